@@ -7,12 +7,21 @@ These helpers keep selection logic DRY and consistent across views/endpoints.
 """
 from __future__ import annotations
 
+from typing import Optional
+
 from django.db.models import QuerySet, OuterRef, Subquery
 
+from core.models.model_co_geoAssumptions import StateReference
 from core.models.model_co_valuations import Valuation
+from core.services.serv_co_cache import SharedCache
 
 from ..models.model_acq_seller import AcqAsset
 
+# Modeling reference-data cache: FC/REO models read StateReference for every
+# asset, but the table only changes through the assumptions screens.
+# Invalidated by the StateReference post_save/post_delete receiver in acq_module.signals.
+_state_reference_cache = SharedCache("modeling_state_reference", ttl=60 * 60, local_maxsize=128)
+
 
 def sellertrade_qs(seller_id: int, trade_id: int, view: str = 'snapshot') -> QuerySet[AcqAsset]:
     """Build the base queryset for a specific seller + trade pair.
@@ -85,3 +94,23 @@ def annotate_seller_valuations(qs: QuerySet[AcqAsset]) -> QuerySet[AcqAsset]:
     return qs
 
 
+def get_state_reference(state_code: Optional[str]) -> Optional[StateReference]:
+    """Return the StateReference row for a state code from the shared cache.
+
+    Args:
+        state_code: Two-letter state code (as stored on AcqProperty.state).
+
+    Returns:
+        StateReference instance, or None when the code is empty or unknown.
+    """
+    if not state_code:
+        return None
+    return _state_reference_cache.get_or_set(
+        state_code,
+        lambda: StateReference.objects.filter(state_code=state_code).first(),
+    )
+
+
+def invalidate_state_reference_cache() -> None:
+    """Drop cached StateReference rows in every worker."""
+    _state_reference_cache.invalidate()
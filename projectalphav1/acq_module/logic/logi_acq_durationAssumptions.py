@@ -5,13 +5,30 @@ What: Backend logic helpers for ACQ workflows.
 Why: Keep reusable model/business logic out of views; import from DRF views and other modules.
 Where: projectalphav1/acq_module/logic/logi_acq_durationAssumptions.py
 How: Plain functions that query models and shape dictionaries for serializers.
+
+FC timelines are served from FCTimelineTable: one in-process snapshot of every
+state's status durations, totals and REO marketing months (~50 states x ~9
+statuses), built with three queries and shared by the FC/REO models, the
+outcome logic and the asset timeline endpoint. Saves to FCTimelines, FCStatus or
+StateReference bump a version in the shared cache (acq_module.signals); each
+worker compares versions at most every FC_TIMELINE_VERSION_CHECK_SECONDS and
+rebuilds its snapshot when it is stale.
+
+Docs reviewed:
+- Cache key versioning: https://docs.djangoproject.com/en/5.2/topics/cache/#cache-versioning
+- cache.incr / cache.add: https://docs.djangoproject.com/en/5.2/topics/cache/#basic-usage
 """
 
 import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from django.db.models import Prefetch, Sum
+from django.core.cache import cache
+from django.db.models import Prefetch
 
 from acq_module.models.model_acq_seller import AcqAsset
 from core.models.model_co_geoAssumptions import StateReference
@@ -25,6 +42,168 @@ from .logi_acq_expenseAssumptions import (
 logger = logging.getLogger(__name__)
 
 
+# Shared version counter; bumped by invalidate_fc_timeline_table() in any process
+FC_TIMELINE_VERSION_KEY = "fc_timeline_table:version"
+# How often a worker re-reads the shared version (seconds); 0 checks on every lookup
+FC_TIMELINE_VERSION_CHECK_SECONDS: float = float(os.getenv("FC_TIMELINE_VERSION_CHECK_SECONDS", "5"))
+# Months -> days factor used by the StateReference.fc_state_months fallback
+DAYS_PER_MONTH = 30.44
+
+
+@dataclass(frozen=True)
+class StateFCTimeline:
+    """Precomputed foreclosure timeline for one state."""
+
+    state_code: str
+    # fc_status_id -> duration_days (only statuses configured for the state)
+    durations: Dict[int, Optional[int]] = field(default_factory=dict)
+    # Sum of non-null FCTimelines durations; None when the state has none
+    timeline_total_days: Optional[int] = None
+    # timeline_total_days, or the StateReference.fc_state_months fallback
+    total_days: Optional[int] = None
+    reo_marketing_months: Optional[int] = None
+
+
+class FCTimelineTable:
+    """Immutable snapshot of FCStatus/FCTimelines/StateReference for modeling lookups.
+
+    Use get_fc_timeline_table() instead of building one directly; lookups on the
+    returned table never touch the database.
+    """
+
+    def __init__(self, version: Any, statuses: List[Tuple[int, str, str]], states: Dict[str, StateFCTimeline]):
+        self.version = version
+        # (id, status, display) in FCStatus order
+        self.statuses = statuses
+        self.states = states
+
+    @classmethod
+    def build(cls, version: Any = None) -> "FCTimelineTable":
+        """Load the three reference tables (3 queries) and precompute per-state totals."""
+        statuses = [
+            (status_id, code, dict(FCStatus.STATUS_CHOICES).get(code, code))
+            for status_id, code in FCStatus.objects.order_by("order", "status").values_list("id", "status")
+        ]
+
+        durations: Dict[str, Dict[int, Optional[int]]] = {}
+        for state_code, status_id, days in FCTimelines.objects.values_list(
+            "state__state_code", "fc_status_id", "duration_days",
+        ):
+            durations.setdefault(state_code, {})[status_id] = days
+
+        references = {
+            state_code: (fc_state_months, reo_months)
+            for state_code, fc_state_months, reo_months in StateReference.objects.values_list(
+                "state_code", "fc_state_months", "reo_marketing_duration",
+            )
+        }
+
+        states: Dict[str, StateFCTimeline] = {}
+        for state_code in set(durations) | set(references):
+            by_status = durations.get(state_code, {})
+            non_null = [days for days in by_status.values() if days is not None]
+            timeline_total = sum(non_null) if non_null else None
+            fc_state_months, reo_months = references.get(state_code, (None, None))
+
+            # WHAT: States without FCTimelines fall back to StateReference.fc_state_months
+            # WHY: Newly imported assets don't have FCTimelines configured yet
+            total = timeline_total
+            if total is None and fc_state_months:
+                total = round(fc_state_months * DAYS_PER_MONTH)
+                logger.debug(
+                    f'[FC TIMELINE] No FCTimelines for state {state_code}, '
+                    f'using StateReference default: {fc_state_months} months ({total} days)'
+                )
+
+            states[state_code] = StateFCTimeline(
+                state_code=state_code,
+                durations=by_status,
+                timeline_total_days=timeline_total,
+                total_days=total,
+                reo_marketing_months=reo_months,
+            )
+        return cls(version, statuses, states)
+
+    def get(self, state_code: Optional[str]) -> Optional[StateFCTimeline]:
+        return self.states.get(state_code) if state_code else None
+
+    def timeline_payload(self, state_code: str) -> Dict[str, Any]:
+        """The get_asset_fc_timeline payload for a state (a fresh dict per call)."""
+        state = self.get(state_code) or StateFCTimeline(state_code=state_code)
+        return {
+            "state": state_code,
+            "statuses": [
+                {
+                    "id": status_id,
+                    "status": code,
+                    "statusDisplay": display,
+                    "durationDays": state.durations.get(status_id),
+                }
+                for status_id, code, display in self.statuses
+            ],
+            "totalDurationDays": state.total_days,
+            "reoMarketingMonths": state.reo_marketing_months,
+        }
+
+
+_table: Optional[FCTimelineTable] = None
+_table_checked_at: float = 0.0
+_table_lock = threading.Lock()
+
+
+def _shared_version() -> Any:
+    """Current shared version; seeded time-based so an evicted counter never repeats."""
+    try:
+        version = cache.get(FC_TIMELINE_VERSION_KEY)
+        if version is None:
+            cache.add(FC_TIMELINE_VERSION_KEY, time.time_ns(), timeout=None)
+            version = cache.get(FC_TIMELINE_VERSION_KEY)
+        return version
+    except Exception as e:
+        # WHAT: Cache outage - keep serving the local snapshot rather than failing models
+        logger.warning(f'[FC TIMELINE] version lookup failed: {e}')
+        return _table.version if _table is not None else None
+
+
+def get_fc_timeline_table() -> FCTimelineTable:
+    """Return this process's FCTimelineTable, rebuilding it when the shared version moved."""
+    global _table, _table_checked_at
+    table = _table
+    now = time.monotonic()
+    if table is not None and now - _table_checked_at < FC_TIMELINE_VERSION_CHECK_SECONDS:
+        return table
+    with _table_lock:
+        version = _shared_version()
+        if _table is None or _table.version != version:
+            _table = FCTimelineTable.build(version)
+        _table_checked_at = now
+        return _table
+
+
+def invalidate_fc_timeline_table() -> None:
+    """Mark every worker's FCTimelineTable stale (call after FC/state reference writes commit)."""
+    global _table
+    with _table_lock:
+        _table = None
+    try:
+        cache.incr(FC_TIMELINE_VERSION_KEY)
+    except ValueError:
+        cache.set(FC_TIMELINE_VERSION_KEY, time.time_ns(), timeout=None)
+    except Exception as e:
+        logger.warning(f'[FC TIMELINE] version bump failed: {e}')
+
+
+def get_state_fc_timeline(state_code: Optional[str]) -> Dict[str, Any]:
+    """Foreclosure timeline payload for a state code (no queries on a warm table).
+
+    Modeling paths that already loaded the asset's property should call this
+    instead of get_asset_fc_timeline.
+    """
+    if not state_code:
+        return {"state": None, "statuses": []}
+    return get_fc_timeline_table().timeline_payload(state_code)
+
+
 def get_asset_fc_timeline(asset_id: int) -> Dict[str, Any]:
     """
     Return an asset-scoped foreclosure timeline payload.
@@ -35,81 +214,26 @@ def get_asset_fc_timeline(asset_id: int) -> Dict[str, Any]:
             {"id": 1, "status": "pre_fc", "statusDisplay": "Pre-Foreclosure", "durationDays": 45},
             ...
         ],
-        "totalDurationDays": 123
+        "totalDurationDays": 123,
+        "reoMarketingMonths": 4
     }
 
     Source of truth:
-    - Asset state from `acq_module.models.seller.SellerRawData.state` (PK is hub/asset id)
-    - Timelines from `core.models.model_co_assumptions.FCTimelines` filtered by state
-    - Status order/display from `core.models.model_co_assumptions.FCStatus`
-    - totalDurationDays: sum of non-null duration_days across all statuses
+    - Asset state from `AcqAsset.property.state` (the only query made here)
+    - Timelines, status order/display and StateReference from FCTimelineTable
+    - totalDurationDays: sum of non-null duration_days across all statuses, falling
+      back to StateReference.fc_state_months (in days) when the state has none
     """
-
-    # Resolve asset state (already normalized upstream by ETL/model layer)
     # AcqAsset has a OneToOneField primary key to core.AssetIdHub via `asset_hub`.
     # Query explicitly by asset_hub_id to avoid any ambiguity with PKs in data imports.
-    asset = (
+    state_code = (
         AcqAsset.objects
-        .select_related("property")
         .filter(asset_hub_id=asset_id)
-        .only("property__state")
+        .values_list("property__state", flat=True)
         .first()
     )
-    if not asset or not asset.property or not asset.property.state:
-        return {"state": None, "statuses": []}
-    state_code = asset.property.state
-
-    # Preload all statuses in defined order for consistent rows
-    statuses: List[FCStatus] = list(FCStatus.objects.all().order_by("order", "status"))
+    return get_state_fc_timeline(state_code)
 
-    # Build a map of fc_status_id -> duration_days for the given state
-    # Use select_related to avoid extra queries
-    timelines = (
-        FCTimelines.objects.select_related("fc_status", "state")
-        .filter(state__state_code=state_code)
-    )
-    duration_by_status: Dict[int, int] = {t.fc_status_id: t.duration_days for t in timelines}
-
-    results = []
-    for s in statuses:
-        results.append({
-            "id": s.id,
-            "status": s.status,
-            "statusDisplay": s.get_status_display(),
-            "durationDays": duration_by_status.get(s.id),
-        })
-
-    # Compute total duration across statuses (sum non-null values). If none present, fallback to StateReference.
-    non_null = [d for d in duration_by_status.values() if d is not None]
-    total = sum(non_null) if non_null else None
-
-    # WHAT: Get StateReference for REO marketing AND foreclosure fallback
-    # WHY: If FCTimelines not configured for this state, use StateReference.fc_state_months as default
-    # HOW: Query StateReference by state_code and use fc_state_months converted to days
-    reo_marketing_months = None
-    try:
-        state_ref = StateReference.objects.filter(state_code=state_code).first()
-        if state_ref:
-            reo_marketing_months = state_ref.reo_marketing_duration
-            
-            # WHAT: If FCTimelines has no data (total is None), fallback to StateReference
-            # WHY: Newly imported assets don't have FCTimelines configured yet
-            # HOW: Use fc_state_months from StateReference, convert to days (months * 30.44)
-            if total is None and state_ref.fc_state_months:
-                total = round(state_ref.fc_state_months * 30.44)  # Convert months to days
-                logger.info(
-                    f'[FC TIMELINE] No FCTimelines for state {state_code}, '
-                    f'using StateReference default: {state_ref.fc_state_months} months ({total} days)'
-                )
-    except StateReference.DoesNotExist:
-        pass
-
-    return {
-        "state": state_code,
-        "statuses": results,
-        "totalDurationDays": total,
-        "reoMarketingMonths": reo_marketing_months
-    }
 
 def get_state_fc_total_duration_days(state_code: str) -> Optional[int]:
     """Return the sum of `duration_days` across all foreclosure statuses for a state.
@@ -120,13 +244,8 @@ def get_state_fc_total_duration_days(state_code: str) -> Optional[int]:
     Returns:
         Integer total of days across statuses, or None if no durations exist for the state.
     """
-    # Aggregate over all timeline rows for the given state.
-    agg = (
-        FCTimelines.objects
-        .filter(state__state_code=state_code)
-        .aggregate(total=Sum('duration_days'))
-    )
-    return agg.get('total')
+    state = get_fc_timeline_table().get(state_code)
+    return state.timeline_total_days if state else None
 
 
 def get_asset_fc_total_duration_days(asset_id: int) -> Optional[int]:
@@ -138,16 +257,15 @@ def get_asset_fc_total_duration_days(asset_id: int) -> Optional[int]:
     Returns:
         Integer total of days across statuses for the asset's state, or None if unknown.
     """
-    asset = (
+    state_code = (
         AcqAsset.objects
-        .select_related("property")
         .filter(asset_hub_id=asset_id)
-        .only("property__state")
+        .values_list("property__state", flat=True)
         .first()
     )
-    if not asset or not asset.property or not asset.property.state:
+    if not state_code:
         return None
-    return get_state_fc_total_duration_days(asset.property.state)
+    return get_state_fc_total_duration_days(state_code)
 
 
 def get_state_fc_metrics(state_code: str) -> Dict[str, Optional[int]]:
@@ -155,18 +273,7 @@ def get_state_fc_metrics(state_code: str) -> Dict[str, Optional[int]]:
 
     Returns a dict with keys: { 'totalDurationDays', 'reoMarketingMonths' }.
     """
-    total = get_state_fc_total_duration_days(state_code)
-    reo_months = None
-    try:
-        state_ref = (
-            StateReference.objects
-            .filter(state_code=state_code)
-            .only('reo_marketing_duration')
-            .first()
-        )
-        if state_ref:
-            reo_months = state_ref.reo_marketing_duration
-    except StateReference.DoesNotExist:
-        pass
-    return {'totalDurationDays': total, 'reoMarketingMonths': reo_months}
-
+    state = get_fc_timeline_table().get(state_code)
+    if state is None:
+        return {'totalDurationDays': None, 'reoMarketingMonths': None}
+    return {'totalDurationDays': state.timeline_total_days, 'reoMarketingMonths': state.reo_marketing_months}
@@ -6,7 +6,7 @@ from typing import Optional
 from acq_module.models.model_acq_seller import AcqAsset
 from acq_module.models.model_acq_assumptions import LoanLevelAssumption, TradeLevelAssumption
 from am_module.models.model_am_modeling import BlendedOutcomeModel
-from core.models.model_co_geoAssumptions import StateReference
+from acq_module.logic.common import get_state_reference
 from core.models.model_co_assumptions import HOAAssumption
 from core.models.model_co_valuations import Valuation
 
@@ -44,12 +44,7 @@ def monthly_tax_for_asset(asset_hub_id: int) -> Decimal:
     if not state_code or not asis_value:
         return Decimal('0.00')
 
-    state = (
-        StateReference.objects
-        .filter(state_code=state_code)
-        .only('property_tax_rate')
-        .first()
-    )
+    state = get_state_reference(state_code)
     if not state or state.property_tax_rate is None:
         return Decimal('0.00')
 
@@ -78,12 +73,7 @@ def monthly_insurance_for_asset(asset_hub_id: int) -> Decimal:
     if not state_code or not asis_value:
         return Decimal('0.00')
 
-    state = (
-        StateReference.objects
-        .filter(state_code=state_code)
-        .only('insurance_rate_avg')
-        .first()
-    )
+    state = get_state_reference(state_code)
     if not state or state.insurance_rate_avg is None:
         return Decimal('0.00')
 
@@ -6,8 +6,8 @@ from numpy_financial import irr, npv
 from acq_module.models.model_acq_seller import AcqAsset
 from acq_module.models.model_acq_assumptions import TradeLevelAssumption, LoanLevelAssumption
 from acq_module.logic.logi_acq_expenseAssumptions import monthly_tax_for_asset, monthly_insurance_for_asset
-from acq_module.logic.logi_acq_durationAssumptions import get_asset_fc_timeline
-from core.models.model_co_geoAssumptions import StateReference
+from acq_module.logic.logi_acq_durationAssumptions import get_state_fc_timeline
+from acq_module.logic.common import get_state_reference
 
 
 class fcoutcomeLogic:
@@ -71,7 +71,7 @@ class fcoutcomeLogic:
         # WHAT: Get FC timeline to calculate duration-based expenses (including user overrides)
         # WHY: Taxes and insurance accumulate over the entire timeline
         try:
-            fc_timeline = get_asset_fc_timeline(asset_hub_id)
+            fc_timeline = get_state_fc_timeline(asset.property.state)
             total_days = fc_timeline.get('totalDurationDays', 0)
             base_months = round(total_days / 30.44) if total_days else 0
             
@@ -124,7 +124,7 @@ class fcoutcomeLogic:
         legal_costs = Decimal('0.00')
         if raw.state:
             try:
-                state_ref = StateReference.objects.filter(state_code=raw.state).only('fc_legal_fees_avg').first()
+                state_ref = get_state_reference(raw.state)
                 if state_ref and state_ref.fc_legal_fees_avg:
                     legal_costs = Decimal(str(state_ref.fc_legal_fees_avg))
                 # print(f"5. Legal Costs ({raw.state}): ${legal_costs:,.2f}")
@@ -22,6 +22,7 @@ from core.models.model_co_assumptions import (
     UnitBasedAssumption,
     StateReference
 )
+from acq_module.logic.common import get_state_reference
 
 
 class UtilityAssumptionWorkflow:
@@ -69,12 +70,7 @@ class UtilityAssumptionWorkflow:
     def state_reference(self) -> Optional[StateReference]:
         """Get state reference data for this asset (cached)."""
         if self._state_reference is None and self.seller_data and self.seller_data.property:
-            try:
-                self._state_reference = StateReference.objects.get(
-                    state_code=self.seller_data.property.state
-                )
-            except StateReference.DoesNotExist:
-                self._state_reference = None
+            self._state_reference = get_state_reference(self.seller_data.property.state)
         return self._state_reference
     
     def get_property_category(self) -> str:
@@ -14,12 +14,12 @@ from decimal import Decimal
 
 from acq_module.models.model_acq_seller import AcqAsset
 from acq_module.models.model_acq_assumptions import TradeLevelAssumption, LoanLevelAssumption
-from acq_module.logic.logi_acq_durationAssumptions import get_asset_fc_timeline
+from acq_module.logic.logi_acq_durationAssumptions import get_state_fc_timeline
 from acq_module.logic.logi_acq_expenseAssumptions import monthly_tax_for_asset, monthly_insurance_for_asset, acq_broker_fee, acq_fee_other
 from acq_module.logic.logi_acq__proceedAssumptions import fc_sale_proceeds
 from acq_module.logic.logi_acq_purchasePrice import purchase_price, purchase_price_metrics
 from acq_module.logic.logi_acq_outcomespecific import fcoutcomeLogic
-from core.models.model_co_geoAssumptions import StateReference
+from acq_module.logic.common import get_state_reference
 from core.models.model_co_assumptions import Servicer
 from core.models.model_co_valuations import Valuation
 
@@ -38,7 +38,7 @@ def get_fc_timeline_sums(asset_hub_id: int, reference_date: Optional[date] = Non
     - Gets settlement_date and servicing_transfer_date from TradeLevelAssumption linked via SellerRawData.trade
     - Calculates servicing_transfer_months as difference between settlement_date and servicing_transfer_date
     - Uses effective_servicing_transfer_date property which defaults to settlement_date + 30 days if not set
-    - Gets FC timeline totals from existing get_asset_fc_timeline function
+    - Gets FC timeline totals from the in-memory FCTimelineTable (get_state_fc_timeline)
     - Converts days to months and rounds to nearest whole integer for both values
     
     Args:
@@ -98,9 +98,9 @@ def get_fc_timeline_sums(asset_hub_id: int, reference_date: Optional[date] = Non
                 if trade_assumption.servicer.servicing_transfer_duration:
                     servicing_transfer_months = trade_assumption.servicer.servicing_transfer_duration
     
-    # WHAT: Get FC timeline data using existing function
+    # WHAT: Get FC timeline data for the asset's state from the cached FCTimelineTable
     # WHY: Reuse existing logic that sums all FCStatus durations
-    fc_timeline_data = get_asset_fc_timeline(asset_hub_id)
+    fc_timeline_data = get_state_fc_timeline(asset.property.state if asset and asset.property else None)
     
     foreclosure_days = fc_timeline_data.get('totalDurationDays')
     foreclosure_months = None
@@ -448,7 +448,7 @@ def get_fc_expense_values(
     # WHY: Legal fees are state-specific and stored in reference table
     if asset_state:
         try:
-            state_ref = StateReference.objects.filter(state_code=asset_state).only('fc_legal_fees_avg').first()
+            state_ref = get_state_reference(asset_state)
             if state_ref and state_ref.fc_legal_fees_avg is not None:
                 legal_cost = state_ref.fc_legal_fees_avg
                 # WHAT: Convert to Decimal if not already
@@ -14,12 +14,12 @@ from decimal import Decimal
 
 from acq_module.models.model_acq_seller import AcqAsset
 from acq_module.models.model_acq_assumptions import TradeLevelAssumption, LoanLevelAssumption
-from acq_module.logic.logi_acq_durationAssumptions import get_asset_fc_timeline
+from acq_module.logic.logi_acq_durationAssumptions import get_state_fc_timeline
 from acq_module.logic.logi_acq_expenseAssumptions import monthly_tax_for_asset, monthly_insurance_for_asset, acq_broker_fee, acq_fee_other
 from acq_module.logic.logi_acq__proceedAssumptions import reo_asis_proceeds, reo_arv_proceeds
 from acq_module.logic.logi_acq_purchasePrice import purchase_price, purchase_price_metrics
 from acq_module.logic.logi_acq_outcomespecific import fcoutcomeLogic
-from core.models.model_co_geoAssumptions import StateReference
+from acq_module.logic.common import get_state_reference
 from core.models.model_co_assumptions import Servicer, HOAAssumption, PropertyTypeAssumption, SquareFootageAssumption
 from core.models.model_co_valuations import Valuation
 
@@ -37,7 +37,7 @@ def get_reo_timeline_sums(asset_hub_id: int, reference_date: Optional[date] = No
     Where: Called by API views to serve frontend REOSaleModelCard component.
     How: 
     - Gets servicing transfer duration from TradeLevelAssumption
-    - Gets FC timeline totals from existing get_asset_fc_timeline function
+    - Gets FC timeline totals from the in-memory FCTimelineTable (get_state_fc_timeline)
     - Gets REO marketing duration from StateReference for the asset's state
     - Converts days to months and rounds to nearest whole integer
     
@@ -72,7 +72,7 @@ def get_reo_timeline_sums(asset_hub_id: int, reference_date: Optional[date] = No
     # WHY: This function was querying it 2 separate times (rehab duration, marketing duration)
     state_ref = None
     if asset and asset.property and asset.property.state:
-        state_ref = StateReference.objects.filter(state_code=asset.property.state).first()
+        state_ref = get_state_reference(asset.property.state)
     
     # WHAT: Default to 0 instead of None so calculations still work
     # WHY: Returning None breaks frontend calculations; 0 is a valid "no duration" value
@@ -101,9 +101,9 @@ def get_reo_timeline_sums(asset_hub_id: int, reference_date: Optional[date] = No
                 if trade_assumption.servicer.servicing_transfer_duration:
                     servicing_transfer_months = trade_assumption.servicer.servicing_transfer_duration
     
-    # WHAT: Get FC timeline data using existing function
+    # WHAT: Get FC timeline data for the asset's state from the cached FCTimelineTable
     # WHY: REO scenario includes full foreclosure process
-    fc_timeline_data = get_asset_fc_timeline(asset_hub_id)
+    fc_timeline_data = get_state_fc_timeline(asset.property.state if asset and asset.property else None)
     
     foreclosure_days = fc_timeline_data.get('totalDurationDays')
     foreclosure_months = None
@@ -391,7 +391,7 @@ def get_reo_expense_values(
     # WHAT: Get legal costs from state reference
     if asset_state:
         try:
-            state_ref = StateReference.objects.filter(state_code=asset_state).first()
+            state_ref = get_state_reference(asset_state)
             if state_ref and state_ref.fc_legal_fees_avg:
                 legal_cost = state_ref.fc_legal_fees_avg
         except Exception as e:
@@ -5,20 +5,32 @@ signal receivers that forward work to dedicated logic/service modules. This
 keeps models thin and avoids performing network I/O inside model.save().
 
 Currently implemented:
-    - Post-save hook for `AcqProperty`: triggers geocoding after the DB
-      transaction commits by calling `logic.geocoding_logic.geocode_row`.
-      The logic layer persists results to `LlDataEnrichment` so future
-      requests reuse coordinates without hitting external APIs.
+    - Post-save hook for `AcqProperty`: appends a GEOCODE event to the
+      side-effect outbox (`core.services.serv_co_outbox`). The dispatcher
+      geocodes all queued rows with one `batch_geocode_row_ids` call and
+      persists results to `LlDataEnrichment` (and the address cache table) so
+      future requests reuse coordinates without hitting external APIs.
+    - Post-save/post-delete hooks for `StateReference`: drop the shared
+      modeling reference-data cache (`logic.common.get_state_reference`).
+    - Post-save/post-delete hooks for `FCTimelines`, `FCStatus` and
+      `StateReference`: bump the FCTimelineTable version
+      (`logic.logi_acq_durationAssumptions`) so every worker rebuilds it.
 """
 
 from __future__ import annotations
 
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.db import transaction
 from django.dispatch import receiver
 
 from .models.model_acq_seller import AcqProperty
-from core.services.serv_co_geocoding import geocode_row
+from core.models import SideEffectEvent
+from core.models.model_co_assumptions import FCStatus, FCTimelines
+from core.models.model_co_geoAssumptions import StateReference
+from core.services.serv_co_geocoding import GEOCODE_ENRICHMENT_FIELDS, batch_geocode_row_ids
+from core.services.serv_co_outbox import emit_side_effect, register_side_effect_handler
+from .logic.common import invalidate_state_reference_cache
+from .logic.logi_acq_durationAssumptions import invalidate_fc_timeline_table
 
 
 @receiver(post_save, sender=AcqProperty)
@@ -27,10 +39,10 @@ def acqproperty_post_save(sender, instance: AcqProperty, created: bool, **kwargs
 
     Behavior:
     - Only fires enrichment when a row is freshly created (`created is True`).
-    - Schedules geocoding with `transaction.on_commit` to ensure we run outside
-      the current DB transaction (avoids slow writes / retries on rollbacks).
-    - Delegates to `geocode_row(instance.pk)` which handles "DB -> cache -> API"
-      resolution and persists coordinates to `LlDataEnrichment`.
+    - Appends a GEOCODE outbox event in the current transaction (one small
+      INSERT; rolled back with the row). Rows created within the debounce
+      window are geocoded together by `geocode_property_rows`:
+      "DB -> address cache -> batch API".
 
     This signal is best-effort; failures are swallowed to avoid impacting
     the write-path for ingest flows.
@@ -38,16 +50,34 @@ def acqproperty_post_save(sender, instance: AcqProperty, created: bool, **kwargs
     if not created:
         return
 
-    def _do_geocode():
-        try:
-            geocode_row(instance.pk)
-        except Exception:
-            # Fail silently; geocoding is a best-effort enrichment
-            pass
-
-    # Prefer after-commit execution to avoid network I/O inside DB tx
     try:
-        transaction.on_commit(_do_geocode)
+        emit_side_effect(SideEffectEvent.Kind.GEOCODE, instance.pk)
     except Exception:
-        # Fallback: run immediately if on_commit is unavailable (edge envs)
-        _do_geocode()
\ No newline at end of file
+        # Fail silently; geocoding is a best-effort enrichment
+        pass
+
+
+def geocode_property_rows(row_ids):
+    """Outbox handler: batch geocode AcqProperty rows queued by the post-save hook or imports."""
+    batch_geocode_row_ids(row_ids, fields=GEOCODE_ENRICHMENT_FIELDS)
+
+
+register_side_effect_handler(SideEffectEvent.Kind.GEOCODE, geocode_property_rows)
+
+
+@receiver(post_save, sender=StateReference)
+@receiver(post_delete, sender=StateReference)
+def statereference_changed(sender, instance: StateReference, **kwargs):
+    """Invalidate cached StateReference rows used by the FC/REO models."""
+    transaction.on_commit(invalidate_state_reference_cache)
+
+
+@receiver(post_save, sender=FCTimelines)
+@receiver(post_delete, sender=FCTimelines)
+@receiver(post_save, sender=FCStatus)
+@receiver(post_delete, sender=FCStatus)
+@receiver(post_save, sender=StateReference)
+@receiver(post_delete, sender=StateReference)
+def fc_timeline_reference_changed(sender, instance, **kwargs):
+    """Mark the in-memory FCTimelineTable stale in every worker once the write commits."""
+    transaction.on_commit(invalidate_fc_timeline_table)
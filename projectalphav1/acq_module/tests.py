@@ -1,3 +1,92 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from acq_module.logic import logi_acq_durationAssumptions as durations
+from acq_module.models.model_acq_seller import AcqAsset, AcqProperty
+from core.models import AssetIdHub
+from core.models.model_co_assumptions import FCStatus, FCTimelines
+from core.test.fixtures import state_reference
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class FCTimelineTableTestCase(TestCase):
+    """FC timeline lookups come from the in-memory FCTimelineTable and follow reference edits."""
+
+    def setUp(self):
+        cache.clear()
+        durations.invalidate_fc_timeline_table()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.fl = state_reference('FL', fc_state_months=12, reo_marketing_duration=4)
+            self.fl.save()
+            state_reference('TX', fc_state_months=10, reo_marketing_duration=3).save()
+            self.pre_fc = FCStatus.objects.create(status='pre_fc', order=1)
+            self.sale = FCStatus.objects.create(status='sale_scheduled', order=2)
+            self.fl_sale = FCTimelines.objects.create(state=self.fl, fc_status=self.sale, duration_days=200)
+            FCTimelines.objects.create(state=self.fl, fc_status=self.pre_fc, duration_days=100)
+
+    def test_lookups_are_served_without_queries(self):
+        with self.assertNumQueries(3):
+            durations.get_fc_timeline_table()
+        with self.assertNumQueries(0):
+            fl = durations.get_state_fc_timeline('FL')
+            tx = durations.get_state_fc_timeline('TX')
+            metrics = durations.get_state_fc_metrics('TX')
+            unknown = durations.get_state_fc_timeline('ZZ')
+
+        self.assertEqual(fl['totalDurationDays'], 300)
+        self.assertEqual(fl['reoMarketingMonths'], 4)
+        self.assertEqual(
+            [(row['status'], row['statusDisplay'], row['durationDays']) for row in fl['statuses']],
+            [('pre_fc', 'Pre-Foreclosure', 100), ('sale_scheduled', 'Sale Scheduled', 200)],
+        )
+        # WHAT: No FCTimelines rows -> StateReference.fc_state_months fallback (payload only)
+        self.assertEqual(tx['totalDurationDays'], round(10 * 30.44))
+        self.assertEqual(metrics, {'totalDurationDays': None, 'reoMarketingMonths': 3})
+        self.assertEqual(durations.get_state_fc_total_duration_days('FL'), 300)
+        self.assertIsNone(unknown['totalDurationDays'])
+
+    def test_asset_timeline_only_resolves_the_state(self):
+        hub = AssetIdHub.objects.create(sellertape_id='FC-1')
+        asset = AcqAsset.objects.create(asset_hub=hub)
+        AcqProperty.objects.create(asset=asset, state='FL')
+        durations.get_fc_timeline_table()
+
+        with self.assertNumQueries(1):
+            payload = durations.get_asset_fc_timeline(hub.pk)
+        self.assertEqual((payload['state'], payload['totalDurationDays']), ('FL', 300))
+        self.assertEqual(durations.get_asset_fc_timeline(hub.pk + 1), {'state': None, 'statuses': []})
+
+    def test_saves_and_other_workers_invalidate_the_table(self):
+        durations.get_fc_timeline_table()
+        with mock.patch.object(durations, 'FC_TIMELINE_VERSION_CHECK_SECONDS', 3600):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.fl_sale.duration_days = 250
+                self.fl_sale.save()
+            self.assertEqual(durations.get_state_fc_total_duration_days('FL'), 350)
+
+            # WHAT: Another worker bumped the version - seen once the check interval passes
+            cache.incr(durations.FC_TIMELINE_VERSION_KEY)
+            FCTimelines.objects.filter(pk=self.fl_sale.pk).update(duration_days=300)
+            self.assertEqual(durations.get_state_fc_total_duration_days('FL'), 350)
+        with mock.patch.object(durations, 'FC_TIMELINE_VERSION_CHECK_SECONDS', 0):
+            self.assertEqual(durations.get_state_fc_total_duration_days('FL'), 400)
+
+    def test_matrix_csv_import_invalidates_the_table(self):
+        durations.get_fc_timeline_table()
+        upload = SimpleUploadedFile(
+            'fc.csv',
+            b'state_code,status_code,duration_days\nTX,pre_fc,90\nTX,sale_scheduled,30\n',
+            content_type='text/csv',
+        )
+        client = APIClient()
+        client.force_authenticate(get_user_model().objects.create_user('fc-admin'))
+        with mock.patch.object(durations, 'FC_TIMELINE_VERSION_CHECK_SECONDS', 3600):
+            with self.captureOnCommitCallbacks(execute=True):
+                response = client.post('/api/core/fc-timelines/import_matrix_csv/', {'file': upload})
+            self.assertEqual(response.status_code, 200, response.content)
+            self.assertEqual(durations.get_state_fc_metrics('TX')['totalDurationDays'], 120)
@@ -8,16 +8,18 @@ Docs reviewed:
 
 This endpoint keeps the API key on the server and returns 4–6 concise bullet points.
 """
-from typing import List, Tuple, Dict
+from typing import List
+import hashlib
 import os
 import logging
-import time
 
 from django.views.decorators.csrf import csrf_exempt
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
+from core.services.serv_co_cache import SharedCache
+
 # Attempt to import Anthropics' SDK. If unavailable, return a helpful error.
 try:  # Try to import the official SDK (preferred)
     import anthropic  # type: ignore
@@ -58,37 +60,11 @@ _MAX_OUTPUT_TOKENS = int(os.getenv("AI_SUMMARY_MAX_TOKENS", "150"))
 # Lower temperature to minimize dithering and slightly speed decoding
 _TEMPERATURE = float(os.getenv("AI_SUMMARY_TEMPERATURE", "0"))
 
-# Simple in-memory cache (per-process). Suitable for dev and single-process deployments.
-# Key: (context_hash, max_bullets, model)
+# Shared LRU/TTL cache (in-process L1 + shared Django cache tier) so every worker
+# reuses summaries. Key: (sha256(context), max_bullets, model)
 _CACHE_TTL = int(os.getenv("AI_SUMMARY_CACHE_TTL", "600"))  # seconds
 _CACHE_MAX_ENTRIES = int(os.getenv("AI_SUMMARY_CACHE_MAX", "200"))
-_cache: Dict[Tuple[int, int, str], Tuple[float, List[str]]] = {}
-
-def _cache_get(key: Tuple[int, int, str]) -> List[str] | None:
-    now = time.time()
-    item = _cache.get(key)
-    if not item:
-        return None
-    ts, value = item
-    if now - ts > _CACHE_TTL:
-        # expired
-        try:
-            del _cache[key]
-        except Exception:
-            pass
-        return None
-    return value
-
-def _cache_set(key: Tuple[int, int, str], value: List[str]) -> None:
-    # Trim cache if it grows too large
-    if len(_cache) >= _CACHE_MAX_ENTRIES:
-        try:
-            # Remove oldest item (approximate by timestamp scan)
-            oldest_key = min(_cache.items(), key=lambda kv: kv[1][0])[0]
-            del _cache[oldest_key]
-        except Exception:
-            _cache.clear()
-    _cache[key] = (time.time(), value)
+_cache = SharedCache("ai_summary", ttl=_CACHE_TTL, local_maxsize=_CACHE_MAX_ENTRIES)
 
 
 @csrf_exempt  # Using token auth or anonymous in dev; CSRF exempt simplifies local testing
@@ -134,10 +110,10 @@ def generate_quick_summary(request):
     )
 
     try:
-        # Check cache first (hashing context to keep key size modest)
-        ctx_hash = hash(context)
+        # Check cache first (stable digest of context; hash() differs per process)
+        ctx_hash = hashlib.sha256(context.encode("utf-8")).hexdigest()
         cache_key = (ctx_hash, max_bullets, _MODEL_NAME)
-        cached = _cache_get(cache_key)
+        cached = _cache.get(cache_key)
         if cached is not None:
             return Response({"bullets": cached})
 
@@ -171,7 +147,7 @@ def generate_quick_summary(request):
             bullets = ["No key points extracted."]
 
         # Save to cache for subsequent identical requests
-        _cache_set(cache_key, bullets)
+        _cache.set(cache_key, bullets)
 
         return Response({"bullets": bullets})
 
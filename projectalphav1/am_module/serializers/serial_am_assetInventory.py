@@ -26,7 +26,7 @@ class AssetInventoryRowSerializer(serializers.Serializer):
         from am_module.services.serv_am_assetInventory import AssetInventoryEnricher
 
         enricher = AssetInventoryEnricher()
-        enriched_assets = [enricher.enrich(asset) for asset in queryset]
+        enriched_assets = list(enricher.enrich_queryset(queryset))
         serializer = AssetInventoryRowSerializer(enriched_assets, many=True)
         return Response(serializer.data)
     """
@@ -20,6 +20,11 @@ from acq_module.models.model_acq_seller import AcqAsset  # WHAT: Boarded dataset
 from am_module.models.model_am_amData import AMMetrics
 from am_module.models.model_am_servicersCleaned import ServicerLoanData
 from core.models.model_co_valuations import Valuation
+from am_module.services.serv_am_workflowState import (
+    AssetWorkflowState,
+    TRACK_SPECS,
+    load_workflow_states,
+)
 from am_module.logic.logi_am_modelLogic import (
     resolve_latest_internal_asis_value,
     resolve_latest_internal_arv_value,
@@ -50,6 +55,10 @@ VALUATION_SOURCES = {
     'sellerProvided',
 }
 
+# WHAT: Assets per workflow-state bulk load in enrich_queryset()
+# WHY: Bounds the size of asset_hub_id IN (...) lists for "view all" requests
+WORKFLOW_STATE_CHUNK_SIZE = 1000
+
 # NOTE on ordering:
 """
 Frontend may request ordering on any visible column. We expose a permissive
@@ -96,25 +105,10 @@ def build_queryset(
         .select_related("seller", "trade")  # HOW: ensure seller/trade names resolve without extra queries
         # PERFORMANCE: Prefetch all related data in bulk queries to avoid N+1
         .prefetch_related("asset_hub__valuations")  # Load all valuations in ONE query
-        .prefetch_related("asset_hub__dil_tasks")  # Load all DIL tasks in ONE query
-        .prefetch_related("asset_hub__modification_tasks")  # Load all Modification tasks in ONE query
-        .prefetch_related("asset_hub__reo_tasks")  # Load all REO tasks in ONE query
-        .prefetch_related("asset_hub__fc_tasks")  # Load all FC tasks in ONE query
-        .prefetch_related("asset_hub__short_sale_tasks")  # Load all Short Sale tasks in ONE query
-        .prefetch_related("asset_hub__note_sale_tasks")  # Load all Note Sale tasks in ONE query
-        .prefetch_related("asset_hub__performing_tasks")  # Load all Performing tasks in ONE query
-        .prefetch_related("asset_hub__delinquent_tasks")  # Load all Delinquent tasks in ONE query
         .prefetch_related("asset_hub__servicer_loan_data")  # Load all servicer data in ONE query
         .prefetch_related("asset_hub__ammetrics")  # Load all AMMetrics in ONE query for delinquency status
-        # Also prefetch the outcome models themselves (used by get_active_tracks)
-        .select_related("asset_hub__dil")  # OneToOne relationships use select_related
-        .select_related("asset_hub__modification")
-        .select_related("asset_hub__reo_data")
-        .select_related("asset_hub__fc_sale")
-        .select_related("asset_hub__short_sale")
-        .select_related("asset_hub__note_sale")
-        .select_related("asset_hub__performing_track")
-        .select_related("asset_hub__delinquent_track")
+        # NOTE: Outcome tracks/tasks are not joined here; AssetInventoryEnricher bulk-loads
+        # them per page via serv_am_workflowState (16 narrow queries instead of 8 joins + 8 prefetches)
         .annotate(
             seller_name=F("seller__name"),  # WHAT: Expose friendly name aliases to match legacy serializer fields
             trade_name=F("trade__trade_name"),
@@ -261,6 +255,10 @@ class AssetInventoryEnricher:
         # WHY: Reusing the latest valuation per source avoids N x sources queries
         # HOW: Populated lazily on first valuation lookup for an asset
         self._valuation_cache: dict[int | str, dict[str, Valuation]] = {}
+        # WHAT: Per-batch cache mapping asset_hub_id -> AssetWorkflowState (tracks + tasks)
+        # WHY: One bulk load per page instead of scanning 16 relations per asset
+        # HOW: Filled by prime_workflow_states(); single hubs are loaded on demand
+        self._workflow_states: dict[int, AssetWorkflowState] = {}
 
     def enrich(self, obj: AcqAsset) -> AcqAsset:
         """
@@ -346,7 +344,8 @@ class AssetInventoryEnricher:
 
         WHAT: Iterate through queryset and enrich each object
         WHY: Provides generator interface for large datasets without loading all into memory
-        HOW: Yield enriched objects one at a time, maintaining valuation cache across all
+        HOW: Yield enriched objects in chunks, bulk-loading workflow state per chunk and
+             maintaining the valuation cache across all
 
         Args:
             qs: QuerySet of SellerRawData objects
@@ -354,9 +353,45 @@ class AssetInventoryEnricher:
         Yields:
             Enriched SellerRawData instances
         """
+        chunk: list[AcqAsset] = []
         for obj in qs:
+            chunk.append(obj)
+            if len(chunk) >= WORKFLOW_STATE_CHUNK_SIZE:
+                yield from self._enrich_chunk(chunk)
+                chunk = []
+        if chunk:
+            yield from self._enrich_chunk(chunk)
+
+    def _enrich_chunk(self, objs: list[AcqAsset]) -> Iterable[AcqAsset]:
+        self.prime_workflow_states(objs)
+        for obj in objs:
             yield self.enrich(obj)
 
+    def prime_workflow_states(self, objs: Iterable[AcqAsset]) -> None:
+        """
+        Bulk-load outcome track/task state for a batch of assets.
+
+        WHAT: Fill the workflow state cache for every asset in the batch
+        WHY: get_active_tracks()/get_active_tasks() then run without queries
+        HOW: One serv_am_workflowState.load_workflow_states() call for all hub ids
+
+        Args:
+            objs: AcqAsset instances (or AssetIdHub instances) about to be enriched
+        """
+        hub_ids = [getattr(obj, 'asset_hub_id', None) or obj.pk for obj in objs]
+        missing = [h for h in hub_ids if h is not None and h not in self._workflow_states]
+        if missing:
+            self._workflow_states.update(load_workflow_states(missing))
+
+    def get_workflow_state(self, obj: AcqAsset) -> AssetWorkflowState | None:
+        """Return the cached workflow state for an asset (loads a single hub if not primed)."""
+        hub_id = getattr(obj, 'asset_hub_id', None) or getattr(obj, 'pk', None)
+        if hub_id is None:
+            return None
+        if hub_id not in self._workflow_states:
+            self.prime_workflow_states([obj])
+        return self._workflow_states.get(hub_id)
+
     # ========== Basic Computed Fields ==========
 
     def get_asset_id(self, obj: AcqAsset) -> int | str | None:
@@ -466,51 +501,21 @@ class AssetInventoryEnricher:
 
         WHAT: Identify which outcome types have active 1:1 records for this asset
         WHY: Dashboard "Active Tracks" field shows all active workflow types for quick status overview
-        HOW: Check for existence of each outcome model (DIL, Modification, REO, FCSale, ShortSale) on the hub
+        HOW: Read the bulk-loaded workflow state (see prime_workflow_states) for each outcome model
 
         Returns:
             Comma-separated string like "DIL, Modification" or None if no active tracks
         """
-        hub = getattr(obj, 'asset_hub', None)
-        if not hub:
+        state = self.get_workflow_state(obj)
+        if state is None:
             return None
 
         # IMPORTANT:
         # If you add a new track/task model in `am_module.models.model_am_tracksTasks`, you must update:
-        # - this `get_active_tracks()` / `get_active_tasks()` logic
-        # - queryset prefetches in `build_queryset()` (to avoid N+1 queries)
+        # - TRACK_SPECS in `am_module.services.serv_am_workflowState`
         # - frontend badge mappings in `frontend_vue/src/config/badgeTokens.ts`
         # Otherwise, new tracks/tasks may not appear in the AM grid.
-
-        # WHAT: Map outcome model related names to their display labels
-        # WHY: These are the 1:1 outcome/track models that indicate active workflows
-        # HOW: Check hasattr on hub for each related_name, collect labels for existing records
-        tracks = []
-        
-        # Check each outcome type (all are 1:1 with asset_hub)
-        if hasattr(hub, 'dil') and getattr(hub, 'dil', None) is not None:
-            tracks.append('DIL')
-        
-        if hasattr(hub, 'modification') and getattr(hub, 'modification', None) is not None:
-            tracks.append('Modification')
-        
-        if hasattr(hub, 'reo_data') and getattr(hub, 'reo_data', None) is not None:
-            tracks.append('REO')
-        
-        if hasattr(hub, 'fc_sale') and getattr(hub, 'fc_sale', None) is not None:
-            tracks.append('FC')
-        
-        if hasattr(hub, 'short_sale') and getattr(hub, 'short_sale', None) is not None:
-            tracks.append('Short Sale')
-
-        if hasattr(hub, 'note_sale') and getattr(hub, 'note_sale', None) is not None:
-            tracks.append('Note Sale')
-
-        if hasattr(hub, 'performing_track') and getattr(hub, 'performing_track', None) is not None:
-            tracks.append('Performing')
-
-        if hasattr(hub, 'delinquent_track') and getattr(hub, 'delinquent_track', None) is not None:
-            tracks.append('Delinquent')
+        tracks = [spec.label for spec in TRACK_SPECS if state.has_track(spec.key)]
 
         delinquency_status = self.get_delinquency_status(obj)
         if delinquency_status and str(delinquency_status).strip().lower() not in ('current', '0'):
@@ -525,116 +530,22 @@ class AssetInventoryEnricher:
 
         WHAT: Identify current active tasks across all outcome types for this asset
         WHY: Dashboard "Active Tasks" field shows granular workflow progress beyond just outcome existence
-        HOW: Query each outcome's related tasks, collect latest/active task per outcome type with readable labels
+        HOW: For each existing outcome, take the latest task from the bulk-loaded workflow state
 
         Returns:
             Comma-separated string like "DIL: Owner/Heirs contacted, Modification: Drafted" or None if no active tasks
         """
-        hub = getattr(obj, 'asset_hub', None)
-        if not hub:
+        state = self.get_workflow_state(obj)
+        if state is None:
             return None
 
-        # WHAT: Collect active tasks from each outcome type
-        # WHY: Each outcome type has different task models and status labels
-        # HOW: Check for existence of outcome, then query its related tasks to find most recent active one
         tasks = []
-        
-        # DIL Tasks - use prefetched data (NO new query)
-        if hasattr(hub, 'dil') and getattr(hub, 'dil', None) is not None:
-            try:
-                # Sort prefetched tasks in Python memory instead of database query
-                dil_tasks_list = list(hub.dil_tasks.all())  # Uses prefetched data
-                if dil_tasks_list:
-                    dil_task = max(dil_tasks_list, key=lambda t: t.created_at or '')
-                    if dil_task.task_type:
-                        label = dil_task.get_task_type_display() if hasattr(dil_task, 'get_task_type_display') else dil_task.task_type
-                        tasks.append(f'DIL: {label}')
-            except Exception:
-                pass
-        
-        # Modification Tasks - use prefetched data (NO new query)
-        if hasattr(hub, 'modification') and getattr(hub, 'modification', None) is not None:
-            try:
-                mod_tasks_list = list(hub.modification_tasks.all())  # Uses prefetched data
-                if mod_tasks_list:
-                    mod_task = max(mod_tasks_list, key=lambda t: t.created_at or '')
-                    if mod_task.task_type:
-                        label = mod_task.get_task_type_display() if hasattr(mod_task, 'get_task_type_display') else mod_task.task_type
-                        tasks.append(f'Modification: {label}')
-            except Exception:
-                pass
-        
-        # REO Tasks - use prefetched data (NO new query)
-        if hasattr(hub, 'reo_data') and getattr(hub, 'reo_data', None) is not None:
-            try:
-                reo_tasks_list = list(hub.reo_tasks.all())  # Uses prefetched data
-                if reo_tasks_list:
-                    reo_task = max(reo_tasks_list, key=lambda t: t.created_at or '')
-                    if reo_task.task_type:
-                        label = reo_task.get_task_type_display() if hasattr(reo_task, 'get_task_type_display') else reo_task.task_type
-                        tasks.append(f'REO: {label}')
-            except Exception:
-                pass
-        
-        # FC Tasks - use prefetched data (NO new query)
-        if hasattr(hub, 'fc_sale') and getattr(hub, 'fc_sale', None) is not None:
-            try:
-                fc_tasks_list = list(hub.fc_tasks.all())  # Uses prefetched data
-                if fc_tasks_list:
-                    fc_task = max(fc_tasks_list, key=lambda t: t.created_at or '')
-                    if fc_task.task_type:
-                        label = fc_task.get_task_type_display() if hasattr(fc_task, 'get_task_type_display') else fc_task.task_type
-                        tasks.append(f'FC: {label}')
-            except Exception:
-                pass
-        
-        # Short Sale Tasks - use prefetched data (NO new query)
-        if hasattr(hub, 'short_sale') and getattr(hub, 'short_sale', None) is not None:
-            try:
-                ss_tasks_list = list(hub.short_sale_tasks.all())  # Uses prefetched data
-                if ss_tasks_list:
-                    ss_task = max(ss_tasks_list, key=lambda t: t.created_at or '')
-                    if ss_task.task_type:
-                        label = ss_task.get_task_type_display() if hasattr(ss_task, 'get_task_type_display') else ss_task.task_type
-                        tasks.append(f'Short Sale: {label}')
-            except Exception:
-                pass
-
-        # Note Sale Tasks - use prefetched data (NO new query)
-        if hasattr(hub, 'note_sale') and getattr(hub, 'note_sale', None) is not None:
-            try:
-                ns_tasks_list = list(hub.note_sale_tasks.all())  # Uses prefetched data
-                if ns_tasks_list:
-                    ns_task = max(ns_tasks_list, key=lambda t: t.created_at or '')
-                    if ns_task.task_type:
-                        label = ns_task.get_task_type_display() if hasattr(ns_task, 'get_task_type_display') else ns_task.task_type
-                        tasks.append(f'Note Sale: {label}')
-            except Exception:
-                pass
-
-        # Performing Tasks - use prefetched data (NO new query)
-        if hasattr(hub, 'performing_track') and getattr(hub, 'performing_track', None) is not None:
-            try:
-                perf_tasks_list = list(hub.performing_tasks.all())  # Uses prefetched data
-                if perf_tasks_list:
-                    perf_task = max(perf_tasks_list, key=lambda t: t.created_at or '')
-                    if perf_task.task_type:
-                        label = perf_task.get_task_type_display() if hasattr(perf_task, 'get_task_type_display') else perf_task.task_type
-                        tasks.append(f'Performing: {label}')
-            except Exception:
-                pass
-
-        # Delinquent Tasks - use prefetched data (NO new query)
-        if hasattr(hub, 'delinquent_track') and getattr(hub, 'delinquent_track', None) is not None:
-            try:
-                dq_tasks_list = list(hub.delinquent_tasks.all())  # Uses prefetched data
-                if dq_tasks_list:
-                    dq_task = max(dq_tasks_list, key=lambda t: t.created_at or '')
-                    if dq_task.task_type:
-                        label = dq_task.get_task_type_display() if hasattr(dq_task, 'get_task_type_display') else dq_task.task_type
-                        tasks.append(f'Delinquent: {label}')
-            except Exception:
-                pass
+        for spec in TRACK_SPECS:
+            if not state.has_track(spec.key):
+                continue
+            latest = state.latest_task(spec.key)
+            if latest is not None and latest.task_type:
+                tasks.append(f'{spec.label}: {latest.label}')
 
         # WHAT: Return comma-separated string or None for empty
         return ', '.join(tasks) if tasks else None
@@ -37,6 +37,7 @@ logger = logging.getLogger(__name__)
 _MODEL_NAME = os.getenv("AI_SUMMARY_MODEL", "gemini-2.5-flash")  # Gemini Flash 2.5 - cost-effective option
 _MAX_OUTPUT_TOKENS = int(os.getenv("AI_SUMMARY_MAX_TOKENS", "2048"))  # Gemini supports higher token limits
 _TEMPERATURE = float(os.getenv("AI_SUMMARY_TEMPERATURE", "0.3"))  # Slightly higher for more natural summaries
+_SUMMARY_CONCURRENCY = int(os.getenv("AI_SUMMARY_CONCURRENCY", "4"))  # Parallel Gemini calls for batched regeneration
 
 
 def _compute_notes_hash(notes: List[AMNote]) -> str:
@@ -533,3 +534,47 @@ def generate_note_summary(asset_hub_id: int, force_regenerate: bool = False) ->
         # HOW: Raise new exception with helpful message
         raise Exception(f"Gemini summary generation failed: {str(e)}") from e
 
+
+
+def generate_note_summaries(asset_hub_ids, max_workers: int = _SUMMARY_CONCURRENCY) -> Dict[int, str]:
+    """
+    WHAT: Regenerates summaries for many asset hubs (outbox batch for AMNote changes).
+    WHY: Note saves used to call Gemini inline, once per save; the outbox coalesces a burst
+         of edits per hub and hands the dispatcher one list of hubs.
+    HOW: Calls generate_note_summary per hub on a small thread pool (the work is Gemini
+         round-trips). The notes hash check skips hubs whose notes did not change, so a
+         retried batch only re-summarizes the hubs that failed.
+
+    Args:
+        asset_hub_ids: AssetIdHub primary keys
+        max_workers: Concurrent Gemini calls
+
+    Returns:
+        Dict of asset_hub_id -> error message for hubs that failed (empty on success)
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from django.db import connection
+
+    hub_ids = sorted({int(h) for h in asset_hub_ids if h})
+
+    def _summarize(hub_id: int):
+        try:
+            generate_note_summary(hub_id)
+            return hub_id, None
+        except Exception as e:
+            return hub_id, str(e)
+
+    def _summarize_in_worker(hub_id: int):
+        try:
+            return _summarize(hub_id)
+        finally:
+            # WHAT: Worker threads open their own DB connection; release it per task
+            connection.close()
+
+    if len(hub_ids) <= 1 or max_workers <= 1:
+        results = [_summarize(hub_id) for hub_id in hub_ids]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(hub_ids)), thread_name_prefix="note-summary") as pool:
+            results = list(pool.map(_summarize_in_worker, hub_ids))
+    return {hub_id: error for hub_id, error in results if error}
@@ -0,0 +1,357 @@
+"""
+Batched Performance Summary (underwritten vs realized) across many assets.
+
+WHAT: The PLMetrics grid values for a set of assets as one columnar frame, with variance
+      and trade / fund / total subtotals
+WHY: PerformanceSummarySerializer resolves ~60 get_*_underwritten / get_*_realized methods
+     one asset at a time; portfolio reviews open dozens of assets and paid that per asset
+HOW: - load_performance_inputs(): one query - BlendedOutcomeModel inputs, the
+       LLTransactionSummary realized fields and the trade / fund keys joined per hub
+     - underwritten_frame() / realized_frame(): every grid row is one vectorized column,
+       following the serializer's rules (None for missing inputs, the same rollups,
+       the "> 0 else None" realized totals)
+     - build_performance_table(): variance = realized - underwritten, subtotals by
+       groupby(trade / fund) over the same frame
+     - GET /api/am/performance-summary/bulk/ wraps it
+
+Docs reviewed:
+- QuerySet.values() with expressions: https://docs.djangoproject.com/en/5.2/ref/models/querysets/#values
+- DataFrame.groupby: https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.groupby.html
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+from django.db.models import F, Q
+
+from am_module.models.model_am_modeling import BlendedOutcomeModel
+
+# WHAT: Grid rows in PLMetrics.vue order (keys match PerformanceSummarySerializer's prefixes)
+METRICS = (
+    'purchase_cost',
+    'acq_due_diligence', 'acq_legal', 'acq_title', 'acq_other', 'acq_costs_total',
+    'gross_cost_total',
+    'income_principal', 'income_interest', 'income_rent', 'income_cam', 'income_mod_down_payment',
+    'income_total',
+    'expense_servicing',
+    'legal_foreclosure', 'legal_bankruptcy', 'legal_dil', 'legal_cash_for_keys', 'legal_eviction',
+    'legal_costs_total',
+    'expense_am_fees', 'expense_property_tax', 'expense_property_insurance',
+    'reo_hoa', 'reo_utilities', 'reo_trashout', 'reo_renovation', 'reo_property_preservation',
+    'cre_marketing', 'cre_ga_pool', 'cre_maintenance', 'cre_expenses_total',
+    'reo_expenses_total',
+    'fund_taxes', 'fund_legal', 'fund_consulting', 'fund_audit', 'fund_expenses_total',
+    'operating_expenses_total',
+    'proceeds', 'net_liquidation_proceeds', 'broker_closing', 'other_closing', 'closing_costs_total',
+    'net_pl',
+)
+
+# WHAT: Grid rows read straight from a BlendedOutcomeModel field
+UNDERWRITTEN_SOURCES = {
+    'purchase_cost': 'purchase_price',
+    'income_principal': 'principal_collect',
+    'income_interest': 'interest_collect',
+    'income_rent': 'rental_income',
+    'income_cam': 'cam_income',
+    'income_mod_down_payment': 'mod_down_payment',
+    'legal_bankruptcy': 'bk_legal_fees',
+    'legal_dil': 'dil_fees',
+    'legal_cash_for_keys': 'cfk_fees',
+    'legal_eviction': 'eviction_fees',
+    'expense_am_fees': 'fund_am_fees',
+    'expense_property_tax': 'total_property_tax',
+    'expense_property_insurance': 'total_insurance',
+    'reo_hoa': 'total_hoa',
+    'reo_utilities': 'total_utility',
+    'reo_trashout': 'trashout_cost',
+    'reo_renovation': 'reconciled_rehab_cost',
+    'reo_property_preservation': 'property_preservation_cost',
+    'proceeds': 'expected_gross_proceeds',
+    'net_liquidation_proceeds': 'expected_net_proceeds',
+    'broker_closing': 'broker_closing_fees',
+    'other_closing': 'tax_title_transfer_cost',
+}
+ACQ_FIELDS = ('due_diligence', 'legal_costs', 'taxtitle_fees', 'other_fee', 'broker_acq_fees')
+SERVICING_FIELDS = (
+    'servicing_board_fee', 'servicing_current', 'servicing_30d', 'servicing_60d', 'servicing_90d',
+    'servicing_120d', 'servicing_fc', 'servicing_bk', 'servicing_liq_fee',
+)
+UNDERWRITTEN_FIELDS = tuple(dict.fromkeys(
+    [*UNDERWRITTEN_SOURCES.values(), *ACQ_FIELDS, *SERVICING_FIELDS, 'fc_expenses']
+))
+
+# WHAT: Grid rows read straight from an LLTransactionSummary field
+REALIZED_SOURCES = {
+    metric: f'{metric}_realized'
+    for metric in (
+        'acq_due_diligence', 'acq_legal', 'acq_title', 'acq_other',
+        'income_principal', 'income_interest', 'income_rent', 'income_cam', 'income_mod_down_payment',
+        'expense_servicing', 'expense_am_fees', 'expense_property_tax', 'expense_property_insurance',
+        'legal_foreclosure', 'legal_bankruptcy', 'legal_dil', 'legal_cash_for_keys', 'legal_eviction',
+        'reo_hoa', 'reo_utilities', 'reo_trashout', 'reo_renovation', 'reo_property_preservation',
+        'cre_marketing', 'cre_ga_pool', 'cre_maintenance',
+        'fund_taxes', 'fund_legal', 'fund_consulting', 'fund_audit',
+        'net_liquidation_proceeds', 'broker_closing', 'other_closing',
+    )
+}
+REALIZED_SOURCES.update({
+    'purchase_cost': 'purchase_price_realized',
+    'proceeds': 'gross_liquidation_proceeds_realized',
+})
+REALIZED_FIELDS = tuple(dict.fromkeys([
+    *REALIZED_SOURCES.values(),
+    'acq_total_realized', 'legal_total_realized', 'reo_total_realized', 'fund_total_realized',
+    'total_expenses_realized', 'realized_gross_cost',
+]))
+
+GROUP_LEVELS = {'trade': 'trade_id', 'fund': 'fund_id'}
+MAX_BULK_ASSETS = 5000
+
+
+class PerformanceScopeTooLarge(ValueError):
+    """The requested hubs / trades / funds cover more than MAX_BULK_ASSETS assets."""
+
+
+# ------------------------------
+# Loading
+# ------------------------------
+
+def performance_scope(
+    hub_ids: Optional[Iterable[int]] = None,
+    trade_ids: Optional[Iterable[int]] = None,
+    fund_ids: Optional[Iterable[int]] = None,
+) -> Q:
+    """BlendedOutcomeModel filter for hubs OR'd with trades / funds (AssetDetails keys)."""
+    scope = Q(pk__in=[])
+    if hub_ids:
+        scope |= Q(asset_hub_id__in=list(hub_ids))
+    if trade_ids:
+        scope |= Q(asset_hub__details__trade_id__in=list(trade_ids))
+    if fund_ids:
+        scope |= Q(asset_hub__details__fund_legal_entity_id__in=list(fund_ids))
+    return scope
+
+
+def load_performance_inputs(scope: Q, limit: Optional[int] = MAX_BULK_ASSETS) -> pd.DataFrame:
+    """
+    WHAT: Underwritten and realized inputs for every hub in scope
+    HOW: One query; realized fields are joined through the one-to-one summary and
+         prefixed ``ts_``; ``has_realized`` marks hubs with an LLTransactionSummary
+
+    RETURNS: DataFrame indexed by asset_hub_id (float64 amounts, NaN for NULL)
+    RAISES: PerformanceScopeTooLarge when the scope has more than ``limit`` assets -
+            a cut-off scope would return trade / fund subtotals that look complete
+    """
+    realized = {f'ts_{name}': F(f'asset_hub__ll_transaction_summary__{name}') for name in REALIZED_FIELDS}
+    rows = (
+        BlendedOutcomeModel.objects
+        .filter(scope)
+        .order_by('asset_hub_id')
+        .values(
+            'asset_hub_id',
+            *UNDERWRITTEN_FIELDS,
+            trade_id=F('asset_hub__details__trade_id'),
+            trade_name=F('asset_hub__details__trade__trade_name'),
+            fund_id=F('asset_hub__details__fund_legal_entity_id'),
+            fund_name=F('asset_hub__details__fund_legal_entity__nickname_name'),
+            summary_id=F('asset_hub__ll_transaction_summary__asset_hub_id'),
+            **realized,
+        )
+    )
+    if limit is not None:
+        rows = list(rows[:limit + 1])
+        if len(rows) > limit:
+            raise PerformanceScopeTooLarge(f'Scope covers more than {limit} assets; narrow the hubs, trades or funds.')
+    df = pd.DataFrame.from_records(list(rows))
+    if df.empty:
+        return df
+    df = df.set_index('asset_hub_id')
+    amounts = [*UNDERWRITTEN_FIELDS, *realized]
+    df[amounts] = df[amounts].apply(pd.to_numeric, errors='coerce').astype(np.float64)
+    df['has_realized'] = df.pop('summary_id').notna()
+    return df
+
+
+# ------------------------------
+# Vectorized grid columns
+# ------------------------------
+
+def _sum(df: pd.DataFrame, *columns: str) -> pd.Series:
+    """Sum with NULL as 0 (the serializer's `x or 0`)."""
+    return df[list(columns)].fillna(0).sum(axis=1)
+
+
+def _nonzero(series: pd.Series) -> pd.Series:
+    return series.where(series != 0)
+
+
+def _positive(series: pd.Series) -> pd.Series:
+    return series.where(series > 0)
+
+
+def underwritten_frame(inputs: pd.DataFrame) -> pd.DataFrame:
+    """Underwritten grid column per metric (rules of PerformanceSummarySerializer)."""
+    out = pd.DataFrame(index=inputs.index)
+    for metric, source in UNDERWRITTEN_SOURCES.items():
+        out[metric] = inputs[source]
+    out['acq_due_diligence'] = _nonzero(inputs['due_diligence'])
+    out['acq_legal'] = _nonzero(inputs['legal_costs'])
+    out['acq_title'] = _nonzero(inputs['taxtitle_fees'])
+    out['acq_other'] = _positive(_sum(inputs, 'other_fee', 'broker_acq_fees'))
+    out['acq_costs_total'] = _sum(inputs, *ACQ_FIELDS)
+    out['gross_cost_total'] = _sum(inputs, 'purchase_price') + out['acq_costs_total']
+    out['income_total'] = _sum(out, 'income_principal', 'income_interest', 'income_rent', 'income_cam', 'income_mod_down_payment')
+    out['expense_servicing'] = _positive(_sum(inputs, *SERVICING_FIELDS))
+    out['legal_foreclosure'] = _sum(inputs, 'fc_expenses')
+    out['legal_costs_total'] = _sum(
+        out, 'legal_foreclosure', 'legal_bankruptcy', 'legal_dil', 'legal_cash_for_keys', 'legal_eviction',
+    )
+    # WHAT: No underwritten CRE / fund expense inputs yet (serializer returns None / 0)
+    for metric in ('cre_marketing', 'cre_ga_pool', 'cre_maintenance', 'fund_taxes', 'fund_legal', 'fund_consulting', 'fund_audit'):
+        out[metric] = np.nan
+    out['cre_expenses_total'] = 0.0
+    out['fund_expenses_total'] = 0.0
+    out['reo_expenses_total'] = _sum(
+        out, 'reo_hoa', 'reo_utilities', 'reo_trashout', 'reo_renovation', 'reo_property_preservation',
+    ) + out['cre_expenses_total']
+    out['operating_expenses_total'] = _sum(
+        out, 'expense_servicing', 'legal_costs_total', 'expense_am_fees', 'expense_property_tax',
+        'expense_property_insurance', 'reo_expenses_total', 'fund_expenses_total',
+    )
+    out['closing_costs_total'] = _sum(out, 'broker_closing', 'other_closing')
+    out['net_pl'] = (
+        _sum(out, 'proceeds') + out['income_total'] - (out['operating_expenses_total'] + out['gross_cost_total'])
+    )
+    return out[list(METRICS)]
+
+
+def realized_frame(inputs: pd.DataFrame) -> pd.DataFrame:
+    """Realized grid column per metric; every value is NaN for hubs without a summary."""
+    ts = inputs[[f'ts_{name}' for name in REALIZED_FIELDS]]
+    ts.columns = list(REALIZED_FIELDS)
+    out = pd.DataFrame(index=inputs.index)
+    for metric, source in REALIZED_SOURCES.items():
+        out[metric] = ts[source]
+    out['acq_costs_total'] = _positive(_sum(out, 'acq_due_diligence', 'acq_legal', 'acq_title', 'acq_other'))
+    out['gross_cost_total'] = ts['realized_gross_cost'].fillna(
+        _positive(_sum(ts, 'purchase_price_realized', 'acq_total_realized'))
+    )
+    out['income_total'] = _positive(_sum(
+        out, 'income_principal', 'income_interest', 'income_rent', 'income_cam', 'income_mod_down_payment',
+    ))
+    out['legal_costs_total'] = _positive(_sum(
+        out, 'legal_foreclosure', 'legal_bankruptcy', 'legal_dil', 'legal_cash_for_keys', 'legal_eviction',
+    ))
+    out['cre_expenses_total'] = _positive(_sum(out, 'cre_marketing', 'cre_ga_pool', 'cre_maintenance'))
+    out['reo_expenses_total'] = _positive(_sum(
+        out, 'reo_hoa', 'reo_utilities', 'reo_trashout', 'reo_renovation', 'reo_property_preservation',
+        'cre_expenses_total',
+    ))
+    out['fund_expenses_total'] = _positive(_sum(out, 'fund_taxes', 'fund_legal', 'fund_consulting', 'fund_audit'))
+    out['operating_expenses_total'] = ts['total_expenses_realized'].fillna(_positive(
+        _sum(out, 'expense_servicing', 'expense_am_fees', 'expense_property_tax', 'expense_property_insurance')
+        + _sum(ts, 'legal_total_realized', 'reo_total_realized', 'fund_total_realized')
+    ))
+    out['closing_costs_total'] = _positive(_sum(out, 'broker_closing', 'other_closing'))
+    out['net_pl'] = _nonzero(
+        _sum(out, 'proceeds', 'income_total') - _sum(out, 'operating_expenses_total', 'gross_cost_total')
+    )
+    return out[list(METRICS)].where(inputs['has_realized'], axis=0)
+
+
+def _variance_table(
+    underwritten: pd.DataFrame, realized: pd.DataFrame, variance: Optional[pd.DataFrame] = None,
+) -> pd.DataFrame:
+    """Columns <metric>_underwritten / _realized / _variance, in METRICS order (variance defaults to realized - underwritten)."""
+    if variance is None:
+        variance = realized - underwritten
+    columns = {}
+    for metric in METRICS:
+        columns[f'{metric}_underwritten'] = underwritten[metric]
+        columns[f'{metric}_realized'] = realized[metric]
+        columns[f'{metric}_variance'] = variance[metric]
+    return pd.DataFrame(columns, index=underwritten.index)
+
+
+# ------------------------------
+# Table
+# ------------------------------
+
+def _records(frame: pd.DataFrame) -> List[Dict[str, Any]]:
+    """JSON-ready rows: amounts rounded to cents, NaN -> None."""
+    frame = frame.round(2).astype(object).where(frame.notna(), None)
+    return frame.to_dict('records')
+
+
+def build_performance_table(inputs: pd.DataFrame) -> Dict[str, Any]:
+    """
+    WHAT: Per-asset variance table plus trade, fund and total subtotals
+    HOW: Subtotals sum each column (NULLs skipped, all-NULL stays NULL). A subtotal's
+         variance is the sum of the per-asset variances, so it only covers assets with
+         both an underwritten and a realized value - a hub without an LLTransactionSummary
+         adds to the underwritten subtotal but not to the variance
+
+    RETURNS:
+        {
+            'metrics': [...],
+            'assets': [{'asset_hub_id', 'trade_id', 'trade_name', 'fund_id', 'fund_name',
+                        '<metric>_underwritten', '<metric>_realized', '<metric>_variance', ...}],
+            'trades': [{'trade_id', 'trade_name', 'asset_count', ...}],
+            'funds': [{'fund_id', 'fund_name', 'asset_count', ...}],
+            'total': {'asset_count', ...} or None,
+        }
+    """
+    result: Dict[str, Any] = {'metrics': list(METRICS), 'assets': [], 'trades': [], 'funds': [], 'total': None}
+    if inputs.empty:
+        return result
+
+    underwritten = underwritten_frame(inputs)
+    realized = realized_frame(inputs)
+    keys = inputs[['trade_id', 'trade_name', 'fund_id', 'fund_name']].astype({'trade_id': 'Int64', 'fund_id': 'Int64'})
+
+    variance = realized - underwritten
+    assets = keys.join(_variance_table(underwritten, realized, variance)).reset_index()
+    result['assets'] = _records(assets)
+
+    for level, key in GROUP_LEVELS.items():
+        name = f'{level}_name'
+        grouped_keys = keys[[key, name]].fillna({key: -1})
+        group_u = underwritten.groupby(grouped_keys[key]).sum(min_count=1)
+        group_r = realized.groupby(grouped_keys[key]).sum(min_count=1)
+        group_v = variance.groupby(grouped_keys[key]).sum(min_count=1)
+        table = _variance_table(group_u, group_r, group_v)
+        table.insert(0, 'asset_count', grouped_keys.groupby(key).size())
+        table.insert(0, name, grouped_keys.groupby(key)[name].first())
+        table.index.name = key
+        table = table.reset_index()
+        # WHAT: Hubs without a trade / fund subtotal under key None
+        table[key] = table[key].astype(object).where(table[key] != -1, None)
+        result[f'{level}s'] = _records(table)
+
+    total = _variance_table(
+        underwritten.sum(min_count=1).to_frame().T,
+        realized.sum(min_count=1).to_frame().T,
+        variance.sum(min_count=1).to_frame().T,
+    )
+    total.insert(0, 'asset_count', len(inputs))
+    result['total'] = _records(total)[0]
+    return result
+
+
+def get_bulk_performance_summary(
+    hub_ids: Optional[Iterable[int]] = None,
+    trade_ids: Optional[Iterable[int]] = None,
+    fund_ids: Optional[Iterable[int]] = None,
+    limit: Optional[int] = MAX_BULK_ASSETS,
+) -> Dict[str, Any]:
+    """
+    WHAT: Performance Summary variance table for hubs and/or whole trades / funds
+    WHY: Portfolio reviews - one query and a handful of vectorized columns for every asset
+
+    RETURNS: See build_performance_table
+    RAISES: PerformanceScopeTooLarge (see load_performance_inputs)
+    """
+    return build_performance_table(load_performance_inputs(performance_scope(hub_ids, trade_ids, fund_ids), limit))
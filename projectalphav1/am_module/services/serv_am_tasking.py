@@ -2,30 +2,24 @@
 # WHAT: Service functions for task completion metrics and status logic
 # WHY: Centralize business logic for determining active vs completed tasks
 # WHERE: Called by view_am_tasking.py to provide dashboard metrics
-# HOW: Filter tasks by completion status based on task_type values
+# HOW: Categorize tasks from the bulk-loaded workflow state (serv_am_workflowState)
 # ============================================================
 
-from typing import Dict, List, Any, Type
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional, Type
 
 from django.db import transaction
 from am_module.models.model_am_amData import (
-    FCTask,
-    REOtask,
-    DILTask,
-    ShortSaleTask,
-    ModificationTask,
-    NoteSaleTask,
-    PerformingTask,
-    DelinquentTask,
-    FCSale,
-    REOData,
-    DIL,
     ShortSale,
-    Modification,
-    NoteSale,
-    PerformingTrack,
+    DelinquentTask,
     DelinquentTrack,
 )
+from am_module.services.serv_am_workflowState import (
+    AssetWorkflowState,
+    SPECS_BY_KEY,
+    TRACK_SPECS,
+    load_workflow_state,
+)
 
 
 def enforce_track_exclusivity_after_activation(*, created_model: Type, asset_hub) -> None:
@@ -55,15 +49,17 @@ def enforce_track_exclusivity_after_activation(*, created_model: Type, asset_hub
             pass
 
 
-def get_task_metrics(hub_id: int) -> Dict[str, Any]:
+def get_task_metrics(hub_id: int, state: Optional[AssetWorkflowState] = None) -> Dict[str, Any]:
     """
     WHAT: Calculate active and completed task counts for a hub
     WHY: Provide task completion metrics for the tasking dashboard UI
     WHERE: Called by view_am_tasking.py endpoint for dashboard data
-    HOW: Query all task types, filter by completion status, aggregate counts
+    HOW: Walk the hub's bulk-loaded workflow state, categorize tasks by sequence position
     
     Args:
         hub_id: The asset hub ID to get metrics for
+        state: Optional pre-loaded workflow state (avoids reloading when the caller
+            also needs tracks/milestones for the same hub)
         
     Returns:
         dict: {
@@ -76,103 +72,54 @@ def get_task_metrics(hub_id: int) -> Dict[str, Any]:
     Business Rules:
         - FC Task "sold" = completed
         - REO Task "sold" = completed  
-        - DIL Task "dil_successful" = completed
+        - DIL Task "dil_executed" = completed
         - Short Sale Task "sold" = completed
-        - Modification Task "mod_accepted" = completed
+        - Modification Task "mod_failed" = completed
         - All other task types = active
     """
-    # WHAT: Define task sequences for each outcome type
-    # WHY: Need to know the order of tasks to determine which is "most recent"
-    # HOW: Map model class to ordered sequence of task_type values
-    TASK_SEQUENCES = {
-        FCTask: ['nod_noi', 'fc_filing', 'mediation', 'judgement', 'redemption', 'sale_scheduled', 'sold'],
-        REOtask: ['eviction', 'trashout', 'renovation', 'pre_marketing', 'listed', 'under_contract', 'sold'],
-        DILTask: ['pursuing_dil', 'owner_contacted', 'dil_failed', 'dil_drafted', 'dil_executed'],
-        ShortSaleTask: ['list_price_accepted', 'listed', 'under_contract', 'sold'],
-        ModificationTask: ['mod_drafted', 'mod_executed', 'mod_rpl', 'mod_failed'],
-        NoteSaleTask: ['potential_note_sale', 'out_to_market', 'pending_sale', 'sold'],
-        PerformingTask: ['perf', 'rpl', 'note_sold'],
-        DelinquentTask: ['dq_30', 'dq_60', 'dq_90', 'dq_120_plus', 'loss_mit', 'fc_dil'],
-    }
-    
-    # WHAT: Define which task types actually close the track
-    # WHY: Some final tasks close the track (sold, failed), others don't (re-performing)
-    # HOW: Map model class to list of task_type values that mean "track closed"
-    TRACK_CLOSING_TYPES = {
-        FCTask: ['sold'],
-        REOtask: ['sold'],
-        DILTask: ['dil_executed'],
-        ShortSaleTask: ['sold'],
-        ModificationTask: ['mod_failed'],  # Only 'failed' closes track, not 're-performing'
-        NoteSaleTask: ['sold'],
-        PerformingTask: ['note_sold'],
-        DelinquentTask: ['loss_mit', 'fc_dil'],
-    }
-    
+    if state is None:
+        state = load_workflow_state(hub_id)
+
     active_tasks = []
     completed_tasks = []
     
-    # WHAT: Process each task model to categorize tasks
+    # WHAT: Process each track's tasks to categorize them
     # WHY: Need to determine which task is most recent and which are superseded
-    # HOW: For each model, find highest task in sequence and mark others as completed
-    for task_model, sequence in TASK_SEQUENCES.items():
-        tasks = task_model.objects.filter(asset_hub_id=hub_id).select_related('asset_hub')
-        
+    # HOW: For each track, find highest task in sequence and mark others as completed
+    for spec in TRACK_SPECS:
+        # WHAT: Newest first so the most recent of duplicate task types wins
+        tasks = list(reversed(state.tasks_for(spec.key)))
         if not tasks:
             continue
+        sequence = spec.sequence
         
         # WHAT: Find the highest (most recent) task in the sequence
         # WHY: Only the most recent task should be active, all previous are completed
         # HOW: Check each task's position in sequence, keep track of highest
         highest_index = -1
         highest_task = None
-        closing_types = TRACK_CLOSING_TYPES.get(task_model, [])
         
         for task in tasks:
             task_type_lower = task.task_type.lower() if task.task_type else ''
-            try:
-                index = sequence.index(task_type_lower)
-                if index > highest_index:
-                    highest_index = index
-                    highest_task = task
-            except ValueError:
-                # Task type not in sequence, skip it
-                continue
+            if task_type_lower in sequence and sequence.index(task_type_lower) > highest_index:
+                highest_index = sequence.index(task_type_lower)
+                highest_task = task
         
         # WHAT: Categorize all tasks based on highest task found
         # WHY: Most recent task is active (unless it closes track), all others are completed
-        # HOW: Compare each task's index to highest_index
         for task in tasks:
             task_type_lower = task.task_type.lower() if task.task_type else ''
-            
-            try:
-                index = sequence.index(task_type_lower)
-            except ValueError:
+            if task_type_lower not in sequence:
                 # Task type not in sequence, skip it
                 continue
             
-            # WHAT: Check if this is the highest task
-            if task.id == highest_task.id:
-                # WHAT: Check if this task type closes the track
-                if task_type_lower in closing_types:
-                    # Track is closed, add to completed
-                    completed_tasks.append({
-                        'model': task_model.__name__,
-                        'task': task,
-                    })
-                else:
-                    # Most recent task but track still active
-                    active_tasks.append({
-                        'model': task_model.__name__,
-                        'task': task,
-                    })
+            item = {'model': task.model_name, 'task': task}
+            if task.id == highest_task.id and task_type_lower not in spec.closing_types:
+                # Most recent task but track still active
+                active_tasks.append(item)
             else:
-                # WHAT: This task is superseded by a more recent task
-                # WHY: Earlier tasks in sequence are considered "completed" when later tasks exist
-                completed_tasks.append({
-                    'model': task_model.__name__,
-                    'task': task,
-                })
+                # WHAT: Superseded by a more recent task, or the track-closing task itself
+                completed_tasks.append(item)
     
     return {
         'active_count': len(active_tasks),
@@ -190,7 +137,7 @@ def _serialize_task_pills(task_data_list: List[Dict[str, Any]], is_completed: bo
     HOW: Map task data to UI badge format with outcome-specific colors
     
     Args:
-        task_data_list: List of dicts with 'model' (str) and 'task' (model instance)
+        task_data_list: List of dicts with 'model' (str) and 'task' (TaskRecord)
         is_completed: If True, use 'success' tone for all tasks (green for sold/completed)
         
     Returns:
@@ -224,8 +171,8 @@ def _serialize_task_pills(task_data_list: List[Dict[str, Any]], is_completed: bo
         
         # WHAT: Get human-readable label from task_type choices
         # WHY: Display friendly names like "Sold" instead of "sold"
-        # HOW: Use get_task_type_display() Django method
-        task_label = task.get_task_type_display() if hasattr(task, 'get_task_type_display') else task.task_type.upper()
+        # HOW: TaskRecord.label is resolved from the model's TaskType choices
+        task_label = task.label or task.task_type.upper()
         
         # WHAT: Combine track prefix with task label
         # WHY: Show context of which track the task belongs to
@@ -274,15 +221,16 @@ def _get_outcome_tone(outcome_type: str) -> str:
     return tone_map.get(outcome_type, 'secondary')
 
 
-def get_active_outcome_tracks(hub_id: int) -> Dict[str, Any]:
+def get_active_outcome_tracks(hub_id: int, state: Optional[AssetWorkflowState] = None) -> Dict[str, Any]:
     """
     WHAT: Determine which outcome tracks are active vs completed for a hub
     WHY: Active Tracks should only show outcomes that haven't reached completion
     WHERE: Called by view_am_tasking.py endpoint for dashboard data
-    HOW: Check if outcome has any tasks with completion status
+    HOW: Check if outcome has any tasks with completion status (bulk-loaded workflow state)
     
     Args:
         hub_id: The asset hub ID to get active tracks for
+        state: Optional pre-loaded workflow state
         
     Returns:
         dict: {
@@ -299,97 +247,39 @@ def get_active_outcome_tracks(hub_id: int) -> Dict[str, Any]:
         - Short Sale with "sold" task → completed track
         - Modification with "completed" task → completed track
     """
-    # WHAT: Map outcome models to their task models and completion types
-    # WHY: Need to check if outcome has completed tasks
-    # HOW: Query outcome, then check its tasks for completion status
-    OUTCOME_CONFIG = {
-        'fc': {
-            'outcome_model': FCSale,
-            'task_model': FCTask,
-            'completion_types': ['sold'],
-            'label': 'FC',
-            'tone': 'danger',
-        },
-        'reo': {
-            'outcome_model': REOData,
-            'task_model': REOtask,
-            'completion_types': ['sold'],
-            'label': 'REO',
-            'tone': 'info',
-        },
-        'dil': {
-            'outcome_model': DIL,
-            'task_model': DILTask,
-            'completion_types': ['dil_executed'],
-            'label': 'DIL',
-            'tone': 'primary',
-        },
-        'short_sale': {
-            'outcome_model': ShortSale,
-            'task_model': ShortSaleTask,
-            'completion_types': ['sold'],
-            'label': 'Short Sale',
-            'tone': 'warning',
-        },
-        'modification': {
-            'outcome_model': Modification,
-            'task_model': ModificationTask,
-            'completion_types': ['mod_failed'],  # Fixed: must match task_type value with mod_ prefix
-            'label': 'Modification',
-            'tone': 'modification-green',
-        },
-        'note_sale': {
-            'outcome_model': NoteSale,
-            'task_model': NoteSaleTask,
-            'completion_types': ['sold'],
-            'label': 'Note Sale',
-            'tone': 'secondary',
-        },
-        'performing': {
-            'outcome_model': PerformingTrack,
-            'task_model': PerformingTask,
-            'completion_types': ['note_sold'],
-            'label': 'Performing',
-            'tone': 'success',
-        },
-        'delinquent': {
-            'outcome_model': DelinquentTrack,
-            'task_model': DelinquentTask,
-            'completion_types': ['loss_mit', 'fc_dil'],
-            'label': 'Delinquent',
-            'tone': 'warning',
-        },
+    # WHAT: Badge label/tone per outcome track (models + completion types live in TRACK_SPECS)
+    OUTCOME_BADGES = {
+        'fc': ('FC', 'danger'),
+        'reo': ('REO', 'info'),
+        'dil': ('DIL', 'primary'),
+        'short_sale': ('Short Sale', 'warning'),
+        'modification': ('Modification', 'modification-green'),
+        'note_sale': ('Note Sale', 'secondary'),
+        'performing': ('Performing', 'success'),
+        'delinquent': ('Delinquent', 'warning'),
     }
-    
+
+    if state is None:
+        state = load_workflow_state(hub_id)
+
     active_tracks = []
     completed_tracks = []
     active_track_badges = []
     
-    for outcome_type, config in OUTCOME_CONFIG.items():
-        # WHAT: Check if this outcome exists for this hub
-        # WHY: Only show tracks that have been created
-        # HOW: Query outcome model by asset_hub_id
-        outcome_exists = config['outcome_model'].objects.filter(asset_hub_id=hub_id).exists()
-        
-        if not outcome_exists:
+    for outcome_type, (label, tone) in OUTCOME_BADGES.items():
+        # WHAT: Only show tracks that have been created
+        if not state.has_track(outcome_type):
             continue
         
-        # WHAT: Check if outcome has any completed tasks
-        # WHY: Completed tasks mean the track is done
-        # HOW: Use exists() with __in for single optimized query instead of N+1 loop
-        has_completed_task = config['task_model'].objects.filter(
-            asset_hub_id=hub_id,
-            task_type__in=config['completion_types']
-        ).exists()
-        
-        if has_completed_task:
+        # WHAT: Completed tasks mean the track is done
+        if state.is_closed(outcome_type):
             completed_tracks.append(outcome_type)
         else:
             active_tracks.append(outcome_type)
             active_track_badges.append({
                 'key': f"track_{outcome_type}",
-                'label': config['label'],
-                'tone': config['tone'],
+                'label': label,
+                'tone': tone,
             })
     
     return {
@@ -401,15 +291,16 @@ def get_active_outcome_tracks(hub_id: int) -> Dict[str, Any]:
     }
 
 
-def get_track_milestones(hub_id: int) -> List[Dict[str, Any]]:
+def get_track_milestones(hub_id: int, state: Optional[AssetWorkflowState] = None) -> List[Dict[str, Any]]:
     """
     WHAT: Get current and upcoming tasks for each active track
     WHY: Provide milestone progression view for tasking dashboard
     WHERE: Called by view_am_tasking.py endpoint for milestones card
-    HOW: Define task sequences, find current task, determine next task
+    HOW: Use task sequences from TRACK_SPECS, find current task, determine next task
     
     Args:
         hub_id: The asset hub ID to get milestones for
+        state: Optional pre-loaded workflow state
         
     Returns:
         List of track groups with current and upcoming tasks:
@@ -421,143 +312,39 @@ def get_track_milestones(hub_id: int) -> List[Dict[str, Any]]:
             }
         ]
     """
-    # WHAT: Define task sequences for each outcome track
-    # WHY: Each track has a specific order of tasks that must be completed
-    # HOW: Map track to ordered list of task_type values
-    TRACK_SEQUENCES = {
-        'fc': {
-            'label': 'Foreclosure',
-            'tone': 'danger',
-            'task_model': FCTask,
-            'sequence': [
-                'nod_noi',        # NOD/NOI (Notice of Default/Notice of Intent)
-                'fc_filing',      # FC Filing
-                'mediation',      # Mediation
-                'judgement',      # Judgement
-                'redemption',     # Redemption period
-                'sale_scheduled', # Sale Scheduled
-                'sold',           # Sold (completion)
-            ]
-        },
-        'modification': {
-            'label': 'Modification',
-            'tone': 'modification-green',
-            'task_model': ModificationTask,
-            'sequence': [
-                'mod_drafted',      # Drafted
-                'mod_executed',     # Executed
-                'mod_rpl',          # Re-Performing
-                'mod_failed',       # Failed
-            ]
-        },
-        'short_sale': {
-            'label': 'Short Sale',
-            'tone': 'warning',
-            'task_model': ShortSaleTask,
-            'sequence': [
-                'list_price_accepted', # List Price Accepted (matches ShortSaleCard)
-                'listed',             # Listed
-                'under_contract',     # Under Contract
-                'sold',              # Sold (completion)
-            ]
-        },
-        'dil': {
-            'label': 'Deed-in-Lieu',
-            'tone': 'primary',
-            'task_model': DILTask,
-            'sequence': [
-                'pursuing_dil',             # Pursuing DIL
-                'owner_contacted',          # Owner/Heirs contacted
-                'dil_failed',               # DIL Failed
-                'dil_drafted',              # DIL Drafted
-                'dil_executed',             # DIL Executed (completion)
-            ]
-        },
-        'reo': {
-            'label': 'REO',
-            'tone': 'info',
-            'task_model': REOtask,
-            'sequence': [
-                'eviction',       # Eviction
-                'trashout',       # Trashout
-                'renovation',     # Renovation
-                'pre_marketing',  # Pre-Marketing
-                'listed',         # Listed
-                'under_contract', # Under Contract
-                'sold',          # Sold (completion)
-            ]
-        },
-        'note_sale': {
-            'label': 'Note Sale',
-            'tone': 'secondary',
-            'task_model': NoteSaleTask,
-            'sequence': [
-                'potential_note_sale', # Potential Note Sale
-                'out_to_market',       # Out to Market
-                'pending_sale',        # Pending Sale
-                'sold',               # Sold (completion)
-            ]
-        },
-        'performing': {
-            'label': 'Performing',
-            'tone': 'success',
-            'task_model': PerformingTask,
-            'sequence': [
-                'perf',
-                'rpl',
-                'note_sold',
-            ]
-        },
-        'delinquent': {
-            'label': 'Delinquent',
-            'tone': 'warning',
-            'task_model': DelinquentTask,
-            'sequence': [
-                'dq_30',
-                'dq_60',
-                'dq_90',
-                'dq_120_plus',
-                'loss_mit',
-                'fc_dil',
-            ]
-        }
+    # WHAT: Display label/tone per outcome track (sequences live in TRACK_SPECS)
+    TRACK_DISPLAY = {
+        'fc': ('Foreclosure', 'danger'),
+        'modification': ('Modification', 'modification-green'),
+        'short_sale': ('Short Sale', 'warning'),
+        'dil': ('Deed-in-Lieu', 'primary'),
+        'reo': ('REO', 'info'),
+        'note_sale': ('Note Sale', 'secondary'),
+        'performing': ('Performing', 'success'),
+        'delinquent': ('Delinquent', 'warning'),
     }
-    
+
+    if state is None:
+        state = load_workflow_state(hub_id)
+
     track_groups = []
     
     # WHAT: Get active tracks for this hub
     # WHY: Only show milestones for tracks that are currently active
-    # HOW: Use existing get_active_outcome_tracks function
-    active_data = get_active_outcome_tracks(hub_id)
+    # HOW: Reuse get_active_outcome_tracks on the same workflow state (no extra queries)
+    active_data = get_active_outcome_tracks(hub_id, state=state)
     active_tracks = active_data['active_tracks']
     
     for track_type in active_tracks:
-        if track_type not in TRACK_SEQUENCES:
+        if track_type not in TRACK_DISPLAY:
             continue
             
-        config = TRACK_SEQUENCES[track_type]
-        task_model = config['task_model']
-        sequence = config['sequence']
+        track_label = TRACK_DISPLAY[track_type][0]
+        sequence = SPECS_BY_KEY[track_type].sequence
         
-        # WHAT: Get all tasks for this track and hub
-        # WHY: Need to find current task position in sequence
-        # HOW: Query task model, order by creation date
-        tasks = task_model.objects.filter(asset_hub_id=hub_id).order_by('created_at')
-        
-        if not tasks.exists():
-            continue
-            
-        # WHAT: Find current task (latest non-completion task)
+        # WHAT: Find current task (latest task in the sequence, by creation order)
         # WHY: Current task is the active step in the workflow
-        # HOW: Get latest task that isn't a completion task_type
-        current_task = None
-        current_index = -1
-        
-        for task in tasks:
-            task_type_lower = task.task_type.lower() if task.task_type else ''
-            if task_type_lower in sequence:
-                current_index = sequence.index(task_type_lower)
-                current_task = task
+        current_index, current_task = state.current_task(track_type)
         
         if not current_task:
             continue
@@ -572,8 +359,6 @@ def get_track_milestones(hub_id: int) -> List[Dict[str, Any]]:
             # WHAT: Calculate estimated due date for upcoming task
             # WHY: Provide timeline expectations
             # HOW: Add standard intervals based on task type
-            from datetime import datetime, timedelta
-            
             # Standard intervals between tasks (in days)
             TASK_INTERVALS = {
                 # Foreclosure intervals
@@ -619,12 +404,12 @@ def get_track_milestones(hub_id: int) -> List[Dict[str, Any]]:
         current_task_data = {
             'id': current_task.id,
             'label': _format_task_label(current_task.task_type),
-            'due_date': current_task.due_date.strftime('%Y-%m-%d') if hasattr(current_task, 'due_date') and current_task.due_date else datetime.now().strftime('%Y-%m-%d'),
+            'due_date': current_task.due_date.strftime('%Y-%m-%d') if getattr(current_task, 'due_date', None) else datetime.now().strftime('%Y-%m-%d'),
             'tone': _get_current_task_tone(current_task)
         }
         
         track_group = {
-            'track_name': config['label'],
+            'track_name': track_label,
             'current_task': current_task_data,
             'upcoming_task': upcoming_task
         }
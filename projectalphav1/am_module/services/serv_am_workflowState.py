@@ -0,0 +1,220 @@
+"""
+Service layer for bulk-loaded asset workflow state (outcome tracks + tasks).
+
+WHAT: One compact, precomputed view of which outcome tracks and tasks exist per asset hub
+WHY: The inventory enricher, task metrics/milestones endpoints, pipeline dashboard and
+     asset-class sync each scanned the eight track tables and eight task tables per hub
+     (select_related/prefetch of full model rows, or 16+ exists() queries per hub)
+HOW: For a set of hub IDs, read each track table once (hub ids only) and each task table
+     once with values() (id, hub, task_type, created_at) - 16 narrow queries total - and
+     build one AssetWorkflowState per hub. Callers derive active tracks, latest tasks,
+     completion state and stage counts from that structure without further queries.
+
+IMPORTANT:
+If you add a new track/task model in `am_module.models.model_am_tracksTasks`, add it to
+TRACK_SPECS below (and the frontend badge mappings in `frontend_vue/src/config/badgeTokens.ts`).
+
+Docs reviewed:
+- QuerySet.values(): https://docs.djangoproject.com/en/stable/ref/models/querysets/#values
+- Django Performance Optimization: https://docs.djangoproject.com/en/stable/topics/db/optimization/
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Type
+
+from django.db import models
+
+from am_module.models.model_am_tracksTasks import (
+    DIL,
+    DILTask,
+    DelinquentTask,
+    DelinquentTrack,
+    FCSale,
+    FCTask,
+    Modification,
+    ModificationTask,
+    NoteSale,
+    NoteSaleTask,
+    PerformingTask,
+    PerformingTrack,
+    REOData,
+    REOtask,
+    ShortSale,
+    ShortSaleTask,
+)
+
+
+class TrackSpec(NamedTuple):
+    """Static configuration for one outcome track and its task table."""
+
+    key: str                          # Canonical track key (e.g. 'short_sale')
+    label: str                        # Inventory label ("Short Sale")
+    track_model: Type[models.Model]   # 1:1 outcome model keyed by asset_hub
+    task_model: Type[models.Model]    # FK task model with task_type + created_at
+    sequence: Tuple[str, ...]         # Ordered task_type workflow
+    closing_types: Tuple[str, ...]    # task_types that close the track
+
+
+# WHAT: Ordered as the inventory "Active Tracks" column lists them
+TRACK_SPECS: Tuple[TrackSpec, ...] = (
+    TrackSpec('dil', 'DIL', DIL, DILTask,
+              ('pursuing_dil', 'owner_contacted', 'dil_failed', 'dil_drafted', 'dil_executed'),
+              ('dil_executed',)),
+    TrackSpec('modification', 'Modification', Modification, ModificationTask,
+              ('mod_drafted', 'mod_executed', 'mod_rpl', 'mod_failed'),
+              ('mod_failed',)),  # Only 'failed' closes track, not 're-performing'
+    TrackSpec('reo', 'REO', REOData, REOtask,
+              ('eviction', 'trashout', 'renovation', 'pre_marketing', 'listed', 'under_contract', 'sold'),
+              ('sold',)),
+    TrackSpec('fc', 'FC', FCSale, FCTask,
+              ('nod_noi', 'fc_filing', 'mediation', 'judgement', 'redemption', 'sale_scheduled', 'sold'),
+              ('sold',)),
+    TrackSpec('short_sale', 'Short Sale', ShortSale, ShortSaleTask,
+              ('list_price_accepted', 'listed', 'under_contract', 'sold'),
+              ('sold',)),
+    TrackSpec('note_sale', 'Note Sale', NoteSale, NoteSaleTask,
+              ('potential_note_sale', 'out_to_market', 'pending_sale', 'sold'),
+              ('sold',)),
+    TrackSpec('performing', 'Performing', PerformingTrack, PerformingTask,
+              ('perf', 'rpl', 'note_sold'),
+              ('note_sold',)),
+    TrackSpec('delinquent', 'Delinquent', DelinquentTrack, DelinquentTask,
+              ('dq_30', 'dq_60', 'dq_90', 'dq_120_plus', 'loss_mit', 'fc_dil'),
+              ('loss_mit', 'fc_dil')),
+)
+
+SPECS_BY_KEY: Dict[str, TrackSpec] = {spec.key: spec for spec in TRACK_SPECS}
+SPECS_BY_TASK_MODEL: Dict[Type[models.Model], TrackSpec] = {spec.task_model: spec for spec in TRACK_SPECS}
+
+
+class TaskRecord(NamedTuple):
+    """Lightweight task row (replaces full model instances for read paths)."""
+
+    id: int
+    task_type: str
+    created_at: Optional[datetime]
+    label: str                        # get_task_type_display() equivalent
+    model_name: str                   # Task model class name (e.g. 'FCTask')
+
+
+class AssetWorkflowState:
+    """Outcome tracks and tasks for one asset hub.
+
+    Attributes:
+        hub_id: AssetIdHub primary key
+        tracks: Set of track keys with an outcome record
+        tasks: Track key -> TaskRecords ordered by (created_at, id) ascending
+    """
+
+    __slots__ = ('hub_id', 'tracks', 'tasks')
+
+    def __init__(self, hub_id: int):
+        self.hub_id = hub_id
+        self.tracks: set[str] = set()
+        self.tasks: Dict[str, List[TaskRecord]] = {}
+
+    def has_track(self, key: str) -> bool:
+        return key in self.tracks
+
+    def tasks_for(self, key: str) -> List[TaskRecord]:
+        return self.tasks.get(key, [])
+
+    def latest_task(self, key: str) -> Optional[TaskRecord]:
+        """Most recently created task for a track (None when the track has no tasks)."""
+        tasks = self.tasks.get(key)
+        return tasks[-1] if tasks else None
+
+    def is_closed(self, key: str) -> bool:
+        """True when any task on the track has a closing task_type."""
+        closing = SPECS_BY_KEY[key].closing_types
+        return any(t.task_type in closing for t in self.tasks.get(key, []))
+
+    def is_active(self, key: str) -> bool:
+        """Track exists and has not been closed."""
+        return key in self.tracks and not self.is_closed(key)
+
+    def active_track_keys(self) -> List[str]:
+        return [spec.key for spec in TRACK_SPECS if self.is_active(spec.key)]
+
+    def current_task(self, key: str) -> Tuple[int, Optional[TaskRecord]]:
+        """Latest task (by creation) whose type is in the track sequence, with its index."""
+        sequence = SPECS_BY_KEY[key].sequence
+        current: Tuple[int, Optional[TaskRecord]] = (-1, None)
+        for task in self.tasks.get(key, []):
+            task_type = (task.task_type or '').lower()
+            if task_type in sequence:
+                current = (sequence.index(task_type), task)
+        return current
+
+
+def _task_type_labels(task_model: Type[models.Model]) -> Dict[str, str]:
+    return {str(value): str(label) for value, label in task_model._meta.get_field('task_type').choices or ()}
+
+
+def load_workflow_states(
+    hub_ids: Iterable[int],
+    track_keys: Optional[Iterable[str]] = None,
+) -> Dict[int, AssetWorkflowState]:
+    """
+    Bulk-load workflow state for a set of hubs.
+
+    WHAT: Build {hub_id: AssetWorkflowState} for every requested hub
+    WHY: Replaces per-hub/per-track lookups with two narrow queries per track
+    HOW: values_list() on each track table, values() on each task table, grouped in Python
+
+    Args:
+        hub_ids: AssetIdHub primary keys
+        track_keys: Optional subset of TRACK_SPECS keys to load (default: all)
+
+    Returns:
+        Dict keyed by hub_id; hubs without any tracks/tasks still get an empty state
+    """
+    hub_ids = {int(h) for h in hub_ids if h is not None}
+    states: Dict[int, AssetWorkflowState] = {h: AssetWorkflowState(h) for h in hub_ids}
+    if not hub_ids:
+        return states
+
+    wanted = set(track_keys) if track_keys is not None else None
+    for spec in TRACK_SPECS:
+        if wanted is not None and spec.key not in wanted:
+            continue
+
+        for hub_id in spec.track_model.objects.filter(asset_hub_id__in=hub_ids).values_list('asset_hub_id', flat=True):
+            states[hub_id].tracks.add(spec.key)
+
+        labels = _task_type_labels(spec.task_model)
+        model_name = spec.task_model.__name__
+        rows = (
+            spec.task_model.objects
+            .filter(asset_hub_id__in=hub_ids)
+            .order_by('created_at', 'id')
+            .values_list('id', 'asset_hub_id', 'task_type', 'created_at')
+        )
+        for task_id, hub_id, task_type, created_at in rows:
+            task_type = task_type or ''
+            states[hub_id].tasks.setdefault(spec.key, []).append(
+                TaskRecord(task_id, task_type, created_at, labels.get(task_type, task_type), model_name)
+            )
+    return states
+
+
+def load_workflow_state(hub_id: int) -> AssetWorkflowState:
+    """Convenience wrapper for single-hub callers (detail views, signals)."""
+    return load_workflow_states([hub_id])[int(hub_id)]
+
+
+def count_task_types(
+    states: Iterable[AssetWorkflowState],
+    track_key: str,
+    task_types: Optional[Iterable[str]] = None,
+) -> Dict[str, int]:
+    """Count task rows by task_type for one track across many hubs (pipeline dashboard)."""
+    allowed = set(task_types) if task_types is not None else None
+    counts: Dict[str, int] = {}
+    for state in states:
+        for task in state.tasks.get(track_key, []):
+            if not task.task_type or (allowed is not None and task.task_type not in allowed):
+                continue
+            counts[task.task_type] = counts.get(task.task_type, 0) + 1
+    return counts
@@ -1,75 +1,74 @@
+"""
+Asset class sync signals.
+
+WHAT: Keeps AssetDetails.asset_class (REO / Performing) in line with the active outcome tracks
+WHY: Track/task saves come in bursts (task boards, imports); syncing per save repeated the
+     same workflow-state load for one hub many times
+HOW: post_save/post_delete append an ASSET_CLASS outbox event for the hub; the dispatcher
+     calls sync_asset_classes once for every hub queued in the debounce window.
+"""
+
 import logging
 
-from django.db import transaction
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-logger = logging.getLogger(__name__)
+from core.models import SideEffectEvent
+from core.services.serv_co_outbox import emit_side_effect, register_side_effect_handler
 
+logger = logging.getLogger(__name__)
 
-def _sync_asset_class_from_active_tracks(asset_hub_id: int) -> None:
-    from core.models.model_co_assetIdHub import AssetDetails
-    from am_module.models.model_am_tracksTasks import (
-        PerformingTask,
-        PerformingTrack,
-        REOData,
-        REOtask,
-    )
 
-    if not asset_hub_id:
-        return
+def sync_asset_classes(asset_hub_ids) -> None:
+    """Set AssetDetails.asset_class to REO/Performing for hubs with that track active.
 
-    reo_active = REOData.objects.filter(asset_hub_id=asset_hub_id).exists() and not REOtask.objects.filter(
-        asset_hub_id=asset_hub_id,
-        task_type='sold',
-    ).exists()
+    One workflow-state load and at most two UPDATEs for the whole batch, so bulk
+    callers (imports, backfills) can sync many hubs at once.
+    """
+    from core.models.model_co_assetIdHub import AssetDetails
+    from am_module.services.serv_am_workflowState import load_workflow_states
 
-    performing_active = PerformingTrack.objects.filter(asset_hub_id=asset_hub_id).exists() and not PerformingTask.objects.filter(
-        asset_hub_id=asset_hub_id,
-        task_type='note_sold',
-    ).exists()
+    states = load_workflow_states(asset_hub_ids, track_keys=('reo', 'performing'))
+    reo_ids = [hub_id for hub_id, state in states.items() if state.is_active('reo')]
+    performing_ids = [
+        hub_id for hub_id, state in states.items()
+        if not state.is_active('reo') and state.is_active('performing')
+    ]
 
-    if reo_active:
-        AssetDetails.objects.filter(asset_id=asset_hub_id).update(asset_class=AssetDetails.AssetClass.REO)
-    elif performing_active:
-        AssetDetails.objects.filter(asset_id=asset_hub_id).update(asset_class=AssetDetails.AssetClass.PERFORMING)
+    if reo_ids:
+        AssetDetails.objects.filter(asset_id__in=reo_ids).update(asset_class=AssetDetails.AssetClass.REO)
+    if performing_ids:
+        AssetDetails.objects.filter(asset_id__in=performing_ids).update(asset_class=AssetDetails.AssetClass.PERFORMING)
 
 
-@receiver(post_save, sender='am_module.REOData')
-def sync_asset_class_on_reo_data_save(sender, instance, created: bool, **kwargs):
-    transaction.on_commit(lambda: _sync_asset_class_from_active_tracks(getattr(instance, 'asset_hub_id', None) or instance.pk))
+register_side_effect_handler(SideEffectEvent.Kind.ASSET_CLASS, sync_asset_classes)
 
 
-@receiver(post_save, sender='am_module.REOtask')
-def sync_asset_class_on_reo_task_save(sender, instance, created: bool, **kwargs):
-    transaction.on_commit(lambda: _sync_asset_class_from_active_tracks(getattr(instance, 'asset_hub_id', None)))
+def _queue_asset_class_sync(asset_hub_id) -> None:
+    if not asset_hub_id:
+        return
+    emit_side_effect(SideEffectEvent.Kind.ASSET_CLASS, asset_hub_id)
 
 
+@receiver(post_save, sender='am_module.REOData')
 @receiver(post_save, sender='am_module.PerformingTrack')
-def sync_asset_class_on_performing_track_save(sender, instance, created: bool, **kwargs):
-    transaction.on_commit(lambda: _sync_asset_class_from_active_tracks(getattr(instance, 'asset_hub_id', None) or instance.pk))
+def sync_asset_class_on_track_save(sender, instance, created: bool, **kwargs):
+    _queue_asset_class_sync(getattr(instance, 'asset_hub_id', None) or instance.pk)
 
 
+@receiver(post_save, sender='am_module.REOtask')
 @receiver(post_save, sender='am_module.PerformingTask')
-def sync_asset_class_on_performing_task_save(sender, instance, created: bool, **kwargs):
-    transaction.on_commit(lambda: _sync_asset_class_from_active_tracks(getattr(instance, 'asset_hub_id', None)))
+def sync_asset_class_on_task_save(sender, instance, created: bool, **kwargs):
+    _queue_asset_class_sync(getattr(instance, 'asset_hub_id', None))
 
 
 @receiver(post_delete, sender='am_module.REOData')
-def sync_asset_class_on_reo_data_delete(sender, instance, **kwargs):
-    transaction.on_commit(lambda: _sync_asset_class_from_active_tracks(getattr(instance, 'asset_hub_id', None) or instance.pk))
-
-
-@receiver(post_delete, sender='am_module.REOtask')
-def sync_asset_class_on_reo_task_delete(sender, instance, **kwargs):
-    transaction.on_commit(lambda: _sync_asset_class_from_active_tracks(getattr(instance, 'asset_hub_id', None)))
-
-
 @receiver(post_delete, sender='am_module.PerformingTrack')
-def sync_asset_class_on_performing_track_delete(sender, instance, **kwargs):
-    transaction.on_commit(lambda: _sync_asset_class_from_active_tracks(getattr(instance, 'asset_hub_id', None) or instance.pk))
+def sync_asset_class_on_track_delete(sender, instance, **kwargs):
+    _queue_asset_class_sync(getattr(instance, 'asset_hub_id', None) or instance.pk)
 
 
+@receiver(post_delete, sender='am_module.REOtask')
 @receiver(post_delete, sender='am_module.PerformingTask')
-def sync_asset_class_on_performing_task_delete(sender, instance, **kwargs):
-    transaction.on_commit(lambda: _sync_asset_class_from_active_tracks(getattr(instance, 'asset_hub_id', None)))
+def sync_asset_class_on_task_delete(sender, instance, **kwargs):
+    _queue_asset_class_sync(getattr(instance, 'asset_hub_id', None))
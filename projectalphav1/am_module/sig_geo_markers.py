@@ -0,0 +1,41 @@
+"""
+Django signals for cached map markers.
+
+WHAT: Drops cached map marker payloads when coordinates or lifecycle status change.
+WHY: Marker payloads are cached per filter/zoom/bbox (core/services/serv_co_geoMarkers.py);
+     a newly geocoded or liquidated asset must show up on the next map load.
+HOW: post_save/post_delete on LlDataEnrichment and AssetDetails bump the marker
+     cache namespace version after the transaction commits.
+
+Docs reviewed:
+- Django signals: https://docs.djangoproject.com/en/stable/topics/signals/
+- transaction.on_commit: https://docs.djangoproject.com/en/stable/topics/db/transactions/#performing-actions-after-commit
+"""
+
+import logging
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.models import AssetDetails, LlDataEnrichment
+from core.services.serv_co_geoMarkers import invalidate_marker_cache
+
+logger = logging.getLogger(__name__)
+
+
+def _invalidate() -> None:
+    try:
+        invalidate_marker_cache()
+    except Exception as e:
+        # WHAT: Cache outages must never break a model save
+        logger.warning(f'[GeoMarkers] Cache invalidation failed: {e}')
+
+
+@receiver(post_save, sender=LlDataEnrichment, dispatch_uid='geo_markers_enrichment_save')
+@receiver(post_delete, sender=LlDataEnrichment, dispatch_uid='geo_markers_enrichment_delete')
+@receiver(post_save, sender=AssetDetails, dispatch_uid='geo_markers_details_save')
+@receiver(post_delete, sender=AssetDetails, dispatch_uid='geo_markers_details_delete')
+def invalidate_geo_markers(sender, instance, **kwargs):
+    """Invalidate cached marker payloads once the current transaction commits."""
+    transaction.on_commit(_invalidate)
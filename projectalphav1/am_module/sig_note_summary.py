@@ -3,7 +3,10 @@ Django signals for AM module.
 
 WHAT: Handles automatic regeneration of note summaries when notes are created or updated.
 WHY: Ensures summaries stay current without manual intervention.
-HOW: Uses Django post_save and post_delete signals to trigger summary regeneration.
+HOW: post_save/post_delete append a NOTE_SUMMARY event for the note's asset hub to the
+     side-effect outbox (core/services/serv_co_outbox.py). Edits to one hub within the
+     debounce window coalesce, and the dispatcher regenerates every queued hub in one
+     batch (generate_note_summaries), so saving a note never waits on Gemini.
 
 Docs reviewed:
 - Django signals: https://docs.djangoproject.com/en/stable/topics/signals/
@@ -16,17 +19,50 @@ from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from am_module.models.model_am_amData import AMNote
-from am_module.services.serv_am_noteSummary import generate_note_summary
+from am_module.services.serv_am_noteSummary import generate_note_summaries
+from core.models import SideEffectEvent
+from core.services.serv_co_outbox import emit_side_effect, register_side_effect_handler
 
 logger = logging.getLogger(__name__)
 
 
+def regenerate_note_summaries(asset_hub_ids) -> None:
+    """
+    WHAT: Outbox handler - regenerate summaries for a batch of asset hubs.
+    WHY: One call per dispatch window instead of one Gemini call per note save.
+    HOW: Raises when any hub failed so the outbox retries the batch; hubs that succeeded
+         are skipped on retry by the notes hash check.
+    """
+    failures = generate_note_summaries(asset_hub_ids)
+    if failures:
+        hub_id, error = next(iter(failures.items()))
+        raise RuntimeError(f"{len(failures)} note summaries failed (hub {hub_id}: {error})")
+
+
+register_side_effect_handler(SideEffectEvent.Kind.NOTE_SUMMARY, regenerate_note_summaries)
+
+
+def _queue_summary(instance: AMNote, action: str) -> None:
+    # WHAT: Summary is keyed by asset hub; notes should always have one, but be defensive
+    asset_hub_id = getattr(instance, 'asset_hub_id', None)
+    if not asset_hub_id:
+        logger.warning(f"AMNote {instance.id} has no asset_hub_id, skipping summary regeneration")
+        return
+
+    try:
+        emit_side_effect(SideEffectEvent.Kind.NOTE_SUMMARY, asset_hub_id)
+    except Exception as e:
+        # WHAT: Log error but don't break the note write
+        # WHY: Summary generation failure shouldn't prevent note changes
+        logger.exception(f"Failed to queue summary regeneration for asset hub {asset_hub_id} after note {action}: {e}")
+
+
 @receiver(post_save, sender=AMNote)
 def regenerate_summary_on_note_save(sender, instance: AMNote, created: bool, **kwargs):
     """
-    WHAT: Regenerates note summary when a note is created or updated.
+    WHAT: Queues note summary regeneration when a note is created or updated.
     WHY: Keeps summaries current with latest note content.
-    HOW: Calls generate_note_summary service after note save.
+    HOW: Appends a NOTE_SUMMARY outbox event for the note's asset hub.
 
     Args:
         sender: The AMNote model class
@@ -34,65 +70,19 @@ def regenerate_summary_on_note_save(sender, instance: AMNote, created: bool, **k
         created: True if this is a new note, False if it was updated
         **kwargs: Additional signal arguments
     """
-    # WHAT: Get asset hub ID from note
-    # WHY: Summary is keyed by asset hub
-    # HOW: Access asset_hub_id from note instance
-    asset_hub_id = getattr(instance, 'asset_hub_id', None)
-
-    # WHAT: Guard against None asset hub
-    # WHY: Notes should always have asset hub, but be defensive
-    # HOW: Check if asset_hub_id exists before proceeding
-    if not asset_hub_id:
-        logger.warning(f"AMNote {instance.id} has no asset_hub_id, skipping summary regeneration")
-        return
-
-    try:
-        # WHAT: Regenerate summary for this asset hub
-        # WHY: Notes changed, summary needs update
-        # HOW: Call generate_note_summary service with force_regenerate=True
-        generate_note_summary(asset_hub_id, force_regenerate=True)
-        logger.debug(
-            f"Regenerated note summary for asset hub {asset_hub_id} after note {'creation' if created else 'update'}"
-        )
-    except Exception as e:
-        # WHAT: Log error but don't break note save
-        # WHY: Summary generation failure shouldn't prevent note creation
-        # HOW: Log exception and continue
-        logger.exception(f"Failed to regenerate summary for asset hub {asset_hub_id} after note save: {e}")
+    _queue_summary(instance, 'creation' if created else 'update')
 
 
 @receiver(post_delete, sender=AMNote)
 def regenerate_summary_on_note_delete(sender, instance: AMNote, **kwargs):
     """
-    WHAT: Regenerates note summary when a note is deleted.
+    WHAT: Queues note summary regeneration when a note is deleted.
     WHY: Summary should reflect current notes, including deletions.
-    HOW: Calls generate_note_summary service after note deletion.
+    HOW: Appends a NOTE_SUMMARY outbox event (asset_hub_id is still set after delete).
 
     Args:
         sender: The AMNote model class
         instance: The AMNote instance that was deleted
         **kwargs: Additional signal arguments
     """
-    # WHAT: Get asset hub ID from deleted note instance
-    # WHY: Need to know which asset's summary to regenerate
-    # HOW: Access asset_hub_id from instance (still available after delete)
-    asset_hub_id = getattr(instance, 'asset_hub_id', None)
-
-    # WHAT: Guard against None asset hub
-    # WHY: Defensive programming
-    # HOW: Check if asset_hub_id exists
-    if not asset_hub_id:
-        logger.warning(f"Deleted AMNote {instance.id} had no asset_hub_id, skipping summary regeneration")
-        return
-
-    try:
-        # WHAT: Regenerate summary for this asset hub
-        # WHY: Note was deleted, summary needs update
-        # HOW: Call generate_note_summary service with force_regenerate=True
-        generate_note_summary(asset_hub_id, force_regenerate=True)
-        logger.debug(f"Regenerated note summary for asset hub {asset_hub_id} after note deletion")
-    except Exception as e:
-        # WHAT: Log error but don't break note deletion
-        # WHY: Summary generation failure shouldn't prevent note deletion
-        # HOW: Log exception and continue
-        logger.exception(f"Failed to regenerate summary for asset hub {asset_hub_id} after note delete: {e}")
+    _queue_summary(instance, 'deletion')
@@ -6,4 +6,5 @@ all @receiver handlers are registered.
 
 import am_module.sig_note_summary  # noqa: F401
 import am_module.sig_asset_class  # noqa: F401
+import am_module.sig_geo_markers  # noqa: F401
 
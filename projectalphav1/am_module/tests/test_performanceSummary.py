@@ -0,0 +1,94 @@
+"""Tests for the batched Performance Summary (serv_am_performanceSummary, PerformanceSummaryViewSet.bulk)."""
+
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from acq_module.models.model_acq_seller import Seller, Trade
+from am_module.models.model_am_modeling import BlendedOutcomeModel
+from am_module.serializers.serial_am_performanceSummary import PerformanceSummarySerializer
+from am_module.services.serv_am_performanceSummary import (
+    METRICS, PerformanceScopeTooLarge, get_bulk_performance_summary,
+)
+from am_module.views.view_performance_summary import PerformanceSummaryViewSet
+from core.models import AssetDetails, AssetIdHub, LLTransactionSummary
+
+
+class BulkPerformanceSummaryTestCase(TestCase):
+    """The columnar table matches the per-asset serializer and adds trade/fund subtotals."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user('pl-reviewer')
+        self.trade = Trade.objects.create(seller=Seller.objects.create(name='Acme Bank'), trade_name='Pool 7')
+        self.hubs = [AssetIdHub.objects.create(sellertape_id=f'PS-{i}') for i in range(3)]
+        for hub in self.hubs[:2]:
+            AssetDetails.objects.update_or_create(asset=hub, defaults={'trade': self.trade})
+
+        BlendedOutcomeModel.objects.create(
+            asset_hub=self.hubs[0], purchase_price=Decimal('100000'), due_diligence=Decimal('500'),
+            servicing_current=Decimal('50'), expected_gross_proceeds=Decimal('150000'), fc_expenses=Decimal('1200'),
+        )
+        BlendedOutcomeModel.objects.create(asset_hub=self.hubs[1], purchase_price=Decimal('50000'))
+        BlendedOutcomeModel.objects.create(asset_hub=self.hubs[2], purchase_price=Decimal('10000'), other_fee=Decimal('25'))
+        LLTransactionSummary.objects.create(
+            asset_hub=self.hubs[0],
+            purchase_price_realized=Decimal('98000'), gross_purchase_price_realized=Decimal('98000'),
+            acq_due_diligence_realized=Decimal('400'), expense_servicing_realized=Decimal('60'),
+            income_interest_realized=Decimal('2500'), gross_liquidation_proceeds_realized=Decimal('140000'),
+        )
+
+    def _bulk(self, method='get', **params):
+        factory = APIRequestFactory()
+        request = getattr(factory, method)('/api/am/performance-summary/bulk/', params, **({'format': 'json'} if method == 'post' else {}))
+        force_authenticate(request, user=self.user)
+        with CaptureQueriesContext(connection) as ctx:
+            response = PerformanceSummaryViewSet.as_view({'get': 'bulk', 'post': 'bulk'})(request)
+        return response, len(ctx.captured_queries)
+
+    def test_rows_match_serializer(self):
+        response, queries = self._bulk(hub_ids=','.join(str(hub.pk) for hub in self.hubs))
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(queries, 1)
+
+        rows = {row['asset_hub_id']: row for row in response.data['assets']}
+        for outcome in BlendedOutcomeModel.objects.select_related('asset_hub__ll_transaction_summary'):
+            expected = PerformanceSummarySerializer(outcome).data
+            row = rows[outcome.asset_hub_id]
+            for metric in METRICS:
+                for column in ('underwritten', 'realized'):
+                    key = f'{metric}_{column}'
+                    value = None if expected[key] is None else round(float(expected[key]), 2)
+                    self.assertEqual(row[key], value, f'{outcome.asset_hub_id} {key}')
+
+        first = rows[self.hubs[0].pk]
+        self.assertEqual(first['trade_name'], 'Pool 7')
+        self.assertEqual(first['purchase_cost_variance'], -2000.0)
+        self.assertIsNone(rows[self.hubs[1].pk]['purchase_cost_realized'])
+
+    def test_trade_and_fund_subtotals(self):
+        response, _queries = self._bulk(method='post', trade=[self.trade.pk], hub_ids=[self.hubs[2].pk])
+        self.assertEqual(response.status_code, 200, response.data)
+
+        trades = {row['trade_id']: row for row in response.data['trades']}
+        self.assertEqual(trades[self.trade.pk]['asset_count'], 2)
+        self.assertEqual(trades[self.trade.pk]['purchase_cost_underwritten'], 150000.0)
+        self.assertEqual(trades[self.trade.pk]['purchase_cost_realized'], 98000.0)  # hub without a summary skipped
+        self.assertEqual(trades[self.trade.pk]['purchase_cost_variance'], -2000.0)  # only hubs with both values
+        self.assertEqual(trades[None]['asset_count'], 1)
+        self.assertIsNone(trades[None]['purchase_cost_realized'])
+        self.assertIsNone(trades[None]['purchase_cost_variance'])
+        self.assertEqual([row['fund_id'] for row in response.data['funds']], [None])
+        self.assertEqual(response.data['total']['purchase_cost_underwritten'], 160000.0)
+        self.assertEqual(response.data['total']['purchase_cost_variance'], -2000.0)
+
+        response, _queries = self._bulk(trade='abc')
+        self.assertEqual(response.status_code, 400)
+
+    def test_oversized_scope_is_rejected(self):
+        with self.assertRaises(PerformanceScopeTooLarge):
+            get_bulk_performance_summary(trade_ids=[self.trade.pk], limit=1)
+        self.assertEqual(get_bulk_performance_summary(trade_ids=[self.trade.pk], limit=2)['total']['asset_count'], 2)
@@ -0,0 +1,52 @@
+"""Tests for the bulk-loaded asset workflow state (serv_am_workflowState)."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from am_module.services import serv_am_tasking
+from am_module.services.serv_am_workflowState import (
+    AssetWorkflowState,
+    TaskRecord,
+    count_task_types,
+)
+
+
+def _task(task_id, task_type, day, model_name='FCTask'):
+    return TaskRecord(task_id, task_type, datetime(2025, 1, day), task_type.title(), model_name)
+
+
+def _state():
+    state = AssetWorkflowState(7)
+    state.tracks.update({'fc', 'reo'})
+    state.tasks['fc'] = [_task(1, 'nod_noi', 1), _task(2, 'fc_filing', 5), _task(3, 'mediation', 9)]
+    state.tasks['reo'] = [_task(4, 'eviction', 2, 'REOtask'), _task(5, 'sold', 8, 'REOtask')]
+    return state
+
+
+class AssetWorkflowStateTestCase(SimpleTestCase):
+    """Test case for state derivations shared by the enricher, tasking and pipeline views."""
+
+    def test_active_and_closed_tracks(self):
+        state = _state()
+        self.assertEqual(state.active_track_keys(), ['fc'])
+        self.assertTrue(state.is_closed('reo'))
+        self.assertEqual(state.latest_task('fc').task_type, 'mediation')
+        self.assertEqual(state.current_task('fc'), (2, state.tasks['fc'][-1]))
+
+    def test_task_metrics_use_preloaded_state(self):
+        with patch.object(serv_am_tasking, 'load_workflow_state') as loader:
+            metrics = serv_am_tasking.get_task_metrics(7, state=_state())
+            tracks = serv_am_tasking.get_active_outcome_tracks(7, state=_state())
+        loader.assert_not_called()
+        self.assertEqual(metrics['active_count'], 1)
+        self.assertEqual(metrics['completed_count'], 4)
+        self.assertEqual(metrics['active_items'][0]['label'], 'FC: Mediation')
+        self.assertEqual(tracks['active_tracks'], ['fc'])
+        self.assertEqual(tracks['completed_tracks'], ['reo'])
+
+    def test_count_task_types(self):
+        states = [_state(), _state()]
+        self.assertEqual(count_task_types(states, 'reo', ['sold']), {'sold': 2})
+        self.assertEqual(count_task_types(states, 'fc')['nod_noi'], 2)
@@ -7,6 +7,7 @@ from django.shortcuts import get_object_or_404
 from django.db.models import Q
 
 from am_module.services.serv_am_assetInventory import build_queryset, AssetInventoryEnricher
+from am_module.services.serv_am_workflowState import count_task_types, load_workflow_states
 from am_module.serializers.serial_am_assetInventory import (
     AssetInventoryRowSerializer,
     AssetInventoryColumnsSerializer,
@@ -19,16 +20,20 @@ from am_module.models.model_am_servicersCleaned import ServicerLoanData
 from acq_module.models.model_acq_seller import AcqAsset, Trade
 from core.models.attachments import Photo
 from core.models import AssetIdHub, AssetDetails
+from core.services.serv_co_geoMarkers import (
+    build_marker_payload,
+    cached_marker_payload,
+    filter_bbox,
+    iter_marker_rows,
+    parse_bbox,
+    parse_zoom,
+)
 from core.models.model_core_notification import Notification
 from rest_framework import serializers, status
 from django.db.models import Q
 from rest_framework.permissions import IsAuthenticatedOrReadOnly, AllowAny
 from rest_framework.authentication import SessionAuthentication
-from am_module.models.model_am_amData import (
-    AMNote,
-    FCTask, REOtask, DILTask, ShortSaleTask, ModificationTask, NoteSaleTask,
-    PerformingTask, DelinquentTask,
-)
+from am_module.models.model_am_amData import AMNote
 
 import logging
 
@@ -85,6 +90,7 @@ class AssetInventoryViewSet(ViewSet):
         # WHAT: Enrich paginated results with computed fields
         # WHY: Avoid enriching entire queryset when only showing one page
         enricher = AssetInventoryEnricher()
+        enricher.prime_workflow_states(page)
         enriched_page = [enricher.enrich(asset) for asset in page]
 
         ser = AssetInventoryRowSerializer(enriched_page, many=True)
@@ -495,15 +501,20 @@ def asset_dashboard_stats(request):
 
 @api_view(['GET'])
 def asset_geo_markers(request: Request):
-    """Return clustered geocode markers for active Asset Management inventory.
-
-    WHAT: Builds a list of map markers representing active boarded assets.
-    WHY: The Asset Dispersion card needs to plot one marker per unique lat/lng,
-    bundling multiple assets at identical coordinates so marker size can scale
-    with density.
-    HOW: Reuse the existing `build_queryset()` helper so filter semantics remain
-    identical to the AG Grid, then aggregate over persisted geocode data stored
-    on `LlDataEnrichment`.
+    """Return geocode markers for active Asset Management inventory.
+
+    WHAT: Builds map markers for boarded assets, clustered server-side by zoom.
+    WHY: The Asset Dispersion card only needs coordinates and a label; loading the
+    full inventory rows (prefetches, annotations) and one marker per asset made
+    20k+ asset maps slow and multi-megabyte.
+    HOW: Reuse `build_queryset()` filter semantics so markers stay in sync with the
+    AG Grid, strip its joins/prefetches, select only coordinate + label columns,
+    then cluster with `core.services.serv_co_geoMarkers`.
+
+    Query params (in addition to the grid filters):
+        zoom: Map zoom level; when given, nearby markers are merged into clusters
+        bbox: "west,south,east,north" viewport; only markers inside are returned
+
     Docs reviewed: https://docs.djangoproject.com/en/stable/topics/db/queries/
     """
     # WHAT: Accept optional quick filter search via `q` parameter so the map can mirror
@@ -520,48 +531,61 @@ def asset_geo_markers(request: Request):
     lifecycle_param = request.query_params.get('asset_status') or request.query_params.get('lifecycle_status')
     if lifecycle_param:
         filters['lifecycle_status'] = lifecycle_param
-    # HOW: Build the base queryset using shared service function to ensure identical joins
-    # and annotations, then apply lifecycle filtering if requested.
-    qs = build_queryset(q=q, filters=filters, ordering=None)
 
-    if lifecycle_param == AssetDetails.AssetStatus.ACTIVE:
+    zoom = parse_zoom(request.query_params.get('zoom'))
+    bbox = parse_bbox(request.query_params.get('bbox'))
+
+    def _build():
+        # HOW: Same filters as the grid, but without the grid's joins and prefetches
+        qs = build_queryset(q=q, filters=filters, ordering=None).select_related(None).prefetch_related(None)
+
+        if lifecycle_param == AssetDetails.AssetStatus.ACTIVE:
+            qs = qs.filter(
+                Q(asset_hub__details__asset_status=AssetDetails.AssetStatus.ACTIVE)
+                | Q(asset_hub__details__isnull=True)
+            )
+        elif lifecycle_param == AssetDetails.AssetStatus.LIQUIDATED:
+            qs = qs.filter(asset_hub__details__asset_status=AssetDetails.AssetStatus.LIQUIDATED)
+
         qs = qs.filter(
-            Q(asset_hub__details__asset_status=AssetDetails.AssetStatus.ACTIVE)
-            | Q(asset_hub__details__isnull=True)
+            asset_hub__enrichment__geocode_lat__isnull=False,
+            asset_hub__enrichment__geocode_lng__isnull=False,
         )
-    elif lifecycle_param == AssetDetails.AssetStatus.LIQUIDATED:
-        qs = qs.filter(asset_hub__details__asset_status=AssetDetails.AssetStatus.LIQUIDATED)
-    # WHAT: Pull related enrichment + metadata up front to avoid N+1 lookups while iterating.
-    qs = qs.select_related('asset_hub__enrichment', 'asset_hub__details', 'asset_hub', 'seller', 'trade')
-    # WHY: Emit one marker per asset record so the frontend renders individual pins rather than clustered aggregates.
-    markers = []
-    for row in qs:
-        hub = getattr(row, 'asset_hub', None)
-        enrichment = getattr(hub, 'enrichment', None) if hub is not None else None
-        details = getattr(hub, 'details', None) if hub is not None else None
-        lat = getattr(enrichment, 'geocode_lat', None)
-        lng = getattr(enrichment, 'geocode_lng', None)
-        if lat is None or lng is None:
-            continue  # WHAT: Skip assets without geocode coordinates to avoid invalid map points.
-        lat_f = float(lat)
-        lng_f = float(lng)
-        label = getattr(enrichment, 'geocode_display_address', '') or \
-            ", ".join(filter(None, [str(row.city or '').strip(), str(row.state or '').strip()]))
-        markers.append({
-            "lat": round(lat_f, 6),  # WHAT: Round latitude for consistency while preserving precision.
-            "lng": round(lng_f, 6),  # WHAT: Round longitude to align with latitude precision.
-            "asset_hub_id": row.pk,  # WHAT: Use row.pk since SellerRawData uses asset_hub as primary key (no .asset_hub_id attribute)
-            "label": label,  # WHAT: Provide human-readable location text when available.
-            "count": 1,  # WHAT: Maintain count attribute for backwards compatibility with existing UI expectations.
-            "state": (row.state or "").strip(),  # WHAT: Include state abbreviation for frontend aggregation (docs reviewed: https://docs.djangoproject.com/en/5.0/ref/models/instances/#field-access for safe field access).
-            "city": (row.city or "").strip(),
-            "street_address": (row.street_address or "").strip(),
-            "lifecycle_status": getattr(details, 'asset_status', None) if details is not None else None,
-        })
-    payload = {
-        "markers": markers,
-        "count": len(markers),
-    }
+        qs = filter_bbox(qs, bbox, 'asset_hub__enrichment__geocode_lat', 'asset_hub__enrichment__geocode_lng')
+
+        # WHAT: Only the columns the map renders (one narrow query)
+        rows = qs.values_list(
+            'asset_hub_id',
+            'asset_hub__enrichment__geocode_lat',
+            'asset_hub__enrichment__geocode_lng',
+            'asset_hub__enrichment__geocode_display_address',
+            'property__city',
+            'property__state',
+            'property__street_address',
+            'asset_hub__details__asset_status',
+        )
+        markers = []
+        for hub_id, lat, lng, (display, city, state, street, lifecycle) in iter_marker_rows(rows):
+            city = str(city or '').strip()
+            state = str(state or '').strip()
+            markers.append({
+                "lat": lat,
+                "lng": lng,
+                "asset_hub_id": hub_id,
+                "label": display or ", ".join(filter(None, [city, state])),
+                "count": 1,  # WHAT: Maintain count attribute for backwards compatibility with existing UI expectations.
+                "state": state,
+                "city": city,
+                "street_address": str(street or '').strip(),
+                "lifecycle_status": lifecycle,
+            })
+        return build_marker_payload(markers, zoom=zoom)
+
+    payload = cached_marker_payload(
+        'am_inventory',
+        {**filters, 'q': q, 'zoom': zoom, 'bbox': bbox},
+        _build,
+    )
     return Response(payload)
 
 
@@ -571,7 +595,7 @@ def am_pipeline_dashboard(request):
     
     WHAT: Count active assets by their current stage across all outcome tracks
     WHY: AM dashboard needs to show pipeline funnel (e.g., "10 in FC Referral, 3 in REO Rehab")
-    HOW: Query each task model, group by task_type, filter to ACTIVE assets only
+    HOW: Bulk-load workflow state for ACTIVE assets, count tasks by task_type per track
     
     Returns:
         {
@@ -587,8 +611,6 @@ def am_pipeline_dashboard(request):
             "totals": {"fc": 15, "reo": 8, ...}
         }
     """
-    from django.db.models import Count
-
     logger = logging.getLogger(__name__)
 
     try:
@@ -608,7 +630,6 @@ def am_pipeline_dashboard(request):
         # NOTE: 'sold' is excluded from active pipeline - shown in "Recently Liquidated" section instead
         track_configs = {
             'fc': {
-                'model': FCTask,
                 'label': 'Foreclosure',
                 'stages': [
                     ('nod_noi', 'NOD/NOI'),
@@ -620,7 +641,6 @@ def am_pipeline_dashboard(request):
                 ],
             },
             'reo': {
-                'model': REOtask,
                 'label': 'REO',
                 'stages': [
                     ('eviction', 'Eviction'),
@@ -631,7 +651,6 @@ def am_pipeline_dashboard(request):
                 ],
             },
             'dil': {
-                'model': DILTask,
                 'label': 'DIL',
                 'stages': [
                     ('pursuing_dil', 'Pursuing DIL'),
@@ -641,7 +660,6 @@ def am_pipeline_dashboard(request):
                 ],
             },
             'short_sale': {
-                'model': ShortSaleTask,
                 'label': 'Short Sale',
                 'stages': [
                     ('list_price_accepted', 'List Price Accepted'),
@@ -650,7 +668,6 @@ def am_pipeline_dashboard(request):
                 ],
             },
             'modification': {
-                'model': ModificationTask,
                 'label': 'Modification',
                 'stages': [
                     ('mod_drafted', 'Drafted'),
@@ -660,7 +677,6 @@ def am_pipeline_dashboard(request):
                 ],
             },
             'note_sale': {
-                'model': NoteSaleTask,
                 'label': 'Note Sale',
                 'stages': [
                     ('potential_note_sale', 'Potential'),
@@ -669,7 +685,6 @@ def am_pipeline_dashboard(request):
                 ],
             },
             'performing': {
-                'model': PerformingTask,
                 'label': 'Performing',
                 'stages': [
                     ('perf', 'Performing'),
@@ -677,7 +692,6 @@ def am_pipeline_dashboard(request):
                 ],
             },
             'delinquent': {
-                'model': DelinquentTask,
                 'label': 'Delinquent',
                 'stages': [
                     ('dq_30', '30 Days Delinquent'),
@@ -692,29 +706,21 @@ def am_pipeline_dashboard(request):
         summary = []
         totals = {}
 
+        # WHAT: Track/task state for every active hub in one bulk load (16 narrow queries)
+        # WHY: Shared with the inventory grid / tasking services instead of per-track GROUP BYs
+        active_states = list(load_workflow_states(active_hub_ids).values())
+
         for track_key, config in track_configs.items():
-            model = config['model']
             stage_labels = dict(config['stages'])
 
             # WHAT: Count tasks by task_type for active assets only
             # WHY: Get distribution of assets across pipeline stages
-            counts = (
-                model.objects
-                .filter(asset_hub_id__in=active_hub_ids)
-                .exclude(task_type__isnull=True)
-                .values('task_type')
-                .annotate(count=Count('id'))
-            )
+            counts = count_task_types(active_states, track_key)
 
             track_counts = {}
             track_total = 0
 
-            for row in counts:
-                task_type = row.get('task_type')
-                if not task_type:
-                    continue
-                task_type_s = str(task_type)
-                count = int(row.get('count') or 0)
+            for task_type_s, count in counts.items():
                 if count <= 0:
                     continue
 
@@ -752,31 +758,21 @@ def am_pipeline_dashboard(request):
 
         # WHAT: Count liquidated assets by outcome type (which track has 'sold' task)
         # WHY: Show breakdown like "FC Sale: 5, REO: 3, Short Sale: 2"
+        liquidated_states = list(load_workflow_states(
+            liquidated_hub_ids,
+            track_keys=('fc', 'reo', 'short_sale', 'note_sale', 'dil', 'modification'),
+        ).values())
+
+        def _sold(track_key, task_types):
+            return sum(count_task_types(liquidated_states, track_key, task_types).values())
+
         recently_liquidated = {
-            'fc_sale': FCTask.objects.filter(
-                asset_hub_id__in=liquidated_hub_ids,
-                task_type='sold'
-            ).count(),
-            'reo': REOtask.objects.filter(
-                asset_hub_id__in=liquidated_hub_ids,
-                task_type='sold'
-            ).count(),
-            'short_sale': ShortSaleTask.objects.filter(
-                asset_hub_id__in=liquidated_hub_ids,
-                task_type='sold'
-            ).count(),
-            'note_sale': NoteSaleTask.objects.filter(
-                asset_hub_id__in=liquidated_hub_ids,
-                task_type='sold'
-            ).count(),
-            'dil': DILTask.objects.filter(
-                asset_hub_id__in=liquidated_hub_ids,
-                task_type='dil_executed'
-            ).count(),
-            'modification': ModificationTask.objects.filter(
-                asset_hub_id__in=liquidated_hub_ids,
-                task_type__in=['mod_rpl', 'note_sale']
-            ).count(),
+            'fc_sale': _sold('fc', ['sold']),
+            'reo': _sold('reo', ['sold']),
+            'short_sale': _sold('short_sale', ['sold']),
+            'note_sale': _sold('note_sale', ['sold']),
+            'dil': _sold('dil', ['dil_executed']),
+            'modification': _sold('modification', ['mod_rpl', 'note_sale']),
         }
         recently_liquidated['total'] = sum(int(v or 0) for v in recently_liquidated.values())
 
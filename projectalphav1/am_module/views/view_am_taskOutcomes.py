@@ -404,6 +404,7 @@ class REOScopeViewSet(mixins.ListModelMixin,
 
 from rest_framework.views import APIView
 from am_module.services.serv_am_tasking import get_task_metrics, get_active_outcome_tracks, get_track_milestones
+from am_module.services.serv_am_workflowState import load_workflow_state
 
 
 class TaskMetricsView(APIView):
@@ -452,8 +453,10 @@ class TaskMetricsView(APIView):
         # WHAT: Call service layer to compute metrics
         # WHY: Keep business logic in services, not views
         # WHERE: serv_am_tasking.py
-        task_metrics = get_task_metrics(asset_hub_id)
-        track_metrics = get_active_outcome_tracks(asset_hub_id)
+        # HOW: Load the hub's tracks/tasks once and share it between both computations
+        workflow_state = load_workflow_state(asset_hub_id)
+        task_metrics = get_task_metrics(asset_hub_id, state=workflow_state)
+        track_metrics = get_active_outcome_tracks(asset_hub_id, state=workflow_state)
         
         # WHAT: Combine task and track metrics into single response
         # WHY: Frontend needs both task completion and track completion data
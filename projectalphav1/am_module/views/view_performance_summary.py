@@ -5,6 +5,7 @@ WHAT: API endpoint for Performance Summary grid (P&L metrics)
 WHY: Provides data for PLMetrics.vue component in loan-level tabs
 HOW: Returns BlendedOutcomeModel data via PerformanceSummarySerializer
 WHERE: Accessed from frontend at /api/am/performance-summary/<asset_hub_id>/
+       Portfolio reviews use /api/am/performance-summary/bulk/ (serv_am_performanceSummary)
 
 Docs reviewed:
 - DRF ViewSets: https://www.django-rest-framework.org/api-guide/viewsets/
@@ -12,12 +13,26 @@ Docs reviewed:
 """
 
 from rest_framework.viewsets import ViewSet
+from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import status
 from django.shortcuts import get_object_or_404
 
 from am_module.models.model_am_modeling import BlendedOutcomeModel
 from am_module.serializers.serial_am_performanceSummary import PerformanceSummarySerializer
+from am_module.services.serv_am_performanceSummary import (
+    MAX_BULK_ASSETS, PerformanceScopeTooLarge, get_bulk_performance_summary,
+)
+
+
+def _id_list(values):
+    """Integer ids from repeated and/or comma-separated values; ValueError on junk."""
+    if isinstance(values, (str, int)):
+        values = [values]
+    ids = []
+    for value in values or []:
+        ids.extend(int(part) for part in str(value).split(',') if part.strip())
+    return ids
 
 
 class PerformanceSummaryViewSet(ViewSet):
@@ -26,6 +41,7 @@ class PerformanceSummaryViewSet(ViewSet):
     
     Endpoints:
     - GET /api/am/performance-summary/<asset_hub_id>/ - Get P&L metrics for an asset
+    - GET|POST /api/am/performance-summary/bulk/ - Variance table for many assets
     """
     
     def retrieve(self, request, pk=None):
@@ -53,3 +69,34 @@ class PerformanceSummaryViewSet(ViewSet):
         
         serializer = PerformanceSummarySerializer(outcome_model)
         return Response(serializer.data, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['get', 'post'], url_path='bulk')
+    def bulk(self, request):
+        """
+        WHAT: Underwritten vs realized variance table for many assets
+        WHY: Portfolio reviews open dozens of assets; one request replaces one retrieve per asset
+        HOW: serv_am_performanceSummary - one query, vectorized columns, trade/fund subtotals
+
+        Params (query string or JSON body; ids repeated or comma-separated, OR'd together):
+            hub_ids: AssetIdHub ids
+            trade: Trade ids
+            fund: FundLegalEntity ids
+        """
+        source = request.data if request.method == 'POST' else request.query_params
+        getter = source.getlist if hasattr(source, 'getlist') else source.get
+        try:
+            hub_ids = _id_list(getter('hub_ids'))
+            trade_ids = _id_list(getter('trade'))
+            fund_ids = _id_list(getter('fund'))
+        except (TypeError, ValueError):
+            return Response({'detail': 'hub_ids, trade and fund must be integer ids.'}, status=status.HTTP_400_BAD_REQUEST)
+        if not (hub_ids or trade_ids or fund_ids):
+            return Response({'detail': 'Provide hub_ids, trade or fund.'}, status=status.HTTP_400_BAD_REQUEST)
+        if len(hub_ids) > MAX_BULK_ASSETS:
+            return Response({'detail': f'At most {MAX_BULK_ASSETS} hub_ids per request.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            data = get_bulk_performance_summary(hub_ids, trade_ids, fund_ids)
+        except PerformanceScopeTooLarge as exc:
+            return Response({'detail': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(data, status=status.HTTP_200_OK)
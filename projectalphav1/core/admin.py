@@ -31,6 +31,8 @@ from core.models import (
     SquareFootageAssumption,
     UnitBasedAssumption,
     LlDataEnrichment,
+    GeocodeAddressCache,
+    SideEffectEvent,
     Valuation,
     ValuationGradeReference,
     Photo,
@@ -46,11 +48,15 @@ from core.models import (
     LeaseComparableRentRoll,
     HistoricalPropertyCashFlow,
     CalendarEvent,
+    CalendarEventProjection,
     GeneralLedgerEntries,
     ChartOfAccounts,
+    GeneralLedgerMonthlyRollup,
     Notification,
     NotificationRead,
+    ActivityEvent,
 )
+from core.services.serv_co_generalLedger import queue_gl_rollup_refresh_for
 
 # Cross-app children that reference AssetIdHub
 from acq_module.models.model_acq_seller import AcqAsset, Trade
@@ -70,6 +76,17 @@ class NotificationReadAdmin(admin.ModelAdmin):
     list_filter = ("read_at",)
     search_fields = ("notification__title", "user__username", "user__email")
     readonly_fields = ("read_at",)
+
+
+@admin.register(ActivityEvent)
+class ActivityEventAdmin(admin.ModelAdmin):
+    """Activity feed rows (written from Notification/AuditLog; read-only here)."""
+
+    list_display = ("id", "source", "source_id", "created_at", "asset_hub", "actor", "field_name")
+    list_filter = ("source",)
+    search_fields = ("title", "message", "field_name", "actor")
+    readonly_fields = [f.name for f in ActivityEvent._meta.fields]
+    list_per_page = 50
 # Asset Details admin
 @admin.register(AssetDetails)
 class AssetDetailsAdmin(admin.ModelAdmin):
@@ -1018,6 +1035,40 @@ class LlDataEnrichmentAdmin(admin.ModelAdmin):
         )
 
 
+@admin.register(GeocodeAddressCache)
+class GeocodeAddressCacheAdmin(admin.ModelAdmin):
+    """Read-only view of cached Geocodio results (delete a row to force a re-lookup)."""
+
+    list_display = ('normalized_address', 'fields_key', 'lat', 'lng', 'hit_count', 'last_used_at')
+    search_fields = ('normalized_address', 'used_address')
+    list_filter = ('fields_key',)
+    readonly_fields = ('created_at', 'last_used_at', 'hit_count')
+    list_per_page = 50
+
+
+@admin.register(SideEffectEvent)
+class SideEffectEventAdmin(admin.ModelAdmin):
+    """Side-effect outbox: pending/failed events (handled events are deleted)."""
+
+    list_display = ('kind', 'target_id', 'status', 'attempts', 'available_at', 'enqueued_at')
+    list_filter = ('kind', 'status')
+    search_fields = ('target_id', 'last_error')
+    readonly_fields = ('created_at', 'enqueued_at')
+    list_per_page = 50
+
+
+@admin.register(CalendarEventProjection)
+class CalendarEventProjectionAdmin(admin.ModelAdmin):
+    """Calendar projection rows (rebuilt from source models; read-only here)."""
+
+    list_display = ('event_key', 'date', 'category', 'source', 'trade', 'refreshed_at')
+    list_filter = ('source', 'category')
+    search_fields = ('event_key',)
+    date_hierarchy = 'date'
+    readonly_fields = [f.name for f in CalendarEventProjection._meta.fields]
+    list_per_page = 50
+
+
 @admin.register(PropertyTypeAssumption)
 class PropertyTypeAssumptionAdmin(admin.ModelAdmin):
     """Admin for property type-based utility and property management assumptions."""
@@ -1768,12 +1819,14 @@ class GeneralLedgerEntriesAdmin(admin.ModelAdmin):
     def flag_for_review(self, request, queryset):
         """WHAT: Admin action to flag selected entries for review"""
         count = queryset.update(requires_review=True)
+        queue_gl_rollup_refresh_for(queryset)
         self.message_user(request, f'{count} entries flagged for review.')
     flag_for_review.short_description = 'Flag selected entries for review'
     
     def clear_review_flag(self, request, queryset):
         """WHAT: Admin action to clear review flag from selected entries"""
         count = queryset.update(requires_review=False, review_notes='')
+        queue_gl_rollup_refresh_for(queryset)
         self.message_user(request, f'{count} entries marked as reviewed.')
     clear_review_flag.short_description = 'Clear review flag from selected entries'
     
@@ -1783,6 +1836,30 @@ class GeneralLedgerEntriesAdmin(admin.ModelAdmin):
     export_to_csv.short_description = 'Export selected entries to CSV'
 
 
+@admin.register(GeneralLedgerMonthlyRollup)
+class GeneralLedgerMonthlyRollupAdmin(admin.ModelAdmin):
+    """
+    WHAT: Read-only view of the GL dashboard rollup
+    WHY: Spot-check rollup totals against entries; rebuilt by `manage.py rebuild_gl_rollup`
+    """
+    list_display = (
+        'month',
+        'company_name',
+        'account_number',
+        'account_name',
+        'tag',
+        'bucket',
+        'entry_count',
+        'total_debits',
+        'total_credits',
+    )
+    list_filter = ('tag', 'bucket')
+    search_fields = ('company_name', 'account_number', 'account_name')
+    date_hierarchy = 'month'
+    readonly_fields = [f.name for f in GeneralLedgerMonthlyRollup._meta.fields]
+    list_per_page = 50
+
+
 @admin.register(ChartOfAccounts)
 class ChartOfAccountsAdmin(admin.ModelAdmin):
     """
@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        """
+        WHAT: Registers core signals when app is ready.
+        WHY: Keeps the calendar event projection in sync with its source models.
+        HOW: Import signals module to connect post_save/post_delete handlers.
+        """
+        import core.signals  # noqa: F401
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import json
+import time
+
+from django.core.management.base import BaseCommand
+from django.db.models import Count
+
+from core.models import SideEffectEvent
+from core.services.serv_co_outbox import SIDE_EFFECT_BATCH_LIMIT, dispatch_side_effects
+
+
+class Command(BaseCommand):
+    help = (
+        "Dispatch queued side effects from the outbox (geocoding, SharePoint folders, "
+        "note summaries, asset-class sync) in batches per kind."
+    )
+
+    def add_arguments(self, parser):  # pragma: no cover - argument definitions
+        parser.add_argument(
+            "--kind",
+            dest="kinds",
+            action="append",
+            choices=list(SideEffectEvent.Kind.values),
+            help="Only dispatch this kind (repeatable). Default: all kinds.",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=SIDE_EFFECT_BATCH_LIMIT,
+            help="Target ids per handler call.",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling instead of exiting once the due events are drained.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=5.0,
+            help="Seconds between polls with --loop.",
+        )
+        parser.add_argument(
+            "--retry-failed",
+            action="store_true",
+            help="Re-queue events that exhausted their attempts before dispatching.",
+        )
+
+    def handle(self, *args, **options):  # pragma: no cover - orchestration
+        if options["retry_failed"]:
+            requeued = SideEffectEvent.objects.filter(status=SideEffectEvent.Status.FAILED).update(
+                status=SideEffectEvent.Status.PENDING, attempts=0,
+            )
+            self.stdout.write(self.style.NOTICE(f"Re-queued {requeued} failed events"))
+
+        try:
+            while True:
+                summary = dispatch_side_effects(options.get("kinds"), limit=options["limit"])
+                if summary:
+                    self.stdout.write(self.style.SUCCESS(f"Dispatched: {json.dumps(summary)}"))
+                if not options["loop"]:
+                    break
+                time.sleep(options["poll_interval"])
+        except KeyboardInterrupt:
+            self.stdout.write(self.style.WARNING("Interrupted; claimed events are retried after the lease expires."))
+
+        backlog = (
+            SideEffectEvent.objects
+            .values("kind", "status")
+            .annotate(count=Count("id"))
+            .order_by("kind", "status")
+        )
+        self.stdout.write(self.style.NOTICE(
+            "Outbox: " + json.dumps({f"{row['kind']}/{row['status']}": row["count"] for row in backlog})
+        ))
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.services.serv_co_glIngest import EXISTING_MODES, ingest_gl_entries, read_gl_file
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk-load General Ledger entries from CSV/Excel files. Rows are validated as a batch "
+        "(amounts, dates, chart of accounts, balanced documents) and written with bulk_create; "
+        "rejected rows are reported instead of stopping the load."
+    )
+
+    def add_arguments(self, parser):  # pragma: no cover - argument definitions
+        parser.add_argument("files", nargs="+", help="CSV or Excel files to import")
+        parser.add_argument("--sheet", default=0, help="Excel sheet name or index (default: first sheet)")
+        parser.add_argument(
+            "--existing",
+            choices=EXISTING_MODES,
+            default="skip",
+            help="What to do with entry ids already in the ledger (default: skip)",
+        )
+        parser.add_argument(
+            "--balance-by",
+            default="document_number",
+            help="Rows sharing this column must balance (default: document_number)",
+        )
+        parser.add_argument("--no-balance-check", action="store_true", help="Skip the balanced-document check")
+        parser.add_argument("--no-account-check", action="store_true", help="Skip the chart of accounts check")
+        parser.add_argument("--batch-size", type=int, default=2000, help="Rows per INSERT (default: 2000)")
+        parser.add_argument("--errors-csv", help="Write the error report of each file to <stem>_<this suffix>")
+        parser.add_argument("--dry-run", action="store_true", help="Validate only, no DB writes")
+
+    def handle(self, *args, **options):  # pragma: no cover - orchestration
+        sheet = options["sheet"]
+        if isinstance(sheet, str) and sheet.isdigit():
+            sheet = int(sheet)
+
+        for file_name in options["files"]:
+            path = Path(file_name)
+            if not path.exists():
+                raise CommandError(f"File not found: {path}")
+            result = ingest_gl_entries(
+                read_gl_file(path, sheet=sheet),
+                existing=options["existing"],
+                balance_by=None if options["no_balance_check"] else options["balance_by"],
+                check_accounts=not options["no_account_check"],
+                dry_run=options["dry_run"],
+                batch_size=options["batch_size"],
+            )
+            summary = result.as_dict(error_limit=0)
+            summary.pop("errors")
+            style = self.style.SUCCESS if not len(result.errors) else self.style.WARNING
+            self.stdout.write(style(f"{path.name}: {json.dumps(summary)}"))
+
+            if len(result.errors):
+                for error in result.errors.to_records(limit=5):
+                    # WHAT: +2 -> spreadsheet line (header is line 1)
+                    self.stdout.write(f"  line {error['row'] + 2} {error['column']}: {error['message']}")
+                if options.get("errors_csv"):
+                    report_path = path.with_name(f"{path.stem}_{options['errors_csv']}")
+                    result.errors.frame.to_csv(report_path, index=False)
+                    self.stdout.write(f"  error report: {report_path}")
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import json
+
+from django.core.management.base import BaseCommand
+
+from core.services.serv_co_activityFeed import rebuild_activity_feed, reconcile_unread_counters
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the activity feed log (ActivityEvent) from Notification and AuditLog. "
+        "Run once after deploying the feed table; --counters also recomputes every "
+        "user's unread notification count."
+    )
+
+    def add_arguments(self, parser):  # pragma: no cover - argument definitions
+        parser.add_argument(
+            "--counters",
+            action="store_true",
+            help="Recompute NotificationUnreadCounter rows as well.",
+        )
+
+    def handle(self, *args, **options):  # pragma: no cover - orchestration
+        summary = rebuild_activity_feed()
+        self.stdout.write(self.style.SUCCESS(f"Activity events written: {json.dumps(summary)}"))
+        if options.get("counters"):
+            users = reconcile_unread_counters()
+            self.stdout.write(self.style.SUCCESS(f"Unread counters recomputed for {users} users"))
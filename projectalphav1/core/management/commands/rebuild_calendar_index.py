@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import json
+
+from django.core.management.base import BaseCommand
+
+from core.services.serv_co_calendarIndex import (
+    SOURCE_ACQ_LOAN,
+    SOURCE_PROJECTED,
+    SOURCE_SERVICER,
+    SOURCE_TRADE_ASSUMPTION,
+    rebuild_calendar_index,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the calendar event projection (CalendarEventProjection) from its source "
+        "models. Run once after deploying the projection and after editing CALENDAR_DATE_FIELDS."
+    )
+
+    def add_arguments(self, parser):  # pragma: no cover - argument definitions
+        parser.add_argument(
+            "--source",
+            dest="sources",
+            action="append",
+            choices=[SOURCE_ACQ_LOAN, SOURCE_SERVICER, SOURCE_TRADE_ASSUMPTION, SOURCE_PROJECTED],
+            help="Only rebuild this source (repeatable). Default: all sources.",
+        )
+
+    def handle(self, *args, **options):  # pragma: no cover - orchestration
+        summary = rebuild_calendar_index(options.get("sources"))
+        self.stdout.write(self.style.SUCCESS(f"Calendar events written: {json.dumps(summary)}"))
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from core.models import AssetDetails
+from core.services.serv_co_cashFlowSeries import rebuild_cash_flow_series
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild LLCashFlowSeries (and LLTransactionSummary realized totals) from GeneralLedgerEntries "
+        "in bulk. Default: every asset; narrow with --hub, --fund or --trade."
+    )
+
+    def add_arguments(self, parser):  # pragma: no cover - argument definitions
+        parser.add_argument("--hub", dest="hubs", action="append", type=int, help="AssetIdHub id (repeatable)")
+        parser.add_argument("--fund", dest="funds", action="append", type=int, help="FundLegalEntity id (repeatable)")
+        parser.add_argument("--trade", dest="trades", action="append", type=int, help="Trade id (repeatable)")
+        parser.add_argument(
+            "--skip-summaries",
+            action="store_true",
+            help="Only rebuild the cash flow series; leave LLTransactionSummary untouched.",
+        )
+
+    def handle(self, *args, **options):  # pragma: no cover - orchestration
+        hub_ids = None
+        if options.get("hubs") or options.get("funds") or options.get("trades"):
+            hub_ids = set(options.get("hubs") or [])
+            if options.get("funds"):
+                hub_ids.update(
+                    AssetDetails.objects.filter(fund_legal_entity_id__in=options["funds"]).values_list("asset_id", flat=True)
+                )
+            if options.get("trades"):
+                hub_ids.update(
+                    AssetDetails.objects.filter(trade_id__in=options["trades"]).values_list("asset_id", flat=True)
+                )
+        result = rebuild_cash_flow_series(hub_ids, summaries=not options["skip_summaries"])
+        self.stdout.write(self.style.SUCCESS(f"Cash flow series rebuilt: {result.as_dict()}"))
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.services.serv_co_generalLedger import refresh_gl_rollup
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the GL dashboard rollup (GeneralLedgerMonthlyRollup) from GeneralLedgerEntries. "
+        "Run once after deploying the rollup, or after GL writes that bypass save()/bulk ingest."
+    )
+
+    def add_arguments(self, parser):  # pragma: no cover - argument definitions
+        parser.add_argument(
+            "--month",
+            dest="months",
+            action="append",
+            help="Only rebuild this posting month, YYYY-MM (repeatable). Default: every month.",
+        )
+
+    def handle(self, *args, **options):  # pragma: no cover - orchestration
+        months = None
+        if options.get("months"):
+            try:
+                months = [date.fromisoformat(f"{value}-01") for value in options["months"]]
+            except ValueError as exc:
+                raise CommandError(f"--month expects YYYY-MM: {exc}") from exc
+        written = refresh_gl_rollup(months)
+        self.stdout.write(self.style.SUCCESS(f"GL rollup rows written: {written}"))
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.5 on 2026-10-18 21:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GeocodeAddressCache',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('normalized_address', models.CharField(help_text='Lowercased, whitespace-collapsed address used as the lookup key.', max_length=255)),
+                ('fields_key', models.CharField(blank=True, default='', help_text='Sorted, comma-joined Geocodio `fields` append list the result was fetched with.', max_length=128)),
+                ('used_address', models.CharField(blank=True, default='', max_length=255)),
+                ('lat', models.DecimalField(decimal_places=6, max_digits=9)),
+                ('lng', models.DecimalField(decimal_places=6, max_digits=9)),
+                ('extras', models.JSONField(blank=True, default=dict, help_text='Parsed census/MSA/school metadata (see _parse_geocodio_result_entry).')),
+                ('hit_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_used_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Geocode Address Cache',
+                'verbose_name_plural': 'Geocode Address Cache',
+                'db_table': 'core_geocode_address_cache',
+                'constraints': [models.UniqueConstraint(fields=('normalized_address', 'fields_key'), name='uniq_geocode_cache_address_fields')],
+            },
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.5 on 2026-10-18 21:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_geocode_address_cache'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SideEffectEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('geocode', 'Geocode AcqProperty'), ('trade_folders', 'SharePoint trade folders'), ('asset_folders', 'SharePoint asset folders'), ('note_summary', 'AI note summary'), ('asset_class', 'Asset class sync')], max_length=32)),
+                ('target_id', models.PositiveBigIntegerField(help_text='AcqProperty pk (geocode), Trade pk (trade folders) or AssetIdHub pk (everything else).')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('failed', 'Failed')], default='pending', max_length=16)),
+                ('enqueued_at', models.DateTimeField(help_text='Time of the latest event for this target (a dispatcher only deletes the row if unchanged).')),
+                ('available_at', models.DateTimeField(help_text='Earliest dispatch time: end of the debounce window, lease expiry or retry backoff.')),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Side Effect Event',
+                'verbose_name_plural': 'Side Effect Outbox',
+                'db_table': 'core_side_effect_outbox',
+                'ordering': ['available_at', 'id'],
+                'indexes': [models.Index(fields=['status', 'available_at'], name='core_outbox_due_idx')],
+                'constraints': [models.UniqueConstraint(fields=('kind', 'target_id'), name='uniq_side_effect_kind_target')],
+            },
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.5 on 2026-10-18 21:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('acq_module', '0003_acqbankruptcy_acqmodification_delete_trade_deal_and_more'),
+        ('core', '0004_side_effect_outbox'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CalendarEventProjection',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event_key', models.CharField(help_text="Calendar event id, e.g. 'servicer_data:123:actual_fc_sale_date'", max_length=128, unique=True)),
+                ('source', models.CharField(help_text='Projection source (AcqLoan, ServicerData, ...)', max_length=32)),
+                ('source_id', models.PositiveBigIntegerField(help_text='Primary key of the source record')),
+                ('date', models.DateField()),
+                ('category', models.CharField(max_length=50)),
+                ('payload', models.JSONField(default=dict, help_text='Serialized event (everything except date)')),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+                ('asset_hub', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.assetidhub')),
+                ('seller', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='acq_module.seller')),
+                ('trade', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='acq_module.trade')),
+            ],
+            options={
+                'verbose_name': 'Calendar Event Projection',
+                'verbose_name_plural': 'Calendar Event Projections',
+                'db_table': 'core_calendar_event_projection',
+                'ordering': ['date', 'id'],
+                'indexes': [models.Index(fields=['date', 'category', 'trade'], name='core_calproj_date_cat_trade'), models.Index(fields=['source', 'source_id'], name='core_calproj_source'), models.Index(fields=['seller', 'date'], name='core_calproj_seller_date'), models.Index(fields=['asset_hub'], name='core_calproj_hub')],
+            },
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.5 on 2026-10-18 21:52
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('core', '0005_calendar_event_projection'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationUnreadCounter',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='notification_unread_counter', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('unread_count', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'core_notification_unread_counter',
+            },
+        ),
+        migrations.CreateModel(
+            name='ActivityEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(choices=[('notification', 'Notification'), ('audit', 'Audit Log')], max_length=16)),
+                ('source_id', models.BigIntegerField()),
+                ('created_at', models.DateTimeField(db_index=True)),
+                ('actor', models.CharField(blank=True, max_length=150, null=True)),
+                ('title', models.CharField(max_length=255)),
+                ('message', models.TextField(blank=True)),
+                ('event_type', models.CharField(blank=True, max_length=64)),
+                ('field_name', models.CharField(blank=True, max_length=64)),
+                ('old_value', models.TextField(blank=True, null=True)),
+                ('new_value', models.TextField(blank=True, null=True)),
+                ('asset_hub', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.assetidhub')),
+            ],
+            options={
+                'db_table': 'core_activity_event',
+                'ordering': ['-created_at', '-id'],
+                'indexes': [models.Index(fields=['-created_at', '-id'], name='core_activity_feed_idx'), models.Index(fields=['source', '-created_at', '-id'], name='core_activity_source_idx'), models.Index(fields=['asset_hub', '-created_at', '-id'], name='core_activity_hub_idx')],
+                'constraints': [models.UniqueConstraint(fields=('source', 'source_id'), name='uniq_activity_event_source')],
+            },
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.5 on 2026-10-18 22:10
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_activity_event'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GeneralLedgerMonthlyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('company_name', models.CharField(help_text='Entity (GeneralLedgerEntries.company_name)', max_length=255)),
+                ('account_number', models.CharField(max_length=50)),
+                ('account_name', models.CharField(max_length=255)),
+                ('tag', models.CharField(blank=True, max_length=50, null=True)),
+                ('month', models.DateField(help_text='First day of the posting month')),
+                ('entry_count', models.PositiveIntegerField(default=0)),
+                ('review_count', models.PositiveIntegerField(default=0, help_text='Entries with requires_review set')),
+                ('total_debits', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=20)),
+                ('total_credits', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=20)),
+                ('first_posting_date', models.DateField(blank=True, null=True)),
+                ('last_posting_date', models.DateField(blank=True, null=True)),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+                ('bucket', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='core.generalledgerbucket')),
+            ],
+            options={
+                'verbose_name': 'GL Monthly Rollup',
+                'verbose_name_plural': 'GL Monthly Rollups',
+                'db_table': 'general_ledger_monthly_rollup',
+                'ordering': ['-month', 'company_name', 'account_number'],
+                'indexes': [models.Index(fields=['month', 'company_name'], name='gl_rollup_month_entity'), models.Index(fields=['account_number', 'month'], name='gl_rollup_account_month'), models.Index(fields=['tag', 'month'], name='gl_rollup_tag_month')],
+            },
+        ),
+    ]
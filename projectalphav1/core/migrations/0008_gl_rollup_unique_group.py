@@ -0,0 +1,44 @@
+# Generated by Django 5.2.5 on 2026-10-18 23:40
+
+from django.db import migrations, models
+from django.db.models import Count, Max
+
+
+def drop_duplicate_rollup_rows(apps, schema_editor):
+    """Keep the newest row of each group so the unique constraint can be added."""
+    Rollup = apps.get_model('core', 'GeneralLedgerMonthlyRollup')
+    dimensions = ('company_name', 'account_number', 'account_name', 'tag', 'bucket', 'month')
+    duplicates = (
+        Rollup.objects.order_by().values(*dimensions)
+        .annotate(rows=Count('id'), keep=Max('id'))
+        .filter(rows__gt=1)
+    )
+    for group in duplicates.iterator():
+        keep = group.pop('keep')
+        group.pop('rows')
+        lookups = {}
+        for name in dimensions:
+            if group[name] is None:
+                lookups[f'{name}__isnull'] = True
+            else:
+                lookups[name] = group[name]
+        Rollup.objects.filter(**lookups).exclude(id=keep).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_gl_monthly_rollup'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_duplicate_rollup_rows, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='generalledgermonthlyrollup',
+            constraint=models.UniqueConstraint(
+                fields=('company_name', 'account_number', 'account_name', 'tag', 'bucket', 'month'),
+                name='gl_rollup_unique_group',
+                nulls_distinct=False,
+            ),
+        ),
+    ]
@@ -9,17 +9,18 @@ from .model_co_assetIdHub import AssetIdHub, AssetDetails
 from .model_co_geoAssumptions import StateReference, CountyReference, MSAReference, HUDZIPCBSACrosswalk
 from .model_co_assumptions import Servicer, FCStatus, FCTimelines, CommercialUnits, HOAAssumption, PropertyTypeAssumption, SquareFootageAssumption, UnitBasedAssumption
 from .model_co_lookupTables import PropertyType
-from .model_co_enrichment import LlDataEnrichment
+from .model_co_enrichment import LlDataEnrichment, GeocodeAddressCache
 from .model_co_valuations import Valuation, ValuationGradeReference
 from .attachments import Photo, Document
 from .model_co_realizedTransactions import LLTransactionSummary, LLCashFlowSeries
 from .commercial import UnitMix, RentRoll
 from .model_co_valuations import ComparableProperty, SalesComparable, LeaseComparable, LeaseComparableUnitMix, LeaseComparableRentRoll
 from .propertycfs import HistoricalPropertyCashFlow
-from .model_co_calendar import CalendarEvent
-from .model_co_generalLedger import GeneralLedgerEntries, ChartOfAccounts
+from .model_co_calendar import CalendarEvent, CalendarEventProjection
+from .model_co_generalLedger import GeneralLedgerEntries, ChartOfAccounts, GeneralLedgerMonthlyRollup
 
-from .model_core_notification import Notification, NotificationRead
+from .model_core_notification import ActivityEvent, Notification, NotificationRead, NotificationUnreadCounter
+from .model_co_outbox import SideEffectEvent
 
 __all__ = [
     'DebtFacility',
@@ -50,6 +51,7 @@ __all__ = [
     'UnitBasedAssumption',
     'PropertyType',
     'LlDataEnrichment', 
+    'GeocodeAddressCache',
     'Valuation',
     'ValuationGradeReference',
     'Photo',
@@ -65,8 +67,13 @@ __all__ = [
     'LeaseComparableRentRoll',
     'HistoricalPropertyCashFlow',
     'CalendarEvent',
+    'CalendarEventProjection',
     'GeneralLedgerEntries',
     'ChartOfAccounts',
+    'GeneralLedgerMonthlyRollup',
     'Notification',
     'NotificationRead',
+    'ActivityEvent',
+    'NotificationUnreadCounter',
+    'SideEffectEvent',
 ]
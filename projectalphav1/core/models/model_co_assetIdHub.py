@@ -150,15 +150,23 @@ class AssetDetails(models.Model):
         # NOTE: Removed auto-inference logic - set is_commercial manually if needed
         if not self.asset_class:
             acq_asset = getattr(self.asset, 'acq_asset', None)
-            raw_status = getattr(acq_asset, 'asset_status', None)
-            if raw_status == 'NPL':
-                self.asset_class = self.AssetClass.NPL
-            elif raw_status == 'REO':
-                self.asset_class = self.AssetClass.REO
-            elif raw_status in {'PERF', 'RPL'}:
-                self.asset_class = self.AssetClass.PERFORMING
+            self.asset_class = self.asset_class_for_status(getattr(acq_asset, 'asset_status', None))
         super().save(*args, **kwargs)
 
+    @classmethod
+    def asset_class_for_status(cls, raw_status):
+        """Map an AcqAsset.asset_status to the default asset_class (None when unmapped).
+
+        Shared by save() and bulk writers (seller tape import) that bypass save().
+        """
+        if raw_status == 'NPL':
+            return cls.AssetClass.NPL
+        if raw_status == 'REO':
+            return cls.AssetClass.REO
+        if raw_status in {'PERF', 'RPL'}:
+            return cls.AssetClass.PERFORMING
+        return None
+
     def _infer_is_commercial(self) -> bool:
         """Infer a simple boolean commercial flag.
 
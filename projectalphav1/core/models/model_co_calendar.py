@@ -224,3 +224,70 @@ class CalendarEvent(models.Model):
     def display_priority(self):
         """Return priority with fallback for display"""
         return self.get_priority_display() if self.priority else 'Normal'
+
+
+class CalendarEventProjection(models.Model):
+    """
+    Read-only calendar events projected from source model date fields.
+
+    WHAT: One row per (source record, date field) listed in CALENDAR_DATE_FIELDS, plus
+          projected liquidation dates - already formatted as the calendar payload
+    WHY: get_calendar_events used to load every AcqAsset, ServicerLoanData,
+         TradeLevelAssumption and BlendedOutcomeModel row and filter dates in Python on
+         each request; a month view now is one range query on (date, category, trade)
+    HOW: core/services/serv_co_calendarIndex.py rebuilds the rows of changed source
+         records (core/signals.py, ETL hooks); `manage.py rebuild_calendar_index` does a
+         full backfill. Custom tasks stay in CalendarEvent.
+    """
+
+    event_key = models.CharField(
+        max_length=128,
+        unique=True,
+        help_text="Calendar event id, e.g. 'servicer_data:123:actual_fc_sale_date'",
+    )
+    source = models.CharField(max_length=32, help_text="Projection source (AcqLoan, ServicerData, ...)")
+    source_id = models.PositiveBigIntegerField(help_text="Primary key of the source record")
+    date = models.DateField()
+    category = models.CharField(max_length=50)
+    seller = models.ForeignKey(
+        'acq_module.Seller',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='+',
+    )
+    trade = models.ForeignKey(
+        'acq_module.Trade',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='+',
+    )
+    asset_hub = models.ForeignKey(
+        'core.AssetIdHub',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='+',
+    )
+    payload = models.JSONField(default=dict, help_text="Serialized event (everything except date)")
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Calendar Event Projection"
+        verbose_name_plural = "Calendar Event Projections"
+        db_table = "core_calendar_event_projection"
+        ordering = ['date', 'id']
+        indexes = [
+            models.Index(fields=['date', 'category', 'trade'], name='core_calproj_date_cat_trade'),
+            models.Index(fields=['source', 'source_id'], name='core_calproj_source'),
+            models.Index(fields=['seller', 'date'], name='core_calproj_seller_date'),
+            models.Index(fields=['asset_hub'], name='core_calproj_hub'),
+        ]
+
+    def __str__(self):  # pragma: no cover - simple representation
+        return f"{self.event_key} - {self.date}"
+
+    def as_event(self) -> dict:
+        """Calendar event dict in the UnifiedCalendarEventSerializer input format."""
+        return {**self.payload, 'date': self.date}
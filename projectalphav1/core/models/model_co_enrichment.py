@@ -212,3 +212,51 @@ class LlDataEnrichment(models.Model):
 
     def __str__(self) -> str:  # pragma: no cover - simple representation
         return f"Enrichment for {self.asset_hub_id}"
+
+
+class GeocodeAddressCache(models.Model):
+    """
+    Persistent address -> Geocodio result cache.
+
+    WHAT: One row per normalized address string and requested Geocodio field set
+    WHY: The same City, State pair appears on many assets across trades; once resolved it
+         never needs another paid API call (the shared-cache tier expires after 30 days)
+    HOW: Written by the batch geocoder (core/services/serv_co_geocoding.py) after each
+         successful lookup and read in bulk before any request is sent
+    """
+
+    normalized_address = models.CharField(
+        max_length=255,
+        help_text="Lowercased, whitespace-collapsed address used as the lookup key.",
+    )
+    fields_key = models.CharField(
+        max_length=128,
+        blank=True,
+        default="",
+        help_text="Sorted, comma-joined Geocodio `fields` append list the result was fetched with.",
+    )
+    used_address = models.CharField(max_length=255, blank=True, default="")
+    lat = models.DecimalField(max_digits=9, decimal_places=6)
+    lng = models.DecimalField(max_digits=9, decimal_places=6)
+    extras = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Parsed census/MSA/school metadata (see _parse_geocodio_result_entry).",
+    )
+    hit_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_used_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Geocode Address Cache"
+        verbose_name_plural = "Geocode Address Cache"
+        db_table = 'core_geocode_address_cache'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['normalized_address', 'fields_key'],
+                name='uniq_geocode_cache_address_fields',
+            ),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover - simple representation
+        return f"{self.normalized_address} [{self.fields_key or '-'}]"
@@ -516,4 +516,59 @@ class ChartOfAccounts(models.Model):
         WHY: Human-readable display in admin and debugging
         HOW: Returns account number and name
         """
-        return f"{self.account_number} - {self.account_name}"
\ No newline at end of file
+        return f"{self.account_number} - {self.account_name}"
+
+
+class GeneralLedgerMonthlyRollup(models.Model):
+    """
+    WHAT: Monthly GL totals per (entity, account, tag, bucket, month)
+    WHY: The GL dashboard blocks (summary, by tag/bucket/account, monthly trend) each
+         re-aggregated the full filtered GeneralLedgerEntries set on every request
+    HOW: Rebuilt per touched month by core/services/serv_co_generalLedger.py
+         (signals on single-row edits, bulk GL ingest, `manage.py rebuild_gl_rollup`).
+         Dashboard requests whose filters map onto these columns read this table instead.
+    """
+    company_name = models.CharField(max_length=255, help_text='Entity (GeneralLedgerEntries.company_name)')
+    account_number = models.CharField(max_length=50)
+    account_name = models.CharField(max_length=255)
+    tag = models.CharField(max_length=50, null=True, blank=True)
+    # WHAT: CASCADE (not SET_NULL like the entries) - nulling would collide with the
+    #       month's NULL-bucket row; core.signals re-folds the affected months after commit
+    bucket = models.ForeignKey(
+        GeneralLedgerBucket,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='+',
+    )
+    month = models.DateField(help_text='First day of the posting month')
+
+    entry_count = models.PositiveIntegerField(default=0)
+    review_count = models.PositiveIntegerField(default=0, help_text='Entries with requires_review set')
+    total_debits = models.DecimalField(max_digits=20, decimal_places=2, default=Decimal('0.00'))
+    total_credits = models.DecimalField(max_digits=20, decimal_places=2, default=Decimal('0.00'))
+    first_posting_date = models.DateField(null=True, blank=True)
+    last_posting_date = models.DateField(null=True, blank=True)
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'general_ledger_monthly_rollup'
+        verbose_name = 'GL Monthly Rollup'
+        verbose_name_plural = 'GL Monthly Rollups'
+        ordering = ['-month', 'company_name', 'account_number']
+        indexes = [
+            models.Index(fields=['month', 'company_name'], name='gl_rollup_month_entity'),
+            models.Index(fields=['account_number', 'month'], name='gl_rollup_account_month'),
+            models.Index(fields=['tag', 'month'], name='gl_rollup_tag_month'),
+        ]
+        constraints = [
+            # WHAT: One row per group even when two refreshes of a month race
+            models.UniqueConstraint(
+                fields=['company_name', 'account_number', 'account_name', 'tag', 'bucket', 'month'],
+                name='gl_rollup_unique_group',
+                nulls_distinct=False,
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.month:%Y-%m} {self.company_name} {self.account_number}"
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from django.db import models
+
+
+class SideEffectEvent(models.Model):
+    """
+    Side-effect outbox.
+
+    WHAT: One pending row per (kind, target_id) that still needs slow or networked work
+          (geocoding, SharePoint folders, AI note summaries, asset-class sync)
+    WHY: post_save receivers used to do that work inline, once per saved row, so request
+         latency and tape-import time grew with every external call
+    HOW: Signals append rows (a repeat event for the same target just pushes the existing
+         row's debounce window); core/services/serv_co_outbox.py claims due rows, groups
+         them by kind and hands each handler a batch of target ids. Rows are deleted once
+         handled; rows that keep failing stay behind with status FAILED for inspection.
+    """
+
+    class Kind(models.TextChoices):
+        GEOCODE = "geocode", "Geocode AcqProperty"
+        TRADE_FOLDERS = "trade_folders", "SharePoint trade folders"
+        ASSET_FOLDERS = "asset_folders", "SharePoint asset folders"
+        NOTE_SUMMARY = "note_summary", "AI note summary"
+        ASSET_CLASS = "asset_class", "Asset class sync"
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        FAILED = "failed", "Failed"
+
+    kind = models.CharField(max_length=32, choices=Kind.choices)
+    target_id = models.PositiveBigIntegerField(
+        help_text="AcqProperty pk (geocode), Trade pk (trade folders) or AssetIdHub pk (everything else).",
+    )
+    status = models.CharField(max_length=16, choices=Status.choices, default=Status.PENDING)
+    enqueued_at = models.DateTimeField(
+        help_text="Time of the latest event for this target (a dispatcher only deletes the row if unchanged).",
+    )
+    available_at = models.DateTimeField(
+        help_text="Earliest dispatch time: end of the debounce window, lease expiry or retry backoff.",
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "Side Effect Event"
+        verbose_name_plural = "Side Effect Outbox"
+        db_table = "core_side_effect_outbox"
+        ordering = ["available_at", "id"]
+        constraints = [
+            models.UniqueConstraint(fields=["kind", "target_id"], name="uniq_side_effect_kind_target"),
+        ]
+        indexes = [
+            models.Index(fields=["status", "available_at"], name="core_outbox_due_idx"),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover - simple representation
+        return f"{self.kind}:{self.target_id} ({self.status})"
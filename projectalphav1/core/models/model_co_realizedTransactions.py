@@ -8,6 +8,58 @@ from django.db import models
 from decimal import Decimal
 
 
+# WHAT: Realized subtotals and the fields each one sums, in dependency order
+# WHY: LLTransactionSummary.save() and the bulk builder must compute identical totals
+TRANSACTION_SUMMARY_TOTALS = (
+    ('acq_total_realized', (
+        'acq_due_diligence_realized', 'acq_legal_realized', 'acq_title_realized', 'acq_other_realized',
+    )),
+    ('operating_expenses_total_realized', (
+        'expense_other_realized', 'expense_am_fees_realized',
+        'expense_property_tax_realized', 'expense_property_insurance_realized',
+    )),
+    ('legal_total_realized', (
+        'legal_foreclosure_realized', 'legal_bankruptcy_realized', 'legal_dil_realized',
+        'legal_cash_for_keys_realized', 'legal_eviction_realized',
+    )),
+    ('reo_total_realized', (
+        'reo_hoa_realized', 'reo_utilities_realized', 'reo_trashout_realized',
+        'reo_renovation_realized', 'reo_property_preservation_realized',
+    )),
+    ('cre_total_realized', (
+        'cre_marketing_realized', 'cre_ga_pool_realized', 'cre_maintenance_realized',
+    )),
+    ('fund_total_realized', (
+        'fund_taxes_realized', 'fund_legal_realized', 'fund_consulting_realized', 'fund_audit_realized',
+    )),
+    ('rehab_trashout_total_realized', ('reo_trashout_realized', 'reo_renovation_realized')),
+    ('reo_closing_cost_realized', ('broker_closing_realized', 'other_closing_realized')),
+    ('total_expenses_realized', (
+        'acq_total_realized', 'operating_expenses_total_realized', 'legal_total_realized',
+        'reo_total_realized', 'cre_total_realized', 'fund_total_realized', 'reo_closing_cost_realized',
+    )),
+    ('realized_gross_cost', ('gross_purchase_price_realized', 'total_expenses_realized')),
+)
+
+# WHAT: LLCashFlowSeries line items summed into total_income / total_expenses
+CASH_FLOW_INCOME_FIELDS = (
+    'income_principal', 'income_interest', 'income_rent', 'income_cam',
+    'income_mod_down_payment', 'proceeds', 'net_liquidation_proceeds',
+)
+CASH_FLOW_EXPENSE_FIELDS = (
+    'purchase_price',
+    'acq_due_diligence_expenses', 'acq_legal_expenses', 'acq_title_expenses', 'acq_other_expenses',
+    'servicing_expenses', 'am_fees_expenses', 'property_tax_expenses', 'property_insurance_expenses',
+    'legal_foreclosure_expenses', 'legal_bankruptcy_expenses', 'legal_dil_expenses',
+    'legal_cash_for_keys_expenses', 'legal_eviction_expenses',
+    'reo_hoa_expenses', 'reo_utilities_expenses', 'reo_trashout_expenses',
+    'reo_renovation_expenses', 'reo_property_preservation_expenses',
+    'cre_marketing_expenses', 'cre_ga_pool_expenses', 'cre_maintenance_expenses',
+    'fund_taxes_expenses', 'fund_legal_expenses', 'fund_consulting_expenses', 'fund_audit_expenses',
+    'broker_closing_expenses', 'other_closing_expenses',
+)
+
+
 class LLTransactionSummary(models.Model):
     """
     WHAT: Transaction summary rollup for loan-level realized P&L
@@ -281,73 +333,9 @@ class LLTransactionSummary(models.Model):
     def save(self, *args, **kwargs):
         z = lambda v: v if v is not None else Decimal('0.00')
 
-        self.acq_total_realized = (
-            z(self.acq_due_diligence_realized)
-            + z(self.acq_legal_realized)
-            + z(self.acq_title_realized)
-            + z(self.acq_other_realized)
-        )
-
-        self.operating_expenses_total_realized = (
-            z(self.expense_other_realized)
-            + z(self.expense_am_fees_realized)
-            + z(self.expense_property_tax_realized)
-            + z(self.expense_property_insurance_realized)
-        )
-
-        self.legal_total_realized = (
-            z(self.legal_foreclosure_realized)
-            + z(self.legal_bankruptcy_realized)
-            + z(self.legal_dil_realized)
-            + z(self.legal_cash_for_keys_realized)
-            + z(self.legal_eviction_realized)
-        )
-
-        self.reo_total_realized = (
-            z(self.reo_hoa_realized)
-            + z(self.reo_utilities_realized)
-            + z(self.reo_trashout_realized)
-            + z(self.reo_renovation_realized)
-            + z(self.reo_property_preservation_realized)
-        )
-
-        self.cre_total_realized = (
-            z(self.cre_marketing_realized)
-            + z(self.cre_ga_pool_realized)
-            + z(self.cre_maintenance_realized)
-        )
-
-        self.fund_total_realized = (
-            z(self.fund_taxes_realized)
-            + z(self.fund_legal_realized)
-            + z(self.fund_consulting_realized)
-            + z(self.fund_audit_realized)
-        )
-
-        self.rehab_trashout_total_realized = (
-            z(self.reo_trashout_realized)
-            + z(self.reo_renovation_realized)
-        )
-
-        self.reo_closing_cost_realized = (
-            z(self.broker_closing_realized)
-            + z(self.other_closing_realized)
-        )
-
-        self.total_expenses_realized = (
-            z(self.acq_total_realized)
-            + z(self.operating_expenses_total_realized)
-            + z(self.legal_total_realized)
-            + z(self.reo_total_realized)
-            + z(self.cre_total_realized)
-            + z(self.fund_total_realized)
-            + z(self.reo_closing_cost_realized)
-        )
-
-        self.realized_gross_cost = (
-            z(self.gross_purchase_price_realized)
-            + z(self.total_expenses_realized)
-        )
+        # WHAT: Subtotals in dependency order (see TRANSACTION_SUMMARY_TOTALS)
+        for total, parts in TRANSACTION_SUMMARY_TOTALS:
+            setattr(self, total, sum((z(getattr(self, part)) for part in parts), Decimal('0.00')))
 
         super().save(*args, **kwargs)
 
@@ -608,26 +596,9 @@ class LLCashFlowSeries(models.Model):
             if self.period_number is not None:
                 self.period_date = purchase_date + relativedelta(months=self.period_number)
         
-        # Calculate total income
-        self.total_income = (
-            self.income_principal + self.income_interest + self.income_rent +
-            self.income_cam + self.income_mod_down_payment + self.proceeds +
-            self.net_liquidation_proceeds
-        )
-        
-        # Calculate total expenses (all negative cash flows)
-        self.total_expenses = (
-            self.purchase_price + self.acq_due_diligence_expenses + self.acq_legal_expenses +
-            self.acq_title_expenses + self.acq_other_expenses + self.servicing_expenses +
-            self.am_fees_expenses + self.property_tax_expenses +
-            self.property_insurance_expenses + self.legal_foreclosure_expenses +
-            self.legal_bankruptcy_expenses + self.legal_dil_expenses + self.legal_cash_for_keys_expenses +
-            self.legal_eviction_expenses + self.reo_hoa_expenses + self.reo_utilities_expenses +
-            self.reo_trashout_expenses + self.reo_renovation_expenses + self.reo_property_preservation_expenses +
-            self.cre_marketing_expenses + self.cre_ga_pool_expenses + self.cre_maintenance_expenses +
-            self.fund_taxes_expenses + self.fund_legal_expenses + self.fund_consulting_expenses +
-            self.fund_audit_expenses + self.broker_closing_expenses + self.other_closing_expenses
-        )
+        # Calculate totals (shared with the bulk builder in serv_co_cashFlowSeries)
+        self.total_income = sum((getattr(self, field) for field in CASH_FLOW_INCOME_FIELDS), Decimal('0.00'))
+        self.total_expenses = sum((getattr(self, field) for field in CASH_FLOW_EXPENSE_FIELDS), Decimal('0.00'))
         
         # Calculate net cash flow
         self.net_cash_flow = self.total_income - self.total_expenses
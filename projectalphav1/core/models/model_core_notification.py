@@ -65,3 +65,78 @@ class NotificationRead(models.Model):
 
     def __str__(self) -> str:
         return f"{self.user_id} read {self.notification_id}"
+
+
+class ActivityEvent(models.Model):
+    """Denormalized activity feed row (one per Notification / AuditLog entry).
+
+    WHAT: The /core/activity/ feed reads this single table with a keyset cursor on
+          (created_at, id) instead of merging two over-fetched querysets in Python
+    WHY: The merged feed could not page past 200 items and re-humanized every audit
+         row on each request
+    HOW: Written by core.signals when a Notification or AuditLog row is created;
+         `manage.py rebuild_activity_feed` backfills. Titles are resolved at read
+         time from the hub-label cache so address changes show up on old events.
+    """
+
+    class Source(models.TextChoices):
+        NOTIFICATION = "notification", "Notification"
+        AUDIT = "audit", "Audit Log"
+
+    source = models.CharField(max_length=16, choices=Source.choices)
+    source_id = models.BigIntegerField()
+    created_at = models.DateTimeField(db_index=True)
+    asset_hub = models.ForeignKey(
+        "core.AssetIdHub",
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    actor = models.CharField(max_length=150, blank=True, null=True)
+    # Fallback title when the hub has no label (notification title / "Activity")
+    title = models.CharField(max_length=255)
+    message = models.TextField(blank=True)
+    event_type = models.CharField(max_length=64, blank=True)
+    field_name = models.CharField(max_length=64, blank=True)
+    old_value = models.TextField(null=True, blank=True)
+    new_value = models.TextField(null=True, blank=True)
+
+    class Meta:
+        db_table = "core_activity_event"
+        ordering = ["-created_at", "-id"]
+        constraints = [
+            models.UniqueConstraint(fields=["source", "source_id"], name="uniq_activity_event_source"),
+        ]
+        indexes = [
+            models.Index(fields=["-created_at", "-id"], name="core_activity_feed_idx"),
+            models.Index(fields=["source", "-created_at", "-id"], name="core_activity_source_idx"),
+            models.Index(fields=["asset_hub", "-created_at", "-id"], name="core_activity_hub_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.source}:{self.source_id}"
+
+
+class NotificationUnreadCounter(models.Model):
+    """Per-user unread notification count, maintained incrementally.
+
+    Created lazily on a user's first count lookup (one COUNT); afterwards new
+    notifications, reads and deletions adjust it with single UPDATE statements
+    (see core/services/serv_co_activityFeed.py).
+    """
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="notification_unread_counter",
+    )
+    unread_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "core_notification_unread_counter"
+
+    def __str__(self) -> str:
+        return f"{self.user_id}: {self.unread_count} unread"
@@ -9,6 +9,19 @@ How: Many-to-One with AssetIdHub; includes income, expense, and calculated metri
 from django.db import models
 from decimal import Decimal
 
+# WHAT: Expense columns summed by total_utilities() / total_operating_expenses()
+# WHY: Shared with core.services.serv_co_commercialAnalytics so bulk metrics add the same fields
+UTILITY_EXPENSE_FIELDS = (
+    'utilities_water', 'utilities_sewer', 'utilities_electric', 'utilities_gas', 'trash', 'utilities_other',
+)
+OPERATING_EXPENSE_FIELDS = (
+    'admin', 'insurance', 'utilities_water', 'utilities_sewer',
+    'utilities_electric', 'utilities_gas', 'trash', 'utilities_other',
+    'property_management', 'repairs_maintenance', 'marketing',
+    'property_taxes', 'hoa_fees', 'security_property_preservation', 'landscaping',
+    'pool_maintenance', 'other_expense',
+)
+
 
 class HistoricalPropertyCashFlow(models.Model):
     """
@@ -279,16 +292,8 @@ class HistoricalPropertyCashFlow(models.Model):
         Returns:
             Decimal: Total opex rounded to 2 decimals.
         """
-        expense_fields = [
-            self.admin, self.insurance, self.utilities_water, self.utilities_sewer,
-            self.utilities_electric, self.utilities_gas, self.trash, self.utilities_other,
-            self.property_management, self.repairs_maintenance, self.marketing,
-            self.property_taxes, self.hoa_fees, self.security_property_preservation, self.landscaping,
-            self.pool_maintenance, self.other_expense
-        ]
-        
         total = Decimal('0.00')
-        for expense in expense_fields:
+        for expense in (getattr(self, name) for name in OPERATING_EXPENSE_FIELDS):
             if expense:
                 exp = expense if isinstance(expense, Decimal) else Decimal(str(expense))
                 total += exp
@@ -304,17 +309,8 @@ class HistoricalPropertyCashFlow(models.Model):
         Returns:
             Decimal: Total utilities rounded to 2 decimals.
         """
-        util_fields = [
-            self.utilities_water,
-            self.utilities_sewer,
-            self.utilities_electric,
-            self.utilities_gas,
-            self.trash,
-            self.utilities_other,
-        ]
-
         total = Decimal('0.00')
-        for v in util_fields:
+        for v in (getattr(self, name) for name in UTILITY_EXPENSE_FIELDS):
             if v:
                 total += v if isinstance(v, Decimal) else Decimal(str(v))
 
@@ -360,27 +356,30 @@ class HistoricalPropertyCashFlow(models.Model):
         
         What: (NOI / Market Value) * 100
         Why: Standard unlevered return metric
-        How: Uses latest `Valuation` record for this `asset_hub` (by `value_date` desc or created order)
+        How: Uses latest `Valuation` record for this `asset_hub` (by `value_date` desc or created order);
+             querysets annotated with `latest_asis_value` (see
+             serv_co_commercialAnalytics.latest_asis_value_subquery) skip the per-row lookup
         Returns:
             Decimal: Cap rate percent (e.g., 6.25 for 6.25%). 0.00 if value unavailable/non-positive.
         """
-        try:
-            from .valuations import Valuation  # local import to avoid circulars
-        except Exception:
-            return Decimal('0.00')
-
         noi = self.net_operating_income()
-        # Get most recent valuation by value_date desc, fallback to latest created
-        valuation = (
-            Valuation.objects
-            .filter(asset_hub=self.asset_hub)
-            .order_by('-value_date', '-id')
-            .first()
-        )
-        if not valuation or not valuation.asis_value:
+        if hasattr(self, 'latest_asis_value'):
+            asis_value = self.latest_asis_value
+        else:
+            from .model_co_valuations import Valuation  # local import to avoid circulars
+
+            # Get most recent valuation by value_date desc, fallback to latest created
+            asis_value = (
+                Valuation.objects
+                .filter(asset_hub_id=self.asset_hub_id)
+                .order_by('-value_date', '-id')
+                .values_list('asis_value', flat=True)
+                .first()
+            )
+        if not asis_value:
             return Decimal('0.00')
 
-        value = valuation.asis_value if isinstance(valuation.asis_value, Decimal) else Decimal(str(valuation.asis_value))
+        value = asis_value if isinstance(asis_value, Decimal) else Decimal(str(asis_value))
         if value <= 0:
             return Decimal('0.00')
 
@@ -34,16 +34,16 @@ from core.views.view_co_notifications import _resolve_request_user
 # ============================================================================
 # What: Simple list of date fields to show on calendar
 # Why: One place to add/remove fields - no complex classes or methods
-# Where: Used by view_co_calendar.py
+# Where: Used by core/services/serv_co_calendarIndex.py (CalendarEventProjection builder)
 # How: Just add lines like: ('SellerRawData', 'maturity_date', 'Maturity', 'deadline')
 #
 # TO ADD A DATE FIELD TO CALENDAR:
 # 1. Add one line below in format: (Model, field_name, title, event_type)
-# 2. Done!
+# 2. Run: python manage.py rebuild_calendar_index
 #
 # TO REMOVE A DATE FIELD:
 # 1. Delete or comment out the line
-# 2. Done!
+# 2. Run: python manage.py rebuild_calendar_index
 #
 # Format: (ModelName, field_name, display_title, event_type)
 #
@@ -48,3 +48,4 @@ class ActivityItemSerializer(serializers.Serializer):
 
     asset_hub_id = serializers.IntegerField(required=False, allow_null=True)
     actor = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+    is_read = serializers.BooleanField(required=False)
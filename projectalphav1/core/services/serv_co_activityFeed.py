@@ -0,0 +1,474 @@
+"""
+Activity feed: denormalized event log, keyset pages, hub labels and unread counters.
+
+WHAT: Serves /core/activity/ from ActivityEvent (one row per Notification / AuditLog
+      entry) and keeps per-user unread notification counts
+WHY: ActivityFeedView fetched limit*2 notifications and limit*2 audit rows, built hub
+     labels and humanized audit fields on every call, merged in Python, and could not
+     page past 200 items; unread state was an Exists(NotificationRead) subquery per row
+HOW: - record_activity(): signals (core.signals) insert the ActivityEvent row in the
+       same transaction as the source row; audit messages are humanized once, here
+     - feed_page(): one indexed range query ordered by (created_at, id) DESC with an
+       opaque keyset cursor; read flags for the page's notifications in one query
+     - Hub labels ("<servicer id> - <address>") come from a SharedCache filled in
+       bulk for misses and dropped per hub when AssetIdHub / AcqAsset /
+       ServicerLoanData rows change
+     - NotificationUnreadCounter: created lazily (two COUNTs), then +1 per new
+       notification for every user, -1 per read, -1 for users who had not read a
+       deleted notification. `manage.py rebuild_activity_feed --counters` recomputes.
+
+Docs reviewed:
+- Keyset pagination ("seek method"): https://use-the-index-luke.com/no-offset
+- Row-value comparisons / composite indexes: https://www.postgresql.org/docs/current/indexes-multicolumn.html
+- F() expressions for race-free counters: https://docs.djangoproject.com/en/5.2/ref/models/expressions/#f-expressions
+"""
+
+from __future__ import annotations
+
+import base64
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils.dateparse import parse_datetime
+
+from core.models import ActivityEvent, AssetIdHub, Notification, NotificationRead, NotificationUnreadCounter
+from core.services.serv_co_cache import SharedCache
+
+logger = logging.getLogger(__name__)
+
+# Hub id -> (servicer loan id, address); one entry per hub, reused across pages and users
+_hub_label_cache = SharedCache("activity_hub_labels", ttl=6 * 60 * 60, local_maxsize=4096)
+
+# Audit fields that only record bookkeeping timestamps
+SKIPPED_AUDIT_FIELDS = {"updated_at", "created_at"}
+
+FEED_DEFAULT_LIMIT = 50
+FEED_MAX_LIMIT = 200
+_BATCH_SIZE = 1000
+
+
+# ---------------------------------------------------------------------------
+# Display helpers (formerly in core/views/view_co_notifications.py)
+# ---------------------------------------------------------------------------
+def format_full_address(street: Any, city: Any, state: Any, postal: Any) -> str:
+    street_s = (str(street).strip() if street is not None else "").strip()
+    city_s = (str(city).strip() if city is not None else "").strip()
+    state_s = (str(state).strip() if state is not None else "").strip()
+    postal_s = (str(postal).strip() if postal is not None else "").strip()
+
+    parts: list[str] = []
+    if street_s:
+        parts.append(street_s)
+    city_state = ", ".join([p for p in [city_s, state_s] if p])
+    if city_state:
+        parts.append(city_state)
+    if postal_s:
+        if parts:
+            parts[-1] = f"{parts[-1]} {postal_s}".strip()
+        else:
+            parts.append(postal_s)
+    return ", ".join([p for p in parts if p]).strip()
+
+
+def _format_currency(value: Any) -> str:
+    """Format numeric value as currency with $ and commas."""
+    if value is None:
+        return "—"
+    try:
+        num = float(str(value).replace(",", "").replace("$", "").strip())
+        if num == int(num):
+            return f"${int(num):,}"
+        return f"${num:,.2f}"
+    except (ValueError, TypeError):
+        return str(value)
+
+
+def _format_date_value(value: Any) -> str:
+    """Format date string (YYYY-MM-DD or ISO) to friendly format like Jan 16, 2026."""
+    if value is None:
+        return "—"
+    s = str(value).strip()
+    if not s or s.lower() in ("none", "null", ""):
+        return "—"
+    try:
+        # Try ISO format first
+        if "T" in s:
+            dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
+        else:
+            dt = datetime.strptime(s[:10], "%Y-%m-%d")
+        return dt.strftime("%b %d, %Y")
+    except Exception:
+        return s
+
+
+def _is_currency_field(field_name: str) -> bool:
+    """Check if field name suggests it's a currency/money field."""
+    f = (field_name or "").lower()
+    currency_keywords = [
+        "price", "cost", "amount", "balance", "value", "fee", "payment",
+        "debt", "arrears", "escrow", "charges", "total", "upb", "bid",
+    ]
+    return any(kw in f for kw in currency_keywords)
+
+
+def _is_date_field(field_name: str) -> bool:
+    """Check if field name suggests it's a date field."""
+    f = (field_name or "").lower()
+    date_keywords = ["date", "completion", "expire", "maturity", "due"]
+    return any(kw in f for kw in date_keywords)
+
+
+def coalesce_display(value: Any, field_name: str = "") -> str:
+    """Format value based on field type - currency, date, or plain text."""
+    if value is None:
+        return "—"
+    s = str(value).strip()
+    if s == "" or s.lower() == "none" or s.lower() == "null":
+        return "—"
+
+    # Format based on field type
+    if _is_currency_field(field_name):
+        return _format_currency(value)
+    if _is_date_field(field_name):
+        return _format_date_value(value)
+
+    return s
+
+
+def humanize_field_name(field_name: str) -> str:
+    f = (field_name or "").strip()
+    if not f:
+        return "Field"
+    f_lower = f.lower()
+    if "status" in f_lower:
+        return "Status"
+    if f_lower == "task_type":
+        return "Task Type"
+    return f.replace("_", " ").strip().title()
+
+
+def audit_message(field_name: str, old_value: Any, new_value: Any) -> str:
+    """"Field: old → new" with currency/date formatting ('' when both display the same)."""
+    old_disp = coalesce_display(old_value, field_name)
+    new_disp = coalesce_display(new_value, field_name)
+    return f"{humanize_field_name(field_name)}: {old_disp} → {new_disp}" if old_disp != new_disp else ""
+
+
+# ---------------------------------------------------------------------------
+# Hub labels
+# ---------------------------------------------------------------------------
+def build_hub_label_map(hub_ids: Iterable[int]) -> Dict[int, Tuple[str, str]]:
+    """(servicer loan id, address) per hub from AcqAsset, else the latest servicer row."""
+    hub_label_map: Dict[int, Tuple[str, str]] = {}
+    hub_ids = set(hub_ids)
+    if not hub_ids:
+        return hub_label_map
+
+    hubs = (
+        AssetIdHub.objects.filter(id__in=hub_ids)
+        .select_related("acq_asset")
+        .prefetch_related("servicer_loan_data")
+    )
+    for hub in hubs:
+        servicer_loan_id = (str(getattr(hub, "servicer_id", "") or "").strip())
+
+        addr = ""
+        srd = getattr(hub, "acq_asset", None)
+        if srd is not None:
+            addr = format_full_address(
+                getattr(srd, "street_address", None),
+                getattr(srd, "city", None),
+                getattr(srd, "state", None),
+                getattr(srd, "zip", None),
+            )
+
+        if not addr:
+            servicer_rows = list(getattr(hub, "servicer_loan_data", []).all())
+            if servicer_rows:
+                servicer_rows.sort(
+                    key=lambda s: (
+                        getattr(s, "reporting_year", 0) or 0,
+                        getattr(s, "reporting_month", 0) or 0,
+                        getattr(s, "as_of_date", "") or "",
+                    ),
+                    reverse=True,
+                )
+                latest = servicer_rows[0]
+                addr = format_full_address(
+                    getattr(latest, "address", None),
+                    getattr(latest, "city", None),
+                    getattr(latest, "state", None),
+                    getattr(latest, "zip_code", None),
+                )
+
+        hub_label_map[int(hub.id)] = (servicer_loan_id, addr)
+
+    return hub_label_map
+
+
+def get_hub_labels(hub_ids: Iterable[int]) -> Dict[int, Tuple[str, str]]:
+    """Cached hub labels; misses are built together (one hub + one servicer query)."""
+    labels: Dict[int, Tuple[str, str]] = {}
+    missing = set()
+    for hub_id in {int(h) for h in hub_ids if h is not None}:
+        cached = _hub_label_cache.get(hub_id)
+        if cached is None:
+            missing.add(hub_id)
+        else:
+            labels[hub_id] = tuple(cached)
+    if missing:
+        built = build_hub_label_map(missing)
+        for hub_id in missing:
+            label = built.get(hub_id, ("", ""))
+            _hub_label_cache.set(hub_id, label)
+            labels[hub_id] = label
+    return labels
+
+
+def invalidate_hub_labels(hub_ids: Iterable[Any]) -> None:
+    """Drop cached labels after hub/asset/servicer address changes."""
+    for hub_id in {int(h) for h in hub_ids if h is not None}:
+        _hub_label_cache.delete(hub_id)
+
+
+def _title(labels: Dict[int, Tuple[str, str]], hub_id: Optional[int], fallback: str) -> str:
+    servicer_loan_id, addr = labels.get(hub_id, ("", "")) if hub_id is not None else ("", "")
+    if servicer_loan_id and addr:
+        return f"{servicer_loan_id} - {addr}"
+    return servicer_loan_id or addr or fallback
+
+
+# ---------------------------------------------------------------------------
+# Event log writes
+# ---------------------------------------------------------------------------
+def event_for_notification(notification: Notification) -> ActivityEvent:
+    creator = notification.created_by if notification.created_by_id else None
+    return ActivityEvent(
+        source=ActivityEvent.Source.NOTIFICATION,
+        source_id=notification.pk,
+        created_at=notification.created_at,
+        asset_hub_id=notification.asset_hub_id,
+        actor=getattr(creator, "username", None),
+        title=notification.title or "",
+        message=notification.message or "",
+        event_type=notification.event_type or "",
+    )
+
+
+def event_for_audit(audit: Any) -> Optional[ActivityEvent]:
+    """ActivityEvent for an AuditLog row, or None for bookkeeping-only fields."""
+    field_raw = (audit.field_name or "").strip()
+    if field_raw.lower() in SKIPPED_AUDIT_FIELDS:
+        return None
+    changer = audit.changed_by if audit.changed_by_id else None
+    return ActivityEvent(
+        source=ActivityEvent.Source.AUDIT,
+        source_id=audit.pk,
+        created_at=audit.changed_at,
+        asset_hub_id=audit.asset_hub_id,
+        actor=getattr(changer, "username", None),
+        title="Activity",
+        message=audit_message(field_raw, audit.old_value, audit.new_value),
+        field_name=field_raw,
+        old_value=audit.old_value,
+        new_value=audit.new_value,
+    )
+
+
+def record_activity(events: Iterable[Optional[ActivityEvent]]) -> int:
+    """Upsert ActivityEvent rows on (source, source_id); returns the number written."""
+    rows = [event for event in events if event is not None]
+    if not rows:
+        return 0
+    ActivityEvent.objects.bulk_create(
+        rows,
+        batch_size=_BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=["source", "source_id"],
+        update_fields=[
+            "created_at", "asset_hub", "actor", "title", "message",
+            "event_type", "field_name", "old_value", "new_value",
+        ],
+    )
+    return len(rows)
+
+
+def remove_activity(source: str, source_ids: Iterable[int]) -> None:
+    ActivityEvent.objects.filter(source=source, source_id__in=list(source_ids)).delete()
+
+
+def rebuild_activity_feed() -> Dict[str, int]:
+    """Backfill/refresh ActivityEvent from Notification and AuditLog; returns rows per source."""
+    from am_module.models import AuditLog
+
+    written = {ActivityEvent.Source.NOTIFICATION.value: 0, ActivityEvent.Source.AUDIT.value: 0}
+    batch: List[Optional[ActivityEvent]] = []
+
+    def _flush(source: str) -> None:
+        written[source] += record_activity(batch)
+        batch.clear()
+
+    for notification in Notification.objects.select_related("created_by").order_by("id").iterator(chunk_size=_BATCH_SIZE):
+        batch.append(event_for_notification(notification))
+        if len(batch) >= _BATCH_SIZE:
+            _flush(ActivityEvent.Source.NOTIFICATION.value)
+    _flush(ActivityEvent.Source.NOTIFICATION.value)
+
+    for audit in AuditLog.objects.select_related("changed_by").order_by("id").iterator(chunk_size=_BATCH_SIZE):
+        batch.append(event_for_audit(audit))
+        if len(batch) >= _BATCH_SIZE:
+            _flush(ActivityEvent.Source.AUDIT.value)
+    _flush(ActivityEvent.Source.AUDIT.value)
+    return written
+
+
+# ---------------------------------------------------------------------------
+# Keyset pages
+# ---------------------------------------------------------------------------
+def encode_cursor(created_at: datetime, pk: int) -> str:
+    raw = f"{created_at.isoformat()}|{pk}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Inverse of encode_cursor; raises ValueError for malformed cursors."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        stamp, pk = raw.rsplit("|", 1)
+        created_at = parse_datetime(stamp)
+        if created_at is None:
+            raise ValueError(stamp)
+        return created_at, int(pk)
+    except Exception as exc:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from exc
+
+
+def feed_page(
+    user: Optional[Any],
+    *,
+    limit: int = FEED_DEFAULT_LIMIT,
+    cursor: Optional[str] = None,
+    asset_hub_id: Optional[int] = None,
+    sources: Optional[Iterable[str]] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """One page of feed items (newest first) and the cursor for the next page (or None)."""
+    qs = ActivityEvent.objects.all()
+    if sources is not None:
+        qs = qs.filter(source__in=list(sources))
+    if asset_hub_id is not None:
+        qs = qs.filter(asset_hub_id=asset_hub_id)
+    if cursor:
+        created_at, pk = decode_cursor(cursor)
+        qs = qs.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk))
+
+    rows = list(qs.order_by("-created_at", "-id")[: limit + 1])
+    next_cursor = encode_cursor(rows[limit - 1].created_at, rows[limit - 1].pk) if len(rows) > limit else None
+    rows = rows[:limit]
+
+    labels = get_hub_labels(row.asset_hub_id for row in rows if row.asset_hub_id)
+    notification_ids = [row.source_id for row in rows if row.source == ActivityEvent.Source.NOTIFICATION]
+    read_ids: set = set()
+    if user is not None and notification_ids:
+        read_ids = set(
+            NotificationRead.objects.filter(user=user, notification_id__in=notification_ids)
+            .values_list("notification_id", flat=True)
+        )
+
+    items: List[Dict[str, Any]] = []
+    for row in rows:
+        item: Dict[str, Any] = {
+            "id": f"{row.source}:{row.source_id}",
+            "source": row.source,
+            "created_at": row.created_at,
+            "title": _title(labels, row.asset_hub_id, row.title),
+            "message": row.message,
+            "asset_hub_id": row.asset_hub_id,
+            "actor": row.actor,
+        }
+        if row.source == ActivityEvent.Source.NOTIFICATION:
+            item["event_type"] = row.event_type
+            item["is_read"] = row.source_id in read_ids
+        else:
+            item.update(field_name=row.field_name, old_value=row.old_value, new_value=row.new_value)
+        items.append(item)
+    return items, next_cursor
+
+
+# ---------------------------------------------------------------------------
+# Unread counters
+# ---------------------------------------------------------------------------
+def _count_unread(user_id: int) -> int:
+    total = Notification.objects.count()
+    return max(total - NotificationRead.objects.filter(user_id=user_id).count(), 0)
+
+
+def get_unread_count(user: Any) -> int:
+    """The user's unread notification count (two COUNTs the first time, one PK read after)."""
+    count = (
+        NotificationUnreadCounter.objects.filter(user_id=user.pk)
+        .values_list("unread_count", flat=True)
+        .first()
+    )
+    if count is not None:
+        return max(count, 0)
+    counter, _created = NotificationUnreadCounter.objects.get_or_create(
+        user_id=user.pk, defaults={"unread_count": _count_unread(user.pk)},
+    )
+    return max(counter.unread_count, 0)
+
+
+def reset_unread_count(user_id: int) -> int:
+    """Recompute one user's counter (after bulk reads such as clear-all)."""
+    count = _count_unread(user_id)
+    NotificationUnreadCounter.objects.update_or_create(user_id=user_id, defaults={"unread_count": count})
+    return count
+
+
+def reconcile_unread_counters() -> int:
+    """Recompute every existing counter; returns the number of users updated."""
+    user_ids = list(NotificationUnreadCounter.objects.values_list("user_id", flat=True))
+    with transaction.atomic():
+        for user_id in user_ids:
+            reset_unread_count(user_id)
+    return len(user_ids)
+
+
+def notification_created() -> None:
+    NotificationUnreadCounter.objects.update(unread_count=F("unread_count") + 1)
+
+
+def notification_read(user_id: int) -> None:
+    NotificationUnreadCounter.objects.filter(user_id=user_id, unread_count__gt=0).update(
+        unread_count=F("unread_count") - 1,
+    )
+
+
+def notification_deleting(notification_id: int) -> None:
+    """Before a notification is deleted: it leaves the unread count of users who never read it."""
+    NotificationUnreadCounter.objects.filter(unread_count__gt=0).exclude(
+        user__notification_reads__notification_id=notification_id,
+    ).update(unread_count=F("unread_count") - 1)
+
+
+__all__ = [
+    "FEED_DEFAULT_LIMIT",
+    "FEED_MAX_LIMIT",
+    "audit_message",
+    "build_hub_label_map",
+    "decode_cursor",
+    "encode_cursor",
+    "event_for_audit",
+    "event_for_notification",
+    "feed_page",
+    "get_hub_labels",
+    "get_unread_count",
+    "invalidate_hub_labels",
+    "rebuild_activity_feed",
+    "reconcile_unread_counters",
+    "record_activity",
+    "remove_activity",
+    "reset_unread_count",
+]
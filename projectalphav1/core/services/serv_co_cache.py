@@ -0,0 +1,240 @@
+"""
+Shared cache tier helpers.
+
+WHAT: One LRU/TTL cache API used by FRED macro data, AI summaries, map markers
+      and modeling reference data
+WHY: Module-level dicts and LocMemCache are per-process - every gunicorn worker
+     starts cold, holds its own copy, and the cron service never sees them
+HOW: Two levels per namespace:
+     - L1: optional in-process LRU with TTL (OrderedDict, O(1) get/set/evict)
+     - L2: the configured Django cache (Redis, file or database backend - see
+       settings.CACHES), shared by every worker and the cron service
+     Hit/miss counters are kept per namespace for monitoring (/api/health/).
+
+USAGE:
+    from core.services.serv_co_cache import SharedCache
+
+    _fred_cache = SharedCache('fred', ttl=3600)
+
+    data = _fred_cache.get_or_set('10_year_treasury', lambda: fetch(...))
+    _fred_cache.invalidate()          # drop every entry in the namespace
+
+Docs reviewed:
+- Django cache framework: https://docs.djangoproject.com/en/5.2/topics/cache/
+- Cache key versioning: https://docs.djangoproject.com/en/5.2/topics/cache/#cache-versioning
+- collections.OrderedDict.move_to_end: https://docs.python.org/3/library/collections.html#collections.OrderedDict.move_to_end
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+# Sentinel so cached falsy values (0, [], {}) still count as hits
+_MISSING = object()
+
+
+class LRUTTLCache:
+    """Thread-safe in-process LRU cache with per-entry expiry.
+
+    Replaces ad-hoc dict caches that evicted by scanning every entry with
+    ``min(...)``; eviction here pops the least recently used entry in O(1).
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: Optional[float] = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# ---------------------------------------------------------------------------
+# Hit/miss metrics
+# ---------------------------------------------------------------------------
+_stats_lock = threading.Lock()
+_stats: Dict[str, Dict[str, int]] = {}
+
+
+def record_cache_event(namespace: str, event: str) -> None:
+    """Increment a per-namespace counter ('hits', 'local_hits', 'misses', 'sets', 'errors')."""
+    with _stats_lock:
+        counters = _stats.setdefault(namespace, {'hits': 0, 'local_hits': 0, 'misses': 0, 'sets': 0, 'errors': 0})
+        counters[event] = counters.get(event, 0) + 1
+
+
+def get_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Return a snapshot of per-namespace counters with a computed hit rate.
+
+    Counters are per process; each worker reports its own traffic.
+    """
+    with _stats_lock:
+        snapshot = {ns: dict(counters) for ns, counters in _stats.items()}
+    for counters in snapshot.values():
+        lookups = counters['hits'] + counters['local_hits'] + counters['misses']
+        counters['hit_rate'] = round((counters['hits'] + counters['local_hits']) / lookups, 4) if lookups else None
+    return snapshot
+
+
+def reset_cache_stats() -> None:
+    with _stats_lock:
+        _stats.clear()
+
+
+def make_cache_key(*parts: Any) -> str:
+    """Build a short, backend-safe key from arbitrary parts (SHA-1 of their repr)."""
+    raw = '|'.join(repr(p) for p in parts)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+class SharedCache:
+    """Namespaced cache on the shared Django cache tier with an optional L1 LRU.
+
+    Args:
+        namespace: Key prefix and metrics bucket (e.g. 'fred', 'geocode')
+        ttl: Shared (L2) expiry in seconds; None keeps entries until evicted
+        local_maxsize: Size of the in-process LRU (0 disables L1)
+        local_ttl: L1 expiry in seconds (defaults to min(ttl, 60) so workers
+            converge quickly after invalidation)
+        alias: Django cache alias from settings.CACHES
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl: Optional[int] = 300,
+        *,
+        local_maxsize: int = 0,
+        local_ttl: Optional[int] = None,
+        alias: str = 'default',
+    ):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.alias = alias
+        if local_ttl is None:
+            local_ttl = min(ttl, 60) if ttl is not None else 60
+        self._local = LRUTTLCache(maxsize=local_maxsize, ttl=local_ttl) if local_maxsize else None
+
+    @property
+    def backend(self):
+        return caches[self.alias]
+
+    def _version_key(self) -> str:
+        return f'{self.namespace}:__version__'
+
+    def _version(self) -> int:
+        version = self.backend.get(self._version_key())
+        if version is None:
+            # WHAT: Seed with a time-based version so an evicted counter never
+            # resurrects entries written under an older version
+            self.backend.add(self._version_key(), time.time_ns(), timeout=None)
+            version = self.backend.get(self._version_key())
+        return version
+
+    def _key(self, key: Any) -> str:
+        if not isinstance(key, str):
+            key = make_cache_key(key)
+        return f'{self.namespace}:{key}'
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        full_key = self._key(key)
+        if self._local is not None:
+            value = self._local.get(full_key, _MISSING)
+            if value is not _MISSING:
+                record_cache_event(self.namespace, 'local_hits')
+                return value
+        try:
+            value = self.backend.get(full_key, _MISSING, version=self._version())
+        except Exception as e:
+            # WHAT: Cache outages degrade to a miss instead of failing the caller
+            logger.warning(f'[Cache:{self.namespace}] get failed: {e}')
+            record_cache_event(self.namespace, 'errors')
+            value = _MISSING
+        if value is _MISSING:
+            record_cache_event(self.namespace, 'misses')
+            return default
+        record_cache_event(self.namespace, 'hits')
+        if self._local is not None:
+            self._local.set(full_key, value)
+        return value
+
+    def set(self, key: Any, value: Any, ttl: Optional[int] = _MISSING) -> None:
+        full_key = self._key(key)
+        timeout = self.ttl if ttl is _MISSING else ttl
+        try:
+            self.backend.set(full_key, value, timeout=timeout, version=self._version())
+            record_cache_event(self.namespace, 'sets')
+        except Exception as e:
+            logger.warning(f'[Cache:{self.namespace}] set failed: {e}')
+            record_cache_event(self.namespace, 'errors')
+        if self._local is not None:
+            self._local.set(full_key, value)
+
+    def delete(self, key: Any) -> None:
+        full_key = self._key(key)
+        if self._local is not None:
+            self._local.delete(full_key)
+        try:
+            self.backend.delete(full_key, version=self._version())
+        except Exception as e:
+            logger.warning(f'[Cache:{self.namespace}] delete failed: {e}')
+
+    def get_or_set(self, key: Any, compute: Callable[[], Any], ttl: Optional[int] = _MISSING) -> Any:
+        """Return the cached value or compute, store and return it.
+
+        ``None`` results are not stored so transient failures are retried.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        value = compute()
+        if value is not None:
+            self.set(key, value, ttl)
+        return value
+
+    def invalidate(self) -> None:
+        """Drop every entry in this namespace (all workers) by bumping its version."""
+        if self._local is not None:
+            self._local.clear()
+        try:
+            self.backend.incr(self._version_key())
+        except ValueError:
+            self.backend.set(self._version_key(), time.time_ns(), timeout=None)
@@ -0,0 +1,496 @@
+"""
+Calendar event projection (CalendarEventProjection) maintenance.
+
+WHAT: Builds the read-only calendar events (CALENDAR_DATE_FIELDS + projected
+      liquidations) into CalendarEventProjection rows and keeps them current
+WHY: get_calendar_events scanned AcqAsset, ServicerLoanData, TradeLevelAssumption and
+     BlendedOutcomeModel on every request and filtered dates in Python; the projection
+     turns a month view into one indexed range query
+HOW: - Each source declares how to load its rows (one .values() query per scope) and which
+       source lookup matches each projection column (source_id, asset_hub_id, trade_id,
+       seller_id) - see _SOURCES.
+     - refresh_calendar_events(source, ids, scope=...) rebuilds the events of the matching
+       source rows: upsert on event_key, delete keys that disappeared (date cleared, row
+       deleted).
+     - Signals (core/signals.py) call queue_calendar_refresh(); ids are collected per
+       thread and refreshed once after commit. ETL loops wrap their writes in
+       deferred_calendar_refresh() and bulk writers call queue_hub_calendar_refresh(),
+       so an import refreshes each touched record once.
+     - `manage.py rebuild_calendar_index` rebuilds everything (initial backfill, or after
+       editing CALENDAR_DATE_FIELDS).
+
+Docs reviewed:
+- QuerySet.bulk_create(update_conflicts=...): https://docs.djangoproject.com/en/5.2/ref/models/querysets/#bulk-create
+- transaction.on_commit: https://docs.djangoproject.com/en/5.2/topics/db/transactions/#performing-actions-after-commit
+- threading.local: https://docs.python.org/3/library/threading.html#thread-local-data
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from django.db import transaction
+from django.db.models import Q
+
+from acq_module.models.model_acq_assumptions import TradeLevelAssumption
+from acq_module.models.model_acq_seller import AcqAsset
+from am_module.models.model_am_modeling import BlendedOutcomeModel
+from am_module.models.model_am_servicersCleaned import ServicerLoanData
+from core.models import CalendarEventProjection
+from core.serializers.serial_co_calendar import CALENDAR_DATE_FIELDS
+
+logger = logging.getLogger(__name__)
+
+SOURCE_ACQ_LOAN = 'AcqLoan'
+SOURCE_SERVICER = 'ServicerData'
+SOURCE_TRADE_ASSUMPTION = 'TradeLevelAssumption'
+SOURCE_PROJECTED = 'ProjectedLiquidation'
+
+# WHAT: Sources keyed to an AssetIdHub (refreshed when the hub's asset/property changes)
+HUB_SOURCES = (SOURCE_ACQ_LOAN, SOURCE_SERVICER, SOURCE_PROJECTED)
+
+_UPSERT_BATCH = 1000
+_UPSERT_FIELDS = ['source', 'source_id', 'date', 'category', 'seller', 'trade', 'asset_hub', 'payload']
+
+
+def _date_fields(model_name: str) -> List[Tuple[str, str, str, Optional[str]]]:
+    """(field, title, category, sub_type) entries of CALENDAR_DATE_FIELDS for one model."""
+    fields = []
+    for item in CALENDAR_DATE_FIELDS:
+        if item[0] == model_name:
+            _model, field, title, category = item[:4]
+            fields.append((field, title, category, item[4] if len(item) == 5 else None))
+    return fields
+
+
+def _any_date(prefix: str, fields: Sequence[Tuple[str, str, str, Optional[str]]]) -> Q:
+    """Q matching rows where at least one configured date field is set."""
+    condition = Q(pk__in=[])
+    for field, *_rest in fields:
+        condition |= Q(**{f'{prefix}{field}__isnull': False})
+    return condition
+
+
+def _projection(
+    source: str,
+    source_id: int,
+    date_value,
+    event: Dict[str, Any],
+    *,
+    seller_id=None,
+    trade_id=None,
+    asset_hub_id=None,
+) -> CalendarEventProjection:
+    return CalendarEventProjection(
+        event_key=event['id'],
+        source=source,
+        source_id=source_id,
+        date=date_value,
+        category=event['category'],
+        seller_id=seller_id,
+        trade_id=trade_id,
+        asset_hub_id=asset_hub_id,
+        payload=event,
+    )
+
+
+# Source builders (one query per call; scope is a Q on the source model) --------------
+
+def _build_acq_loan(scope: Q) -> Iterator[CalendarEventProjection]:
+    """AcqLoan date fields (titles use the property address)."""
+    fields = _date_fields('AcqLoan')
+    if not fields:
+        return
+    rows = (
+        AcqAsset.objects.filter(scope)
+        .filter(_any_date('loan__', fields))
+        .values(
+            'asset_hub_id', 'seller_id', 'trade_id',
+            'property__street_address', 'property__city', 'property__state',
+            *[f'loan__{field}' for field, *_rest in fields],
+        )
+    )
+    for row in rows.iterator(chunk_size=2000):
+        address = row['property__street_address'] or (
+            f"{row['property__city'] or 'Unknown'}, {row['property__state'] or ''}"
+        )
+        address = address[:30]
+        hub_id = row['asset_hub_id']
+        for field, title, category, _sub_type in fields:
+            date_value = row[f'loan__{field}']
+            if not date_value:
+                continue
+            yield _projection(
+                SOURCE_ACQ_LOAN, hub_id, date_value,
+                {
+                    'id': f'acq_asset:{hub_id}:{field}',
+                    'title': f'{title}: {address}',
+                    'time': 'All Day',
+                    'description': title,
+                    'category': category,
+                    'source_model': 'AcqLoan',
+                    'source_id': hub_id,
+                    'url': f'/acq/loan/{hub_id}/',
+                    'editable': False,  # Model-based events are read-only
+                },
+                seller_id=row['seller_id'], trade_id=row['trade_id'], asset_hub_id=hub_id,
+            )
+
+
+def _build_servicer(scope: Q) -> Iterator[CalendarEventProjection]:
+    """ServicerLoanData date fields (e.g. actual_fc_sale_date)."""
+    fields = _date_fields('ServicerLoanData')
+    if not fields:
+        return
+    rows = (
+        ServicerLoanData.objects.filter(scope)
+        .filter(_any_date('', fields))
+        .values(
+            'id', 'asset_hub_id', 'servicer_id', 'address', 'city', 'state',
+            'asset_hub__acq_asset__seller_id', 'asset_hub__acq_asset__trade_id',
+            *[field for field, *_rest in fields],
+        )
+    )
+    for row in rows.iterator(chunk_size=2000):
+        address = row['address'] or f"{row['city'] or 'Unknown'}, {row['state'] or ''}"
+        hub_id = row['asset_hub_id']
+        for field, title, category, _sub_type in fields:
+            date_value = row[field]
+            if not date_value:
+                continue
+            yield _projection(
+                SOURCE_SERVICER, row['id'], date_value,
+                {
+                    'id': f"servicer_data:{row['id']}:{field}",
+                    'title': address[:30],
+                    'time': 'All Day',
+                    'description': title,
+                    'category': category,
+                    'source_model': 'ServicerData',
+                    'source_id': row['id'],
+                    'url': f'/am/loan/{hub_id}/' if hub_id else '',
+                    'editable': False,
+                    'servicer_id': row['servicer_id'] or '',
+                    'address': address,
+                    'asset_hub_id': hub_id,
+                    'city': row['city'] or '',
+                    'state': row['state'] or '',
+                },
+                seller_id=row['asset_hub__acq_asset__seller_id'],
+                trade_id=row['asset_hub__acq_asset__trade_id'],
+                asset_hub_id=hub_id,
+            )
+
+
+def _build_trade_assumption(scope: Q) -> Iterator[CalendarEventProjection]:
+    """TradeLevelAssumption bid/settlement dates (titled "Seller - Trade")."""
+    fields = _date_fields('TradeLevelAssumption')
+    if not fields:
+        return
+    rows = (
+        TradeLevelAssumption.objects.filter(scope)
+        .filter(_any_date('', fields))
+        .values(
+            'id', 'trade_id', 'trade__trade_name', 'trade__seller_id', 'trade__seller__name',
+            *[field for field, *_rest in fields],
+        )
+    )
+    for row in rows.iterator(chunk_size=2000):
+        trade_name = row['trade__trade_name'] or 'Unknown Trade'
+        seller_name = row['trade__seller__name'] or 'Unknown Seller'
+        for field, title, category, sub_type in fields:
+            date_value = row[field]
+            if not date_value:
+                continue
+            event = {
+                'id': f"trade_assumption:{row['id']}:{field}",
+                'title': f'{seller_name} - {trade_name}',
+                'time': 'All Day',
+                'description': title,
+                'category': category,
+                'event_type': category,  # WHAT: Set event_type to 'trade' for frontend filtering/display
+                'source_model': 'TradeLevelAssumption',
+                'source_id': row['id'],
+                'editable': False,
+                'url': f"/acq/trade/{row['trade_id']}/" if row['trade_id'] else '',
+            }
+            if sub_type:
+                event['sub_type'] = sub_type
+            yield _projection(
+                SOURCE_TRADE_ASSUMPTION, row['id'], date_value, event,
+                seller_id=row['trade__seller_id'], trade_id=row['trade_id'],
+            )
+
+
+def _build_projected(scope: Q) -> Iterator[CalendarEventProjection]:
+    """
+    Projected liquidation per hub: ReUWAMProjections.reuw_projected_liq_date, falling back
+    to BlendedOutcomeModel.expected_exit_date (same rules as
+    am_module.logic.logi_am_modelLogic.get_projected_liquidation_events).
+    """
+    rows = list(
+        BlendedOutcomeModel.objects.filter(scope)
+        .filter(
+            Q(expected_exit_date__isnull=False)
+            | Q(asset_hub__reuw_am_projections__reuw_projected_liq_date__isnull=False)
+        )
+        .values(
+            'asset_hub_id', 'expected_exit_date',
+            'asset_hub__reuw_am_projections__reuw_projected_liq_date',
+            'asset_hub__servicer_id',
+            'asset_hub__acq_asset__asset_hub_id',
+            'asset_hub__acq_asset__seller_id', 'asset_hub__acq_asset__trade_id',
+            'asset_hub__acq_asset__property__street_address',
+            'asset_hub__acq_asset__property__city',
+            'asset_hub__acq_asset__property__state',
+        )
+    )
+    # WHAT: Hubs without an AcqAsset use the latest servicer record's address (one query)
+    fallback: Dict[int, Dict[str, Any]] = {}
+    missing = [row['asset_hub_id'] for row in rows if row['asset_hub__acq_asset__asset_hub_id'] is None]
+    if missing:
+        for servicer_row in (
+            ServicerLoanData.objects.filter(asset_hub_id__in=missing)
+            .order_by('asset_hub_id', '-as_of_date')
+            .values('asset_hub_id', 'address', 'city', 'state')
+        ):
+            fallback.setdefault(servicer_row['asset_hub_id'], servicer_row)
+
+    for row in rows:
+        hub_id = row['asset_hub_id']
+        projected_date = row['asset_hub__reuw_am_projections__reuw_projected_liq_date']
+        source_model = 'ReUWAMProjections'
+        if not projected_date:
+            projected_date = row['expected_exit_date']
+            source_model = 'BlendedOutcomeModel'
+
+        address, city, state = 'Unknown Address', '', ''
+        if row['asset_hub__acq_asset__asset_hub_id'] is not None:
+            city = row['asset_hub__acq_asset__property__city'] or ''
+            state = row['asset_hub__acq_asset__property__state'] or ''
+            address = row['asset_hub__acq_asset__property__street_address'] or f"{city or 'Unknown'}, {state}"
+        elif hub_id in fallback:
+            servicer_row = fallback[hub_id]
+            city = servicer_row['city'] or ''
+            state = servicer_row['state'] or ''
+            address = servicer_row['address'] or f"{city or 'Unknown'}, {state}"
+        address_display = address[:30] if address else 'Unknown Address'
+        servicer_id = row['asset_hub__servicer_id'] or ''
+        title = f'{servicer_id} - {address_display}' if servicer_id else address_display
+
+        yield _projection(
+            SOURCE_PROJECTED, hub_id, projected_date,
+            {
+                'id': f'projected_liquidation:{hub_id}',
+                'title': title,
+                'time': 'All Day',
+                'description': f'Projected liquidation date for {address_display}',
+                'category': 'projected_liquidation',
+                'event_type': 'projected_liquidation',
+                'source_model': source_model,
+                'source_id': hub_id,
+                'url': f'/am/loan/{hub_id}/' if hub_id else '',
+                'editable': False,
+                'asset_hub_id': hub_id,
+                'servicer_id': servicer_id,
+                'address': address_display,
+                'city': city,
+                'state': state,
+            },
+            seller_id=row['asset_hub__acq_asset__seller_id'],
+            trade_id=row['asset_hub__acq_asset__trade_id'],
+            asset_hub_id=hub_id,
+        )
+
+
+@dataclass(frozen=True)
+class _Source:
+    build: Callable[[Q], Iterable[CalendarEventProjection]]
+    # WHAT: Projection column -> source model lookup (a missing scope means "not affected")
+    scopes: Dict[str, str]
+
+
+_SOURCES: Dict[str, _Source] = {
+    SOURCE_ACQ_LOAN: _Source(_build_acq_loan, {
+        'source_id': 'asset_hub_id',
+        'asset_hub_id': 'asset_hub_id',
+        'trade_id': 'trade_id',
+        'seller_id': 'seller_id',
+    }),
+    SOURCE_SERVICER: _Source(_build_servicer, {
+        'source_id': 'pk',
+        'asset_hub_id': 'asset_hub_id',
+        'trade_id': 'asset_hub__acq_asset__trade_id',
+        'seller_id': 'asset_hub__acq_asset__seller_id',
+    }),
+    SOURCE_TRADE_ASSUMPTION: _Source(_build_trade_assumption, {
+        'source_id': 'pk',
+        'trade_id': 'trade_id',
+        'seller_id': 'trade__seller_id',
+    }),
+    SOURCE_PROJECTED: _Source(_build_projected, {
+        'source_id': 'asset_hub_id',
+        'asset_hub_id': 'asset_hub_id',
+        'trade_id': 'asset_hub__acq_asset__trade_id',
+        'seller_id': 'asset_hub__acq_asset__seller_id',
+    }),
+}
+
+
+def refresh_calendar_events(source: str, ids: Optional[Iterable[int]] = None, *, scope: str = 'source_id') -> int:
+    """
+    Rebuild the projection rows of ``source`` whose ``scope`` column is in ``ids``
+    (every row of the source when ``ids`` is None). Returns the number of rows written.
+    """
+    spec = _SOURCES[source]
+    lookup = spec.scopes.get(scope)
+    if lookup is None:
+        return 0
+    id_list = None if ids is None else sorted({int(value) for value in ids if value})
+    if id_list == []:
+        return 0
+
+    source_filter = Q() if id_list is None else Q(**{f'{lookup}__in': id_list})
+    existing = CalendarEventProjection.objects.filter(source=source)
+    if id_list is not None:
+        existing = existing.filter(**{f'{scope}__in': id_list})
+
+    written = 0
+    keys = set()
+    with transaction.atomic():
+        stale = set(existing.values_list('event_key', flat=True))
+        batch: List[CalendarEventProjection] = []
+        for projection in spec.build(source_filter):
+            keys.add(projection.event_key)
+            batch.append(projection)
+            if len(batch) >= _UPSERT_BATCH:
+                written += _upsert(batch)
+                batch = []
+        if batch:
+            written += _upsert(batch)
+        stale -= keys
+        stale_keys = sorted(stale)
+        for start in range(0, len(stale_keys), _UPSERT_BATCH):
+            CalendarEventProjection.objects.filter(event_key__in=stale_keys[start:start + _UPSERT_BATCH]).delete()
+    return written
+
+
+def _upsert(batch: List[CalendarEventProjection]) -> int:
+    CalendarEventProjection.objects.bulk_create(
+        batch,
+        update_conflicts=True,
+        unique_fields=['event_key'],
+        update_fields=_UPSERT_FIELDS + ['refreshed_at'],
+    )
+    return len(batch)
+
+
+def rebuild_calendar_index(sources: Optional[Iterable[str]] = None) -> Dict[str, int]:
+    """Full rebuild of every (or the given) source; returns rows written per source."""
+    return {source: refresh_calendar_events(source) for source in (sources or _SOURCES)}
+
+
+# Incremental refresh (signals / ETL hooks) -------------------------------------------
+
+_state = threading.local()
+
+
+def _pending() -> Dict[Tuple[str, str], set]:
+    if not hasattr(_state, 'pending'):
+        _state.pending = {}
+        _state.depth = 0
+    return _state.pending
+
+
+def queue_calendar_refresh(source: str, ids: Iterable[Any], *, scope: str = 'source_id') -> None:
+    """Refresh ``source`` rows matching ``ids`` once the current transaction commits."""
+    pending = _pending()
+    pending.setdefault((source, scope), set()).update(int(value) for value in ids if value)
+    if not _state.depth:
+        # WHAT: Every call registers; the first callback drains everything queued so far.
+        #       A rolled-back transaction leaves its ids queued for the next commit, which
+        #       only means a harmless extra rebuild.
+        transaction.on_commit(flush_calendar_refreshes)
+
+
+def queue_hub_calendar_refresh(hub_ids: Iterable[Any]) -> None:
+    """Refresh every hub-keyed source (AcqLoan, servicer, projected) for ``hub_ids``."""
+    hub_ids = list(hub_ids)
+    for source in HUB_SOURCES:
+        queue_calendar_refresh(source, hub_ids, scope='asset_hub_id')
+
+
+def flush_calendar_refreshes() -> None:
+    """Run all queued refreshes (one set-based rebuild per source/scope)."""
+    pending = _pending()
+    _state.pending = {}
+    for (source, scope), ids in pending.items():
+        if not ids:
+            continue
+        try:
+            refresh_calendar_events(source, ids, scope=scope)
+        except Exception:
+            # WHAT: The calendar must never break a model save; rebuild_calendar_index repairs
+            logger.exception('[CalendarIndex] Refresh of %s (%s, %d ids) failed', source, scope, len(ids))
+
+
+@contextmanager
+def deferred_calendar_refresh():
+    """
+    Collect signal-driven refreshes inside the block and run them once at the end
+    (after commit). Wrap ETL loops that save many source rows one by one.
+    """
+    _pending()
+    _state.depth += 1
+    try:
+        yield
+    finally:
+        _state.depth -= 1
+        if not _state.depth:
+            transaction.on_commit(flush_calendar_refreshes)
+
+
+def query_calendar_events(
+    start_date=None,
+    end_date=None,
+    *,
+    seller_id=None,
+    trade_id=None,
+    categories: Optional[Sequence[str]] = None,
+) -> List[Dict[str, Any]]:
+    """Projected events in [start_date, end_date] - one indexed range query."""
+    queryset = CalendarEventProjection.objects.all()
+    if start_date:
+        queryset = queryset.filter(date__gte=start_date)
+    if end_date:
+        queryset = queryset.filter(date__lte=end_date)
+    if categories:
+        queryset = queryset.filter(category__in=list(categories))
+    if trade_id:
+        queryset = queryset.filter(trade_id=trade_id)
+    if seller_id:
+        queryset = queryset.filter(seller_id=seller_id)
+    return [
+        {**payload, 'date': date_value}
+        for date_value, payload in queryset.order_by('date', 'id').values_list('date', 'payload')
+    ]
+
+
+__all__ = [
+    'HUB_SOURCES',
+    'SOURCE_ACQ_LOAN',
+    'SOURCE_PROJECTED',
+    'SOURCE_SERVICER',
+    'SOURCE_TRADE_ASSUMPTION',
+    'deferred_calendar_refresh',
+    'flush_calendar_refreshes',
+    'query_calendar_events',
+    'queue_calendar_refresh',
+    'queue_hub_calendar_refresh',
+    'rebuild_calendar_index',
+    'refresh_calendar_events',
+]
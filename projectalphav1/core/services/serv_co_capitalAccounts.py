@@ -0,0 +1,383 @@
+"""
+Fund capital accounts and pro-rata distribution allocations.
+
+WHAT: Positions, unfunded commitments and distribution allocations for every member of a
+      fund (and every co-investor) computed as array operations
+WHY: CoInvestor.total_contributed() / total_distributed() / net_position(),
+     FundMembership.remaining_commitment() and
+     EntityMembership.effective_distribution_percentage() work one instance at a time, and
+     the CoInvestor ones run two aggregate queries each - investor reports paid that per investor
+HOW: - build_fund_capital_accounts(): one FundMembership query for the fund, one
+       EntityMembership query per ownership level for the look-through; committed /
+       contributed / unfunded / pro-rata shares are NumPy arrays in integer cents
+     - allocate_pro_rata() / allocate_by_group(): largest-remainder allocation, so the
+       allocated cents always add up to the distribution exactly
+     - build_co_investor_positions(): three grouped queries (investors, contributions,
+       distributions by type) for the whole co-investor book
+     - get_*() wrappers cache payloads in SharedCache('capital_accounts'); core.signals
+       drops the namespace after commit when any cap-stack model changes
+     - GET /api/core/capital/funds/<fund_id>/accounts/ and /api/core/capital/co-investors/
+
+Docs reviewed:
+- QuerySet.values() / annotate(): https://docs.djangoproject.com/en/5.2/ref/models/querysets/#values
+- numpy.lexsort: https://numpy.org/doc/stable/reference/generated/numpy.lexsort.html
+- Largest remainder method: https://en.wikipedia.org/wiki/Largest_remainder_method
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+from django.db.models import Sum
+
+from core.models import CoInvestor, Entity, EntityMembership, FundMembership, InvestorContribution, InvestorDistribution
+from core.services.serv_co_cache import SharedCache
+
+_capital_cache = SharedCache('capital_accounts', ttl=60 * 60, local_maxsize=32)
+
+# WHAT: Nested EntityMembership levels followed below a fund member (cycle guard)
+MAX_LOOK_THROUGH_DEPTH = 6
+
+DISTRIBUTION_TYPES = [choice for choice, _label in InvestorDistribution.DistributionType.choices]
+
+
+# ------------------------------
+# Array helpers
+# ------------------------------
+
+def to_cents(values: Iterable[Any]) -> np.ndarray:
+    """Decimal / None values -> int64 cents (None -> 0)."""
+    return np.asarray([int(Decimal(v or 0).scaleb(2)) for v in values], dtype=np.int64)
+
+
+def _money(cents: Any) -> Decimal:
+    return Decimal(int(cents)).scaleb(-2)
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> List[Optional[float]]:
+    """Element-wise numerator / denominator rounded to 6 places; None where the denominator is 0."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        values = np.where(denominator != 0, numerator / np.where(denominator != 0, denominator, 1), np.nan)
+    return [None if np.isnan(v) else round(float(v), 6) for v in values]
+
+
+def allocate_by_group(amounts: np.ndarray, groups: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    WHAT: Split each group's amount across its rows pro rata to ``weights``
+    HOW: Floor of the exact share, then the leftover cents of each group go one each to
+         the rows with the largest fractional remainders (ties: earlier row first)
+
+    ARGS:
+        amounts: int64 cents per group (indexed by group number)
+        groups: Group number of every row (0..len(amounts)-1)
+        weights: Non-negative weight of every row; a group whose weights sum to 0 gets nothing
+
+    RETURNS: int64 cents per row; each group's rows sum to its amount (or 0)
+    """
+    amounts = np.asarray(amounts, dtype=np.int64)
+    groups = np.asarray(groups, dtype=np.int64)
+    weights = np.clip(np.asarray(weights, dtype=np.float64), 0, None)
+    if not len(groups):
+        return np.zeros(0, dtype=np.int64)
+
+    totals = np.bincount(groups, weights=weights, minlength=len(amounts))
+    funded = totals[groups] > 0
+    sign = np.sign(amounts)[groups]
+    magnitude = np.abs(amounts)[groups].astype(np.float64)
+    exact = np.where(funded, magnitude * weights / np.where(funded, totals[groups], 1), 0.0)
+    base = np.floor(exact).astype(np.int64)
+
+    allocated = np.bincount(groups, weights=base, minlength=len(amounts)).astype(np.int64)
+    leftover = np.where(totals > 0, np.abs(amounts) - allocated, 0)
+    # WHAT: Rank rows inside their group by remainder (largest first, stable on row order)
+    order = np.lexsort((np.arange(len(groups)), -(exact - base), groups))
+    starts = np.searchsorted(groups[order], np.arange(len(amounts)))
+    rank = np.empty(len(groups), dtype=np.int64)
+    rank[order] = np.arange(len(groups)) - starts[groups[order]]
+    base += (rank < leftover[groups]) & funded
+    return base * sign
+
+
+def allocate_pro_rata(amount_cents: int, weights: np.ndarray) -> np.ndarray:
+    """Single-pool allocate_by_group: ``amount_cents`` split pro rata to ``weights``."""
+    weights = np.asarray(weights, dtype=np.float64)
+    return allocate_by_group(np.asarray([amount_cents]), np.zeros(len(weights), dtype=np.int64), weights)
+
+
+def member_weights(ownership: np.ndarray, committed: np.ndarray, active: np.ndarray) -> np.ndarray:
+    """Distribution weights: ownership % of active members, or their commitments when no % is set."""
+    ownership = np.where(active, ownership, 0.0)
+    if ownership.sum() > 0:
+        return ownership
+    return np.where(active, committed, 0).astype(np.float64)
+
+
+# ------------------------------
+# Fund capital accounts
+# ------------------------------
+
+def _look_through(
+    entity_ids: np.ndarray, shares: np.ndarray, allocations: Optional[np.ndarray],
+) -> List[Dict[str, Any]]:
+    """
+    WHAT: Ultimate beneficial owners below the fund members
+    HOW: Level by level, each entity that has active EntityMembership rows passes its
+         share (and allocation) to its members pro rata to
+         distribution_percentage-or-ownership_percentage (one query per level);
+         entities without members are beneficial owners, summed across paths
+    """
+    owners: Dict[int, Dict[str, Any]] = {}
+    frontier_ids, frontier_shares, frontier_alloc = entity_ids, shares, allocations
+    names = dict(Entity.objects.filter(pk__in=entity_ids.tolist()).values_list('pk', 'name'))
+
+    for depth in range(MAX_LOOK_THROUGH_DEPTH + 1):
+        rows = [] if depth == MAX_LOOK_THROUGH_DEPTH or not len(frontier_ids) else list(
+            EntityMembership.objects
+            .filter(parent_entity_id__in=frontier_ids.tolist(), is_active=True)
+            .order_by('parent_entity_id', 'pk')
+            .values_list('parent_entity_id', 'member_entity_id', 'member_entity__name',
+                         'ownership_percentage', 'distribution_percentage')
+        )
+        # WHAT: Members with no weight at all cannot take the share - the parent keeps it
+        weighted = {}
+        for row in rows:
+            weighted[row[0]] = weighted.get(row[0], 0) + float(row[4] if row[4] is not None else row[3] or 0)
+        rows = [row for row in rows if weighted[row[0]] > 0]
+        parents_with_members = {row[0] for row in rows}
+        for i, entity_id in enumerate(frontier_ids.tolist()):
+            if entity_id in parents_with_members:
+                continue
+            owner = owners.setdefault(entity_id, {
+                'entity_id': entity_id, 'entity_name': names.get(entity_id), 'depth': depth,
+                'effective_share': 0.0, 'allocation_cents': 0,
+            })
+            owner['effective_share'] += float(frontier_shares[i])
+            if frontier_alloc is not None:
+                owner['allocation_cents'] += int(frontier_alloc[i])
+        if not rows:
+            break
+
+        # WHAT: Frontier rows may repeat an entity (several paths) - every path passes down
+        position = {}
+        for i, entity_id in enumerate(frontier_ids.tolist()):
+            position.setdefault(entity_id, []).append(i)
+        parent_rows = [(p, row) for row in rows for p in position[row[0]]]
+        groups = np.asarray([p for p, _row in parent_rows], dtype=np.int64)
+        child_ids = np.asarray([row[1] for _p, row in parent_rows], dtype=np.int64)
+        child_weights = np.asarray(
+            [float(row[4] if row[4] is not None else row[3] or 0) for _p, row in parent_rows],
+        )
+        names.update({row[1]: row[2] for row in rows})
+
+        group_totals = np.bincount(groups, weights=child_weights, minlength=len(frontier_ids))
+        fraction = np.where(group_totals[groups] > 0, child_weights / np.where(group_totals[groups] > 0, group_totals[groups], 1), 0.0)
+        frontier_shares = frontier_shares[groups] * fraction
+        if frontier_alloc is not None:
+            frontier_alloc = allocate_by_group(frontier_alloc, groups, child_weights)
+        frontier_ids = child_ids
+
+    result = []
+    for owner in sorted(owners.values(), key=lambda o: (-o['effective_share'], o['entity_id'])):
+        cents = owner.pop('allocation_cents')
+        owner['effective_share'] = round(owner['effective_share'], 6)
+        owner['allocation'] = _money(cents) if allocations is not None else None
+        result.append(owner)
+    return result
+
+
+def build_fund_capital_accounts(
+    fund_id: int, distribution: Optional[Decimal] = None, look_through: bool = True,
+) -> Optional[Dict[str, Any]]:
+    """
+    WHAT: Capital accounts of every member of a fund (an Entity with FundMembership rows)
+    WHY: One fetch and array math instead of per-member property calls
+
+    ARGS:
+        fund_id: Entity id of the fund
+        distribution: Optional amount to allocate pro rata across active members
+        look_through: Also resolve nested EntityMembership down to beneficial owners
+
+    RETURNS: {'fund': {...}, 'totals': {...}, 'members': [...], 'beneficial_owners': [...]}
+             or None when the fund does not exist
+    """
+    fund = Entity.objects.filter(pk=fund_id).values('id', 'name', 'entity_type').first()
+    if fund is None:
+        return None
+    rows = list(
+        FundMembership.objects
+        .filter(fund_id=fund_id)
+        .order_by('member_type', '-ownership_percentage', 'pk')
+        .values(
+            'id', 'entity_id', 'entity__name', 'entity__entity_type', 'member_type', 'is_active',
+            'ownership_percentage', 'capital_committed', 'capital_contributed',
+            'investing_through_id', 'investing_through__nickname_name',
+        )
+    )
+    committed = to_cents(row['capital_committed'] for row in rows)
+    contributed = to_cents(row['capital_contributed'] for row in rows)
+    ownership = np.asarray([float(row['ownership_percentage'] or 0) for row in rows], dtype=np.float64)
+    active = np.asarray([bool(row['is_active']) for row in rows], dtype=bool)
+
+    # WHAT: Same arithmetic as FundMembership.remaining_commitment(), for every member
+    unfunded = committed - contributed
+    weights = member_weights(ownership, committed, active)
+    total_weight = weights.sum()
+    shares = weights / total_weight if total_weight > 0 else np.zeros(len(rows))
+    amount_cents = None if distribution is None else int(Decimal(distribution).scaleb(2))
+    allocations = allocate_pro_rata(amount_cents, weights) if amount_cents is not None else None
+    called = _ratio(contributed, committed)
+
+    members = []
+    for i, row in enumerate(rows):
+        members.append({
+            'membership_id': row['id'],
+            'entity_id': row['entity_id'],
+            'entity_name': row['entity__name'],
+            'entity_type': row['entity__entity_type'],
+            'member_type': row['member_type'],
+            'is_active': row['is_active'],
+            'investing_through_id': row['investing_through_id'],
+            'investing_through_name': row['investing_through__nickname_name'],
+            'ownership_percentage': row['ownership_percentage'],
+            'capital_committed': _money(committed[i]),
+            'capital_contributed': _money(contributed[i]),
+            'unfunded_commitment': _money(unfunded[i]),
+            'percent_called': called[i],
+            'pro_rata_share': round(float(shares[i]), 6),
+            'allocation': _money(allocations[i]) if allocations is not None else None,
+        })
+
+    owners = []
+    if look_through and rows:
+        entity_ids = np.asarray([row['entity_id'] for row in rows], dtype=np.int64)
+        owners = _look_through(entity_ids, shares, allocations)
+
+    return {
+        'fund': fund,
+        'distribution': _money(amount_cents) if amount_cents is not None else None,
+        'totals': {
+            'member_count': len(rows),
+            'active_member_count': int(active.sum()),
+            'capital_committed': _money(committed.sum()),
+            'capital_contributed': _money(contributed.sum()),
+            'unfunded_commitment': _money(unfunded.sum()),
+            'percent_called': _ratio(np.asarray([contributed.sum()]), np.asarray([committed.sum()]))[0],
+            'ownership_percentage_total': round(float(ownership[active].sum()), 2),
+        },
+        'members': members,
+        'beneficial_owners': owners,
+    }
+
+
+# ------------------------------
+# Co-investor book
+# ------------------------------
+
+def build_co_investor_positions(
+    distribution: Optional[Decimal] = None, active_only: bool = False,
+) -> Dict[str, Any]:
+    """
+    WHAT: Contributed / distributed / net position / unfunded for every CoInvestor
+    HOW: Three queries (investors, contribution sums, distribution sums by type) and
+         array math; matches CoInvestor.total_contributed() / total_distributed() /
+         net_position() per investor
+
+    ARGS:
+        distribution: Optional amount allocated pro rata to ownership_percentage of
+                      active investors
+        active_only: Skip inactive investors
+    """
+    investors = CoInvestor.objects.order_by('pk')
+    if active_only:
+        investors = investors.filter(is_active=True)
+    rows = list(investors.values(
+        'id', 'is_active', 'commitment_amount', 'ownership_percentage',
+        'crm_contact_id', 'crm_contact__contact_name', 'crm_contact__firm',
+    ))
+    index = {row['id']: i for i, row in enumerate(rows)}
+    count = len(rows)
+
+    contributed = np.zeros(count, dtype=np.int64)
+    for investor_id, total in (
+        InvestorContribution.objects.filter(co_investor_id__in=list(index))
+        .order_by().values('co_investor_id').annotate(total=Sum('amount'))
+        .values_list('co_investor_id', 'total')
+    ):
+        contributed[index[investor_id]] = to_cents([total])[0]
+
+    by_type = np.zeros((len(DISTRIBUTION_TYPES), count), dtype=np.int64)
+    type_index = {name: i for i, name in enumerate(DISTRIBUTION_TYPES)}
+    for investor_id, kind, total in (
+        InvestorDistribution.objects.filter(co_investor_id__in=list(index))
+        .order_by().values('co_investor_id', 'distribution_type').annotate(total=Sum('amount'))
+        .values_list('co_investor_id', 'distribution_type', 'total')
+    ):
+        by_type[type_index.get(kind, type_index['other']), index[investor_id]] += to_cents([total])[0]
+
+    distributed = by_type.sum(axis=0)
+    net_position = contributed - distributed
+    has_commitment = np.asarray([row['commitment_amount'] is not None for row in rows], dtype=bool)
+    commitment = to_cents(row['commitment_amount'] for row in rows)
+    unfunded = commitment - contributed
+    ownership = np.asarray([float(row['ownership_percentage'] or 0) for row in rows], dtype=np.float64)
+    active = np.asarray([bool(row['is_active']) for row in rows], dtype=bool)
+    amount_cents = None if distribution is None else int(Decimal(distribution).scaleb(2))
+    allocations = (
+        allocate_pro_rata(amount_cents, member_weights(ownership, commitment, active))
+        if amount_cents is not None else None
+    )
+    multiple = _ratio(distributed, contributed)
+
+    investors_out = []
+    for i, row in enumerate(rows):
+        investors_out.append({
+            'co_investor_id': row['id'],
+            'crm_contact_id': row['crm_contact_id'],
+            'name': row['crm_contact__contact_name'],
+            'firm': row['crm_contact__firm'],
+            'is_active': row['is_active'],
+            'ownership_percentage': row['ownership_percentage'],
+            'commitment_amount': row['commitment_amount'],
+            'total_contributed': _money(contributed[i]),
+            'total_distributed': _money(distributed[i]),
+            'distributed_by_type': {name: _money(by_type[t, i]) for t, name in enumerate(DISTRIBUTION_TYPES)},
+            'net_position': _money(net_position[i]),
+            'unfunded_commitment': _money(unfunded[i]) if has_commitment[i] else None,
+            'distribution_multiple': multiple[i],
+            'allocation': _money(allocations[i]) if allocations is not None else None,
+        })
+
+    return {
+        'distribution': _money(amount_cents) if amount_cents is not None else None,
+        'totals': {
+            'investor_count': count,
+            'total_commitment': _money(commitment.sum()),
+            'total_contributed': _money(contributed.sum()),
+            'total_distributed': _money(distributed.sum()),
+            'net_position': _money(net_position.sum()),
+            'unfunded_commitment': _money(unfunded[has_commitment].sum()),
+        },
+        'investors': investors_out,
+    }
+
+
+# ------------------------------
+# Cached entry points
+# ------------------------------
+
+def get_fund_capital_accounts(fund_id: int, distribution: Optional[Decimal] = None) -> Optional[Dict[str, Any]]:
+    """Cached build_fund_capital_accounts (dropped whenever a cap-stack model changes)."""
+    key = ('fund', int(fund_id), None if distribution is None else str(Decimal(distribution).quantize(Decimal('0.01'))))
+    return _capital_cache.get_or_set(key, lambda: build_fund_capital_accounts(fund_id, distribution))
+
+
+def get_co_investor_positions(distribution: Optional[Decimal] = None, active_only: bool = False) -> Dict[str, Any]:
+    """Cached build_co_investor_positions."""
+    key = ('co_investors', active_only, None if distribution is None else str(Decimal(distribution).quantize(Decimal('0.01'))))
+    return _capital_cache.get_or_set(key, lambda: build_co_investor_positions(distribution, active_only))
+
+
+def invalidate_capital_accounts() -> None:
+    _capital_cache.invalidate()
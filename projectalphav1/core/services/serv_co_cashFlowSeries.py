@@ -0,0 +1,452 @@
+"""
+Bulk LLCashFlowSeries / LLTransactionSummary builder.
+
+WHAT: Rebuild loan-level realized cash flows from GeneralLedgerEntries in bulk
+WHY: LLCashFlowSeries.save() loads asset_hub.blended_outcome_model for every row and sums
+     ~35 line items in Python, so rebuilding a fund's series meant thousands of saves
+HOW: - load_gl_cash_flows(): one grouped query - net debit-credit per (hub, posting date,
+       account) for accounts whose ChartOfAccounts.transaction_table_reference names a
+       realized field - plus one query for BlendedOutcomeModel purchase dates
+     - build_series_frame(): period numbers, the (hub, period) x line-item pivot, totals and
+       period dates are vectorized columns (integer cents, no Decimal math per row)
+     - rebuild_cash_flow_series(): replaces each hub's series with one DELETE and batched
+       bulk_create in a single transaction, upserts LLTransactionSummary from the same
+       frame (zeroing GL-mapped fields of rebuilt hubs that no longer have activity),
+       and bumps the reporting cash-flow cache tag once on commit
+     - `manage.py rebuild_cash_flow_series` wraps it
+
+PERIODS: period 0 starts on the purchase date (BlendedOutcomeModel.purchase_date, or the
+         hub's first posting date when none is set); period n starts on purchase_date + n
+         months (day clamped to month end, as relativedelta). Postings before the purchase
+         date land in period 0. Every period from 0 to the last posting is written.
+
+SIGNS: income line items (income_*, proceeds, net_liquidation_proceeds) are credit - debit;
+       every other line item is debit - credit, so both are positive in normal use.
+
+Docs reviewed:
+- DataFrame.pivot_table: https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.pivot_table.html
+- QuerySet.bulk_create(update_conflicts=...): https://docs.djangoproject.com/en/5.2/ref/models/querysets/#bulk-create
+- Executing custom SQL directly: https://docs.djangoproject.com/en/5.2/topics/db/sql/#executing-custom-sql-directly
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+from django.db import connection, transaction
+from django.db.models import F, Sum
+
+from am_module.models.model_am_modeling import BlendedOutcomeModel
+from core.models import ChartOfAccounts, GeneralLedgerEntries, LLCashFlowSeries, LLTransactionSummary
+from core.models.model_co_realizedTransactions import (
+    CASH_FLOW_EXPENSE_FIELDS,
+    CASH_FLOW_INCOME_FIELDS,
+    TRANSACTION_SUMMARY_TOTALS,
+)
+
+logger = logging.getLogger(__name__)
+
+CASH_FLOW_BATCH_SIZE = 1000
+
+SERIES_FIELDS = CASH_FLOW_INCOME_FIELDS + CASH_FLOW_EXPENSE_FIELDS
+
+# WHAT: LLTransactionSummary fields fed from GL (everything except the computed subtotals)
+SUMMARY_TOTAL_FIELDS = tuple(total for total, _parts in TRANSACTION_SUMMARY_TOTALS)
+SUMMARY_FIELDS = tuple(
+    f.name for f in LLTransactionSummary._meta.concrete_fields
+    if f.name.endswith('_realized') and f.name not in SUMMARY_TOTAL_FIELDS
+)
+SUMMARY_INCOME_FIELDS = frozenset(
+    name for name in SUMMARY_FIELDS
+    if name.startswith('income_') or name.endswith('liquidation_proceeds_realized')
+)
+
+# WHAT: Summary names whose series field is not derivable from the name
+_SUMMARY_TO_SERIES_OVERRIDES = {
+    'gross_liquidation_proceeds_realized': 'proceeds',
+}
+
+
+def series_field_for(reference: Optional[str]) -> Optional[str]:
+    """
+    WHAT: LLCashFlowSeries field for a ChartOfAccounts.transaction_table_reference
+    WHY: References may name either the series field or the LLTransactionSummary one
+    HOW: Series names pass through; `<x>_realized` / `expense_<x>_realized` resolve to
+         `<x>` or `<x>_expenses`; anything else (e.g. expense_other_realized) is None
+    """
+    name = (reference or '').strip()
+    if name in SERIES_FIELDS:
+        return name
+    if name in _SUMMARY_TO_SERIES_OVERRIDES:
+        return _SUMMARY_TO_SERIES_OVERRIDES[name]
+    if not name.endswith('_realized'):
+        return None
+    stem = name[:-len('_realized')]
+    if stem.startswith('expense_'):
+        stem = stem[len('expense_'):]
+    for candidate in (stem, f'{stem}_expenses'):
+        if candidate in SERIES_FIELDS:
+            return candidate
+    return None
+
+
+# WHAT: Series field -> LLTransactionSummary field (the inverse of series_field_for)
+SERIES_TO_SUMMARY = {
+    series_field_for(name): name for name in SUMMARY_FIELDS if series_field_for(name)
+}
+
+
+def summary_field_for(reference: Optional[str]) -> Optional[str]:
+    """LLTransactionSummary field for a transaction_table_reference (None when unmapped)."""
+    name = (reference or '').strip()
+    if name in SUMMARY_FIELDS:
+        return name
+    return SERIES_TO_SUMMARY.get(name)
+
+
+@dataclass
+class CashFlowRebuildResult:
+    """Counts of one rebuild run."""
+
+    hubs: int = 0
+    series_deleted: int = 0
+    series_created: int = 0
+    summaries_written: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            'hubs': self.hubs,
+            'series_deleted': self.series_deleted,
+            'series_created': self.series_created,
+            'summaries_written': self.summaries_written,
+        }
+
+
+# ------------------------------
+# Loading
+# ------------------------------
+
+def load_gl_cash_flows(hub_ids: Optional[Iterable[int]] = None) -> pd.DataFrame:
+    """
+    WHAT: Net GL activity per (hub, posting date, account) for mapped accounts
+    HOW: One ChartOfAccounts query and one grouped GeneralLedgerEntries query
+
+    RETURNS: DataFrame[asset_hub_id, posting_date (datetime64), account_number,
+             reference, net_cents (int64, debit - credit)]
+    """
+    references = dict(
+        ChartOfAccounts.objects
+        .exclude(transaction_table_reference__isnull=True)
+        .exclude(transaction_table_reference='')
+        .values_list('account_number', 'transaction_table_reference')
+    )
+    columns = ['asset_hub_id', 'posting_date', 'account_number', 'reference', 'net_cents']
+    if not references:
+        return pd.DataFrame(columns=columns)
+
+    entries = GeneralLedgerEntries.objects.filter(
+        asset_hub__isnull=False,
+        account_number__in=list(references),
+    )
+    if hub_ids is not None:
+        entries = entries.filter(asset_hub_id__in=list(hub_ids))
+    rows = list(
+        entries
+        .order_by()
+        .values('asset_hub_id', 'posting_date', 'account_number')
+        .annotate(net=Sum(F('debit_amount') - F('credit_amount')))
+        .values_list('asset_hub_id', 'posting_date', 'account_number', 'net')
+    )
+    if not rows:
+        return pd.DataFrame(columns=columns)
+
+    hubs, posted, accounts, nets = zip(*rows)
+    df = pd.DataFrame({
+        'asset_hub_id': np.asarray(hubs, dtype=np.int64),
+        'posting_date': pd.to_datetime(list(posted)),
+        'account_number': list(accounts),
+    })
+    df['reference'] = df['account_number'].map(references)
+    # WHAT: Exact Decimal -> cents (one conversion per grouped row, not per GL line)
+    df['net_cents'] = np.asarray([int(Decimal(net or 0).scaleb(2)) for net in nets], dtype=np.int64)
+    return df[columns]
+
+
+def load_mapped_summary_fields() -> List[str]:
+    """LLTransactionSummary fields some ChartOfAccounts.transaction_table_reference feeds."""
+    references = (
+        ChartOfAccounts.objects
+        .exclude(transaction_table_reference__isnull=True)
+        .exclude(transaction_table_reference='')
+        .values_list('transaction_table_reference', flat=True)
+        .distinct()
+    )
+    mapped = {summary_field_for(reference) for reference in references}
+    return [name for name in SUMMARY_FIELDS if name in mapped]
+
+
+def load_purchase_dates(hub_ids: Iterable[int]) -> pd.Series:
+    """BlendedOutcomeModel.purchase_date per hub (datetime64, hubs without one omitted)."""
+    rows = list(
+        BlendedOutcomeModel.objects
+        .filter(asset_hub_id__in=list(hub_ids), purchase_date__isnull=False)
+        .values_list('asset_hub_id', 'purchase_date')
+    )
+    if not rows:
+        return pd.Series(dtype='datetime64[ns]')
+    hubs, dates = zip(*rows)
+    return pd.Series(pd.to_datetime(list(dates)), index=pd.Index(hubs, name='asset_hub_id'))
+
+
+# ------------------------------
+# Vectorized build
+# ------------------------------
+
+def _month_index(dates: pd.Series) -> np.ndarray:
+    return (dates.dt.year * 12 + dates.dt.month - 1).to_numpy(dtype=np.int64)
+
+
+def _period_dates(anchor: pd.Series, period_numbers: np.ndarray) -> pd.Series:
+    """anchor + n months per row, clamping the day to the target month (as relativedelta)."""
+    target = _month_index(anchor) + period_numbers
+    firsts = pd.to_datetime(pd.DataFrame({'year': target // 12, 'month': target % 12 + 1, 'day': 1}))
+    day = np.minimum(anchor.dt.day.to_numpy(), firsts.dt.days_in_month.to_numpy())
+    return firsts + pd.to_timedelta(day - 1, unit='D')
+
+
+def build_series_frame(gl: pd.DataFrame, purchase_dates: Optional[pd.Series] = None) -> pd.DataFrame:
+    """
+    WHAT: The (hub, period) x line-item matrix with totals and period dates
+    WHY: Everything LLCashFlowSeries.save() computes, for every row at once
+
+    ARGS:
+        gl: Output of load_gl_cash_flows
+        purchase_dates: Output of load_purchase_dates (period 0 anchor per hub)
+
+    RETURNS: DataFrame[asset_hub_id, period_number, period_date, *SERIES_FIELDS,
+             total_income, total_expenses, net_cash_flow]; amounts in int64 cents
+    """
+    columns = ['asset_hub_id', 'period_number', 'period_date', *SERIES_FIELDS,
+               'total_income', 'total_expenses', 'net_cash_flow']
+    df = gl.assign(field=gl['reference'].map(series_field_for)).dropna(subset=['field'])
+    if df.empty:
+        return pd.DataFrame(columns=columns)
+
+    income = df['field'].isin(CASH_FLOW_INCOME_FIELDS).to_numpy()
+    df = df.assign(cents=np.where(income, -df['net_cents'], df['net_cents']))
+
+    # WHAT: Period 0 anchor - purchase date, else the hub's first posting
+    first_posting = df.groupby('asset_hub_id')['posting_date'].min()
+    anchors = first_posting.copy()
+    if purchase_dates is not None and len(purchase_dates):
+        known = purchase_dates.reindex(anchors.index).dropna()
+        anchors.loc[known.index] = known
+    anchor = df['asset_hub_id'].map(anchors)
+
+    # WHAT: Largest n with anchor + n months <= posting date (relativedelta clamps the day)
+    posted = df['posting_date']
+    months = _month_index(posted) - _month_index(anchor)
+    before_anchor_day = posted.dt.day.to_numpy() < np.minimum(anchor.dt.day.to_numpy(), posted.dt.days_in_month.to_numpy())
+    df['period_number'] = np.maximum(months - before_anchor_day, 0)
+
+    matrix = df.pivot_table(
+        index=['asset_hub_id', 'period_number'], columns='field', values='cents',
+        aggfunc='sum', fill_value=0,
+    ).reindex(columns=list(SERIES_FIELDS), fill_value=0)
+
+    # WHAT: Dense periods 0..last per hub so the series is a regular monthly time series
+    last = matrix.index.to_frame(index=False).groupby('asset_hub_id')['period_number'].max()
+    dense = pd.MultiIndex.from_arrays(
+        [np.repeat(last.index.to_numpy(), last.to_numpy() + 1),
+         np.concatenate([np.arange(n + 1) for n in last.to_numpy()])],
+        names=['asset_hub_id', 'period_number'],
+    )
+    matrix = matrix.reindex(dense, fill_value=0).astype(np.int64)
+
+    matrix['total_income'] = matrix[list(CASH_FLOW_INCOME_FIELDS)].sum(axis=1)
+    matrix['total_expenses'] = matrix[list(CASH_FLOW_EXPENSE_FIELDS)].sum(axis=1)
+    matrix['net_cash_flow'] = matrix['total_income'] - matrix['total_expenses']
+
+    out = matrix.reset_index()
+    out['period_date'] = _period_dates(
+        out['asset_hub_id'].map(anchors), out['period_number'].to_numpy(dtype=np.int64),
+    ).to_numpy()
+    return out[columns]
+
+
+def build_summary_frame(gl: pd.DataFrame) -> pd.DataFrame:
+    """
+    WHAT: Realized GL totals per hub in LLTransactionSummary field names
+    RETURNS: DataFrame indexed by asset_hub_id, one int64 cents column per mapped field
+    """
+    df = gl.assign(field=gl['reference'].map(summary_field_for)).dropna(subset=['field'])
+    if df.empty:
+        return pd.DataFrame(index=pd.Index([], name='asset_hub_id'))
+    income = df['field'].isin(SUMMARY_INCOME_FIELDS).to_numpy()
+    df = df.assign(cents=np.where(income, -df['net_cents'], df['net_cents']))
+    return df.pivot_table(index='asset_hub_id', columns='field', values='cents', aggfunc='sum', fill_value=0)
+
+
+def apply_summary_totals(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    WHAT: LLTransactionSummary subtotals as vectorized columns (same rules as save())
+    HOW: TRANSACTION_SUMMARY_TOTALS is in dependency order; missing parts count as 0
+    """
+    for total, parts in TRANSACTION_SUMMARY_TOTALS:
+        frame[total] = frame.reindex(columns=list(parts)).fillna(0).sum(axis=1).astype(np.int64)
+    return frame
+
+
+# ------------------------------
+# Writing
+# ------------------------------
+
+def _cents_to_decimal(cents: Any) -> Decimal:
+    return Decimal(int(cents)).scaleb(-2)
+
+
+def _series_objects(frame: pd.DataFrame) -> List[LLCashFlowSeries]:
+    if frame.empty:
+        return []
+    amount_columns = [*SERIES_FIELDS, 'total_income', 'total_expenses', 'net_cash_flow']
+    hubs = frame['asset_hub_id'].to_numpy()
+    periods = frame['period_number'].to_numpy()
+    dates = frame['period_date'].dt.date.to_numpy()
+    amounts = frame[amount_columns].to_numpy(dtype=np.int64)
+    return [
+        LLCashFlowSeries(
+            asset_hub_id=int(hubs[i]),
+            period_number=int(periods[i]),
+            period_date=dates[i],
+            **{column: _cents_to_decimal(amounts[i, j]) for j, column in enumerate(amount_columns)},
+        )
+        for i in range(len(frame))
+    ]
+
+
+def _write_summaries(
+    summary: pd.DataFrame,
+    mapped_fields: Iterable[str],
+    hub_ids: Optional[List[int]],
+    batch_size: int,
+) -> int:
+    """
+    WHAT: Upsert LLTransactionSummary rows for the rebuilt hubs
+    WHY: Realized fields without a mapped account (e.g. CSV backfills) must survive, while
+         a rebuilt hub whose GL activity went away must not keep its old GL totals
+    HOW: Existing rows are read once; GL-mapped columns are overwritten (0 when the hub has
+         no activity), totals are recomputed. Hubs with activity but no summary get one;
+         hubs without either are left alone
+
+    ARGS:
+        summary: Output of build_summary_frame
+        mapped_fields: Output of load_mapped_summary_fields
+        hub_ids: The rebuild scope (None = every hub)
+    """
+    gl_fields = [name for name in SUMMARY_FIELDS if name in set(mapped_fields) or name in summary.columns]
+    if not gl_fields:
+        return 0
+    kept_fields = [name for name in SUMMARY_FIELDS if name not in gl_fields]
+    existing = LLTransactionSummary.objects.all()
+    if hub_ids is not None:
+        existing = existing.filter(asset_hub_id__in=hub_ids)
+    existing = pd.DataFrame.from_records(
+        list(existing.values('asset_hub_id', *kept_fields)),
+        columns=['asset_hub_id', *kept_fields],
+    ).set_index('asset_hub_id')
+
+    hubs = sorted(set(summary.index.tolist()) | set(existing.index.tolist()))
+    if not hubs:
+        return 0
+    frame = summary.reindex(index=pd.Index(hubs, name='asset_hub_id'), columns=gl_fields, fill_value=0).astype(np.int64)
+    # WHAT: Preserve non-GL columns as nullable cents; NULL stays NULL (save() treats it as 0)
+    kept = existing.reindex(frame.index)
+    for name in kept_fields:
+        cents = [int(v.scaleb(2)) if isinstance(v, Decimal) else None for v in kept[name].tolist()]
+        frame[name] = pd.array(cents, dtype='Int64')
+    frame = apply_summary_totals(frame)
+
+    objects = []
+    for hub_id, row in zip(frame.index.tolist(), frame.to_dict('records')):
+        values = {
+            name: (None if pd.isna(value) else _cents_to_decimal(value))
+            for name, value in row.items()
+        }
+        objects.append(LLTransactionSummary(asset_hub_id=int(hub_id), **values))
+    LLTransactionSummary.objects.bulk_create(
+        objects,
+        batch_size=batch_size,
+        update_conflicts=True,
+        unique_fields=['asset_hub'],
+        update_fields=[*gl_fields, *SUMMARY_TOTAL_FIELDS, 'last_updated'],
+    )
+    return len(objects)
+
+
+def _delete_series(hub_ids: Optional[List[int]]) -> int:
+    """
+    WHAT: Delete the series rows being replaced in one statement
+    WHY: QuerySet.delete() loads every row to send post_delete, and each of those signals
+         bumps the reporting cash-flow tag; the rebuild bumps it once on commit instead
+    HOW: Raw SQL DELETE - nothing references LLCashFlowSeries, so no cascade is skipped
+    """
+    table = connection.ops.quote_name(LLCashFlowSeries._meta.db_table)
+    with connection.cursor() as cursor:
+        if hub_ids is None:
+            cursor.execute(f'DELETE FROM {table}')
+        else:
+            column = connection.ops.quote_name(LLCashFlowSeries._meta.get_field('asset_hub').column)
+            cursor.execute(f'DELETE FROM {table} WHERE {column} = ANY(%s)', [hub_ids])
+        return cursor.rowcount
+
+
+def _invalidate_cash_flow_reports() -> None:
+    try:
+        from reporting.services.serv_rep_cache import invalidate_tags, TAG_CASH_FLOWS
+
+        invalidate_tags(TAG_CASH_FLOWS)
+    except Exception as exc:
+        logger.warning(f"Cash flow cache invalidation failed: {exc}")
+
+
+def rebuild_cash_flow_series(
+    hub_ids: Optional[Iterable[int]] = None,
+    summaries: bool = True,
+    batch_size: int = CASH_FLOW_BATCH_SIZE,
+) -> CashFlowRebuildResult:
+    """
+    WHAT: Replace the LLCashFlowSeries of the given hubs from their GL entries
+    WHY: One grouped read and a handful of bulk writes instead of a save() per period
+
+    ARGS:
+        hub_ids: AssetIdHub ids to rebuild (default: the whole table); hubs without
+                 mapped GL activity lose their series and their GL-mapped summary fields
+        summaries: Also upsert LLTransactionSummary realized fields and totals
+        batch_size: bulk_create batch size
+
+    RETURNS: CashFlowRebuildResult
+    """
+    scope = None if hub_ids is None else sorted({int(hub_id) for hub_id in hub_ids})
+    gl = load_gl_cash_flows(scope)
+    target = scope if scope is not None else sorted(gl['asset_hub_id'].unique().tolist())
+    series = build_series_frame(gl, load_purchase_dates(target))
+    objects = _series_objects(series)
+    result = CashFlowRebuildResult(hubs=len(target))
+
+    mapped_fields = load_mapped_summary_fields() if summaries else []
+
+    with transaction.atomic():
+        result.series_deleted = _delete_series(scope)
+        LLCashFlowSeries.objects.bulk_create(objects, batch_size=batch_size)
+        result.series_created = len(objects)
+        if summaries:
+            result.summaries_written = _write_summaries(build_summary_frame(gl), mapped_fields, scope, batch_size)
+        transaction.on_commit(_invalidate_cash_flow_reports)
+
+    logger.info(f"Rebuilt cash flow series: {result.as_dict()}")
+    return result
@@ -0,0 +1,359 @@
+"""
+Portfolio NOI / cap-rate analytics for commercial properties.
+
+WHAT: HistoricalPropertyCashFlow metrics (vacancy loss, EGI, opex, NOI, OER, cap rate) for
+      every property-year in scope, trailing / rolling views per property, and unit mix /
+      rent roll rollups - as columnar frames
+WHY: The model helpers work one row at a time (cap_rate() also runs a Valuation query per
+     row) and UnitMix / RentRoll totals are per-instance methods; portfolio screens
+     iterated hundreds of property-years
+HOW: - load_cash_flow_frame(): one query; the latest Valuation as-is value is a
+       correlated subquery (latest_asis_value_subquery)
+     - cash_flow_metrics(): the model formulas as vectorized integer-cent columns
+       (vacancy loss rounds half-even like Decimal.quantize)
+     - add_trailing_metrics(): per-property YoY NOI growth and 3-year rolling averages
+       over a dense asset x year pivot (a missing year breaks YoY, not the window)
+     - unit_mix_rollup() / rent_roll_rollup(): one grouped query / one fetch each
+     - build_commercial_analytics(): latest reported year per property ("T12" - rows
+       are annual), rollups joined, portfolio totals
+     - get_commercial_analytics() caches in SharedCache('commercial_analytics');
+       core.signals drops the namespace after commit on cash flow / unit mix /
+       rent roll / valuation edits
+
+Docs reviewed:
+- Subquery / OuterRef: https://docs.djangoproject.com/en/5.2/ref/models/expressions/#subquery-expressions
+- DataFrame.rolling: https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.rolling.html
+- DataFrame.pivot: https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.pivot.html
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+from django.db.models import DecimalField, ExpressionWrapper, F, IntegerField, OuterRef, Subquery, Sum
+
+from core.models import HistoricalPropertyCashFlow, RentRoll, UnitMix, Valuation
+from core.models.propertycfs import OPERATING_EXPENSE_FIELDS, UTILITY_EXPENSE_FIELDS
+from core.services.serv_co_cache import SharedCache
+
+_analytics_cache = SharedCache('commercial_analytics', ttl=60 * 60, local_maxsize=16)
+
+INCOME_FIELDS = ('gross_potential_rent_revenue', 'cam_income', 'other_income')
+AMOUNT_FIELDS = (*INCOME_FIELDS, *OPERATING_EXPENSE_FIELDS)
+
+# WHAT: Property-year metrics (names match the HistoricalPropertyCashFlow helpers)
+CASH_FLOW_METRICS = (
+    'gross_potential_rent_revenue', 'vacancy_loss', 'effective_gross_rent_revenue',
+    'cam_income', 'other_income', 'effective_gross_income',
+    'total_utilities', 'total_operating_expenses', 'net_operating_income',
+    'operating_expense_ratio', 'asis_value', 'cap_rate',
+)
+ROLLING_WINDOW_YEARS = 3
+
+# WHAT: Latest-year columns summed into the portfolio total
+TOTAL_COLUMNS = (
+    'gross_potential_rent_revenue', 'vacancy_loss', 'effective_gross_income',
+    'total_operating_expenses', 'net_operating_income',
+    'units', 'unit_mix_annual_rent', 'rent_roll_units', 'occupied_units',
+    'leased_sqft', 'rent_roll_annual_rent', 'annual_cam',
+)
+
+
+def latest_asis_value_subquery() -> Subquery:
+    """As-is value of the hub's latest Valuation (same ordering as HistoricalPropertyCashFlow.cap_rate())."""
+    return Subquery(
+        Valuation.objects
+        .filter(asset_hub_id=OuterRef('asset_hub_id'))
+        .order_by('-value_date', '-id')
+        .values('asis_value')[:1],
+        output_field=DecimalField(max_digits=15, decimal_places=2),
+    )
+
+
+# ------------------------------
+# Loading
+# ------------------------------
+
+def load_cash_flow_frame(hub_ids: Optional[Iterable[int]] = None) -> pd.DataFrame:
+    """
+    WHAT: Raw HistoricalPropertyCashFlow inputs for the hubs in scope (all when None)
+
+    RETURNS: DataFrame with asset_hub_id, year, the amount fields, vacancy_pct and
+             asis_value (float64, NaN for NULL)
+    """
+    qs = HistoricalPropertyCashFlow.objects.all()
+    if hub_ids is not None:
+        qs = qs.filter(asset_hub_id__in=list(hub_ids))
+    rows = qs.order_by('asset_hub_id', 'year').values(
+        'asset_hub_id', 'year', *AMOUNT_FIELDS, 'vacancy_pct', asis_value=latest_asis_value_subquery(),
+    )
+    df = pd.DataFrame.from_records(list(rows))
+    if df.empty:
+        return df
+    numeric = [*AMOUNT_FIELDS, 'vacancy_pct', 'asis_value']
+    df[numeric] = df[numeric].apply(pd.to_numeric, errors='coerce').astype(np.float64)
+    return df
+
+
+def _cents(series: pd.Series) -> np.ndarray:
+    """Dollars (NaN as 0) -> int64 cents; exact for 2-decimal amounts."""
+    return np.rint(series.fillna(0).to_numpy(np.float64) * 100).astype(np.int64)
+
+
+def _divide_half_even(numerator: np.ndarray, denominator: int) -> np.ndarray:
+    """Integer division rounded half-to-even (Decimal.quantize's default rounding)."""
+    quotient, remainder = np.divmod(numerator, denominator)
+    twice = 2 * remainder
+    return quotient + ((twice > denominator) | ((twice == denominator) & (quotient % 2 == 1)))
+
+
+# ------------------------------
+# Vectorized metrics
+# ------------------------------
+
+def cash_flow_metrics(inputs: pd.DataFrame) -> pd.DataFrame:
+    """
+    WHAT: CASH_FLOW_METRICS for every property-year row
+    HOW: Same formulas as the model helpers, on integer cents:
+         vacancy_loss = GPR x vacancy_pct / 100 (rounded to the cent),
+         EGI = GPR - vacancy_loss + other + CAM, NOI = EGI - opex,
+         OER = opex / EGI x 100 (0 when EGI <= 0), cap_rate = NOI / as-is value x 100
+         (None without a positive value - the model reports 0.00)
+
+    RETURNS: DataFrame (asset_hub_id, year, *CASH_FLOW_METRICS) in dollars / percent
+    """
+    if inputs.empty:
+        return pd.DataFrame(columns=['asset_hub_id', 'year', *CASH_FLOW_METRICS])
+
+    gpr = _cents(inputs['gross_potential_rent_revenue'])
+    vacancy_bps = np.rint(inputs['vacancy_pct'].fillna(0).to_numpy(np.float64) * 100).astype(np.int64)
+    vacancy_loss = _divide_half_even(gpr * vacancy_bps, 10000)
+    effective_rent = gpr - vacancy_loss
+    cam = _cents(inputs['cam_income'])
+    other = _cents(inputs['other_income'])
+    egi = effective_rent + other + cam
+    utilities = sum(_cents(inputs[name]) for name in UTILITY_EXPENSE_FIELDS)
+    opex = sum(_cents(inputs[name]) for name in OPERATING_EXPENSE_FIELDS)
+    noi = egi - opex
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        oer = np.where(egi > 0, opex / np.where(egi > 0, egi, 1) * 100, 0.0)
+        value = inputs['asis_value'].to_numpy(np.float64)
+        cap_rate = np.where(value > 0, (noi / 100) / np.where(value > 0, value, 1) * 100, np.nan)
+
+    return pd.DataFrame({
+        'asset_hub_id': inputs['asset_hub_id'].to_numpy(),
+        'year': inputs['year'].to_numpy(),
+        'gross_potential_rent_revenue': gpr / 100,
+        'vacancy_loss': vacancy_loss / 100,
+        'effective_gross_rent_revenue': effective_rent / 100,
+        'cam_income': cam / 100,
+        'other_income': other / 100,
+        'effective_gross_income': egi / 100,
+        'total_utilities': utilities / 100,
+        'total_operating_expenses': opex / 100,
+        'net_operating_income': noi / 100,
+        'operating_expense_ratio': oer,
+        'asis_value': value,
+        'cap_rate': cap_rate,
+    })
+
+
+def _year_pivot(metrics: pd.DataFrame, column: str) -> pd.DataFrame:
+    """asset_hub_id x year pivot of ``column`` with every year between the first and last present."""
+    pivot = metrics.pivot(index='asset_hub_id', columns='year', values=column)
+    return pivot.reindex(columns=range(int(pivot.columns.min()), int(pivot.columns.max()) + 1))
+
+
+def add_trailing_metrics(metrics: pd.DataFrame, window: int = ROLLING_WINDOW_YEARS) -> pd.DataFrame:
+    """
+    WHAT: noi_growth_pct (vs the prior calendar year) and <window>-year rolling averages
+          of NOI / EGI / opex per property
+    HOW: Dense year pivots so a missing year yields no growth figure and shortens the
+         rolling window instead of reaching back past it
+    """
+    metrics = metrics.copy()
+    if metrics.empty:
+        for column in ('noi_growth_pct', 'noi_rolling_avg', 'egi_rolling_avg', 'opex_rolling_avg'):
+            metrics[column] = pd.Series(dtype=np.float64)
+        return metrics
+
+    noi = _year_pivot(metrics, 'net_operating_income')
+    rows = noi.index.get_indexer(metrics['asset_hub_id'])
+    cols = noi.columns.get_indexer(metrics['year'])
+
+    def _lookup(pivot: pd.DataFrame) -> np.ndarray:
+        return pivot.to_numpy(np.float64)[rows, cols]
+
+    prior = noi.shift(1, axis=1)
+    growth = (noi - prior) / prior.abs().where(prior != 0) * 100
+    metrics['noi_growth_pct'] = _lookup(growth)
+    for column, name in (
+        ('net_operating_income', 'noi_rolling_avg'),
+        ('effective_gross_income', 'egi_rolling_avg'),
+        ('total_operating_expenses', 'opex_rolling_avg'),
+    ):
+        pivot = _year_pivot(metrics, column)
+        metrics[name] = _lookup(pivot.T.rolling(window, min_periods=1).mean().T)
+    return metrics
+
+
+# ------------------------------
+# Unit mix / rent roll
+# ------------------------------
+
+def unit_mix_rollup(hub_ids: Optional[Iterable[int]] = None) -> pd.DataFrame:
+    """
+    WHAT: Units, square footage and rent per property from UnitMix
+    HOW: One grouped query; the same unit_count x unit_avg_* products as
+         UnitMix.get_total_sqft() / get_total_monthly_rent()
+    """
+    qs = UnitMix.objects.all()
+    if hub_ids is not None:
+        qs = qs.filter(asset_hub_id_id__in=list(hub_ids))
+    rows = (
+        qs.order_by()
+        .values('asset_hub_id_id')
+        .annotate(
+            units=Sum('unit_count'),
+            unit_sqft=Sum(ExpressionWrapper(F('unit_count') * F('unit_avg_sqft'), output_field=IntegerField())),
+            unit_mix_monthly_rent=Sum(ExpressionWrapper(
+                F('unit_count') * F('unit_avg_rent'), output_field=DecimalField(max_digits=14, decimal_places=2),
+            )),
+        )
+    )
+    df = pd.DataFrame.from_records(list(rows), columns=['asset_hub_id_id', 'units', 'unit_sqft', 'unit_mix_monthly_rent'])
+    df = df.rename(columns={'asset_hub_id_id': 'asset_hub_id'}).set_index('asset_hub_id').astype(np.float64)
+    df['unit_mix_annual_rent'] = df['unit_mix_monthly_rent'] * 12
+    df['unit_mix_rent_per_sqft'] = df['unit_mix_monthly_rent'] / df['unit_sqft'].where(df['unit_sqft'] > 0)
+    return df
+
+
+def rent_roll_rollup(hub_ids: Optional[Iterable[int]] = None, as_of: Optional[date] = None) -> pd.DataFrame:
+    """
+    WHAT: Occupancy, rent, CAM and lease expiry profile per property from RentRoll
+    HOW: One fetch, groupby sums. A unit is occupied when it has a tenant name;
+         walt_years is the rent-weighted average remaining term of leases with an end
+         date; expiring_12m_pct is the share of monthly rent on leases ending within a
+         year of ``as_of``
+    """
+    as_of = as_of or date.today()
+    qs = RentRoll.objects.all()
+    if hub_ids is not None:
+        qs = qs.filter(asset_hub_id_id__in=list(hub_ids))
+    columns = ['asset_hub_id_id', 'tenant_name', 'sq_feet', 'rent', 'cam_month', 'lease_end_date']
+    df = pd.DataFrame.from_records(list(qs.order_by().values(*columns)), columns=columns)
+    df = df.rename(columns={'asset_hub_id_id': 'asset_hub_id'})
+
+    rent = pd.to_numeric(df['rent'], errors='coerce').fillna(0).astype(np.float64)
+    sqft = pd.to_numeric(df['sq_feet'], errors='coerce').fillna(0).astype(np.float64)
+    occupied = df['tenant_name'].fillna('').astype(str).str.strip() != ''
+    end = pd.to_datetime(df['lease_end_date'], errors='coerce')
+    remaining_years = ((end - pd.Timestamp(as_of)).dt.days / 365.25).clip(lower=0)
+    has_term = remaining_years.notna() & (rent > 0)
+
+    parts = pd.DataFrame({
+        'asset_hub_id': df['asset_hub_id'],
+        'rent_roll_units': 1,
+        'occupied_units': occupied.astype(np.int64),
+        'leased_sqft': sqft.where(occupied, 0),
+        'rent_roll_monthly_rent': rent,
+        'annual_cam': pd.to_numeric(df['cam_month'], errors='coerce').fillna(0).astype(np.float64) * 12,
+        '_rent_sqft': sqft.where(rent > 0, 0),
+        '_term_rent': rent.where(has_term, 0),
+        '_term_weighted': (remaining_years * rent).where(has_term, 0),
+        '_expiring_rent': rent.where(end.notna() & (remaining_years <= 1), 0),
+    })
+    grouped = parts.groupby('asset_hub_id').sum().astype(np.float64)
+    grouped['occupancy_pct'] = grouped['occupied_units'] / grouped['rent_roll_units'] * 100
+    grouped['rent_roll_annual_rent'] = grouped['rent_roll_monthly_rent'] * 12
+    grouped['rent_roll_rent_per_sqft'] = grouped['rent_roll_monthly_rent'] / grouped.pop('_rent_sqft').where(lambda s: s > 0)
+    grouped['walt_years'] = grouped.pop('_term_weighted') / grouped.pop('_term_rent').where(lambda s: s > 0)
+    rent_total = grouped['rent_roll_monthly_rent'].where(grouped['rent_roll_monthly_rent'] > 0)
+    grouped['expiring_12m_pct'] = grouped.pop('_expiring_rent') / rent_total * 100
+    return grouped
+
+
+# ------------------------------
+# Table
+# ------------------------------
+
+def _records(frame: pd.DataFrame) -> List[Dict[str, Any]]:
+    """JSON-ready rows: amounts rounded to cents, NaN -> None."""
+    frame = frame.round(2).astype(object).where(frame.notna(), None)
+    return frame.to_dict('records')
+
+
+def build_commercial_analytics(
+    hub_ids: Optional[Iterable[int]] = None, include_years: bool = False, as_of: Optional[date] = None,
+) -> Dict[str, Any]:
+    """
+    WHAT: Per-property analytics for the latest reported year plus portfolio totals
+    HOW: Three queries (cash flows + valuations, unit mix, rent roll); everything else
+         is frame arithmetic
+
+    ARGS:
+        hub_ids: Properties to include (None: every hub with cash flows, unit mix or rent roll)
+        include_years: Also return every property-year with its trailing metrics
+        as_of: Reference date for lease expiry metrics (default today)
+
+    RETURNS:
+        {
+            'properties': [{'asset_hub_id', 'latest_year', *CASH_FLOW_METRICS, 'noi_growth_pct',
+                            'noi_rolling_avg', ..., unit mix and rent roll columns}],
+            'years': [...] (include_years only),
+            'total': {...} or None,
+        }
+    """
+    hub_ids = None if hub_ids is None else sorted(set(hub_ids))
+    metrics = add_trailing_metrics(cash_flow_metrics(load_cash_flow_frame(hub_ids)))
+    units = unit_mix_rollup(hub_ids)
+    rent_roll = rent_roll_rollup(hub_ids, as_of)
+
+    latest = metrics.sort_values(['asset_hub_id', 'year']).groupby('asset_hub_id').tail(1)
+    latest = latest.rename(columns={'year': 'latest_year'}).set_index('asset_hub_id')
+    properties = latest.join(units, how='outer').join(rent_roll, how='outer')
+    properties.index.name = 'asset_hub_id'
+    properties = properties.sort_index()
+    properties['latest_year'] = properties['latest_year'].astype('Int64')
+
+    result: Dict[str, Any] = {
+        'metrics': list(CASH_FLOW_METRICS),
+        'properties': _records(properties.reset_index()),
+        'total': None,
+    }
+    if include_years:
+        result['years'] = _records(metrics.sort_values(['asset_hub_id', 'year']))
+    if properties.empty:
+        return result
+
+    total = properties.reindex(columns=list(TOTAL_COLUMNS)).sum(min_count=1)
+    valued = properties['asis_value'] > 0
+    valued_noi = properties.loc[valued, 'net_operating_income'].sum(min_count=1)
+    valued_value = properties.loc[valued, 'asis_value'].sum(min_count=1)
+    total['property_count'] = len(properties)
+    total['asis_value'] = valued_value
+    total['cap_rate'] = valued_noi / valued_value * 100 if valued_value and valued_value > 0 else np.nan
+    egi = total['effective_gross_income']
+    total['operating_expense_ratio'] = total['total_operating_expenses'] / egi * 100 if egi and egi > 0 else np.nan
+    units_total = total['rent_roll_units']
+    total['occupancy_pct'] = total['occupied_units'] / units_total * 100 if units_total and units_total > 0 else np.nan
+    result['total'] = _records(total.to_frame().T)[0]
+    return result
+
+
+def get_commercial_analytics(
+    hub_ids: Optional[Iterable[int]] = None, include_years: bool = False,
+) -> Dict[str, Any]:
+    """Cached build_commercial_analytics (keyed per day, since lease expiry metrics use today)."""
+    hub_ids = None if hub_ids is None else tuple(sorted(set(hub_ids)))
+    today = date.today()
+    key = ('analytics', hub_ids, bool(include_years), today.isoformat())
+    return _analytics_cache.get_or_set(key, lambda: build_commercial_analytics(hub_ids, include_years, today))
+
+
+def invalidate_commercial_analytics() -> None:
+    _analytics_cache.invalidate()
@@ -0,0 +1,343 @@
+"""
+Foreclosure timeline matrix and bulk upserts for the assumptions screens.
+
+WHAT: Builds the states x statuses matrix served by FCTimelinesViewSet.matrix and
+      writes bulk edits / CSV imports as one upsert
+WHY: The matrix ran one FCTimelines query per status, and bulk_update,
+     bulk_set_status_duration and import_matrix_csv saved rows one at a time
+     (plus a StateReference/FCStatus lookup per CSV row)
+HOW: - build_fc_timeline_matrix(): three fetches (states, statuses, timeline values)
+       pivoted in memory; get_fc_timeline_matrix() caches the result in SharedCache
+     - Bulk paths validate every row first (FCTimelinesSerializer field rules,
+       state/status codes resolved from one fetch each) and report all errors;
+       valid input is written with one bulk_create(update_conflicts=True) on the
+       (state, fc_status) unique key inside a transaction
+     - bulk_create skips post_save, so the upsert invalidates the matrix cache and
+       the modeling FCTimelineTable itself after commit. Single-row saves are
+       covered by core.signals / acq_module.signals.
+
+Docs reviewed:
+- QuerySet.bulk_create(update_conflicts=...): https://docs.djangoproject.com/en/5.2/ref/models/querysets/#bulk-create
+- DRF serializer validation: https://www.django-rest-framework.org/api-guide/serializers/#validation
+- csv.DictReader: https://docs.python.org/3/library/csv.html#csv.DictReader
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.utils import timezone
+
+from core.models import FCStatus, FCTimelines, StateReference
+from core.serializers.serial_co_assumptions import FCTimelinesSerializer
+from core.services.serv_co_cache import SharedCache
+
+# Matrix payload for the assumptions screen (~50 states x ~9 statuses)
+_matrix_cache = SharedCache("fc_timeline_matrix", ttl=60 * 60, local_maxsize=4)
+_MATRIX_KEY = "matrix"
+
+# Columns rewritten when an upsert hits an existing (state, fc_status) row
+_UPSERT_FIELDS = ["duration_days", "cost_avg", "notes", "updated_at"]
+_UPSERT_BATCH_SIZE = 500
+
+
+class FCTimelineValidationError(Exception):
+    """Raised with the per-row error list when a bulk payload fails validation."""
+
+    def __init__(self, errors: List[Dict[str, Any]]):
+        super().__init__("Validation errors occurred")
+        self.errors = errors
+
+
+def _timeline_cell(row: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": row["id"],
+        "durationDays": row["duration_days"],
+        "costAvg": float(row["cost_avg"]) if row["cost_avg"] else None,
+        "notes": row["notes"] or "",
+    }
+
+
+def build_fc_timeline_matrix() -> Dict[str, Any]:
+    """Full states x statuses matrix from three queries (missing cells are placeholders).
+
+    Response format:
+    {"states": [..], "statuses": [{ id, status, statusDisplay, order, timelines: { AL: {...} } }],
+     "stateMeta": { AL: { name, judicial, typeDisplay } }}
+    """
+    states = list(
+        StateReference.objects.order_by("state_name").values_list("state_code", "state_name", "judicialvsnonjudicial")
+    )
+    state_codes = [code for code, _name, _judicial in states]
+    # Per-state metadata (e.g. Judicial vs Non-Judicial) so the UI can show a
+    # "State Type" row above the status rows without duplicating business logic.
+    state_meta = {
+        code: {
+            "name": name,
+            "judicial": bool(judicial),
+            "typeDisplay": "Judicial" if judicial else "Non-Judicial",
+        }
+        for code, name, judicial in states
+    }
+
+    # WHAT: One fetch pivoted to {fc_status_id: {state_code: cell}}
+    by_status: Dict[int, Dict[str, Dict[str, Any]]] = {}
+    for row in FCTimelines.objects.values("id", "state_id", "fc_status_id", "duration_days", "cost_avg", "notes"):
+        by_status.setdefault(row["fc_status_id"], {})[row["state_id"]] = _timeline_cell(row)
+
+    displays = dict(FCStatus.STATUS_CHOICES)
+    matrix_data = []
+    for status_id, code, order in FCStatus.objects.order_by("order").values_list("id", "status", "order"):
+        existing = by_status.get(status_id, {})
+        matrix_data.append({
+            "id": status_id,
+            "status": code,
+            "statusDisplay": displays.get(code, code),
+            "order": order,
+            "timelines": {
+                state_code: existing.get(state_code) or {
+                    "id": None,
+                    "durationDays": None,
+                    "costAvg": None,
+                    "notes": "",
+                    "stateCode": state_code,
+                    "statusId": status_id,
+                }
+                for state_code in state_codes
+            },
+        })
+
+    # Fallback: no FCStatus rows - use STATUS_CHOICES
+    if not matrix_data:
+        for idx, (code, display) in enumerate(FCStatus.STATUS_CHOICES, start=1):
+            matrix_data.append({
+                "id": None,
+                "status": code,
+                "statusDisplay": display,
+                "order": idx,
+                "timelines": {
+                    state_code: {
+                        "id": None,
+                        "durationDays": None,
+                        "costAvg": None,
+                        "notes": "",
+                        "stateCode": state_code,
+                        "statusId": None,
+                        "statusCode": code,
+                    }
+                    for state_code in state_codes
+                },
+            })
+
+    return {"states": state_codes, "statuses": matrix_data, "stateMeta": state_meta}
+
+
+def get_fc_timeline_matrix() -> Dict[str, Any]:
+    """Cached build_fc_timeline_matrix() (invalidated on any FC/state reference write)."""
+    return _matrix_cache.get_or_set(_MATRIX_KEY, build_fc_timeline_matrix)
+
+
+def invalidate_fc_matrix_cache() -> None:
+    _matrix_cache.invalidate()
+
+
+def invalidate_fc_timeline_caches() -> None:
+    """Drop the matrix cache and the modeling FCTimelineTable in every worker."""
+    from acq_module.logic.logi_acq_durationAssumptions import invalidate_fc_timeline_table
+
+    invalidate_fc_matrix_cache()
+    invalidate_fc_timeline_table()
+
+
+def upsert_fc_timelines(
+    timelines: Iterable[FCTimelines],
+    update_fields: Optional[List[str]] = None,
+) -> List[FCTimelines]:
+    """Insert or update rows on (state, fc_status) with one statement per batch.
+
+    ``update_fields`` limits the columns rewritten on existing rows (default:
+    duration_days, cost_avg, notes). Later rows win when the same (state, fc_status)
+    appears twice.
+    """
+    by_key: Dict[Tuple[str, int], FCTimelines] = {}
+    for timeline in timelines:
+        by_key[(timeline.state_id, timeline.fc_status_id)] = timeline
+    rows = list(by_key.values())
+    if not rows:
+        return rows
+    now = timezone.now()
+    # WHAT: Insert pk-less copies - a loaded row's id would collide on the primary key
+    #       instead of the (state, fc_status) conflict target
+    values = [
+        FCTimelines(
+            state_id=row.state_id,
+            fc_status_id=row.fc_status_id,
+            duration_days=row.duration_days,
+            cost_avg=row.cost_avg,
+            notes=row.notes,
+            updated_at=now,
+        )
+        for row in rows
+    ]
+    with transaction.atomic():
+        FCTimelines.objects.bulk_create(
+            values,
+            batch_size=_UPSERT_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=["state", "fc_status"],
+            update_fields=update_fields or _UPSERT_FIELDS,
+        )
+        transaction.on_commit(invalidate_fc_timeline_caches)
+    return rows
+
+
+def _validate_values(data: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """Apply FCTimelinesSerializer's field rules to a partial payload; returns (values, errors)."""
+    serializer = FCTimelinesSerializer(data=data, partial=True)
+    if not serializer.is_valid():
+        return {}, serializer.errors
+    values = {
+        field: serializer.validated_data[field]
+        for field in ("duration_days", "cost_avg", "notes")
+        if field in serializer.validated_data
+    }
+    return values, None
+
+
+def bulk_update_fc_timelines(payload: List[Dict[str, Any]]) -> List[FCTimelines]:
+    """Partial updates keyed by timeline id ({id, durationDays?, costAvg?, notes?}).
+
+    Raises FCTimelineValidationError listing every bad row; nothing is written then.
+    """
+    def _pk(row: Any) -> Optional[int]:
+        try:
+            return int(row.get("id"))
+        except (AttributeError, TypeError, ValueError):
+            return None
+
+    errors: List[Dict[str, Any]] = []
+    existing = FCTimelines.objects.select_related("state", "fc_status").in_bulk(
+        {pk for pk in map(_pk, payload) if pk}
+    )
+
+    updated: List[FCTimelines] = []
+    for row in payload:
+        timeline_id = row.get("id") if isinstance(row, dict) else None
+        if not timeline_id:
+            errors.append({"error": "Missing timeline id", "data": row})
+            continue
+        instance = existing.get(_pk(row))
+        if instance is None:
+            errors.append({"error": f"Timeline {timeline_id} not found", "timeline_id": timeline_id})
+            continue
+        values, row_errors = _validate_values(row)
+        if row_errors:
+            errors.append({"timeline_id": timeline_id, "errors": row_errors})
+            continue
+        for field, value in values.items():
+            setattr(instance, field, value)
+        updated.append(instance)
+
+    if errors:
+        raise FCTimelineValidationError(errors)
+    return upsert_fc_timelines(updated)
+
+
+def set_status_duration_for_states(fc_status: FCStatus, duration_days: int, *, create_missing: bool = True) -> Dict[str, int]:
+    """Set duration_days for one status across every state; returns {'updated', 'created'}."""
+    state_codes = StateReference.objects.values_list("state_code", flat=True)
+    existing = set(FCTimelines.objects.filter(fc_status=fc_status).values_list("state_id", flat=True))
+    rows = [
+        FCTimelines(state_id=state_code, fc_status=fc_status, duration_days=duration_days)
+        for state_code in state_codes
+        if create_missing or state_code in existing
+    ]
+    # WHAT: Existing rows keep their cost_avg/notes
+    upsert_fc_timelines(rows, update_fields=["duration_days", "updated_at"])
+    updated = sum(1 for row in rows if row.state_id in existing)
+    return {"updated": updated, "created": len(rows) - updated}
+
+
+def _resolve_statuses(codes: Iterable[str]) -> Tuple[Dict[str, FCStatus], List[str]]:
+    """Existing FCStatus rows by code; unknown-but-valid codes are created. Returns (map, unknown)."""
+    codes = set(codes)
+    statuses: Dict[str, FCStatus] = {}
+    for fc in FCStatus.objects.filter(status__in=codes).order_by("order", "id"):
+        # WHAT: First row per code wins, like FCStatus.objects.filter(status=code).first()
+        statuses.setdefault(fc.status, fc)
+    for idx, (code, display) in enumerate(FCStatus.STATUS_CHOICES, start=1):
+        if code in codes and code not in statuses:
+            statuses[code] = FCStatus.objects.create(
+                status=code,
+                order=idx,
+                notes=f"Autocreated from CSV import ({display})",
+            )
+    unknown = sorted(code for code in codes if code not in statuses)
+    return statuses, unknown
+
+
+def import_fc_matrix_rows(rows: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+    """Validate and upsert CSV matrix rows (matrix_csv format); returns {'created', 'updated'}.
+
+    Raises FCTimelineValidationError with {row, error, data} entries; nothing is written then.
+    """
+    parsed: List[Tuple[int, Dict[str, Any], str, str, Dict[str, Any]]] = []
+    errors: List[Dict[str, Any]] = []
+    for line_no, row in enumerate(rows, start=2):
+        state_code = (row.get("state_code") or "").strip()
+        status_code = (row.get("status_code") or "").strip()
+        if not state_code or not status_code:
+            errors.append({"row": line_no, "error": "Missing required state_code or status_code", "data": row})
+            continue
+        values, row_errors = _validate_values({
+            "durationDays": (row.get("duration_days") or "").strip() or None,
+            "costAvg": (row.get("cost_avg") or "").strip() or None,
+            "notes": (row.get("notes") or "").strip(),
+        })
+        if row_errors:
+            errors.append({"row": line_no, "error": str(row_errors), "data": row})
+            continue
+        parsed.append((line_no, row, state_code, status_code, values))
+
+    with transaction.atomic():
+        known_states = set(
+            StateReference.objects.filter(state_code__in={p[2] for p in parsed}).values_list("state_code", flat=True)
+        )
+        statuses, unknown_statuses = _resolve_statuses(p[3] for p in parsed)
+
+        timelines: List[FCTimelines] = []
+        for line_no, row, state_code, status_code, values in parsed:
+            if state_code not in known_states:
+                errors.append({"row": line_no, "error": f"Unknown state_code \"{state_code}\"", "data": row})
+            elif status_code in unknown_statuses:
+                errors.append({"row": line_no, "error": f"Unknown status_code \"{status_code}\"", "data": row})
+            else:
+                timelines.append(FCTimelines(state_id=state_code, fc_status=statuses[status_code], **values))
+
+        if errors:
+            errors.sort(key=lambda error: error["row"])
+            # WHAT: Raising inside atomic() also drops statuses autocreated for this file
+            raise FCTimelineValidationError(errors)
+
+        existing = set(
+            FCTimelines.objects
+            .filter(fc_status__in=[fc.pk for fc in statuses.values()], state_id__in=known_states)
+            .values_list("state_id", "fc_status_id")
+        )
+        written = upsert_fc_timelines(timelines)
+    updated = sum(1 for t in written if (t.state_id, t.fc_status_id) in existing)
+    return {"created": len(written) - updated, "updated": updated}
+
+
+__all__ = [
+    "FCTimelineValidationError",
+    "build_fc_timeline_matrix",
+    "bulk_update_fc_timelines",
+    "get_fc_timeline_matrix",
+    "import_fc_matrix_rows",
+    "invalidate_fc_matrix_cache",
+    "invalidate_fc_timeline_caches",
+    "set_status_duration_for_states",
+    "upsert_fc_timelines",
+]
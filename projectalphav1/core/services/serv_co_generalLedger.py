@@ -4,12 +4,20 @@ WHY: Centralize GL entry operations, filtering, and aggregate calculations
 HOW: Reusable service functions for views and background tasks
 WHERE: Imported by GL Entry views and management commands
 """
+import logging
+import threading
+from contextlib import contextmanager
+from django.db import connection, transaction
 from django.db.models import Q, Sum, Count, Min, Max
-from django.db.models.functions import Coalesce
+from django.db.models.functions import Coalesce, TruncMonth
 from decimal import Decimal
-from datetime import datetime, date
-from typing import Dict, List, Optional, Any
-from core.models import GeneralLedgerEntries, ChartOfAccounts
+from datetime import datetime, date, timedelta
+from typing import Dict, Iterable, List, Optional, Any
+from core.models import GeneralLedgerEntries, ChartOfAccounts, GeneralLedgerMonthlyRollup
+
+logger = logging.getLogger(__name__)
+
+_ROLLUP_BATCH = 1000
 
 
 # ------------------------------
@@ -160,204 +168,413 @@ def build_gl_entry_queryset(
     return queryset
 
 
+# ------------------------------
+# Dashboard Aggregates
+# ------------------------------
+# WHAT: Every dashboard block is a fold over the same grouped rows
+# WHY: summary, by-tag, by-bucket, by-account and monthly-trend each re-aggregated the
+#      full filtered entry set (the summary alone ran three aggregates)
+# HOW: get_gl_dashboard_rows() returns totals per (tag, bucket, account, month) - from
+#      GeneralLedgerMonthlyRollup when the filters allow it, else one grouped query over
+#      the filtered entries - and the _fold_* helpers build each block in Python
+
+# WHAT: Dashboard filter name -> rollup lookup (same lookups as GeneralLedgerEntriesFilter)
+ROLLUP_FILTER_LOOKUPS = {
+    'company_name': 'company_name__icontains',
+    'account_number': 'account_number__icontains',
+    'tag': 'tag',
+    'bucket': 'bucket',
+}
+
+_DASHBOARD_DIMENSIONS = ('tag', 'bucket', 'account_number', 'account_name', 'month')
+_ROLLUP_DIMENSIONS = ('company_name', 'account_number', 'account_name', 'tag', 'bucket', 'month')
+_ZERO = Decimal('0.00')
+
+
+def _entry_aggregates() -> Dict[str, Any]:
+    """Aggregates over GeneralLedgerEntries rows (one rollup row per group)."""
+    return {
+        'entry_count': Count('id'),
+        'review_count': Count('id', filter=Q(requires_review=True)),
+        'total_debits': Coalesce(Sum('debit_amount'), _ZERO),
+        'total_credits': Coalesce(Sum('credit_amount'), _ZERO),
+        'first_posting_date': Min('posting_date'),
+        'last_posting_date': Max('posting_date'),
+    }
+
+
+def _rollup_aggregates() -> Dict[str, Any]:
+    """The same aggregates re-combined over GeneralLedgerMonthlyRollup rows (never NULL per group)."""
+    return {
+        'entry_count': Sum('entry_count'),
+        'review_count': Sum('review_count'),
+        'total_debits': Sum('total_debits'),
+        'total_credits': Sum('total_credits'),
+        'first_posting_date': Min('first_posting_date'),
+        'last_posting_date': Max('last_posting_date'),
+    }
+
+
+def _month_start(value: date) -> date:
+    return value.replace(day=1)
+
+
+def _next_month(value: date) -> date:
+    return date(value.year + (value.month == 12), value.month % 12 + 1, 1)
+
+
+def gl_rollup_scope(filters: Dict[str, Any]) -> Optional[Q]:
+    """
+    WHAT: Translate dashboard filters into a GeneralLedgerMonthlyRollup filter
+    WHY: The rollup only answers filters on its own columns and whole posting months
+    HOW: Map each active filter; any other filter (search, loan, review flag, partial
+         month, ...) means entry-level data is needed
+
+    RETURNS: Q over the rollup, or None when the entries must be aggregated directly
+    """
+    scope = Q()
+    for name, value in filters.items():
+        if value in (None, ''):
+            continue
+        if name in ROLLUP_FILTER_LOOKUPS:
+            scope &= Q(**{ROLLUP_FILTER_LOOKUPS[name]: value})
+        elif name == 'posting_date_start' and value.day == 1:
+            scope &= Q(month__gte=value)
+        elif name == 'posting_date_end' and (value + timedelta(days=1)).day == 1:
+            scope &= Q(month__lte=_month_start(value))
+        else:
+            return None
+    return scope
+
+
+def get_gl_dashboard_rows(
+    queryset: Any,
+    filters: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    WHAT: GL totals grouped by (tag, bucket, account, month)
+    WHY: One query feeds every dashboard block
+    HOW: Read the rollup when ``filters`` (the active dashboard filters) map onto it,
+         otherwise group the already-filtered ``queryset``
+
+    PARAMETERS:
+        - queryset: Filtered QuerySet of GeneralLedgerEntries
+        - filters: Active filter values applied to ``queryset`` (None = entries only)
+
+    RETURNS: List of dicts with the dimensions, counts, amounts and posting date range
+    """
+    scope = gl_rollup_scope(filters) if filters is not None else None
+    if scope is not None:
+        rows = (
+            GeneralLedgerMonthlyRollup.objects.filter(scope)
+            .order_by()
+            .values(*_DASHBOARD_DIMENSIONS)
+            .annotate(**_rollup_aggregates())
+        )
+    else:
+        rows = (
+            queryset.order_by()
+            .annotate(month=TruncMonth('posting_date'))
+            .values(*_DASHBOARD_DIMENSIONS)
+            .annotate(**_entry_aggregates())
+        )
+    return list(rows)
+
+
+def _fold(rows: List[Dict[str, Any]], keys: tuple) -> List[Dict[str, Any]]:
+    """Sum count/debits/credits of ``rows`` per ``keys``; adds net_amount."""
+    groups: Dict[tuple, Dict[str, Any]] = {}
+    for row in rows:
+        key = tuple(row[k] for k in keys)
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = {
+                **{k: row[k] for k in keys},
+                'count': 0,
+                'total_debits': _ZERO,
+                'total_credits': _ZERO,
+            }
+        group['count'] += row['entry_count']
+        group['total_debits'] += row['total_debits']
+        group['total_credits'] += row['total_credits']
+    output = list(groups.values())
+    for item in output:
+        item['net_amount'] = item['total_debits'] - item['total_credits']
+    return output
+
+
+def _fold_summary(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    total_debits = sum((row['total_debits'] for row in rows), _ZERO)
+    total_credits = sum((row['total_credits'] for row in rows), _ZERO)
+    first_dates = [row['first_posting_date'] for row in rows if row['first_posting_date']]
+    last_dates = [row['last_posting_date'] for row in rows if row['last_posting_date']]
+
+    tag_counts = sorted(_fold(rows, ('tag',)), key=lambda item: -item['count'])
+    bucket_counts = sorted(_fold(rows, ('bucket',)), key=lambda item: -item['count'])
+    return {
+        'total_entries': sum(row['entry_count'] for row in rows),
+        'total_debits': total_debits,
+        'total_credits': total_credits,
+        'entries_requiring_review': sum(row['review_count'] for row in rows),
+        'date_range_start': min(first_dates) if first_dates else None,
+        'date_range_end': max(last_dates) if last_dates else None,
+        'net_total': total_debits - total_credits,
+        'by_tag': {item['tag'] or 'untagged': item['count'] for item in tag_counts},
+        'by_bucket': {item['bucket'] or 'unbucketed': item['count'] for item in bucket_counts},
+    }
+
+
+def _fold_by_tag(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    labels = dict(GeneralLedgerEntries.EntryTag.choices)
+    output = sorted(_fold(rows, ('tag',)), key=lambda item: -item['total_debits'])
+    for item in output:
+        item['tag_display'] = labels.get(item['tag'], 'Untagged')
+    return output
+
+
+def _fold_by_bucket(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    labels = dict(GeneralLedgerEntries.EntryBucket.choices)
+    output = sorted(_fold(rows, ('bucket',)), key=lambda item: -item['total_debits'])
+    for item in output:
+        item['bucket_display'] = labels.get(item['bucket'], 'Unbucketed')
+    return output
+
+
+def _fold_by_account(rows: List[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
+    output = _fold(rows, ('account_number', 'account_name'))
+    return sorted(output, key=lambda item: -item['total_debits'])[:limit]
+
+
+def _fold_monthly_trend(rows: List[Dict[str, Any]], months: int) -> List[Dict[str, Any]]:
+    output = _fold(rows, ('month',))
+    # WHAT: Latest ``months`` months, returned oldest to newest for left-to-right charts
+    output.sort(key=lambda item: item['month'] or date.min, reverse=True)
+    output = output[:months]
+    for item in output:
+        item['month_display'] = item['month'].strftime('%b %Y') if item['month'] else 'Unknown'
+    return list(reversed(output))
+
+
+def get_gl_dashboard(
+    queryset: Any,
+    filters: Optional[Dict[str, Any]] = None,
+    account_limit: int = 20,
+    months: int = 12,
+) -> Dict[str, Any]:
+    """
+    WHAT: Every GL dashboard block from one grouped query
+    WHY: The dashboard used to call five endpoints that each scanned the entries
+    HOW: Fold get_gl_dashboard_rows() into each block
+
+    RETURNS: Dict with summary, by_tag, by_bucket, by_account and monthly_trend
+    """
+    rows = get_gl_dashboard_rows(queryset, filters)
+    return {
+        'summary': _fold_summary(rows),
+        'by_tag': _fold_by_tag(rows),
+        'by_bucket': _fold_by_bucket(rows),
+        'by_account': _fold_by_account(rows, account_limit),
+        'monthly_trend': _fold_monthly_trend(rows, months),
+    }
+
+
 def get_gl_entry_summary(
     queryset: Any,
+    filters: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """
     WHAT: Calculate summary statistics for a GL entry queryset
     WHY: Provide aggregate data for dashboard KPIs and charts
-    HOW: Use Django ORM aggregations and Python calculations
-    
+    HOW: Fold the grouped dashboard rows (one query)
+
     PARAMETERS:
         - queryset: Filtered QuerySet of GeneralLedgerEntries
-    
+        - filters: Active filter values, lets the rollup answer (see get_gl_dashboard_rows)
+
     RETURNS: Dictionary with summary statistics
     """
-    # WHAT: Calculate total entries and aggregate amounts
-    # WHY: Provide key metrics for dashboard header
-    # HOW: Use Django aggregate functions
-    aggregates = queryset.aggregate(
-        total_entries=Count('id'),
-        total_debits=Coalesce(Sum('debit_amount'), Decimal('0.00')),
-        total_credits=Coalesce(Sum('credit_amount'), Decimal('0.00')),
-        entries_requiring_review=Count('id', filter=Q(requires_review=True)),
-        date_range_start=Min('posting_date'),
-        date_range_end=Max('posting_date'),
-    )
-    
-    # WHAT: Calculate net total (debits - credits)
-    # WHY: Show overall balance impact
-    # HOW: Subtract credits from debits
-    aggregates['net_total'] = aggregates['total_debits'] - aggregates['total_credits']
-    
-    # ------------------------------
-    # Tag Distribution
-    # ------------------------------
-    # WHAT: Count entries by tag
-    # WHY: Show categorical distribution in charts
-    # HOW: Group by tag and count
-    tag_counts = queryset.values('tag').annotate(count=Count('id')).order_by('-count')
-    aggregates['by_tag'] = {
-        item['tag'] or 'untagged': item['count'] 
-        for item in tag_counts
-    }
-    
-    # ------------------------------
-    # Bucket Distribution
-    # ------------------------------
-    # WHAT: Count entries by bucket
-    # WHY: Show strategic grouping distribution in charts
-    # HOW: Group by bucket and count
-    bucket_counts = queryset.values('bucket').annotate(count=Count('id')).order_by('-count')
-    aggregates['by_bucket'] = {
-        item['bucket'] or 'unbucketed': item['count'] 
-        for item in bucket_counts
-    }
-    
-    return aggregates
+    return _fold_summary(get_gl_dashboard_rows(queryset, filters))
 
 
-def get_entries_by_tag(queryset: Any) -> List[Dict[str, Any]]:
+def get_entries_by_tag(queryset: Any, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     """
     WHAT: Get GL entries grouped by tag with aggregate amounts
     WHY: Enable tag-based reporting and charts
-    HOW: Group by tag and calculate sums
-    
-    PARAMETERS:
-        - queryset: Filtered QuerySet of GeneralLedgerEntries
-    
+    HOW: Fold the grouped dashboard rows by tag
+
     RETURNS: List of dicts with tag, count, and amounts
     """
-    # WHAT: Group entries by tag and calculate aggregates
-    # WHY: Provide data for tag breakdown chart
-    # HOW: Use values() with annotate()
-    results = queryset.values('tag').annotate(
-        count=Count('id'),
-        total_debits=Coalesce(Sum('debit_amount'), Decimal('0.00')),
-        total_credits=Coalesce(Sum('credit_amount'), Decimal('0.00')),
-    ).order_by('-total_debits')
-    
-    # WHAT: Calculate net amount for each tag
-    # WHY: Show net impact per category
-    # HOW: Subtract credits from debits
-    output = []
-    for item in results:
-        item['net_amount'] = item['total_debits'] - item['total_credits']
-        item['tag_display'] = dict(GeneralLedgerEntries.EntryTag.choices).get(
-            item['tag'], 'Untagged'
-        )
-        output.append(item)
-    
-    return output
+    return _fold_by_tag(get_gl_dashboard_rows(queryset, filters))
 
 
-def get_entries_by_bucket(queryset: Any) -> List[Dict[str, Any]]:
+def get_entries_by_bucket(queryset: Any, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     """
     WHAT: Get GL entries grouped by bucket with aggregate amounts
     WHY: Enable bucket-based strategic reporting and charts
-    HOW: Group by bucket and calculate sums
-    
-    PARAMETERS:
-        - queryset: Filtered QuerySet of GeneralLedgerEntries
-    
+    HOW: Fold the grouped dashboard rows by bucket
+
     RETURNS: List of dicts with bucket, count, and amounts
     """
-    # WHAT: Group entries by bucket and calculate aggregates
-    # WHY: Provide data for bucket breakdown chart
-    # HOW: Use values() with annotate()
-    results = queryset.values('bucket').annotate(
-        count=Count('id'),
-        total_debits=Coalesce(Sum('debit_amount'), Decimal('0.00')),
-        total_credits=Coalesce(Sum('credit_amount'), Decimal('0.00')),
-    ).order_by('-total_debits')
-    
-    # WHAT: Calculate net amount for each bucket
-    # WHY: Show net impact per strategic grouping
-    # HOW: Subtract credits from debits
-    output = []
-    for item in results:
-        item['net_amount'] = item['total_debits'] - item['total_credits']
-        item['bucket_display'] = dict(GeneralLedgerEntries.EntryBucket.choices).get(
-            item['bucket'], 'Unbucketed'
-        )
-        output.append(item)
-    
-    return output
+    return _fold_by_bucket(get_gl_dashboard_rows(queryset, filters))
 
 
-def get_entries_by_account(queryset: Any, limit: int = 20) -> List[Dict[str, Any]]:
+def get_entries_by_account(
+    queryset: Any,
+    limit: int = 20,
+    filters: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
     """
     WHAT: Get GL entries grouped by account with aggregate amounts
     WHY: Show top accounts by activity
-    HOW: Group by account and calculate sums, limit to top N
-    
-    PARAMETERS:
-        - queryset: Filtered QuerySet of GeneralLedgerEntries
-        - limit: Maximum number of accounts to return (default 20)
-    
+    HOW: Fold the grouped dashboard rows by account, top N by debits
+
     RETURNS: List of dicts with account info and amounts
     """
-    # WHAT: Group entries by account and calculate aggregates
-    # WHY: Provide data for top accounts analysis
-    # HOW: Use values() with annotate() and limit
-    results = queryset.values('account_number', 'account_name').annotate(
-        count=Count('id'),
-        total_debits=Coalesce(Sum('debit_amount'), Decimal('0.00')),
-        total_credits=Coalesce(Sum('credit_amount'), Decimal('0.00')),
-    ).order_by('-total_debits')[:limit]
-    
-    # WHAT: Calculate net amount for each account
-    # WHY: Show net impact per account
-    # HOW: Subtract credits from debits
-    output = []
-    for item in results:
-        item['net_amount'] = item['total_debits'] - item['total_credits']
-        output.append(item)
-    
-    return output
+    return _fold_by_account(get_gl_dashboard_rows(queryset, filters), limit)
 
 
 def get_monthly_trend(
     queryset: Any,
     months: int = 12,
+    filters: Optional[Dict[str, Any]] = None,
 ) -> List[Dict[str, Any]]:
     """
     WHAT: Get GL entry volume and amounts by month
     WHY: Show time-series trends for dashboard charts
-    HOW: Group by month and calculate aggregates
-    
+    HOW: Fold the grouped dashboard rows by month
+
+    RETURNS: List of dicts with month and aggregate data (oldest to newest)
+    """
+    return _fold_monthly_trend(get_gl_dashboard_rows(queryset, filters), months)
+
+
+# ------------------------------
+# Monthly Rollup Maintenance
+# ------------------------------
+
+# WHAT: pg_advisory_xact_lock key space for rollup refreshes ('GLRU' + month ordinal)
+_ROLLUP_LOCK_NAMESPACE = 0x474C5255 << 32
+
+
+def _lock_rollup_months(month_list: Optional[List[date]]) -> None:
+    """
+    WHAT: Serialize rollup refreshes of the same months (held until the transaction ends)
+    WHY: Two refreshes of one month (two GL edits committed together, ingest plus an
+         edit) would each delete the old snapshot and insert their own rows
+    HOW: Month refreshes take a shared lock on the namespace key plus an exclusive lock
+         per month (sorted, so concurrent refreshes cannot deadlock); a full rebuild
+         takes the namespace key exclusively. PostgreSQL only - other backends
+         serialize writes on their own
+    """
+    if connection.vendor != 'postgresql':
+        return
+    with connection.cursor() as cursor:
+        if month_list is None:
+            cursor.execute('SELECT pg_advisory_xact_lock(%s)', [_ROLLUP_LOCK_NAMESPACE])
+            return
+        cursor.execute('SELECT pg_advisory_xact_lock_shared(%s)', [_ROLLUP_LOCK_NAMESPACE])
+        for month in month_list:
+            cursor.execute('SELECT pg_advisory_xact_lock(%s)', [_ROLLUP_LOCK_NAMESPACE + month.toordinal()])
+
+
+def refresh_gl_rollup(months: Optional[Iterable[date]] = None) -> int:
+    """
+    WHAT: Rebuild GeneralLedgerMonthlyRollup for the given posting months
+    WHY: Keep the dashboard rollup in step with GL writes without re-aggregating history
+    HOW: Under a per-month advisory lock, delete the months' rollup rows and insert one
+         grouped aggregate of their entries (the table's unique constraint backs this up)
+
     PARAMETERS:
-        - queryset: Filtered QuerySet of GeneralLedgerEntries
-        - months: Number of months to include (default 12)
-    
-    RETURNS: List of dicts with month and aggregate data
+        - months: Any dates inside the months to rebuild (None = every month)
+
+    RETURNS: Number of rollup rows written
     """
-    from django.db.models.functions import TruncMonth
-    
-    # WHAT: Group entries by month and calculate aggregates
-    # WHY: Provide data for monthly trend chart
-    # HOW: Use TruncMonth annotation with aggregates
-    results = queryset.annotate(
-        month=TruncMonth('posting_date')
-    ).values('month').annotate(
-        count=Count('id'),
-        total_debits=Coalesce(Sum('debit_amount'), Decimal('0.00')),
-        total_credits=Coalesce(Sum('credit_amount'), Decimal('0.00')),
-    ).order_by('-month')[:months]
-    
-    # WHAT: Calculate net amount and format month for display
-    # WHY: Provide complete data for frontend chart
-    # HOW: Process query results
-    output = []
-    for item in results:
-        item['net_amount'] = item['total_debits'] - item['total_credits']
-        item['month_display'] = item['month'].strftime('%b %Y') if item['month'] else 'Unknown'
-        output.append(item)
-    
-    # WHAT: Reverse list to show chronological order (oldest to newest)
-    # WHY: Charts typically display time series left to right
-    # HOW: Reverse the list
-    return list(reversed(output))
+    entries = GeneralLedgerEntries.objects.all()
+    stale = GeneralLedgerMonthlyRollup.objects.all()
+    month_list = None
+    if months is not None:
+        month_list = sorted({_month_start(value) for value in months if value})
+        if not month_list:
+            return 0
+        entries = (
+            entries.filter(posting_date__gte=month_list[0], posting_date__lt=_next_month(month_list[-1]))
+            .annotate(month=TruncMonth('posting_date'))
+            .filter(month__in=month_list)
+        )
+        stale = stale.filter(month__in=month_list)
+    else:
+        entries = entries.annotate(month=TruncMonth('posting_date'))
+
+    grouped = entries.order_by().values(*_ROLLUP_DIMENSIONS).annotate(**_entry_aggregates())
+    written = 0
+    with transaction.atomic():
+        _lock_rollup_months(month_list)
+        stale.delete()
+        batch: List[GeneralLedgerMonthlyRollup] = []
+        for row in grouped.iterator(chunk_size=_ROLLUP_BATCH):
+            row['bucket_id'] = row.pop('bucket')
+            batch.append(GeneralLedgerMonthlyRollup(**row))
+            if len(batch) >= _ROLLUP_BATCH:
+                GeneralLedgerMonthlyRollup.objects.bulk_create(batch)
+                written += len(batch)
+                batch = []
+        if batch:
+            GeneralLedgerMonthlyRollup.objects.bulk_create(batch)
+            written += len(batch)
+    return written
+
+
+_rollup_state = threading.local()
+
+
+def _pending_months() -> set:
+    if not hasattr(_rollup_state, 'months'):
+        _rollup_state.months = set()
+        _rollup_state.depth = 0
+    return _rollup_state.months
+
+
+def queue_gl_rollup_refresh(months: Iterable[Any]) -> None:
+    """Rebuild the rollup for ``months`` (dates inside them) once the transaction commits."""
+    _pending_months().update(_month_start(value) for value in months if value)
+    if not _rollup_state.depth:
+        transaction.on_commit(flush_gl_rollup_refreshes)
+
+
+def flush_gl_rollup_refreshes() -> None:
+    """Run the queued month rebuilds (one refresh_gl_rollup call)."""
+    months = _pending_months()
+    _rollup_state.months = set()
+    if not months:
+        return
+    try:
+        refresh_gl_rollup(months)
+    except Exception:
+        # WHAT: A GL save must never fail on the rollup; rebuild_gl_rollup repairs it
+        logger.exception('[GLRollup] Refresh of %d months failed', len(months))
+
+
+@contextmanager
+def deferred_gl_rollup_refresh():
+    """
+    Collect rollup refreshes inside the block and rebuild each touched month once at
+    the end (after commit). Wrap loops that save GL entries one by one.
+    """
+    _pending_months()
+    _rollup_state.depth += 1
+    try:
+        yield
+    finally:
+        _rollup_state.depth -= 1
+        if not _rollup_state.depth:
+            transaction.on_commit(flush_gl_rollup_refreshes)
+
+
+def queue_gl_rollup_refresh_for(queryset: Any) -> None:
+    """Queue the posting months of ``queryset`` (for writes that skip signals, e.g. .update())."""
+    queue_gl_rollup_refresh(
+        queryset.order_by().annotate(month=TruncMonth('posting_date')).values_list('month', flat=True).distinct()
+    )
 
 
 def get_chart_of_accounts_lookup() -> Dict[str, Dict[str, str]]:
@@ -0,0 +1,183 @@
+"""
+Lightweight map marker service.
+
+WHAT: Coordinate-only marker queries with server-side clustering by zoom level
+WHY: The Asset Dispersion and acquisition maps loaded full inventory querysets
+     (prefetches, annotations) just to read lat/lng, and shipped one marker per
+     asset - multi-megabyte payloads for 20k+ assets
+HOW: - Select only hub id, coordinates and label columns with values_list()
+     - Optionally restrict to a bounding box (uses the geocode_lat/geocode_lng index)
+     - Bucket points into a Web Mercator pixel grid for the requested zoom so each
+       cluster covers roughly CLUSTER_CELL_PX screen pixels; singletons keep their
+       full marker fields
+     - Cache finished payloads per (scope, filters, zoom, bbox) on the shared cache
+       tier; entries are dropped when enrichment coordinates change (am_module/sig_geo_markers.py)
+
+USAGE:
+    qs = filter_bbox(qs, parse_bbox(request.GET.get('bbox')), 'asset_hub__enrichment__geocode_lat', ...)
+    markers = [{...} for hub_id, lat, lng, rest in iter_marker_rows(qs.values_list(...))]
+    payload = build_marker_payload(markers, zoom=parse_zoom(request.GET.get('zoom')))
+
+Docs reviewed:
+- QuerySet.values_list(): https://docs.djangoproject.com/en/5.2/ref/models/querysets/#values-list
+- Web Mercator tiling: https://developers.google.com/maps/documentation/javascript/coordinates
+"""
+from __future__ import annotations
+
+import math
+import os
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from django.db.models import Q
+
+from core.services.serv_co_cache import SharedCache
+
+# WHAT: Target cluster size in screen pixels and the zoom at which clustering stops
+CLUSTER_CELL_PX: int = int(os.getenv("GEO_MARKER_CLUSTER_PX", "60"))
+CLUSTER_MAX_ZOOM: int = int(os.getenv("GEO_MARKER_CLUSTER_MAX_ZOOM", "14"))
+GEO_MARKER_CACHE_TTL: int = int(os.getenv("GEO_MARKER_CACHE_TTL", "300"))
+
+TILE_SIZE = 256
+MAX_MERCATOR_LAT = 85.05112878
+
+_marker_cache = SharedCache("geo_markers", ttl=GEO_MARKER_CACHE_TTL, local_maxsize=64)
+
+BBox = Tuple[float, float, float, float]  # (west, south, east, north)
+
+
+def parse_zoom(value: Optional[str]) -> Optional[int]:
+    """Parse a ``zoom`` query param (0-22); invalid or missing values disable clustering."""
+    if value in (None, ""):
+        return None
+    try:
+        zoom = int(float(value))
+    except (TypeError, ValueError):
+        return None
+    return max(0, min(zoom, 22))
+
+
+def parse_bbox(value: Optional[str]) -> Optional[BBox]:
+    """Parse a ``bbox=west,south,east,north`` query param; returns None when invalid."""
+    if not value:
+        return None
+    try:
+        west, south, east, north = (float(part) for part in str(value).split(","))
+    except (TypeError, ValueError):
+        return None
+    if south > north:
+        return None
+    return west, south, east, north
+
+
+def filter_bbox(queryset, bbox: Optional[BBox], lat_field: str, lng_field: str):
+    """Restrict a queryset to a bounding box (handles boxes crossing the antimeridian)."""
+    if bbox is None:
+        return queryset
+    west, south, east, north = bbox
+    queryset = queryset.filter(**{f"{lat_field}__gte": south, f"{lat_field}__lte": north})
+    if west <= east:
+        return queryset.filter(**{f"{lng_field}__gte": west, f"{lng_field}__lte": east})
+    return queryset.filter(Q(**{f"{lng_field}__gte": west}) | Q(**{f"{lng_field}__lte": east}))
+
+
+def _project(lat: np.ndarray, lng: np.ndarray, zoom: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Project lat/lng to Web Mercator world pixel coordinates at ``zoom``."""
+    world = TILE_SIZE * (2 ** zoom)
+    lat_rad = np.radians(np.clip(lat, -MAX_MERCATOR_LAT, MAX_MERCATOR_LAT))
+    x = (lng + 180.0) / 360.0 * world
+    y = (1.0 - np.log(np.tan(lat_rad) + 1.0 / np.cos(lat_rad)) / math.pi) / 2.0 * world
+    return x, y
+
+
+def cluster_markers(markers: Sequence[Dict[str, Any]], zoom: Optional[int]) -> List[Dict[str, Any]]:
+    """
+    Group markers into grid clusters for a zoom level.
+
+    Args:
+        markers: Marker dicts with at least ``lat`` and ``lng``
+        zoom: Map zoom level; None or >= CLUSTER_MAX_ZOOM returns markers unchanged
+
+    Returns:
+        Singleton cells as the original marker; multi-marker cells as
+        ``{lat, lng, count, cluster: True, bounds: [south, west, north, east]}``
+        positioned at the members' centroid.
+    """
+    if zoom is None or zoom >= CLUSTER_MAX_ZOOM or len(markers) < 2:
+        return list(markers)
+
+    lat = np.fromiter((m["lat"] for m in markers), dtype="float64", count=len(markers))
+    lng = np.fromiter((m["lng"] for m in markers), dtype="float64", count=len(markers))
+    x, y = _project(lat, lng, zoom)
+    cells = np.stack([np.floor(x / CLUSTER_CELL_PX), np.floor(y / CLUSTER_CELL_PX)], axis=1).astype("int64")
+    _, cell_idx, counts = np.unique(cells, axis=0, return_inverse=True, return_counts=True)
+    cell_idx = cell_idx.reshape(-1)
+
+    n_cells = counts.size
+    lat_sum = np.bincount(cell_idx, weights=lat, minlength=n_cells)
+    lng_sum = np.bincount(cell_idx, weights=lng, minlength=n_cells)
+    south = np.full(n_cells, np.inf)
+    north = np.full(n_cells, -np.inf)
+    west = np.full(n_cells, np.inf)
+    east = np.full(n_cells, -np.inf)
+    np.minimum.at(south, cell_idx, lat)
+    np.maximum.at(north, cell_idx, lat)
+    np.minimum.at(west, cell_idx, lng)
+    np.maximum.at(east, cell_idx, lng)
+
+    first_member = np.full(n_cells, -1, dtype="int64")
+    for i, cell in enumerate(cell_idx.tolist()):
+        if first_member[cell] < 0:
+            first_member[cell] = i
+
+    results: List[Dict[str, Any]] = []
+    for cell in range(n_cells):
+        count = int(counts[cell])
+        if count == 1:
+            results.append(markers[int(first_member[cell])])
+            continue
+        results.append({
+            "lat": round(float(lat_sum[cell] / count), 6),
+            "lng": round(float(lng_sum[cell] / count), 6),
+            "count": count,
+            "cluster": True,
+            "bounds": [
+                round(float(south[cell]), 6), round(float(west[cell]), 6),
+                round(float(north[cell]), 6), round(float(east[cell]), 6),
+            ],
+        })
+    return results
+
+
+def build_marker_payload(markers: List[Dict[str, Any]], zoom: Optional[int] = None) -> Dict[str, Any]:
+    """Wrap markers (clustered when ``zoom`` is given) in the standard map payload."""
+    clustered = cluster_markers(markers, zoom)
+    return {
+        "markers": clustered,
+        "count": len(markers),
+        "clustered": len(clustered) != len(markers),
+        "zoom": zoom,
+    }
+
+
+def cached_marker_payload(scope: str, params: Dict[str, Any], build) -> Dict[str, Any]:
+    """Return a cached marker payload for ``(scope, params)`` or build and store it.
+
+    ``params`` must contain every input that changes the result (filters, zoom, bbox).
+    """
+    key = (scope, tuple(sorted((k, str(v)) for k, v in params.items() if v not in (None, ""))))
+    return _marker_cache.get_or_set(key, build)
+
+
+def invalidate_marker_cache() -> None:
+    """Drop every cached marker payload (called when coordinates or lifecycle status change)."""
+    _marker_cache.invalidate()
+
+
+def iter_marker_rows(rows: Iterable[Sequence[Any]]) -> Iterable[Tuple[Any, float, float, Sequence[Any]]]:
+    """Yield ``(id, lat, lng, rest)`` for value rows shaped ``(id, lat, lng, *rest)``, skipping missing coordinates."""
+    for row in rows:
+        hub_id, lat, lng = row[0], row[1], row[2]
+        if lat is None or lng is None:
+            continue
+        yield hub_id, round(float(lat), 6), round(float(lng), 6), row[3:]
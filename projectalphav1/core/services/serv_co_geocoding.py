@@ -2,34 +2,72 @@
 Geocoding services for address enrichment.
 
 This service handles external API calls to Geocod.io and persists results 
-to the LlDataEnrichment model. No caching layer - coordinates are stored
-permanently in the database after successful API calls.
+to the LlDataEnrichment model. Coordinates are stored permanently in the
+database after successful API calls; every resolved address is also kept in
+the GeocodeAddressCache table so repeated addresses across rows, trades,
+workers and the cron service never re-hit the API (city/state centroids do
+not move, so entries do not expire).
+
+Batch pipeline (batch_geocode_row_ids / geocode_missing_assets / geocode_row):
+    1. Collect every pending row and dedupe normalized addresses across all of them
+    2. Resolve what we can from the persistent GeocodeAddressCache table (one query)
+    3. Send the remainder as Geocodio batch POSTs, several in flight at once on a thread
+       pool, each request gated by a shared token-bucket rate limiter; 429/5xx responses
+       are retried with backoff
+    4. Store new results in GeocodeAddressCache and write LlDataEnrichment with one
+       bulk_create + one bulk_update (no per-row get_or_create/save)
 
 Docs reviewed:
 - Geocod.io Python client: https://pygeocodio.readthedocs.io/en/latest/geocode.html
 - Geocod.io API reference: https://www.geocod.io/docs/
+- Geocod.io batch geocoding / rate limits: https://www.geocod.io/docs/#batch-geocoding
+- concurrent.futures: https://docs.python.org/3/library/concurrent.futures.html
+- QuerySet.bulk_update(): https://docs.djangoproject.com/en/5.2/ref/models/querysets/#bulk-update
 """
 from __future__ import annotations
 
+import hashlib
 import os
 import re
+import random
 import logging
+import threading
+import time
 import requests
-from typing import Dict, List, Optional, Tuple, Any, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Tuple, Any, Sequence
 from decimal import Decimal
 
+from django.db import transaction
 from django.db.models import Q, F
 from django.utils import timezone
 
 # App model import: `AcqProperty` contains the address fields we need
 from acq_module.models.model_acq_seller import AcqProperty
-from core.models import LlDataEnrichment
+from core.models import GeocodeAddressCache, LlDataEnrichment
 
 # ---------------------------------------------------------------------------
 # Configuration constants (read from environment with safe defaults)
 # ---------------------------------------------------------------------------
 # Configuration constants
 MAX_UNIQUE_ADDRESSES: int = int(os.getenv("GEOCODE_MAX_ADDRESSES", "500"))
+# Geocodio endpoint (overridable for staging proxies and the local test stub)
+GEOCODIO_API_URL: str = os.getenv("GEOCODIO_API_URL", "https://api.geocod.io/v1.9/geocode")
+GEOCODIO_TIMEOUT_SECONDS: float = float(os.getenv("GEOCODIO_TIMEOUT_SECONDS", "120"))
+# Addresses per batch POST (Geocodio accepts up to 10,000; smaller batches parallelize better)
+GEOCODIO_BATCH_SIZE: int = int(os.getenv("GEOCODIO_BATCH_SIZE", "1000"))
+# Batch requests in flight at once
+GEOCODIO_CONCURRENCY: int = int(os.getenv("GEOCODIO_CONCURRENCY", "4"))
+# Requests allowed per minute across all threads of this process
+GEOCODIO_REQUESTS_PER_MINUTE: int = int(os.getenv("GEOCODIO_REQUESTS_PER_MINUTE", "60"))
+GEOCODIO_MAX_ATTEMPTS: int = int(os.getenv("GEOCODIO_MAX_ATTEMPTS", "3"))
+GEOCODIO_RETRY_BASE_SECONDS: float = 1.0
+
+# Rows per bulk_create/bulk_update statement
+BULK_BATCH_SIZE = 500
+
+# Census/MSA + school district appends requested for new assets (imports and signals)
+GEOCODE_ENRICHMENT_FIELDS: Tuple[str, ...] = ("census2024", "census", "school")
 
 
 logger = logging.getLogger(__name__)
@@ -109,7 +147,7 @@ _CLIENTS: Dict[str, Any] = {}
 # Function: _geocodio_http_request – make direct HTTP request to Geocodio API.
 def _geocodio_http_request(addresses, api_key: str, fields=None):
     """Make direct HTTP request to Geocodio API since Python client is broken."""
-    url = "https://api.geocod.io/v1.9/geocode"
+    url = GEOCODIO_API_URL
     
     if isinstance(addresses, str):
         # Single address
@@ -119,7 +157,7 @@ def _geocodio_http_request(addresses, api_key: str, fields=None):
         }
         if fields:
             params['fields'] = ','.join(fields)
-        response = requests.get(url, params=params)
+        response = requests.get(url, params=params, timeout=GEOCODIO_TIMEOUT_SECONDS)
     else:
         # Batch addresses
         data = {
@@ -127,7 +165,7 @@ def _geocodio_http_request(addresses, api_key: str, fields=None):
         }
         if fields:
             data['fields'] = ','.join(fields)
-        response = requests.post(url, json=addresses, params=data)
+        response = requests.post(url, json=addresses, params=data, timeout=GEOCODIO_TIMEOUT_SECONDS)
     
     response.raise_for_status()
     data = response.json()
@@ -589,304 +627,206 @@ def _parse_geocodio_result_entry(entry: Any) -> Tuple[Optional[Tuple[float, floa
     return (lat_f, lng_f), extras
 
 
-# Function: _persist_enrichment_rows – upsert LlDataEnrichment rows for shared addresses.
-def _persist_enrichment_rows(
-    rows_info: List[Dict[str, Any]],
+# WHAT: LlDataEnrichment column <- key in the extras dict from _parse_geocodio_result_entry.
+# WHY: One table drives create defaults, update comparisons and the bulk_update field list.
+_GEOCODE_EXTRA_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("geocode_msa_type", "msa_type"),
+    ("geocode_csa_name", "csa_name"),
+    ("geocode_csa_code", "csa_code"),
+    ("geocode_state_fips", "state_fips"),
+    ("geocode_county_fips", "county_fips"),
+    ("geocode_tract_code", "tract_code"),
+    ("geocode_block_code", "block_code"),
+    ("geocode_block_group", "block_group"),
+    ("geocode_full_fips", "full_fips"),
+    ("geocode_place_name", "place_name"),
+    ("geocode_place_fips", "place_fips"),
+    ("geocode_metdiv_name", "metdiv_name"),
+    ("geocode_metdiv_code", "metdiv_code"),
+    ("geocode_county_subdivision_name", "county_subdivision_name"),
+    ("geocode_county_subdivision_fips", "county_subdivision_fips"),
+    ("geocode_county_subdivision_class_code", "county_subdivision_class_code"),
+    ("geocode_county_subdivision_class_desc", "county_subdivision_class_desc"),
+    ("geocode_census_year", "census_year"),
+    ("geocode_census_source", "census_source"),
+    ("geocode_school_district", "school_district"),
+    ("geocode_school_district_lea_code", "school_district_lea_code"),
+    ("geocode_school_district_grade_low", "school_district_grade_low"),
+    ("geocode_school_district_grade_high", "school_district_grade_high"),
+    ("geocode_school_district_type", "school_district_type"),
+)
+
+_ENRICHMENT_UPDATE_FIELDS: Tuple[str, ...] = (
+    "geocode_lat",
+    "geocode_lng",
+    "geocode_used_address",
+    "geocode_full_address",
+    "geocode_display_address",
+    "geocode_msa",
+    "geocode_msa_code",
+    *(field for field, _key in _GEOCODE_EXTRA_FIELDS),
+    "geocoded_at",
+    "updated_at",
+)
+
+
+class GeocodeAssignment(NamedTuple):
+    """Rows that share one resolved address (input to _persist_enrichment_rows)."""
+
+    rows: List[Dict[str, Any]]          # row_meta dicts: id (asset_hub_id), candidates, display_name
+    coords: Tuple[float, float]
+    extras: Dict[str, Optional[str]]
+    used_address: Optional[str]
+
+
+def _set_if_changed(obj: Any, field: str, value: Any) -> bool:
+    """Assign ``value`` to ``obj.field`` and report whether it differed."""
+    if getattr(obj, field, None) == value:
+        return False
+    setattr(obj, field, value)
+    return True
+
+
+def _apply_geocode_to_existing(
+    enr_obj: LlDataEnrichment,
     coords: Tuple[float, float],
     extras: Dict[str, Optional[str]],
-    used_address: Optional[str],
-) -> int:
-    """Persist geocode results for a set of SellerRawData rows."""
-    if not rows_info or coords is None:
-        return 0
-
+    fallback_addr: Optional[str],
+    display_name: str,
+) -> bool:
+    """Merge a geocode result into an existing enrichment row; True when anything changed.
+
+    Coordinates and address labels are only filled when missing; census/school metadata
+    is overwritten whenever Geocodio returned a value. MSA fields are always written
+    (empty string = "processed, no MSA") so backfills can tell attempted rows apart.
+    """
     lat, lng = coords
-    when = timezone.now()
+    changed = False
+    if not enr_obj.geocode_lat or not enr_obj.geocode_lng:
+        changed |= _set_if_changed(enr_obj, "geocode_lat", lat)
+        changed |= _set_if_changed(enr_obj, "geocode_lng", lng)
+    if fallback_addr and not enr_obj.geocode_used_address:
+        changed |= _set_if_changed(enr_obj, "geocode_used_address", fallback_addr)
+    if fallback_addr and not enr_obj.geocode_full_address:
+        changed |= _set_if_changed(enr_obj, "geocode_full_address", fallback_addr)
+    if display_name and not enr_obj.geocode_display_address:
+        changed |= _set_if_changed(enr_obj, "geocode_display_address", display_name)
+    for field, key in _GEOCODE_EXTRA_FIELDS:
+        value = extras.get(key)
+        if value:
+            changed |= _set_if_changed(enr_obj, field, value)
+
     msa_name = extras.get("msa_name")
     msa_code = extras.get("msa_code")
-    msa_type = extras.get("msa_type")
-    csa_name = extras.get("csa_name")
-    csa_code = extras.get("csa_code")
-    state_fips = extras.get("state_fips")
-    county_fips = extras.get("county_fips")
-    tract_code = extras.get("tract_code")
-    block_code = extras.get("block_code")
-    block_group = extras.get("block_group")
-    full_fips = extras.get("full_fips")
-    place_name = extras.get("place_name")
-    place_fips = extras.get("place_fips")
-    metdiv_name = extras.get("metdiv_name")
-    metdiv_code = extras.get("metdiv_code")
-    county_subdivision_name = extras.get("county_subdivision_name")
-    county_subdivision_fips = extras.get("county_subdivision_fips")
-    county_subdivision_class_code = extras.get("county_subdivision_class_code")
-    county_subdivision_class_desc = extras.get("county_subdivision_class_desc")
-    census_year = extras.get("census_year")
-    census_source = extras.get("census_source")
-    school_name = extras.get("school_district")
-    school_lea = extras.get("school_district_lea_code")
-    school_grade_low = extras.get("school_district_grade_low")
-    school_grade_high = extras.get("school_district_grade_high")
-    school_type = extras.get("school_district_type")
-    updated_rows = 0
-    
-    # WHAT: Log what we're about to persist
-    # WHY: Track progress during backfills
-    # HOW: Keep output minimal when no extra metadata is present
-    if msa_name or msa_code or state_fips or county_fips or school_name:
-        logger.info(
-            "[Persist] Coordinates: lat=%s, lng=%s, MSA: %s (%s), Address: %s",
-            lat,
-            lng,
-            msa_name or "None",
-            msa_code or "None",
-            used_address or "Unknown",
-        )
-    else:
-        logger.info("[Persist] Coordinates: lat=%s, lng=%s, Address: %s", lat, lng, used_address or "Unknown")
+    if not enr_obj.geocode_msa or (msa_name and enr_obj.geocode_msa != msa_name):
+        changed |= _set_if_changed(enr_obj, "geocode_msa", msa_name or "")
+    if not enr_obj.geocode_msa_code or (msa_code and enr_obj.geocode_msa_code != msa_code):
+        changed |= _set_if_changed(enr_obj, "geocode_msa_code", msa_code or "")
+    return changed
+
 
-    for row_meta in rows_info:
-        row_id = row_meta.get("id")
-        if not row_id:
+# Function: _persist_enrichment_rows – bulk upsert LlDataEnrichment rows for resolved addresses.
+def _persist_enrichment_rows(assignments: Sequence[GeocodeAssignment]) -> int:
+    """Persist geocode results for many SellerRawData rows in a fixed number of queries.
+
+    WHAT: One SELECT of existing enrichment rows, one bulk_create for new hubs and one
+          bulk_update for hubs whose enrichment changed
+    WHY: The old per-row get_or_create + save issued 2-3 queries per asset, which dominated
+         large tape imports once the API calls were batched
+    HOW: Rows are keyed by asset_hub_id (first assignment wins for a hub listed twice);
+         marker caches are dropped after commit because bulk writes skip post_save signals
+
+    Returns:
+        Number of rows that were created or whose values changed (unchanged rows are
+        not written and not counted)
+    """
+    per_hub: Dict[int, Tuple[Dict[str, Any], GeocodeAssignment]] = {}
+    for assignment in assignments:
+        if assignment.coords is None:
             continue
+        for row_meta in assignment.rows or []:
+            hub_id = row_meta.get("id")
+            if hub_id and hub_id not in per_hub:
+                per_hub[hub_id] = (row_meta, assignment)
+    if not per_hub:
+        return 0
 
+    when = timezone.now()
+    existing = {
+        enr.asset_hub_id: enr
+        for enr in LlDataEnrichment.objects
+        .filter(asset_hub_id__in=list(per_hub))
+        .only("id", "asset_hub_id", *_ENRICHMENT_UPDATE_FIELDS)
+    }
+
+    to_create: List[LlDataEnrichment] = []
+    to_update: List[LlDataEnrichment] = []
+    for hub_id, (row_meta, assignment) in per_hub.items():
+        extras = assignment.extras or {}
         candidates = row_meta.get("candidates") or []
-        fallback_addr = used_address or row_meta.get("used_address") or (candidates[0] if candidates else None)
+        fallback_addr = assignment.used_address or row_meta.get("used_address") or (candidates[0] if candidates else None)
         display_name = row_meta.get("display_name") or fallback_addr or ""
 
-        defaults = {
-            "geocode_lat": lat,
-            "geocode_lng": lng,
-            "geocode_used_address": fallback_addr or "",
-            "geocode_full_address": fallback_addr or "",
-            "geocode_display_address": display_name,
-            "geocoded_at": when,
-            "geocode_msa": msa_name or "",  # Store empty string instead of None
-            "geocode_msa_code": msa_code or "",  # Store empty string instead of None
-            "geocode_msa_type": msa_type or "",
-            "geocode_csa_name": csa_name or "",
-            "geocode_csa_code": csa_code or "",
-            "geocode_state_fips": state_fips or "",
-            "geocode_county_fips": county_fips or "",
-            "geocode_tract_code": tract_code or "",
-            "geocode_block_code": block_code or "",
-            "geocode_block_group": block_group or "",
-            "geocode_full_fips": full_fips or "",
-            "geocode_place_name": place_name or "",
-            "geocode_place_fips": place_fips or "",
-            "geocode_metdiv_name": metdiv_name or "",
-            "geocode_metdiv_code": metdiv_code or "",
-            "geocode_county_subdivision_name": county_subdivision_name or "",
-            "geocode_county_subdivision_fips": county_subdivision_fips or "",
-            "geocode_county_subdivision_class_code": county_subdivision_class_code or "",
-            "geocode_county_subdivision_class_desc": county_subdivision_class_desc or "",
-            "geocode_census_year": census_year or "",
-            "geocode_census_source": census_source or "",
-            "geocode_school_district": school_name or "",
-            "geocode_school_district_lea_code": school_lea or "",
-            "geocode_school_district_grade_low": school_grade_low or "",
-            "geocode_school_district_grade_high": school_grade_high or "",
-            "geocode_school_district_type": school_type or "",
-        }
-        
-        if msa_name or msa_code or state_fips or county_fips or school_name:
-            logger.info(
-                "[Persist] Row %s: %s -> MSA: %s",
-                row_id,
-                fallback_addr or "No address",
-                msa_name or "NO MSA DATA",
-            )
-        else:
-            logger.info("[Persist] Row %s: %s", row_id, fallback_addr or "No address")
+        enr_obj = existing.get(hub_id)
+        if enr_obj is None:
+            lat, lng = assignment.coords
+            values = {field: extras.get(key) or "" for field, key in _GEOCODE_EXTRA_FIELDS}
+            to_create.append(LlDataEnrichment(
+                asset_hub_id=hub_id,
+                geocode_lat=lat,
+                geocode_lng=lng,
+                geocode_used_address=fallback_addr or "",
+                geocode_full_address=fallback_addr or "",
+                geocode_display_address=display_name,
+                geocode_msa=extras.get("msa_name") or "",  # Store empty string instead of None
+                geocode_msa_code=extras.get("msa_code") or "",
+                geocoded_at=when,
+                **values,
+            ))
+        elif _apply_geocode_to_existing(enr_obj, assignment.coords, extras, fallback_addr, display_name):
+            enr_obj.geocoded_at = when
+            enr_obj.updated_at = when
+            to_update.append(enr_obj)
+
+    with transaction.atomic():
+        if to_create:
+            # WHAT: ignore_conflicts - a concurrent signal-driven geocode may create the hub row first
+            LlDataEnrichment.objects.bulk_create(to_create, batch_size=BULK_BATCH_SIZE, ignore_conflicts=True)
+        if to_update:
+            LlDataEnrichment.objects.bulk_update(to_update, list(_ENRICHMENT_UPDATE_FIELDS), batch_size=BULK_BATCH_SIZE)
+        if to_create or to_update:
+            transaction.on_commit(_invalidate_marker_cache)
+
+    logger.info(
+        "[Persist] %d enrichment rows created, %d updated, %d unchanged",
+        len(to_create),
+        len(to_update),
+        len(per_hub) - len(to_create) - len(to_update),
+    )
+    return len(to_create) + len(to_update)
 
-        try:
-            # WHAT: Use asset_hub_id as the primary key since seller_raw_data was removed
-            # WHY: LlDataEnrichment now only has OneToOneField to AssetIdHub
-            # HOW: Direct relationship to asset_hub_id
-            enr_obj, created = LlDataEnrichment.objects.get_or_create(
-                asset_hub_id=row_id,
-                defaults=defaults,
-            )
-            logger.info("[Persist] Row %s: %s (created=%s)", row_id, "SUCCESS", created)
-        except Exception as e:
-            logger.error("[Persist] Row %s: FAILED - %s (address: %s)", row_id, str(e), fallback_addr or "Unknown")
-            continue
 
-        if getattr(enr_obj, 'asset_hub_id', None) is None:
-            # WHAT: AcqProperty primary key equals asset_hub_id
-            # WHY: AssetIdHub is the canonical identifier for enrichment
-            # HOW: Use row_id directly to backfill if needed
-            try:
-                enr_obj.asset_hub_id = row_id
-                enr_obj.save(update_fields=['asset_hub'])
-            except Exception:
-                pass
-
-        if not created:
-            changed = False
-            if not enr_obj.geocode_lat or not enr_obj.geocode_lng:
-                enr_obj.geocode_lat = lat
-                enr_obj.geocode_lng = lng
-                changed = True
-            if not enr_obj.geocode_used_address and fallback_addr:
-                enr_obj.geocode_used_address = fallback_addr
-                changed = True
-            if not enr_obj.geocode_full_address and fallback_addr:
-                enr_obj.geocode_full_address = fallback_addr
-                changed = True
-            if not enr_obj.geocode_display_address and display_name:
-                enr_obj.geocode_display_address = display_name
-                changed = True
-            # Update census metadata when available
-            if state_fips and getattr(enr_obj, "geocode_state_fips", None) != state_fips:
-                enr_obj.geocode_state_fips = state_fips
-                changed = True
-            if county_fips and getattr(enr_obj, "geocode_county_fips", None) != county_fips:
-                enr_obj.geocode_county_fips = county_fips
-                changed = True
-            if tract_code and getattr(enr_obj, "geocode_tract_code", None) != tract_code:
-                enr_obj.geocode_tract_code = tract_code
-                changed = True
-            if block_code and getattr(enr_obj, "geocode_block_code", None) != block_code:
-                enr_obj.geocode_block_code = block_code
-                changed = True
-            if block_group and getattr(enr_obj, "geocode_block_group", None) != block_group:
-                enr_obj.geocode_block_group = block_group
-                changed = True
-            if full_fips and getattr(enr_obj, "geocode_full_fips", None) != full_fips:
-                enr_obj.geocode_full_fips = full_fips
-                changed = True
-            if place_name and getattr(enr_obj, "geocode_place_name", None) != place_name:
-                enr_obj.geocode_place_name = place_name
-                changed = True
-            if place_fips and getattr(enr_obj, "geocode_place_fips", None) != place_fips:
-                enr_obj.geocode_place_fips = place_fips
-                changed = True
-            if metdiv_name and getattr(enr_obj, "geocode_metdiv_name", None) != metdiv_name:
-                enr_obj.geocode_metdiv_name = metdiv_name
-                changed = True
-            if metdiv_code and getattr(enr_obj, "geocode_metdiv_code", None) != metdiv_code:
-                enr_obj.geocode_metdiv_code = metdiv_code
-                changed = True
-            if county_subdivision_name and getattr(enr_obj, "geocode_county_subdivision_name", None) != county_subdivision_name:
-                enr_obj.geocode_county_subdivision_name = county_subdivision_name
-                changed = True
-            if county_subdivision_fips and getattr(enr_obj, "geocode_county_subdivision_fips", None) != county_subdivision_fips:
-                enr_obj.geocode_county_subdivision_fips = county_subdivision_fips
-                changed = True
-            if county_subdivision_class_code and getattr(enr_obj, "geocode_county_subdivision_class_code", None) != county_subdivision_class_code:
-                enr_obj.geocode_county_subdivision_class_code = county_subdivision_class_code
-                changed = True
-            if county_subdivision_class_desc and getattr(enr_obj, "geocode_county_subdivision_class_desc", None) != county_subdivision_class_desc:
-                enr_obj.geocode_county_subdivision_class_desc = county_subdivision_class_desc
-                changed = True
-            if census_year and getattr(enr_obj, "geocode_census_year", None) != census_year:
-                enr_obj.geocode_census_year = census_year
-                changed = True
-            if census_source and getattr(enr_obj, "geocode_census_source", None) != census_source:
-                enr_obj.geocode_census_source = census_source
-                changed = True
-            # Update school district metadata when available
-            if school_name and getattr(enr_obj, "geocode_school_district", None) != school_name:
-                enr_obj.geocode_school_district = school_name
-                changed = True
-            if school_lea and getattr(enr_obj, "geocode_school_district_lea_code", None) != school_lea:
-                enr_obj.geocode_school_district_lea_code = school_lea
-                changed = True
-            if school_grade_low and getattr(enr_obj, "geocode_school_district_grade_low", None) != school_grade_low:
-                enr_obj.geocode_school_district_grade_low = school_grade_low
-                changed = True
-            if school_grade_high and getattr(enr_obj, "geocode_school_district_grade_high", None) != school_grade_high:
-                enr_obj.geocode_school_district_grade_high = school_grade_high
-                changed = True
-            if school_type and getattr(enr_obj, "geocode_school_district_type", None) != school_type:
-                enr_obj.geocode_school_district_type = school_type
-                changed = True
-            # WHAT: Always update MSA fields, even if empty
-            # WHY: User wants to track which addresses were processed but have no MSA
-            # HOW: Store empty string to indicate "processed but no MSA data"
-            if not enr_obj.geocode_msa or (msa_name and enr_obj.geocode_msa != msa_name):
-                enr_obj.geocode_msa = msa_name or ""
-                changed = True
-            if not getattr(enr_obj, "geocode_msa_code", None) or (msa_code and getattr(enr_obj, "geocode_msa_code", None) != msa_code):
-                enr_obj.geocode_msa_code = msa_code or ""
-                changed = True
-            if changed:
-                enr_obj.geocoded_at = when
-                enr_obj.save(update_fields=[
-                    "geocode_lat",
-                    "geocode_lng",
-                    "geocode_used_address",
-                    "geocode_full_address",
-                    "geocode_display_address",
-                    "geocode_msa",
-                    "geocode_msa_code",
-                    "geocoded_at",
-                ])
-
-        updated_rows += 1
-
-    return updated_rows
-
-
-# Function: _geocode_geocodio – single-address call to official client with census append.
-def _geocode_geocodio(
-    address: str,
-    api_key: str,
-    *,
-    fields: Optional[Sequence[str]] = None,
-) -> Tuple[Optional[Tuple[float, float]], Dict[str, Optional[str]]]:
-    """Call Geocod.io API using official geocodio-library-python.
-    
-    DOCS: https://github.com/Geocodio/geocodio-library-python
-    """
-    extras: Dict[str, Optional[str]] = {}
-    
+def _invalidate_marker_cache() -> None:
+    """Drop cached map markers (bulk writes bypass the LlDataEnrichment post_save hook)."""
     try:
-        # WHAT: Call Geocodio HTTP API directly since Python client is broken
-        # WHY: Python client doesn't expose census data properly
-        # HOW: Use direct HTTP request and parse JSON response
-        response_data = _geocodio_http_request(address, api_key, fields)
-        
-        if not response_data.get('results'):
-            return None, extras
-        
-        first = response_data['results'][0]
-        coords, extras = _parse_geocodio_result_entry(first)
-        
-        return coords, extras
-        
-    except requests.exceptions.HTTPError as e:
-        status = getattr(getattr(e, 'response', None), 'status_code', None)
-        if status == 422:
-            logger.warning("[Geocodio] Unprocessable address '%s' (422); skipping", address)
-            return None, extras
-        logger.warning("[Geocodio] HTTP error for address '%s' (status=%s): %s", address, status, str(e))
-        return None, extras
-    except Exception as e:
-        logger.exception("[Geocodio] Unexpected error for address '%s': %s", address, str(e))
-        return None, extras
-
+        from core.services.serv_co_geoMarkers import invalidate_marker_cache
 
-# Function: _call_geocoding_api – thin wrapper to keep signature consistent.
-def _call_geocoding_api(
-    address: str,
-    api_key: str,
-    *,
-    fields: Optional[Sequence[str]] = None,
-) -> Tuple[Optional[Tuple[float, float]], Dict[str, Optional[str]]]:
-    """Call Geocod.io API directly for an address."""
-    return _geocode_geocodio(address, api_key, fields=fields)
+        invalidate_marker_cache()
+    except Exception as exc:
+        logger.warning("[Persist] Marker cache invalidation failed: %s", exc)
 
 
-# Function: _try_geocoding_candidates – iterate candidate strings until success.
+# Function: _try_geocoding_candidates – resolve candidate strings in one cache-first batch.
 def _try_geocoding_candidates(
     address_candidates: List[str],
     api_key: str,
     *,
     fields: Optional[Sequence[str]] = None,
 ) -> Tuple[Optional[Tuple[float, float]], Optional[str], Dict[str, Optional[str]]]:
-    """Try multiple address candidates with API calls.
+    """Try multiple address candidates, returning the first (in order) that resolves.
+
+    All candidates go through geocode_addresses together: cached ones cost nothing and
+    the rest share a single batch request instead of one sequential call each.
 
     Args:
         address_candidates: list produced by `_build_address_candidates()`
@@ -897,27 +837,89 @@ def _try_geocoding_candidates(
             - coords: (lat, lng) or None
             - used_address: the address string that produced coords, or None
     """
+    if not address_candidates:
+        return None, None, {}
+    resolved, _stats = geocode_addresses(address_candidates, api_key=api_key, fields=fields)
     for addr in address_candidates:
-        coords, extras = _call_geocoding_api(addr, api_key, fields=fields)
-        if coords is not None:
+        hit = resolved.get(_normalize_address_for_dedup([addr]))
+        if hit is not None:
+            coords, extras, _used = hit
             return coords, addr, extras
     return None, None, {}
 
 
+class _RateLimiter:
+    """Thread-safe token bucket: at most ``per_minute`` acquisitions per rolling minute.
+
+    The bucket starts full (``burst`` tokens, default = concurrency) so the first wave of
+    batch requests goes out immediately; after that callers block until a token refills.
+    """
+
+    def __init__(self, per_minute: int, burst: int = 1):
+        self.rate = max(per_minute, 1) / 60.0
+        self.capacity = float(max(burst, 1))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def _geocodio_request_with_retry(
+    addresses,
+    api_key: str,
+    fields: Optional[Sequence[str]] = None,
+    *,
+    limiter: Optional[_RateLimiter] = None,
+):
+    """_geocodio_http_request gated by ``limiter``; retries 429/5xx and connection errors.
+
+    Other HTTP errors (401/403/422) are raised immediately - retrying cannot fix them.
+    """
+    for attempt in range(1, GEOCODIO_MAX_ATTEMPTS + 1):
+        if limiter is not None:
+            limiter.acquire()
+        try:
+            return _geocodio_http_request(addresses, api_key, fields)
+        except requests.exceptions.HTTPError as exc:
+            status = getattr(getattr(exc, "response", None), "status_code", None)
+            if attempt >= GEOCODIO_MAX_ATTEMPTS or not (status == 429 or (status or 0) >= 500):
+                raise
+            logger.warning("[Geocodio] HTTP %s on attempt %d/%d; retrying", status, attempt, GEOCODIO_MAX_ATTEMPTS)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as exc:
+            if attempt >= GEOCODIO_MAX_ATTEMPTS:
+                raise
+            logger.warning("[Geocodio] %s on attempt %d/%d; retrying", type(exc).__name__, attempt, GEOCODIO_MAX_ATTEMPTS)
+        # WHAT: Exponential backoff with jitter so parallel workers do not retry in lockstep
+        time.sleep(GEOCODIO_RETRY_BASE_SECONDS * (2 ** (attempt - 1)) * (1 + random.random()))
+    return {}
+
+
 # Function: _batch_geocode_geocodio – perform Geocodio batch lookup and map responses.
 def _batch_geocode_geocodio(
     addresses: Sequence[str],
     api_key: str,
     *,
     fields: Optional[Sequence[str]] = None,
+    limiter: Optional[_RateLimiter] = None,
 ) -> Dict[str, Tuple[Tuple[float, float], Dict[str, Optional[str]], str]]:
-    """Batch geocode a list of addresses using the official client."""
+    """Batch geocode a list of addresses in one Geocodio POST."""
     resolved: Dict[str, Tuple[Tuple[float, float], Dict[str, Optional[str]], str]] = {}
     if not addresses:
         return resolved
 
     try:
-        response_data = _geocodio_http_request(list(addresses), api_key, fields)
+        response_data = _geocodio_request_with_retry(list(addresses), api_key, fields, limiter=limiter)
         raw_results = response_data.get('results', [])
 
         for idx, addr in enumerate(addresses):
@@ -946,19 +948,169 @@ def _batch_geocode_geocodio(
     return resolved
 
 
+def _fields_key(fields: Optional[Sequence[str]]) -> str:
+    """Stable GeocodeAddressCache.fields_key for a Geocodio `fields` list."""
+    return ",".join(sorted({str(f).strip() for f in fields or () if f and str(f).strip()}))
+
+
+_CACHE_KEY_MAX_LENGTH = 255  # GeocodeAddressCache.normalized_address max_length
+
+
+def _address_cache_key(norm: str) -> str:
+    """
+    GeocodeAddressCache.normalized_address value for a normalized address.
+
+    Short addresses are stored as-is; longer ones keep a readable prefix plus a SHA-256
+    of the full string so reads and writes agree and distinct long addresses never collide.
+    """
+    if len(norm) <= _CACHE_KEY_MAX_LENGTH:
+        return norm
+    digest = hashlib.sha256(norm.encode("utf-8")).hexdigest()
+    return f"{norm[:_CACHE_KEY_MAX_LENGTH - len(digest) - 1]}#{digest}"
+
+
+def _load_cached_addresses(
+    norms: Sequence[str],
+    fields_key: str,
+) -> Dict[str, Tuple[Tuple[float, float], Dict[str, Optional[str]], str]]:
+    """Bulk read GeocodeAddressCache rows for normalized addresses (one SELECT + one UPDATE)."""
+    if not norms:
+        return {}
+    by_key = {_address_cache_key(norm): norm for norm in norms}
+    hits: Dict[str, Tuple[Tuple[float, float], Dict[str, Optional[str]], str]] = {}
+    hit_ids: List[int] = []
+    rows = (
+        GeocodeAddressCache.objects
+        .filter(normalized_address__in=list(by_key), fields_key=fields_key)
+        .values_list("id", "normalized_address", "lat", "lng", "extras", "used_address")
+    )
+    for pk, key, lat, lng, extras, used_address in rows:
+        norm = by_key[key]
+        hits[norm] = ((float(lat), float(lng)), dict(extras or {}), used_address or norm)
+        hit_ids.append(pk)
+    if hit_ids:
+        GeocodeAddressCache.objects.filter(pk__in=hit_ids).update(
+            hit_count=F("hit_count") + 1, last_used_at=timezone.now(),
+        )
+    return hits
+
+
+def _store_cached_addresses(
+    resolved: Dict[str, Tuple[Tuple[float, float], Dict[str, Optional[str]], str]],
+    fields_key: str,
+) -> None:
+    """Persist newly resolved addresses; existing keys are left untouched."""
+    if not resolved:
+        return
+    entries = [
+        GeocodeAddressCache(
+            normalized_address=_address_cache_key(norm),
+            fields_key=fields_key,
+            used_address=(used_address or "")[:255],
+            lat=Decimal(str(round(coords[0], 6))),
+            lng=Decimal(str(round(coords[1], 6))),
+            extras=extras or {},
+        )
+        for norm, (coords, extras, used_address) in resolved.items()
+    ]
+    try:
+        GeocodeAddressCache.objects.bulk_create(entries, batch_size=BULK_BATCH_SIZE, ignore_conflicts=True)
+    except Exception as exc:
+        # WHAT: The cache is an optimization; a failed write must not lose the geocode itself
+        logger.warning("[Geocode] Address cache write failed: %s", exc)
+
+
+# Function: geocode_addresses – dedupe, cache-first, concurrent rate-limited batch lookup.
+def geocode_addresses(
+    addresses: Sequence[str],
+    *,
+    api_key: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+    batch_size: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    use_cache: bool = True,
+) -> Tuple[Dict[str, Tuple[Tuple[float, float], Dict[str, Optional[str]], str]], Dict[str, int]]:
+    """Resolve many address strings with as few Geocodio requests as possible.
+
+    WHAT: Dedupe -> GeocodeAddressCache -> concurrent batch POSTs for the remainder
+    WHY: Tape imports repeat the same City, State thousands of times, and chunks used to be
+         sent one after another (or one HTTP call per address on the signal path)
+    HOW: Unique normalized addresses are split into ``batch_size`` chunks that run on a
+         thread pool (``concurrency`` in flight) behind one shared _RateLimiter; successful
+         results are written back to the cache table
+
+    Returns:
+        (resolved, stats) where ``resolved`` maps normalized address ->
+        ((lat, lng), extras, used_address) and ``stats`` counts unique_addresses,
+        cache_hits, api_calls and unresolved
+    """
+    stats = {"unique_addresses": 0, "cache_hits": 0, "api_calls": 0, "unresolved": 0}
+    unique: Dict[str, str] = {}
+    for addr in addresses or ():
+        norm = _normalize_address_for_dedup([addr]) if addr else ""
+        if norm and norm not in unique:
+            unique[norm] = addr
+    stats["unique_addresses"] = len(unique)
+    if not unique:
+        return {}, stats
+
+    fields_key = _fields_key(fields)
+    resolved = _load_cached_addresses(list(unique), fields_key) if use_cache else {}
+    stats["cache_hits"] = len(resolved)
+
+    pending = [addr for norm, addr in unique.items() if norm not in resolved]
+    api_key = api_key or _env_api_key()
+    if pending and api_key:
+        size = max(1, min(batch_size or GEOCODIO_BATCH_SIZE, 10000))
+        chunks = [pending[i:i + size] for i in range(0, len(pending), size)]
+        workers = max(1, min(concurrency or GEOCODIO_CONCURRENCY, len(chunks)))
+        limiter = _RateLimiter(GEOCODIO_REQUESTS_PER_MINUTE, burst=workers)
+        stats["api_calls"] = len(chunks)
+        logger.info(
+            "[Geocode] %d unique addresses: %d cached, %d to fetch in %d batch(es), %d in flight",
+            len(unique), stats["cache_hits"], len(pending), len(chunks), workers,
+        )
+
+        def _run(chunk: List[str]):
+            return _batch_geocode_geocodio(chunk, api_key, fields=fields, limiter=limiter)
+
+        if workers == 1:
+            chunk_results = [_run(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="geocodio") as pool:
+                chunk_results = list(pool.map(_run, chunks))
+
+        fetched: Dict[str, Tuple[Tuple[float, float], Dict[str, Optional[str]], str]] = {}
+        for result in chunk_results:
+            fetched.update(result)
+        if use_cache:
+            _store_cached_addresses(fetched, fields_key)
+        resolved.update(fetched)
+
+    stats["unresolved"] = len(unique) - len(resolved)
+    return resolved, stats
+
+
 # Function: batch_geocode_row_ids – persist coordinates/MSA data for specific assets.
 def batch_geocode_row_ids(
     row_ids: Sequence[int],
     *,
-    chunk_size: int = 1000,
+    chunk_size: int = GEOCODIO_BATCH_SIZE,
     fields: Optional[Sequence[str]] = None,
+    concurrency: Optional[int] = None,
 ) -> Dict[str, Any]:
-    """Batch geocode SellerRawData rows by primary key."""
+    """Batch geocode SellerRawData rows by primary key.
+
+    Addresses are deduped across every requested row, resolved through geocode_addresses
+    (cache table first, then concurrent batch requests of ``chunk_size``) and persisted
+    with a single bulk write.
+    """
     stats = {
         "requested_rows": len(row_ids or []),
         "unique_addresses": 0,
         "updated_rows": 0,
         "api_calls": 0,
+        "cache_hits": 0,
         "raw_responses": [],  # Store raw responses for CSV export
     }
 
@@ -980,23 +1132,15 @@ def batch_geocode_row_ids(
 
     # WHAT: Prefetch existing enrichment data to skip already-geocoded addresses
     # WHY: Avoid wasting API calls on addresses that already have coordinates
-    # HOW: Bulk fetch all enrichment records and build lookup dict
+    # HOW: One values_list() of hub ids that already carry lat/lng
     all_asset_ids = [r["asset_hub_id"] for r in rows if r.get("asset_hub_id")]
-    logger.info("[Batch] Checking %d asset_hub_ids for existing geocode data", len(all_asset_ids))
-    existing_enrichments = {}
+    geocoded_hub_ids: set = set()
     if all_asset_ids:
-        enrichments = LlDataEnrichment.objects.filter(
-            asset_hub_id__in=all_asset_ids
-        ).only("asset_hub_id", "geocode_lat", "geocode_lng")
-        existing_enrichments = {
-            e.asset_hub_id: e 
-            for e in enrichments 
-            if e.geocode_lat is not None and e.geocode_lng is not None
-        }
-        logger.info("[Batch] Found %d existing geocoded records to skip (out of %d enrichment records total)", 
-                    len(existing_enrichments), enrichments.count())
-        if len(existing_enrichments) > 0:
-            logger.info("[Batch] Sample existing asset_hub_ids: %s", list(existing_enrichments.keys())[:5])
+        geocoded_hub_ids = set(
+            LlDataEnrichment.objects
+            .filter(asset_hub_id__in=all_asset_ids, geocode_lat__isnull=False, geocode_lng__isnull=False)
+            .values_list("asset_hub_id", flat=True)
+        )
 
     addr_to_rows: Dict[str, List[Dict[str, Any]]] = {}
     unique_addresses: List[Tuple[str, str]] = []
@@ -1008,7 +1152,7 @@ def batch_geocode_row_ids(
         # WHAT: Skip rows that already have geocode data
         # WHY: Don't waste API calls on already-geocoded addresses
         # HOW: Check if enrichment exists with lat/lng
-        if asset_hub_id and asset_hub_id in existing_enrichments:
+        if asset_hub_id and asset_hub_id in geocoded_hub_ids:
             skipped_count += 1
             continue
         
@@ -1032,52 +1176,61 @@ def batch_geocode_row_ids(
     stats["skipped_count"] = skipped_count
     logger.info("[Batch] Found %d unique addresses from %d rows (skipped %d already geocoded)", 
                 len(unique_addresses), len(rows), skipped_count)
-    for i, (norm, addr) in enumerate(unique_addresses[:5]):  # Log first 5
-        logger.info("[Batch] Address %d: %s -> %s", i+1, addr, norm)
     
     if not unique_addresses:
         logger.warning("[Batch] No unique addresses to geocode (all already have data or no valid addresses)")
         return stats
 
+    resolved, geo_stats = geocode_addresses(
+        [addr for _norm, addr in unique_addresses],
+        api_key=api_key,
+        fields=fields,
+        batch_size=chunk_size,
+        concurrency=concurrency,
+    )
+    stats["api_calls"] = geo_stats["api_calls"]
+    stats["cache_hits"] = geo_stats["cache_hits"]
+
+    assignments: List[GeocodeAssignment] = []
     for norm, addr in unique_addresses:
-        coords, used_addr, extras = _try_geocoding_candidates([addr], api_key, fields=fields)
-        stats["api_calls"] += 1
-        if not coords:
+        hit = resolved.get(norm)
+        if hit is None:
             continue
+        coords, extras, _used = hit
+        rows_for_addr = addr_to_rows.get(norm, [])
+        assignments.append(GeocodeAssignment(rows_for_addr, coords, extras, addr))
 
         # WHAT: Capture raw response data for CSV export
         # WHY: User wants to save all responses to avoid wasting API calls
         # HOW: Store all extracted data plus raw response
-        rows_for_addr = addr_to_rows.get(norm, [])
         for row_info in rows_for_addr:
-            asset_hub_id = row_info.get("id")
-            raw_response_data = {
-                'asset_hub_id': asset_hub_id,
-                'address': used_addr,
-                'lat': coords[0] if coords else '',
-                'lng': coords[1] if coords else '',
+            stats["raw_responses"].append({
+                'asset_hub_id': row_info.get("id"),
+                'address': addr,
+                'lat': coords[0],
+                'lng': coords[1],
                 'msa_name': extras.get('msa_name', ''),
                 'msa_code': extras.get('msa_code', ''),
                 'csa_name': extras.get('csa_name', ''),
                 'csa_code': extras.get('csa_code', '')
-            }
-            stats["raw_responses"].append(raw_response_data)
-        
-        updated = _persist_enrichment_rows(
-            rows_for_addr,
-            coords,
-            extras,
-            used_addr,
-        )
-        stats["updated_rows"] += updated
+            })
 
+    stats["updated_rows"] = _persist_enrichment_rows(assignments)
     return stats
 
 
-def geocode_missing_assets(limit: Optional[int] = None, *, chunk_size: int = 1000, fields: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+def geocode_missing_assets(
+    limit: Optional[int] = None,
+    *,
+    chunk_size: int = GEOCODIO_BATCH_SIZE,
+    fields: Optional[Sequence[str]] = None,
+    concurrency: Optional[int] = None,
+) -> Dict[str, Any]:
     # WHAT: Find SellerRawData records that need geocoding
     # WHY: Only geocode records that don't have both lat AND lng
-    # HOW: Query for records where enrichment is missing OR where BOTH lat and lng are null
+    # HOW: Query for records where enrichment is missing OR where BOTH lat and lng are null;
+    #      all pending rows go through one batch_geocode_row_ids call so addresses dedupe
+    #      across the whole backlog and chunks are sent concurrently
     qs = AcqProperty.objects.filter(
         Q(asset__asset_hub__enrichment__isnull=True)
         | (Q(asset__asset_hub__enrichment__geocode_lat__isnull=True) & Q(asset__asset_hub__enrichment__geocode_lng__isnull=True))
@@ -1092,7 +1245,7 @@ def geocode_missing_assets(limit: Optional[int] = None, *, chunk_size: int = 100
             "updated_rows": 0,
             "api_calls": 0,
         }
-    return batch_geocode_row_ids(row_ids, chunk_size=chunk_size, fields=fields)
+    return batch_geocode_row_ids(row_ids, chunk_size=chunk_size, fields=fields, concurrency=concurrency)
 
 
 # Function: preview_msa_for_row_ids – fetch MSA/CSA preview data without DB writes.
@@ -1255,130 +1408,98 @@ def preview_msa_for_addresses(
 
 
 # Function: geocode_markers_for_seller_trade – drive seller/trade map marker enrichment.
-def geocode_markers_for_seller_trade(seller_id: int, trade_id: int) -> Dict[str, Any]:
+def geocode_markers_for_seller_trade(
+    seller_id: int,
+    trade_id: int,
+    *,
+    zoom: Optional[int] = None,
+    bbox: Optional[Tuple[float, float, float, float]] = None,
+) -> Dict[str, Any]:
     """Business logic: build geocoded markers for all addresses under seller+trade.
 
+    Reads persisted coordinates only (no external API calls) in a single query
+    that joins the enrichment row, then de-duplicates by address and optionally
+    clusters by zoom (see core/services/serv_co_geoMarkers.py).
+
     Args:
         seller_id: The seller identifier to filter rows by
         trade_id:  The trade identifier to filter rows by
+        zoom: Optional map zoom level; nearby markers are merged into clusters
+        bbox: Optional (west, south, east, north) viewport filter
 
     Returns:
         A dict payload ready to be returned by a Django view as JSON, with keys:
         - markers: list of { lat: float, lng: float, name: str, id: int }
-        - count:   number of markers
-        - source:  "cache" | "live" | "mixed" | "none"
-        - error:   optional error string (e.g., missing API key)
+          (clusters carry count/cluster/bounds instead of name/id)
+        - count:   number of address markers before clustering
+        - clustered: whether any markers were merged
+        - source:  "db"
     """
-    import logging
-    import time
-    logger = logging.getLogger(__name__)
-    
-    start_time = time.time()
-    print(f'[GEOCODE SERVICE] Starting for seller={seller_id}, trade={trade_id}')
-
-    # Query only the fields needed to compose addresses and labels for markers
-    query_start = time.time()
-    rows = list(
-        AcqProperty.objects
-        .filter(Q(asset__seller_id=seller_id) & Q(asset__trade_id=trade_id))
-        .annotate(asset_hub_id=F("asset_id"))
-        .values("pk", "asset_hub_id", "city", "state", "zip")
+    from core.services.serv_co_geoMarkers import (
+        build_marker_payload,
+        cached_marker_payload,
+        filter_bbox,
+        iter_marker_rows,
     )
-    query_time = time.time() - query_start
-    print(f'[GEOCODE SERVICE] Found {len(rows)} rows in {query_time:.2f}s')
 
-    # Deduplicate by the most specific candidate to minimize geocoding calls
-    # (and protect quotas)
-    addr_to_rows: Dict[str, List[Dict[str, Any]]] = {}
-    for r in rows:
-        candidates = _build_address_candidates(r)
-        if not candidates:
-            continue
-        primary = candidates[0]
-        norm = _normalize_address_for_dedup([primary])
-        if not norm:
-            continue
-        addr_to_rows.setdefault(norm, []).append({
-            "id": r["asset_hub_id"],
-            "candidates": candidates,
-            "display_name": _build_display_address(r),
-        })
-
-    # WHAT: Process all unique addresses
-    unique_addrs = list(addr_to_rows.keys())
-    
-    dedup_time = time.time() - query_start
-    print(f'[GEOCODE SERVICE] Deduplicated to {len(unique_addrs)} unique addresses in {dedup_time:.2f}s')
-
-    # WHAT: Bulk-fetch ALL enrichment records for this seller/trade to avoid N+1 queries
-    # WHY: Querying in a loop causes 658+ individual queries (extremely slow)
-    # HOW: Single query with filter, build lookup dict by seller_raw_data_id
-    all_asset_ids = [r["id"] for row_list in addr_to_rows.values() for r in row_list]
-    enrichment_prefetch_start = time.time()
-    print(f'[GEOCODE SERVICE] Prefetching enrichments for {len(all_asset_ids)} asset IDs')
-    
-    try:
-        enrichments = LlDataEnrichment.objects.filter(
-            asset_hub_id__in=all_asset_ids
-        ).only("asset_hub_id", "geocode_lat", "geocode_lng", "geocode_used_address", "geocode_display_address", "geocode_msa", "geocode_msa_code")
-
-        # Build lookup dict: asset_hub_id -> enrichment object
-        enrichment_lookup = {e.asset_hub_id: e for e in enrichments}
-        enrichment_prefetch_time = time.time() - enrichment_prefetch_start
-        print(f'[GEOCODE SERVICE] Prefetched {len(enrichment_lookup)} enrichment records in {enrichment_prefetch_time:.2f}s')
-    except Exception as e:
-        print(f'[GEOCODE SERVICE ERROR] Failed to prefetch enrichments: {e}')
-        import traceback
-        traceback.print_exc()
-        # Fallback to empty lookup (will trigger API calls if needed)
-        enrichment_lookup = {}
-
-    markers: List[Dict[str, Any]] = []
-    any_api_calls = False
-    
-    enrichment_start = time.time()
-    for norm in unique_addrs:
-        # Use the first representative row for label/name; multiple ids may share address
-        representative = addr_to_rows[norm][0]
-        candidates = representative["candidates"]
-        # 1) Prefer DB-persisted geocode if present on any row for this address
-        coords: Optional[Tuple[float, float]] = None
-        used_addr = None
-        for r in addr_to_rows[norm]:
-            enr = enrichment_lookup.get(r["id"])
-            if enr and enr.geocode_lat is not None and enr.geocode_lng is not None:
-                try:
-                    coords = (float(enr.geocode_lat), float(enr.geocode_lng))
-                    used_addr = enr.geocode_used_address or None
-                    break
-                except Exception:
-                    coords = None
+    def _build() -> Dict[str, Any]:
+        # WHAT: Only the columns needed for coordinates, dedup key and label
+        qs = (
+            AcqProperty.objects
+            .filter(Q(asset__seller_id=seller_id) & Q(asset__trade_id=trade_id))
+            .filter(
+                asset__asset_hub__enrichment__geocode_lat__isnull=False,
+                asset__asset_hub__enrichment__geocode_lng__isnull=False,
+            )
+        )
+        qs = filter_bbox(
+            qs, bbox,
+            "asset__asset_hub__enrichment__geocode_lat",
+            "asset__asset_hub__enrichment__geocode_lng",
+        )
+        rows = qs.order_by("asset_id").values_list(
+            "asset_id",
+            "asset__asset_hub__enrichment__geocode_lat",
+            "asset__asset_hub__enrichment__geocode_lng",
+            "asset__asset_hub__enrichment__geocode_used_address",
+            "city",
+            "state",
+            "zip",
+        )
 
-        # If no persisted coordinates, skip this address (no external API calls).
-        if coords is None:
-            continue
+        # Deduplicate by the most specific address candidate; first row wins
+        markers: List[Dict[str, Any]] = []
+        seen: set = set()
+        for hub_id, lat, lng, (used_addr, city, state, zip_code) in iter_marker_rows(rows):
+            row = {"city": city, "state": state, "zip": zip_code}
+            candidates = _build_address_candidates(row)
+            if not candidates:
+                continue
+            norm = _normalize_address_for_dedup([candidates[0]])
+            if not norm or norm in seen:
+                continue
+            seen.add(norm)
+            markers.append({
+                "lat": lat,
+                "lng": lng,
+                "name": _build_display_address(row) or used_addr or candidates[0],
+                "id": hub_id,
+            })
 
-        lat, lng = coords
-        markers.append({
-            "lat": float(lat),
-            "lng": float(lng),
-            "name": representative.get("display_name") or used_addr or candidates[0],
-            "id": representative["id"],
-        })
+        payload = build_marker_payload(markers, zoom=zoom)
+        payload["source"] = "db"
+        return payload
 
-    # Determine overall source for response
-    source = "db"
-    
-    enrichment_time = time.time() - enrichment_start
-    total_time = time.time() - start_time
-    print(f'[GEOCODE SERVICE] Enrichment loop: {enrichment_time:.2f}s')
-    print(f'[GEOCODE SERVICE] TOTAL TIME: {total_time:.2f}s for {len(markers)} markers')
-
-    return {
-        "markers": markers,
-        "count": len(markers),
-        "source": source,
-    }
+    payload = cached_marker_payload(
+        "acq_seller_trade",
+        {"seller_id": seller_id, "trade_id": trade_id, "zoom": zoom, "bbox": bbox},
+        _build,
+    )
+    logger.info(
+        f"[GEOCODE SERVICE] seller={seller_id} trade={trade_id}: "
+        f"{payload['count']} markers ({len(payload['markers'])} after clustering)"
+    )
+    return payload
 
 
 # Function: geocode_row – single-row enrichment used by signals/import hooks.
@@ -1387,7 +1508,8 @@ def geocode_row(row_id: int) -> Optional[Tuple[float, float]]:
 
     This is used by post-save signals to populate coordinates automatically
     on creation without requiring a batch call. It follows the same order:
-    DB -> cache -> live. Returns (lat, lng) when available.
+    DB -> address cache table -> live (one batch request for all candidates).
+    Returns (lat, lng) when available.
     """
     try:
         api_key = _env_api_key()
@@ -1419,59 +1541,8 @@ def geocode_row(row_id: int) -> Optional[Tuple[float, float]]:
         if coords is None:
             return None
 
-        lat, lng = coords
-        when = timezone.now()
-        msa_name = extras.get("msa_name")
-        msa_code = extras.get("msa_code")
-        enr_obj, created = LlDataEnrichment.objects.get_or_create(
-            asset_hub_id=row_id,
-            defaults={
-                "geocode_lat": lat,
-                "geocode_lng": lng,
-                "geocode_used_address": used_addr or candidates[0],
-                "geocode_full_address": used_addr or candidates[0],
-                "geocode_display_address": _build_display_address(r),
-                "geocoded_at": when,
-                "geocode_msa": msa_name,
-                "geocode_msa_code": msa_code,
-            },
-        )
-        # Ensure asset_hub mirrors the property row's hub
-        if getattr(enr_obj, 'asset_hub_id', None) is None:
-            try:
-                enr_obj.asset_hub_id = row_id
-                enr_obj.save(update_fields=['asset_hub'])
-            except Exception:
-                pass
-        if not created:
-            changed = False
-            if not enr_obj.geocode_lat or not enr_obj.geocode_lng:
-                enr_obj.geocode_lat = lat
-                enr_obj.geocode_lng = lng
-                changed = True
-            if not enr_obj.geocode_used_address:
-                enr_obj.geocode_used_address = used_addr or candidates[0]
-                changed = True
-            if not enr_obj.geocode_full_address:
-                enr_obj.geocode_full_address = used_addr or candidates[0]
-                changed = True
-            if not enr_obj.geocode_display_address:
-                enr_obj.geocode_display_address = _build_display_address(r)
-                changed = True
-            if msa_name and not enr_obj.geocode_msa:
-                enr_obj.geocode_msa = msa_name
-                changed = True
-            if msa_code and not getattr(enr_obj, "geocode_msa_code", None):
-                enr_obj.geocode_msa_code = msa_code
-                changed = True
-            if changed:
-                enr_obj.geocoded_at = when
-                enr_obj.save(update_fields=[
-                    "geocode_lat", "geocode_lng", "geocode_used_address",
-                    "geocode_full_address", "geocode_display_address",
-                    "geocode_msa", "geocode_msa_code",
-                    "geocoded_at",
-                ])
-        return lat, lng
+        row_meta = {"id": row_id, "candidates": candidates, "display_name": _build_display_address(r)}
+        _persist_enrichment_rows([GeocodeAssignment([row_meta], coords, extras, used_addr or candidates[0])])
+        return coords
     except Exception:
         return None
@@ -0,0 +1,476 @@
+"""
+Bulk General Ledger ingest.
+
+WHAT: Validate a whole batch of GL lines with pandas/NumPy and write it with bulk_create
+WHY: GeneralLedgerEntries.save() runs full_clean() per row, so month-end loads of hundreds
+     of thousands of lines spent most of their time in per-row validation and INSERTs
+HOW: - prepare_gl_frame(): trims text and parses amounts (to integer cents) and dates one
+       column at a time
+     - validate_gl_frame(): every rule is one boolean mask over the frame - required
+       fields, amount parsing/sign/size, at least one non-zero amount (as clean()),
+       field lengths, tag choices, duplicate entry ids, ChartOfAccounts codes and
+       balanced debits/credits per document - collected into a GLErrorReport
+       (one row per input row / column / rule)
+     - ingest_gl_entries(): builds GeneralLedgerEntries for the valid rows, bulk_creates
+       them in batches (skip, update or reject existing entry ids) and rebuilds the
+       touched GeneralLedgerMonthlyRollup months once
+     - `manage.py import_gl_entries` and POST /gl-entries/bulk-import/ wrap it
+
+USAGE:
+    result = ingest_gl_entries(read_gl_file('GeneralLedgerDetails_2025_11.csv'))
+    result.errors.frame.to_csv('gl_errors.csv', index=False)
+
+Docs reviewed:
+- pandas.to_numeric / to_datetime: https://pandas.pydata.org/docs/reference/api/pandas.to_datetime.html
+- GroupBy.transform: https://pandas.pydata.org/docs/reference/api/pandas.core.groupby.DataFrameGroupBy.transform.html
+- QuerySet.bulk_create(update_conflicts=...): https://docs.djangoproject.com/en/5.2/ref/models/querysets/#bulk-create
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
+
+import numpy as np
+import pandas as pd
+from django.db import models, transaction
+
+from core.models import AssetIdHub, ChartOfAccounts, GeneralLedgerEntries
+from core.models.model_co_generalLedger import GeneralLedgerBucket
+from core.services.serv_co_generalLedger import queue_gl_rollup_refresh
+
+logger = logging.getLogger(__name__)
+
+GL_INGEST_BATCH_SIZE = 2000
+
+# WHAT: Columns read from the input (anything else is ignored)
+AMOUNT_COLUMNS = ('debit_amount', 'credit_amount', 'amount')
+DATE_COLUMNS = ('posting_date', 'entry_date', 'date_funded')
+TEXT_LIMITS: Dict[str, Optional[int]] = {
+    f.name: f.max_length
+    for f in GeneralLedgerEntries._meta.concrete_fields
+    if isinstance(f, (models.CharField, models.TextField))
+}
+INTEGER_COLUMNS = ('asset_hub_id', 'bucket_id')
+REQUIRED_COLUMNS = ('entry', 'company_name', 'account_number', 'account_name', 'posting_date', 'entry_date')
+
+EXISTING_MODES = ('skip', 'update', 'error')
+
+# WHAT: Text treated as an empty cell
+NULL_LIKE_VALUES = {'', 'na', 'n/a', 'nan', 'none', 'null', '-', '--', 'nat'}
+
+# WHAT: max_digits=15, decimal_places=2 -> at most 13 integer digits
+_MAX_CENTS = 10 ** 15
+_REPORT_COLUMNS = ['row', 'entry', 'column', 'code', 'message']
+
+
+@dataclass
+class GLErrorReport:
+    """Validation errors, one row per (input row, column, rule); ``row`` is the 0-based input position."""
+
+    frame: pd.DataFrame = field(default_factory=lambda: pd.DataFrame(columns=_REPORT_COLUMNS))
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    @property
+    def rows(self) -> Set[int]:
+        return set(self.frame['row'].astype(int))
+
+    def counts(self) -> Dict[str, int]:
+        """Errors per rule code."""
+        return {str(code): int(count) for code, count in self.frame['code'].value_counts().items()}
+
+    def to_records(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        frame = self.frame if limit is None else self.frame.head(limit)
+        return frame.astype(object).where(frame.notna(), None).to_dict('records')
+
+
+@dataclass
+class GLIngestResult:
+    """Counts of one ingest run plus its error report."""
+
+    rows_received: int = 0
+    rows_valid: int = 0
+    created: int = 0
+    updated: int = 0
+    skipped_existing: int = 0
+    dry_run: bool = False
+    errors: GLErrorReport = field(default_factory=GLErrorReport)
+
+    @property
+    def rows_rejected(self) -> int:
+        return self.rows_received - self.rows_valid
+
+    def as_dict(self, error_limit: Optional[int] = 1000) -> Dict[str, Any]:
+        return {
+            'rows_received': self.rows_received,
+            'rows_valid': self.rows_valid,
+            'rows_rejected': self.rows_rejected,
+            'created': self.created,
+            'updated': self.updated,
+            'skipped_existing': self.skipped_existing,
+            'dry_run': self.dry_run,
+            'error_counts': self.errors.counts(),
+            'errors': self.errors.to_records(error_limit),
+        }
+
+
+# ------------------------------
+# Reading and normalizing
+# ------------------------------
+
+def read_gl_file(source: Union[str, Path, Any], name: Optional[str] = None, sheet: Any = 0) -> pd.DataFrame:
+    """
+    WHAT: Read a GL export (CSV or Excel) as text columns
+    WHY: Validation parses amounts/dates itself so it can report the bad cells
+    HOW: dtype=str and no NA conversion; ``name`` gives the extension for file objects
+    """
+    suffix = Path(str(name or getattr(source, 'name', source))).suffix.lower()
+    if suffix in ('.xlsx', '.xlsm', '.xls'):
+        return pd.read_excel(source, sheet_name=sheet, dtype=str, keep_default_na=False)
+    return pd.read_csv(source, dtype=str, keep_default_na=False, encoding='utf-8-sig')
+
+
+def _text(series: pd.Series) -> pd.Series:
+    """Trimmed string column with empty / null-like cells as <NA>."""
+    text = series.astype('string').str.strip().str.strip('"').str.strip()
+    return text.mask(text.str.lower().isin(NULL_LIKE_VALUES))
+
+
+def _column(df: pd.DataFrame, column: str) -> pd.Series:
+    """_text() of ``column``, or an all-<NA> column when the input lacks it."""
+    if column in df.columns:
+        return _text(df[column])
+    return pd.Series(pd.NA, index=df.index, dtype='string')
+
+
+def _numbers(text: pd.Series) -> np.ndarray:
+    """float64 array of ``text`` (NaN where empty or unparseable)."""
+    values = pd.to_numeric(text, errors='coerce').astype('Float64')
+    return values.to_numpy(dtype=float, na_value=np.nan)
+
+
+def prepare_gl_frame(data: Union[pd.DataFrame, Iterable[Dict[str, Any]]]) -> pd.DataFrame:
+    """
+    WHAT: Normalize raw GL rows column-wise
+    HOW: Lower-case headers; text -> trimmed strings; amounts -> float plus
+         ``<col>_cents`` (int64) and ``<col>_invalid``; dates -> datetime64 plus
+         ``<col>_invalid``; missing columns are added empty
+
+    RETURNS: New DataFrame indexed 0..n-1 in input order
+    """
+    df = data.copy() if isinstance(data, pd.DataFrame) else pd.DataFrame.from_records(list(data))
+    df.columns = [str(column).strip().lower().replace(' ', '_') for column in df.columns]
+    df = df.loc[:, ~df.columns.duplicated()].reset_index(drop=True)
+    provided = set(df.columns)
+
+    for column in TEXT_LIMITS:
+        df[column] = _column(df, column)
+
+    for column in AMOUNT_COLUMNS:
+        raw = _column(df, column)
+        cleaned = raw.str.replace(r'[$,\s]', '', regex=True).str.replace(r'^\((.*)\)$', r'-\1', regex=True)
+        numbers = _numbers(cleaned)
+        finite = np.isfinite(numbers)
+        df[f'{column}_invalid'] = raw.notna().to_numpy(dtype=bool) & ~finite
+        df[f'{column}_missing'] = ~finite
+        # WHAT: Clip before the int cast; anything this large fails the size rule anyway
+        df[f'{column}_cents'] = np.rint(np.clip(np.where(finite, numbers, 0.0) * 100, -1e17, 1e17)).astype(np.int64)
+
+    for column in DATE_COLUMNS:
+        raw = _column(df, column)
+        # WHAT: Fast ISO parse first; only the leftovers go through the per-value parser
+        parsed = pd.to_datetime(raw, errors='coerce', format='ISO8601')
+        retry = raw.notna() & parsed.isna()
+        if retry.any():
+            parsed = parsed.mask(retry, pd.to_datetime(raw[retry], errors='coerce', format='mixed'))
+        df[column] = parsed
+        df[f'{column}_invalid'] = (raw.notna() & parsed.isna()).to_numpy(dtype=bool)
+
+    for column in INTEGER_COLUMNS:
+        raw = _column(df, column)
+        numbers = _numbers(raw)
+        whole = np.isfinite(numbers) & (np.mod(np.nan_to_num(numbers), 1) == 0)
+        df[f'{column}_invalid'] = raw.notna().to_numpy(dtype=bool) & ~whole
+        df[column] = pd.Series(np.where(whole, numbers, np.nan), index=df.index).astype('Int64')
+
+    review = _column(df, 'requires_review')
+    df['requires_review'] = review.str.lower().isin({'1', 'true', 't', 'yes', 'y'}).to_numpy(dtype=bool)
+
+    # WHAT: Updates only overwrite columns the input actually had
+    df.attrs['provided_columns'] = provided
+    return df
+
+
+# ------------------------------
+# Validation
+# ------------------------------
+
+def _errors(df: pd.DataFrame, mask: Any, column: str, code: str, message: Union[str, pd.Series]) -> pd.DataFrame:
+    mask = np.asarray(mask, dtype=bool)
+    rows = df.index[mask]
+    if isinstance(message, pd.Series):
+        message = message[mask].astype(str).to_numpy()
+    return pd.DataFrame({
+        'row': rows,
+        'entry': df['entry'].to_numpy(dtype=object)[mask],
+        'column': column,
+        'code': code,
+        'message': message,
+    })
+
+
+def validate_gl_frame(
+    df: pd.DataFrame,
+    *,
+    accounts: Optional[Dict[str, str]] = None,
+    balance_by: Optional[str] = 'document_number',
+    existing_entries: Optional[Set[str]] = None,
+    known_ids: Optional[Dict[str, Set[int]]] = None,
+) -> GLErrorReport:
+    """
+    WHAT: Vectorized validation of a prepare_gl_frame() frame
+    WHY: One pass per rule instead of full_clean() per row
+    HOW: Each rule is a boolean mask. ``accounts`` (account_number -> account_name, None
+         skips the check) also fills missing account names. With ``balance_by`` every
+         group of rows sharing that column must net to zero, and a group with any rejected
+         row is rejected whole so no half-posted journal is written. ``existing_entries``
+         rejects entry ids already in the ledger (existing='error'); ``known_ids``
+         (column -> ids that exist) rejects dangling asset_hub_id / bucket_id values.
+
+    RETURNS: GLErrorReport (empty when every row is valid)
+    """
+    found: List[pd.DataFrame] = []
+
+    if accounts is not None:
+        missing_name = df['account_name'].isna() & df['account_number'].notna()
+        df.loc[missing_name, 'account_name'] = df.loc[missing_name, 'account_number'].map(accounts)
+
+    for column in REQUIRED_COLUMNS:
+        missing = df[column].isna().to_numpy(dtype=bool)
+        if f'{column}_invalid' in df.columns:
+            missing &= ~df[f'{column}_invalid'].to_numpy(dtype=bool)
+        found.append(_errors(df, missing, column, 'required', f'{column} is required'))
+
+    for column in AMOUNT_COLUMNS:
+        invalid = df[f'{column}_invalid']
+        found.append(_errors(df, invalid, column, 'invalid_amount', f'{column} is not a number'))
+        cents = df[f'{column}_cents']
+        found.append(_errors(df, np.abs(cents) >= _MAX_CENTS, column, 'amount_too_large', f'{column} exceeds 13 integer digits'))
+        if column != 'amount':
+            found.append(_errors(df, cents < 0, column, 'negative_amount', f'{column} must not be negative'))
+
+    # WHAT: Same rule as GeneralLedgerEntries.clean()
+    no_amount = (df['debit_amount_cents'] == 0) & (df['credit_amount_cents'] == 0) & (df['amount_cents'] == 0)
+    no_amount &= ~(df['debit_amount_invalid'] | df['credit_amount_invalid'] | df['amount_invalid'])
+    found.append(_errors(
+        df, no_amount, 'debit_amount', 'no_amount',
+        'At least one of credit_amount, debit_amount, or amount must be non-zero.',
+    ))
+
+    for column in DATE_COLUMNS:
+        found.append(_errors(df, df[f'{column}_invalid'], column, 'invalid_date', f'{column} is not a date'))
+    for column in INTEGER_COLUMNS:
+        found.append(_errors(df, df[f'{column}_invalid'], column, 'invalid_id', f'{column} is not an integer id'))
+        if known_ids is not None and column in known_ids:
+            dangling = df[column].notna() & ~df[column].isin(known_ids[column])
+            found.append(_errors(df, dangling.fillna(False), column, 'unknown_id', f'{column} does not exist'))
+
+    for column, limit in TEXT_LIMITS.items():
+        if limit:
+            too_long = df[column].str.len().fillna(0).to_numpy() > limit
+            found.append(_errors(df, too_long, column, 'too_long', f'{column} is longer than {limit} characters'))
+
+    tags = df['tag'].str.lower()
+    df['tag'] = tags
+    bad_tag = tags.notna() & ~tags.isin(GeneralLedgerEntries.EntryTag.values)
+    found.append(_errors(df, bad_tag, 'tag', 'invalid_tag', 'Unknown tag: ' + tags.fillna('')))
+
+    duplicate = df['entry'].notna() & df['entry'].duplicated(keep='first')
+    found.append(_errors(df, duplicate, 'entry', 'duplicate_entry', 'entry appears earlier in this batch'))
+
+    if existing_entries:
+        exists = df['entry'].isin(existing_entries).to_numpy(dtype=bool)
+        found.append(_errors(df, exists, 'entry', 'entry_exists', 'entry already exists in the ledger'))
+
+    if accounts is not None:
+        unknown = df['account_number'].notna() & ~df['account_number'].isin(accounts.keys())
+        found.append(_errors(
+            df, unknown, 'account_number', 'unknown_account',
+            'Account not in chart of accounts: ' + df['account_number'].fillna(''),
+        ))
+
+    if balance_by:
+        keyed = df[balance_by].notna().to_numpy(dtype=bool)
+        groups = df[balance_by]
+        net = (df['debit_amount_cents'] - df['credit_amount_cents']).groupby(groups).transform('sum')
+        unbalanced = keyed & (net.fillna(0).to_numpy() != 0)
+        found.append(_errors(
+            df, unbalanced, balance_by, 'unbalanced',
+            'Debits and credits differ by ' + (net.fillna(0) / 100).map('{:,.2f}'.format) + f' for this {balance_by}',
+        ))
+
+        rejected = np.zeros(len(df), dtype=bool)
+        for frame in found:
+            rejected[frame['row'].to_numpy(dtype=int)] = True
+        group_rejected = pd.Series(rejected, index=df.index).groupby(groups).transform('any')
+        partial = keyed & group_rejected.fillna(False).to_numpy(dtype=bool) & ~rejected
+        found.append(_errors(df, partial, balance_by, 'group_rejected', f'Another row with this {balance_by} was rejected'))
+
+    found = [frame for frame in found if len(frame)]
+    if not found:
+        return GLErrorReport()
+    report = pd.concat(found, ignore_index=True).sort_values(['row', 'column'], kind='stable').reset_index(drop=True)
+    return GLErrorReport(report[_REPORT_COLUMNS])
+
+
+# ------------------------------
+# Writing
+# ------------------------------
+
+def _cents_to_decimal(cents: int) -> Decimal:
+    return Decimal(int(cents)).scaleb(-2)
+
+
+def _build_entries(df: pd.DataFrame, created_by: Optional[Any]) -> List[GeneralLedgerEntries]:
+    """GeneralLedgerEntries objects for validated rows (no full_clean - already validated)."""
+    columns = list(TEXT_LIMITS) + list(INTEGER_COLUMNS)
+    values = df[columns].astype(object).where(df[columns].notna(), None).to_dict('records')
+    dates = {column: df[column].dt.date.astype(object).where(df[column].notna(), None).to_numpy() for column in DATE_COLUMNS}
+    debit = df['debit_amount_cents'].to_numpy()
+    credit = df['credit_amount_cents'].to_numpy()
+    amount = df['amount_cents'].to_numpy()
+    amount_missing = df['amount_missing'].to_numpy()
+    review = df['requires_review'].to_numpy()
+
+    entries = []
+    for position, record in enumerate(values):
+        entries.append(GeneralLedgerEntries(
+            **record,
+            **{column: dates[column][position] for column in DATE_COLUMNS},
+            debit_amount=_cents_to_decimal(debit[position]),
+            credit_amount=_cents_to_decimal(credit[position]),
+            amount=None if amount_missing[position] else _cents_to_decimal(amount[position]),
+            requires_review=bool(review[position]),
+            created_by=created_by,
+            updated_by=created_by,
+        ))
+    return entries
+
+
+def _ids(df: pd.DataFrame, column: str) -> List[int]:
+    return [int(value) for value in df[column].dropna().unique()]
+
+
+def _existing(entries: List[str]) -> Dict[str, Any]:
+    """entry id -> current posting_date for ids already in the ledger."""
+    found: Dict[str, Any] = {}
+    for start in range(0, len(entries), GL_INGEST_BATCH_SIZE):
+        found.update(
+            GeneralLedgerEntries.objects.filter(entry__in=entries[start:start + GL_INGEST_BATCH_SIZE])
+            .values_list('entry', 'posting_date')
+        )
+    return found
+
+
+def ingest_gl_entries(
+    data: Union[pd.DataFrame, Iterable[Dict[str, Any]]],
+    *,
+    existing: str = 'skip',
+    balance_by: Optional[str] = 'document_number',
+    check_accounts: bool = True,
+    created_by: Optional[Any] = None,
+    dry_run: bool = False,
+    batch_size: int = GL_INGEST_BATCH_SIZE,
+) -> GLIngestResult:
+    """
+    WHAT: Validate and bulk-write a batch of GL lines
+    WHY: Replace per-row save()/full_clean() in GL loads
+    HOW: prepare_gl_frame -> validate_gl_frame -> bulk_create valid rows in one
+         transaction -> rebuild the touched rollup months after commit
+
+    PARAMETERS:
+        - data: DataFrame (e.g. read_gl_file()) or iterable of dicts keyed by field name
+        - existing: 'skip' (default), 'update' or 'error' for entry ids already stored
+        - balance_by: Column whose groups must balance (None disables the check)
+        - check_accounts: Require account_number to exist in ChartOfAccounts
+        - created_by: User stamped on created_by/updated_by
+        - dry_run: Validate only
+
+    RETURNS: GLIngestResult with counts and the error report
+    """
+    if existing not in EXISTING_MODES:
+        raise ValueError(f'existing must be one of {EXISTING_MODES}, got {existing!r}')
+    if balance_by is not None and balance_by not in TEXT_LIMITS:
+        raise ValueError(f'balance_by must be a text field of GeneralLedgerEntries, got {balance_by!r}')
+
+    df = prepare_gl_frame(data)
+    result = GLIngestResult(rows_received=len(df), dry_run=dry_run)
+
+    accounts = dict(ChartOfAccounts.objects.values_list('account_number', 'account_name')) if check_accounts else None
+    stored = _existing(df['entry'].dropna().unique().tolist())
+    known_ids = {
+        'asset_hub_id': set(AssetIdHub.objects.filter(pk__in=_ids(df, 'asset_hub_id')).values_list('pk', flat=True)),
+        'bucket_id': set(GeneralLedgerBucket.objects.filter(pk__in=_ids(df, 'bucket_id')).values_list('pk', flat=True)),
+    }
+    result.errors = validate_gl_frame(
+        df,
+        accounts=accounts,
+        balance_by=balance_by,
+        existing_entries=set(stored) if existing == 'error' else None,
+        known_ids=known_ids,
+    )
+
+    valid = df[~df.index.isin(result.errors.rows)]
+    if existing == 'skip':
+        is_stored = valid['entry'].isin(stored.keys())
+        result.skipped_existing = int(is_stored.sum())
+        valid = valid[~is_stored]
+    result.rows_valid = len(valid) + result.skipped_existing
+    if dry_run or valid.empty:
+        return result
+
+    entries = _build_entries(valid, created_by)
+    months = set(valid['posting_date'].dt.date)
+    updated = [entry.entry for entry in entries if entry.entry in stored]
+    months.update(stored[entry] for entry in updated)
+
+    provided = df.attrs.get('provided_columns', set())
+    update_fields = [
+        name.removesuffix('_id')
+        for name in (*TEXT_LIMITS, *DATE_COLUMNS, *AMOUNT_COLUMNS, *INTEGER_COLUMNS, 'requires_review')
+        if name in provided and name != 'entry'
+    ] + ['updated_by', 'updated_at']
+    with transaction.atomic():
+        for start in range(0, len(entries), batch_size):
+            batch = entries[start:start + batch_size]
+            if existing == 'update':
+                GeneralLedgerEntries.objects.bulk_create(
+                    batch, update_conflicts=True, unique_fields=['entry'], update_fields=update_fields,
+                )
+            else:
+                GeneralLedgerEntries.objects.bulk_create(batch)
+        # WHAT: bulk_create skips the post_save signal, so queue the touched months here
+        queue_gl_rollup_refresh(months)
+
+    result.updated = len(updated)
+    result.created = len(entries) - result.updated
+    logger.info(
+        '[GLIngest] %d rows: %d created, %d updated, %d skipped, %d rejected',
+        result.rows_received, result.created, result.updated, result.skipped_existing, result.rows_rejected,
+    )
+    return result
+
+
+__all__ = [
+    'GLErrorReport',
+    'GLIngestResult',
+    'ingest_gl_entries',
+    'prepare_gl_frame',
+    'read_gl_file',
+    'validate_gl_frame',
+]
@@ -7,10 +7,11 @@ Base URL: https://api.stlouisfed.org/fred
 """
 import requests
 from typing import Dict, Optional, Any
-from django.core.cache import cache
 import logging
 import os
 
+from core.services.serv_co_cache import SharedCache
+
 logger = logging.getLogger(__name__)
 
 # FRED API Configuration (Federal Reserve Economic Data)
@@ -18,6 +19,9 @@ FRED_API_KEY = os.getenv("FRED_API_KEY")
 FRED_BASE_URL = "https://api.stlouisfed.org/fred"
 CACHE_TIMEOUT = 3600  # Reduced to 1 hour for testing; was 86400 (24 hours) to handle stale data issues
 
+# Shared across gunicorn workers and the cron service (see core/services/serv_co_cache.py)
+_fred_cache = SharedCache("fred_api", ttl=CACHE_TIMEOUT, local_maxsize=32)
+
 # FRED Series IDs
 FRED_MORTGAGE_30_YEAR = "MORTGAGE30US"  # 30-Year Fixed Rate Mortgage Average
 FRED_10_YEAR_TREASURY = "DGS10"  # 10-Year Treasury Constant Maturity Rate
@@ -87,10 +91,10 @@ def get_mortgage_rate_30_year() -> Dict[str, Any]:
     
     Uses caching to avoid excessive API calls (24 hour cache).
     """
-    cache_key = "fred_api:mortgage_30_year"
+    cache_key = "mortgage_30_year"
     
     # Check cache first
-    cached_data = cache.get(cache_key)
+    cached_data = _fred_cache.get(cache_key)
     if cached_data:
         logger.info("Returning cached 30-year mortgage rate")
         return cached_data
@@ -138,7 +142,7 @@ def get_mortgage_rate_30_year() -> Dict[str, Any]:
             }
             
             # Cache the result
-            cache.set(cache_key, data, CACHE_TIMEOUT)
+            _fred_cache.set(cache_key, data)
             
             return data
         else:
@@ -163,10 +167,10 @@ def get_fred_series(series_id: str, series_name: str, params: Optional[Dict] = N
     Returns:
         Dictionary with current value, date, and percentage change
     """
-    cache_key = f"fred_api:{series_name}"
+    cache_key = series_name
     
     # Check cache first
-    cached_data = cache.get(cache_key)
+    cached_data = _fred_cache.get(cache_key)
     if cached_data:
         logger.info(f"Returning cached {series_name}")
         return cached_data
@@ -216,7 +220,7 @@ def get_fred_series(series_id: str, series_name: str, params: Optional[Dict] = N
             }
             
             # Cache the result
-            cache.set(cache_key, data, CACHE_TIMEOUT)
+            _fred_cache.set(cache_key, data)
             
             return data
         else:
@@ -262,5 +266,5 @@ def clear_rate_cache():
     """
     Clear all cached FRED data.
     """
-    cache.delete_pattern("fred_api:*")
+    _fred_cache.invalidate()
     logger.info("Cleared all FRED API caches")
@@ -0,0 +1,251 @@
+"""
+Side-effect outbox: debounced, batched post-save work.
+
+WHAT: Signals record "this target needs X" in SideEffectEvent; a dispatcher later runs X
+      once per batch of targets (geocoding, SharePoint folders, AI note summaries,
+      asset-class sync)
+WHY: The post_save receivers did the slow/networked work inline, once per row - every
+     AMNote save waited on Gemini, every AcqProperty on Geocodio, every AcqAsset on
+     SharePoint - so request latency and tape-import time grew with the external calls
+HOW: - emit_side_effects(kind, ids): one INSERT .. ON CONFLICT per call, inside the
+       caller's transaction (a rollback drops the event). A repeat event for a pending
+       target only pushes its window forward, so bursts coalesce per hub/trade.
+     - dispatch_side_effects(): claims due rows per kind (SELECT .. FOR UPDATE SKIP
+       LOCKED + lease), calls the kind's registered handler once with all target ids,
+       then deletes the rows. Failures back off and end as status FAILED.
+     - After commit, an in-process dispatcher thread wakes up when the window closes, so
+       web requests and CLI imports do not wait for the work. `manage.py
+       dispatch_side_effects` drains anything left (deploys, crashed workers).
+
+Handlers are registered by the app that owns the side effect (acq_module.signals,
+am_module.sig_note_summary, am_module.sig_asset_class, sharepoint signals):
+
+    register_side_effect_handler(SideEffectEvent.Kind.GEOCODE, geocode_rows)
+
+A handler receives a sorted list of target ids and must be idempotent (a target may be
+dispatched again if it is re-emitted while its batch is running). Raising marks the
+whole batch for retry.
+
+Docs reviewed:
+- Transactional outbox pattern: https://microservices.io/patterns/data/transactional-outbox.html
+- QuerySet.bulk_create(update_conflicts=...): https://docs.djangoproject.com/en/5.2/ref/models/querysets/#bulk-create
+- select_for_update(skip_locked=True): https://docs.djangoproject.com/en/5.2/ref/models/querysets/#select-for-update
+- transaction.on_commit: https://docs.djangoproject.com/en/5.2/topics/db/transactions/#performing-actions-after-commit
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from datetime import timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from django.db import connection, transaction
+from django.db.models import F, Min
+from django.utils import timezone
+
+from core.models import SideEffectEvent
+
+logger = logging.getLogger(__name__)
+
+# Debounce window: events for the same target within this many seconds run once
+SIDE_EFFECT_WINDOW_SECONDS: float = float(os.getenv("SIDE_EFFECT_WINDOW_SECONDS", "2"))
+# Run the dispatcher in a background thread of the emitting process after commit
+SIDE_EFFECT_INLINE_DISPATCH: bool = os.getenv("SIDE_EFFECT_INLINE_DISPATCH", "1").lower() not in {"0", "false", "no"}
+SIDE_EFFECT_MAX_ATTEMPTS: int = int(os.getenv("SIDE_EFFECT_MAX_ATTEMPTS", "5"))
+SIDE_EFFECT_RETRY_SECONDS: int = 30
+# Claimed rows are invisible to other dispatchers for this long (crash recovery)
+SIDE_EFFECT_LEASE_SECONDS: int = 15 * 60
+# Target ids per handler call
+SIDE_EFFECT_BATCH_LIMIT: int = int(os.getenv("SIDE_EFFECT_BATCH_LIMIT", "1000"))
+# The inline thread keeps waiting for upcoming windows up to this far ahead
+_INLINE_MAX_WAIT_SECONDS: float = 60.0
+
+_HANDLERS: Dict[str, Callable[[List[int]], Any]] = {}
+
+
+def register_side_effect_handler(kind: str, handler: Callable[[List[int]], Any]) -> None:
+    """Register the batch handler for one SideEffectEvent.Kind (last registration wins)."""
+    _HANDLERS[str(kind)] = handler
+
+
+def emit_side_effects(kind: str, target_ids: Iterable[Any], *, delay: Optional[float] = None) -> int:
+    """Queue ``kind`` for every target id; returns the number of distinct targets queued.
+
+    Call from signals/bulk writers inside the write transaction. ``delay`` overrides the
+    debounce window (0 = dispatch on the next pass).
+    """
+    ids = sorted({int(target) for target in target_ids if target})
+    if not ids:
+        return 0
+    now = timezone.now()
+    window = SIDE_EFFECT_WINDOW_SECONDS if delay is None else delay
+    available_at = now + timedelta(seconds=window)
+    # WHAT: Savepoint - a failed INSERT must not poison the caller's transaction
+    with transaction.atomic():
+        SideEffectEvent.objects.bulk_create(
+            [
+                SideEffectEvent(
+                    kind=kind,
+                    target_id=target_id,
+                    status=SideEffectEvent.Status.PENDING,
+                    enqueued_at=now,
+                    available_at=available_at,
+                )
+                for target_id in ids
+            ],
+            batch_size=500,
+            # WHAT: Coalesce - an existing row (pending, leased or failed) is re-armed
+            update_conflicts=True,
+            unique_fields=["kind", "target_id"],
+            update_fields=["status", "enqueued_at", "available_at", "attempts", "last_error"],
+        )
+    if SIDE_EFFECT_INLINE_DISPATCH:
+        transaction.on_commit(_InlineDispatcher.wake)
+    return len(ids)
+
+
+def emit_side_effect(kind: str, target_id: Any, *, delay: Optional[float] = None) -> int:
+    """Single-target convenience wrapper for post_save receivers."""
+    return emit_side_effects(kind, [target_id], delay=delay)
+
+
+def _claim(kind: str, limit: int) -> Tuple[List[Tuple[int, int, int]], Any]:
+    """Lease up to ``limit`` due rows of one kind; returns (rows, claimed_at)."""
+    now = timezone.now()
+    with transaction.atomic():
+        rows = list(
+            SideEffectEvent.objects
+            .select_for_update(skip_locked=True)
+            .filter(kind=kind, status=SideEffectEvent.Status.PENDING, available_at__lte=now)
+            .order_by("available_at", "id")
+            .values_list("id", "target_id", "attempts")[:limit]
+        )
+        if rows:
+            SideEffectEvent.objects.filter(pk__in=[row[0] for row in rows]).update(
+                available_at=now + timedelta(seconds=SIDE_EFFECT_LEASE_SECONDS),
+                attempts=F("attempts") + 1,
+            )
+    return rows, now
+
+
+def _record_failure(rows: Sequence[tuple], claimed_at, error: str) -> None:
+    """Back off (attempts x SIDE_EFFECT_RETRY_SECONDS) or give up after max attempts."""
+    now = timezone.now()
+    by_attempt: Dict[int, List[int]] = {}
+    for pk, _target, attempts in rows:
+        by_attempt.setdefault(attempts + 1, []).append(pk)
+    for attempts, pks in by_attempt.items():
+        # WHAT: enqueued_at filter - a row re-emitted meanwhile keeps its fresh window
+        qs = SideEffectEvent.objects.filter(pk__in=pks, enqueued_at__lte=claimed_at)
+        if attempts >= SIDE_EFFECT_MAX_ATTEMPTS:
+            qs.update(status=SideEffectEvent.Status.FAILED, last_error=error[:2000])
+        else:
+            qs.update(
+                available_at=now + timedelta(seconds=SIDE_EFFECT_RETRY_SECONDS * attempts),
+                last_error=error[:2000],
+            )
+
+
+def dispatch_side_effects(
+    kinds: Optional[Iterable[str]] = None,
+    *,
+    limit: int = SIDE_EFFECT_BATCH_LIMIT,
+) -> Dict[str, Dict[str, int]]:
+    """Run every due event once, grouped per kind; returns {kind: {"targets", "failed"}}.
+
+    Each kind is drained in batches of ``limit`` target ids until no due rows remain.
+    """
+    summary: Dict[str, Dict[str, int]] = {}
+    for kind in kinds or SideEffectEvent.Kind.values:
+        stats = summary.setdefault(kind, {"targets": 0, "failed": 0})
+        while True:
+            rows, claimed_at = _claim(kind, limit)
+            if not rows:
+                break
+            target_ids = sorted({row[1] for row in rows})
+            handler = _HANDLERS.get(kind)
+            try:
+                if handler is None:
+                    raise LookupError(f"No side-effect handler registered for '{kind}'")
+                handler(target_ids)
+            except Exception as exc:
+                logger.exception("[Outbox] %s handler failed for %d targets", kind, len(target_ids))
+                _record_failure(rows, claimed_at, f"{type(exc).__name__}: {exc}")
+                stats["failed"] += len(target_ids)
+                # WHAT: Stop this kind for the pass; the failed rows are now backing off
+                break
+            SideEffectEvent.objects.filter(
+                pk__in=[row[0] for row in rows], enqueued_at__lte=claimed_at,
+            ).delete()
+            stats["targets"] += len(target_ids)
+            logger.info("[Outbox] %s: dispatched %d targets", kind, len(target_ids))
+    return {kind: stats for kind, stats in summary.items() if stats["targets"] or stats["failed"]}
+
+
+def next_due_at():
+    """available_at of the earliest pending event (None when the outbox is empty)."""
+    return (
+        SideEffectEvent.objects
+        .filter(status=SideEffectEvent.Status.PENDING)
+        .aggregate(next_due=Min("available_at"))["next_due"]
+    )
+
+
+class _InlineDispatcher:
+    """One background dispatcher thread per process, woken after commits that emitted events.
+
+    The thread sleeps until the debounce window closes, drains due events and keeps going
+    while more events are due within _INLINE_MAX_WAIT_SECONDS; then it exits. It is not a
+    daemon so a CLI import finishes its queued side effects before the process exits.
+    """
+
+    _lock = threading.Lock()
+    _thread: Optional[threading.Thread] = None
+    _wakeups = 0
+
+    @classmethod
+    def wake(cls) -> None:
+        with cls._lock:
+            cls._wakeups += 1
+            if cls._thread is not None and cls._thread.is_alive():
+                return
+            cls._thread = threading.Thread(target=cls._run, name="side-effect-dispatcher")
+            cls._thread.start()
+
+    @classmethod
+    def _run(cls) -> None:
+        try:
+            while True:
+                with cls._lock:
+                    seen = cls._wakeups
+                due = next_due_at()
+                if due is None:
+                    wait = None
+                else:
+                    wait = (due - timezone.now()).total_seconds()
+                if wait is None or wait > _INLINE_MAX_WAIT_SECONDS:
+                    with cls._lock:
+                        if cls._wakeups == seen:
+                            cls._thread = None
+                            return
+                    continue
+                if wait > 0:
+                    threading.Event().wait(wait + 0.05)
+                dispatch_side_effects()
+        except Exception:
+            logger.exception("[Outbox] Inline dispatcher stopped")
+            with cls._lock:
+                cls._thread = None
+        finally:
+            connection.close()
+
+
+__all__ = [
+    "dispatch_side_effects",
+    "emit_side_effect",
+    "emit_side_effects",
+    "next_due_at",
+    "register_side_effect_handler",
+]
@@ -0,0 +1,196 @@
+"""Core signals: keep the calendar projection (CalendarEventProjection), the activity feed
+(ActivityEvent, unread counters, hub labels) and the GL monthly rollup current, and drop the
+cached FC timeline matrix when foreclosure reference data changes.
+
+Imported by core.apps.CoreConfig.ready(). Each calendar receiver only queues ids; the rebuild
+runs once per transaction in core/services/serv_co_calendarIndex.py (flush after commit).
+
+Docs reviewed:
+- Django signals: https://docs.djangoproject.com/en/5.2/topics/signals/
+- transaction.on_commit: https://docs.djangoproject.com/en/5.2/topics/db/transactions/#performing-actions-after-commit
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+
+from core.services.serv_co_calendarIndex import (
+    SOURCE_ACQ_LOAN,
+    SOURCE_PROJECTED,
+    SOURCE_SERVICER,
+    SOURCE_TRADE_ASSUMPTION,
+    HUB_SOURCES,
+    queue_calendar_refresh,
+)
+from core.services import serv_co_activityFeed as activity_feed
+from core.services import serv_co_generalLedger as general_ledger
+from core.services.serv_co_fcTimelines import invalidate_fc_matrix_cache
+from core.services.serv_co_capitalAccounts import invalidate_capital_accounts
+from core.services.serv_co_commercialAnalytics import invalidate_commercial_analytics
+
+# WHAT: Model label → (projection sources, scope column, instance attribute holding the id)
+# WHY: One table lists which calendar events depend on which model
+CALENDAR_DEPENDENCIES = {
+    'am_module.ServicerLoanData': ((SOURCE_SERVICER,), 'source_id', 'pk'),
+    'acq_module.TradeLevelAssumption': ((SOURCE_TRADE_ASSUMPTION,), 'source_id', 'pk'),
+    # Trade/seller names are part of the bid/settlement titles
+    'acq_module.Trade': ((SOURCE_TRADE_ASSUMPTION,), 'trade_id', 'pk'),
+    'acq_module.Seller': ((SOURCE_TRADE_ASSUMPTION,), 'seller_id', 'pk'),
+    # Seller/trade membership and property addresses of hub-keyed events
+    'acq_module.AcqAsset': (HUB_SOURCES, 'asset_hub_id', 'pk'),
+    'acq_module.AcqLoan': ((SOURCE_ACQ_LOAN,), 'asset_hub_id', 'asset_id'),
+    'acq_module.AcqProperty': ((SOURCE_ACQ_LOAN, SOURCE_PROJECTED), 'asset_hub_id', 'asset_id'),
+    'am_module.BlendedOutcomeModel': ((SOURCE_PROJECTED,), 'asset_hub_id', 'asset_hub_id'),
+    'am_module.ReUWAMProjections': ((SOURCE_PROJECTED,), 'asset_hub_id', 'asset_hub_id'),
+    # servicer_id is part of the projected liquidation title
+    'core.AssetIdHub': ((SOURCE_PROJECTED,), 'asset_hub_id', 'pk'),
+}
+
+
+def _make_handler(sources, scope, attr):
+    def _handler(sender, instance, **kwargs):
+        target = getattr(instance, attr, None)
+        if target is None:
+            return
+        for source in sources:
+            queue_calendar_refresh(source, [target], scope=scope)
+    return _handler
+
+
+# WHAT: Keep strong references to the generated handlers
+# WHY: Signals hold weak references by default
+_HANDLERS = {}
+
+for _label, (_sources, _scope, _attr) in CALENDAR_DEPENDENCIES.items():
+    _HANDLERS[_label] = _make_handler(_sources, _scope, _attr)
+    post_save.connect(_HANDLERS[_label], sender=_label, dispatch_uid=f'calendar_index_save_{_label}')
+    post_delete.connect(_HANDLERS[_label], sender=_label, dispatch_uid=f'calendar_index_delete_{_label}')
+
+
+# WHAT: Single-row edits to FC reference data (admin, ModelViewSet update). The bulk
+#       upserts in serv_co_fcTimelines skip post_save and invalidate on their own.
+FC_MATRIX_DEPENDENCIES = ('core.FCTimelines', 'core.FCStatus', 'core.StateReference')
+
+
+def _fc_matrix_changed(sender, instance, **kwargs):
+    transaction.on_commit(invalidate_fc_matrix_cache)
+
+
+for _label in FC_MATRIX_DEPENDENCIES:
+    post_save.connect(_fc_matrix_changed, sender=_label, dispatch_uid=f'fc_matrix_save_{_label}')
+    post_delete.connect(_fc_matrix_changed, sender=_label, dispatch_uid=f'fc_matrix_delete_{_label}')
+
+
+# WHAT: Any cap-stack edit can move a capital account, so the whole namespace goes
+CAPITAL_ACCOUNT_DEPENDENCIES = (
+    'core.CoInvestor', 'core.InvestorContribution', 'core.InvestorDistribution',
+    'core.Entity', 'core.FundLegalEntity', 'core.FundMembership', 'core.EntityMembership',
+)
+
+
+def _capital_accounts_changed(sender, instance, **kwargs):
+    transaction.on_commit(invalidate_capital_accounts)
+
+
+for _label in CAPITAL_ACCOUNT_DEPENDENCIES:
+    post_save.connect(_capital_accounts_changed, sender=_label, dispatch_uid=f'capital_accounts_save_{_label}')
+    post_delete.connect(_capital_accounts_changed, sender=_label, dispatch_uid=f'capital_accounts_delete_{_label}')
+
+
+COMMERCIAL_ANALYTICS_DEPENDENCIES = ('core.HistoricalPropertyCashFlow', 'core.UnitMix', 'core.RentRoll', 'core.Valuation')
+
+
+def _commercial_analytics_changed(sender, instance, **kwargs):
+    transaction.on_commit(invalidate_commercial_analytics)
+
+
+for _label in COMMERCIAL_ANALYTICS_DEPENDENCIES:
+    post_save.connect(_commercial_analytics_changed, sender=_label, dispatch_uid=f'commercial_analytics_save_{_label}')
+    post_delete.connect(_commercial_analytics_changed, sender=_label, dispatch_uid=f'commercial_analytics_delete_{_label}')
+
+
+# ---------------------------------------------------------------------------
+# Activity feed
+# ---------------------------------------------------------------------------
+def _notification_saved(sender, instance, created, **kwargs):
+    activity_feed.record_activity([activity_feed.event_for_notification(instance)])
+    if created:
+        activity_feed.notification_created()
+
+
+def _notification_deleting(sender, instance, **kwargs):
+    activity_feed.notification_deleting(instance.pk)
+
+
+def _notification_deleted(sender, instance, **kwargs):
+    activity_feed.remove_activity('notification', [instance.pk])
+
+
+def _notification_read(sender, instance, created, **kwargs):
+    if created:
+        activity_feed.notification_read(instance.user_id)
+
+
+def _audit_logged(sender, instance, created, **kwargs):
+    if created:
+        activity_feed.record_activity([activity_feed.event_for_audit(instance)])
+
+
+def _audit_deleted(sender, instance, **kwargs):
+    activity_feed.remove_activity('audit', [instance.pk])
+
+
+post_save.connect(_notification_saved, sender='core.Notification', dispatch_uid='activity_notification_save')
+pre_delete.connect(_notification_deleting, sender='core.Notification', dispatch_uid='activity_notification_pre_delete')
+post_delete.connect(_notification_deleted, sender='core.Notification', dispatch_uid='activity_notification_delete')
+post_save.connect(_notification_read, sender='core.NotificationRead', dispatch_uid='activity_notification_read')
+post_save.connect(_audit_logged, sender='am_module.AuditLog', dispatch_uid='activity_audit_save')
+post_delete.connect(_audit_deleted, sender='am_module.AuditLog', dispatch_uid='activity_audit_delete')
+
+# WHAT: Model label → instance attribute holding the hub id used in feed titles
+HUB_LABEL_DEPENDENCIES = {
+    'core.AssetIdHub': 'pk',
+    'acq_module.AcqAsset': 'pk',
+    'am_module.ServicerLoanData': 'asset_hub_id',
+}
+
+
+def _make_hub_label_handler(attr):
+    def _handler(sender, instance, **kwargs):
+        activity_feed.invalidate_hub_labels([getattr(instance, attr, None)])
+    return _handler
+
+
+for _label, _attr in HUB_LABEL_DEPENDENCIES.items():
+    _HANDLERS[f'hub_label:{_label}'] = _make_hub_label_handler(_attr)
+    post_save.connect(_HANDLERS[f'hub_label:{_label}'], sender=_label, dispatch_uid=f'hub_label_save_{_label}')
+    post_delete.connect(_HANDLERS[f'hub_label:{_label}'], sender=_label, dispatch_uid=f'hub_label_delete_{_label}')
+
+
+# ---------------------------------------------------------------------------
+# GL monthly rollup
+# ---------------------------------------------------------------------------
+def _gl_entry_saving(sender, instance, raw=False, update_fields=None, **kwargs):
+    # WHAT: A posting_date edit also changes the month the entry leaves
+    if raw or not instance.pk or (update_fields is not None and 'posting_date' not in update_fields):
+        return
+    previous = sender.objects.filter(pk=instance.pk).values_list('posting_date', flat=True).first()
+    if previous and previous != instance.posting_date:
+        general_ledger.queue_gl_rollup_refresh([previous])
+
+
+def _gl_entry_changed(sender, instance, **kwargs):
+    general_ledger.queue_gl_rollup_refresh([instance.posting_date])
+
+
+pre_save.connect(_gl_entry_saving, sender='core.GeneralLedgerEntries', dispatch_uid='gl_rollup_pre_save')
+post_save.connect(_gl_entry_changed, sender='core.GeneralLedgerEntries', dispatch_uid='gl_rollup_save')
+post_delete.connect(_gl_entry_changed, sender='core.GeneralLedgerEntries', dispatch_uid='gl_rollup_delete')
+
+
+def _gl_bucket_deleting(sender, instance, **kwargs):
+    # WHAT: Entries move to bucket=NULL through an .update() (no signals) and the rollup
+    #       rows cascade away, so re-fold the bucket's months after commit
+    general_ledger.queue_gl_rollup_refresh_for(instance.entries.all())
+
+
+pre_delete.connect(_gl_bucket_deleting, sender='core.GeneralLedgerBucket', dispatch_uid='gl_rollup_bucket_pre_delete')
@@ -0,0 +1,20 @@
+"""Shared model fixtures for tests that need reference rows with many required columns."""
+
+from decimal import Decimal
+
+from core.models import StateReference
+
+
+def state_reference(state_code: str, **fields) -> StateReference:
+    """Unsaved StateReference with every required duration/rate zeroed; override via ``fields``."""
+    zero = Decimal('0')
+    values = {
+        'state_name': state_code, 'fc_state_months': 0, 'eviction_duration': 0, 'rehab_duration': 0,
+        'reo_marketing_duration': 0, 'reo_local_market_ext_duration': 0, 'dil_duration_avg': 0,
+        'property_tax_rate': zero, 'transfer_tax_rate': zero, 'insurance_rate_avg': zero,
+        'broker_closing_cost_fees_avg': zero, 'other_closing_cost_fees_avg': zero,
+        'fc_legal_fees_avg': zero, 'dil_cost_avg': zero, 'cfk_cost_avg': zero,
+        'value_adjustment_annual': zero,
+    }
+    values.update(fields)
+    return StateReference(state_code=state_code, **values)
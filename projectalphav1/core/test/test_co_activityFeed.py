@@ -0,0 +1,127 @@
+"""Tests for the activity feed log, keyset pages and unread counters (serv_co_activityFeed)."""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from am_module.models import AuditLog
+from am_module.models.model_am_servicersCleaned import ServicerLoanData
+from core.models import ActivityEvent, AssetIdHub, Notification, NotificationRead
+from core.services import serv_co_activityFeed as activity_feed
+from core.views.view_co_notifications import ActivityFeedView, NotificationViewSet
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class ActivityFeedTestCase(TestCase):
+    """Every event is reachable through cursors; counters match a recount after each change."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user('feed-reader')
+        self.hub = AssetIdHub.objects.create(sellertape_id='FEED-1', servicer_id='SB-9')
+        activity_feed.invalidate_hub_labels([self.hub.pk])
+        self.loan = ServicerLoanData.objects.create(
+            asset_hub=self.hub, address='5 Oak Ave', city='Mesa', state='AZ', zip_code='85201',
+        )
+        for idx in range(4):
+            Notification.objects.create(
+                event_type=Notification.EventType.TASK_CHANGED, title=f'Task {idx}', asset_hub=self.hub,
+            )
+            AuditLog.log_change(self.loan, 'current_balance', 1000 * idx, 1500 * idx, changed_by=self.user)
+        AuditLog.log_change(self.loan, 'updated_at', 'a', 'b')
+        Notification.objects.create(event_type=Notification.EventType.TRADE_IMPORT, title='No hub')
+
+    def _page(self, **params):
+        request = APIRequestFactory().get('/api/core/activity/', params)
+        force_authenticate(request, user=self.user)
+        with CaptureQueriesContext(connection) as ctx:
+            response = ActivityFeedView.as_view()(request)
+        self.assertEqual(response.status_code, 200, response.data)
+        return response, len(ctx.captured_queries)
+
+    def _notifications(self, action, method='get', pk=None):
+        factory = getattr(APIRequestFactory(), method)
+        request = factory(f'/api/core/notifications/{action}/')
+        force_authenticate(request, user=self.user)
+        view = NotificationViewSet.as_view({method: action.replace('-', '_')})
+        return view(request, pk=pk) if pk else view(request)
+
+    def test_cursor_pages_walk_the_merged_log_in_order(self):
+        expected = [
+            f'{source}:{source_id}'
+            for source, source_id in ActivityEvent.objects.order_by('-created_at', '-id').values_list('source', 'source_id')
+        ]
+        self.assertEqual(len(expected), 9)  # 5 notifications + 4 audit rows (updated_at skipped)
+
+        seen, cursor, page_queries = [], None, []
+        while True:
+            params = {'limit': 4, **({'cursor': cursor} if cursor else {})}
+            response, queries = self._page(**params)
+            seen += [item['id'] for item in response.data['results']]
+            page_queries.append(queries)
+            cursor = response.data['next_cursor']
+            self.assertEqual(response.get('X-Next-Cursor'), cursor)
+            if not cursor:
+                break
+        self.assertEqual(seen, expected)
+        # WHAT: event page + read flags; hub labels come from the cache after the first page
+        self.assertTrue(all(queries <= 2 for queries in page_queries[1:]), page_queries)
+
+        response, _queries = self._page(source='audit', asset_hub_id=self.hub.pk, limit=1)
+        item = response.data['results'][0]
+        self.assertEqual(item['title'], 'SB-9 - 5 Oak Ave, Mesa, AZ 85201')
+        self.assertEqual(item['message'], 'Current Balance: $3,000 → $4,500')
+        self.assertEqual(item['actor'], 'feed-reader')
+
+    def test_bad_cursor_is_rejected(self):
+        request = APIRequestFactory().get('/api/core/activity/', {'cursor': 'bm9wZQ'})
+        force_authenticate(request, user=self.user)
+        self.assertEqual(ActivityFeedView.as_view()(request).status_code, 400)
+
+    def test_hub_label_follows_hub_changes(self):
+        self._page(limit=1, source='notification', asset_hub_id=self.hub.pk)
+        self.hub.servicer_id = 'SB-10'
+        self.hub.save()
+        response, _queries = self._page(limit=1, source='notification', asset_hub_id=self.hub.pk)
+        self.assertTrue(response.data['results'][0]['title'].startswith('SB-10 - '))
+
+    def test_unread_counter_tracks_reads_creates_and_deletes(self):
+        def assert_count():
+            recount = Notification.objects.exclude(reads__user=self.user).count()
+            with self.assertNumQueries(1):
+                response = self._notifications('unread-count')
+            self.assertEqual(response.data['unread'], recount)
+
+        self.assertEqual(self._notifications('unread-count').data['unread'], 5)
+        assert_count()
+
+        Notification.objects.create(event_type=Notification.EventType.ASSET_LIQUIDATED, title='Sold')
+        assert_count()
+
+        first, second = Notification.objects.order_by('id')[:2]
+        self._notifications('mark-read', method='post', pk=first.pk)
+        self._notifications('mark-read', method='post', pk=first.pk)  # second read is a no-op
+        assert_count()
+
+        second.delete()  # unread -> leaves the count
+        first.delete()  # already read -> count unchanged
+        assert_count()
+
+        self._notifications('clear-all', method='post')
+        assert_count()
+        self.assertEqual(self._notifications('unread-count').data['unread'], 0)
+        self.assertFalse(NotificationRead.objects.filter(notification_id=first.pk).exists())
+
+        response, _queries = self._page(source='notification', limit=1)
+        self.assertTrue(response.data['results'][0]['is_read'])
+
+    def test_rebuild_matches_signal_written_rows(self):
+        fields = ('source', 'source_id', 'title', 'message', 'actor', 'asset_hub_id')
+        before = sorted(ActivityEvent.objects.values_list(*fields))
+        ActivityEvent.objects.all().delete()
+        summary = activity_feed.rebuild_activity_feed()
+        self.assertEqual(summary, {'notification': 5, 'audit': 4})
+        self.assertEqual(sorted(ActivityEvent.objects.values_list(*fields)), before)
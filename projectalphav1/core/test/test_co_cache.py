@@ -0,0 +1,74 @@
+"""Tests for the shared cache tier helpers (serv_co_cache)."""
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from core.services.serv_co_cache import (
+    LRUTTLCache,
+    SharedCache,
+    get_cache_stats,
+    reset_cache_stats,
+)
+
+LOCMEM_CACHE = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'core-cache-tests',
+    }
+}
+
+
+class LRUTTLCacheTestCase(SimpleTestCase):
+    """Test case for the in-process LRU/TTL cache."""
+
+    def test_evicts_least_recently_used(self):
+        lru = LRUTTLCache(maxsize=2, ttl=None)
+        lru.set('a', 1)
+        lru.set('b', 2)
+        lru.get('a')          # 'b' is now least recently used
+        lru.set('c', 3)
+        self.assertEqual(lru.get('a'), 1)
+        self.assertIsNone(lru.get('b'))
+        self.assertEqual(lru.get('c'), 3)
+
+    def test_expired_entries_are_misses(self):
+        lru = LRUTTLCache(maxsize=4, ttl=0)
+        lru.set('a', 1)
+        self.assertIsNone(lru.get('a'))
+        self.assertEqual(len(lru), 0)
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class SharedCacheTestCase(SimpleTestCase):
+    """Test case for SharedCache get_or_set, invalidation and metrics."""
+
+    def setUp(self):
+        cache.clear()
+        reset_cache_stats()
+
+    def test_get_or_set_and_metrics(self):
+        shared = SharedCache('test_ns', ttl=60)
+        calls = []
+        compute = lambda: calls.append(1) or {'rate': 6.5}
+        self.assertEqual(shared.get_or_set(('series', 1), compute), {'rate': 6.5})
+        self.assertEqual(shared.get_or_set(('series', 1), compute), {'rate': 6.5})
+        self.assertEqual(len(calls), 1)
+
+        stats = get_cache_stats()['test_ns']
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['hit_rate'], 0.5)
+
+    def test_falsy_values_are_hits(self):
+        shared = SharedCache('test_ns', ttl=60)
+        shared.set('empty', [])
+        self.assertEqual(shared.get('empty', 'missing'), [])
+
+    def test_invalidate_is_visible_to_other_instances(self):
+        """Two instances model two workers sharing one backend."""
+        worker_a = SharedCache('test_ns', ttl=60)
+        worker_b = SharedCache('test_ns', ttl=60)
+        worker_a.set('key', 'value')
+        self.assertEqual(worker_b.get('key'), 'value')
+        worker_b.invalidate()
+        self.assertIsNone(worker_a.get('key'))
@@ -0,0 +1,95 @@
+"""Tests for the calendar event projection (serv_co_calendarIndex) and get_calendar_events."""
+
+from datetime import date
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+
+from acq_module.models.model_acq_assumptions import TradeLevelAssumption
+from acq_module.models.model_acq_seller import AcqAsset, Seller, Trade
+from am_module.models.model_am_modeling import BlendedOutcomeModel
+from am_module.models.model_am_servicersCleaned import ServicerLoanData
+from core.models import AssetIdHub, CalendarEventProjection
+from core.services import serv_co_calendarIndex as calendar_index
+from core.views.view_co_calendar import get_calendar_events
+
+
+class CalendarIndexTestCase(TestCase):
+    """Signals keep the projection current; the endpoint reads it with one range query."""
+
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.seller = Seller.objects.create(name='Acme Bank')
+            self.trade = Trade.objects.create(seller=self.seller, trade_name='Pool 7')
+            self.assumption = TradeLevelAssumption.objects.create(
+                trade=self.trade, servicer=None, bid_date=date(2025, 3, 4), settlement_date=date(2025, 4, 20),
+            )
+            self.hub = AssetIdHub.objects.create(sellertape_id='CAL-1', servicer_id='SB-1')
+            AcqAsset.objects.create(asset_hub=self.hub, seller=self.seller, trade=self.trade)
+            self.servicer = ServicerLoanData.objects.create(
+                asset_hub=self.hub, address='12 Elm St', city='Tulsa', state='OK',
+                actual_fc_sale_date=date(2025, 3, 18),
+            )
+            BlendedOutcomeModel.objects.create(asset_hub=self.hub, expected_exit_date=date(2025, 3, 25))
+
+    def _get(self, **params):
+        request = APIRequestFactory().get('/api/core/calendar/events/', params)
+        with CaptureQueriesContext(connection) as ctx:
+            response = get_calendar_events(request)
+        return response, len(ctx.captured_queries)
+
+    def test_month_view_is_a_range_query(self):
+        response, queries = self._get(start_date='2025-03-01', end_date='2025-03-31', trade_id=self.trade.pk)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [event['id'] for event in response.data],
+            [
+                f'trade_assumption:{self.assumption.pk}:bid_date',
+                f'servicer_data:{self.servicer.pk}:actual_fc_sale_date',
+                f'projected_liquidation:{self.hub.pk}',
+            ],
+        )
+        self.assertEqual(response.data[0]['title'], 'Acme Bank - Pool 7')
+        self.assertEqual(response.data[2]['title'], 'SB-1 - Unknown, ')
+        # WHAT: projection query + custom CalendarEvent query, however large the book is
+        self.assertEqual(queries, 2)
+
+        response, _queries = self._get(start_date='2025-03-01', end_date='2025-04-30', categories='trade')
+        self.assertEqual([event.get('sub_type') for event in response.data], ['bid_date', 'settlement_date'])
+
+    def test_source_changes_update_and_remove_events(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.trade.trade_name = 'Pool 7B'
+            self.trade.save()
+            self.assumption.bid_date = None
+            self.assumption.save()
+            self.servicer.delete()
+
+        keys = set(CalendarEventProjection.objects.values_list('event_key', flat=True))
+        self.assertEqual(keys, {
+            f'trade_assumption:{self.assumption.pk}:settlement_date',
+            f'projected_liquidation:{self.hub.pk}',
+        })
+        settlement = CalendarEventProjection.objects.get(source=calendar_index.SOURCE_TRADE_ASSUMPTION)
+        self.assertEqual(settlement.payload['title'], 'Acme Bank - Pool 7B')
+
+    def test_deferred_block_refreshes_each_source_once(self):
+        with mock.patch.object(calendar_index, 'refresh_calendar_events') as refresh:
+            with self.captureOnCommitCallbacks(execute=True):
+                with calendar_index.deferred_calendar_refresh():
+                    for day in (5, 6, 7):
+                        ServicerLoanData.objects.create(asset_hub=self.hub, actual_fc_sale_date=date(2025, 5, day))
+                    refresh.assert_not_called()
+        self.assertEqual(refresh.call_count, 1)
+        (source, ids), kwargs = refresh.call_args
+        self.assertEqual((source, len(ids), kwargs), (calendar_index.SOURCE_SERVICER, 3, {'scope': 'source_id'}))
+
+    def test_rebuild_matches_incremental_state(self):
+        before = dict(CalendarEventProjection.objects.values_list('event_key', 'payload'))
+        CalendarEventProjection.objects.all().delete()
+        calendar_index.rebuild_calendar_index()
+        self.assertEqual(dict(CalendarEventProjection.objects.values_list('event_key', 'payload')), before)
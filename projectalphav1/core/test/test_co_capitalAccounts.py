@@ -0,0 +1,127 @@
+"""Tests for fund capital accounts and pro-rata allocations (serv_co_capitalAccounts)."""
+
+from datetime import date
+from decimal import Decimal
+
+import numpy as np
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, SimpleTestCase
+from django.test.utils import CaptureQueriesContext
+
+from core.models import (
+    CoInvestor, Entity, EntityMembership, FundMembership, InvestorContribution, InvestorDistribution, MasterCRM,
+)
+from core.services.serv_co_capitalAccounts import (
+    allocate_by_group, allocate_pro_rata, build_co_investor_positions, build_fund_capital_accounts,
+    get_fund_capital_accounts,
+)
+
+
+class AllocationTestCase(SimpleTestCase):
+    """Largest-remainder splits always add back to the distributed cents."""
+
+    def test_pro_rata_sums_exactly(self):
+        self.assertEqual(allocate_pro_rata(100, np.array([1, 1, 1])).tolist(), [34, 33, 33])
+        self.assertEqual(allocate_pro_rata(-100, np.array([1, 1, 1])).tolist(), [-34, -33, -33])
+        self.assertEqual(allocate_pro_rata(1000, np.array([0, 0])).tolist(), [0, 0])
+        split = allocate_pro_rata(123457, np.array([33.33, 33.33, 33.34]))
+        self.assertEqual(int(split.sum()), 123457)
+
+    def test_groups_are_independent(self):
+        split = allocate_by_group(np.array([10, 7]), np.array([1, 0, 1, 0]), np.array([1, 2, 1, 1]))
+        self.assertEqual(split.tolist(), [4, 7, 3, 3])
+
+
+class FundCapitalAccountsTestCase(TestCase):
+    """Array results match the per-instance model methods; look-through reaches beneficial owners."""
+
+    def setUp(self):
+        cache.clear()
+        self.fund = Entity.objects.create(name='Fund I', entity_type='fund')
+        self.gp = Entity.objects.create(name='GP LLC', entity_type='llc')
+        self.trust = Entity.objects.create(name='Family Trust', entity_type='trust')
+        self.alice = Entity.objects.create(name='Alice', entity_type='individual')
+        self.bob = Entity.objects.create(name='Bob', entity_type='individual')
+        self.lapsed = Entity.objects.create(name='Lapsed LP', entity_type='llc')
+        for entity, member_type, pct, committed, contributed, active in [
+            (self.gp, 'gp', '10.00', '100000.00', '50000.00', True),
+            (self.trust, 'lp', '90.00', '900000.00', '450000.00', True),
+            (self.lapsed, 'lp', '5.00', '50000.00', '50000.00', False),
+        ]:
+            FundMembership.objects.create(
+                fund=self.fund, entity=entity, member_type=member_type, admission_date=date(2024, 1, 1),
+                ownership_percentage=Decimal(pct), capital_committed=Decimal(committed),
+                capital_contributed=Decimal(contributed), is_active=active,
+            )
+        # WHAT: Distribution % overrides ownership % for Bob
+        EntityMembership.objects.create(
+            parent_entity=self.trust, member_entity=self.alice, ownership_percentage=Decimal('50.00'),
+            membership_date=date(2024, 1, 1),
+        )
+        EntityMembership.objects.create(
+            parent_entity=self.trust, member_entity=self.bob, ownership_percentage=Decimal('50.00'),
+            distribution_percentage=Decimal('100.00'), membership_date=date(2024, 1, 1),
+        )
+
+    def test_accounts_and_allocation(self):
+        with CaptureQueriesContext(connection) as ctx:
+            payload = build_fund_capital_accounts(self.fund.pk, Decimal('1000.01'))
+        self.assertLessEqual(len(ctx.captured_queries), 6)
+
+        members = {row['entity_id']: row for row in payload['members']}
+        for membership in FundMembership.objects.filter(fund=self.fund):
+            self.assertEqual(members[membership.entity_id]['unfunded_commitment'], membership.remaining_commitment())
+        self.assertEqual(members[self.gp.pk]['percent_called'], 0.5)
+        self.assertEqual(members[self.gp.pk]['allocation'], Decimal('100.00'))
+        self.assertEqual(members[self.trust.pk]['allocation'], Decimal('900.01'))
+        self.assertEqual(members[self.lapsed.pk]['allocation'], Decimal('0.00'))
+        self.assertEqual(payload['totals']['unfunded_commitment'], Decimal('500000.00'))
+
+        owners = {row['entity_id']: row for row in payload['beneficial_owners']}
+        self.assertEqual(owners[self.alice.pk]['allocation'], Decimal('300.00'))  # 50 / (50 + 100)
+        self.assertEqual(owners[self.bob.pk]['allocation'], Decimal('600.01'))
+        self.assertEqual(owners[self.bob.pk]['depth'], 1)
+        self.assertNotIn(self.trust.pk, owners)
+        self.assertEqual(sum(row['allocation'] for row in payload['beneficial_owners']), Decimal('1000.01'))
+        self.assertIsNone(build_fund_capital_accounts(999999))
+
+    def test_cache_dropped_on_membership_change(self):
+        self.assertEqual(get_fund_capital_accounts(self.fund.pk)['totals']['member_count'], 3)
+        with self.captureOnCommitCallbacks(execute=True):
+            FundMembership.objects.filter(entity=self.lapsed).delete()
+        self.assertEqual(get_fund_capital_accounts(self.fund.pk)['totals']['member_count'], 2)
+
+
+class CoInvestorPositionsTestCase(TestCase):
+    """Bulk co-investor positions match CoInvestor.total_contributed() / net_position()."""
+
+    def test_positions_match_model_methods(self):
+        contact = MasterCRM.objects.create(contact_name='Pat Investor', firm='Pat Capital')
+        funded = CoInvestor.objects.create(
+            crm_contact=contact, commitment_amount=Decimal('1000.00'), ownership_percentage=Decimal('25.00'),
+        )
+        empty = CoInvestor.objects.create(ownership_percentage=Decimal('75.00'))
+        InvestorContribution.objects.create(co_investor=funded, contribution_date=date(2025, 1, 1), amount=Decimal('400.00'))
+        InvestorContribution.objects.create(co_investor=funded, contribution_date=date(2025, 2, 1), amount=Decimal('200.00'))
+        InvestorDistribution.objects.create(
+            co_investor=funded, distribution_date=date(2025, 6, 1), amount=Decimal('150.00'),
+            distribution_type='return_of_capital',
+        )
+
+        with CaptureQueriesContext(connection) as ctx:
+            payload = build_co_investor_positions(Decimal('100.00'))
+        self.assertEqual(len(ctx.captured_queries), 3)
+
+        rows = {row['co_investor_id']: row for row in payload['investors']}
+        for investor in (funded, empty):
+            self.assertEqual(rows[investor.pk]['total_contributed'], investor.total_contributed())
+            self.assertEqual(rows[investor.pk]['total_distributed'], investor.total_distributed())
+            self.assertEqual(rows[investor.pk]['net_position'], investor.net_position())
+        self.assertEqual(rows[funded.pk]['name'], 'Pat Investor')
+        self.assertEqual(rows[funded.pk]['unfunded_commitment'], Decimal('400.00'))
+        self.assertEqual(rows[funded.pk]['distributed_by_type']['return_of_capital'], Decimal('150.00'))
+        self.assertEqual(rows[funded.pk]['distribution_multiple'], 0.25)
+        self.assertIsNone(rows[empty.pk]['unfunded_commitment'])
+        self.assertIsNone(rows[empty.pk]['distribution_multiple'])
+        self.assertEqual((rows[funded.pk]['allocation'], rows[empty.pk]['allocation']), (Decimal('25.00'), Decimal('75.00')))
@@ -0,0 +1,102 @@
+"""Tests for the bulk cash flow series builder (serv_co_cashFlowSeries)."""
+
+from datetime import date
+from decimal import Decimal
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from am_module.models.model_am_modeling import BlendedOutcomeModel
+from core.models import AssetIdHub, ChartOfAccounts, GeneralLedgerEntries, LLCashFlowSeries, LLTransactionSummary
+from core.services.serv_co_cashFlowSeries import rebuild_cash_flow_series
+
+
+class CashFlowSeriesTestCase(TestCase):
+    """GL entries become dense monthly series with the same totals save() computes."""
+
+    def setUp(self):
+        self.hub = AssetIdHub.objects.create(sellertape_id='CF-1')
+        self.other = AssetIdHub.objects.create(sellertape_id='CF-2')
+        BlendedOutcomeModel.objects.create(asset_hub=self.hub, purchase_date=date(2025, 1, 31))
+        for account, reference in [
+            ('1500', 'purchase_price_realized'),
+            ('4100', 'income_interest_realized'),
+            ('4200', 'income_rent'),
+            ('6100', 'expense_servicing_realized'),
+            ('1000', None),
+        ]:
+            ChartOfAccounts.objects.create(
+                account_number=account, account_name=f'Account {account}', account_type='Other',
+                transaction_table_reference=reference,
+            )
+        lines = [
+            ('GL-1', self.hub, '1500', date(2025, 1, 31), '100000.00', '0'),
+            ('GL-2', self.hub, '6100', date(2025, 2, 27), '25.00', '0'),        # before Feb 28 -> period 0
+            ('GL-3', self.hub, '4100', date(2025, 4, 2), '0', '500.00'),         # period 2 (Mar 31 - Apr 29)
+            ('GL-4', self.hub, '4100', date(2025, 4, 20), '20.00', '0'),         # reversal nets against GL-3
+            ('GL-5', self.hub, '1000', date(2025, 4, 2), '500.00', '0'),         # unmapped account
+            ('GL-6', self.other, '4200', date(2025, 5, 10), '0', '1000.00'),     # no purchase date
+        ]
+        for entry, hub, account, posted, debit, credit in lines:
+            GeneralLedgerEntries.objects.create(
+                entry=entry, company_name='Fund I', account_number=account, account_name=f'Account {account}',
+                posting_date=posted, entry_date=posted, asset_hub=hub,
+                debit_amount=Decimal(debit), credit_amount=Decimal(credit),
+            )
+        LLTransactionSummary.objects.create(asset_hub=self.hub, expense_other_realized=Decimal('10.00'))
+        LLCashFlowSeries.objects.create(asset_hub=self.hub, period_number=9, income_rent=Decimal('5'))
+
+    def test_rebuild_replaces_series_and_summaries(self):
+        with CaptureQueriesContext(connection) as ctx:
+            result = rebuild_cash_flow_series()
+        self.assertLess(len(ctx.captured_queries), 15)
+        self.assertEqual(result.as_dict(), {'hubs': 2, 'series_deleted': 1, 'series_created': 4, 'summaries_written': 2})
+
+        series = list(LLCashFlowSeries.objects.filter(asset_hub=self.hub).order_by('period_number'))
+        self.assertEqual(
+            [(row.period_number, row.period_date) for row in series],
+            [(0, date(2025, 1, 31)), (1, date(2025, 2, 28)), (2, date(2025, 3, 31))],
+        )
+        self.assertEqual(series[0].purchase_price, Decimal('100000.00'))
+        self.assertEqual(series[0].servicing_expenses, Decimal('25.00'))
+        self.assertEqual(series[0].net_cash_flow, Decimal('-100025.00'))
+        self.assertEqual(series[1].net_cash_flow, Decimal('0.00'))
+        self.assertEqual((series[2].income_interest, series[2].total_income), (Decimal('480.00'), Decimal('480.00')))
+
+        other = LLCashFlowSeries.objects.get(asset_hub=self.other)
+        self.assertEqual((other.period_number, other.period_date, other.income_rent), (0, date(2025, 5, 10), Decimal('1000.00')))
+
+        # WHAT: Bulk totals match save() for the same line items
+        series[0].save()
+        self.assertEqual(series[0].total_expenses, Decimal('100025.00'))
+
+        summary = LLTransactionSummary.objects.get(asset_hub=self.hub)
+        self.assertEqual(summary.purchase_price_realized, Decimal('100000.00'))
+        self.assertEqual(summary.income_interest_realized, Decimal('480.00'))
+        self.assertEqual(summary.expense_servicing_realized, Decimal('25.00'))
+        self.assertEqual(summary.expense_other_realized, Decimal('10.00'))  # not GL-mapped - kept
+        self.assertEqual(summary.operating_expenses_total_realized, Decimal('10.00'))
+        self.assertEqual(summary.realized_gross_cost, Decimal('10.00'))
+        self.assertEqual(LLTransactionSummary.objects.get(asset_hub=self.other).income_rent_realized, Decimal('1000.00'))
+
+    def test_scoped_rebuild_leaves_other_hubs(self):
+        rebuild_cash_flow_series([self.other.pk], summaries=False)
+        self.assertTrue(LLCashFlowSeries.objects.filter(asset_hub=self.hub, period_number=9).exists())
+        self.assertEqual(LLCashFlowSeries.objects.filter(asset_hub=self.other).count(), 1)
+        self.assertFalse(LLTransactionSummary.objects.filter(asset_hub=self.other).exists())
+
+    def test_scoped_hub_without_activity_is_cleared(self):
+        rebuild_cash_flow_series()
+        LLTransactionSummary.objects.filter(asset_hub=self.other).update(expense_other_realized=Decimal('7.00'))
+        GeneralLedgerEntries.objects.filter(asset_hub=self.other).delete()
+        untouched = AssetIdHub.objects.create(sellertape_id='CF-3')
+
+        result = rebuild_cash_flow_series([self.other.pk, untouched.pk])
+        self.assertEqual((result.series_deleted, result.series_created, result.summaries_written), (1, 0, 1))
+        self.assertFalse(LLCashFlowSeries.objects.filter(asset_hub=self.other).exists())
+        summary = LLTransactionSummary.objects.get(asset_hub=self.other)
+        self.assertEqual(summary.income_rent_realized, Decimal('0.00'))
+        self.assertEqual(summary.expense_other_realized, Decimal('7.00'))  # not GL-mapped - kept
+        self.assertFalse(LLTransactionSummary.objects.filter(asset_hub=untouched).exists())
+        self.assertEqual(LLTransactionSummary.objects.get(asset_hub=self.hub).income_interest_realized, Decimal('480.00'))
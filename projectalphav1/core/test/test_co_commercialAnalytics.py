@@ -0,0 +1,91 @@
+"""Tests for portfolio commercial analytics (serv_co_commercialAnalytics)."""
+
+from datetime import date
+from decimal import Decimal
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from core.models import AssetIdHub, HistoricalPropertyCashFlow, RentRoll, UnitMix, Valuation
+from core.services.serv_co_commercialAnalytics import build_commercial_analytics
+
+MODEL_METRICS = (
+    'vacancy_loss', 'effective_gross_rent_revenue', 'effective_gross_income', 'total_utilities',
+    'total_operating_expenses', 'net_operating_income', 'operating_expense_ratio',
+)
+
+
+class CommercialAnalyticsTestCase(TestCase):
+    """Vectorized metrics match the HistoricalPropertyCashFlow helpers; rollups cover unit mix and rent roll."""
+
+    def setUp(self):
+        self.hub = AssetIdHub.objects.create(sellertape_id='CRE-1')
+        self.rent_only = AssetIdHub.objects.create(sellertape_id='CRE-2')
+        for year, gpr, vacancy, cam, taxes, water in [
+            (2022, '100000.00', '5.00', '2000.00', '12000.00', '800.00'),
+            (2023, '110000.00', '4.25', None, '12500.00', '850.00'),
+            (2025, '120000.10', '5.05', '2500.00', '13000.00', None),  # 2024 not reported
+        ]:
+            HistoricalPropertyCashFlow.objects.create(
+                asset_hub=self.hub, year=year, gross_potential_rent_revenue=Decimal(gpr),
+                vacancy_pct=Decimal(vacancy), cam_income=cam and Decimal(cam), other_income=Decimal('1500.00'),
+                property_taxes=Decimal(taxes), utilities_water=water and Decimal(water), insurance=Decimal('4000.00'),
+            )
+        Valuation.objects.create(asset_hub=self.hub, source='internal', asis_value=Decimal('900000'), value_date=date(2024, 1, 1))
+        Valuation.objects.create(asset_hub=self.hub, source='broker', asis_value=Decimal('1250000'), value_date=date(2025, 6, 30))
+
+        UnitMix.objects.create(asset_hub_id=self.hub, unit_type='1BR', unit_count=10, unit_avg_sqft=800, unit_avg_rent=Decimal('1200'))
+        UnitMix.objects.create(asset_hub_id=self.hub, unit_type='2BR', unit_count=5, unit_avg_sqft=1000, unit_avg_rent=Decimal('1500'))
+        for tenant, unit, sqft, rent, cam, end in [
+            ('Acme', '101', 1000, '1000.00', 100, date(2025, 7, 1)),
+            ('Beta', '102', 2000, '3000.00', None, date(2028, 1, 1)),
+            (None, '103', 1500, None, None, None),
+        ]:
+            RentRoll.objects.create(
+                asset_hub_id=self.rent_only, tenant_name=tenant, unit_name=unit, sq_feet=sqft,
+                rent=rent and Decimal(rent), cam_month=cam, lease_end_date=end,
+            )
+
+    def test_property_years_match_model_helpers(self):
+        with CaptureQueriesContext(connection) as ctx:
+            result = build_commercial_analytics(include_years=True, as_of=date(2025, 1, 1))
+        self.assertEqual(len(ctx.captured_queries), 3)
+
+        years = {row['year']: row for row in result['years']}
+        for cash_flow in HistoricalPropertyCashFlow.objects.filter(asset_hub=self.hub):
+            row = years[cash_flow.year]
+            for metric in MODEL_METRICS:
+                self.assertEqual(row[metric], float(getattr(cash_flow, metric)()), f'{cash_flow.year} {metric}')
+            self.assertEqual(row['cap_rate'], float(cash_flow.cap_rate()))
+
+        noi = {year: row['net_operating_income'] for year, row in years.items()}
+        self.assertEqual(years[2023]['noi_growth_pct'], round((noi[2023] - noi[2022]) / abs(noi[2022]) * 100, 2))
+        self.assertIsNone(years[2025]['noi_growth_pct'])
+        self.assertEqual(years[2025]['noi_rolling_avg'], round((noi[2023] + noi[2025]) / 2, 2))
+
+    def test_latest_year_and_rollups(self):
+        result = build_commercial_analytics([self.hub.pk, self.rent_only.pk], as_of=date(2025, 1, 1))
+        properties = {row['asset_hub_id']: row for row in result['properties']}
+
+        subject = properties[self.hub.pk]
+        self.assertEqual(subject['latest_year'], 2025)
+        self.assertEqual(subject['asis_value'], 1250000.0)
+        self.assertEqual((subject['units'], subject['unit_sqft']), (15.0, 13000.0))
+        self.assertEqual(subject['unit_mix_annual_rent'], 234000.0)
+        self.assertIsNone(subject['rent_roll_units'])
+
+        rent_roll = properties[self.rent_only.pk]
+        self.assertIsNone(rent_roll['latest_year'])
+        self.assertEqual((rent_roll['rent_roll_units'], rent_roll['occupied_units']), (3.0, 2.0))
+        self.assertEqual(rent_roll['occupancy_pct'], 66.67)
+        self.assertEqual(rent_roll['rent_roll_annual_rent'], 48000.0)
+        self.assertEqual(rent_roll['annual_cam'], 1200.0)
+        self.assertEqual(rent_roll['expiring_12m_pct'], 25.0)
+        self.assertEqual(rent_roll['walt_years'], round((1000 * 181 + 3000 * 1095) / 365.25 / 4000, 2))
+
+        total = result['total']
+        self.assertEqual(total['property_count'], 2)
+        self.assertEqual(total['net_operating_income'], subject['net_operating_income'])
+        self.assertEqual(total['cap_rate'], subject['cap_rate'])
+        self.assertEqual(build_commercial_analytics([])['properties'], [])
@@ -0,0 +1,143 @@
+"""Tests for the FC timeline matrix and bulk upserts (serv_co_fcTimelines, FCTimelinesViewSet)."""
+
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from acq_module.logic.logi_acq_durationAssumptions import get_state_fc_metrics
+from core.models import FCStatus, FCTimelines, StateReference
+from core.services.serv_co_fcTimelines import invalidate_fc_matrix_cache
+from core.test.fixtures import state_reference
+
+STATE_CODES = ['AL', 'AZ', 'CA', 'FL', 'GA', 'NY', 'OH', 'TX']
+STATUS_CODES = [code for code, _display in FCStatus.STATUS_CHOICES]
+
+
+def make_states(codes):
+    StateReference.objects.bulk_create([
+        state_reference(code, state_name=f'State {code}', judicialvsnonjudicial=code in {'FL', 'NY'}, fc_state_months=6)
+        for code in codes
+    ])
+
+
+def make_statuses(codes):
+    return FCStatus.objects.bulk_create([FCStatus(status=code, order=idx) for idx, code in enumerate(codes, start=1)])
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class FCTimelineMatrixTestCase(TestCase):
+    """Query counts do not grow with the number of states, statuses or uploaded rows."""
+
+    def setUp(self):
+        cache.clear()
+        invalidate_fc_matrix_cache()
+        self.client = APIClient()
+        self.client.force_authenticate(get_user_model().objects.create_user('fc-matrix'))
+
+    def _call(self, method, path, data=None, **kwargs):
+        with CaptureQueriesContext(connection) as ctx, self.captureOnCommitCallbacks(execute=True):
+            response = getattr(self.client, method)(f'/api/core/fc-timelines/{path}/', data, **kwargs)
+        self.assertLess(response.status_code, 300, response.content)
+        return response, len(ctx.captured_queries)
+
+    def _csv(self, states, statuses, days):
+        lines = ['state_code,status_code,duration_days,cost_avg,notes']
+        lines += [f'{state},{code},{days},12.50,' for state in states for code in statuses]
+        return SimpleUploadedFile('fc.csv', '\n'.join(lines).encode(), content_type='text/csv')
+
+    def test_matrix_is_pivoted_from_one_fetch_and_cached(self):
+        make_states(STATE_CODES[:2])
+        small = make_statuses(STATUS_CODES[:2])
+        FCTimelines.objects.create(state_id='AL', fc_status=small[0], duration_days=45, cost_avg=Decimal('100'))
+        response, small_queries = self._call('get', 'matrix')
+        self.assertEqual(response.data['states'], ['AL', 'AZ'])
+        cell = response.data['statuses'][0]['timelines']['AL']
+        self.assertEqual((cell['durationDays'], cell['costAvg']), (45, 100.0))
+        self.assertEqual(response.data['statuses'][1]['timelines']['AZ']['statusId'], small[1].pk)
+
+        make_states(STATE_CODES[2:])
+        make_statuses(STATUS_CODES[2:])
+        invalidate_fc_matrix_cache()
+        response, large_queries = self._call('get', 'matrix')
+        self.assertEqual(len(response.data['statuses']), len(STATUS_CODES))
+        self.assertEqual(response.data['stateMeta']['FL']['typeDisplay'], 'Judicial')
+        self.assertEqual(large_queries, small_queries)
+
+        _response, cached_queries = self._call('get', 'matrix')
+        self.assertLess(cached_queries, large_queries)
+
+    def test_csv_import_is_one_upsert_and_reports_every_bad_row(self):
+        make_states(STATE_CODES)
+        make_statuses(STATUS_CODES[:1])
+        self._call('get', 'matrix')
+
+        response, small_queries = self._call(
+            'post', 'import_matrix_csv', {'file': self._csv(STATE_CODES[:1], STATUS_CODES[:2], 30)},
+        )
+        self.assertEqual((response.data['created'], response.data['updated']), (2, 0))
+
+        response, large_queries = self._call(
+            'post', 'import_matrix_csv', {'file': self._csv(STATE_CODES, STATUS_CODES, 40)},
+        )
+        self.assertEqual(
+            (response.data['created'], response.data['updated']),
+            (len(STATE_CODES) * len(STATUS_CODES) - 2, 2),
+        )
+        # WHAT: only the autocreated statuses differ (1 vs 7, one INSERT each); rows are one upsert
+        self.assertEqual(large_queries - small_queries, (len(STATUS_CODES) - 2) - 1)
+        self.assertEqual(FCTimelines.objects.get(state_id='AL', fc_status__status='pre_fc').duration_days, 40)
+
+        # WHAT: the matrix cache and modeling table were invalidated by the upsert
+        response, _queries = self._call('get', 'matrix')
+        self.assertEqual(response.data['statuses'][0]['timelines']['TX']['durationDays'], 40)
+        self.assertEqual(get_state_fc_metrics('TX')['totalDurationDays'], 40 * len(STATUS_CODES))
+
+        bad = SimpleUploadedFile(
+            'fc.csv', b'state_code,status_code,duration_days\nZZ,pre_fc,1\nAL,nope,1\nAL,pre_fc,abc\nAL,mediation,5\n',
+            content_type='text/csv',
+        )
+        response = self.client.post('/api/core/fc-timelines/import_matrix_csv/', {'file': bad})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([error['row'] for error in response.data['errors']], [2, 3, 4])
+        self.assertEqual(FCTimelines.objects.get(state_id='AL', fc_status__status='mediation').duration_days, 40)
+
+    def test_bulk_update_and_bulk_set_are_constant_query_upserts(self):
+        make_states(STATE_CODES)
+        make_statuses(STATUS_CODES)
+        self._call('post', 'import_matrix_csv', {'file': self._csv(STATE_CODES, STATUS_CODES, 10)})
+        ids = list(FCTimelines.objects.order_by('id').values_list('id', flat=True))
+
+        _response, small_queries = self._call(
+            'post', 'bulk_update', [{'id': pk, 'durationDays': 20} for pk in ids[:2]], format='json',
+        )
+        response, large_queries = self._call(
+            'post', 'bulk_update', [{'id': pk, 'notes': 'checked'} for pk in ids], format='json',
+        )
+        self.assertEqual(large_queries, small_queries)
+        self.assertEqual(len(response.data['updated']), len(ids))
+        first = FCTimelines.objects.get(pk=ids[0])
+        self.assertEqual((first.duration_days, first.notes, first.cost_avg), (20, 'checked', Decimal('12.50')))
+
+        response = self.client.post(
+            '/api/core/fc-timelines/bulk_update/',
+            [{'id': ids[0], 'durationDays': 'x'}, {'id': 0}, {'durationDays': 1}, {'id': ids[1], 'durationDays': 99}],
+            format='json',
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(len(response.data['details']), 3)
+        self.assertEqual(FCTimelines.objects.get(pk=ids[1]).duration_days, 20)
+
+        FCTimelines.objects.filter(state_id='TX', fc_status__status='mediation').delete()
+        response, _queries = self._call(
+            'post', 'bulk_set_status_duration', {'statusCode': 'mediation', 'durationDays': 75}, format='json',
+        )
+        self.assertEqual((response.data['updatedCount'], response.data['createdCount']), (len(STATE_CODES) - 1, 1))
+        mediation = FCTimelines.objects.filter(fc_status__status='mediation')
+        self.assertEqual(set(mediation.values_list('duration_days', flat=True)), {75})
+        self.assertEqual(mediation.get(state_id='AL').notes, 'checked')
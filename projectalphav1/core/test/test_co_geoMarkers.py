@@ -0,0 +1,50 @@
+"""Tests for the lightweight map marker service (serv_co_geoMarkers)."""
+
+from django.test import SimpleTestCase
+
+from core.services.serv_co_geoMarkers import (
+    CLUSTER_MAX_ZOOM,
+    build_marker_payload,
+    cluster_markers,
+    iter_marker_rows,
+    parse_bbox,
+    parse_zoom,
+)
+
+MARKERS = [
+    {'lat': 32.7767, 'lng': -96.7970, 'asset_hub_id': 1},   # Dallas
+    {'lat': 32.7800, 'lng': -96.8000, 'asset_hub_id': 2},   # Dallas
+    {'lat': 40.7128, 'lng': -74.0060, 'asset_hub_id': 3},   # New York
+]
+
+
+class GeoMarkerClusteringTestCase(SimpleTestCase):
+    """Test case for zoom-based grid clustering and param parsing."""
+
+    def test_nearby_markers_cluster_at_low_zoom(self):
+        result = cluster_markers(MARKERS, zoom=4)
+        self.assertEqual(len(result), 2)
+        cluster = next(m for m in result if m.get('cluster'))
+        self.assertEqual(cluster['count'], 2)
+        self.assertAlmostEqual(cluster['lat'], (32.7767 + 32.78) / 2, places=5)
+        self.assertIn(MARKERS[2], result)
+
+    def test_no_clustering_without_zoom_or_when_zoomed_in(self):
+        self.assertEqual(cluster_markers(MARKERS, zoom=None), MARKERS)
+        self.assertEqual(cluster_markers(MARKERS, zoom=CLUSTER_MAX_ZOOM), MARKERS)
+
+    def test_payload_counts_assets_not_clusters(self):
+        payload = build_marker_payload(MARKERS, zoom=4)
+        self.assertEqual(payload['count'], 3)
+        self.assertTrue(payload['clustered'])
+
+    def test_param_parsing(self):
+        self.assertEqual(parse_zoom('5.7'), 5)
+        self.assertIsNone(parse_zoom('abc'))
+        self.assertEqual(parse_bbox('-125,24,-66,50'), (-125.0, 24.0, -66.0, 50.0))
+        self.assertIsNone(parse_bbox('1,2,3'))
+        self.assertIsNone(parse_bbox('-125,50,-66,24'))
+
+    def test_rows_without_coordinates_are_skipped(self):
+        rows = [(1, None, -96.8, 'x'), (2, 32.5, -96.8, 'y')]
+        self.assertEqual(list(iter_marker_rows(rows)), [(2, 32.5, -96.8, ('y',))])
@@ -0,0 +1,190 @@
+"""Tests for the batch geocoding pipeline (serv_co_geocoding) against a local Geocodio stub."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+
+from core.models import AssetIdHub, GeocodeAddressCache, LlDataEnrichment
+from core.services import serv_co_geocoding as geo
+
+
+class GeocodioStub:
+    """Minimal Geocodio batch endpoint on 127.0.0.1 (POST list of addresses -> results).
+
+    Coordinates are derived from the address text so assertions are deterministic.
+    ``fail_first`` answers that many requests with HTTP 429; ``delay`` slows every
+    request down so concurrent batches overlap.
+    """
+
+    def __init__(self, *, fail_first: int = 0, delay: float = 0.0):
+        self.fail_first = fail_first
+        self.delay = delay
+        self.batches = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                addresses = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                with stub._lock:
+                    stub.in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+                    throttled = stub.fail_first > 0
+                    if throttled:
+                        stub.fail_first -= 1
+                    else:
+                        stub.batches.append(addresses)
+                time.sleep(stub.delay)
+                with stub._lock:
+                    stub.in_flight -= 1
+                if throttled:
+                    self._reply(429, {'error': 'rate limited'})
+                    return
+                self._reply(200, {'results': [
+                    {'query': addr, 'response': {'results': [
+                        {'location': {'lat': 30 + len(addr) / 100, 'lng': -90.0}, 'fields': {}},
+                    ]}}
+                    for addr in addresses
+                ]})
+
+            def _reply(self, status, payload):
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self.server.server_port}/v1.9/geocode'
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self._patches = [
+            mock.patch.object(geo, 'GEOCODIO_API_URL', self.url),
+            mock.patch.object(geo, 'GEOCODIO_RETRY_BASE_SECONDS', 0.01),
+            mock.patch.object(geo, 'GEOCODIO_REQUESTS_PER_MINUTE', 6000),
+        ]
+        for patch in self._patches:
+            patch.start()
+        return self
+
+    def __exit__(self, *exc):
+        for patch in self._patches:
+            patch.stop()
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class GeocodeBatchRequestTestCase(SimpleTestCase):
+    """Dedup, concurrency, retry and rate limiting without touching the database."""
+
+    def test_addresses_are_deduped_before_batching(self):
+        with GeocodioStub() as stub:
+            resolved, stats = geo.geocode_addresses(
+                ['Dallas, TX', '  dallas,   TX ', 'Austin, TX', ''],
+                api_key='test', batch_size=10, use_cache=False,
+            )
+        self.assertEqual(stub.batches, [['Dallas, TX', 'Austin, TX']])
+        self.assertEqual(set(resolved), {'dallas, tx', 'austin, tx'})
+        self.assertEqual(stats, {'unique_addresses': 2, 'cache_hits': 0, 'api_calls': 1, 'unresolved': 0})
+
+    def test_batches_run_concurrently(self):
+        addresses = [f'City {i}, TX' for i in range(4)]
+        with GeocodioStub(delay=0.2) as stub:
+            resolved, stats = geo.geocode_addresses(
+                addresses, api_key='test', batch_size=1, concurrency=4, use_cache=False,
+            )
+        self.assertEqual(stats['api_calls'], 4)
+        self.assertEqual(len(resolved), 4)
+        self.assertGreater(stub.max_in_flight, 1)
+
+    def test_throttled_batch_is_retried(self):
+        with GeocodioStub(fail_first=1) as stub:
+            resolved, _stats = geo.geocode_addresses(['Miami, FL'], api_key='test', use_cache=False)
+        coords, _extras, used = resolved['miami, fl']
+        self.assertEqual(used, 'Miami, FL')
+        self.assertAlmostEqual(coords[0], 30.09)
+        self.assertEqual(len(stub.batches), 1)
+
+    def test_rate_limiter_spaces_requests(self):
+        limiter = geo._RateLimiter(per_minute=1200, burst=1)  # 20/s -> 50ms per token
+        started = time.monotonic()
+        for _ in range(4):
+            limiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - started, 0.14)
+
+
+class GeocodeAddressCacheTestCase(TestCase):
+    """Persistent address cache and bulk enrichment writes."""
+
+    def test_second_lookup_is_served_from_cache_table(self):
+        with GeocodioStub() as stub:
+            geo.geocode_addresses(['Tulsa, OK'], api_key='test', fields=['census'])
+            resolved, stats = geo.geocode_addresses(['tulsa, ok', 'Tulsa, OK'], api_key='test', fields=['census'])
+        self.assertEqual(len(stub.batches), 1)
+        self.assertEqual(stats['cache_hits'], 1)
+        self.assertEqual(stats['api_calls'], 0)
+        self.assertIn('tulsa, ok', resolved)
+        entry = GeocodeAddressCache.objects.get(normalized_address='tulsa, ok')
+        self.assertEqual((entry.fields_key, entry.hit_count), ('census', 1))
+
+    def test_long_addresses_hit_the_cache(self):
+        prefix = 'Suite 100, ' * 30
+        long_a, long_b = f'{prefix}Tulsa, OK', f'{prefix}Reno, NV'
+        with GeocodioStub() as stub:
+            geo.geocode_addresses([long_a, long_b], api_key='test')
+            resolved, stats = geo.geocode_addresses([long_a, long_b], api_key='test')
+        self.assertEqual(len(stub.batches), 1)
+        self.assertEqual(stats['cache_hits'], 2)
+        self.assertEqual(GeocodeAddressCache.objects.count(), 2)
+        self.assertNotEqual(*[coords for coords, _extras, _used in resolved.values()])
+
+    def test_candidates_resolve_in_one_request(self):
+        with GeocodioStub() as stub:
+            coords, used, _extras = geo._try_geocoding_candidates(['Nowhere', 'Reno, NV'], 'test')
+        self.assertEqual(stub.batches, [['Nowhere', 'Reno, NV']])
+        self.assertEqual(used, 'Nowhere')
+        self.assertIsNotNone(coords)
+
+    def _persist(self, hubs):
+        assignments = [
+            geo.GeocodeAssignment(
+                [{'id': hub.pk, 'candidates': ['Boise, ID'], 'display_name': 'Boise, ID'}],
+                (43.6, -116.2),
+                {'msa_name': 'Boise City, ID', 'msa_code': '14260'},
+                'Boise, ID',
+            )
+            for hub in hubs
+        ]
+        with CaptureQueriesContext(connection) as ctx:
+            written = geo._persist_enrichment_rows(assignments)
+        return written, len(ctx.captured_queries)
+
+    def test_enrichment_rows_are_written_in_bulk(self):
+        small = [AssetIdHub.objects.create(sellertape_id=f'GEO-S{i}') for i in range(2)]
+        large = [AssetIdHub.objects.create(sellertape_id=f'GEO-L{i}') for i in range(6)]
+        LlDataEnrichment.objects.create(asset_hub=small[0], geocode_msa='')
+        LlDataEnrichment.objects.create(asset_hub=large[0], geocode_msa='')
+
+        written_small, queries_small = self._persist(small)
+        written_large, queries_large = self._persist(large)
+
+        self.assertEqual((written_small, written_large), (2, 6))
+        self.assertEqual(queries_small, queries_large)
+        enrichment = LlDataEnrichment.objects.get(asset_hub=large[0])
+        self.assertEqual(float(enrichment.geocode_lat), 43.6)
+        self.assertEqual(enrichment.geocode_msa_code, '14260')
+        self.assertEqual(LlDataEnrichment.objects.filter(geocode_msa='Boise City, ID').count(), 8)
+        self.assertEqual(self._persist(large)[0], 0)  # unchanged rows are not counted
@@ -0,0 +1,103 @@
+"""Tests for the bulk GL ingest (serv_co_glIngest)."""
+
+from datetime import date
+from decimal import Decimal
+
+import pandas as pd
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from core.models import ChartOfAccounts, GeneralLedgerEntries, GeneralLedgerMonthlyRollup
+from core.services.serv_co_glIngest import ingest_gl_entries
+
+
+def _line(entry, document, account, debit='', credit='', **extra):
+    return {
+        'entry': entry,
+        'company_name': 'Fund I',
+        'document_number': document,
+        'account_number': account,
+        'posting_date': '2025-11-03',
+        'entry_date': '2025-11-01 00:00:00',
+        'debit_amount': debit,
+        'credit_amount': credit,
+        **extra,
+    }
+
+
+class GLIngestTestCase(TestCase):
+    """Whole-batch validation rejects bad rows (and their documents) and bulk-writes the rest."""
+
+    def setUp(self):
+        ChartOfAccounts.objects.create(account_number='1000', account_name='Cash', account_type='Asset')
+        ChartOfAccounts.objects.create(account_number='4000', account_name='Fee Income', account_type='Revenue')
+
+    def test_report_and_bulk_write(self):
+        frame = pd.DataFrame([
+            _line('JE-1a', 'JE-1', '1000', debit='$1,250.00'),
+            _line('JE-1b', 'JE-1', '4000', credit='1250', tag='Fee_Income'),
+            _line('JE-2a', 'JE-2', '1000', debit='100.00'),
+            _line('JE-2b', 'JE-2', '4000', credit='90.00'),               # unbalanced document
+            _line('JE-3a', 'JE-3', '9999', debit='5'),                    # unknown account
+            _line('JE-3b', 'JE-3', '4000', credit='5'),                   # rejected with its document
+            _line('JE-4', None, '1000', debit='abc', posting_date='11/31/2025'),
+            _line('JE-1a', None, '1000', debit='1'),                      # duplicate entry id
+            _line('JE-5', None, '1000', posting_date='11/20/2025', amount='(10.00)'),
+        ])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            result = ingest_gl_entries(frame)
+
+        self.assertEqual(result.rows_received, 9)
+        self.assertEqual(result.created, 3)
+        self.assertEqual(result.errors.counts(), {
+            'unbalanced': 2,
+            'unknown_account': 1,
+            'group_rejected': 1,
+            'invalid_amount': 1,
+            'invalid_date': 1,
+            'duplicate_entry': 1,
+        })
+        first = result.errors.to_records(limit=1)[0]
+        self.assertEqual((first['row'], first['code']), (2, 'unbalanced'))
+        self.assertIn('10.00', first['message'])
+
+        stored = {gl.entry: gl for gl in GeneralLedgerEntries.objects.all()}
+        self.assertEqual(set(stored), {'JE-1a', 'JE-1b', 'JE-5'})
+        self.assertEqual(stored['JE-1a'].debit_amount, Decimal('1250.00'))
+        self.assertEqual(stored['JE-1a'].account_name, 'Cash')  # filled from the chart of accounts
+        self.assertEqual(stored['JE-1b'].tag, 'fee_income')
+        self.assertEqual(stored['JE-5'].amount, Decimal('-10.00'))
+        self.assertEqual(stored['JE-5'].posting_date, date(2025, 11, 20))
+
+        rollup = GeneralLedgerMonthlyRollup.objects.filter(month=date(2025, 11, 1))
+        self.assertEqual(sum(row.entry_count for row in rollup), 3)
+
+    def test_existing_entries_skip_or_update(self):
+        lines = [_line('JE-1a', 'JE-1', '1000', debit='10'), _line('JE-1b', 'JE-1', '4000', credit='10')]
+        ingest_gl_entries(lines)
+
+        result = ingest_gl_entries(lines)
+        self.assertEqual((result.created, result.skipped_existing), (0, 2))
+
+        lines = [
+            {'entry': 'JE-1a', 'company_name': 'Fund I', 'account_number': '1000', 'document_number': 'JE-1',
+             'posting_date': '2025-12-01', 'entry_date': '2025-12-01', 'debit_amount': '20'},
+            {'entry': 'JE-1b', 'company_name': 'Fund I', 'account_number': '4000', 'document_number': 'JE-1',
+             'posting_date': '2025-12-01', 'entry_date': '2025-12-01', 'credit_amount': '20'},
+        ]
+        with self.captureOnCommitCallbacks(execute=True):
+            with CaptureQueriesContext(connection) as ctx:
+                result = ingest_gl_entries(lines, existing='update')
+        self.assertEqual((result.created, result.updated), (0, 2))
+        # WHAT: accounts, existing ids, hub ids, bucket ids, one upsert - not one query per row
+        self.assertLess(len(ctx.captured_queries), 15)
+        self.assertEqual(GeneralLedgerEntries.objects.get(entry='JE-1a').debit_amount, Decimal('20.00'))
+        self.assertEqual(
+            set(GeneralLedgerMonthlyRollup.objects.values_list('month', flat=True)),
+            {date(2025, 12, 1)},
+        )
+
+        result = ingest_gl_entries(lines, existing='error', dry_run=True)
+        self.assertEqual(result.errors.counts(), {'entry_exists': 2})
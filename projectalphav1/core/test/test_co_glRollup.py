@@ -0,0 +1,118 @@
+"""Tests for the GL monthly rollup and the single-pass dashboard (serv_co_generalLedger)."""
+
+from datetime import date
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.models import GeneralLedgerBucket, GeneralLedgerEntries, GeneralLedgerMonthlyRollup
+from core.services import serv_co_generalLedger as general_ledger
+from core.views.view_co_generalLedger import GeneralLedgerEntriesViewSet
+
+
+class GLRollupTestCase(TestCase):
+    """The rollup answers month-aligned filters with the same numbers as the entries."""
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user('gl-reader')
+        rows = [
+            ('GL-1', 'Fund I', '1000', date(2025, 1, 5), '100.00', '0', 'loan_payment', False),
+            ('GL-2', 'Fund I', '1000', date(2025, 1, 20), '50.00', '0', 'loan_payment', True),
+            ('GL-3', 'Fund I', '4000', date(2025, 2, 3), '0', '75.00', 'fee_income', False),
+            ('GL-4', 'Fund II', '1000', date(2025, 2, 14), '25.00', '0', None, False),
+            ('GL-5', 'Fund II', '5000', date(2025, 3, 1), '10.00', '10.00', 'adjustment', True),
+        ]
+        with self.captureOnCommitCallbacks(execute=True):
+            for entry, company, account, posted, debit, credit, tag, review in rows:
+                GeneralLedgerEntries.objects.create(
+                    entry=entry,
+                    company_name=company,
+                    account_number=account,
+                    account_name=f'Account {account}',
+                    posting_date=posted,
+                    entry_date=posted,
+                    debit_amount=Decimal(debit),
+                    credit_amount=Decimal(credit),
+                    tag=tag,
+                    requires_review=review,
+                )
+
+    def _get(self, action, **params):
+        request = APIRequestFactory().get(f'/api/core/general-ledger/entries/{action}/', params)
+        force_authenticate(request, user=self.user)
+        view = GeneralLedgerEntriesViewSet.as_view({'get': action.replace('-', '_')})
+        with CaptureQueriesContext(connection) as ctx:
+            response = view(request)
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.data, len(ctx.captured_queries)
+
+    def test_signals_keep_rollup_per_month(self):
+        self.assertEqual(
+            sorted(GeneralLedgerMonthlyRollup.objects.values_list('month', 'company_name', 'account_number', 'entry_count')),
+            [
+                (date(2025, 1, 1), 'Fund I', '1000', 2),
+                (date(2025, 2, 1), 'Fund I', '4000', 1),
+                (date(2025, 2, 1), 'Fund II', '1000', 1),
+                (date(2025, 3, 1), 'Fund II', '5000', 1),
+            ],
+        )
+
+        entry = GeneralLedgerEntries.objects.get(entry='GL-2')
+        with self.captureOnCommitCallbacks(execute=True):
+            entry.posting_date = date(2025, 3, 9)
+            entry.save()
+            GeneralLedgerEntries.objects.get(entry='GL-4').delete()
+
+        jan = GeneralLedgerMonthlyRollup.objects.get(month=date(2025, 1, 1))
+        self.assertEqual((jan.entry_count, jan.review_count, jan.total_debits), (1, 0, Decimal('100.00')))
+        self.assertFalse(GeneralLedgerMonthlyRollup.objects.filter(month=date(2025, 2, 1), company_name='Fund II').exists())
+        self.assertEqual(GeneralLedgerMonthlyRollup.objects.filter(month=date(2025, 3, 1)).count(), 2)
+
+    def test_dashboard_matches_entry_aggregates(self):
+        params = {'posting_date_start': '2025-01-01', 'posting_date_end': '2025-02-28', 'company_name': 'fund'}
+        rolled, queries = self._get('dashboard', **params)
+        self.assertEqual(queries, 1)  # one grouped rollup query for every block
+
+        entries = general_ledger.build_gl_entry_queryset(
+            posting_date_start=date(2025, 1, 1), posting_date_end=date(2025, 2, 28),
+        )
+        direct = general_ledger.get_gl_dashboard(entries)
+        self.assertEqual(rolled['summary']['total_entries'], 4)
+        self.assertEqual(rolled['summary']['entries_requiring_review'], 1)
+        self.assertEqual(Decimal(rolled['summary']['net_total']), direct['summary']['net_total'])
+        self.assertEqual(rolled['summary']['by_tag'], {'loan_payment': 2, 'fee_income': 1, 'untagged': 1})
+        for block in ('by_tag', 'by_bucket', 'by_account', 'monthly_trend'):
+            self.assertEqual(rolled[block], direct[block], block)
+        self.assertEqual([item['month_display'] for item in rolled['monthly_trend']], ['Jan 2025', 'Feb 2025'])
+
+        # WHAT: A mid-month start needs entry-level data; same answer from the entries
+        summary, _queries = self._get('summary', posting_date_start='2025-01-10')
+        self.assertEqual(summary['total_entries'], 4)
+        self.assertEqual(summary['date_range_start'], '2025-01-20')
+
+    def test_update_paths_queue_refresh(self):
+        entries = GeneralLedgerEntries.objects.filter(company_name='Fund I')
+        with self.captureOnCommitCallbacks(execute=True):
+            entries.update(requires_review=True)
+            general_ledger.queue_gl_rollup_refresh_for(entries)
+        self.assertEqual(
+            sum(GeneralLedgerMonthlyRollup.objects.filter(company_name='Fund I').values_list('review_count', flat=True)),
+            3,
+        )
+
+    def test_refresh_is_idempotent_and_bucket_delete_refolds(self):
+        bucket = GeneralLedgerBucket.objects.create(name='Servicing')
+        with self.captureOnCommitCallbacks(execute=True):
+            GeneralLedgerEntries.objects.filter(entry='GL-2').update(bucket=bucket)
+            general_ledger.queue_gl_rollup_refresh([date(2025, 1, 1)])
+        general_ledger.refresh_gl_rollup([date(2025, 1, 1)])
+        self.assertEqual(GeneralLedgerMonthlyRollup.objects.filter(month=date(2025, 1, 1)).count(), 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            bucket.delete()
+        jan = GeneralLedgerMonthlyRollup.objects.get(month=date(2025, 1, 1))
+        self.assertEqual((jan.bucket_id, jan.entry_count, jan.total_debits), (None, 2, Decimal('150.00')))
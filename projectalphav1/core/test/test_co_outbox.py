@@ -0,0 +1,87 @@
+"""Tests for the side-effect outbox (serv_co_outbox) and the signals that feed it."""
+
+from unittest import mock
+
+from django.test import TestCase
+
+from am_module.models.model_am_amData import AMNote
+from core.models import AssetIdHub, SideEffectEvent
+from core.services import serv_co_outbox as outbox
+
+GEOCODE = SideEffectEvent.Kind.GEOCODE
+
+
+class SideEffectOutboxTestCase(TestCase):
+    """Coalescing, batched dispatch and retry bookkeeping."""
+
+    def setUp(self):
+        self.calls = []
+        patcher = mock.patch.dict(outbox._HANDLERS, {GEOCODE: self.calls.append})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_repeat_events_coalesce_per_target(self):
+        outbox.emit_side_effects(GEOCODE, [3, 1, 3])
+        outbox.emit_side_effect(GEOCODE, 1)
+        self.assertEqual(
+            sorted(SideEffectEvent.objects.filter(kind=GEOCODE).values_list('target_id', flat=True)),
+            [1, 3],
+        )
+
+    def test_due_events_dispatch_in_one_batch_and_are_deleted(self):
+        outbox.emit_side_effects(GEOCODE, [5, 2, 9], delay=0)
+        outbox.emit_side_effect(GEOCODE, 7)  # still inside its debounce window
+
+        summary = outbox.dispatch_side_effects([GEOCODE])
+
+        self.assertEqual(self.calls, [[2, 5, 9]])
+        self.assertEqual(summary, {GEOCODE: {'targets': 3, 'failed': 0}})
+        self.assertEqual(list(SideEffectEvent.objects.values_list('target_id', flat=True)), [7])
+
+    def test_failures_back_off_then_stop(self):
+        def fail(_ids):
+            raise RuntimeError('upstream down')
+
+        outbox.emit_side_effect(GEOCODE, 4, delay=0)
+        with mock.patch.dict(outbox._HANDLERS, {GEOCODE: fail}), \
+                mock.patch.object(outbox, 'SIDE_EFFECT_MAX_ATTEMPTS', 2), \
+                mock.patch.object(outbox, 'SIDE_EFFECT_RETRY_SECONDS', 0):
+            self.assertEqual(outbox.dispatch_side_effects([GEOCODE])[GEOCODE]['failed'], 1)
+            event = SideEffectEvent.objects.get()
+            self.assertEqual((event.status, event.attempts), (SideEffectEvent.Status.PENDING, 1))
+            self.assertIn('upstream down', event.last_error)
+
+            outbox.dispatch_side_effects([GEOCODE])
+        event.refresh_from_db()
+        self.assertEqual((event.status, event.attempts), (SideEffectEvent.Status.FAILED, 2))
+
+        # WHAT: A new event re-arms a failed target
+        outbox.emit_side_effect(GEOCODE, 4, delay=0)
+        outbox.dispatch_side_effects([GEOCODE])
+        self.assertEqual(self.calls, [[4]])
+        self.assertFalse(SideEffectEvent.objects.exists())
+
+    def test_event_emitted_during_dispatch_is_kept(self):
+        def handler(ids):
+            self.calls.append(ids)
+            if len(self.calls) == 1:
+                outbox.emit_side_effect(GEOCODE, 8)
+
+        outbox.emit_side_effect(GEOCODE, 8, delay=0)
+        with mock.patch.dict(outbox._HANDLERS, {GEOCODE: handler}):
+            outbox.dispatch_side_effects([GEOCODE])
+        self.assertEqual(self.calls, [[8]])
+        self.assertTrue(SideEffectEvent.objects.filter(target_id=8).exists())
+
+    def test_note_saves_queue_one_summary_without_calling_gemini(self):
+        hub = AssetIdHub.objects.create(sellertape_id='OUTBOX-1')
+        with mock.patch('am_module.services.serv_am_noteSummary.generate_note_summary') as summarize:
+            note = AMNote.objects.create(asset_hub=hub, body='First call')
+            note.body = 'Second call'
+            note.save()
+            AMNote.objects.create(asset_hub=hub, body='Left voicemail')
+            summarize.assert_not_called()
+
+            SideEffectEvent.objects.update(available_at=SideEffectEvent.objects.get().enqueued_at)
+            outbox.dispatch_side_effects([SideEffectEvent.Kind.NOTE_SUMMARY])
+        summarize.assert_called_once_with(hub.pk)
@@ -24,7 +24,8 @@ from core.views.commercial_api import (
     LeaseComparableUnitMixListView,
     LeaseComparableRentRollListView,
     RentRollListView,
-    HistoricalPropertyCashFlowListView
+    HistoricalPropertyCashFlowListView,
+    CommercialAnalyticsView,
 )
 from core.views.view_co_calendar import get_calendar_events, CustomCalendarEventViewSet, get_followups
 from core.views.macro_metrics_api_new import (
@@ -52,6 +53,7 @@ from core.views.view_co_generalLedger import (
     ChartOfAccountsViewSet,
 )
 from core.views.view_co_notifications import NotificationViewSet, ActivityFeedView
+from core.views.view_co_capitalAccounts import fund_capital_accounts, co_investor_positions
 from core.views.view_co_egnyteDoc import (
     upload_document,
     list_documents,
@@ -122,6 +124,7 @@ urlpatterns = [
     path('lease-comp-rent-roll/<int:asset_hub_id>/', LeaseComparableRentRollListView.as_view(), name='lease-comp-rent-roll-list'),
     path('rent-roll/<int:asset_hub_id>/', RentRollListView.as_view(), name='rent-roll-list'),
     path('historical-cashflow/<int:asset_hub_id>/', HistoricalPropertyCashFlowListView.as_view(), name='historical-cashflow-list'),
+    path('commercial-analytics/', CommercialAnalyticsView.as_view(), name='commercial-analytics'),
     
     # Valuation endpoints - Create/Update/Get valuations for assets
     path('valuations/<int:asset_hub_id>/', create_or_update_valuation, name='valuation-create-update'),
@@ -139,4 +142,8 @@ urlpatterns = [
 
     # Activity feed - combines notifications + audit log
     path('activity/', ActivityFeedView.as_view(), name='activity-feed'),
+
+    # Capital accounts - fund member positions, co-investor book, pro-rata allocations
+    path('capital/funds/<int:fund_id>/accounts/', fund_capital_accounts, name='capital-fund-accounts'),
+    path('capital/co-investors/', co_investor_positions, name='capital-co-investors'),
 ]
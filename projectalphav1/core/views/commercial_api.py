@@ -10,12 +10,15 @@ Endpoints:
 - GET /core/unit-mix/<asset_hub_id>/ - Subject property unit mix
 - GET /core/lease-comp-unit-mix/<asset_hub_id>/ - Lease comparable unit mix
 - GET /core/lease-comp-rent-roll/<asset_hub_id>/ - Lease comparable rent roll
+- GET /core/commercial-analytics/?hub_ids=1,2,3 - Portfolio NOI / cap rate / rent roll analytics
 
 Docs reviewed:
 - DRF Generic Views: https://www.django-rest-framework.org/api-guide/generic-views/
 - DRF ListAPIView: https://www.django-rest-framework.org/api-guide/generic-views/#listapiview
 """
-from rest_framework import generics
+from rest_framework import generics, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
 from core.models.commercial import UnitMix, RentRoll
 from core.models.model_co_valuations import (
     LeaseComparableUnitMix,
@@ -23,6 +26,7 @@ from core.models.model_co_valuations import (
     ComparableProperty
 )
 from core.models.propertycfs import HistoricalPropertyCashFlow
+from core.services.serv_co_commercialAnalytics import get_commercial_analytics, latest_asis_value_subquery
 from core.serializers.commercial_serializers import (
     UnitMixSerializer,
     LeaseComparableUnitMixSerializer,
@@ -150,10 +154,37 @@ class HistoricalPropertyCashFlowListView(generics.ListAPIView):
     
     What: Returns historical property cash flow records (annual operating data) for the asset
     Why: Frontend needs historical cash flow for Commercial Analysis tab
-    How: Filter HistoricalPropertyCashFlow by asset_hub from the URL, order by year descending
+    How: Filter HistoricalPropertyCashFlow by asset_hub from the URL, order by year descending;
+         the latest valuation is annotated so cap_rate() does not query per row
     """
     serializer_class = HistoricalPropertyCashFlowSerializer
 
     def get_queryset(self):
         asset_hub_id = self.kwargs.get('asset_hub_id')
-        return HistoricalPropertyCashFlow.objects.filter(asset_hub_id=asset_hub_id).order_by('-year')
+        return (
+            HistoricalPropertyCashFlow.objects
+            .filter(asset_hub_id=asset_hub_id)
+            .annotate(latest_asis_value=latest_asis_value_subquery())
+            .order_by('-year')
+        )
+
+
+class CommercialAnalyticsView(APIView):
+    """
+    GET /core/commercial-analytics/?hub_ids=1,2,3&years=true
+
+    What: NOI, EGI, OER and cap rate for each property's latest reported year, YoY NOI
+          growth, rolling averages, unit mix and rent roll rollups, and portfolio totals
+    Why: Portfolio screens need every property at once instead of one list call per asset
+    How: Cached columnar build in core/services/serv_co_commercialAnalytics.py; omit
+         hub_ids for every commercial property, years=true adds each property-year row
+    """
+
+    def get(self, request):
+        raw_ids = request.query_params.getlist('hub_ids')
+        try:
+            hub_ids = [int(part) for value in raw_ids for part in value.split(',') if part.strip()]
+        except ValueError:
+            return Response({'error': 'hub_ids must be integers'}, status=status.HTTP_400_BAD_REQUEST)
+        include_years = (request.query_params.get('years') or '').lower() in ('1', 'true', 'yes')
+        return Response(get_commercial_analytics(hub_ids if raw_ids else None, include_years))
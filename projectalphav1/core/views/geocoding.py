@@ -10,6 +10,7 @@ from django.http import JsonResponse, HttpRequest
 from django.views.decorators.http import require_GET
 
 from core.services.serv_co_geocoding import geocode_markers_for_seller_trade
+from core.services.serv_co_geoMarkers import parse_bbox, parse_zoom
 
 
 @require_GET
@@ -21,7 +22,13 @@ def geocode_markers(request: HttpRequest, seller_id: int, trade_id: int):
     print(f'\n\n=== GEOCODE MARKERS CALLED: seller_id={seller_id}, trade_id={trade_id} ===\n')
     logger.info(f'[GEOCODE MARKERS] Starting for seller_id={seller_id}, trade_id={trade_id}')
     
-    payload = geocode_markers_for_seller_trade(seller_id=seller_id, trade_id=trade_id)
+    # Optional ?zoom= / ?bbox=west,south,east,north for server-side clustering
+    payload = geocode_markers_for_seller_trade(
+        seller_id=seller_id,
+        trade_id=trade_id,
+        zoom=parse_zoom(request.GET.get("zoom")),
+        bbox=parse_bbox(request.GET.get("bbox")),
+    )
     
     print(f'=== GEOCODE MARKERS COMPLETE: {payload.get("count")} markers, source={payload.get("source")} ===\n\n')
     logger.info(f'[GEOCODE MARKERS] Returning {payload.get("count")} markers, source={payload.get("source")}')
@@ -4,10 +4,11 @@ Calendar API Views
 What: REST API endpoints for unified calendar event aggregation and custom event CRUD
 Why: Frontend calendar widget needs to display dates from multiple models + user-created events
 Where: projectalphav1/core/views/view_co_calendar.py
-How: Aggregates date fields from various models into standardized format using serial_co_calendar serializers
+How: Reads model date events from the CalendarEventProjection index (maintained by
+     core/services/serv_co_calendarIndex.py) and serializes them with serial_co_calendar serializers
 
 Handles both:
-1. Read-only events from model dates (SellerRawData, ServicerData, TradeLevelAssumption, Trade)
+1. Read-only events from model dates (AcqLoan, ServicerData, TradeLevelAssumption, projected liquidations)
 2. CRUD operations for custom calendar events (CalendarEvent model)
 
 Endpoints:
@@ -34,18 +35,12 @@ from django.conf import settings
 
 from rest_framework.exceptions import PermissionDenied
 
-# Import models that contain date fields
-from acq_module.models.model_acq_seller import AcqAsset, Seller, Trade
-from acq_module.models.model_acq_assumptions import TradeLevelAssumption
-from am_module.models.model_am_servicersCleaned import ServicerLoanData as ServicerData
-
 from core.models import CalendarEvent
-from am_module.logic.logi_am_modelLogic import get_projected_liquidation_events
+from core.services.serv_co_calendarIndex import query_calendar_events
 from core.serializers.serial_co_calendar import (
     CalendarEventReadSerializer,
     CustomCalendarEventSerializer,
     UnifiedCalendarEventSerializer,
-    CALENDAR_DATE_FIELDS,
 )
 
 from core.views.view_co_notifications import _resolve_request_user
@@ -60,7 +55,7 @@ def get_calendar_events(request):
     What: Main calendar endpoint that combines events from multiple data sources
     Why: Frontend FullCalendar widget needs unified event list from all models
     Where: Called by frontend calendar component at /api/core/calendar/events/
-    How: Calls helper functions for each model, filters/combines results, serializes with UnifiedCalendarEventSerializer
+    How: One range query on CalendarEventProjection + custom events, serialized with UnifiedCalendarEventSerializer
     
     Query Parameters:
     - start_date (optional): Filter events on or after this date (YYYY-MM-DD)
@@ -135,38 +130,26 @@ def get_calendar_events(request):
     if categories_param:
         categories_filter = [cat.strip() for cat in categories_param.split(',')]
     
-    # Collect events from various sources
-    # What: Aggregate events from all models into single list
-    # Why: Calendar needs unified view of all date-based events across the system
-    # How: Call helper function for each model, each returns list of standardized dicts
-    events = []
-    
-    # 1. AcqAsset/Loan - Foreclosure dates, maturity dates, modification dates
-    # Currently empty date_fields list - add fields as needed
-    events.extend(_get_acq_asset_events(start_date, end_date, seller_id, trade_id))
-    
-    # 2. ServicerData - Payment dates, maturity dates, bankruptcy dates
-    # Currently includes: actual_fc_sale_date
-    events.extend(_get_servicer_data_events(start_date, end_date, seller_id, trade_id))
-    
-    # 3. TradeLevelAssumption dates (bid_date, settlement_date)
-    # Currently includes: bid_date, settlement_date
-    events.extend(_get_trade_assumption_events(start_date, end_date, seller_id, trade_id))
-    
-    # 4. Projected Liquidation dates (ReUWAMProjections.reuw_projected_liq_date with fallback to BlendedOutcomeModel.expected_exit_date)
-    # Uses re-underwritten AM projections if available, otherwise falls back to initial UW projections
-    events.extend(get_projected_liquidation_events(start_date, end_date, seller_id, trade_id))
-    
-    # 5. Custom CalendarEvent records (user-created events)
-    # All fields from CalendarEvent model
-    events.extend(_get_custom_calendar_events(request, start_date, end_date, seller_id, trade_id))
-    
-    # Filter by categories if specified
-    # What: Remove events that don't match requested categories
-    # Why: Allow frontend to show only certain event types (e.g., only deadlines)
+    # Collect events
+    # What: Model-based events from the date-indexed projection + custom tasks
+    # Why: The projection is kept current by signals/ETL hooks (serv_co_calendarIndex.py),
+    #      so a month view is one range query on (date, category, trade) instead of a
+    #      scan of every AcqAsset/ServicerLoanData/TradeLevelAssumption/BlendedOutcomeModel
+    # How: Sources and fields come from CALENDAR_DATE_FIELDS plus projected liquidations
+    events = query_calendar_events(
+        start_date,
+        end_date,
+        seller_id=seller_id,
+        trade_id=trade_id,
+        categories=categories_filter,
+    )
+
+    # Custom CalendarEvent records (user-created events)
+    custom_events = _get_custom_calendar_events(request, start_date, end_date, seller_id, trade_id)
     if categories_filter:
-        events = [e for e in events if e.get('category') in categories_filter]
-    
+        custom_events = [e for e in custom_events if e.get('category') in categories_filter]
+    events.extend(custom_events)
+
     # Serialize and return
     # What: Convert list of dicts to JSON using UnifiedCalendarEventSerializer
     # Why: Validates structure and ensures consistent output format
@@ -174,317 +157,6 @@ def get_calendar_events(request):
     return Response(serializer.data, status=status.HTTP_200_OK)
 
 
-def _get_acq_asset_events(start_date=None, end_date=None, seller_id=None, trade_id=None):
-    """
-    Extract calendar events from AcqAsset/Loan models.
-    
-    What: Converts date fields from AcqLoan records into calendar events
-    Why: Seller tape data contains important dates that should appear on calendar
-    Where: Called by get_calendar_events() main endpoint
-    How: Queries AcqAsset/Loan, extracts configured date fields, formats as event dicts
-    
-    Includes: maturity dates, foreclosure dates, modification dates, payment dates
-    
-    Args:
-        start_date: Filter events on/after this date
-        end_date: Filter events on/before this date
-        seller_id: Filter to specific seller
-        trade_id: Filter to specific trade
-    
-    Returns:
-        List of event dicts with keys: id, title, date, time, description, category, 
-        source_model, source_id, url, editable
-    
-    Note: Currently date_fields list is empty - add date field configs as needed
-    """
-    events = []
-    
-    # Build queryset with filters
-    queryset = AcqAsset.objects.select_related('seller', 'trade', 'loan', 'property').all()
-    
-    if seller_id:
-        queryset = queryset.filter(seller_id=seller_id)
-    if trade_id:
-        queryset = queryset.filter(trade_id=trade_id)
-    
-    # Get date fields from serializer config
-    # What: Filter CALENDAR_DATE_FIELDS for AcqLoan model
-    # Why: Single list in serial_co_calendar.py controls all calendar fields
-    # Where: CALENDAR_DATE_FIELDS in core/serializers/serial_co_calendar.py
-    # How: Just add/remove lines in that list - no need to edit this view
-    date_fields = []
-    for item in CALENDAR_DATE_FIELDS:
-        if item[0] == 'AcqLoan':
-            if len(item) == 5:
-                model, field, title, event_type, sub_type = item
-            else:
-                model, field, title, event_type = item
-                sub_type = None
-            date_fields.append((field, f'{title}: {{address}}', event_type, title, sub_type))
-    
-    for record in queryset:
-        # Get display address (use street_address or fallback to city/state)
-        address = (
-            record.property.street_address
-            if record.property and record.property.street_address
-            else f"{record.property.city if record.property else 'Unknown'}, {record.property.state if record.property else ''}"
-        )
-        address = address[:30]  # Truncate for display
-        
-        # Extract each date field
-        for field_name, title_template, category, desc_template, sub_type in date_fields:
-            date_value = getattr(record.loan, field_name, None) if record.loan else None
-            
-            if date_value:
-                # Apply date range filter if specified
-                if start_date and date_value < start_date:
-                    continue
-                if end_date and date_value > end_date:
-                    continue
-                
-                events.append({
-                    'id': f'acq_asset:{record.asset_hub_id}:{field_name}',
-                    'title': title_template.format(address=address),
-                    'date': date_value,
-                    'time': 'All Day',
-                    'description': desc_template.format(address=address),
-                    'category': category,
-                    'source_model': 'AcqLoan',
-                    'source_id': record.asset_hub_id,
-                    'url': f'/acq/loan/{record.asset_hub_id}/',
-                    'editable': False  # Model-based events are read-only
-                })
-    
-    return events
-
-
-def _get_servicer_data_events(start_date=None, end_date=None, seller_id=None, trade_id=None):
-    """
-    Extract calendar events from ServicerData model.
-    
-    What: Converts date fields from ServicerLoanData records into calendar events
-    Why: Servicer data contains critical dates (FC sales, payments, bankruptcy) for calendar
-    Where: Called by get_calendar_events() main endpoint
-    How: Queries ServicerLoanData, extracts configured date fields, formats as event dicts
-    
-    Includes: payment dates, maturity dates, bankruptcy dates, actual_fc_sale_date
-    
-    Args:
-        start_date: Filter events on/after this date
-        end_date: Filter events on/before this date
-        seller_id: Filter to specific seller (via asset_hub relationship)
-        trade_id: Filter to specific trade (via asset_hub relationship)
-    
-    Returns:
-        List of event dicts with keys: id, title, date, time, description, category, 
-        source_model, source_id, url, editable
-    """
-    events = []
-    
-    # Build queryset with filters
-    queryset = ServicerData.objects.select_related('asset_hub').all()
-    
-    # Filter by seller/trade through asset_hub relationship
-    if seller_id or trade_id:
-        filters = Q()
-        if seller_id:
-            filters &= Q(asset_hub__acq_asset__seller_id=seller_id)
-        if trade_id:
-            filters &= Q(asset_hub__acq_asset__trade_id=trade_id)
-        queryset = queryset.filter(filters)
-    
-    # Get date fields from serializer config
-    # What: Filter CALENDAR_DATE_FIELDS for ServicerLoanData model
-    # Why: Single list in serial_co_calendar.py controls all calendar fields
-    # Where: CALENDAR_DATE_FIELDS in core/serializers/serial_co_calendar.py
-    # How: Just add/remove lines in that list - no need to edit this view
-    date_fields = []
-    for item in CALENDAR_DATE_FIELDS:
-        if item[0] == 'ServicerLoanData':
-            if len(item) == 5:
-                model, field, title, event_type, sub_type = item
-            else:
-                model, field, title, event_type = item
-                sub_type = None
-            date_fields.append((field, '{address}', event_type, title, sub_type))
-    
-    for record in queryset:
-        address = record.address or f"{record.city or 'Unknown'}, {record.state or ''}"
-        address_display = address[:30]
-        servicer_id = record.servicer_id or ''
-        
-        for field_name, title_template, category, desc_template, sub_type in date_fields:
-            date_value = getattr(record, field_name, None)
-            
-            if date_value:
-                if start_date and date_value < start_date:
-                    continue
-                if end_date and date_value > end_date:
-                    continue
-                
-                events.append({
-                    'id': f'servicer_data:{record.id}:{field_name}',
-                    'title': title_template.format(address=address_display),
-                    'date': date_value,
-                    'time': 'All Day',
-                    'description': desc_template,
-                    'category': category,
-                    'source_model': 'ServicerData',
-                    'source_id': record.id,
-                    'url': f'/am/loan/{record.asset_hub_id}/' if record.asset_hub_id else '',
-                    'editable': False,
-                    'servicer_id': servicer_id,
-                    'address': address,
-                    'asset_hub_id': record.asset_hub_id,
-                    'city': record.city or '',  # WHAT: Include city for event card display
-                    'state': record.state or '',  # WHAT: Include state for event card display
-                })
-    
-    return events
-
-
-def _get_trade_events(start_date=None, end_date=None, seller_id=None, trade_id=None):
-    """
-    Extract calendar events from Trade model.
-    
-    What: Converts date fields from Trade records into calendar events
-    Why: Trade creation dates and milestones should appear on calendar for tracking
-    Where: Called by get_calendar_events() main endpoint
-    How: Queries Trade model, extracts created_at and other date fields, formats as event dicts
-    
-    Includes: trade creation dates, important milestones
-    
-    Args:
-        start_date: Filter events on/after this date
-        end_date: Filter events on/before this date
-        seller_id: Filter to specific seller
-        trade_id: Filter to specific trade
-    
-    Returns:
-        List of event dicts with keys: id, title, date, time, description, category, 
-        source_model, source_id, url, editable
-    """
-    events = []
-    
-    # Build queryset with filters
-    queryset = Trade.objects.select_related('seller').all()
-    
-    if seller_id:
-        queryset = queryset.filter(seller_id=seller_id)
-    if trade_id:
-        queryset = queryset.filter(id=trade_id)
-    
-    for trade in queryset:
-        # Trade created date
-        if trade.created_at:
-            trade_date = trade.created_at.date()
-            
-            if start_date and trade_date < start_date:
-                continue
-            if end_date and trade_date > end_date:
-                continue
-            
-            events.append({
-                'id': f'trade:{trade.id}:created',
-                'title': f'Trade Created: {trade.trade_name}',
-                'date': trade_date,
-                'time': 'All Day',
-                'description': f'Trade {trade.trade_name} created for {trade.seller.name if trade.seller else "Unknown Seller"}',
-                'category': 'trade',
-                'source_model': 'Trade',
-                'source_id': trade.id,
-                'url': f'/acq/trade/{trade.id}/',
-                'editable': False  # Model-based events are read-only
-            })
-    
-    return events
-
-
-def _get_trade_assumption_events(start_date=None, end_date=None, seller_id=None, trade_id=None):
-    """
-    Extract calendar events from TradeLevelAssumption model.
-    
-    What: Converts date fields from TradeLevelAssumption records into calendar events
-    Why: Bid dates and settlement dates are critical milestones that should appear on calendar
-    Where: Called by get_calendar_events() main endpoint
-    How: Queries TradeLevelAssumption, extracts configured date fields, formats as event dicts
-    
-    Includes: bid_date, settlement_date
-    
-    Args:
-        start_date: Filter events on/after this date
-        end_date: Filter events on/before this date
-        seller_id: Filter to specific seller (via trade relationship)
-        trade_id: Filter to specific trade
-    
-    Returns:
-        List of event dicts with keys: id, title, date, time, description, category, 
-        source_model, source_id, url, editable
-    """
-    events = []
-    
-    # Build queryset with filters
-    queryset = TradeLevelAssumption.objects.select_related('trade', 'trade__seller').all()
-    
-    if seller_id:
-        queryset = queryset.filter(trade__seller_id=seller_id)
-    if trade_id:
-        queryset = queryset.filter(trade_id=trade_id)
-    
-    # Get date fields from serializer config
-    # What: Filter CALENDAR_DATE_FIELDS for TradeLevelAssumption model
-    # Why: Single list in serial_co_calendar.py controls all calendar fields
-    # Where: CALENDAR_DATE_FIELDS in core/serializers/serial_co_calendar.py
-    # How: Just add/remove lines in that list - no need to edit this view
-    date_fields = []
-    for item in CALENDAR_DATE_FIELDS:
-        if item[0] == 'TradeLevelAssumption':
-            if len(item) == 5:
-                model, field, title, event_type, sub_type = item
-            else:
-                model, field, title, event_type = item
-                sub_type = None
-            date_fields.append((field, '{trade_name}', event_type, title, sub_type))
-    
-    for record in queryset:
-        trade_name = record.trade.trade_name if record.trade else 'Unknown Trade'
-        seller_name = record.trade.seller.name if record.trade and record.trade.seller else 'Unknown Seller'
-        display_name = f'{seller_name} - {trade_name}'
-        
-        for field_name, title_template, category, desc_template, sub_type in date_fields:
-            date_value = getattr(record, field_name, None)
-            
-            if date_value:
-                if start_date and date_value < start_date:
-                    continue
-                if end_date and date_value > end_date:
-                    continue
-                
-                event_data = {
-                    'id': f'trade_assumption:{record.id}:{field_name}',
-                    'title': display_name,
-                    'date': date_value,
-                    'time': 'All Day',
-                    'description': desc_template.format(trade_name=trade_name),
-                    'category': category,
-                    'event_type': category,  # WHAT: Set event_type to 'trade' for frontend filtering/display
-                    'source_model': 'TradeLevelAssumption',
-                    'source_id': record.id,
-                    'editable': False,
-                    'url': f'/acq/trade/{record.trade_id}/' if record.trade_id else ''
-                }
-                
-                # WHAT: Add sub_type to distinguish bid_date vs settlement_date
-                # WHY: Frontend needs to display "Bid Date" or "Settlement Date" sub-tag
-                # HOW: sub_type comes from CALENDAR_DATE_FIELDS tuple (5th element)
-                if sub_type:
-                    event_data['sub_type'] = sub_type
-                
-                events.append(event_data)
-    
-    return events
-
-
 def _get_custom_calendar_events(request, start_date=None, end_date=None, seller_id=None, trade_id=None):
     """
     Extract calendar events from CalendarEvent model (user-created custom events).
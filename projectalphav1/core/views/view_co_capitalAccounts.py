@@ -0,0 +1,66 @@
+"""
+WHAT: Read-only API for fund capital accounts and the co-investor book
+WHY: Investor reporting needs every member's position (and a what-if distribution split)
+     in one request instead of per-investor property calls
+HOW: Thin wrappers over core.services.serv_co_capitalAccounts (cached, invalidated by
+     core.signals when any cap-stack model changes)
+WHERE: Mounted at /api/core/capital/ via core.urls
+"""
+from decimal import Decimal, InvalidOperation
+
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from core.services.serv_co_capitalAccounts import get_co_investor_positions, get_fund_capital_accounts
+
+
+def _distribution_param(request):
+    """Optional ?distribution=<amount>; raises ValueError on junk."""
+    raw = (request.query_params.get('distribution') or '').strip().replace(',', '')
+    if not raw:
+        return None
+    try:
+        amount = Decimal(raw)
+    except InvalidOperation:
+        raise ValueError(f'Invalid distribution amount: {raw!r}')
+    if not amount.is_finite():
+        raise ValueError(f'Invalid distribution amount: {raw!r}')
+    return amount.quantize(Decimal('0.01'))
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def fund_capital_accounts(request, fund_id):
+    """
+    Capital accounts for every member of a fund.
+
+    Query params: distribution (optional amount split pro rata across active members
+    and through nested entities to beneficial owners).
+    """
+    try:
+        distribution = _distribution_param(request)
+    except ValueError as exc:
+        return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+    payload = get_fund_capital_accounts(fund_id, distribution)
+    if payload is None:
+        return Response({'error': f'Fund {fund_id} not found'}, status=status.HTTP_404_NOT_FOUND)
+    return Response(payload)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def co_investor_positions(request):
+    """
+    Contributed / distributed / net position for every co-investor.
+
+    Query params: distribution (optional amount split by ownership %), active (true to
+    skip inactive investors).
+    """
+    try:
+        distribution = _distribution_param(request)
+    except ValueError as exc:
+        return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+    active_only = (request.query_params.get('active') or '').lower() in ('1', 'true', 'yes')
+    return Response(get_co_investor_positions(distribution, active_only))
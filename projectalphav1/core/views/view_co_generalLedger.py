@@ -6,6 +6,7 @@ WHERE: Mounted at /api/gl-entries/ via core.urls
 """
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
+from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django_filters import rest_framework as filters
@@ -21,6 +22,7 @@ from core.serializers.serial_co_generalLedger import (
 )
 from core.services.serv_co_generalLedger import (
     build_gl_entry_queryset,
+    get_gl_dashboard,
     get_gl_entry_summary,
     get_entries_by_tag,
     get_entries_by_bucket,
@@ -28,6 +30,7 @@ from core.services.serv_co_generalLedger import (
     get_monthly_trend,
     get_chart_of_accounts_lookup,
 )
+from core.services.serv_co_glIngest import EXISTING_MODES, ingest_gl_entries, read_gl_file
 
 
 class GeneralLedgerEntriesFilter(filters.FilterSet):
@@ -95,6 +98,8 @@ class GeneralLedgerEntriesViewSet(viewsets.ModelViewSet):
         GET    /api/gl-entries/by-bucket/ - Get entries grouped by bucket
         GET    /api/gl-entries/by-account/- Get entries grouped by account
         GET    /api/gl-entries/monthly-trend/ - Get monthly trend data
+        GET    /api/gl-entries/dashboard/ - All of the above in one response
+        POST   /api/gl-entries/bulk-import/ - Validate and bulk-load a GL file
     """
     
     # WHAT: Set queryset and serializer
@@ -147,6 +152,49 @@ class GeneralLedgerEntriesViewSet(viewsets.ModelViewSet):
         
         return queryset
     
+    def get_dashboard_filters(self):
+        """
+        WHAT: Active filter values of this request (absent filters dropped)
+        WHY: Lets the analytics service answer from GeneralLedgerMonthlyRollup when
+             every filter maps onto it
+        HOW: Reuse the FilterSet's cleaned form data; 'search' forces entry-level data
+        """
+        filterset = self.filterset_class(self.request.query_params, queryset=self.get_queryset(), request=self.request)
+        filterset.is_valid()
+        active = {
+            name: value
+            for name, value in filterset.form.cleaned_data.items()
+            if value not in (None, '')
+        }
+        search_query = self.request.query_params.get('search', None)
+        if search_query:
+            active['search'] = search_query
+        return active
+    
+    @action(detail=False, methods=['get'], url_path='dashboard')
+    def dashboard(self, request):
+        """
+        WHAT: Every GL dashboard block in one response
+        WHY: Replace five analytics calls that each aggregated the filtered entries
+        HOW: One grouped query (rollup when the filters allow) folded into each block
+        
+        QUERY PARAMS:
+            All standard filter params (posting_date_start, tag, bucket, etc.)
+            limit: Max number of accounts in by_account (default 20)
+            months: Number of months in monthly_trend (default 12)
+        
+        RETURNS: summary, by_tag, by_bucket, by_account, monthly_trend
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        data = get_gl_dashboard(
+            queryset,
+            filters=self.get_dashboard_filters(),
+            account_limit=int(request.query_params.get('limit', 20)),
+            months=int(request.query_params.get('months', 12)),
+        )
+        data['summary'] = GLEntrySummarySerializer(data['summary']).data
+        return Response(data)
+    
     @action(detail=False, methods=['get'], url_path='summary')
     def summary(self, request):
         """
@@ -167,7 +215,7 @@ class GeneralLedgerEntriesViewSet(viewsets.ModelViewSet):
         # WHAT: Calculate summary statistics
         # WHY: Provide aggregate data for frontend
         # HOW: Call service layer function
-        summary_data = get_gl_entry_summary(queryset)
+        summary_data = get_gl_entry_summary(queryset, filters=self.get_dashboard_filters())
         
         # WHAT: Serialize and return summary
         # WHY: Validate data structure and format dates
@@ -193,7 +241,7 @@ class GeneralLedgerEntriesViewSet(viewsets.ModelViewSet):
         # WHAT: Get tag groupings
         # WHY: Provide data for tag breakdown chart
         # HOW: Call service layer function
-        tag_data = get_entries_by_tag(queryset)
+        tag_data = get_entries_by_tag(queryset, filters=self.get_dashboard_filters())
         
         return Response(tag_data)
     
@@ -215,7 +263,7 @@ class GeneralLedgerEntriesViewSet(viewsets.ModelViewSet):
         # WHAT: Get bucket groupings
         # WHY: Provide data for bucket breakdown chart
         # HOW: Call service layer function
-        bucket_data = get_entries_by_bucket(queryset)
+        bucket_data = get_entries_by_bucket(queryset, filters=self.get_dashboard_filters())
         
         return Response(bucket_data)
     
@@ -243,7 +291,7 @@ class GeneralLedgerEntriesViewSet(viewsets.ModelViewSet):
         # WHAT: Get account groupings
         # WHY: Provide data for top accounts analysis
         # HOW: Call service layer function
-        account_data = get_entries_by_account(queryset, limit=limit)
+        account_data = get_entries_by_account(queryset, limit=limit, filters=self.get_dashboard_filters())
         
         return Response(account_data)
     
@@ -271,10 +319,51 @@ class GeneralLedgerEntriesViewSet(viewsets.ModelViewSet):
         # WHAT: Get monthly trend data
         # WHY: Provide data for time series chart
         # HOW: Call service layer function
-        trend_data = get_monthly_trend(queryset, months=months)
+        trend_data = get_monthly_trend(queryset, months=months, filters=self.get_dashboard_filters())
         
         return Response(trend_data)
     
+    @action(detail=False, methods=['post'], url_path='bulk-import', parser_classes=[MultiPartParser, FormParser])
+    def bulk_import(self, request):
+        """
+        WHAT: Validate and bulk-load an uploaded GL file (CSV or Excel)
+        WHY: Month-end loads are too large for row-by-row create/save
+        HOW: serv_co_glIngest.ingest_gl_entries (vectorized checks + bulk_create)
+        
+        BODY (multipart):
+            file: CSV/XLSX export with GeneralLedgerEntries column names
+            existing: skip | update | error (default skip)
+            balance_by: Column whose rows must balance (default document_number, '' to skip)
+            dry_run: true to validate only
+        
+        RETURNS: Counts and the first 1000 errors (400 when nothing could be loaded)
+        """
+        upload = request.FILES.get('file')
+        if upload is None:
+            return Response({'detail': 'file is required'}, status=status.HTTP_400_BAD_REQUEST)
+        existing = request.data.get('existing') or 'skip'
+        if existing not in EXISTING_MODES:
+            return Response({'detail': f'existing must be one of {EXISTING_MODES}'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            frame = read_gl_file(upload, name=upload.name)
+        except Exception as e:
+            return Response({'detail': f'Could not read file: {e}'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            result = ingest_gl_entries(
+                frame,
+                existing=existing,
+                balance_by=request.data.get('balance_by', 'document_number') or None,
+                created_by=request.user,
+                dry_run=str(request.data.get('dry_run', '')).lower() in ('1', 'true', 'yes'),
+            )
+        except ValueError as e:
+            return Response({'detail': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        response_status = status.HTTP_200_OK if result.rows_valid or not result.rows_received else status.HTTP_400_BAD_REQUEST
+        return Response(result.as_dict(), status=response_status)
+    
     @action(detail=True, methods=['post'], url_path='flag-for-review')
     def flag_for_review(self, request, pk=None):
         """
@@ -15,6 +15,8 @@ from rest_framework.response import Response
 from django.db import connection
 from django.conf import settings
 
+from core.services.serv_co_cache import get_cache_stats
+
 
 @api_view(['GET'])
 @permission_classes([AllowAny])  # No authentication required for health checks
@@ -29,7 +31,8 @@ def health_check(request):
     This endpoint:
     1. Tests database connectivity
     2. Returns service status
-    3. Doesn't require authentication
+    3. Reports cache tier backend and per-namespace hit/miss counters (this worker)
+    4. Doesn't require authentication
     """
     try:
         # Test database connection by running a simple query
@@ -39,7 +42,11 @@ def health_check(request):
         return Response({
             'status': 'healthy',
             'database': 'connected',
-            'debug': settings.DEBUG
+            'debug': settings.DEBUG,
+            'cache': {
+                'backend': getattr(settings, 'CACHE_BACKEND', None),
+                'stats': get_cache_stats(),
+            },
         }, status=200)
     
     except Exception as e:
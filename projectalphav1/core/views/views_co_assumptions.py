@@ -29,6 +29,13 @@ from core.serializers.serial_co_assumptions import (
     ServicerSerializer,
 )
 from core.serializers.serial_co_crm import MSAReferenceSerializer
+from core.services.serv_co_fcTimelines import (
+    FCTimelineValidationError,
+    bulk_update_fc_timelines,
+    get_fc_timeline_matrix,
+    import_fc_matrix_rows,
+    set_status_duration_for_states,
+)
 
 
 class DevAuthBypassMixin:
@@ -226,97 +233,13 @@ class FCTimelinesViewSet(DevAuthBypassMixin, viewsets.ModelViewSet):
         {"states": [..], "statuses": [{ id, status, statusDisplay, order, timelines: { AL: {...} } }]}
 
         Always returns full cross of states × statuses. Missing rows are placeholders.
+        Built from one fetch per table and cached (see serv_co_fcTimelines).
         """
-        states = StateReference.objects.all().order_by("state_name")
-        state_codes = [s.state_code for s in states]
-        # Build per-state metadata for frontend (e.g., Judicial vs Non-Judicial)
-        # This allows the UI to show a "State Type" row above status rows without
-        # duplicating business logic client-side.
-        state_meta = {
-            s.state_code: {
-                "name": s.state_name,
-                "judicial": bool(getattr(s, "judicialvsnonjudicial", False)),
-                "typeDisplay": "Judicial" if getattr(s, "judicialvsnonjudicial", False) else "Non-Judicial",
-            }
-            for s in states
-        }
-
-        fc_statuses = FCStatus.objects.all().order_by("order")
-        timelines = FCTimelines.objects.all().select_related("state", "fc_status")
-
-        matrix_data = []
-
-        # Normal path: have FCStatus rows
-        for fc_status in fc_statuses:
-            status_timelines = timelines.filter(fc_status=fc_status)
-            timelines_by_state = {}
-
-            existing_timelines = {
-                t.state.state_code: t for t in status_timelines
-            }
-
-            for code in state_codes:
-                t = existing_timelines.get(code)
-                if t:
-                    timelines_by_state[code] = {
-                        "id": t.id,
-                        "durationDays": t.duration_days,
-                        "costAvg": float(t.cost_avg) if t.cost_avg else None,
-                        "notes": t.notes or "",
-                    }
-                else:
-                    timelines_by_state[code] = {
-                        "id": None,
-                        "durationDays": None,
-                        "costAvg": None,
-                        "notes": "",
-                        "stateCode": code,
-                        "statusId": fc_status.id,
-                    }
-
-            matrix_data.append(
-                {
-                    "id": fc_status.id,
-                    "status": fc_status.status,
-                    "statusDisplay": fc_status.get_status_display(),
-                    "order": fc_status.order,
-                    "timelines": timelines_by_state,
-                }
-            )
-
-        # Fallback: no FCStatus rows — use STATUS_CHOICES
-        if not matrix_data:
-            for idx, (code, display) in enumerate(FCStatus.STATUS_CHOICES, start=1):
-                timelines_by_state = {}
-                for st_code in state_codes:
-                    timelines_by_state[st_code] = {
-                        "id": None,
-                        "durationDays": None,
-                        "costAvg": None,
-                        "notes": "",
-                        "stateCode": st_code,
-                        "statusId": None,
-                        "statusCode": code,
-                    }
-                matrix_data.append(
-                    {
-                        "id": None,
-                        "status": code,
-                        "statusDisplay": display,
-                        "order": idx,
-                        "timelines": timelines_by_state,
-                    }
-                )
-
-        return Response({
-            "states": state_codes,
-            "statuses": matrix_data,
-            "stateMeta": state_meta,
-        })
+        return Response(get_fc_timeline_matrix())
 
     @action(detail=False, methods=["post"])
     def bulk_update(self, request):
-        """Bulk update multiple foreclosure timelines at once"""
+        """Bulk update multiple foreclosure timelines at once (validated, single upsert)"""
         timelines_data = request.data
 
         if not isinstance(timelines_data, list):
@@ -325,49 +248,13 @@ class FCTimelinesViewSet(DevAuthBypassMixin, viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        updated_timelines = []
-        errors = []
-
         try:
-            with transaction.atomic():
-                for timeline_data in timelines_data:
-                    timeline_id = timeline_data.get("id")
-                    if not timeline_id:
-                        errors.append(
-                            {"error": "Missing timeline id", "data": timeline_data}
-                        )
-                        continue
-
-                    try:
-                        instance = FCTimelines.objects.get(id=timeline_id)
-                        serializer = FCTimelinesSerializer(
-                            instance, data=timeline_data, partial=True
-                        )
-                        if serializer.is_valid():
-                            serializer.save()
-                            updated_timelines.append(serializer.data)
-                        else:
-                            errors.append(
-                                {
-                                    "timeline_id": timeline_id,
-                                    "errors": serializer.errors,
-                                }
-                            )
-                    except FCTimelines.DoesNotExist:
-                        errors.append(
-                            {
-                                "error": f"Timeline {timeline_id} not found",
-                                "timeline_id": timeline_id,
-                            }
-                        )
-
-                if errors:
-                    raise Exception("Validation errors occurred")
-        except Exception as e:
+            updated_timelines = bulk_update_fc_timelines(timelines_data)
+        except FCTimelineValidationError as e:
             return Response(
                 {
                     "error": "Bulk update failed",
-                    "details": errors,
+                    "details": e.errors,
                     "message": str(e),
                 },
                 status=status.HTTP_400_BAD_REQUEST,
@@ -376,7 +263,7 @@ class FCTimelinesViewSet(DevAuthBypassMixin, viewsets.ModelViewSet):
         return Response(
             {
                 "message": f"Successfully updated {len(updated_timelines)} timelines",
-                "updated": updated_timelines,
+                "updated": FCTimelinesSerializer(updated_timelines, many=True).data,
             },
             status=status.HTTP_200_OK,
         )
@@ -437,23 +324,10 @@ class FCTimelinesViewSet(DevAuthBypassMixin, viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        updated = 0
-        created = 0
         try:
-            with transaction.atomic():
-                for state in StateReference.objects.all():
-                    timeline = FCTimelines.objects.filter(
-                        state=state, fc_status=fc_status
-                    ).first()
-                    if not timeline:
-                        if not create_missing:
-                            continue
-                        timeline = FCTimelines(state=state, fc_status=fc_status)
-                        created += 1
-                    else:
-                        updated += 1
-                    timeline.duration_days = duration_days
-                    timeline.save()
+            counts = set_status_duration_for_states(
+                fc_status, duration_days, create_missing=bool(create_missing)
+            )
         except Exception as e:
             return Response(
                 {"error": "Bulk set failed", "message": str(e)},
@@ -466,8 +340,8 @@ class FCTimelinesViewSet(DevAuthBypassMixin, viewsets.ModelViewSet):
                 "statusId": fc_status.id,
                 "statusCode": fc_status.status,
                 "durationDays": duration_days,
-                "updatedCount": updated,
-                "createdCount": created,
+                "updatedCount": counts["updated"],
+                "createdCount": counts["created"],
             }
         )
 
@@ -543,76 +417,21 @@ class FCTimelinesViewSet(DevAuthBypassMixin, viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        created = 0
-        updated = 0
-        errors = []
-
-        def get_or_create_status_by_code(code: str) -> FCStatus:
-            fc = FCStatus.objects.filter(status=code).first()
-            if fc:
-                return fc
-            for idx, (c, display) in enumerate(FCStatus.STATUS_CHOICES, start=1):
-                if c == code:
-                    return FCStatus.objects.create(
-                        status=code,
-                        order=idx,
-                        notes=f"Autocreated from CSV import ({display})",
-                    )
-            raise ValueError(f"Unknown status_code \"{code}\"")
-
         try:
-            with transaction.atomic():
-                for i, row in enumerate(reader, start=2):
-                    try:
-                        state_code = (row.get("state_code") or "").strip()
-                        status_code = (row.get("status_code") or "").strip()
-                        if not state_code or not status_code:
-                            raise ValueError("Missing required state_code or status_code")
-
-                        try:
-                            st = StateReference.objects.get(state_code=state_code)
-                        except StateReference.DoesNotExist:
-                            raise ValueError(f"Unknown state_code \"{state_code}\"")
-
-                        fc = get_or_create_status_by_code(status_code)
-
-                        duration_days = row.get("duration_days")
-                        duration_days = (
-                            int(duration_days)
-                            if (duration_days and str(duration_days).strip() != "")
-                            else None
-                        )
-                        cost_avg = row.get("cost_avg")
-                        cost_avg = (
-                            float(cost_avg)
-                            if (cost_avg and str(cost_avg).strip() != "")
-                            else None
-                        )
-                        notes = (row.get("notes") or "").strip()
-
-                        timeline, created_flag = FCTimelines.objects.get_or_create(
-                            state=st, fc_status=fc
-                        )
-                        if created_flag:
-                            created += 1
-                        else:
-                            updated += 1
-                        timeline.duration_days = duration_days
-                        timeline.cost_avg = cost_avg
-                        timeline.notes = notes
-                        timeline.save()
-                    except Exception as row_err:
-                        errors.append({"row": i, "error": str(row_err), "data": row})
-                if errors:
-                    raise Exception("Errors during CSV import")
+            counts = import_fc_matrix_rows(reader)
+        except FCTimelineValidationError as e:
+            return Response(
+                {"error": "Import failed", "message": "Errors during CSV import", "errors": e.errors},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
         except Exception as e:
             return Response(
-                {"error": "Import failed", "message": str(e), "errors": errors},
+                {"error": "Import failed", "message": str(e), "errors": []},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
         return Response(
-            {"message": "Import successful", "created": created, "updated": updated}
+            {"message": "Import successful", "created": counts["created"], "updated": counts["updated"]}
         )
 
 
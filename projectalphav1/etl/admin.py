@@ -11,6 +11,7 @@ from etl.models import (
     ValuationDocument,
     ExtractionFieldResult,
     ExtractionLogEntry,
+    ExtractionResultCache,
     SBDailyLoanData,
     SBDailyArmData,
     SBDailyForeclosureData,
@@ -742,6 +743,37 @@ class ExtractionLogEntryAdmin(admin.ModelAdmin):
     message_preview.short_description = "Message"
 
 
+@admin.register(ExtractionResultCache)
+class ExtractionResultCacheAdmin(admin.ModelAdmin):
+    """Admin interface for cached extraction results (delete a row to force re-extraction)."""
+    
+    # List view configuration
+    list_display = (
+        'id',
+        'kind',
+        'content_sha256',
+        'version',
+        'file_size_bytes',
+        'hit_count',
+        'created_at',
+        'last_used_at',
+    )
+    
+    list_filter = (
+        'kind',
+        'created_at',
+    )
+    
+    search_fields = (
+        'content_sha256',
+    )
+    
+    readonly_fields = ('hit_count', 'created_at', 'last_used_at')
+    
+    # Pagination
+    list_per_page = 100
+
+
 @admin.register(ValuationPhoto)
 class ValuationPhotoAdmin(admin.ModelAdmin):
     """Admin interface for ValuationPhoto records."""
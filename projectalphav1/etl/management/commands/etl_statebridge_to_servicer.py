@@ -35,6 +35,7 @@ from am_module.models.model_am_servicersCleaned import (
     ServicerTransactionData,
 )
 from core.models import AssetIdHub
+from core.services.serv_co_calendarIndex import deferred_calendar_refresh
 
 logger = logging.getLogger(__name__)
 
@@ -99,14 +100,16 @@ class Command(BaseCommand):
             )
         )
 
-        for kind in kinds:
-            self._run_kind(
-                kind=kind,
-                date_filter=date_filter,
-                dry_run=dry_run,
-                batch_size=batch_size,
-                max_records=max_records,
-            )
+        # WHAT: ServicerLoanData saves queue calendar refreshes; run them once at the end
+        with deferred_calendar_refresh():
+            for kind in kinds:
+                self._run_kind(
+                    kind=kind,
+                    date_filter=date_filter,
+                    dry_run=dry_run,
+                    batch_size=batch_size,
+                    max_records=max_records,
+                )
 
     def _run_kind(
         self,
@@ -5,10 +5,13 @@ WHAT: Imports seller data from Excel/CSV files into SellerRawData model
       Supports FILE MODE (single file) or OUTLOOK MODE (scan inbox for attachments)
 WHY: Automates data import with AI-powered column mapping and Outlook integration
 WHERE: Run via `python manage.py import_seller_data --file data.xlsx` or `--scan-outlook`
-HOW: Uses modular ETL pipeline with specialized components
+HOW: Uses modular ETL pipeline with specialized components; files and sheets are read,
+     header-detected and mapped concurrently in a process pool, then written in order
+     per trade (see serv_etl_tape_pipeline.py), followed by a per-stage timing report
 
 USAGE - FILE MODE:
     python manage.py import_seller_data --file data.xlsx --seller-name "ABC" --auto-create
+    python manage.py import_seller_data --file a.xlsx --file b.xlsx --all-sheets --workers 4
 
 USAGE - OUTLOOK MODE:
     python manage.py import_seller_data --scan-outlook --auto-create --outlook-unread-only --outlook-mark-read
@@ -17,7 +20,7 @@ DEPENDENCIES: pip install pandas openpyxl anthropic msal requests msoffcrypto-to
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from django.core.management.base import BaseCommand, CommandError
 
@@ -26,9 +29,13 @@ from etl.services import (
     OutlookScanner,
     SellerIdentifier,
     AIColumnMapper,
-    FileProcessor,
     DataImporter,
 )
+from etl.services.services_sellerTapeImport.serv_etl_tape_pipeline import (
+    SellerTapePipeline,
+    TapeFile,
+    TapePipelineResult,
+)
 
 
 class Command(BaseCommand):
@@ -39,7 +46,7 @@ class Command(BaseCommand):
     def add_arguments(self, parser):
         """Define command-line arguments."""
         # MODE SELECTION
-        parser.add_argument('--file', type=str, help='Path to Excel/CSV file')
+        parser.add_argument('--file', type=str, action='append', help='Path to Excel/CSV file (repeatable)')
         parser.add_argument('--scan-outlook', action='store_true', help='Scan Outlook inbox')
 
         # OUTLOOK OPTIONS
@@ -60,6 +67,8 @@ class Command(BaseCommand):
         # FILE PROCESSING
         parser.add_argument('--config', type=str, help='JSON config with column mappings')
         parser.add_argument('--sheet', type=str, default=0, help='Excel sheet (default: 0)')
+        parser.add_argument('--all-sheets', action='store_true', help='Import every sheet that maps to loan fields')
+        parser.add_argument('--workers', type=int, help='Processes for read/detect/map (default: ETL_TAPE_WORKERS)')
         parser.add_argument('--skip-rows', type=int, default=0, help='Rows to skip (default: 0)')
         parser.add_argument('--limit-rows', type=int, help='Limit to first N rows (for testing)')
         parser.add_argument('--dry-run', action='store_true', help='Preview without saving')
@@ -120,18 +129,13 @@ class Command(BaseCommand):
                 self.stdout.write(self.style.WARNING('   [WARNING] No Excel attachments\n'))
                 continue
 
-            # Process files
-            for file_path, password in files:
-                try:
-                    self.stdout.write(f'\n   Processing: {file_path.name}')
-                    # Pass email data for AI seller matching
-                    options_with_email = options.copy()
-                    options_with_email['email_data'] = email
-                    records = self._process_single_file(file_path, password, options_with_email)
-                    total_files += 1
-                    total_records += records
-                except Exception as e:
-                    self.stdout.write(self.style.ERROR(f'   [ERROR] {str(e)}'))
+            # Process files (concurrently; one ordered writer per trade)
+            try:
+                result = self._run_pipeline([TapeFile(path, password) for path, password in files], options, email)
+                total_files += len(files)
+                total_records += result.records_imported
+            except Exception as e:
+                self.stdout.write(self.style.ERROR(f'   [ERROR] {str(e)}'))
 
             # Mark as read
             if options.get('outlook_mark_read'):
@@ -141,76 +145,63 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS(f'\n\n=== COMPLETE ==='))
         self.stdout.write(self.style.SUCCESS(f'Emails: {len(emails)}, Files: {total_files}, Records: {total_records}\n'))
 
-    def _handle_file_mode(self, file_path_str: str, options):
-        """Handle single file import mode."""
-        file_path = Path(file_path_str)
-        if not file_path.exists():
-            raise CommandError(f'File not found: {file_path}')
+    def _handle_file_mode(self, file_path_strs: List[str], options):
+        """Handle file import mode (one or more --file arguments)."""
+        file_paths = [Path(file_path_str) for file_path_str in file_path_strs]
+        for file_path in file_paths:
+            if not file_path.exists():
+                raise CommandError(f'File not found: {file_path}')
 
         self.stdout.write(self.style.SUCCESS(f'\n=== FILE IMPORT MODE ==='))
-        self.stdout.write(f'   File: {file_path}\n')
-        self._process_single_file(file_path, None, options)
-
-    def _process_single_file(self, file_path: Path, password: Optional[str], options: dict) -> int:
-        """Process a single file through ETL pipeline."""
-        # Initialize importer with AI seller matching
-        importer = DataImporter(
-            seller_id=options.get('seller_id'),
-            trade_id=options.get('trade_id'),
-            seller_name=options.get('seller_name'),
-            trade_name=options.get('trade_name'),
-            auto_create=options.get('auto_create', False),
-            update_existing=options.get('update_existing', False),
-            use_ai_seller_matching=not options.get('no_ai', False),  # Enable AI seller matching unless --no-ai
-            email_data=options.get('email_data'),  # Pass email data for AI context
-            stdout=self.stdout
-        )
-
-        # Get/create seller and trade
-        seller, trade = importer.get_or_create_seller_trade(file_path)
-
-        # Read file
-        processor = FileProcessor(file_path, password=password, stdout=self.stdout)
-        df = processor.read(sheet=options.get('sheet', 0), skip_rows=options.get('skip_rows', 0))
-        
-        # Limit rows if requested (for testing)
-        limit_rows = options.get('limit_rows')
-        if limit_rows and limit_rows > 0:
-            original_count = len(df)
-            df = df.head(limit_rows)
-            self.stdout.write(self.style.WARNING(f'      [LIMIT] Processing only {len(df)} of {original_count} rows (testing mode)'))
-        
-        self.stdout.write(self.style.SUCCESS(f'      [OK] Loaded {len(df)} rows, {len(df.columns)} columns'))
-
-        # Map columns
-        mapping_method = 'MANUAL'  # Default
-        if options.get('config'):
-            mapper = AIColumnMapper.from_config(options['config'], stdout=self.stdout)
-            column_mapping = mapper.map()
-            mapping_method = 'MANUAL'  # Config-based is manual
-        else:
-            mapper = AIColumnMapper(df.columns, stdout=self.stdout)
-            use_ai = not options.get('no_ai', False)
-            column_mapping = mapper.map(use_ai=use_ai)
-            mapping_method = 'AI' if use_ai else 'EXACT'
-
-            # Save mapping if requested (legacy JSON file save)
-            if options.get('save_mapping'):
-                mapper.save_mapping(column_mapping, options['save_mapping'])
-
-        # Import data
-        if options.get('dry_run'):
-            self.stdout.write(self.style.WARNING(f'      [DRY RUN] Would import {len(df)} records'))
-            return 0
-
-        records_imported = importer.import_data(
-            df=df,
-            column_mapping=column_mapping,
-            seller=seller,
-            trade=trade,
+        for file_path in file_paths:
+            self.stdout.write(f'   File: {file_path}\n')
+        result = self._run_pipeline([TapeFile(file_path) for file_path in file_paths], options)
+        if result.errors and not result.sheets_imported and not options.get('dry_run'):
+            raise CommandError('; '.join(f'{label}: {error}' for label, error in result.errors))
+
+    def _run_pipeline(self, files: List[TapeFile], options: dict, email_data: Optional[dict] = None) -> TapePipelineResult:
+        """Run files through the parallel ETL pipeline and print errors + timing report."""
+        def importer_factory():
+            # Initialize importer with AI seller matching
+            return DataImporter(
+                seller_id=options.get('seller_id'),
+                trade_id=options.get('trade_id'),
+                seller_name=options.get('seller_name'),
+                trade_name=options.get('trade_name'),
+                auto_create=options.get('auto_create', False),
+                update_existing=options.get('update_existing', False),
+                use_ai_seller_matching=not options.get('no_ai', False),  # Enable AI seller matching unless --no-ai
+                email_data=email_data,  # Pass email data for AI context
+                stdout=self.stdout
+            )
+
+        pipeline = SellerTapePipeline(
+            importer_factory,
+            workers=options.get('workers'),
+            all_sheets=options.get('all_sheets', False),
+            sheet=options.get('sheet', 0),
+            skip_rows=options.get('skip_rows', 0),
+            limit_rows=options.get('limit_rows'),
+            use_ai=not options.get('no_ai', False),
+            config=options.get('config'),
             batch_size=options.get('batch_size', 100),
-            file_path=file_path,
-            save_mapping=True,  # Always save mapping to database
-            mapping_method=mapping_method
+            dry_run=options.get('dry_run', False),
+            stdout=self.stdout,
         )
-        return records_imported
+        result = pipeline.run(files)
+
+        # Save mapping if requested (legacy JSON file save; first imported sheet)
+        if options.get('save_mapping') and not options.get('config') and result.column_mappings:
+            column_mapping = next(iter(result.column_mappings.values()))
+            AIColumnMapper([], stdout=self.stdout).save_mapping(column_mapping, options['save_mapping'])
+
+        for label, error in result.errors:
+            self.stdout.write(self.style.ERROR(f'   [ERROR] {label}: {error}'))
+        for label, reason in result.sheets_skipped:
+            self.stdout.write(self.style.WARNING(f'   [SKIPPED] {label}: {reason}'))
+        self.stdout.write(self.style.SUCCESS(
+            f'      [OK] Sheets imported: {result.sheets_imported}, Records: {result.records_imported}'
+        ))
+        for line in result.report.lines():
+            self.stdout.write(line)
+        return result
@@ -12,6 +12,7 @@ from django.utils.dateparse import parse_datetime
 from core.models import AssetIdHub
 from core.models.model_co_valuations import Valuation
 from etl.services import ValuationExtractionPipeline
+from etl.services.services_valuationExtract.serv_etl_valuationQueue import enqueue_valuation_document
 
 User = get_user_model()
 
@@ -56,6 +57,11 @@ class Command(BaseCommand):
             dest="uploaded_at",
             help="Optional ISO-8601 datetime to record when the document was uploaded.",
         )
+        parser.add_argument(
+            "--queue",
+            action="store_true",
+            help="Enqueue the document for `process_valuation_queue` workers instead of extracting it now.",
+        )
 
     def handle(self, *args, **options):  # pragma: no cover - orchestration
         file_path = Path(options["file_path"]).expanduser().resolve()
@@ -88,6 +94,17 @@ class Command(BaseCommand):
                 parsed = timezone.make_aware(parsed, timezone.get_current_timezone())
             uploaded_at = parsed
 
+        if options.get("queue"):
+            document = enqueue_valuation_document(
+                file_path,
+                asset_hub=asset,
+                source=options["source"],
+                created_by=created_by_user,
+                uploaded_at=uploaded_at,
+            )
+            self.stdout.write(self.style.SUCCESS(f"Queued document ID: {document.pk}"))
+            return
+
         pipeline = ValuationExtractionPipeline()
 
         self.stdout.write(self.style.NOTICE("Starting valuation extraction..."))
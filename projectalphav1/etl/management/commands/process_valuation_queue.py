@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.models import AssetIdHub
+from core.models.model_co_valuations import Valuation
+from etl.services import ValuationExtractionPipeline
+from etl.services.services_valuationExtract.serv_etl_valuationQueue import (
+    VALUATION_QUEUE_CONCURRENCY,
+    VALUATION_QUEUE_MAX_ATTEMPTS,
+    ValuationQueueWorker,
+    enqueue_valuation_document,
+    queue_progress,
+)
+
+DOCUMENT_SUFFIXES = {".pdf", ".png", ".jpg", ".jpeg", ".tif", ".tiff"}
+
+
+class Command(BaseCommand):
+    help = (
+        "Run a worker that extracts queued ValuationDocuments concurrently "
+        "(optionally enqueueing a directory of BPOs/appraisals first)."
+    )
+
+    def add_arguments(self, parser):  # pragma: no cover - argument definitions
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=VALUATION_QUEUE_CONCURRENCY,
+            help="Number of documents extracted concurrently.",
+        )
+        parser.add_argument(
+            "--max-attempts",
+            type=int,
+            default=VALUATION_QUEUE_MAX_ATTEMPTS,
+            help="Attempts per document before it is marked failed.",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit when the queue is drained instead of polling for new documents.",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            help="Stop after this many document attempts.",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=5.0,
+            help="Seconds between queue polls when idle.",
+        )
+        parser.add_argument(
+            "--enqueue-dir",
+            dest="enqueue_dir",
+            help="Enqueue every document in this directory before processing (requires --asset).",
+        )
+        parser.add_argument(
+            "--asset",
+            dest="asset_id",
+            type=int,
+            help="AssetIdHub primary key for documents enqueued with --enqueue-dir.",
+        )
+        parser.add_argument(
+            "--source",
+            dest="source",
+            choices=list(Valuation.Source.values),
+            help="Optional valuation source override for enqueued documents.",
+        )
+
+    def handle(self, *args, **options):  # pragma: no cover - orchestration
+        if options.get("enqueue_dir"):
+            self._enqueue_directory(options)
+
+        worker = ValuationQueueWorker(
+            ValuationExtractionPipeline(),
+            concurrency=options["workers"],
+            max_attempts=options["max_attempts"],
+        )
+        self.stdout.write(self.style.NOTICE(
+            f"Worker {worker.worker_id} starting ({worker.concurrency} concurrent); queue: {json.dumps(queue_progress())}"
+        ))
+
+        def on_progress(document, outcome, metrics):
+            stats = metrics.as_dict()
+            style = self.style.SUCCESS if outcome == "complete" else self.style.WARNING
+            self.stdout.write(style(
+                f"[{stats['finished']} done, {stats['docs_per_minute']}/min] "
+                f"document {document.pk} {document.file_name}: {outcome}"
+            ))
+
+        try:
+            metrics = worker.run(
+                once=options["once"],
+                max_documents=options.get("limit"),
+                poll_interval=options["poll_interval"],
+                on_progress=on_progress,
+            )
+        except KeyboardInterrupt:
+            metrics = worker.metrics
+            self.stdout.write(self.style.WARNING("Interrupted; in-progress claims are re-queued after the lease expires."))
+
+        self.stdout.write(self.style.SUCCESS(f"Run metrics: {json.dumps(metrics.as_dict())}"))
+        self.stdout.write(self.style.NOTICE(f"Queue: {json.dumps(queue_progress())}"))
+
+    def _enqueue_directory(self, options) -> None:
+        directory = Path(options["enqueue_dir"]).expanduser().resolve()
+        if not directory.is_dir():
+            raise CommandError(f"Directory not found: {directory}")
+        if options.get("asset_id") is None:
+            raise CommandError("--asset is required with --enqueue-dir")
+        try:
+            asset = AssetIdHub.objects.get(pk=options["asset_id"])
+        except AssetIdHub.DoesNotExist as exc:
+            raise CommandError(f"AssetIdHub {options['asset_id']} does not exist") from exc
+
+        paths = sorted(p for p in directory.iterdir() if p.is_file() and p.suffix.lower() in DOCUMENT_SUFFIXES)
+        for path in paths:
+            enqueue_valuation_document(path, asset_hub=asset, source=options.get("source"))
+        self.stdout.write(self.style.SUCCESS(f"Enqueued {len(paths)} document(s) from {directory}"))
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.5 on 2026-10-18 21:16
+
+import hashlib
+import json
+import re
+
+from django.db import migrations, models
+
+
+def _fingerprint(columns):
+    # Frozen copy of ImportMapping.fingerprint_columns as of this migration; the live
+    # model must not be imported here or later changes would rewrite history.
+    headers = sorted({re.sub(r'\s+', ' ', str(c)).strip().lower() for c in columns or [] if str(c).strip()})
+    return hashlib.sha256(json.dumps(headers).encode('utf-8')).hexdigest()
+
+
+def backfill_header_fingerprints(apps, schema_editor):
+    """Fingerprint existing mappings so repeat tapes can reuse them."""
+    ImportMapping = apps.get_model('etl', 'ImportMapping')
+    rows = []
+    for mapping in ImportMapping.objects.exclude(source_columns=[]).only('id', 'source_columns'):
+        mapping.header_fingerprint = _fingerprint(mapping.source_columns)
+        rows.append(mapping)
+    ImportMapping.objects.bulk_update(rows, ['header_fingerprint'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('etl', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='importmapping',
+            name='header_fingerprint',
+            field=models.CharField(blank=True, db_index=True, default='', help_text='SHA-256 of the normalized source column set', max_length=64),
+        ),
+        migrations.RunPython(backfill_header_fingerprints, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.5 on 2026-10-18 21:21
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_initial'),
+        ('etl', '0002_importmapping_header_fingerprint'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='valuationdocument',
+            name='asset_hub',
+            field=models.ForeignKey(blank=True, help_text='Asset hub the extracted valuation is attached to (required for queued documents).', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='valuation_documents', to='core.assetidhub'),
+        ),
+        migrations.AddField(
+            model_name='valuationdocument',
+            name='attempts',
+            field=models.PositiveSmallIntegerField(default=0, help_text='Number of extraction attempts claimed by queue workers.'),
+        ),
+        migrations.AddField(
+            model_name='valuationdocument',
+            name='locked_at',
+            field=models.DateTimeField(blank=True, help_text='When the current worker claimed the document; stale claims are re-queued.', null=True),
+        ),
+        migrations.AddField(
+            model_name='valuationdocument',
+            name='locked_by',
+            field=models.CharField(blank=True, help_text='Worker currently processing this document.', max_length=100),
+        ),
+        migrations.AddField(
+            model_name='valuationdocument',
+            name='next_attempt_at',
+            field=models.DateTimeField(blank=True, help_text='Earliest time a failed attempt may be retried (null = immediately).', null=True),
+        ),
+        migrations.AddField(
+            model_name='valuationdocument',
+            name='source_override',
+            field=models.CharField(blank=True, help_text='Valuation.Source value to use instead of the inferred source.', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='valuationetl',
+            name='document',
+            field=models.ForeignKey(blank=True, help_text='Source document this valuation was extracted from (re-extraction updates this row)', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='valuations', to='etl.valuationdocument'),
+        ),
+        migrations.AddIndex(
+            model_name='valuationdocument',
+            index=models.Index(fields=['status', 'next_attempt_at'], name='etl_valdoc_queue_idx'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.5 on 2026-10-18 21:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('etl', '0003_valuation_document_queue'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExtractionResultCache',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_sha256', models.CharField(help_text='SHA-256 of the source file bytes.', max_length=64)),
+                ('kind', models.CharField(choices=[('valuation', 'Valuation'), ('settlement', 'Settlement Statement')], max_length=20)),
+                ('version', models.CharField(help_text='Extractor/prompt/schema version the result was produced with.', max_length=64)),
+                ('file_size_bytes', models.BigIntegerField(blank=True, null=True)),
+                ('raw_response', models.JSONField(blank=True, default=dict)),
+                ('normalized', models.JSONField(blank=True, default=dict)),
+                ('hit_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_used_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'etl_extraction_result_cache',
+                'constraints': [models.UniqueConstraint(fields=('content_sha256', 'kind', 'version'), name='etl_extraction_cache_key_uniq')],
+            },
+        ),
+    ]
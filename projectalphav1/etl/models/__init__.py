@@ -12,6 +12,7 @@ from .model_etl_document_extraction import (
     ExtractionLogEntry,
     ExtractionStatus,
     ExtractionMethod,
+    ExtractionResultCache,
 )
 from .model_etl_statebridge_raw import (
     SBDailyLoanData,
@@ -47,6 +48,7 @@ __all__ = [
     "ExtractionLogEntry",
     "ExtractionStatus",
     "ExtractionMethod",
+    "ExtractionResultCache",
     "SBDailyLoanData",
     "SBDailyArmData",
     "SBDailyForeclosureData",
@@ -51,9 +51,47 @@ class ValuationDocument(models.Model):
         related_name="valuation_documents",
     )
 
+    # Extraction queue (see serv_etl_valuationQueue): PENDING documents with an asset hub
+    # are claimed by `process_valuation_queue` workers.
+    asset_hub = models.ForeignKey(
+        "core.AssetIdHub",
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="valuation_documents",
+        help_text="Asset hub the extracted valuation is attached to (required for queued documents).",
+    )
+    source_override = models.CharField(
+        max_length=20,
+        blank=True,
+        help_text="Valuation.Source value to use instead of the inferred source.",
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0,
+        help_text="Number of extraction attempts claimed by queue workers.",
+    )
+    next_attempt_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Earliest time a failed attempt may be retried (null = immediately).",
+    )
+    locked_by = models.CharField(
+        max_length=100,
+        blank=True,
+        help_text="Worker currently processing this document.",
+    )
+    locked_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When the current worker claimed the document; stale claims are re-queued.",
+    )
+
     class Meta:
         db_table = "etl_valuation_document"
         ordering = ["-uploaded_at"]
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"], name="etl_valdoc_queue_idx"),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover - human readable display
         return f"{self.file_name} ({self.status})"
@@ -123,3 +161,42 @@ class ExtractionLogEntry(models.Model):
 
     def __str__(self) -> str:  # pragma: no cover
         return f"[{self.level}] {self.message[:50]}"
+
+
+class ExtractionResultCache(models.Model):
+    """Extraction output keyed by document content and extractor version.
+
+    Re-processing the same file bytes with the same prompt/schema reuses the stored
+    result instead of calling the vision model (see serv_etl_extraction_cache).
+    """
+
+    class Kind(models.TextChoices):
+        VALUATION = "valuation", "Valuation"
+        SETTLEMENT = "settlement", "Settlement Statement"
+
+    content_sha256 = models.CharField(max_length=64, help_text="SHA-256 of the source file bytes.")
+    kind = models.CharField(max_length=20, choices=Kind.choices)
+    version = models.CharField(
+        max_length=64,
+        help_text="Extractor/prompt/schema version the result was produced with.",
+    )
+    file_size_bytes = models.BigIntegerField(null=True, blank=True)
+
+    raw_response = models.JSONField(default=dict, blank=True)
+    normalized = models.JSONField(default=dict, blank=True)
+
+    hit_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_used_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "etl_extraction_result_cache"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["content_sha256", "kind", "version"],
+                name="etl_extraction_cache_key_uniq",
+            ),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover - human readable display
+        return f"{self.kind} {self.content_sha256[:12]} ({self.version[:8]})"
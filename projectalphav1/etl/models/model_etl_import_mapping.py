@@ -23,7 +23,11 @@ Docs reviewed:
 - Django model best practices: https://docs.djangoproject.com/en/stable/topics/db/models/
 """
 
-from django.db import models
+import hashlib
+import json
+import re
+
+from django.db import models, transaction
 from django.utils import timezone
 from acq_module.models.model_acq_seller import Seller, Trade
 
@@ -83,6 +87,17 @@ class ImportMapping(models.Model):
         help_text='List of column names from the source file'
     )
     
+    # WHAT: Fingerprint of the normalized source header set
+    # WHY: Repeat tapes with the same layout reuse this mapping without an AI call
+    # HOW: Set in save() from source_columns (see fingerprint_columns)
+    header_fingerprint = models.CharField(
+        max_length=64,
+        blank=True,
+        default='',
+        db_index=True,
+        help_text='SHA-256 of the normalized source column set'
+    )
+    
     # WHAT: Track how mapping was created (AI vs manual vs exact)
     # WHY: Helps users understand mapping quality and source
     # HOW: Enum field with predefined creation methods
@@ -223,12 +238,31 @@ class ImportMapping(models.Model):
         seller_name = self.seller.name if self.seller else "No Seller"
         return f"{self.mapping_name} ({seller_name})"
     
+    @staticmethod
+    def normalize_header(column) -> str:
+        """Lowercase, trim and collapse whitespace in a source column name."""
+        return re.sub(r'\s+', ' ', str(column)).strip().lower()
+
+    @classmethod
+    def fingerprint_columns(cls, columns) -> str:
+        """
+        WHAT: Stable fingerprint for a source header set
+        HOW: SHA-256 of the sorted, de-duplicated normalized headers (order-insensitive)
+        """
+        headers = sorted({cls.normalize_header(c) for c in columns or [] if str(c).strip()})
+        return hashlib.sha256(json.dumps(headers).encode('utf-8')).hexdigest()
+
     def save(self, *args, **kwargs):
         """
         WHAT: Override save to handle default mapping logic
         WHY: Ensure only one default mapping per seller
         HOW: Clear other defaults when this is set as default
         """
+        self.header_fingerprint = self.fingerprint_columns(self.source_columns) if self.source_columns else ''
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'source_columns' in update_fields:
+            kwargs['update_fields'] = set(update_fields) | {'header_fingerprint'}
+
         # WHAT: If this mapping is being set as default, clear other defaults
         # WHY: Only one default mapping per seller
         # HOW: Update other mappings for same seller
@@ -239,6 +273,13 @@ class ImportMapping(models.Model):
             ).exclude(pk=self.pk).update(is_default=False)
         
         super().save(*args, **kwargs)
+
+        # WHAT: Let the next import with this layout re-read the saved mapping
+        if self.header_fingerprint:
+            from etl.services.services_sellerTapeImport.serv_etl_ai_mapper import forget_header_mapping
+
+            fingerprint = self.header_fingerprint
+            transaction.on_commit(lambda: forget_header_mapping(fingerprint))
     
     def mark_as_used(self):
         """
@@ -197,6 +197,7 @@ class ValuationETL(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name='valuations_created')
+    document = models.ForeignKey('etl.ValuationDocument', on_delete=models.SET_NULL, null=True, blank=True, related_name='valuations', help_text="Source document this valuation was extracted from (re-extraction updates this row)")
 
     class Meta:
         db_table = "etl_valuation"
@@ -40,6 +40,10 @@ from etl.services.services_valuationExtract.serv_etl_valuation_vision_extractor
 )
 
 from etl.services.services_valuationExtract.serv_etl_valuationPipeline import ValuationExtractionPipeline
+from etl.services.services_valuationExtract.serv_etl_valuationQueue import (
+    ValuationQueueWorker,
+    enqueue_valuation_document,
+)
 from etl.services.services_tradeSettlementExtract.serv_etl_settlementStmt_pipeline import (
     TradeSettlementExtractionService,
     TradeSettlementStatementPipeline,
@@ -74,6 +78,8 @@ __all__ = [
     'DocumentExtractionResult',
     'FieldExtractionRecord',
     'ValuationExtractionPipeline',
+    'ValuationQueueWorker',
+    'enqueue_valuation_document',
     # Trade settlement extraction workflow (shares Gemini client)
     'TradeSettlementExtractionService',
     'TradeSettlementStatementPipeline',
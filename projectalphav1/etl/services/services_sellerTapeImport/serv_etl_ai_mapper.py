@@ -3,7 +3,13 @@ AI Column Mapping Module
 
 WHAT: Maps source Excel/CSV columns to SellerRawData model fields
 WHY: Different sellers use different column names - need intelligent mapping
-HOW: Uses Claude AI for semantic matching, with fallback to exact matching
+HOW: Uses Claude AI for semantic matching, with fallback to exact matching.
+     Mappings are memoized on the shared cache tier:
+       - whole header sets by fingerprint (backed by ImportMapping.header_fingerprint)
+       - single columns by normalized header name
+       - choice values by (field, raw value)
+     so repeat-seller imports make no AI round trips and new layouts only send the
+     columns that are still unmapped.
 
 USAGE:
     mapper = AIColumnMapper(df.columns)
@@ -16,11 +22,14 @@ USAGE:
 import os
 import json
 import logging
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import anthropic
 
 from acq_module.models.model_acq_seller import AcqAsset, AcqLoan, AcqProperty
+from core.services.serv_co_cache import SharedCache, make_cache_key
+from etl.models.model_etl_import_mapping import ImportMapping
 from etl.services.services_sellerTapeImport.etl_field_registry import (
     get_import_field_definitions,
     get_import_field_specs,
@@ -28,6 +37,24 @@ from etl.services.services_sellerTapeImport.etl_field_registry import (
 
 logger = logging.getLogger(__name__)
 
+# WHAT: Mapping memo lifetime (seconds) - tape layouts and choice spellings rarely change
+MAPPING_CACHE_TTL = int(os.getenv('ETL_MAPPING_CACHE_TTL', str(30 * 24 * 3600)))
+
+_header_set_cache = SharedCache('etl_header_mapping', ttl=MAPPING_CACHE_TTL, local_maxsize=128)
+CHOICE_FAILURE_TTL = 300
+
+_column_cache = SharedCache('etl_column_mapping', ttl=MAPPING_CACHE_TTL, local_maxsize=4096)
+_choice_cache = SharedCache('etl_choice_values', ttl=MAPPING_CACHE_TTL, local_maxsize=4096)
+
+# WHAT: Stored for columns the AI deliberately left unmapped (distinguishes "no match" from a miss)
+NO_MATCH = ''
+_MISS = object()
+
+
+def _column_key(column) -> str:
+    """Backend-safe cache key for one normalized source header."""
+    return make_cache_key(ImportMapping.normalize_header(column))
+
 
 class AIColumnMapper:
     """
@@ -51,7 +78,9 @@ class AIColumnMapper:
         """
         WHAT: Map source columns to model fields
         WHY: Main entry point for column mapping
-        HOW: Uses AI if enabled and available, otherwise exact matching
+        HOW: With AI enabled: reuse the mapping stored for this header fingerprint; otherwise
+             exact matching + per-column memo, and only the still-unmapped columns go to AI.
+             Without AI: exact matching only.
 
         Args:
             use_ai: Use AI mapping (default: True)
@@ -59,22 +88,95 @@ class AIColumnMapper:
         Returns:
             Dict mapping source column names to model field names
         """
-        if use_ai:
+        if not use_ai:
+            return self._exact_matching()
+
+        fingerprint = ImportMapping.fingerprint_columns(self.source_columns)
+        known = self._known_header_mapping(fingerprint)
+        if known is not None:
+            if self.stdout:
+                self.stdout.write('   [MAPPING] Reusing mapping for known header layout (no AI call)\n')
+            return self._apply_header_mapping(known)
+
+        mapping = self._exact_matching()
+        remaining = []
+        for col in self.source_columns:
+            if col in mapping:
+                continue
+            memo = _column_cache.get(_column_key(col), _MISS)
+            if memo is _MISS:
+                remaining.append(col)
+            elif memo != NO_MATCH:
+                mapping[col] = memo
+
+        complete = True
+        if remaining:
             api_key = os.getenv('ANTHROPIC_API_KEY')
-            if api_key:
+            if not api_key:
+                complete = False
+                if self.stdout:
+                    self.stdout.write('   [WARNING] ANTHROPIC_API_KEY not found. Using exact matching.\n')
+            else:
                 try:
-                    return self._ai_mapping()
+                    ai_mapping = self._ai_mapping(remaining)
                 except Exception as e:
+                    complete = False
                     if self.stdout:
                         self.stdout.write(f'   [WARNING] AI mapping failed: {e}. Using exact matching.\n')
                     logger.warning(f'AI mapping failed: {e}')
-            else:
-                if self.stdout:
-                    self.stdout.write('   [WARNING] ANTHROPIC_API_KEY not found. Using exact matching.\n')
+                else:
+                    mapping.update(ai_mapping)
+                    for col in remaining:
+                        _column_cache.set(_column_key(col), ai_mapping.get(col, NO_MATCH))
+
+        # WHAT: Only memoize the full layout once every column has a definitive answer
+        if complete:
+            _header_set_cache.set(fingerprint, {
+                ImportMapping.normalize_header(col): mapping.get(col, NO_MATCH) for col in self.source_columns
+            })
+        return mapping
 
-        return self._exact_matching()
+    def _known_header_mapping(self, fingerprint: str) -> Optional[Dict[str, str]]:
+        """
+        WHAT: Normalized header -> field mapping stored for this header layout
+        HOW: Shared cache first, then the most relevant active ImportMapping with the
+             same fingerprint (default > most recently used > newest)
+        """
+        cached = _header_set_cache.get(fingerprint, _MISS)
+        if cached is not _MISS:
+            return cached
+
+        stored = self._stored_header_mapping(fingerprint)
+        if not stored:
+            return None
+
+        known = {ImportMapping.normalize_header(col): NO_MATCH for col in self.source_columns}
+        known.update({ImportMapping.normalize_header(col): field for col, field in stored.items()})
+        _header_set_cache.set(fingerprint, known)
+        return known
+
+    @staticmethod
+    def _stored_header_mapping(fingerprint: str) -> Optional[Dict[str, str]]:
+        """column_mapping of the preferred active ImportMapping for a fingerprint."""
+        return (
+            ImportMapping.objects
+            .filter(header_fingerprint=fingerprint, is_active=True)
+            .order_by('-is_default', '-last_used_at', '-created_at')
+            .values_list('column_mapping', flat=True)
+            .first()
+        )
+
+    def _apply_header_mapping(self, known: Dict[str, str]) -> Dict[str, str]:
+        """Re-key a normalized header mapping onto this file's column names (registry fields only)."""
+        valid_fields = set(get_import_field_specs().keys())
+        mapping = {}
+        for col in self.source_columns:
+            field = known.get(ImportMapping.normalize_header(col))
+            if field and field in valid_fields:
+                mapping[col] = field
+        return mapping
 
-    def _ai_mapping(self) -> Dict[str, str]:
+    def _ai_mapping(self, columns: Optional[List[str]] = None) -> Dict[str, str]:
         """
         WHAT: Use Claude AI to intelligently map source columns to model fields
         WHY: Handles variations in column naming, synonyms, and abbreviations
@@ -82,9 +184,13 @@ class AIColumnMapper:
 
         DOCS: https://docs.anthropic.com/en/api/messages
 
+        Args:
+            columns: Columns to map (default: all source columns)
+
         Returns:
             Dict mapping source columns to model fields
         """
+        columns = list(self.source_columns) if columns is None else list(columns)
         api_key = os.getenv('ANTHROPIC_API_KEY')
 
         # Build comprehensive field definitions for Claude
@@ -94,7 +200,7 @@ class AIColumnMapper:
         prompt = f"""You are a data mapping expert. Map source Excel/CSV columns to database fields.
 
 SOURCE COLUMNS (from Excel/CSV file):
-{json.dumps(list(self.source_columns), indent=2)}
+{json.dumps(columns, indent=2)}
 
 TARGET DATABASE FIELDS (Import registry):
 {json.dumps(field_definitions, indent=2)}
@@ -177,14 +283,14 @@ Return only the JSON mapping, no explanations."""
 
         validated_mapping = {
             source: target for source, target in mapping.items()
-            if target in valid_fields and source in self.source_columns
+            if target in valid_fields and source in columns
         }
         
         # Log validation results
         logger.info(f'Validated mapping: {json.dumps(validated_mapping, indent=2)}')
         if self.stdout:
             self.stdout.write(f'   [AI] Validated mapping: {len(validated_mapping)} valid mappings\n')
-            if 'sellertape_id' not in validated_mapping.values():
+            if 'sellertape_id' not in validated_mapping.values() and len(columns) == len(self.source_columns):
                 self.stdout.write('   [WARNING] No sellertape_id mapping found!\n')
 
         return validated_mapping
@@ -282,38 +388,15 @@ class ConfiguredMapper:
         return self.mapping
 
 
-# Cache for AI validation results to avoid repeated API calls
-_AI_VALIDATION_CACHE: Dict[str, Optional[str]] = {}
+def forget_header_mapping(fingerprint: str) -> None:
+    """Drop the memoized mapping for a header layout (called when an ImportMapping is saved)."""
+    _header_set_cache.delete(fingerprint)
 
-def validate_choice_value(field_name: str, value: str, use_ai: bool = True) -> Optional[str]:
-    """
-    WHAT: Validate and clean choice field values using AI
-    WHY: Handle variations, typos, and ambiguous values in ETL data
-    HOW: Uses Claude to semantically match values to valid model choices
-    
-    Args:
-        field_name: Model field name (e.g., 'occupancy', 'property_type')
-        value: Raw value from Excel/CSV
-        use_ai: Enable AI validation (default: True)
-        
-    Returns:
-        Valid choice value or None
-        
-    Example:
-        >>> validate_choice_value('occupancy', 'No')
-        'Vacant'
-        >>> validate_choice_value('property_type', 'Single Family')
-        'SFR'
-    """
-    if not value or not isinstance(value, str):
-        return None
-        
-    value = value.strip()
-    if not value or value == '-':
-        return None
-    
-    # Define valid choices for each field (matches model constraints)
-    FIELD_CHOICES = {
+
+@lru_cache(maxsize=1)
+def get_choice_field_values() -> Dict[str, List[str]]:
+    """Valid choice values for each AI-validated choice field (matches model constraints)."""
+    return {
         # WHAT: Allow property_type normalization into subclass values
         # WHY: Property type is now derived from asset subclass fields
         # HOW: Combine all subclass choice values into a single list
@@ -327,67 +410,133 @@ def validate_choice_value(field_name: str, value: str, use_ai: bool = True) -> O
         'occupancy': [choice[0] for choice in AcqProperty.Occupancy.choices],
         'asset_status': [choice[0] for choice in AcqAsset.AssetStatus.choices],
     }
-    
-    # Return as-is for non-choice fields
-    if field_name not in FIELD_CHOICES:
-        return value
-        
-    valid_choices = FIELD_CHOICES[field_name]
-    
-    # Exact match (case-sensitive)
+
+
+def _clean_raw_choice(value) -> Optional[str]:
+    if not value or not isinstance(value, str):
+        return None
+    value = value.strip()
+    if not value or value == '-':
+        return None
+    return value
+
+
+def _local_choice_match(value: str, valid_choices: List[str]) -> Optional[str]:
+    """Exact (case-sensitive) then case-insensitive match against valid choices."""
     if value in valid_choices:
         return value
-        
-    # Case-insensitive match
     for choice in valid_choices:
         if value.upper() == choice.upper():
             return choice
-    
-    # Use AI if enabled and API key available
-    if not use_ai:
-        return None
-        
+    return None
+
+
+def resolve_choice_values(
+    pairs: Iterable[Tuple[str, str]],
+    use_ai: bool = True,
+) -> Dict[Tuple[str, str], Optional[str]]:
+    """
+    WHAT: Resolve many (field, raw value) pairs to valid choices at once
+    WHY: One tape has a handful of distinct spellings per choice field; resolving them
+         up front with a single AI call replaces one call per unseen value
+    HOW: Local exact/case-insensitive match -> (field, value) cache -> one batched AI
+         call for everything still unknown; results (including "no match") are cached
+
+    Args:
+        pairs: (field_name, raw_value) pairs; duplicates and blanks are ignored
+        use_ai: Enable AI validation (default: True)
+
+    Returns:
+        Dict keyed by (field_name, stripped value) -> valid choice or None.
+        Non-choice fields map to the value itself.
+    """
+    field_choices = get_choice_field_values()
+    results: Dict[Tuple[str, str], Optional[str]] = {}
+    unknown: Dict[str, List[str]] = {}
+
+    for field_name, raw_value in pairs:
+        value = _clean_raw_choice(raw_value)
+        if value is None or (field_name, value) in results:
+            continue
+        key = (field_name, value)
+        if field_name not in field_choices:
+            results[key] = value
+            continue
+        match = _local_choice_match(value, field_choices[field_name])
+        if match is not None:
+            results[key] = match
+            continue
+        cached = _choice_cache.get(key, _MISS)
+        if cached is not _MISS:
+            results[key] = cached
+            continue
+        results[key] = None
+        if value not in unknown.setdefault(field_name, []):
+            unknown[field_name].append(value)
+
+    unknown = {field: values for field, values in unknown.items() if values}
     api_key = os.getenv('ANTHROPIC_API_KEY')
-    if not api_key:
-        return None
-    
-    # Check cache first to avoid repeated API calls
-    cache_key = f"{field_name}:{value}"
-    if cache_key in _AI_VALIDATION_CACHE:
-        logger.info(f'AI validation cache hit for {field_name}="{value}"')
-        return _AI_VALIDATION_CACHE[cache_key]
-    
+    if not unknown or not use_ai or not api_key:
+        return results
+
+    resolved = _ai_resolve_choices(unknown, {field: field_choices[field] for field in unknown}, api_key)
+    if resolved is None:
+        # WHAT: Remember the failure briefly so per-row callers do not retry the API per value
+        for field_name, values in unknown.items():
+            for value in values:
+                _choice_cache.set((field_name, value), None, ttl=CHOICE_FAILURE_TTL)
+        return results
+
+    for field_name, values in unknown.items():
+        for value in values:
+            choice = resolved.get(field_name, {}).get(value)
+            result = choice if choice in field_choices[field_name] else None
+            results[(field_name, value)] = result
+            _choice_cache.set((field_name, value), result)
+    logger.info(f'AI choice validation resolved {sum(len(v) for v in unknown.values())} value(s) in one call')
+    return results
+
+
+def _ai_resolve_choices(
+    unknown: Dict[str, List[str]],
+    valid_choices: Dict[str, List[str]],
+    api_key: str,
+) -> Optional[Dict[str, Dict[str, Optional[str]]]]:
+    """One Claude call mapping every unknown value of every field; None on failure (not cached)."""
     try:
-        logger.info(f'AI validating {field_name}="{value}" (calling Claude API...)')
+        logger.info(f'AI validating choice values for {sorted(unknown)} (calling Claude API...)')
         client = anthropic.Anthropic(api_key=api_key)
-        
-        # Build AI prompt for choice validation
-        prompt = f"""Map this value to the correct choice for the {field_name} field.
 
-INVALID VALUE: "{value}"
+        prompt = f"""Map each invalid value to the correct choice for its field.
 
-VALID CHOICES:
-{json.dumps(valid_choices)}
+INVALID VALUES (by field):
+{json.dumps(unknown, indent=2)}
+
+VALID CHOICES (by field):
+{json.dumps(valid_choices, indent=2)}
 
 INSTRUCTIONS:
-1. Determine which valid choice best matches the invalid value
+1. For every invalid value, determine which valid choice of that field best matches it
 2. Consider synonyms, abbreviations, and semantic meaning
-3. Return ONLY the exact valid choice string, nothing else
-4. If no good match exists, return "null"
+3. Use ONLY exact valid choice strings; use null if no good match exists
+4. Return ONLY valid JSON in this exact format:
+{{
+  "field_name": {{"invalid value": "valid choice or null"}}
+}}
 
 EXAMPLES:
 - For occupancy: "No" -> "Vacant", "Yes" -> "Occupied"
 - For property_type: "Single Family" -> "SFR", "Duplex" -> "2-4 Family"
 
-Return only the matched choice or "null"."""
+Return only the JSON mapping, no explanations."""
 
         message = client.messages.create(
             model="claude-opus-4-20250514",
-            max_tokens=50,
+            max_tokens=min(4000, 200 + 40 * sum(len(v) for v in unknown.values())),
             temperature=0,
             messages=[{"role": "user", "content": prompt}]
         )
-        
+
         # Extract response
         response_text = ""
         for block in message.content:
@@ -395,24 +544,48 @@ Return only the matched choice or "null"."""
                 response_text += block.text
             elif isinstance(block, dict) and 'text' in block:
                 response_text += block['text']
-        
-        response_text = response_text.strip().strip('"')
-        
-        # Validate response is in valid choices
-        result = None
-        if response_text in valid_choices:
-            result = response_text
-        elif response_text.lower() == 'null':
-            result = None
-        
-        # Cache the result
-        _AI_VALIDATION_CACHE[cache_key] = result
-        logger.info(f'AI validation result cached: {field_name}="{value}" -> {result}')
-        return result
-            
+
+        response_text = response_text.strip()
+        if response_text.startswith('```'):
+            response_text = '\n'.join(response_text.split('\n')[1:-1])
+        if response_text.startswith('json'):
+            response_text = response_text[4:].strip()
+
+        parsed = json.loads(response_text)
+        return {
+            field: {str(value): (choice if isinstance(choice, str) and choice.lower() != 'null' else None)
+                    for value, choice in (mapping or {}).items()}
+            for field, mapping in parsed.items()
+            if isinstance(mapping, dict)
+        }
+
     except Exception as e:
-        logger.warning(f'AI choice validation failed for {field_name}={value}: {e}')
-        # Cache the failure too
-        _AI_VALIDATION_CACHE[cache_key] = None
+        logger.warning(f'AI choice validation failed for {sorted(unknown)}: {e}')
+        return None
+
+
+def validate_choice_value(field_name: str, value: str, use_ai: bool = True) -> Optional[str]:
+    """
+    WHAT: Validate and clean choice field values using AI
+    WHY: Handle variations, typos, and ambiguous values in ETL data
+    HOW: Single-value wrapper around resolve_choice_values (shares its caches);
+         call resolve_choice_values first to batch all of a file's values
     
-    return None
+    Args:
+        field_name: Model field name (e.g., 'occupancy', 'property_type')
+        value: Raw value from Excel/CSV
+        use_ai: Enable AI validation (default: True)
+        
+    Returns:
+        Valid choice value or None
+        
+    Example:
+        >>> validate_choice_value('occupancy', 'No')
+        'Vacant'
+        >>> validate_choice_value('property_type', 'Single Family')
+        'SFR'
+    """
+    cleaned = _clean_raw_choice(value)
+    if cleaned is None:
+        return None
+    return resolve_choice_values([(field_name, cleaned)], use_ai=use_ai).get((field_name, cleaned))
@@ -12,6 +12,8 @@ USAGE:
 
 import logging
 import re
+import sys
+import time
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from decimal import Decimal, InvalidOperation
@@ -20,6 +22,8 @@ from datetime import datetime, date
 import pandas as pd
 import numpy as np
 from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
 from django.utils.dateparse import parse_date
 
 from acq_module.models.model_acq_seller import (
@@ -32,11 +36,16 @@ from acq_module.models.model_acq_seller import (
     Seller,
     Trade,
 )
-from core.models import AssetIdHub, AssetDetails, LlDataEnrichment
+from core.models import AssetIdHub, AssetDetails, LlDataEnrichment, SideEffectEvent
 from core.models.model_co_valuations import Valuation
-from core.services.serv_co_geocoding import batch_geocode_row_ids
+from core.services.serv_co_calendarIndex import deferred_calendar_refresh, queue_hub_calendar_refresh
+from core.services.serv_co_outbox import emit_side_effects
 from etl.services.services_sellerTapeImport.serv_etl_ai_seller_matcher import AISellerMatcher
-from etl.services.services_sellerTapeImport.serv_etl_ai_mapper import validate_choice_value
+from etl.services.services_sellerTapeImport.serv_etl_ai_mapper import (
+    get_choice_field_values,
+    resolve_choice_values,
+    validate_choice_value,
+)
 from etl.services.services_sellerTapeImport.etl_field_registry import (
     get_import_field_targets,
 )
@@ -91,6 +100,7 @@ class DataImporter:
         self._seller_cache = {}
         self._trade_cache = {}
         self._new_row_ids: List[int] = []
+        self._updated_row_ids: List[int] = []
         
         # Initialize AI seller matcher if enabled
         self._ai_matcher = AISellerMatcher(stdout=stdout) if use_ai_seller_matching else None
@@ -105,7 +115,9 @@ class DataImporter:
         file_path: Optional[Path] = None,
         save_mapping: bool = True,
         mapping_name: Optional[str] = None,
-        mapping_method: str = 'AI'
+        mapping_method: str = 'AI',
+        post_import: bool = True,
+        timings: Optional[Dict[str, float]] = None,
     ) -> int:
         """
         WHAT: Main entry point for data import
@@ -122,10 +134,23 @@ class DataImporter:
             save_mapping: Whether to save mapping for future use (default: True)
             mapping_name: Name for saved mapping (optional, auto-generated if not provided)
             mapping_method: How mapping was created (AI, MANUAL, EXACT, HYBRID)
+            post_import: Queue side effects/invalidate caches now (default: True). Callers
+                         importing several sheets into one trade pass False and call
+                         _run_post_import_jobs() once at the end.
+            timings: Optional dict; seconds per stage ('raw_rows', 'transform', 'save',
+                     'post_import', 'mapping_save') are added to it
 
         Returns:
             Number of records imported (created + updated)
         """
+        timings = timings if timings is not None else {}
+        clock = [time.perf_counter()]
+
+        def lap(stage: str) -> None:
+            now = time.perf_counter()
+            timings[stage] = timings.get(stage, 0.0) + now - clock[0]
+            clock[0] = now
+
         # Get or create seller and trade
         if not seller or not trade:
             logger.info('Getting or creating seller and trade...')
@@ -147,11 +172,13 @@ class DataImporter:
             mapping_name=mapping_name,
             mapping_method=mapping_method,
         )
+        lap('raw_rows')
 
         # Transform and validate data
         logger.info(f'Transforming {len(df)} rows...')
         records, errors = self._transform_data(df, column_mapping, seller, trade)
         logger.info(f'Transformation complete: {len(records)} valid records, {len(errors)} errors')
+        lap('transform')
 
         if self.stdout:
             self.stdout.write(f'      [OK] Valid records: {len(records)}\n')
@@ -160,9 +187,11 @@ class DataImporter:
 
         # Save to database
         saved_count, updated_count, skipped_count = self._save_records(records, batch_size)
+        lap('save')
 
-        # Batch geocode newly created rows using Geocodio official client
-        geocode_stats = self._run_batch_geocode_for_new_rows()
+        # Queued side effects (geocoding, SharePoint folders) + cache invalidation
+        geocode_stats = self._run_post_import_jobs() if post_import else None
+        lap('post_import')
 
         if self.stdout:
             self.stdout.write(
@@ -170,8 +199,8 @@ class DataImporter:
             )
             if geocode_stats:
                 self.stdout.write(
-                    f"      [GEOCODE] Batch updated {geocode_stats.get('updated_rows', 0)} rows "
-                    f"across {geocode_stats.get('api_calls', 0)} call(s)\n"
+                    f"      [GEOCODE] Queued {geocode_stats.get('geocode_queued', 0)} new rows "
+                    f"for batch geocoding\n"
                 )
 
         # WHAT: Save mapping for future reuse if requested
@@ -195,6 +224,7 @@ class DataImporter:
                     'errors': len(errors),
                 }
             )
+            lap('mapping_save')
 
         return saved_count + updated_count
 
@@ -441,6 +471,9 @@ class DataImporter:
         # Log first error in detail for debugging
         first_error_logged = False
 
+        # Resolve every distinct choice value up front (one AI call at most)
+        self._prime_choice_values(df, mapping)
+
         for idx, row in df.iterrows():
             try:
                 record = self._transform_row(row, mapping, seller, trade)
@@ -456,6 +489,24 @@ class DataImporter:
 
         return records, errors
 
+    def _prime_choice_values(self, df: pd.DataFrame, mapping: Dict[str, str]) -> None:
+        """
+        WHAT: Batch-resolve the distinct values of every mapped choice column
+        WHY: Per-row validate_choice_value calls then hit the (field, value) cache
+             instead of making one AI round trip per unseen spelling
+        """
+        choice_fields = get_choice_field_values()
+        field_targets = get_import_field_targets()
+        pairs = []
+        for source_col, target_field in mapping.items():
+            target = field_targets.get(target_field)
+            if not target or target[1] not in choice_fields or source_col not in df.columns:
+                continue
+            for value in df[source_col].dropna().unique():
+                pairs.append((target[1], str(value)))
+        if pairs:
+            resolve_choice_values(pairs, use_ai=self.use_ai_seller_matching)
+
     def _transform_row(
         self,
         row: pd.Series,
@@ -784,8 +835,12 @@ class DataImporter:
     ) -> Tuple[int, int, int]:
         """
         WHAT: Save validated records to database in batches
-        WHY: Efficient bulk insertion with transaction safety
-        HOW: Creates AssetIdHub first (1:1 requirement), then creates/updates AcqAsset and children
+        WHY: Per-row existence checks, create() calls and post_save side effects made a
+             5,000-loan tape take minutes (~15 queries + a geocode/SharePoint hook per row)
+        HOW: Set-based per batch - one preload of existing assets, bulk_create of hubs then
+             children in dependency order, bulk_update of changed rows. Signal side effects
+             (geocoding, SharePoint folders) are queued on the outbox and caches are
+             invalidated once after the import in _run_post_import_jobs().
 
         Returns:
             Tuple of (saved_count, updated_count, skipped_count)
@@ -796,289 +851,433 @@ class DataImporter:
 
         for i in range(0, len(records), batch_size):
             batch = records[i:i + batch_size]
+            for wave in self._split_duplicate_keys(batch):
+                saved, updated, skipped = self._save_batch(wave)
+                saved_count += saved
+                updated_count += updated
+                skipped_count += skipped
 
-            for record_data in batch:
-                loan_data = record_data.get("loan", {})
-                asset_data = record_data.get("asset", {})
-                property_data = record_data.get("property", {})
-                foreclosure_data = record_data.get("foreclosure", {})
-                bankruptcy_data = record_data.get("bankruptcy", {})
-                modification_data = record_data.get("modification", {})
-                raw_values = record_data.get("raw_values", {})
-                sellertape_id = loan_data.get("sellertape_id")
+        return saved_count, updated_count, skipped_count
 
-                try:
-                    # Check if record exists
-                    existing = AcqAsset.objects.filter(
-                        seller=record_data['seller'],
-                        trade=record_data['trade'],
-                        loan__sellertape_id=sellertape_id
-                    ).select_related("asset_hub", "loan", "property", "foreclosure_timeline").first()
-
-                    if existing:
-                        if self.update_existing:
-                            # Update existing record
-                            with transaction.atomic():
-                                for field, value in asset_data.items():
-                                    setattr(existing, field, value)
-                                existing.save()
-
-                                # WHAT: Update or create loan record
-                                # WHY: Loan-level fields moved off AcqAsset
-                                # HOW: Create if missing, otherwise update fields
-                                loan_obj = getattr(existing, "loan", None)
-                                if loan_obj is None:
-                                    loan_obj = AcqLoan.objects.create(asset=existing, **loan_data)
-                                else:
-                                    for field, value in loan_data.items():
-                                        setattr(loan_obj, field, value)
-                                    loan_obj.save()
-
-                                # WHAT: Update or create property record
-                                # WHY: Property fields moved off AcqAsset
-                                # HOW: Create if missing, otherwise update fields
-                                property_obj = getattr(existing, "property", None)
-                                if property_obj is None:
-                                    property_obj = AcqProperty.objects.create(asset=existing, **property_data)
-                                else:
-                                    for field, value in property_data.items():
-                                        setattr(property_obj, field, value)
-                                    property_obj.save()
-
-                                # WHAT: Update or create foreclosure timeline if data provided
-                                # WHY: FC fields moved off AcqAsset
-                                # HOW: Create/update only when FC data is present
-                                if foreclosure_data:
-                                    fc_obj = getattr(existing, "foreclosure_timeline", None)
-                                    if fc_obj is None:
-                                        AcqForeclosureTimeline.objects.create(asset=existing, **foreclosure_data)
-                                    else:
-                                        for field, value in foreclosure_data.items():
-                                            setattr(fc_obj, field, value)
-                                        fc_obj.save()
-
-                                # WHAT: Update or create bankruptcy data if provided
-                                # WHY: BK fields moved off AcqLoan
-                                # HOW: Create/update only when BK data is present
-                                if bankruptcy_data:
-                                    bk_obj = getattr(loan_obj, "bankruptcy", None)
-                                    if bk_obj is None:
-                                        AcqBankruptcy.objects.create(loan=loan_obj, **bankruptcy_data)
-                                    else:
-                                        for field, value in bankruptcy_data.items():
-                                            setattr(bk_obj, field, value)
-                                        bk_obj.save()
-
-                                # WHAT: Update or create modification data if provided
-                                # WHY: Mod fields moved off AcqLoan
-                                # HOW: Create/update only when mod data is present
-                                if modification_data:
-                                    mod_obj = getattr(loan_obj, "modification", None)
-                                    if mod_obj is None:
-                                        AcqModification.objects.create(loan=loan_obj, **modification_data)
-                                    else:
-                                        for field, value in modification_data.items():
-                                            setattr(mod_obj, field, value)
-                                        mod_obj.save()
-
-                                # Ensure AssetDetails exists and keep trade pointer in sync
-                                self._ensure_asset_details(existing.asset_hub, existing.trade)
-                                # Sync seller-provided valuations from seller tape fields
-                                self._sync_seller_valuations(existing.asset_hub, raw_values)
-                            updated_count += 1
-                        else:
-                            skipped_count += 1
-                    else:
-                        # Create AssetIdHub first
-                        asset_hub = AssetIdHub.objects.create(sellertape_id=sellertape_id)
-
-                        # Create AcqAsset + children with asset_hub as PK
-                        try:
-                            with transaction.atomic():
-                                asset = AcqAsset.objects.create(
-                                    asset_hub=asset_hub,
-                                    seller=record_data["seller"],
-                                    trade=record_data["trade"],
-                                    **asset_data,
-                                )
-                                self._new_row_ids.append(asset.asset_hub_id)
-
-                                # WHAT: Create loan + property records
-                                # WHY: Maintain 1:1 structure for downstream usage
-                                # HOW: Create both children (nullable fields allowed)
-                                loan_obj = AcqLoan.objects.create(asset=asset, **loan_data)
-                                AcqProperty.objects.create(asset=asset, **property_data)
-
-                                # WHAT: Create foreclosure timeline if FC data present
-                                # WHY: Avoid empty FC rows when no data is provided
-                                # HOW: Only create when FC data exists
-                                if foreclosure_data:
-                                    AcqForeclosureTimeline.objects.create(asset=asset, **foreclosure_data)
-
-                                # WHAT: Create bankruptcy data if provided
-                                # WHY: Avoid empty BK rows when no data is provided
-                                # HOW: Only create when BK data exists
-                                if bankruptcy_data:
-                                    AcqBankruptcy.objects.create(loan=loan_obj, **bankruptcy_data)
-
-                                # WHAT: Create modification data if provided
-                                # WHY: Avoid empty mod rows when no data is provided
-                                # HOW: Only create when mod data exists
-                                if modification_data:
-                                    AcqModification.objects.create(loan=loan_obj, **modification_data)
-                                
-                                # WHAT: Auto-create LoanLevelAssumption for each new asset
-                                # WHY: Required for duration overrides and loan-specific calculations
-                                # HOW: Import and create with default values, link to asset_hub
-                                from acq_module.models.model_acq_assumptions import LoanLevelAssumption
-                                LoanLevelAssumption.objects.get_or_create(
-                                    asset_hub=asset_hub,
-                                    defaults={}  # Use model defaults
-                                )
-
-                                # Ensure one-to-one AssetDetails row exists for this hub
-                                self._ensure_asset_details(asset_hub, record_data["trade"])
-
-                                # Ensure one-to-one LlDataEnrichment row exists for this hub
-                                LlDataEnrichment.objects.get_or_create(
-                                    asset_hub=asset_hub,
-                                    defaults={},
-                                )
-                                # Sync seller-provided valuations from seller tape fields
-                                self._sync_seller_valuations(asset_hub, raw_values)
-                            saved_count += 1
-                        except Exception as insert_error:
-                            logger.error(f'Error inserting AcqAsset for {sellertape_id}: {insert_error}')
-                            skipped_count += 1
-
-                except Exception as e:
-                    logger.error(f'Error processing record {sellertape_id}: {e}')
-                    skipped_count += 1
+    @staticmethod
+    def _record_key(record_data: Dict[str, Any]) -> Tuple[Any, Any, Optional[str]]:
+        """(seller_id, trade_id, sellertape_id) identity of a seller tape row."""
+        sellertape_id = record_data.get("loan", {}).get("sellertape_id")
+        return (
+            getattr(record_data.get("seller"), "pk", None),
+            getattr(record_data.get("trade"), "pk", None),
+            str(sellertape_id) if sellertape_id is not None else None,
+        )
 
-        return saved_count, updated_count, skipped_count
+    @classmethod
+    def _split_duplicate_keys(cls, batch: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        WHAT: Split a batch into waves with unique record keys
+        WHY: A tape can repeat a sellertape_id; the second row must see the first as
+             existing (update or skip), exactly like the old row-by-row loop
+        HOW: Each record goes into the first wave that does not contain its key yet
+        """
+        waves: List[List[Dict[str, Any]]] = []
+        wave_keys: List[set] = []
+        for record_data in batch:
+            key = cls._record_key(record_data)
+            for wave, keys in zip(waves, wave_keys):
+                if key not in keys:
+                    wave.append(record_data)
+                    keys.add(key)
+                    break
+            else:
+                waves.append([record_data])
+                wave_keys.append({key})
+        return waves
 
-    def _sync_seller_valuations(self, asset_hub: AssetIdHub, raw_values: Dict[str, Any]) -> None:
+    def _save_batch(self, batch: List[Dict[str, Any]]) -> Tuple[int, int, int]:
         """
-        WHAT: Persist seller-provided valuation fields into Valuation model.
-        WHY: Centralize all valuation data in core.Valuation with explicit source tagging.
-        HOW: Create or update Valuation rows keyed by (asset_hub, source, value_date).
+        WHAT: Persist one wave in a single transaction
+        WHY: One bad row must not drop the whole batch
+        HOW: On failure, retry the wave row by row so only the offending record is skipped
         """
-        if not asset_hub:
-            return
+        try:
+            with transaction.atomic():
+                created_ids, updated_ids, skipped = self._persist_batch(batch)
+        except Exception as e:
+            if len(batch) == 1:
+                logger.error(f'Error processing record {self._record_key(batch[0])[2]}: {e}')
+                return 0, 0, 1
+            logger.warning(f'Bulk save failed for {len(batch)} records ({e}); retrying row by row')
+            totals = [0, 0, 0]
+            for record_data in batch:
+                for idx, count in enumerate(self._save_batch([record_data])):
+                    totals[idx] += count
+            return totals[0], totals[1], totals[2]
 
-        def add_entry(
-            *,
-            value_date: Optional[date],
-            asis_value: Optional[Decimal],
-            arv_value: Optional[Decimal],
-            notes: Optional[str],
-        ) -> Optional[Dict[str, Any]]:
-            if asis_value is None and arv_value is None:
-                return None
-            return {
-                "asset_hub": asset_hub,
-                "source": Valuation.Source.SELLER_PROVIDED,
-                "value_date": value_date,
-                "asis_value": asis_value,
-                "arv_value": arv_value,
-                "notes": notes,
-            }
+        # WHAT: Track written rows only after the transaction committed
+        self._new_row_ids.extend(created_ids)
+        self._updated_row_ids.extend(updated_ids)
+        return len(created_ids), len(updated_ids), skipped
 
-        entries = []
-        entries.append(
-            add_entry(
-                value_date=raw_values.get("seller_value_date"),
-                asis_value=raw_values.get("seller_asis_value"),
-                arv_value=raw_values.get("seller_arv_value"),
-                notes="Seller tape valuation (primary)",
-            )
-        )
-        entries.append(
-            add_entry(
-                value_date=raw_values.get("additional_value_date"),
-                asis_value=raw_values.get("additional_asis_value"),
-                arv_value=raw_values.get("additional_arv_value"),
-                notes="Seller tape valuation (additional)",
-            )
+    def _persist_batch(self, batch: List[Dict[str, Any]]) -> Tuple[List[int], List[int], int]:
+        """
+        WHAT: Create/update one wave of records (caller owns the transaction)
+
+        Returns:
+            Tuple of (created asset_hub_ids, updated asset_hub_ids, skipped_count)
+        """
+        skipped_count = 0
+        keyed: List[Tuple[Tuple[Any, Any, Optional[str]], Dict[str, Any]]] = []
+        for record_data in batch:
+            key = self._record_key(record_data)
+            if key[2] is None:
+                logger.error('Error processing record None: missing sellertape_id')
+                skipped_count += 1
+                continue
+            keyed.append((key, record_data))
+
+        existing = self._load_existing_assets([key for key, _ in keyed])
+
+        new_records: List[Dict[str, Any]] = []
+        update_pairs: List[Tuple[AcqAsset, Dict[str, Any]]] = []
+        for key, record_data in keyed:
+            asset = existing.get(key)
+            if asset is None:
+                new_records.append(record_data)
+            elif self.update_existing:
+                update_pairs.append((asset, record_data))
+            else:
+                skipped_count += 1
+
+        created_ids = self._bulk_create_assets(new_records)
+        self._bulk_update_assets(update_pairs)
+
+        # Sync seller-provided valuations from seller tape fields
+        valuation_items = [
+            (hub_id, record_data.get("raw_values", {}))
+            for hub_id, record_data in zip(created_ids, new_records)
+        ]
+        valuation_items.extend(
+            (asset.asset_hub_id, record_data.get("raw_values", {}))
+            for asset, record_data in update_pairs
         )
-        entries.append(
-            add_entry(
-                value_date=raw_values.get("origination_value_date"),
-                asis_value=raw_values.get("origination_value"),
-                arv_value=raw_values.get("origination_arv"),
-                notes="Seller tape valuation (origination)",
+        self._bulk_sync_seller_valuations(valuation_items)
+
+        return created_ids, [asset.asset_hub_id for asset, _record_data in update_pairs], skipped_count
+
+    def _load_existing_assets(self, keys: List[Tuple[Any, Any, Optional[str]]]) -> Dict[Tuple[Any, Any, Optional[str]], AcqAsset]:
+        """One query for every existing AcqAsset (with 1:1 children) matching the keys."""
+        if not keys:
+            return {}
+        trade_ids = {key[1] for key in keys}
+        sellertape_ids = {key[2] for key in keys}
+        queryset = (
+            AcqAsset.objects
+            .filter(loan__sellertape_id__in=sellertape_ids)
+            .select_related(
+                "asset_hub", "trade", "loan", "loan__bankruptcy", "loan__modification",
+                "property", "foreclosure_timeline",
             )
         )
+        if None in trade_ids:
+            queryset = queryset.filter(Q(trade_id__in=trade_ids - {None}) | Q(trade__isnull=True))
+        else:
+            queryset = queryset.filter(trade_id__in=trade_ids)
 
-        for entry in [e for e in entries if e is not None]:
-            value_date = entry["value_date"]
-            existing = Valuation.objects.filter(
+        wanted = set(keys)
+        existing: Dict[Tuple[Any, Any, Optional[str]], AcqAsset] = {}
+        for asset in queryset:
+            key = (asset.seller_id, asset.trade_id, asset.loan.sellertape_id)
+            if key in wanted:
+                existing.setdefault(key, asset)
+        return existing
+
+    def _bulk_create_assets(self, records: List[Dict[str, Any]]) -> List[int]:
+        """
+        WHAT: Create hubs, assets and every 1:1 child for new records
+        HOW: bulk_create AssetIdHub first (PKs come back via RETURNING), then children
+             keyed by the hub PK in dependency order: asset -> loan/property/FC -> BK/mod,
+             plus LoanLevelAssumption, AssetDetails and LlDataEnrichment per hub
+        """
+        if not records:
+            return []
+
+        from acq_module.models.model_acq_assumptions import LoanLevelAssumption
+
+        hubs = [AssetIdHub(sellertape_id=r.get("loan", {}).get("sellertape_id")) for r in records]
+        AssetIdHub.objects.bulk_create(hubs)
+
+        assets, loans, properties, foreclosures = [], [], [], []
+        bankruptcies, modifications = [], []
+        assumptions, details, enrichments = [], [], []
+        for asset_hub, record_data in zip(hubs, records):
+            asset = AcqAsset(
                 asset_hub=asset_hub,
-                source=entry["source"],
-                value_date=value_date,
-            ).first()
-            if existing:
+                seller=record_data["seller"],
+                trade=record_data["trade"],
+                **record_data.get("asset", {}),
+            )
+            assets.append(asset)
+
+            # WHAT: Loan + property always exist (1:1 structure); FC/BK/mod only when data present
+            loan_obj = AcqLoan(asset=asset, **record_data.get("loan", {}))
+            loans.append(loan_obj)
+            properties.append(AcqProperty(asset=asset, **record_data.get("property", {})))
+            if record_data.get("foreclosure"):
+                foreclosures.append(AcqForeclosureTimeline(asset=asset, **record_data["foreclosure"]))
+            if record_data.get("bankruptcy"):
+                bankruptcies.append(AcqBankruptcy(loan=loan_obj, **record_data["bankruptcy"]))
+            if record_data.get("modification"):
+                modifications.append(AcqModification(loan=loan_obj, **record_data["modification"]))
+
+            # WHAT: Per-hub companions (LoanLevelAssumption defaults, AssetDetails, enrichment)
+            assumptions.append(LoanLevelAssumption(asset_hub=asset_hub))
+            details.append(AssetDetails(
+                asset=asset_hub,
+                trade=record_data["trade"],
+                asset_status=AssetDetails.AssetStatus.ACTIVE,
+                asset_class=AssetDetails.asset_class_for_status(asset.asset_status),
+            ))
+            enrichments.append(LlDataEnrichment(asset_hub=asset_hub))
+
+        for model, objs in (
+            (AcqAsset, assets),
+            (AcqLoan, loans),
+            (AcqProperty, properties),
+            (AcqForeclosureTimeline, foreclosures),
+            (AcqBankruptcy, bankruptcies),
+            (AcqModification, modifications),
+            (LoanLevelAssumption, assumptions),
+            (AssetDetails, details),
+            (LlDataEnrichment, enrichments),
+        ):
+            if objs:
+                model.objects.bulk_create(objs)
+
+        return [asset_hub.pk for asset_hub in hubs]
+
+    def _bulk_update_assets(self, pairs: List[Tuple[AcqAsset, Dict[str, Any]]]) -> None:
+        """
+        WHAT: Apply tape values to existing assets and their 1:1 children
+        HOW: Set attributes in memory, then one bulk_update per model over the union of
+             touched fields; missing children are bulk_created. bulk_update skips auto_now,
+             so updated_at is stamped explicitly.
+        """
+        if not pairs:
+            return
+
+        now = timezone.now()
+        to_update: Dict[type, Tuple[List[Any], set]] = {}
+        to_create: Dict[type, List[Any]] = {}
+
+        def update(obj, values: Dict[str, Any]) -> None:
+            for field, value in values.items():
+                setattr(obj, field, value)
+            obj.updated_at = now
+            objs, fields = to_update.setdefault(type(obj), ([], set()))
+            objs.append(obj)
+            fields.update(values)
+
+        for asset, record_data in pairs:
+            update(asset, record_data.get("asset", {}))
+
+            loan_obj = getattr(asset, "loan", None)
+            loan_is_new = loan_obj is None
+            if loan_is_new:
+                loan_obj = AcqLoan(asset=asset, **record_data.get("loan", {}))
+                to_create.setdefault(AcqLoan, []).append(loan_obj)
+            else:
+                update(loan_obj, record_data.get("loan", {}))
+
+            property_obj = getattr(asset, "property", None)
+            if property_obj is None:
+                to_create.setdefault(AcqProperty, []).append(AcqProperty(asset=asset, **record_data.get("property", {})))
+            else:
+                update(property_obj, record_data.get("property", {}))
+
+            foreclosure_data = record_data.get("foreclosure")
+            if foreclosure_data:
+                fc_obj = getattr(asset, "foreclosure_timeline", None)
+                if fc_obj is None:
+                    to_create.setdefault(AcqForeclosureTimeline, []).append(
+                        AcqForeclosureTimeline(asset=asset, **foreclosure_data)
+                    )
+                else:
+                    update(fc_obj, foreclosure_data)
+
+            for model, attr, data_key in (
+                (AcqBankruptcy, "bankruptcy", "bankruptcy"),
+                (AcqModification, "modification", "modification"),
+            ):
+                child_data = record_data.get(data_key)
+                if not child_data:
+                    continue
+                child = None if loan_is_new else getattr(loan_obj, attr, None)
+                if child is None:
+                    to_create.setdefault(model, []).append(model(loan=loan_obj, **child_data))
+                else:
+                    update(child, child_data)
+
+        for model in (AcqAsset, AcqLoan, AcqProperty, AcqForeclosureTimeline, AcqBankruptcy, AcqModification):
+            if to_create.get(model):
+                model.objects.bulk_create(to_create[model])
+            if model in to_update:
+                objs, fields = to_update[model]
+                model.objects.bulk_update(objs, sorted(fields | {"updated_at"}))
+
+        # Ensure AssetDetails exists and keep trade pointer in sync
+        self._bulk_ensure_asset_details([asset for asset, _ in pairs])
+
+    def _bulk_ensure_asset_details(self, assets: List[AcqAsset]) -> None:
+        """Guarantee AssetDetails rows exist for existing assets and point to their current trade."""
+        details_by_hub = AssetDetails.objects.in_bulk([asset.asset_hub_id for asset in assets])
+        now = timezone.now()
+        missing, changed = [], []
+        for asset in assets:
+            details = details_by_hub.get(asset.asset_hub_id)
+            if details is None:
+                missing.append(AssetDetails(
+                    asset_id=asset.asset_hub_id,
+                    trade_id=asset.trade_id,
+                    asset_status=AssetDetails.AssetStatus.ACTIVE,
+                    asset_class=AssetDetails.asset_class_for_status(asset.asset_status),
+                ))
+                continue
+            dirty = False
+            if asset.trade_id and details.trade_id != asset.trade_id:
+                details.trade_id = asset.trade_id
+                dirty = True
+            if not details.asset_status:
+                details.asset_status = AssetDetails.AssetStatus.ACTIVE
+                dirty = True
+            if dirty:
+                details.updated_at = now
+                changed.append(details)
+        if missing:
+            AssetDetails.objects.bulk_create(missing, ignore_conflicts=True)
+        if changed:
+            AssetDetails.objects.bulk_update(changed, ["trade", "asset_status", "updated_at"])
+
+    @staticmethod
+    def _seller_valuation_entries(raw_values: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Seller tape valuation entries (primary/additional/origination) that carry a value."""
+        entries = [
+            {
+                "value_date": raw_values.get("seller_value_date"),
+                "asis_value": raw_values.get("seller_asis_value"),
+                "arv_value": raw_values.get("seller_arv_value"),
+                "notes": "Seller tape valuation (primary)",
+            },
+            {
+                "value_date": raw_values.get("additional_value_date"),
+                "asis_value": raw_values.get("additional_asis_value"),
+                "arv_value": raw_values.get("additional_arv_value"),
+                "notes": "Seller tape valuation (additional)",
+            },
+            {
+                "value_date": raw_values.get("origination_value_date"),
+                "asis_value": raw_values.get("origination_value"),
+                "arv_value": raw_values.get("origination_arv"),
+                "notes": "Seller tape valuation (origination)",
+            },
+        ]
+        return [e for e in entries if e["asis_value"] is not None or e["arv_value"] is not None]
+
+    def _bulk_sync_seller_valuations(self, items: List[Tuple[int, Dict[str, Any]]]) -> None:
+        """
+        WHAT: Persist seller-provided valuation fields into Valuation model.
+        WHY: Centralize all valuation data in core.Valuation with explicit source tagging.
+        HOW: Create or update Valuation rows keyed by (asset_hub, source, value_date) -
+             one preload query, one bulk_create and one bulk_update for the batch.
+        """
+        items = [(hub_id, raw_values) for hub_id, raw_values in items if hub_id]
+        if not items:
+            return
+
+        source = Valuation.Source.SELLER_PROVIDED
+        by_key: Dict[Tuple[int, Optional[date]], Valuation] = {}
+        for valuation in Valuation.objects.filter(
+            asset_hub_id__in={hub_id for hub_id, _ in items},
+            source=source,
+        ):
+            by_key.setdefault((valuation.asset_hub_id, valuation.value_date), valuation)
+
+        now = timezone.now()
+        new_rows: List[Valuation] = []
+        changed: Dict[int, Valuation] = {}
+        update_fields: set = set()
+        for hub_id, raw_values in items:
+            for entry in self._seller_valuation_entries(raw_values):
+                key = (hub_id, entry["value_date"])
+                valuation = by_key.get(key)
+                if valuation is None:
+                    valuation = Valuation(asset_hub_id=hub_id, source=source, **entry)
+                    by_key[key] = valuation
+                    new_rows.append(valuation)
+                    continue
+
                 updates = []
                 if entry["asis_value"] is not None:
-                    existing.asis_value = entry["asis_value"]
+                    valuation.asis_value = entry["asis_value"]
                     updates.append("asis_value")
                 if entry["arv_value"] is not None:
-                    existing.arv_value = entry["arv_value"]
+                    valuation.arv_value = entry["arv_value"]
                     updates.append("arv_value")
-                if entry.get("notes") and (existing.notes != entry.get("notes")):
-                    existing.notes = entry.get("notes")
+                if entry["notes"] and valuation.notes != entry["notes"]:
+                    valuation.notes = entry["notes"]
                     updates.append("notes")
-                if updates:
-                    existing.save(update_fields=updates + ["updated_at"])
-            else:
-                Valuation.objects.create(**entry)
+                if updates and valuation.pk is not None:
+                    valuation.updated_at = now
+                    changed[valuation.pk] = valuation
+                    update_fields.update(updates)
 
-    def _ensure_asset_details(self, asset_hub: AssetIdHub, trade: Optional[Trade]):
-        """Guarantee the AssetDetails one-to-one row exists and points to current trade."""
-        try:
-            details, created = AssetDetails.objects.get_or_create(
-                asset=asset_hub,
-                defaults={
-                    "trade": trade,
-                    "asset_status": AssetDetails.AssetStatus.ACTIVE,
-                },
-            )
-            if not created:
-                updates = []
-                if trade and details.trade_id != getattr(trade, "id", None):
-                    details.trade = trade
-                    updates.append("trade")
-                if not details.asset_status:
-                    details.asset_status = AssetDetails.AssetStatus.ACTIVE
-                    updates.append("asset_status")
-                if updates:
-                    details.save(update_fields=updates + ["updated_at"])
-        except Exception:
-            logger.exception("Failed to sync AssetDetails for asset_hub %s", asset_hub_id := getattr(asset_hub, 'id', None))
-
-    def _run_batch_geocode_for_new_rows(self) -> Optional[Dict[str, Any]]:
-        """Call Geocodio batch helper for all newly created AcqAsset rows."""
-        if not self._new_row_ids:
-            return None
+        if new_rows:
+            Valuation.objects.bulk_create(new_rows)
+        if changed:
+            Valuation.objects.bulk_update(list(changed.values()), sorted(update_fields | {"updated_at"}))
+
+    def _run_post_import_jobs(self) -> Optional[Dict[str, Any]]:
+        """
+        WHAT: Queue the side effects bulk writes do not trigger, then drop caches once
+        WHY: bulk_create/bulk_update skip post_save, which used to geocode each new
+             AcqProperty and create SharePoint folders per AcqAsset; running those inline
+             made import time grow with Geocodio/SharePoint latency
+        HOW: Emit one outbox event per new row (core/services/serv_co_outbox.py) for
+             geocoding and - only when the SharePoint signals are enabled - folder
+             creation; the dispatcher batches them after the import commits. New and
+             updated hubs are queued for the calendar projection (bulk_update skips its
+             signals too); reporting and map caches are still invalidated here.
+
+        Returns:
+            Queue stats (or None when there were no new rows)
+        """
+        new_row_ids = list(self._new_row_ids)
+        updated_row_ids = list(self._updated_row_ids)
+        self._new_row_ids.clear()
+        self._updated_row_ids.clear()
+        queued = None
+        if new_row_ids:
+            try:
+                queued = {'geocode_queued': emit_side_effects(SideEffectEvent.Kind.GEOCODE, new_row_ids)}
+                # WHAT: Mirror sig_sharepoint_folderTempCreate only when its receivers are registered
+                if 'sharepoint.sig_sharepoint_folderTempCreate' in sys.modules:
+                    queued['folders_queued'] = emit_side_effects(SideEffectEvent.Kind.ASSET_FOLDERS, new_row_ids)
+            except Exception as exc:
+                logger.warning(f"Queueing post-import side effects failed: {exc}")
+
+        # WHAT: bulk_create/bulk_update skipped the calendar signals - re-index the hubs'
+        #       dates (one set-based rebuild per source for new and updated rows together)
+        if new_row_ids or updated_row_ids:
+            with deferred_calendar_refresh():
+                queue_hub_calendar_refresh(new_row_ids + updated_row_ids)
 
         try:
-            stats = batch_geocode_row_ids(
-                self._new_row_ids,
-                chunk_size=1000,
-                fields=["census2024", "census", "school"],
-            )
-            logger.info(
-                "Batch geocoded %s new rows (unique=%s, api_calls=%s)",
-                stats.get('updated_rows'),
-                stats.get('unique_addresses'),
-                stats.get('api_calls'),
-            )
-            return stats
+            from core.services.serv_co_geoMarkers import invalidate_marker_cache
+            from reporting.services.serv_rep_cache import invalidate_tags, TAG_TRADES, TAG_PARTNERSHIPS
+
+            invalidate_tags(TAG_TRADES, TAG_PARTNERSHIPS)
+            invalidate_marker_cache()
         except Exception as exc:
-            logger.warning(f"Batch geocode failed: {exc}")
-            return None
-        finally:
-            self._new_row_ids.clear()
+            logger.warning(f"Post-import cache invalidation failed: {exc}")
+
+        return queued
 
     def _save_import_mapping(
         self,
@@ -3,7 +3,8 @@ File Processing Module
 
 WHAT: Reads and decrypts Excel/CSV files
 WHY: Handles various file formats and password-protected files
-HOW: Uses pandas for reading, msoffcrypto for decryption
+HOW: Uses pandas for reading, msoffcrypto for decryption; each file is read (and
+     decrypted) once - header detection runs on the raw in-memory frame
 
 USAGE:
     processor = FileProcessor(file_path, password="SA12345$")
@@ -13,14 +14,30 @@ USAGE:
 import os
 import io
 import logging
+import time
 from pathlib import Path
-from typing import Optional, Any, Tuple
+from typing import Optional, Any, Dict, List, Tuple
 
 import pandas as pd
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# WHAT: .xlsx size (bytes) from which the streaming read-only reader is used
+STREAMING_XLSX_BYTES = int(os.getenv('ETL_STREAMING_XLSX_BYTES', str(10 * 1024 * 1024)))
+
+NA_VALUES = ['', 'NA', 'N/A', 'null', 'NULL', 'None']
+
+
+def _cell_to_str(value: Any) -> Any:
+    """Convert an openpyxl cell value like pandas read_excel(dtype=str, na_values=NA_VALUES)."""
+    if value is None:
+        return np.nan
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    text = str(value)
+    return np.nan if text in NA_VALUES else text
+
 
 class FileProcessor:
     """
@@ -44,7 +61,7 @@ class FileProcessor:
         self.auto_detect_headers = auto_detect_headers
         self.stdout = stdout
 
-    def read(self, sheet: Any = 0, skip_rows: int = 0) -> pd.DataFrame:
+    def read(self, sheet: Any = 0, skip_rows: int = 0, timings: Optional[Dict[str, float]] = None) -> pd.DataFrame:
         """
         WHAT: Read Excel or CSV file into a pandas DataFrame
         WHY: Supports multiple file formats commonly used for data sharing
@@ -55,6 +72,8 @@ class FileProcessor:
         Args:
             sheet: Sheet name or index for Excel files (default: 0)
             skip_rows: Number of rows to skip at beginning (default: 0)
+            timings: Optional dict; seconds spent reading/decrypting ('read') and
+                     detecting headers ('detect') are added to it
 
         Returns:
             DataFrame with file data
@@ -63,20 +82,24 @@ class FileProcessor:
             ValueError: If file format unsupported or reading fails
         """
         file_ext = self.file_path.suffix.lower()
+        timings = timings if timings is not None else {}
+        started = time.perf_counter()
 
         try:
+            if file_ext not in ['.xlsx', '.xls', '.csv']:
+                raise ValueError(f'Unsupported file format: {file_ext}. Use .xlsx, .xls, or .csv')
+
             # Auto-detect header row if enabled and skip_rows is 0 (not manually set)
             if self.auto_detect_headers and skip_rows == 0:
-                # STEP 1: Read file WITHOUT headers (header=None) for detection
-                if file_ext in ['.xlsx', '.xls']:
-                    df_raw = self._read_excel(sheet, skip_rows=0, header=None)
-                elif file_ext == '.csv':
-                    df_raw = self._read_csv(skip_rows=0, header=None)
-                else:
-                    raise ValueError(f'Unsupported file format: {file_ext}. Use .xlsx, .xls, or .csv')
+                # STEP 1: Read (and decrypt) the file ONCE without headers
+                df_raw = self._read_raw(sheet)
+                detect_started = time.perf_counter()
+                timings['read'] = timings.get('read', 0.0) + detect_started - started
 
                 # STEP 2: Detect where headers actually are
                 header_row, data_start_row = self._detect_header_row(df_raw)
+                timings['detect'] = timings.get('detect', 0.0) + time.perf_counter() - detect_started
+                started = time.perf_counter()
 
                 if self.stdout:
                     self.stdout.write(
@@ -84,29 +107,18 @@ class FileProcessor:
                         f'data starts at row {data_start_row + 1}\n'
                     )
 
-                # STEP 3: Re-read with correct header row
-                # skiprows: skip all rows BEFORE header_row
-                # header: use next row (row 0 after skipping) as column names
-                if file_ext in ['.xlsx', '.xls']:
-                    df = self._read_excel(sheet, skip_rows=header_row, header=0)
-                else:
-                    df = self._read_csv(skip_rows=header_row, header=0)
-
-                # STEP 4: Skip any intermediate rows between header and data_start
-                # After reading with header at header_row, data_start_row becomes relative
-                rows_to_skip = data_start_row - header_row - 1
-                if rows_to_skip > 0:
-                    if self.stdout:
-                        self.stdout.write(f'      [DEBUG] Skipping {rows_to_skip} rows between header and data\n')
-                    df = df.iloc[rows_to_skip:].reset_index(drop=True)
-            else:
+                # STEP 3: Re-slice the in-memory frame instead of re-reading the file
+                if self.stdout and data_start_row - header_row - 1 > 0:
+                    self.stdout.write(
+                        f'      [DEBUG] Skipping {data_start_row - header_row - 1} rows between header and data\n'
+                    )
+                df = self._slice_raw_frame(df_raw, header_row, data_start_row)
+            elif file_ext == '.csv':
                 # No auto-detection, read normally
-                if file_ext in ['.xlsx', '.xls']:
-                    df = self._read_excel(sheet, skip_rows, header=0)
-                elif file_ext == '.csv':
-                    df = self._read_csv(skip_rows, header=0)
-                else:
-                    raise ValueError(f'Unsupported file format: {file_ext}. Use .xlsx, .xls, or .csv')
+                df = self._read_csv(skip_rows, header=0)
+            else:
+                df = self._slice_raw_frame(self._read_raw(sheet), skip_rows, skip_rows + 1)
+            timings['read'] = timings.get('read', 0.0) + time.perf_counter() - started
 
             # Clean column names: strip whitespace, replace special chars
             df.columns = df.columns.str.strip().str.replace(r'\s+', ' ', regex=True)
@@ -124,7 +136,144 @@ class FileProcessor:
         except Exception as e:
             raise ValueError(f'Error reading file: {str(e)}')
 
-    def _read_excel(self, sheet: Any, skip_rows: int, header: Any = 0) -> pd.DataFrame:
+    def sheet_names(self) -> List[Any]:
+        """
+        WHAT: Sheets of an Excel workbook (``[0]`` for CSV)
+        WHY: Multi-sheet tapes are ingested one task per sheet
+        HOW: pandas.ExcelFile on the (decrypted) source; openpyxl opens it read-only, so
+             only the workbook index is parsed
+        """
+        file_ext = self.file_path.suffix.lower()
+        if file_ext == '.csv':
+            return [0]
+        if file_ext not in ['.xlsx', '.xls']:
+            raise ValueError(f'Unsupported file format: {file_ext}. Use .xlsx, .xls, or .csv')
+        engine = 'openpyxl' if file_ext == '.xlsx' else 'xlrd'
+        with pd.ExcelFile(self._excel_source(), engine=engine) as workbook:
+            return list(workbook.sheet_names)
+
+    def _read_raw(self, sheet: Any = 0) -> pd.DataFrame:
+        """
+        WHAT: Read the whole sheet/file once with header=None (all values as strings)
+        WHY: Header detection and the final frame both come from this single read, so
+             password-protected workbooks are decrypted once and files are parsed once
+        HOW: CSV via _read_csv; .xlsx at or above STREAMING_XLSX_BYTES via the streaming
+             read-only openpyxl reader; other Excel files via pandas
+
+        Args:
+            sheet: Sheet name or index for Excel files
+
+        Returns:
+            DataFrame with positional (integer) columns and raw rows
+        """
+        file_ext = self.file_path.suffix.lower()
+        if file_ext == '.csv':
+            return self._read_csv(skip_rows=0, header=None)
+
+        source = self._excel_source()
+        if file_ext == '.xlsx' and self._source_size(source) >= STREAMING_XLSX_BYTES:
+            if self.stdout:
+                self.stdout.write('      [FILE READ] Large workbook - using streaming read-only reader\n')
+            return self._read_xlsx_streaming(source, sheet)
+        return self._read_excel(sheet, skip_rows=0, header=None, source=source)
+
+    def _excel_source(self) -> Any:
+        """
+        WHAT: Path or decrypted in-memory copy of the workbook
+        HOW: Decrypt with msoffcrypto when a password is set (.xlsx only)
+        """
+        if self.file_path.suffix.lower() != '.xlsx' or not self.password:
+            return self.file_path
+
+        try:
+            import msoffcrypto
+        except ImportError:
+            if self.stdout:
+                self.stdout.write(
+                    '   [WARNING] msoffcrypto-tool not installed. '
+                    'Install with: pip install msoffcrypto-tool\n'
+                )
+            # Try without password
+            return self.file_path
+
+        try:
+            decrypted = io.BytesIO()
+            with open(self.file_path, 'rb') as f:
+                office_file = msoffcrypto.OfficeFile(f)
+                office_file.load_key(password=self.password)
+                office_file.decrypt(decrypted)
+            decrypted.seek(0)
+            return decrypted
+        except Exception as decrypt_error:
+            raise ValueError(f'Failed to decrypt password-protected Excel: {str(decrypt_error)}')
+
+    @staticmethod
+    def _source_size(source: Any) -> int:
+        """Byte size of a path or in-memory buffer."""
+        if isinstance(source, io.BytesIO):
+            return source.getbuffer().nbytes
+        return os.path.getsize(source)
+
+    def _read_xlsx_streaming(self, source: Any, sheet: Any = 0) -> pd.DataFrame:
+        """
+        WHAT: Stream an .xlsx sheet row by row with openpyxl read-only mode
+        WHY: Large tapes (50MB+) should not hold the full cell tree plus an object
+             DataFrame in memory at once
+        HOW: iter_rows(values_only=True), converting each cell to the same string/NaN
+             values pandas produces with dtype=str and our na_values
+
+        DOCS: https://openpyxl.readthedocs.io/en/stable/optimized.html
+        """
+        import openpyxl
+
+        workbook = openpyxl.load_workbook(source, read_only=True, data_only=True, keep_links=False)
+        try:
+            worksheet = workbook.worksheets[sheet] if isinstance(sheet, int) else workbook[sheet]
+            rows = []
+            width = 0
+            last_non_empty = -1
+            for values in worksheet.iter_rows(values_only=True):
+                row = [_cell_to_str(v) for v in values]
+                while row and row[-1] is np.nan:
+                    row.pop()
+                if row:
+                    width = max(width, len(row))
+                    last_non_empty = len(rows)
+                rows.append(row)
+        finally:
+            workbook.close()
+
+        # WHAT: Drop trailing empty rows (pandas does the same)
+        rows = rows[:last_non_empty + 1]
+        return pd.DataFrame(
+            [row + [np.nan] * (width - len(row)) for row in rows],
+            columns=range(width),
+            dtype=object,
+        )
+
+    @staticmethod
+    def _slice_raw_frame(df_raw: pd.DataFrame, header_row: int, data_start_row: int) -> pd.DataFrame:
+        """
+        WHAT: Build the final frame from the raw (header=None) frame
+        HOW: Use row ``header_row`` as column names and rows from ``data_start_row``
+             (at least header_row + 1) as data; blank and repeated header cells are
+             named like pandas does ("Unnamed: 3", "Balance.1")
+        """
+        columns = []
+        seen: dict = {}
+        for idx, value in enumerate(df_raw.iloc[header_row].tolist() if len(df_raw) > header_row else []):
+            name = f'Unnamed: {idx}' if pd.isna(value) else str(value)
+            if name in seen:
+                seen[name] += 1
+                name = f'{name}.{seen[name]}'
+            seen.setdefault(name, 0)
+            columns.append(name)
+
+        df = df_raw.iloc[max(data_start_row, header_row + 1):].reset_index(drop=True)
+        df.columns = columns or df.columns
+        return df
+
+    def _read_excel(self, sheet: Any, skip_rows: int, header: Any = 0, source: Any = None) -> pd.DataFrame:
         """
         WHAT: Read Excel file with password support
         WHY: Many seller files are password-protected
@@ -134,6 +283,7 @@ class FileProcessor:
             sheet: Sheet name or index
             skip_rows: Rows to skip
             header: Row to use as column names (default: 0), or None to not use headers
+            source: Already opened/decrypted workbook (default: open from file_path)
 
         Returns:
             DataFrame with Excel data
@@ -145,41 +295,13 @@ class FileProcessor:
             'skiprows': skip_rows,
             'header': header,
             'dtype': str,  # Read all as string initially for safer processing
-            'na_values': ['', 'NA', 'N/A', 'null', 'NULL', 'None']
+            'na_values': NA_VALUES
         }
 
         if file_ext == '.xlsx':
             read_kwargs['engine'] = 'openpyxl'
-
-            # Handle password-protected files
-            if self.password:
-                try:
-                    import msoffcrypto
-
-                    # Decrypt the file
-                    decrypted = io.BytesIO()
-                    with open(self.file_path, 'rb') as f:
-                        office_file = msoffcrypto.OfficeFile(f)
-                        office_file.load_key(password=self.password)
-                        office_file.decrypt(decrypted)
-
-                    decrypted.seek(0)
-                    df = pd.read_excel(decrypted, **read_kwargs)
-
-                except ImportError:
-                    if self.stdout:
-                        self.stdout.write(
-                            '   [WARNING] msoffcrypto-tool not installed. '
-                            'Install with: pip install msoffcrypto-tool\n'
-                        )
-                    # Try without password
-                    df = pd.read_excel(self.file_path, **read_kwargs)
-
-                except Exception as decrypt_error:
-                    raise ValueError(f'Failed to decrypt password-protected Excel: {str(decrypt_error)}')
-            else:
-                df = pd.read_excel(self.file_path, **read_kwargs)
-
+            # Handle password-protected files (decrypted once by _excel_source)
+            df = pd.read_excel(source if source is not None else self._excel_source(), **read_kwargs)
         else:  # .xls
             read_kwargs['engine'] = 'xlrd'
             df = pd.read_excel(self.file_path, **read_kwargs)
@@ -237,7 +359,7 @@ class FileProcessor:
                     skiprows=skip_rows,
                     header=header,
                     dtype=str,  # Read all as string initially for safer processing
-                    na_values=['', 'NA', 'N/A', 'null', 'NULL', 'None'],
+                    na_values=NA_VALUES,
                     encoding=encoding,
                     encoding_errors='strict'  # Fail fast if encoding doesn't match
                 )
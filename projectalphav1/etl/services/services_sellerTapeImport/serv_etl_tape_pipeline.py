@@ -0,0 +1,460 @@
+"""
+Parallel Seller Tape Ingestion
+
+WHAT: Ingest several seller tapes (Outlook attachments, repeated --file arguments) and
+      several loan sheets per workbook in one run
+WHY: import_seller_data handled attachments and sheets one after another - decrypt, read,
+     detect headers, AI-map, transform, save - so a seller emailing five tapes (or one
+     workbook with several loan sheets) took the sum of all of them
+HOW: Stage 1 (process pool): list the sheets of each workbook, then read/decrypt, detect
+     headers and map columns for every (file, sheet) concurrently. Workers return the
+     frame, the mapping, their progress lines and their stage timings.
+     Stage 2 (this process): resolve seller/trade per file in source order, then hand each
+     trade's sheets to ONE ordered writer (a DataImporter) - raw rows, transform, bulk
+     save - so writes for a trade stay sequential and deterministic. Outbox side effects
+     and cache invalidation run once per trade instead of once per sheet.
+     TapeTimingReport sums seconds per stage and per sheet next to the wall time.
+
+Workers use the "spawn" start method (the Windows default, and safe next to open DB
+connections) and run django.setup() themselves; a single task runs inline.
+
+USAGE:
+    pipeline = SellerTapePipeline(lambda: DataImporter(auto_create=True), workers=4, all_sheets=True)
+    result = pipeline.run([TapeFile(Path('tape_a.xlsx')), TapeFile(Path('tape_b.xlsx'), 'pw')])
+    for line in result.report.lines():
+        print(line)
+
+Docs reviewed:
+- concurrent.futures.ProcessPoolExecutor: https://docs.python.org/3/library/concurrent.futures.html#processpoolexecutor
+- multiprocessing start methods: https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods
+- pandas.ExcelFile: https://pandas.pydata.org/docs/reference/api/pandas.ExcelFile.html
+"""
+
+import io
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import django
+import pandas as pd
+
+# WHAT: No model imports at module level - importing this package pulls in models, so
+#       spawned workers only unpickle the task functions after django.setup() has run
+
+logger = logging.getLogger(__name__)
+
+# WHAT: Default worker processes for stage 1 (read/detect/map are CPU + network bound)
+TAPE_PIPELINE_WORKERS = int(os.getenv('ETL_TAPE_WORKERS', str(min(4, os.cpu_count() or 1))))
+
+# WHAT: Report order; stage 1 runs in the pool, stage 2 in the per-trade writer
+PREPARE_STAGES = ('list_sheets', 'read', 'detect', 'map')
+WRITE_STAGES = ('resolve', 'raw_rows', 'transform', 'save', 'mapping_save', 'post_import')
+
+
+@dataclass
+class TapeFile:
+    """One downloaded attachment / local file to ingest."""
+
+    file_path: Path
+    password: Optional[str] = None
+
+
+@dataclass
+class SheetTask:
+    """Stage 1 work item: one sheet of one file (picklable for the process pool)."""
+
+    file_index: int
+    file_path: Path
+    password: Optional[str]
+    sheet: Any
+    skip_rows: int = 0
+    limit_rows: Optional[int] = None
+    use_ai: bool = True
+    config: Optional[str] = None
+
+    @property
+    def label(self) -> str:
+        return f'{self.file_path.name}[{self.sheet}]'
+
+
+@dataclass
+class PreparedSheet:
+    """Stage 1 result: the mapped frame of one sheet, or the error that stopped it."""
+
+    task: SheetTask
+    df: Optional[pd.DataFrame] = None
+    column_mapping: Dict[str, str] = field(default_factory=dict)
+    mapping_method: str = 'MANUAL'
+    original_rows: int = 0
+    log: str = ''
+    timings: Dict[str, float] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+@dataclass
+class TapeTimingReport:
+    """Seconds per stage (summed over sheets/workers) and per sheet, plus wall time."""
+
+    stage_seconds: Dict[str, float] = field(default_factory=dict)
+    sheet_seconds: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    prepare_wall_seconds: float = 0.0
+    write_wall_seconds: float = 0.0
+    workers: int = 1
+
+    def add(self, label: str, timings: Dict[str, float]) -> None:
+        sheet = self.sheet_seconds.setdefault(label, {})
+        for stage, seconds in timings.items():
+            self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+            sheet[stage] = sheet.get(stage, 0.0) + seconds
+
+    def lines(self) -> List[str]:
+        """Human-readable report (one stage per line, then one line per sheet)."""
+        prepare_total = sum(self.stage_seconds.get(stage, 0.0) for stage in PREPARE_STAGES)
+        lines = [
+            f'[TIMING] Prepare (read/detect/map): {self.prepare_wall_seconds:.2f}s wall, '
+            f'{prepare_total:.2f}s summed over {self.workers} worker(s)',
+        ]
+        lines += [
+            f'   {stage:<13}{self.stage_seconds[stage]:8.2f}s'
+            for stage in PREPARE_STAGES if stage in self.stage_seconds
+        ]
+        lines.append(f'[TIMING] Write (ordered per trade): {self.write_wall_seconds:.2f}s wall')
+        lines += [
+            f'   {stage:<13}{self.stage_seconds[stage]:8.2f}s'
+            for stage in WRITE_STAGES if stage in self.stage_seconds
+        ]
+        for label, timings in self.sheet_seconds.items():
+            detail = ', '.join(f'{stage} {seconds:.2f}s' for stage, seconds in timings.items())
+            lines.append(f'   {label}: {detail}')
+        return lines
+
+
+@dataclass
+class TapePipelineResult:
+    """Outcome of SellerTapePipeline.run()."""
+
+    records_imported: int = 0
+    sheets_imported: int = 0
+    sheets_skipped: List[Tuple[str, str]] = field(default_factory=list)
+    column_mappings: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    errors: List[Tuple[str, str]] = field(default_factory=list)
+    report: TapeTimingReport = field(default_factory=TapeTimingReport)
+
+
+# Stage 1 - runs in worker processes ------------------------------------------------
+
+def list_tape_sheets(tape: TapeFile) -> Tuple[List[Any], float]:
+    """Sheet names of one file and the seconds spent opening it."""
+    from etl.services.services_sellerTapeImport.serv_etl_file_processor import FileProcessor
+
+    started = time.perf_counter()
+    sheets = FileProcessor(tape.file_path, password=tape.password).sheet_names()
+    return sheets, time.perf_counter() - started
+
+
+def prepare_sheet(task: SheetTask) -> PreparedSheet:
+    """
+    WHAT: Read (decrypt), detect headers and map columns for one sheet
+    WHY: These are the slow, independent steps - each sheet is a separate pool task
+    HOW: Progress lines go to a buffer (a worker cannot write to the command's stdout)
+         and are replayed by the parent in source order
+    """
+    from etl.services.services_sellerTapeImport.serv_etl_ai_mapper import AIColumnMapper
+    from etl.services.services_sellerTapeImport.serv_etl_file_processor import FileProcessor
+
+    log = io.StringIO()
+    prepared = PreparedSheet(task=task)
+    try:
+        processor = FileProcessor(task.file_path, password=task.password, stdout=log)
+        df = processor.read(sheet=task.sheet, skip_rows=task.skip_rows, timings=prepared.timings)
+        prepared.original_rows = len(df)
+        if task.limit_rows and task.limit_rows > 0:
+            df = df.head(task.limit_rows)
+
+        started = time.perf_counter()
+        if task.config:
+            prepared.column_mapping = AIColumnMapper.from_config(task.config, stdout=log).map()
+            prepared.mapping_method = 'MANUAL'
+        else:
+            prepared.column_mapping = AIColumnMapper(list(df.columns), stdout=log).map(use_ai=task.use_ai)
+            prepared.mapping_method = 'AI' if task.use_ai else 'EXACT'
+        prepared.timings['map'] = time.perf_counter() - started
+        prepared.df = df
+    except Exception as exc:
+        prepared.error = str(exc)
+    prepared.log = log.getvalue()
+    return prepared
+
+
+# Pipeline ---------------------------------------------------------------------------
+
+class SellerTapePipeline:
+    """
+    WHAT: Concurrent read/detect/map for many files and sheets, ordered writes per trade
+    WHY: Multi-attachment emails and multi-sheet workbooks were ingested serially
+    HOW: See module docstring
+    """
+
+    def __init__(
+        self,
+        importer_factory: Callable[[], Any],
+        *,
+        workers: Optional[int] = None,
+        all_sheets: bool = False,
+        sheet: Any = 0,
+        skip_rows: int = 0,
+        limit_rows: Optional[int] = None,
+        use_ai: bool = True,
+        config: Optional[str] = None,
+        batch_size: int = 100,
+        dry_run: bool = False,
+        stdout=None,
+    ):
+        """
+        Args:
+            importer_factory: Returns a configured DataImporter (one per file; the first
+                              importer of each trade becomes that trade's writer)
+            workers: Worker processes for stage 1 (default: TAPE_PIPELINE_WORKERS)
+            all_sheets: Ingest every sheet that maps to loan fields (default: only ``sheet``)
+            sheet: Sheet name/index when all_sheets is False
+            skip_rows, limit_rows, use_ai, config: As in import_seller_data
+            batch_size: Records per bulk write batch
+            dry_run: Stop after stage 1 and seller/trade resolution
+            stdout: Django stdout for progress messages
+        """
+        self.importer_factory = importer_factory
+        self.workers = max(1, workers if workers is not None else TAPE_PIPELINE_WORKERS)
+        self.all_sheets = all_sheets
+        self.sheet = sheet
+        self.skip_rows = skip_rows
+        self.limit_rows = limit_rows
+        self.use_ai = use_ai
+        self.config = config
+        self.batch_size = batch_size
+        self.dry_run = dry_run
+        self.stdout = stdout
+
+    def _write(self, message: str) -> None:
+        if self.stdout:
+            self.stdout.write(message)
+
+    def run(self, files: Sequence[TapeFile]) -> TapePipelineResult:
+        """Ingest ``files``; sheets are written in (file, sheet) order within each trade."""
+        result = TapePipelineResult()
+        result.report.workers = self.workers
+        if not files:
+            return result
+
+        started = time.perf_counter()
+        with _LazyPool(self.workers) as executor:
+            prepared = self._prepare(executor, list(files), result)
+        result.report.prepare_wall_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        self._write_by_trade(prepared, files, result)
+        result.report.write_wall_seconds = time.perf_counter() - started
+        return result
+
+    # Stage 1 ----------------------------------------------------------------------
+
+    def _prepare(self, executor, files: List[TapeFile], result: TapePipelineResult) -> List[PreparedSheet]:
+        tasks: List[SheetTask] = []
+        if self.all_sheets:
+            listed = executor.map(list_tape_sheets, files)
+            for index, (tape, outcome) in enumerate(zip(files, listed)):
+                if isinstance(outcome, Exception):
+                    result.errors.append((tape.file_path.name, str(outcome)))
+                    continue
+                sheets, seconds = outcome
+                result.report.add(tape.file_path.name, {'list_sheets': seconds})
+                tasks.extend(self._task(index, tape, sheet) for sheet in sheets)
+        else:
+            tasks = [self._task(index, tape, self.sheet) for index, tape in enumerate(files)]
+
+        prepared = []
+        for outcome, task in zip(executor.map(prepare_sheet, tasks), tasks):
+            if isinstance(outcome, Exception):
+                outcome = PreparedSheet(task=task, error=str(outcome))
+            prepared.append(outcome)
+        return prepared
+
+    def _task(self, index: int, tape: TapeFile, sheet: Any) -> SheetTask:
+        return SheetTask(
+            file_index=index,
+            file_path=Path(tape.file_path),
+            password=tape.password,
+            sheet=sheet,
+            skip_rows=self.skip_rows,
+            limit_rows=self.limit_rows,
+            use_ai=self.use_ai,
+            config=self.config,
+        )
+
+    # Stage 2 ----------------------------------------------------------------------
+
+    def _write_by_trade(
+        self,
+        prepared: List[PreparedSheet],
+        files: Sequence[TapeFile],
+        result: TapePipelineResult,
+    ) -> None:
+        """Resolve seller/trade per file, then write each trade's sheets in order."""
+        by_file: Dict[int, List[PreparedSheet]] = {}
+        for sheet in prepared:
+            self._write(f'\n   Prepared: {sheet.task.label}\n{sheet.log}')
+            result.report.add(sheet.task.label, sheet.timings)
+            skip_reason = None if sheet.error else self._skip_reason(sheet)
+            if sheet.error:
+                result.errors.append((sheet.task.label, sheet.error))
+                self._write(f'      [ERROR] {sheet.error}\n')
+            elif skip_reason:
+                result.sheets_skipped.append((sheet.task.label, skip_reason))
+                self._write(f'      [SKIP] {skip_reason}\n')
+            else:
+                result.column_mappings[sheet.task.label] = sheet.column_mapping
+                by_file.setdefault(sheet.task.file_index, []).append(sheet)
+
+        writers: Dict[Any, _TradeWriter] = {}
+        for file_index in sorted(by_file):
+            file_path = Path(files[file_index].file_path)
+            started = time.perf_counter()
+            try:
+                importer = self.importer_factory()
+                seller, trade = importer.get_or_create_seller_trade(file_path)
+            except Exception as exc:
+                result.errors.append((file_path.name, str(exc)))
+                self._write(f'      [ERROR] {file_path.name}: {exc}\n')
+                continue
+            result.report.add(file_path.name, {'resolve': time.perf_counter() - started})
+            writer = writers.get(trade.pk)
+            if writer is None:
+                writer = writers[trade.pk] = _TradeWriter(importer, seller, trade)
+            writer.sheets.extend(by_file[file_index])
+
+        for writer in writers.values():
+            writer.write(self, result)
+
+    def _skip_reason(self, sheet: PreparedSheet) -> Optional[str]:
+        """Only multi-sheet runs skip sheets (cover pages, pivot tabs, notes)."""
+        if not self.all_sheets:
+            return None
+        if sheet.df is None or sheet.df.empty:
+            return 'no data rows'
+        if not any(sheet.column_mapping.values()):
+            return 'no columns map to loan fields'
+        return None
+
+
+class _TradeWriter:
+    """Ordered bulk writer for one trade: sheets are written one after another."""
+
+    def __init__(self, importer, seller, trade):
+        self.importer = importer
+        self.seller = seller
+        self.trade = trade
+        self.sheets: List[PreparedSheet] = []
+
+    def write(self, pipeline: SellerTapePipeline, result: TapePipelineResult) -> None:
+        pipeline._write(f'\n   Writing trade {self.trade.pk}: {len(self.sheets)} sheet(s)\n')
+        for sheet in self.sheets:
+            label = sheet.task.label
+            if sheet.original_rows != len(sheet.df):
+                pipeline._write(
+                    f'      [LIMIT] {label}: processing only {len(sheet.df)} of {sheet.original_rows} rows (testing mode)\n'
+                )
+            if pipeline.dry_run:
+                pipeline._write(f'      [DRY RUN] {label}: would import {len(sheet.df)} records\n')
+                continue
+            timings: Dict[str, float] = {}
+            try:
+                result.records_imported += self.importer.import_data(
+                    df=sheet.df,
+                    column_mapping=sheet.column_mapping,
+                    seller=self.seller,
+                    trade=self.trade,
+                    batch_size=pipeline.batch_size,
+                    file_path=sheet.task.file_path,
+                    save_mapping=True,  # Always save mapping to database
+                    mapping_method=sheet.mapping_method,
+                    post_import=False,
+                    timings=timings,
+                )
+                result.sheets_imported += 1
+            except Exception as exc:
+                logger.exception('Writing %s failed', label)
+                result.errors.append((label, str(exc)))
+                pipeline._write(f'      [ERROR] {label}: {exc}\n')
+            result.report.add(label, timings)
+
+        if not pipeline.dry_run:
+            started = time.perf_counter()
+            queued = self.importer._run_post_import_jobs()
+            result.report.add(f'trade {self.trade.pk}', {'post_import': time.perf_counter() - started})
+            if queued:
+                pipeline._write(
+                    f"      [GEOCODE] Queued {queued.get('geocode_queued', 0)} new rows for batch geocoding\n"
+                )
+
+
+class _LazyPool:
+    """
+    WHAT: map() that runs in a spawned process pool only when it pays off
+    WHY: Starting a worker means importing Django; a single-file, single-sheet import
+         should not pay for that
+    HOW: Tasks run inline until a map() call has more than one task; the pool then stays
+         up for later calls (workers start on demand, up to ``workers``). Task
+         exceptions are returned, not raised, so one bad attachment does not stop the
+         others.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def map(self, fn: Callable[[Any], Any], items: Sequence[Any]) -> List[Any]:
+        items = list(items)
+        if self.workers > 1 and (len(items) > 1 or self._pool is not None):
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    # WHAT: Referenced from django itself - importing anything under etl.services
+                    #       before setup raises AppRegistryNotReady (settings come from the
+                    #       inherited DJANGO_SETTINGS_MODULE)
+                    initializer=django.setup,
+                )
+            futures = [self._pool.submit(fn, item) for item in items]
+            return [self._outcome(future.result) for future in futures]
+        return [self._outcome(lambda item=item: fn(item)) for item in items]
+
+    @staticmethod
+    def _outcome(call: Callable[[], Any]) -> Any:
+        try:
+            return call()
+        except Exception as exc:
+            return exc
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if self._pool is not None:
+            self._pool.shutdown()
+        return False
+
+
+__all__ = [
+    'PreparedSheet',
+    'SellerTapePipeline',
+    'SheetTask',
+    'TapeFile',
+    'TapePipelineResult',
+    'TapeTimingReport',
+    'list_tape_sheets',
+    'prepare_sheet',
+]
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import mimetypes
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -18,6 +20,7 @@ from etl.models import (
     TradeSettlementStatementETL,
     TradeSettlementStatementLineItem,
 )
+from etl.services.services_valuationExtract.serv_etl_extraction_cache import cached_settlement_extraction
 from etl.services.services_valuationExtract.serv_etl_gemini_client import (
     build_valuation_gemini_vision_client,
 )
@@ -68,12 +71,27 @@ def _enumerate_model_fields(model: dj_models.Model) -> List[str]:
     return sorted(fields)
 
 
+@lru_cache(maxsize=None)
+def _concrete_fields(model: dj_models.Model) -> Dict[str, dj_models.Field]:
+    """Map field name -> field for assignable (non-M2M, non-reverse) fields, cached per model."""
+
+    return {
+        field.name: field
+        for field in model._meta.get_fields()
+        if hasattr(field, "attname") and not field.many_to_many and not field.auto_created
+    }
+
+
 # WHAT: Schema guide for the settlement statement extraction prompt.
 # WHY: Tell Gemini which fields to return in the JSON.
 SCHEMA_GUIDE_TEXT = "\n".join(
     f"  - {field_name}" for field_name in _enumerate_model_fields(TradeSettlementStatementETL)
 )
 
+# WHAT: Hash of the extractable field list.
+# WHY: Part of the extraction cache key so schema changes force a fresh model call.
+SETTLEMENT_SCHEMA_VERSION = hashlib.sha256(SCHEMA_GUIDE_TEXT.encode("utf-8")).hexdigest()[:16]
+
 # WHAT: Prompt template for trade settlement statement extraction.
 # WHY: Provide clear instructions and expected JSON structure.
 PROMPT_TEMPLATE = f"""
@@ -120,6 +138,9 @@ class TradeSettlementExtractionResult:
     # WHAT: Warning messages returned by the extractor.
     # WHY: Surface extraction caveats to operators.
     warnings: List[str] = field(default_factory=list)
+    # WHAT: Unmodified model response.
+    # WHY: Stored in the extraction cache alongside the normalized payload.
+    raw_response: Dict[str, Any] = field(default_factory=dict)
 
 
 class TradeSettlementExtractionService:
@@ -131,6 +152,9 @@ class TradeSettlementExtractionService:
     # WHAT: Default prompt for trade settlement extraction.
     # WHY: Ensure consistent response structure.
     prompt: str = PROMPT_TEMPLATE
+    # WHAT: Schema version for the extraction cache key.
+    # WHY: Cached results are reused only for the same field list.
+    schema_version: str = SETTLEMENT_SCHEMA_VERSION
 
     def __init__(
         self,
@@ -239,6 +263,7 @@ class TradeSettlementExtractionService:
             statement_payload=statement_payload,
             line_items=[item for item in line_items if isinstance(item, dict)],
             warnings=warnings,
+            raw_response=response,
         )
 
 
@@ -252,7 +277,6 @@ class TradeSettlementStatementPipeline:
         # WHY: Allow dependency injection for testing.
         self.extractor = extractor or TradeSettlementExtractionService()
 
-    @transaction.atomic
     def process_document(
         self,
         file_path: Path,
@@ -289,7 +313,9 @@ class TradeSettlementStatementPipeline:
         # WHAT: Attempt extraction with error handling.
         # WHY: Ensure document status is updated on failure.
         try:
-            extraction_result = self.extractor.process(file_path)
+            # WHAT: Reuse a stored result for identical file bytes + prompt/schema.
+            # WHY: Re-uploaded statements skip the vision model call entirely.
+            extraction_result, cache_hit = cached_settlement_extraction(self.extractor, file_path)
         except Exception as exc:
             # WHAT: Mark document as failed with message.
             # WHY: Persist failure state for audit.
@@ -299,24 +325,29 @@ class TradeSettlementStatementPipeline:
             document.save(update_fields=["status", "status_message", "processed_at"])
             raise
 
-        # WHAT: Persist statement record using extracted payload.
-        # WHY: Store structured settlement data for downstream use.
-        statement = self._persist_statement(
-            document=document,
-            payload=extraction_result.statement_payload,
-            line_items=extraction_result.line_items,
-            trade=trade,
-            created_by=created_by,
-        )
+        # WHAT: Persist statement, line items and final status in one transaction.
+        # WHY: The vision call above stays outside the transaction; the writes are all-or-nothing.
+        with transaction.atomic():
+            # WHAT: Persist statement record using extracted payload.
+            # WHY: Store structured settlement data for downstream use.
+            statement = self._persist_statement(
+                document=document,
+                payload=extraction_result.statement_payload,
+                line_items=extraction_result.line_items,
+                trade=trade,
+                created_by=created_by,
+            )
 
-        # WHAT: Update document status based on persistence success.
-        # WHY: Track pipeline outcomes with consistent states.
-        document.status = ExtractionStatus.COMPLETE if statement else ExtractionStatus.PARTIAL
-        # WHAT: Store warnings in the status message (trimmed).
-        # WHY: Make warnings visible without extra queries.
-        document.status_message = "; ".join(extraction_result.warnings)[:1000]
-        document.processed_at = timezone.now()
-        document.save(update_fields=["status", "status_message", "processed_at"])
+            # WHAT: Update document status based on persistence success.
+            # WHY: Track pipeline outcomes with consistent states.
+            document.status = ExtractionStatus.COMPLETE if statement else ExtractionStatus.PARTIAL
+            # WHAT: Store warnings in the status message (trimmed).
+            # WHY: Make warnings visible without extra queries.
+            document.status_message = "; ".join(extraction_result.warnings)[:1000]
+            document.processed_at = timezone.now()
+            document.save(update_fields=["status", "status_message", "processed_at"])
+        if cache_hit:
+            logger.info("Settlement statement %s reused a cached extraction.", file_path.name)
 
         return statement
 
@@ -385,9 +416,9 @@ class TradeSettlementStatementPipeline:
                 )
             )
 
-        # WHAT: Bulk create all line items.
-        # WHY: Improve performance for statements with many items.
-        TradeSettlementStatementLineItem.objects.bulk_create(items_to_create)
+        # WHAT: Bulk create all line items in batches.
+        # WHY: One INSERT per batch instead of per line item.
+        TradeSettlementStatementLineItem.objects.bulk_create(items_to_create, batch_size=500)
 
     def _prepare_model_kwargs(
         self,
@@ -396,13 +427,9 @@ class TradeSettlementStatementPipeline:
     ) -> Dict[str, Any]:
         """Coerce payload values into model-compatible kwargs."""
 
-        # WHAT: Build a map of valid fields on the model.
-        # WHY: Filter payload keys to actual model fields.
-        valid_fields: Dict[str, dj_models.Field] = {
-            field.name: field
-            for field in model._meta.get_fields()
-            if hasattr(field, "attname") and not field.many_to_many and not field.auto_created
-        }
+        # WHAT: Look up the valid fields on the model (computed once per model class).
+        # WHY: Filter payload keys to actual model fields without re-walking _meta.
+        valid_fields = _concrete_fields(model)
 
         # WHAT: Prepare output dictionary for model creation.
         # WHY: Separate clean data from raw payload.
@@ -0,0 +1,266 @@
+"""
+Content-addressed cache for document extraction results.
+
+WHAT: Reuse vision-model output when the same document is processed again
+WHY: Re-uploading an appraisal, retrying a queued BPO or re-running smart_extract /
+     multipass_extract sent identical bytes to Gemini every time (minutes of latency and
+     per-call cost for an answer we already had)
+HOW: Key = (SHA-256 of the file bytes, result kind, extractor version). The version hashes
+     the extractor class, model name, prompt and model schema guide (_build_schema_guide),
+     so editing a prompt or adding model fields invalidates old entries automatically.
+     The raw model response and the normalized result payload are stored in
+     ExtractionResultCache; a hit rebuilds the result object without any API call.
+     Empty results are not cached so a bad model response is retried next time.
+
+USAGE:
+    result, hit = cached_valuation_extraction(extractor, file_path)
+    result, hit = cached_settlement_extraction(extractor, file_path)
+
+Set ETL_EXTRACTION_CACHE=0 to bypass the cache (always call the model).
+
+Docs reviewed:
+- hashlib.file_digest: https://docs.python.org/3/library/hashlib.html#file-hashing
+- QuerySet.update_or_create(): https://docs.djangoproject.com/en/5.2/ref/models/querysets/#update-or-create
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from etl.models import ExtractionResultCache
+from etl.services.services_valuationExtract.serv_etl_valuation_vision_extractor import (
+    VALUATION_SCHEMA_VERSION,
+    DocumentExtractionResult,
+    FieldExtractionRecord,
+)
+
+logger = logging.getLogger(__name__)
+
+EXTRACTION_CACHE_ENABLED = os.getenv("ETL_EXTRACTION_CACHE", "1").lower() not in {"0", "false", "no"}
+
+# WHAT: Bump when the stored payload layout changes (forces a miss for old rows)
+CACHE_FORMAT_VERSION = "1"
+
+_HASH_BLOCK_BYTES = 1024 * 1024
+
+ResultT = TypeVar("ResultT")
+
+
+def file_sha256(file_path: Path) -> str:
+    """SHA-256 hex digest of a file, read in 1 MB blocks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as handle:
+        for block in iter(lambda: handle.read(_HASH_BLOCK_BYTES), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def extractor_cache_version(extractor: Any) -> str:
+    """Version string for an extractor's output.
+
+    Extractors may define ``cache_version`` explicitly (multi-pass/optimized flows with
+    several prompts); otherwise the class, model name, prompt and ``schema_version``
+    attributes are hashed.
+    """
+    explicit = getattr(extractor, "cache_version", None)
+    parts = [CACHE_FORMAT_VERSION, f"{type(extractor).__module__}.{type(extractor).__qualname__}"]
+    if explicit:
+        parts.append(str(explicit))
+    else:
+        parts.extend([
+            str(getattr(extractor, "model_name", "")),
+            str(getattr(extractor, "prompt", "")),
+            str(getattr(extractor, "schema_version", "")),
+        ])
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def _cached_extraction(
+    file_path: Path,
+    *,
+    kind: str,
+    version: str,
+    extract: Callable[[Path], ResultT],
+    dump: Callable[[ResultT], Optional[Tuple[Dict[str, Any], Dict[str, Any]]]],
+    load: Callable[[Path, Dict[str, Any], Dict[str, Any]], ResultT],
+    refresh: bool = False,
+) -> Tuple[ResultT, bool]:
+    """Return ``(result, cache_hit)``; on miss run ``extract`` and store its output.
+
+    ``dump(result)`` returns ``(raw_response, normalized)`` or None when the result should
+    not be cached; ``load(file_path, raw_response, normalized)`` rebuilds the result.
+    """
+    file_path = Path(file_path)
+    if not EXTRACTION_CACHE_ENABLED:
+        return extract(file_path), False
+
+    digest = file_sha256(file_path)
+    if not refresh:
+        entry = (
+            ExtractionResultCache.objects
+            .filter(content_sha256=digest, kind=kind, version=version)
+            .only("id", "raw_response", "normalized")
+            .first()
+        )
+        if entry is not None:
+            ExtractionResultCache.objects.filter(pk=entry.pk).update(
+                hit_count=F("hit_count") + 1, last_used_at=timezone.now(),
+            )
+            logger.info("Extraction cache hit for %s (%s %s)", file_path.name, kind, digest[:12])
+            return load(file_path, entry.raw_response or {}, entry.normalized or {}), True
+
+    result = extract(file_path)
+    try:
+        dumped = dump(result)
+        if dumped is None:
+            return result, False
+        raw_response, normalized = dumped
+        # WHAT: Savepoint - a concurrent worker may store the same key first, and a
+        #       failed write must not poison the caller's transaction
+        with transaction.atomic():
+            ExtractionResultCache.objects.update_or_create(
+                content_sha256=digest,
+                kind=kind,
+                version=version,
+                defaults={
+                    "file_size_bytes": file_path.stat().st_size,
+                    "raw_response": raw_response,
+                    "normalized": normalized,
+                },
+            )
+    except IntegrityError:
+        logger.debug("Extraction cache entry for %s stored concurrently", digest[:12])
+    except Exception as exc:
+        # WHAT: The cache is an optimization - a store failure must not discard a paid result
+        logger.warning("Extraction cache store failed for %s (%s): %s", file_path.name, digest[:12], exc)
+    return result, False
+
+
+# Valuation documents ----------------------------------------------------------------
+
+def dump_document_result(result: DocumentExtractionResult) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """Split a DocumentExtractionResult into (raw_response, normalized) JSON payloads."""
+    if not (result.valuation_payload or result.comparables_payload or result.repairs_payload or result.fields):
+        return None
+    normalized = {
+        "mime_type": result.mime_type,
+        "extracted_at": result.extracted_at.isoformat() if result.extracted_at else None,
+        "fields": [asdict(record) for record in result.fields],
+        "valuation_payload": result.valuation_payload,
+        "comparables_payload": result.comparables_payload,
+        "repairs_payload": result.repairs_payload,
+        "warnings": list(result.warnings),
+        "inferred_source": result.inferred_source,
+    }
+    return result.raw_response or {}, normalized
+
+
+def load_document_result(
+    file_path: Path,
+    raw_response: Dict[str, Any],
+    normalized: Dict[str, Any],
+) -> DocumentExtractionResult:
+    """Rebuild a DocumentExtractionResult stored by dump_document_result."""
+    extracted_at = parse_datetime(normalized.get("extracted_at") or "") or timezone.now()
+    return DocumentExtractionResult(
+        file_path=Path(file_path),
+        mime_type=normalized.get("mime_type") or "application/pdf",
+        extracted_at=extracted_at,
+        fields=[FieldExtractionRecord(**record) for record in normalized.get("fields") or []],
+        valuation_payload=normalized.get("valuation_payload") or {},
+        comparables_payload=normalized.get("comparables_payload") or [],
+        repairs_payload=normalized.get("repairs_payload") or [],
+        raw_response=raw_response,
+        warnings=list(normalized.get("warnings") or []),
+        inferred_source=normalized.get("inferred_source"),
+    )
+
+
+def cached_valuation_extraction(
+    extractor: Any,
+    file_path: Path,
+    *,
+    extract: Optional[Callable[[Path], DocumentExtractionResult]] = None,
+    refresh: bool = False,
+) -> Tuple[DocumentExtractionResult, bool]:
+    """Run ``extractor.process`` (or ``extract``) through the cache for a valuation document."""
+    return _cached_extraction(
+        file_path,
+        kind=ExtractionResultCache.Kind.VALUATION,
+        version=extractor_cache_version(extractor),
+        extract=extract or extractor.process,
+        dump=dump_document_result,
+        load=load_document_result,
+        refresh=refresh,
+    )
+
+
+# Settlement statements --------------------------------------------------------------
+
+def cached_settlement_extraction(
+    extractor: Any,
+    file_path: Path,
+    *,
+    refresh: bool = False,
+):
+    """Run a TradeSettlementExtractionService through the cache.
+
+    Returns:
+        ``(TradeSettlementExtractionResult, cache_hit)``
+    """
+    # WHAT: Local import - the settlement pipeline imports this module
+    from etl.services.services_tradeSettlementExtract.serv_etl_settlementStmt_pipeline import (
+        TradeSettlementExtractionResult,
+    )
+
+    def dump(result):
+        if not (result.statement_payload or result.line_items):
+            return None
+        normalized = {
+            "mime_type": result.mime_type,
+            "extracted_at": result.extracted_at.isoformat() if result.extracted_at else None,
+            "statement_payload": result.statement_payload,
+            "line_items": result.line_items,
+            "warnings": list(result.warnings),
+        }
+        return result.raw_response or {}, normalized
+
+    def load(path, raw_response, normalized):
+        return TradeSettlementExtractionResult(
+            file_path=Path(path),
+            mime_type=normalized.get("mime_type") or "application/pdf",
+            extracted_at=parse_datetime(normalized.get("extracted_at") or "") or timezone.now(),
+            statement_payload=normalized.get("statement_payload") or {},
+            line_items=normalized.get("line_items") or [],
+            warnings=list(normalized.get("warnings") or []),
+            raw_response=raw_response,
+        )
+
+    return _cached_extraction(
+        file_path,
+        kind=ExtractionResultCache.Kind.SETTLEMENT,
+        version=extractor_cache_version(extractor),
+        extract=extractor.process,
+        dump=dump,
+        load=load,
+        refresh=refresh,
+    )
+
+
+__all__ = [
+    "VALUATION_SCHEMA_VERSION",
+    "cached_settlement_extraction",
+    "cached_valuation_extraction",
+    "extractor_cache_version",
+    "file_sha256",
+]
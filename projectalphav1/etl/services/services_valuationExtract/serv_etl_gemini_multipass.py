@@ -11,6 +11,7 @@ from django.utils import timezone
 
 from etl.services.services_valuationExtract.serv_etl_gemini_client import build_valuation_gemini_vision_client
 from etl.services.services_valuationExtract.serv_etl_valuation_vision_extractor import (
+    VALUATION_SCHEMA_VERSION,
     DocumentExtractionResult,
     _build_schema_guide,
 )
@@ -250,6 +251,13 @@ class MultiPassGeminiExtractor:
     def process(self, file_path: Path) -> DocumentExtractionResult:
         """Alias for extract() to match pipeline interface."""
         return self.extract(file_path)
+
+    @property
+    def cache_version(self) -> str:
+        """Extraction cache version: all pass prompts/field lists plus the model schema."""
+        return "|".join([
+            ",".join(PASS1_FIELDS), PASS2_PROMPT, ",".join(PASS3_FIELDS), PASS4_PROMPT, VALUATION_SCHEMA_VERSION,
+        ])
     
     def _parse_response(self, response) -> Dict[str, Any]:
         """Parse Gemini response into JSON."""
@@ -305,8 +313,11 @@ def multipass_extract(file_path: str) -> DocumentExtractionResult:
         print(f"Extracted {len(result.comparables_payload)} comparables")
         print(f"Extracted {len(result.repairs_payload)} repairs")
     """
+    from etl.services.services_valuationExtract.serv_etl_extraction_cache import cached_valuation_extraction
+
     extractor = MultiPassGeminiExtractor()
-    return extractor.extract(Path(file_path))
+    result, _ = cached_valuation_extraction(extractor, Path(file_path))
+    return result
 
 
 __all__ = [
@@ -12,6 +12,8 @@ import google.generativeai as genai
 
 from etl.services.services_valuationExtract.serv_etl_gemini_client import build_valuation_gemini_vision_client
 from etl.services.services_valuationExtract.serv_etl_valuation_vision_extractor import (
+    PROMPT_TEMPLATE,
+    VALUATION_SCHEMA_VERSION,
     GeminiVisionExtractionService,
     DocumentExtractionResult,
 )
@@ -69,6 +71,9 @@ Include arrays for "comparables" and "repairs" if found.
 
 class OptimizedGeminiExtractor:
     """Optimized extractor with fast and full modes."""
+
+    # WHAT: Extraction cache version for smart_extract (fast prompt + full prompt + schema)
+    cache_version = "|".join([FAST_EXTRACTION_PROMPT, PROMPT_TEMPLATE, VALUATION_SCHEMA_VERSION])
     
     def __init__(self):
         """Initialize with Gemini client."""
@@ -198,8 +203,11 @@ def smart_extract(file_path: str) -> DocumentExtractionResult:
         else:
             print(f"Extracted {len(result.fields)} fields")
     """
+    from etl.services.services_valuationExtract.serv_etl_extraction_cache import cached_valuation_extraction
+
     extractor = OptimizedGeminiExtractor()
-    return extractor.smart_extract(Path(file_path))
+    result, _ = cached_valuation_extraction(extractor, Path(file_path), extract=extractor.smart_extract)
+    return result
 
 
 __all__ = [
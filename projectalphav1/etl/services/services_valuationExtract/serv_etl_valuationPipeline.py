@@ -7,8 +7,9 @@ import logging
 import re
 from dataclasses import dataclass, field
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Type
 
 from django.db import DataError, models as dj_models, transaction
 from django.utils import timezone
@@ -25,6 +26,7 @@ from etl.models import (
     ValuationDocument,
     ValuationETL,
 )
+from etl.services.services_valuationExtract.serv_etl_extraction_cache import cached_valuation_extraction
 from etl.services.services_valuationExtract.serv_etl_gemini_client import build_valuation_gemini_vision_client
 from etl.services.services_valuationExtract.serv_etl_valuation_vision_extractor import (
     GeminiVisionExtractionService,
@@ -34,6 +36,136 @@ from etl.services.services_valuationExtract.serv_etl_valuation_vision_extractor
 
 logger = logging.getLogger(__name__)
 
+BULK_BATCH_SIZE = 500
+
+_NON_NUMERIC_RE = re.compile(r"[^0-9\.-]")
+_NON_WORD_RE = re.compile(r"\W+")
+_EMPTY_NUMERIC = {"", "-", ".", "-."}
+_TRUE_STRINGS = {"yes", "true", "1", "y"}
+_FALSE_STRINGS = {"no", "false", "0", "n"}
+
+
+class FieldPlan(NamedTuple):
+    """Precompiled coercion for one model field (built once per model class)."""
+
+    coerce: Callable[[object], Optional[object]]
+    max_length: Optional[int]
+    keep_none: bool  # null/blank fields keep an explicit None
+
+
+@lru_cache(maxsize=None)
+def _choice_map(field: dj_models.Field) -> Dict[str, object]:
+    """Lower-cased key/label forms (with and without punctuation) -> choice key."""
+    choice_map: Dict[str, object] = {}
+    for key, label in field.flatchoices:
+        if key in (None, ""):
+            continue
+        forms = {
+            str(key),
+            str(label),
+            _NON_WORD_RE.sub("", str(key)),
+            _NON_WORD_RE.sub("", str(label)),
+        }
+        for form in forms:
+            choice_map[form.lower()] = key
+    return choice_map
+
+
+def _normalize_choice_value(field: dj_models.Field, value: object) -> Optional[object]:
+    value_str = str(value).strip()
+    if not value_str:
+        return None
+    choice_map = _choice_map(field)
+    value_norm = value_str.lower()
+    if value_norm in choice_map:
+        return choice_map[value_norm]
+    return choice_map.get(_NON_WORD_RE.sub("", value_norm))
+
+
+def _numeric_coercer(convert, errors):
+    def coerce(value):
+        try:
+            cleaned = _NON_NUMERIC_RE.sub("", str(value))
+            if cleaned in _EMPTY_NUMERIC:
+                return None
+            return convert(cleaned)
+        except errors:
+            return None
+    return coerce
+
+
+def _coerce_boolean(value):
+    if isinstance(value, bool):
+        return value
+    lowered = str(value).strip().lower()
+    if lowered in _TRUE_STRINGS:
+        return True
+    if lowered in _FALSE_STRINGS:
+        return False
+    return None
+
+
+def _coerce_date(value):
+    if isinstance(value, datetime.date):
+        return value
+    return parse_date(str(value))
+
+
+@lru_cache(maxsize=None)
+def _field_coercer(field: dj_models.Field) -> Callable[[object], Optional[object]]:
+    """Pick the type-specific conversion for ``field`` once (same precedence as before:
+    boolean, decimal, integer, float, date, choices, JSON, text)."""
+    if isinstance(field, dj_models.BooleanField):
+        typed = _coerce_boolean
+    elif isinstance(field, dj_models.DecimalField):
+        typed = _numeric_coercer(Decimal, (InvalidOperation, ValueError, TypeError))
+    elif isinstance(field, dj_models.IntegerField):
+        typed = _numeric_coercer(lambda cleaned: int(float(cleaned)), (ValueError, TypeError))
+    elif isinstance(field, dj_models.FloatField):
+        typed = _numeric_coercer(float, (ValueError, TypeError))
+    elif isinstance(field, dj_models.DateField):
+        typed = _coerce_date
+    elif getattr(field, "choices", None):
+        blank = getattr(field, "blank", False)
+        is_json = isinstance(field, dj_models.JSONField)
+
+        def typed(value):
+            choice = _normalize_choice_value(field, value)
+            if choice is not None:
+                return choice
+            if not blank:
+                return None
+            return value if is_json else str(value)
+    elif isinstance(field, dj_models.JSONField):
+        typed = lambda value: value  # noqa: E731
+    else:
+        typed = str
+
+    def coerce(value):
+        if value is None:
+            return None
+        if isinstance(value, str):
+            value = value.strip()
+            if not value:
+                return None
+        return typed(value)
+
+    return coerce
+
+
+@lru_cache(maxsize=None)
+def compile_model_plan(model: Type[dj_models.Model]) -> Dict[str, FieldPlan]:
+    """Field name -> FieldPlan for every concrete, non-M2M field of ``model``."""
+    return {
+        field.name: FieldPlan(
+            coerce=_field_coercer(field),
+            max_length=getattr(field, "max_length", None) or None,
+            keep_none=bool(getattr(field, "null", False) or getattr(field, "blank", False)),
+        )
+        for field in model._meta.get_fields()
+        if hasattr(field, "attname") and not field.many_to_many and not field.auto_created
+    }
+
 
 @dataclass
 class PipelineSummary:
@@ -55,6 +187,7 @@ class ValuationExtractionPipeline:
         *,
         vision_model: str = "gemini-2.5-flash",
         prompt: Optional[str] = None,
+        use_cache: bool = True,
     ) -> None:
         """Initialize the valuation extraction pipeline.
         
@@ -62,7 +195,10 @@ class ValuationExtractionPipeline:
             extractor: Optional custom Gemini vision extraction service
             vision_model: Gemini model name (default: gemini-2.5-flash)
             prompt: Optional custom prompt for extraction
+            use_cache: Reuse stored results for identical file bytes + prompt/schema
+                (see serv_etl_extraction_cache)
         """
+        self.use_cache = use_cache
         if extractor is not None:
             self.extractor = extractor
         else:
@@ -79,7 +215,6 @@ class ValuationExtractionPipeline:
 
     # Public API ------------------------------------------------------------------
 
-    @transaction.atomic
     def process_document(
         self,
         file_path: Path,
@@ -97,6 +232,9 @@ class ValuationExtractionPipeline:
             source: Choice value from ``Valuation.Source``.
             created_by: Optional user instance for audit metadata.
             uploaded_at: Optional timestamp to backfill original upload time.
+
+        The document record and a failed status are committed on their own; everything
+        persisted from a successful extraction is written in one transaction.
         """
 
         file_path = Path(file_path)
@@ -110,20 +248,84 @@ class ValuationExtractionPipeline:
         )
 
         try:
-            extraction_result = self.extractor.process(file_path)
-            logger.info(
-                "Extraction produced %d field(s) for %s",
-                len(extraction_result.fields),
-                file_path,
-            )
-        except Exception as exc:
+            try:
+                extraction_result = self._extract(file_path, document=document)
+            except Exception as exc:
+                document.status = ExtractionStatus.FAILED
+                document.status_message = str(exc)
+                document.processed_at = timezone.now()
+                document.save(update_fields=["status", "status_message", "processed_at"])
+                raise
+
+            with transaction.atomic():
+                return self._persist_results(document, extraction_result, asset_hub=asset_hub, source=source)
+        finally:
+            # WHAT: Entries queued before a failure (outside the rolled-back transaction)
+            self.flush_logs(document)
+
+    def process_queued_document(self, document: ValuationDocument) -> PipelineSummary:
+        """Extract and persist a document claimed from the extraction queue.
+
+        WHAT: Worker entry point (see serv_etl_valuationQueue)
+        WHY: Queued documents may be retried, so persistence must be idempotent
+        HOW: The (slow) vision call runs outside any transaction; results from earlier
+             attempts are replaced inside one transaction. Extraction errors propagate
+             so the queue can schedule a retry or mark the document FAILED.
+
+        Args:
+            document: ValuationDocument with ``asset_hub`` set
+        """
+        if document.asset_hub_id is None:
+            raise ValueError(f"ValuationDocument {document.pk} has no asset hub to attach the valuation to")
+
+        file_path = Path(document.file_path)
+        if not file_path.exists():
+            raise FileNotFoundError(file_path)
+
+        try:
+            extraction_result = self._extract(file_path, document=document)
+            with transaction.atomic():
+                return self._persist_results(
+                    document,
+                    extraction_result,
+                    asset_hub=document.asset_hub,
+                    source=document.source_override or None,
+                )
+        finally:
+            # WHAT: Entries queued before a failure (outside the rolled-back transaction),
+            #       written before the queue records the retry / failure
+            self.flush_logs(document)
+
+    # Internal helpers -------------------------------------------------------------
+
+    def _extract(self, file_path: Path, *, document: Optional[ValuationDocument] = None) -> DocumentExtractionResult:
+        try:
+            if self.use_cache:
+                extraction_result, cache_hit = cached_valuation_extraction(self.extractor, file_path)
+            else:
+                extraction_result, cache_hit = self.extractor.process(file_path), False
+        except Exception:
             logger.exception("Failed to extract valuation document: %s", file_path)
-            document.status = ExtractionStatus.FAILED
-            document.status_message = str(exc)
-            document.processed_at = timezone.now()
-            document.save(update_fields=["status", "status_message", "processed_at"])
             raise
+        if cache_hit and document is not None:
+            self._write_log(document, "info", "Reused cached extraction for identical document content (no model call).")
+        logger.info(
+            "Extraction produced %d field(s) for %s",
+            len(extraction_result.fields),
+            file_path,
+        )
+        return extraction_result
 
+    def _persist_results(
+        self,
+        document: ValuationDocument,
+        extraction_result: DocumentExtractionResult,
+        *,
+        asset_hub: AssetIdHub,
+        source: Optional[str],
+    ) -> PipelineSummary:
+        """Persist an extraction result against ``document`` and set its final status."""
+        file_path = Path(document.file_path)
         field_results = self._persist_field_results(document, extraction_result.fields)
         warnings = list(extraction_result.warnings)
         self._log_messages(document, extraction_result)
@@ -185,12 +387,14 @@ class ValuationExtractionPipeline:
                     effective_source = chosen_source_str or None
 
         try:
-            valuation = self._persist_valuation(
-                asset_hub=asset_hub,
-                source=effective_source,
-                document=document,
-                extraction_result=extraction_result,
-            )
+            # WHAT: Savepoint so a failed valuation write leaves the field results usable
+            with transaction.atomic():
+                valuation = self._persist_valuation(
+                    asset_hub=asset_hub,
+                    source=effective_source,
+                    document=document,
+                    extraction_result=extraction_result,
+                )
         except Exception as exc:
             warnings.append(f"Valuation persistence failed: {exc}")
             logger.warning("Valuation persistence failed for %s: %s", file_path, exc)
@@ -201,6 +405,9 @@ class ValuationExtractionPipeline:
         document.status_message = "; ".join(warnings)[:1000]
         document.processed_at = timezone.now()
         document.save(update_fields=["status", "status_message", "processed_at"])
+        # WHAT: Committed with the results; on an exception the callers' finally flushes
+        #       whatever is still queued once the transaction has rolled back
+        self.flush_logs(document)
 
         return PipelineSummary(
             document=document,
@@ -210,8 +417,6 @@ class ValuationExtractionPipeline:
             source_used=chosen_source,
         )
 
-    # Internal helpers -------------------------------------------------------------
-
     def _create_document_record(
         self,
         *,
@@ -235,22 +440,26 @@ class ValuationExtractionPipeline:
         document: ValuationDocument,
         records: Sequence[FieldExtractionRecord],
     ) -> List[ExtractionFieldResult]:
-        stored: List[ExtractionFieldResult] = []
+        # WHAT: Replace results from an earlier attempt (unique per document/model/field)
+        ExtractionFieldResult.objects.filter(document=document).delete()
+        pending: Dict[Tuple[str, str], ExtractionFieldResult] = {}
         for record in records:
+            key = (record.model_label, record.field)
+            if key in pending:
+                # WHAT: Earlier pages win (same rule as the merged valuation payload)
+                continue
             value_text, value_json = self._serialise_value(record.value)
-            stored.append(
-                ExtractionFieldResult.objects.create(
-                    document=document,
-                    target_model=record.model_label,
-                    target_field=record.field,
-                    value_text=value_text,
-                    value_json=value_json,
-                    confidence=record.confidence,
-                    extraction_method=record.method,
-                    requires_review=record.requires_review,
-                )
+            pending[key] = ExtractionFieldResult(
+                document=document,
+                target_model=record.model_label,
+                target_field=record.field,
+                value_text=value_text,
+                value_json=value_json,
+                confidence=record.confidence,
+                extraction_method=record.method,
+                requires_review=record.requires_review,
             )
-        return stored
+        return ExtractionFieldResult.objects.bulk_create(pending.values(), batch_size=BULK_BATCH_SIZE)
 
     def _persist_valuation(
         self,
@@ -304,11 +513,21 @@ class ValuationExtractionPipeline:
         valuation_kwargs.setdefault("loan_number", "UNKNOWN")
 
         try:
-            valuation = ValuationETL.objects.create(
-                asset_hub=asset_hub,
-                source=source,
-                **valuation_kwargs,
-            )
+            # WHAT: Re-extracting a document updates the valuation it produced earlier
+            valuation = ValuationETL.objects.filter(document=document).first()
+            if valuation is None:
+                valuation = ValuationETL.objects.create(
+                    asset_hub=asset_hub,
+                    source=source,
+                    document=document,
+                    **valuation_kwargs,
+                )
+            else:
+                valuation.asset_hub = asset_hub
+                valuation.source = source
+                for key, value in valuation_kwargs.items():
+                    setattr(valuation, key, value)
+                valuation.save()
         except DataError as exc:
             overflow_details: List[str] = []
             for key, value in valuation_kwargs.items():
@@ -324,10 +543,10 @@ class ValuationExtractionPipeline:
                 logger.warning("%s", detail_message)
             raise
 
-        ExtractionLogEntry.objects.create(
-            document=document,
-            level="info",
-            message=f"Created ValuationETL {valuation.pk} with fields: {sorted(valuation_kwargs.keys())}",
+        self._write_log(
+            document,
+            "info",
+            f"Saved ValuationETL {valuation.pk} with fields: {sorted(valuation_kwargs.keys())}",
         )
 
         comparables_created = self._persist_comparables(
@@ -405,9 +624,13 @@ class ValuationExtractionPipeline:
         document: ValuationDocument,
     ) -> List[ComparablesETL]:
         created: List[ComparablesETL] = []
+        # WHAT: The latest extraction owns the valuation's comparables (retries replace, not append)
+        valuation.comparables.all().delete()
         if not rows:
             return created
 
+        pending: List[Tuple[int, ComparablesETL]] = []
+        used_numbers: set = set()
         for idx, payload in enumerate(rows, start=1):
             enriched_payload = dict(payload or {})
             enriched_payload.setdefault("comp_number", payload.get("comp_number") or idx)
@@ -429,14 +652,23 @@ class ValuationExtractionPipeline:
                 if default_comp_type:
                     kwargs["comp_type"] = default_comp_type
 
-            try:
-                comparable = ComparablesETL.objects.create(valuation=valuation, **kwargs)
-            except Exception as exc:  # pragma: no cover - best effort logging
-                self._write_log(document, "warning", f"Failed to create comparable {idx}: {exc}")
-            else:
-                created.append(comparable)
+            # WHAT: Keep (comp_type, comp_number) unique - chunked documents can repeat numbers
+            key = (kwargs.get("comp_type"), kwargs.get("comp_number"))
+            if key in used_numbers:
+                next_number = max(
+                    (number or 0) for comp_type, number in used_numbers if comp_type == key[0]
+                ) + 1
+                self._write_log(
+                    document,
+                    "info",
+                    f"Comparable {idx}: comp_number {key[1]} already used; renumbered to {next_number}.",
+                )
+                kwargs["comp_number"] = next_number
+                key = (key[0], next_number)
+            used_numbers.add(key)
+            pending.append((idx, ComparablesETL(valuation=valuation, **kwargs)))
 
-        return created
+        return self._bulk_create_rows(ComparablesETL, pending, document, "comparable")
 
     def _persist_repair_items(
         self,
@@ -445,9 +677,11 @@ class ValuationExtractionPipeline:
         document: ValuationDocument,
     ) -> List[RepairItem]:
         created: List[RepairItem] = []
+        valuation.repair_items.all().delete()
         if not rows:
             return created
 
+        pending: List[Tuple[int, RepairItem]] = []
         for idx, payload in enumerate(rows, start=1):
             enriched_payload = dict(payload or {})
             kwargs = self._prepare_model_kwargs(
@@ -472,13 +706,37 @@ class ValuationExtractionPipeline:
             if "repair_recommended" not in kwargs or kwargs["repair_recommended"] is None:
                 kwargs["repair_recommended"] = False
 
+            pending.append((idx, RepairItem(valuation=valuation, **kwargs)))
+
+        return self._bulk_create_rows(RepairItem, pending, document, "repair")
+
+    def _bulk_create_rows(
+        self,
+        model: Type[dj_models.Model],
+        pending: Sequence[Tuple[int, dj_models.Model]],
+        document: ValuationDocument,
+        label: str,
+    ) -> List[dj_models.Model]:
+        """bulk_create ``pending`` rows; if the batch is rejected, retry row by row so one
+        bad row is logged and skipped instead of dropping the whole table."""
+        if not pending:
+            return []
+        try:
+            with transaction.atomic():
+                return model.objects.bulk_create([obj for _, obj in pending], batch_size=BULK_BATCH_SIZE)
+        except Exception as exc:
+            logger.warning("Bulk %s insert failed for document %s (%s); retrying row by row", label, document.pk, exc)
+
+        created: List[dj_models.Model] = []
+        for idx, obj in pending:
             try:
-                repair = RepairItem.objects.create(valuation=valuation, **kwargs)
+                with transaction.atomic():
+                    obj.save(force_insert=True)
             except Exception as exc:  # pragma: no cover - best effort logging
-                self._write_log(document, "warning", f"Failed to create repair {idx}: {exc}")
+                obj.pk = None
+                self._write_log(document, "warning", f"Failed to create {label} {idx}: {exc}")
             else:
-                created.append(repair)
-
+                created.append(obj)
         return created
 
     def _prepare_model_kwargs(
@@ -489,127 +747,37 @@ class ValuationExtractionPipeline:
         document: Optional[ValuationDocument] = None,
         context: str = "",
     ) -> Dict[str, object]:
-        valid_fields: Dict[str, dj_models.Field] = {
-            field.name: field
-            for field in model._meta.get_fields()
-            if hasattr(field, "attname") and not field.many_to_many and not field.auto_created
-        }
+        plans = compile_model_plan(model)
         prepared: Dict[str, object] = {}
 
         for key, value in values.items():
-            field = valid_fields.get(key)
-            if not field:
+            plan = plans.get(key)
+            if plan is None:
+                continue
+            coerced = plan.coerce(value)
+            if coerced is None and not plan.keep_none:
+                continue
+            if plan.max_length and isinstance(coerced, str) and len(coerced) > plan.max_length:
+                prepared[key] = coerced[: plan.max_length]
+                if document is not None:
+                    self._write_log(
+                        document,
+                        "warning",
+                        (
+                            f"{context or model.__name__}: truncated value for '{key}' from "
+                            f"{len(coerced)} to {plan.max_length} characters."
+                        ),
+                    )
                 continue
-            coerced = self._coerce_field_value(field, value)
-            if coerced is None:
-                if not getattr(field, "null", False) and not getattr(field, "blank", False):
-                    continue
-            if isinstance(coerced, str) and hasattr(field, "max_length") and field.max_length:
-                if len(coerced) > field.max_length:
-                    truncated = coerced[: field.max_length]
-                    prepared[key] = truncated
-                    if document is not None:
-                        self._write_log(
-                            document,
-                            "warning",
-                            (
-                                f"{context or model.__name__}: truncated value for '{key}' from "
-                                f"{len(coerced)} to {field.max_length} characters."
-                            ),
-                        )
-                    continue
             prepared[key] = coerced
 
         return prepared
 
     def _coerce_field_value(self, field: dj_models.Field, value: object) -> Optional[object]:
-        if value is None:
-            return None
-
-        if isinstance(value, str):
-            value = value.strip()
-            if not value:
-                return None
-
-        if isinstance(field, dj_models.BooleanField):
-            if isinstance(value, bool):
-                return value
-            lowered = str(value).strip().lower()
-            if lowered in {"yes", "true", "1", "y"}:
-                return True
-            if lowered in {"no", "false", "0", "n"}:
-                return False
-            return None
-
-        if isinstance(field, dj_models.DecimalField):
-            try:
-                cleaned = re.sub(r"[^0-9\.-]", "", str(value))
-                if cleaned in {"", "-", ".", "-."}:
-                    return None
-                return Decimal(cleaned)
-            except (InvalidOperation, ValueError, TypeError):
-                return None
-
-        if isinstance(field, dj_models.IntegerField):
-            try:
-                cleaned = re.sub(r"[^0-9\.-]", "", str(value))
-                if cleaned in {"", "-", ".", "-."}:
-                    return None
-                return int(float(cleaned))
-            except (ValueError, TypeError):
-                return None
-
-        if isinstance(field, dj_models.FloatField):
-            try:
-                cleaned = re.sub(r"[^0-9\.-]", "", str(value))
-                if cleaned in {"", "-", ".", "-."}:
-                    return None
-                return float(cleaned)
-            except (ValueError, TypeError):
-                return None
-
-        if isinstance(field, dj_models.DateField):
-            if isinstance(value, datetime.date):
-                return value
-            parsed = parse_date(str(value))
-            return parsed
-
-        if hasattr(field, "choices") and field.choices:
-            choice = self._normalize_choice(field, value)
-            if choice is not None:
-                return choice
-            if not getattr(field, "blank", False):
-                return None
-
-        if isinstance(field, dj_models.JSONField):
-            return value
-
-        return str(value)
+        return _field_coercer(field)(value)
 
     def _normalize_choice(self, field: dj_models.Field, value: object) -> Optional[object]:
-        value_str = str(value).strip()
-        if not value_str:
-            return None
-        choice_map: Dict[str, object] = {}
-        for key, label in field.flatchoices:
-            if key in (None, ""):
-                continue
-            forms = {
-                str(key),
-                str(label),
-                re.sub(r"\W+", "", str(key)),
-                re.sub(r"\W+", "", str(label)),
-            }
-            for form in forms:
-                choice_map[form.lower()] = key
-
-        value_norm = value_str.lower()
-        value_slug = re.sub(r"\W+", "", value_norm)
-        if value_norm in choice_map:
-            return choice_map[value_norm]
-        if value_slug in choice_map:
-            return choice_map[value_slug]
-        return None
+        return _normalize_choice_value(field, value)
 
     @staticmethod
     def _default_choice(model: dj_models.Model, field_name: str) -> Optional[object]:
@@ -633,11 +801,16 @@ class ValuationExtractionPipeline:
 
     @staticmethod
     def _write_log(document: ValuationDocument, level: str, message: str) -> None:
-        ExtractionLogEntry.objects.create(
-            document=document,
-            level=level,
-            message=message[:1000],
-        )
+        """Queue a log entry on the document; flush_logs writes the batch."""
+        pending = document.__dict__.setdefault("_pending_log_entries", [])
+        pending.append(ExtractionLogEntry(document=document, level=level, message=message[:1000]))
+
+    @staticmethod
+    def flush_logs(document: ValuationDocument) -> None:
+        """Write the log entries queued on ``document`` (no-op when none are pending)."""
+        pending = document.__dict__.pop("_pending_log_entries", None)
+        if pending:
+            ExtractionLogEntry.objects.bulk_create(pending, batch_size=BULK_BATCH_SIZE)
 
 
 __all__ = [
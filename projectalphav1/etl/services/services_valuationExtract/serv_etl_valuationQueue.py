@@ -0,0 +1,365 @@
+"""
+Database-backed queue for valuation document extraction.
+
+WHAT: Enqueue BPO/appraisal documents and process them with a pool of workers
+WHY: ValuationExtractionPipeline.process_document runs one document at a time inside the
+     caller; a 300-BPO seller delivery blocked the upload/command for hours
+HOW: - enqueue_valuation_document() stores a PENDING ValuationDocument (file path, asset hub,
+       optional source override) and returns immediately
+     - ValuationQueueWorker claims PENDING documents with SELECT ... FOR UPDATE SKIP LOCKED,
+       marks them IN_PROGRESS with a lease (locked_by/locked_at) and runs up to
+       ``concurrency`` extractions at once on a thread pool
+     - Failed attempts go back to PENDING with exponential backoff (next_attempt_at) until
+       max_attempts, then FAILED; claims older than the lease are re-queued (crashed worker)
+     - Persistence is idempotent (ValuationExtractionPipeline.process_queued_document), so a
+       retried or re-queued document replaces its earlier results instead of duplicating them
+     - QueueMetrics tracks per-run outcomes and throughput; queue_progress() reports DB counts
+
+USAGE:
+    enqueue_valuation_document(path, asset_hub=hub, source="BPO")
+    ValuationQueueWorker(concurrency=4).run(once=True)
+    # or: python manage.py process_valuation_queue --workers 4
+
+Docs reviewed:
+- select_for_update(skip_locked=True): https://docs.djangoproject.com/en/5.2/ref/models/querysets/#select-for-update
+- Django DB connections in threads: https://docs.djangoproject.com/en/5.2/ref/databases/#persistent-connections
+- concurrent.futures: https://docs.python.org/3/library/concurrent.futures.html
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from django.db import close_old_connections, connections, transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from core.models import AssetIdHub
+from etl.models import ExtractionLogEntry, ExtractionStatus, ValuationDocument
+from etl.services.services_valuationExtract.serv_etl_valuationPipeline import (
+    PipelineSummary,
+    ValuationExtractionPipeline,
+)
+
+logger = logging.getLogger(__name__)
+
+VALUATION_QUEUE_CONCURRENCY = int(os.getenv("VALUATION_QUEUE_CONCURRENCY", "4"))
+VALUATION_QUEUE_MAX_ATTEMPTS = int(os.getenv("VALUATION_QUEUE_MAX_ATTEMPTS", "3"))
+VALUATION_QUEUE_RETRY_SECONDS = int(os.getenv("VALUATION_QUEUE_RETRY_SECONDS", "60"))
+# WHAT: A claim older than this is treated as abandoned (worker crashed mid-document)
+VALUATION_QUEUE_LEASE_SECONDS = int(os.getenv("VALUATION_QUEUE_LEASE_SECONDS", str(30 * 60)))
+
+OUTCOME_COMPLETE = "complete"
+OUTCOME_PARTIAL = "partial"
+OUTCOME_RETRY = "retry"
+OUTCOME_FAILED = "failed"
+
+
+def enqueue_valuation_document(
+    file_path: Path,
+    *,
+    asset_hub: AssetIdHub,
+    source: Optional[str] = None,
+    created_by=None,
+    uploaded_at=None,
+) -> ValuationDocument:
+    """Register a document for background extraction and return it (status PENDING).
+
+    Args:
+        file_path: Local path to the source document (must be readable by the workers)
+        asset_hub: Asset hub the extracted valuation attaches to
+        source: Optional ``Valuation.Source`` override (otherwise inferred)
+        created_by: Optional user for audit metadata
+        uploaded_at: Optional original upload time (default: now)
+    """
+    file_path = Path(file_path)
+    if not file_path.exists():
+        raise FileNotFoundError(file_path)
+
+    return ValuationDocument.objects.create(
+        file_name=file_path.name,
+        file_path=str(file_path),
+        file_mime_type=file_path.suffix.lower(),
+        file_size_bytes=file_path.stat().st_size,
+        uploaded_at=uploaded_at or timezone.now(),
+        status=ExtractionStatus.PENDING,
+        created_by=created_by,
+        asset_hub=asset_hub,
+        source_override=source or "",
+    )
+
+
+def claim_documents(worker_id: str, limit: int, *, lease_seconds: int = VALUATION_QUEUE_LEASE_SECONDS) -> List[ValuationDocument]:
+    """Atomically claim up to ``limit`` runnable documents for ``worker_id`` (oldest upload first).
+
+    Runnable: PENDING and due (next_attempt_at empty or past), or IN_PROGRESS with an
+    expired lease. SKIP LOCKED lets several worker processes claim concurrently without
+    blocking on or double-claiming the same rows.
+    """
+    if limit <= 0:
+        return []
+
+    now = timezone.now()
+    runnable = (
+        Q(status=ExtractionStatus.PENDING, next_attempt_at__isnull=True)
+        | Q(status=ExtractionStatus.PENDING, next_attempt_at__lte=now)
+        | Q(status=ExtractionStatus.IN_PROGRESS, locked_at__lt=now - timedelta(seconds=lease_seconds))
+    )
+    with transaction.atomic():
+        ids = list(
+            ValuationDocument.objects
+            .select_for_update(skip_locked=True)
+            .filter(runnable, asset_hub__isnull=False)
+            .order_by("uploaded_at", "id")
+            .values_list("id", flat=True)[:limit]
+        )
+        if not ids:
+            return []
+        ValuationDocument.objects.filter(id__in=ids).update(
+            status=ExtractionStatus.IN_PROGRESS,
+            locked_by=worker_id,
+            locked_at=now,
+            attempts=F("attempts") + 1,
+        )
+
+    return list(
+        ValuationDocument.objects
+        .filter(id__in=ids)
+        .select_related("asset_hub")
+        .order_by("uploaded_at", "id")
+    )
+
+
+def queue_progress() -> Dict[str, int]:
+    """Queued document counts by status (single GROUP BY), e.g. {'pending': 12, 'complete': 288}."""
+    counts = {status: 0 for status in ExtractionStatus.values}
+    rows = (
+        ValuationDocument.objects
+        .filter(asset_hub__isnull=False)
+        .order_by()
+        .values("status")
+        .annotate(total=Count("id"))
+    )
+    for row in rows:
+        counts[row["status"]] = row["total"]
+    return counts
+
+
+@dataclass
+class QueueMetrics:
+    """Outcome counters and throughput for one worker run (thread-safe)."""
+
+    started: float = field(default_factory=time.monotonic)
+    counts: Dict[str, int] = field(default_factory=lambda: {
+        OUTCOME_COMPLETE: 0, OUTCOME_PARTIAL: 0, OUTCOME_RETRY: 0, OUTCOME_FAILED: 0,
+    })
+    busy_seconds: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record(self, outcome: str, seconds: float) -> None:
+        with self._lock:
+            self.counts[outcome] = self.counts.get(outcome, 0) + 1
+            self.busy_seconds += seconds
+
+    @property
+    def attempts(self) -> int:
+        return sum(self.counts.values())
+
+    @property
+    def finished(self) -> int:
+        """Documents that reached a final status (complete, partial or failed)."""
+        return self.attempts - self.counts.get(OUTCOME_RETRY, 0)
+
+    def as_dict(self) -> Dict[str, float]:
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        attempts = self.attempts
+        return {
+            **self.counts,
+            "attempts": attempts,
+            "finished": self.finished,
+            "elapsed_seconds": round(elapsed, 1),
+            "docs_per_minute": round(self.finished / elapsed * 60, 2),
+            "avg_seconds_per_attempt": round(self.busy_seconds / attempts, 2) if attempts else 0.0,
+        }
+
+
+class ValuationQueueWorker:
+    """Claims queued valuation documents and extracts them concurrently.
+
+    Args:
+        pipeline: Shared ValuationExtractionPipeline (default: Gemini vision pipeline). The
+            extractor must be safe to call from several threads; pass a stub for tests.
+        concurrency: Documents processed at the same time (1 = inline, no threads)
+        max_attempts: Attempts per document before it is marked FAILED
+        retry_delay_seconds: Backoff before the first retry (doubles per attempt)
+        lease_seconds: Age after which another worker may take over an IN_PROGRESS claim
+        worker_id: Lock owner recorded on claimed documents (default: host:pid:random)
+    """
+
+    def __init__(
+        self,
+        pipeline: Optional[ValuationExtractionPipeline] = None,
+        *,
+        concurrency: int = VALUATION_QUEUE_CONCURRENCY,
+        max_attempts: int = VALUATION_QUEUE_MAX_ATTEMPTS,
+        retry_delay_seconds: int = VALUATION_QUEUE_RETRY_SECONDS,
+        lease_seconds: int = VALUATION_QUEUE_LEASE_SECONDS,
+        worker_id: Optional[str] = None,
+    ) -> None:
+        self.pipeline = pipeline or ValuationExtractionPipeline()
+        self.concurrency = max(1, concurrency)
+        self.max_attempts = max(1, max_attempts)
+        self.retry_delay_seconds = retry_delay_seconds
+        self.lease_seconds = lease_seconds
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.metrics = QueueMetrics()
+
+    # Public API ------------------------------------------------------------------
+
+    def run(
+        self,
+        *,
+        once: bool = False,
+        max_documents: Optional[int] = None,
+        poll_interval: float = 5.0,
+        on_progress: Optional[Callable[[ValuationDocument, str, QueueMetrics], None]] = None,
+    ) -> QueueMetrics:
+        """Process the queue until it is drained (``once``), ``max_documents`` have been
+        attempted, or forever (polling every ``poll_interval`` seconds when idle).
+
+        ``on_progress(document, outcome, metrics)`` is called after every attempt.
+        """
+        if self.concurrency == 1:
+            return self._run_inline(once=once, max_documents=max_documents,
+                                    poll_interval=poll_interval, on_progress=on_progress)
+
+        claimed_total = 0
+        in_flight: Dict[Future, ValuationDocument] = {}
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="valuation-queue") as executor:
+            while True:
+                free = self.concurrency - len(in_flight)
+                if max_documents is not None:
+                    free = min(free, max_documents - claimed_total)
+                claimed = claim_documents(self.worker_id, free, lease_seconds=self.lease_seconds) if free > 0 else []
+                claimed_total += len(claimed)
+                for document in claimed:
+                    in_flight[executor.submit(self._process_in_thread, document)] = document
+
+                if not in_flight:
+                    if once or (max_documents is not None and claimed_total >= max_documents):
+                        break
+                    time.sleep(poll_interval)
+                    continue
+
+                done, _ = wait(list(in_flight), timeout=poll_interval, return_when=FIRST_COMPLETED)
+                for future in done:
+                    document = in_flight.pop(future)
+                    self._report(document, future.result(), on_progress)
+        return self.metrics
+
+    def process(self, document: ValuationDocument) -> str:
+        """Run one claimed document through the pipeline and record its final/retry status.
+
+        Returns:
+            One of OUTCOME_COMPLETE, OUTCOME_PARTIAL, OUTCOME_RETRY, OUTCOME_FAILED
+        """
+        started = time.monotonic()
+        try:
+            summary = self.pipeline.process_queued_document(document)
+        except Exception as exc:
+            outcome = self._record_failure(document, exc)
+        else:
+            outcome = self._record_success(document, summary)
+        self.metrics.record(outcome, time.monotonic() - started)
+        return outcome
+
+    # Internal helpers -------------------------------------------------------------
+
+    def _run_inline(self, *, once, max_documents, poll_interval, on_progress) -> QueueMetrics:
+        claimed_total = 0
+        while max_documents is None or claimed_total < max_documents:
+            claimed = claim_documents(self.worker_id, 1, lease_seconds=self.lease_seconds)
+            if not claimed:
+                if once:
+                    break
+                time.sleep(poll_interval)
+                continue
+            claimed_total += 1
+            self._report(claimed[0], self.process(claimed[0]), on_progress)
+        return self.metrics
+
+    def _process_in_thread(self, document: ValuationDocument) -> str:
+        # WHAT: Each pool thread has its own DB connection; drop it when done
+        close_old_connections()
+        try:
+            return self.process(document)
+        finally:
+            connections.close_all()
+
+    def _report(self, document, outcome, on_progress) -> None:
+        logger.info(
+            "Valuation queue: document %s (%s) -> %s [attempt %s]",
+            document.pk, document.file_name, outcome, document.attempts,
+        )
+        if on_progress is not None:
+            on_progress(document, outcome, self.metrics)
+
+    def _owned(self, document: ValuationDocument):
+        """Queryset guard: only update the row while this worker still holds the claim."""
+        return ValuationDocument.objects.filter(pk=document.pk, locked_by=self.worker_id)
+
+    def _record_success(self, document: ValuationDocument, summary: PipelineSummary) -> str:
+        # WHAT: The pipeline already saved status/processed_at; release the claim
+        self._owned(document).update(locked_by="", locked_at=None, next_attempt_at=None)
+        return OUTCOME_COMPLETE if summary.document.status == ExtractionStatus.COMPLETE else OUTCOME_PARTIAL
+
+    def _record_failure(self, document: ValuationDocument, exc: Exception) -> str:
+        attempts = document.attempts
+        message = f"Attempt {attempts}/{self.max_attempts} failed: {exc}"[:1000]
+        now = timezone.now()
+
+        if attempts < self.max_attempts:
+            delay = self.retry_delay_seconds * (2 ** (attempts - 1))
+            updated = self._owned(document).update(
+                status=ExtractionStatus.PENDING,
+                status_message=message,
+                next_attempt_at=now + timedelta(seconds=delay),
+                locked_by="",
+                locked_at=None,
+            )
+            outcome = OUTCOME_RETRY
+            logger.warning("Valuation document %s: %s; retrying in %ss", document.pk, message, delay)
+        else:
+            updated = self._owned(document).update(
+                status=ExtractionStatus.FAILED,
+                status_message=message,
+                processed_at=now,
+                next_attempt_at=None,
+                locked_by="",
+                locked_at=None,
+            )
+            outcome = OUTCOME_FAILED
+            logger.error("Valuation document %s: %s; giving up", document.pk, message)
+
+        if updated:
+            ExtractionLogEntry.objects.create(document=document, level="error", message=message)
+        return outcome
+
+
+__all__ = [
+    "QueueMetrics",
+    "ValuationQueueWorker",
+    "claim_documents",
+    "enqueue_valuation_document",
+    "queue_progress",
+]
@@ -10,11 +10,16 @@ from valuation documents (PDFs, images, etc.). The service:
 
 from __future__ import annotations
 
+import hashlib
 import io
 import json
 import logging
 import mimetypes
+import os
+import random
 import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Tuple
@@ -205,12 +210,22 @@ def _build_schema_guide(minimal: bool = True) -> str:
 # Use minimal=True for faster extraction (50%+ smaller prompt)
 # Set minimal=False if you need more accuracy with choice fields
 SCHEMA_GUIDE_TEXT = _build_schema_guide(minimal=True)
+# WHAT: Changes whenever extractable fields or their choices change (extraction cache key)
+VALUATION_SCHEMA_VERSION = hashlib.sha256(_build_schema_guide(minimal=False).encode("utf-8")).hexdigest()[:16]
 
 # Gemini File API supports up to 50MB files, but we'll use 20MB for safety
 DEFAULT_MAX_DOCUMENT_BYTES = 20 * 1024 * 1024  # ~20 MB Gemini File API limit
 # Target compression size - compress files larger than this
 COMPRESSION_THRESHOLD_BYTES = 10 * 1024 * 1024  # ~10 MB
 
+# Large-PDF chunking: fill each chunk to this share of the size limit (per-page
+# estimates ignore resources shared between pages), and send up to
+# VISION_CHUNK_CONCURRENCY chunks at once with exponential backoff on failures.
+CHUNK_FILL_RATIO = 0.9
+VISION_CHUNK_CONCURRENCY = int(os.getenv("VISION_CHUNK_CONCURRENCY", "4"))
+VISION_CHUNK_MAX_ATTEMPTS = int(os.getenv("VISION_CHUNK_MAX_ATTEMPTS", "3"))
+VISION_RETRY_BASE_SECONDS = 2.0
+
 PROMPT_TEMPLATE = f"""
 Extract property valuation data from this document using vision/OCR.
 
@@ -252,6 +267,19 @@ class FieldExtractionRecord:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class PdfChunk:
+    """Contiguous page range of a large PDF sent to the vision API as one document."""
+
+    index: int                 # 1-based chunk number (page order)
+    page_indexes: List[int]    # 0-based page indexes in the source PDF
+
+    @property
+    def page_range(self) -> Tuple[int, int]:
+        """1-based (first, last) page numbers."""
+        return self.page_indexes[0] + 1, self.page_indexes[-1] + 1
+
+
 @dataclass
 class DocumentExtractionResult:
     file_path: Path
@@ -279,6 +307,7 @@ class GeminiVisionExtractionService:
 
     prompt: str = PROMPT_TEMPLATE
     default_confidence: float = DEFAULT_CONFIDENCE
+    schema_version: str = VALUATION_SCHEMA_VERSION
 
     def __init__(
         self,
@@ -288,6 +317,9 @@ class GeminiVisionExtractionService:
         model_name: str = "gemini-2.5-flash",
         max_document_bytes: int = DEFAULT_MAX_DOCUMENT_BYTES,
         compression_threshold: int = COMPRESSION_THRESHOLD_BYTES,
+        max_concurrency: int = VISION_CHUNK_CONCURRENCY,
+        max_attempts: int = VISION_CHUNK_MAX_ATTEMPTS,
+        retry_base_seconds: float = VISION_RETRY_BASE_SECONDS,
     ) -> None:
         """Initialize the Gemini Vision Extraction Service.
         
@@ -297,12 +329,18 @@ class GeminiVisionExtractionService:
             model_name: Gemini model to use (default: gemini-2.5-flash)
             max_document_bytes: Maximum document size in bytes
             compression_threshold: Compress files larger than this threshold
+            max_concurrency: Chunks of a large PDF sent to the API at the same time
+            max_attempts: Attempts per chunk before the extraction fails
+            retry_base_seconds: First backoff delay (doubles per retry, with jitter)
         """
         self.client = client or build_valuation_gemini_vision_client(default_model=model_name)
         self.prompt = prompt
         self.model_name = model_name
         self.max_document_bytes = max_document_bytes
         self.compression_threshold = compression_threshold
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_attempts = max(1, max_attempts)
+        self.retry_base_seconds = retry_base_seconds
 
     def process(self, file_path: Path) -> DocumentExtractionResult:
         """Process a document file and extract valuation data.
@@ -342,6 +380,7 @@ class GeminiVisionExtractionService:
                 logger.info("Compression successful. New size: %d bytes", file_size)
 
         responses: List[Dict[str, Any]] = []
+        page_ranges: Optional[List[Tuple[int, int]]] = None
         
         try:
             # Process the file based on size and type
@@ -351,7 +390,7 @@ class GeminiVisionExtractionService:
             elif mime_type == "application/pdf":
                 # PDF is too large, split into chunks
                 logger.info("PDF exceeds size limit, splitting into chunks...")
-                responses = self._process_pdf_in_chunks(processed_file_path)
+                responses, page_ranges = self._process_pdf_in_chunks(processed_file_path)
             else:
                 # Non-PDF file is too large even after compression
                 warning = (
@@ -373,7 +412,7 @@ class GeminiVisionExtractionService:
                 )
 
             # Aggregate all responses into a single result
-            aggregate_result = self._aggregate_responses(responses, file_path, mime_type)
+            aggregate_result = self._aggregate_responses(responses, file_path, mime_type, page_ranges=page_ranges)
             return aggregate_result
             
         finally:
@@ -575,14 +614,104 @@ class GeminiVisionExtractionService:
             logger.warning("Image compression failed: %s", exc)
             return None
 
-    def _process_pdf_in_chunks(self, file_path: Path) -> List[Dict[str, Any]]:
-        """Process a large PDF by splitting it into chunks.
+    def _call_vision_with_retry(self, *, file_bytes: bytes, mime_type: str, label: str) -> Dict[str, Any]:
+        """Call the vision API, retrying failures with exponential backoff and jitter.
+
+        Args:
+            file_bytes: The document bytes to process
+            mime_type: The MIME type of the document
+            label: Chunk description for logs (e.g. "chunk 2 (pages 11-20)")
+
+        Returns:
+            Dictionary containing extracted data
+
+        Raises:
+            The last error once max_attempts is exhausted
+        """
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                return self._call_vision(file_bytes=file_bytes, mime_type=mime_type)
+            except Exception as exc:
+                if attempt >= self.max_attempts:
+                    logger.error("Gemini vision %s failed after %d attempt(s): %s", label, attempt, exc)
+                    raise
+                delay = self.retry_base_seconds * (2 ** (attempt - 1))
+                delay += random.uniform(0, delay / 2) if delay else 0
+                logger.warning(
+                    "Gemini vision %s failed (attempt %d/%d): %s; retrying in %.1fs",
+                    label, attempt, self.max_attempts, exc, delay,
+                )
+                time.sleep(delay)
+        raise RuntimeError("unreachable")  # pragma: no cover
+
+    def _plan_pdf_chunks(self, reader: Any, file_name: str) -> List[PdfChunk]:
+        """Group pages into chunks under the size limit in a single pass.
+
+        Each page is serialized once on its own to estimate its size; pages are then
+        packed greedily until the running estimate reaches CHUNK_FILL_RATIO of
+        max_document_bytes. Standalone page sizes over-count fonts/images shared
+        between pages, so estimates err on the safe side.
+
+        Args:
+            reader: pypdf PdfReader for the document
+            file_name: File name used in error messages
+
+        Returns:
+            Chunks in page order
+
+        Raises:
+            ValueError: If a single page exceeds the size limit
+        """
+        budget = int(self.max_document_bytes * CHUNK_FILL_RATIO)
+        chunks: List[PdfChunk] = []
+        current: List[int] = []
+        current_bytes = 0
+
+        for page_index, page in enumerate(reader.pages):
+            page_bytes = len(self._write_pdf_pages([page]))
+            if page_bytes > self.max_document_bytes:
+                message = (
+                    f"Page {page_index + 1} of {file_name} exceeds Gemini vision size limit "
+                    f"({self.max_document_bytes} bytes)."
+                )
+                logger.error(message)
+                raise ValueError(message)
+
+            if current and current_bytes + page_bytes > budget:
+                chunks.append(PdfChunk(index=len(chunks) + 1, page_indexes=current))
+                current, current_bytes = [], 0
+            current.append(page_index)
+            current_bytes += page_bytes
+
+        if current:
+            chunks.append(PdfChunk(index=len(chunks) + 1, page_indexes=current))
+        return chunks
+
+    def _chunk_payloads(self, reader: Any, chunk: PdfChunk) -> List[Tuple[Tuple[int, int], bytes]]:
+        """Serialize a planned chunk, halving it if the real size still exceeds the limit."""
+        pages = [reader.pages[i] for i in chunk.page_indexes]
+        payload = self._write_pdf_pages(pages)
+        if len(payload) <= self.max_document_bytes or len(pages) == 1:
+            return [(chunk.page_range, payload)]
+        middle = len(chunk.page_indexes) // 2
+        return (
+            self._chunk_payloads(reader, PdfChunk(chunk.index, chunk.page_indexes[:middle]))
+            + self._chunk_payloads(reader, PdfChunk(chunk.index, chunk.page_indexes[middle:]))
+        )
+
+    def _process_pdf_in_chunks(self, file_path: Path) -> Tuple[List[Dict[str, Any]], List[Tuple[int, int]]]:
+        """Process a large PDF by splitting it into page-range chunks sent concurrently.
         
+        HOW: _plan_pdf_chunks sizes chunks in one pass; chunk bytes are built on this
+        thread (pypdf objects are not shared across threads) and at most
+        max_concurrency API calls run at once, each with retry/backoff. Results are
+        returned in page order regardless of completion order.
+
         Args:
             file_path: Path to the PDF file
         
         Returns:
-            List of response dictionaries, one per chunk
+            Tuple of (responses, 1-based page ranges), both in page order
         
         Raises:
             RuntimeError: If pypdf is not available
@@ -593,46 +722,54 @@ class GeminiVisionExtractionService:
         reader = PdfReader(str(file_path))
         total_pages = len(reader.pages)
         if total_pages == 0:
-            return []
+            return [], []
 
-        responses: List[Dict[str, Any]] = []
-        current_pages: List[Any] = []
-        current_bytes: Optional[bytes] = None
-
-        def flush_chunk(pages: Sequence[Any], chunk_bytes: Optional[bytes]) -> None:
-            if not pages:
-                return
-            chunk = chunk_bytes if chunk_bytes is not None else self._write_pdf_pages(pages)
-            responses.append(self._call_vision(file_bytes=chunk, mime_type="application/pdf"))
-
-        for page_index, page in enumerate(reader.pages, start=1):
-            tentative_pages = current_pages + [page]
-            tentative_bytes = self._write_pdf_pages(tentative_pages)
-            if len(tentative_bytes) <= self.max_document_bytes:
-                current_pages = tentative_pages
-                current_bytes = tentative_bytes
-                continue
+        chunks = self._plan_pdf_chunks(reader, file_path.name)
+        pending = iter(
+            payload
+            for chunk in chunks
+            for payload in self._chunk_payloads(reader, chunk)
+        )
 
-            if not current_pages:
-                message = (
-                    f"Single page from {file_path.name} exceeds Claude vision size limit "
-                    f"({self.max_document_bytes} bytes)."
+        results: Dict[Tuple[int, int], Dict[str, Any]] = {}
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="vision-chunk") as executor:
+            in_flight: Dict[Any, Tuple[int, int]] = {}
+
+            def submit_next() -> bool:
+                item = next(pending, None)
+                if item is None:
+                    return False
+                page_range, payload = item
+                label = f"chunk pages {page_range[0]}-{page_range[1]}"
+                future = executor.submit(
+                    self._call_vision_with_retry, file_bytes=payload, mime_type="application/pdf", label=label,
                 )
-                logger.error(message)
-                raise ValueError(message)
-
-            flush_chunk(current_pages, current_bytes)
-            current_pages = [page]
-            current_bytes = self._write_pdf_pages(current_pages)
-
-        flush_chunk(current_pages, current_bytes)
+                in_flight[future] = page_range
+                return True
+
+            # WHAT: Keep at most max_concurrency chunk payloads in memory / in flight
+            while len(in_flight) < self.max_concurrency and submit_next():
+                pass
+            while in_flight:
+                done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                for future in done:
+                    page_range = in_flight.pop(future)
+                    try:
+                        results[page_range] = future.result()
+                    except Exception:
+                        for other in in_flight:
+                            other.cancel()
+                        raise
+                    submit_next()
+
+        page_ranges = sorted(results)
         logger.info(
             "Split %s into %d chunk(s) (pages: %d) for Gemini vision.",
             file_path.name,
-            len(responses),
+            len(page_ranges),
             total_pages,
         )
-        return responses
+        return [results[page_range] for page_range in page_ranges], page_ranges
 
     @staticmethod
     def _write_pdf_pages(pages: Sequence[Any]) -> bytes:
@@ -648,7 +785,25 @@ class GeminiVisionExtractionService:
         responses: Sequence[Dict[str, Any]],
         file_path: Path,
         mime_type: str,
+        page_ranges: Optional[Sequence[Tuple[int, int]]] = None,
     ) -> DocumentExtractionResult:
+        """Merge chunk responses in page order into one extraction result.
+
+        Earlier pages win for valuation fields (later chunks only fill empty values);
+        comparables/repairs rows are appended in page order.
+
+        Args:
+            responses: One response per chunk
+            file_path: Original document path
+            mime_type: Document MIME type
+            page_ranges: Optional 1-based (first, last) page range per response; when
+                given, responses are merged sorted by first page
+        """
+        if page_ranges:
+            ordered = sorted(zip(page_ranges, responses), key=lambda item: item[0])
+            page_ranges = [page_range for page_range, _ in ordered]
+            responses = [response for _, response in ordered]
+
         combined_valuation: Dict[str, Any] = {}
         combined_comparables: List[Dict[str, Any]] = []
         combined_repairs: List[Dict[str, Any]] = []
@@ -656,6 +811,7 @@ class GeminiVisionExtractionService:
         combined_warnings: List[str] = []
         inferred_source: Optional[str] = None
         raw_chunks: List[Dict[str, Any]] = []
+        row_counts: Dict[str, int] = {}
 
         for chunk_index, response in enumerate(responses, start=1):
             if not response:
@@ -672,6 +828,15 @@ class GeminiVisionExtractionService:
                 chunk_warnings,
                 field_records,
             ) = self._normalise_response(response, chunk_index=chunk_index)
+            for record in field_records:
+                if page_ranges:
+                    record.metadata["pages"] = list(page_ranges[chunk_index - 1])
+                if "row_index" in record.metadata:
+                    # WHAT: Number table rows across chunks (row_1..row_n per model, not per chunk)
+                    row_number = row_counts.get(record.model_label, 0) + 1
+                    row_counts[record.model_label] = row_number
+                    record.field = f"row_{row_number}"
+                    record.metadata["row_index"] = row_number
 
             self._merge_valuation_payload(combined_valuation, valuation_data)
             combined_comparables.extend(comparables_data)
@@ -691,7 +856,7 @@ class GeminiVisionExtractionService:
             valuation_payload=combined_valuation,
             comparables_payload=combined_comparables,
             repairs_payload=combined_repairs,
-            raw_response={"chunks": raw_chunks},
+            raw_response={"chunks": raw_chunks, "page_ranges": [list(r) for r in page_ranges or []]},
             warnings=combined_warnings,
             inferred_source=inferred_source,
         )
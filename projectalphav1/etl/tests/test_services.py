@@ -10,7 +10,8 @@ Tests for:
 - OutlookScanner
 """
 
-from django.test import TestCase
+from decimal import Decimal
+from django.test import SimpleTestCase, TestCase
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -19,6 +20,7 @@ from etl.services import (
     ValuationExtractionPipeline,
     FileProcessor,
     DataImporter,
+    AIColumnMapper,
 )
 
 
@@ -48,6 +50,96 @@ class GeminiVisionExtractionServiceTestCase(TestCase):
         self.assertEqual(service.max_document_bytes, 20 * 1024 * 1024)  # 20 MB
 
 
+class VisionChunkedExtractionTestCase(SimpleTestCase):
+    """Page-range chunking, concurrency and retry in GeminiVisionExtractionService (stub client)."""
+
+    PAGE_COUNT = 12
+
+    def setUp(self):
+        import io
+        import tempfile
+        from pypdf import PdfWriter
+
+        # WHAT: Page i is (100 + i) points wide so the stub can tell which pages it received
+        writer = PdfWriter()
+        for i in range(self.PAGE_COUNT):
+            writer.add_blank_page(width=100 + i, height=100)
+        buffer = io.BytesIO()
+        writer.write(buffer)
+        tmp = tempfile.NamedTemporaryFile(suffix='.pdf', delete=False)
+        tmp.write(buffer.getvalue())
+        tmp.close()
+        self.pdf_path = Path(tmp.name)
+        self.addCleanup(self.pdf_path.unlink)
+
+        from etl.services.services_valuationExtract.serv_etl_valuation_vision_extractor import GeminiVisionExtractionService as Service
+        page_bytes = len(Service._write_pdf_pages(writer.pages[:1]))
+        self.max_bytes = page_bytes * 4  # several pages per chunk, several chunks
+
+    @staticmethod
+    def _pages_in(file_bytes):
+        import io
+        from pypdf import PdfReader
+        return [int(float(page.mediabox.width)) - 100 for page in PdfReader(io.BytesIO(file_bytes)).pages]
+
+    def _service(self, client, **kwargs):
+        kwargs.setdefault('max_concurrency', 4)
+        kwargs.setdefault('retry_base_seconds', 0)
+        return GeminiVisionExtractionService(
+            client=client, max_document_bytes=self.max_bytes, compression_threshold=10 ** 9, **kwargs,
+        )
+
+    def test_chunks_cover_every_page_in_order(self):
+        """Concurrent chunks are merged in page order; earliest page wins valuation fields."""
+        import threading
+        import time
+
+        seen = []
+        lock = threading.Lock()
+
+        def client(*, file_bytes, mime_type, prompt):
+            pages = self._pages_in(file_bytes)
+            time.sleep(0.01 * (self.PAGE_COUNT - pages[0]))  # later chunks finish first
+            with lock:
+                seen.append(pages)
+            return {
+                'valuation': {'as_is_value': pages[0] or None, 'notes': f'first page {pages[0]}'},
+                'comparables': [{'address': f'page {page}'} for page in pages],
+            }
+
+        result = self._service(client).process(self.pdf_path)
+
+        self.assertGreater(len(seen), 2)
+        self.assertEqual(sorted(p for chunk in seen for p in chunk), list(range(self.PAGE_COUNT)))
+        self.assertEqual([row['address'] for row in result.comparables_payload],
+                         [f'page {i}' for i in range(self.PAGE_COUNT)])
+        self.assertEqual(result.valuation_payload['notes'], 'first page 0')
+        ranges = result.raw_response['page_ranges']
+        self.assertEqual(ranges[0][0], 1)
+        self.assertEqual(ranges[-1][1], self.PAGE_COUNT)
+
+    def test_transient_failure_is_retried(self):
+        """A chunk that fails once is retried and the extraction still succeeds."""
+        calls = {'count': 0}
+
+        def client(*, file_bytes, mime_type, prompt):
+            calls['count'] += 1
+            if calls['count'] == 1:
+                raise RuntimeError('503 UNAVAILABLE')
+            return {'valuation': {}}
+
+        result = self._service(client, max_concurrency=1).process(self.pdf_path)
+
+        self.assertEqual(calls['count'], len(result.raw_response['page_ranges']) + 1)
+
+    def test_exhausted_retries_raise(self):
+        """The last error propagates once max_attempts is used up."""
+        client = Mock(side_effect=RuntimeError('quota exceeded'))
+        with self.assertRaises(RuntimeError):
+            self._service(client, max_concurrency=1, max_attempts=2).process(self.pdf_path)
+        self.assertEqual(client.call_count, 2)
+
+
 class ValuationExtractionPipelineTestCase(TestCase):
     """Test case for ValuationExtractionPipeline."""
 
@@ -63,6 +155,310 @@ class ValuationExtractionPipelineTestCase(TestCase):
         self.assertIsNotNone(pipeline.extractor)
 
 
+class ValuationQueueWorkerTestCase(TestCase):
+    """Queue claiming, retries and idempotent persistence with a stub extractor."""
+
+    class StubExtractor:
+        """Returns a fixed extraction; fails the first ``failures`` calls."""
+
+        def __init__(self, failures=0):
+            self.failures = failures
+            self.calls = 0
+
+        def process(self, file_path):
+            from django.utils import timezone
+            from etl.services import DocumentExtractionResult
+
+            self.calls += 1
+            if self.calls <= self.failures:
+                raise RuntimeError('vision API unavailable')
+            return DocumentExtractionResult(
+                file_path=file_path,
+                mime_type='application/pdf',
+                extracted_at=timezone.now(),
+                fields=[],
+                valuation_payload={'property_address': '1 Main St', 'as_is_value': '250,000'},
+                comparables_payload=[
+                    {'address': '3 Oak Ave', 'sale_price': '240000'},
+                    {'address': '5 Elm Ct', 'sale_price': '255000'},
+                ],
+                repairs_payload=[],
+                raw_response={},
+                warnings=[],
+                inferred_source='BPO',
+            )
+
+    def setUp(self):
+        import tempfile
+        from core.models import AssetIdHub
+
+        tmp = tempfile.NamedTemporaryFile(suffix='.pdf', delete=False)
+        tmp.write(b'%PDF-1.4 stub')
+        tmp.close()
+        self.file_path = Path(tmp.name)
+        self.addCleanup(self.file_path.unlink)
+        self.asset_hub = AssetIdHub.objects.create(sellertape_id='QUEUE-1')
+
+    def _worker(self, extractor, **kwargs):
+        from etl.services import ValuationQueueWorker
+
+        kwargs.setdefault('concurrency', 1)
+        kwargs.setdefault('retry_delay_seconds', 0)
+        return ValuationQueueWorker(ValuationExtractionPipeline(extractor=extractor), **kwargs)
+
+    def test_drains_queue(self):
+        """Every queued document is claimed once and completed."""
+        from etl.models import ExtractionStatus, ValuationETL
+        from etl.services import enqueue_valuation_document
+
+        documents = [enqueue_valuation_document(self.file_path, asset_hub=self.asset_hub) for _ in range(3)]
+        metrics = self._worker(self.StubExtractor()).run(once=True)
+
+        self.assertEqual(metrics.as_dict()['complete'], 3)
+        for document in documents:
+            document.refresh_from_db()
+            self.assertEqual(document.status, ExtractionStatus.COMPLETE)
+            self.assertEqual(document.attempts, 1)
+            self.assertEqual(document.locked_by, '')
+        self.assertEqual(ValuationETL.objects.filter(document__in=documents).count(), 3)
+
+    def test_failed_attempt_is_retried(self):
+        """A transient failure re-queues the document; the next attempt completes it."""
+        from etl.models import ExtractionStatus
+        from etl.services import enqueue_valuation_document
+
+        document = enqueue_valuation_document(self.file_path, asset_hub=self.asset_hub)
+        extractor = self.StubExtractor(failures=1)
+        metrics = self._worker(extractor).run(once=True)
+
+        document.refresh_from_db()
+        self.assertEqual(extractor.calls, 2)
+        self.assertEqual(metrics.counts['retry'], 1)
+        self.assertEqual(document.status, ExtractionStatus.COMPLETE)
+        self.assertEqual(document.attempts, 2)
+
+    def test_gives_up_after_max_attempts(self):
+        from etl.models import ExtractionStatus
+        from etl.services import enqueue_valuation_document
+
+        document = enqueue_valuation_document(self.file_path, asset_hub=self.asset_hub)
+        self._worker(self.StubExtractor(failures=5), max_attempts=2).run(once=True)
+
+        document.refresh_from_db()
+        self.assertEqual(document.status, ExtractionStatus.FAILED)
+        self.assertIn('vision API unavailable', document.status_message)
+
+    def test_reprocessing_is_idempotent(self):
+        """Re-running a document updates its valuation and replaces its comparables."""
+        from etl.models import ComparablesETL, ValuationETL
+        from etl.services import enqueue_valuation_document
+
+        document = enqueue_valuation_document(self.file_path, asset_hub=self.asset_hub)
+        pipeline = ValuationExtractionPipeline(extractor=self.StubExtractor())
+        pipeline.process_queued_document(document)
+        pipeline.process_queued_document(document)
+
+        self.assertEqual(ValuationETL.objects.filter(document=document).count(), 1)
+        self.assertEqual(ComparablesETL.objects.filter(valuation__document=document).count(), 2)
+
+    def test_queued_logs_survive_a_failed_persist(self):
+        """Log entries queued before a persistence error are written after the rollback."""
+        from etl.models import ExtractionLogEntry
+        from etl.services import enqueue_valuation_document
+
+        document = enqueue_valuation_document(self.file_path, asset_hub=self.asset_hub)
+        pipeline = ValuationExtractionPipeline(extractor=self.StubExtractor())
+        pipeline.process_queued_document(document)  # primes the extraction cache
+        ExtractionLogEntry.objects.filter(document=document).delete()
+
+        with patch.object(ValuationExtractionPipeline, '_persist_field_results', side_effect=RuntimeError('db down')):
+            with self.assertRaises(RuntimeError):
+                pipeline.process_queued_document(document)
+
+        messages = list(ExtractionLogEntry.objects.filter(document=document).values_list('message', flat=True))
+        self.assertEqual(len(messages), 1)
+        self.assertIn('Reused cached extraction', messages[0])
+
+
+class ExtractionCacheTestCase(TestCase):
+    """Content-addressed extraction cache (serv_etl_extraction_cache)."""
+
+    def setUp(self):
+        import tempfile
+
+        tmp = tempfile.NamedTemporaryFile(suffix='.pdf', delete=False)
+        tmp.write(b'%PDF-1.4 appraisal bytes')
+        tmp.close()
+        self.file_path = Path(tmp.name)
+        self.addCleanup(self.file_path.unlink)
+
+    def test_identical_bytes_skip_the_extractor(self):
+        """The second extraction of the same content is served from the cache."""
+        from etl.services.services_valuationExtract.serv_etl_extraction_cache import cached_valuation_extraction
+
+        extractor = ValuationQueueWorkerTestCase.StubExtractor()
+        first, first_hit = cached_valuation_extraction(extractor, self.file_path)
+        second, second_hit = cached_valuation_extraction(extractor, self.file_path)
+
+        self.assertEqual(extractor.calls, 1)
+        self.assertFalse(first_hit)
+        self.assertTrue(second_hit)
+        self.assertEqual(second.valuation_payload, first.valuation_payload)
+        self.assertEqual(second.comparables_payload, first.comparables_payload)
+
+    def test_prompt_change_misses(self):
+        from etl.services.services_valuationExtract.serv_etl_extraction_cache import cached_valuation_extraction
+
+        extractor = ValuationQueueWorkerTestCase.StubExtractor()
+        cached_valuation_extraction(extractor, self.file_path)
+        extractor.prompt = 'new prompt'
+        _, hit = cached_valuation_extraction(extractor, self.file_path)
+
+        self.assertFalse(hit)
+        self.assertEqual(extractor.calls, 2)
+
+    def test_store_failure_still_returns_the_result(self):
+        from django.db import OperationalError
+        from etl.models import ExtractionResultCache
+        from etl.services.services_valuationExtract.serv_etl_extraction_cache import cached_valuation_extraction
+
+        extractor = ValuationQueueWorkerTestCase.StubExtractor()
+        with patch.object(ExtractionResultCache.objects, 'update_or_create', side_effect=OperationalError('cache down')):
+            result, hit = cached_valuation_extraction(extractor, self.file_path)
+
+        self.assertFalse(hit)
+        self.assertTrue(result.valuation_payload)
+        self.assertFalse(ExtractionResultCache.objects.exists())
+
+
+class ExtractionCachePayloadTestCase(SimpleTestCase):
+    """Cache payload round-trip and versioning (no database needed)."""
+
+    def test_document_result_round_trip(self):
+        from django.utils import timezone
+        from etl.services import DocumentExtractionResult, FieldExtractionRecord
+        from etl.services.services_valuationExtract.serv_etl_extraction_cache import (
+            dump_document_result,
+            load_document_result,
+        )
+
+        result = DocumentExtractionResult(
+            file_path=Path('a.pdf'),
+            mime_type='application/pdf',
+            extracted_at=timezone.now(),
+            fields=[FieldExtractionRecord('etl.ValuationETL', 'as_is_value', '100000', '100000',
+                                          metadata={'chunk_index': 1, 'pages': [1, 4]})],
+            valuation_payload={'as_is_value': '100000'},
+            raw_response={'chunks': [{'valuation': {'as_is_value': '100000'}}]},
+            inferred_source='BPO',
+        )
+        raw, normalized = dump_document_result(result)
+        loaded = load_document_result(Path('b.pdf'), raw, normalized)
+
+        self.assertEqual(loaded.file_path, Path('b.pdf'))
+        self.assertEqual(loaded.fields, result.fields)
+        self.assertEqual(loaded.valuation_payload, result.valuation_payload)
+        self.assertEqual(loaded.raw_response, result.raw_response)
+        self.assertEqual(loaded.inferred_source, 'BPO')
+
+    def test_empty_result_is_not_cached(self):
+        from django.utils import timezone
+        from etl.services import DocumentExtractionResult
+        from etl.services.services_valuationExtract.serv_etl_extraction_cache import dump_document_result
+
+        empty = DocumentExtractionResult(Path('a.pdf'), 'application/pdf', timezone.now(), fields=[])
+        self.assertIsNone(dump_document_result(empty))
+
+    def test_version_tracks_prompt_and_schema(self):
+        from etl.services.services_valuationExtract.serv_etl_extraction_cache import extractor_cache_version
+
+        service = GeminiVisionExtractionService(client=Mock())
+        version = extractor_cache_version(service)
+        self.assertEqual(version, extractor_cache_version(GeminiVisionExtractionService(client=Mock())))
+        service.schema_version = 'changed'
+        self.assertNotEqual(version, extractor_cache_version(service))
+
+
+class ValuationBulkPersistenceTestCase(TestCase):
+    """Extraction results are written with a constant number of queries per document."""
+
+    def setUp(self):
+        import tempfile
+        from core.models import AssetIdHub
+
+        tmp = tempfile.NamedTemporaryFile(suffix='.pdf', delete=False)
+        tmp.write(b'%PDF-1.4 bulk')
+        tmp.close()
+        self.file_path = Path(tmp.name)
+        self.addCleanup(self.file_path.unlink)
+        self.asset_hub = AssetIdHub.objects.create(sellertape_id='BULK-1')
+        self.pipeline = ValuationExtractionPipeline(extractor=Mock(), use_cache=False)
+
+    def _result(self, comp_count):
+        from django.utils import timezone
+        from etl.services import DocumentExtractionResult, FieldExtractionRecord
+
+        comps = [{'address': f'{i} Oak Ave', 'sale_price': '200000', 'comp_number': 1} for i in range(comp_count)]
+        return DocumentExtractionResult(
+            file_path=self.file_path,
+            mime_type='application/pdf',
+            extracted_at=timezone.now(),
+            fields=[FieldExtractionRecord('etl.ComparablesETL', f'row_{i}', comp, '') for i, comp in enumerate(comps, 1)],
+            valuation_payload={'property_address': '1 Main St'},
+            comparables_payload=comps,
+            repairs_payload=[{'description': 'Roof', 'estimated_cost': '5,000'}] * comp_count,
+            inferred_source='BPO',
+        )
+
+    def _count_queries(self, comp_count):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from etl.services import enqueue_valuation_document
+
+        document = enqueue_valuation_document(self.file_path, asset_hub=self.asset_hub)
+        self.pipeline.extractor.process.return_value = self._result(comp_count)
+        with CaptureQueriesContext(connection) as ctx:
+            self.pipeline.process_queued_document(document)
+        return len(ctx.captured_queries), document
+
+    def test_query_count_independent_of_row_count(self):
+        from etl.models import ComparablesETL
+
+        small, _ = self._count_queries(2)
+        large, document = self._count_queries(9)
+
+        self.assertEqual(small, large)
+        numbers = list(
+            ComparablesETL.objects.filter(valuation__document=document)
+            .order_by('comp_number').values_list('comp_number', flat=True)
+        )
+        self.assertEqual(numbers, list(range(1, 10)))  # duplicate comp_number 1 renumbered
+
+
+class ValuationFieldPlanTestCase(SimpleTestCase):
+    """Compiled coercion plans and cross-chunk row numbering (no database needed)."""
+
+    def test_plan_compiled_once_per_model(self):
+        from etl.models import ValuationETL
+        from etl.services.services_valuationExtract.serv_etl_valuationPipeline import compile_model_plan
+
+        plan = compile_model_plan(ValuationETL)
+        self.assertIs(plan, compile_model_plan(ValuationETL))
+        self.assertEqual(plan['as_is_value'].coerce('$250,000.50'), Decimal('250000.50'))
+        self.assertIsNone(plan['as_is_value'].coerce('  '))
+
+    def test_table_rows_numbered_across_chunks(self):
+        service = GeminiVisionExtractionService(client=Mock())
+        responses = [
+            {'comparables': [{'address': 'a'}, {'address': 'b'}]},
+            {'comparables': [{'address': 'c'}]},
+        ]
+        result = service._aggregate_responses(responses, Path('x.pdf'), 'application/pdf', page_ranges=[(1, 3), (4, 6)])
+
+        rows = [(r.field, r.value['address'], r.metadata['pages']) for r in result.fields]
+        self.assertEqual(rows, [('row_1', 'a', [1, 3]), ('row_2', 'b', [1, 3]), ('row_3', 'c', [4, 6])])
+
+
 class FileProcessorTestCase(TestCase):
     """Test case for FileProcessor."""
 
@@ -76,6 +472,140 @@ class FileProcessorTestCase(TestCase):
         pass
 
 
+class FileProcessorSinglePassTestCase(SimpleTestCase):
+    """Header detection on the single raw read (no database needed)."""
+
+    def _write_tape(self, directory):
+        import datetime
+        import openpyxl
+
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.append(['Tape SA-1'])
+        sheet.append([])
+        sheet.append(['Loan Number', 'Property Address', 'City', 'Balance', 'Balance', None, 'Date'])
+        for i in range(5):
+            sheet.append([1000 + i, '1 Main St', 'Huntsville', 1234.5 + i, 2.0, None, datetime.datetime(2024, 1, i + 1)])
+        path = Path(directory) / 'tape.xlsx'
+        workbook.save(path)
+        return path
+
+    @patch.object(FileProcessor, '_ai_detect_header_row', return_value=None)
+    def test_streaming_reader_matches_pandas_reader(self, _mock_ai):
+        """The read-only streaming path yields the same frame as the pandas path."""
+        import tempfile
+        from etl.services.services_sellerTapeImport import serv_etl_file_processor as module
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = self._write_tape(directory)
+            pandas_df = FileProcessor(path).read()
+            with patch.object(module, 'STREAMING_XLSX_BYTES', 0):
+                streamed_df = FileProcessor(path).read()
+
+        self.assertEqual(
+            list(pandas_df.columns),
+            ['Loan Number', 'Property Address', 'City', 'Balance', 'Balance.1', 'Unnamed: 5', 'Date'],
+        )
+        self.assertEqual(len(pandas_df), 5)
+        self.assertEqual(pandas_df.iloc[0]['Loan Number'], '1000')
+        self.assertTrue(pandas_df.fillna('').equals(streamed_df.fillna('')))
+
+    @patch.object(FileProcessor, '_ai_detect_header_row', return_value=None)
+    def test_file_is_read_once(self, _mock_ai):
+        """Header detection and the final frame come from one raw read."""
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = self._write_tape(directory)
+            processor = FileProcessor(path)
+            with patch.object(FileProcessor, '_read_raw', wraps=processor._read_raw) as read_raw:
+                processor.read()
+        self.assertEqual(read_raw.call_count, 1)
+
+
+@patch.dict('os.environ', {'ANTHROPIC_API_KEY': ''})
+class SellerTapePipelineTestCase(SimpleTestCase):
+    """Concurrent prepare stage + ordered per-trade writer (importer stubbed, no database)."""
+
+    def setUp(self):
+        import tempfile
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        self.written = []
+        self.post_import_runs = 0
+
+    def _importer_factory(self, trade_pk=7):
+        def factory():
+            importer = Mock()
+            importer.get_or_create_seller_trade.return_value = (Mock(pk=1), Mock(pk=trade_pk))
+
+            def import_data(df, file_path, timings, **kwargs):
+                self.assertFalse(kwargs['post_import'])
+                timings['save'] = 0.01
+                self.written.append((file_path.name, list(df['sellertape_id'])))
+                return len(df)
+
+            def post_import():
+                self.post_import_runs += 1
+
+            importer.import_data.side_effect = import_data
+            importer._run_post_import_jobs.side_effect = post_import
+            return importer
+        return factory
+
+    def _write_csv(self, name, ids):
+        path = self.directory / name
+        lines = ['sellertape_id,current_balance,interest_rate'] + [f'{i},1000,0.05' for i in ids]
+        path.write_text('\n'.join(lines))
+        return path
+
+    def test_workbook_sheets_written_in_order_for_one_trade(self):
+        """Loan sheets are imported in workbook order; a cover sheet is skipped."""
+        import openpyxl
+        from etl.services.services_sellerTapeImport.serv_etl_tape_pipeline import SellerTapePipeline, TapeFile
+
+        workbook = openpyxl.Workbook()
+        workbook.active.title = 'Cover'
+        workbook.active.append(['Prepared for', 'Bid date', 'Notes'])
+        workbook.active.append(['Buyer', 'Friday', 'Confidential'])
+        for title, ids in (('Pool A', ['A1', 'A2']), ('Pool B', ['B1'])):
+            sheet = workbook.create_sheet(title)
+            sheet.append(['sellertape_id', 'current_balance', 'interest_rate'])
+            for loan_id in ids:
+                sheet.append([loan_id, 1000, 0.05])
+        path = self.directory / 'pools.xlsx'
+        workbook.save(path)
+
+        result = SellerTapePipeline(self._importer_factory(), workers=1, all_sheets=True, use_ai=False).run(
+            [TapeFile(path)]
+        )
+
+        self.assertEqual(self.written, [('pools.xlsx', ['A1', 'A2']), ('pools.xlsx', ['B1'])])
+        self.assertEqual(result.sheets_skipped, [('pools.xlsx[Cover]', 'no columns map to loan fields')])
+        self.assertEqual((result.records_imported, result.sheets_imported, self.post_import_runs), (3, 2, 1))
+        self.assertEqual(result.errors, [])
+        for stage in ('list_sheets', 'read', 'detect', 'map', 'resolve', 'save', 'post_import'):
+            self.assertIn(stage, result.report.stage_seconds)
+        self.assertTrue(any('Pool B' in line for line in result.report.lines()))
+
+    def test_files_prepared_in_worker_processes(self):
+        """Several attachments go through the process pool and still write in source order."""
+        from etl.services.services_sellerTapeImport.serv_etl_tape_pipeline import SellerTapePipeline, TapeFile
+
+        files = [
+            TapeFile(self._write_csv('first.csv', ['F1', 'F2'])),
+            TapeFile(self.directory / 'missing.csv'),
+            TapeFile(self._write_csv('second.csv', ['S1'])),
+        ]
+        result = SellerTapePipeline(self._importer_factory(), workers=2, use_ai=False).run(files)
+
+        self.assertEqual(self.written, [('first.csv', ['F1', 'F2']), ('second.csv', ['S1'])])
+        self.assertEqual([label for label, _error in result.errors], ['missing.csv[0]'])
+        self.assertEqual(self.post_import_runs, 1)
+
+
 class DataImporterTestCase(TestCase):
     """Test case for DataImporter."""
 
@@ -88,3 +618,136 @@ class DataImporterTestCase(TestCase):
         # TODO: Add test implementation
         pass
 
+
+class DataImporterBatchingTestCase(SimpleTestCase):
+    """Batch planning for DataImporter._save_records (no database needed)."""
+
+    def test_duplicate_sellertape_ids_go_to_later_waves(self):
+        """Repeated keys are split so later rows see earlier ones as existing."""
+        seller, trade = Mock(pk=1), Mock(pk=2)
+        rows = [
+            {'seller': seller, 'trade': trade, 'loan': {'sellertape_id': sid}}
+            for sid in ('A', 'B', 'A', 'C', 'A')
+        ]
+        waves = DataImporter._split_duplicate_keys(rows)
+        self.assertEqual(
+            [[r['loan']['sellertape_id'] for r in wave] for wave in waves],
+            [['A', 'B', 'C'], ['A'], ['A']],
+        )
+
+    def test_seller_valuation_entries_skip_empty_values(self):
+        """Only entries carrying an as-is or ARV value are persisted."""
+        entries = DataImporter._seller_valuation_entries({
+            'seller_asis_value': 100,
+            'additional_value_date': None,
+            'origination_arv': 250,
+        })
+        self.assertEqual(
+            [e['notes'] for e in entries],
+            ['Seller tape valuation (primary)', 'Seller tape valuation (origination)'],
+        )
+
+
+class DataImporterCalendarRefreshTestCase(TestCase):
+    """Bulk-written rows (created and updated in place) are re-indexed on the calendar."""
+
+    def test_updated_hubs_are_queued_for_calendar_refresh(self):
+        from acq_module.models.model_acq_seller import AcqAsset, Seller, Trade
+
+        seller = Seller.objects.create(name='Acme Bank')
+        trade = Trade.objects.create(seller=seller, trade_name='Pool 7')
+        importer = DataImporter(update_existing=True, use_ai_seller_matching=False)
+
+        def tape(city):
+            return [{'seller': seller, 'trade': trade, 'loan': {'sellertape_id': 'CAL-9'}, 'property': {'city': city}}]
+
+        module = 'etl.services.services_sellerTapeImport.serv_etl_data_importer'
+        with patch(f'{module}.emit_side_effects', return_value=1), \
+                patch(f'{module}.queue_hub_calendar_refresh') as queue_refresh:
+            self.assertEqual(importer._save_records(tape('Tulsa'), 100), (1, 0, 0))
+            importer._run_post_import_jobs()
+            hub_id = AcqAsset.objects.get(loan__sellertape_id='CAL-9').asset_hub_id
+            queue_refresh.assert_called_once_with([hub_id])
+
+            queue_refresh.reset_mock()
+            self.assertEqual(importer._save_records(tape('Mesa'), 100), (0, 1, 0))
+            importer._run_post_import_jobs()
+            queue_refresh.assert_called_once_with([hub_id])
+
+
+class AssetFolderBulkTestCase(TestCase):
+    """Imported assets get their SharePoint folders from one asset query."""
+
+    def test_folder_paths_use_a_fixed_number_of_queries(self):
+        from acq_module.models.model_acq_seller import AcqAsset, AcqProperty, Seller, Trade
+        from core.models import AssetIdHub
+        from sharepoint.sig_sharepoint_folderTempCreate import create_asset_folders_bulk
+
+        trade = Trade.objects.create(seller=Seller.objects.create(name='Acme Bank'), trade_name='Pool 7')
+        hub_ids = []
+        for i in range(3):
+            hub = AssetIdHub.objects.create(sellertape_id=f'SP-{i}')
+            asset = AcqAsset.objects.create(asset_hub=hub, seller=trade.seller, trade=trade)
+            AcqProperty.objects.create(asset=asset, street_address=f'{i} Elm St', city='Tulsa', state='OK', zip='74103')
+            hub_ids.append(hub.pk)
+
+        with patch('sharepoint.services.serv_sp_batch.SharePointBatchService') as service:
+            service.return_value.create_folders_batch.return_value = {'created': 1, 'existed': 0, 'failed': 0, 'errors': []}
+            with self.assertNumQueries(1):
+                create_asset_folders_bulk(hub_ids)
+
+        paths = service.return_value.create_folders_batch.call_args.args[0]
+        self.assertTrue(any('SP-2 - 2 Elm St, Tulsa, OK 74103' in path for path in paths))
+
+
+@patch.dict('os.environ', {'ANTHROPIC_API_KEY': 'test-key'})
+@patch.object(AIColumnMapper, '_stored_header_mapping', return_value=None)
+class AIColumnMapperCacheTestCase(SimpleTestCase):
+    """Fingerprint/column/choice memoization in serv_etl_ai_mapper (no database needed)."""
+
+    def setUp(self):
+        from etl.services.services_sellerTapeImport import serv_etl_ai_mapper as module
+
+        self.module = module
+        for cache in (module._header_set_cache, module._column_cache, module._choice_cache):
+            cache.invalidate()
+
+    def test_repeat_layout_makes_no_ai_call(self, _mock_stored):
+        """The same header set (any order/case) is served from the fingerprint cache."""
+        ai_result = {'Loan #': 'sellertape_id', 'UPB': 'current_balance'}
+        with patch.object(AIColumnMapper, '_ai_mapping', return_value=ai_result) as ai:
+            first = AIColumnMapper(['Loan #', 'UPB', 'city', 'Notes']).map()
+            second = AIColumnMapper(['notes', 'CITY', 'upb', 'LOAN  #']).map()
+
+        ai.assert_called_once_with(['Loan #', 'UPB', 'Notes'])
+        self.assertEqual(first, {'Loan #': 'sellertape_id', 'UPB': 'current_balance', 'city': 'city'})
+        self.assertEqual(second, {'CITY': 'city', 'upb': 'current_balance', 'LOAN  #': 'sellertape_id'})
+
+    def test_new_layout_only_sends_unmapped_columns(self, _mock_stored):
+        """Columns already answered for other layouts are not sent to AI again."""
+        with patch.object(AIColumnMapper, '_ai_mapping', return_value={'UPB': 'current_balance'}):
+            AIColumnMapper(['UPB', 'Notes']).map()
+        with patch.object(AIColumnMapper, '_ai_mapping', return_value={}) as ai:
+            mapping = AIColumnMapper(['UPB', 'Notes', 'Servicer Comment']).map()
+
+        ai.assert_called_once_with(['Servicer Comment'])
+        self.assertEqual(mapping, {'UPB': 'current_balance'})
+
+    def test_choice_values_resolved_in_one_call(self, _mock_stored):
+        """Unknown choice values across fields share one AI call and are then cached."""
+        occupancy = self.module.get_choice_field_values()['occupancy']
+        resolved = {'occupancy': {'No': occupancy[0], 'Yes?': None}}
+        with patch.object(self.module, '_ai_resolve_choices', return_value=resolved) as ai:
+            results = self.module.resolve_choice_values([
+                ('occupancy', 'No'), ('occupancy', ' Yes? '), ('occupancy', 'No'),
+                ('occupancy', occupancy[0].lower()), ('street_address', '1 Main'),
+            ])
+            cached = self.module.validate_choice_value('occupancy', 'No')
+
+        self.assertEqual(ai.call_count, 1)
+        self.assertEqual(ai.call_args[0][0], {'occupancy': ['No', 'Yes?']})
+        self.assertEqual(results[('occupancy', 'No')], occupancy[0])
+        self.assertIsNone(results[('occupancy', 'Yes?')])
+        self.assertEqual(results[('occupancy', occupancy[0].lower())], occupancy[0])
+        self.assertEqual(results[('street_address', '1 Main')], '1 Main')
+        self.assertEqual(cached, occupancy[0])
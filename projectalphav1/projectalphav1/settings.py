@@ -426,12 +426,44 @@ REST_FRAMEWORK = {
 # Django cache settings
 # Docs reviewed:
 # * Django cache framework: https://docs.djangoproject.com/en/5.2/topics/cache/
-# Provide a safe default local-memory cache for development and small deployments.
-# For production, consider Redis or Memcached backends.
-CACHES = {
-    'default': {
+# * Redis cache backend: https://docs.djangoproject.com/en/5.2/topics/cache/#redis
+# * Filesystem / database caching: https://docs.djangoproject.com/en/5.2/topics/cache/#filesystem-caching
+# Shared cache tier used by reporting, FRED, AI summaries, geocoding and modeling
+# caches (see core/services/serv_co_cache.py). Every backend below is visible to
+# all gunicorn workers on a host; Redis is also shared with the cron service.
+# DJANGO_CACHE_BACKEND:
+#   redis    - REDIS_URL (default whenever REDIS_URL is set)
+#   file     - DJANGO_CACHE_DIR on local disk (default for single hosts)
+#   database - 'django_cache' table on the default DB (run `python manage.py createcachetable`)
+#   locmem   - per-process memory (tests / throwaway shells only)
+CACHE_BACKEND = os.getenv('DJANGO_CACHE_BACKEND', 'redis' if os.getenv('REDIS_URL') else 'file').lower()
+
+if CACHE_BACKEND == 'redis':
+    _default_cache_backend = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.getenv('REDIS_URL', 'redis://localhost:6379/0'),
+    }
+elif CACHE_BACKEND == 'database':
+    _default_cache_backend = {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': os.getenv('DJANGO_CACHE_TABLE', 'django_cache'),
+    }
+elif CACHE_BACKEND == 'locmem':
+    _default_cache_backend = {
         'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
         'LOCATION': 'projectalphav1-local',
+    }
+else:
+    _default_cache_backend = {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.getenv('DJANGO_CACHE_DIR', str(BASE_DIR / '.django_cache')),
+        # Bound disk usage; Django culls 1/CULL_FREQUENCY of entries when full
+        'OPTIONS': {'MAX_ENTRIES': int(os.getenv('DJANGO_CACHE_MAX_ENTRIES', '20000'))},
+    }
+
+CACHES = {
+    'default': {
+        **_default_cache_backend,
         # Prefix all keys to avoid collisions when multiple projects share a cache
         'KEY_PREFIX': os.getenv('DJANGO_CACHE_KEY_PREFIX', 'projectalphav1'),
         # Default cache timeout (seconds). Per-key timeouts in code will override this.
@@ -444,6 +476,8 @@ CACHES = {
 # * django-cors-headers: https://github.com/adamchainz/django-cors-headers
 CORS_ALLOW_ALL_ORIGINS = env_bool('DJANGO_CORS_ALLOW_ALL_ORIGINS', True)  # For development only, set to False in production
 CORS_ALLOW_CREDENTIALS = env_bool('DJANGO_CORS_ALLOW_CREDENTIALS', True)
+# Response headers cross-origin JS may read (activity feed keyset cursor)
+CORS_EXPOSE_HEADERS = ['X-Next-Cursor']
 CORS_ALLOWED_ORIGINS = [
 o.strip() for o in os.getenv(
 'DJANGO_CORS_ALLOWED_ORIGINS',
@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class ReportingConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'reporting'
+
+    def ready(self):
+        """
+        WHAT: Registers reporting cache invalidation signals.
+        WHY: Cached reporting payloads must be dropped when source tables change.
+        HOW: Import signals module to connect post_save/post_delete handlers.
+        """
+        import reporting.signals  # noqa: F401
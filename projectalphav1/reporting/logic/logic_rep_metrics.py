@@ -7,6 +7,9 @@
 from django.db.models import Sum, Avg, Count, Q, F
 from decimal import Decimal
 
+import numpy as np
+import numpy_financial as npf
+
 
 def calculate_summary_metrics(queryset):
     """
@@ -313,31 +316,148 @@ def calculate_reo_closing_cost(blended_outcome):
     return float(total or 0)
 
 
-# Placeholder for IRR calculation (requires numpy/scipy for accurate calculation)
+DAYS_PER_YEAR = 365.0
+
+
+def _year_fractions(dates, origin=None):
+    """
+    **WHAT**: Convert cash flow dates to year fractions (actual/365) from an origin date
+    **WHY**: XIRR discounts each flow by (1 + r) ** t with t in years
+    **HOW**: numpy datetime64 day arithmetic; origin defaults to the earliest date
+    """
+    days = np.asarray(dates, dtype='datetime64[D]')
+    origin = days.min() if origin is None else np.datetime64(origin, 'D')
+    return (days - origin).astype('float64') / DAYS_PER_YEAR
+
+
+def batch_xirr(cash_flow_matrix, dates, max_iter=100, tol=1e-7):
+    """
+    **WHAT**: Solve XIRR for many cash flow series at once
+    **WHY**: Realized performance needs asset, trade, fund and portfolio IRRs in one pass
+    **HOW**: Vectorized Newton-Raphson over all rows sharing one date axis, with a
+    vectorized bisection fallback for rows Newton does not converge on
+
+    **PARAMETERS**:
+    - cash_flow_matrix: 2-D array (series x periods); 0 where a series has no flow
+    - dates: 1-D sequence of period dates aligned with the matrix columns
+
+    **RETURNS**: 1-D float array of annualized rates as decimals (0.15 = 15%);
+    NaN where IRR is undefined (no sign change) or cannot be solved
+    """
+    cf = np.atleast_2d(np.asarray(cash_flow_matrix, dtype='float64'))
+    n_rows = cf.shape[0]
+    result = np.full(n_rows, np.nan)
+    if n_rows == 0 or cf.shape[1] == 0:
+        return result
+
+    # WHAT: The origin date does not change the root, so one shared axis serves every row
+    t = _year_fractions(dates)
+    solvable = (cf < 0).any(axis=1) & (cf > 0).any(axis=1)
+    if not solvable.any():
+        return result
+
+    rows = cf[solvable]
+    rate = np.full(rows.shape[0], 0.1)
+    converged = np.zeros(rows.shape[0], dtype=bool)
+
+    with np.errstate(all='ignore'):
+        for _ in range(max_iter):
+            base = (1.0 + rate)[:, None]
+            discount = base ** -t
+            f = (rows * discount).sum(axis=1)
+            df = (-t * rows * discount / base).sum(axis=1)
+            step = np.where(df != 0, f / df, 0.0)
+            new_rate = np.clip(rate - step, -0.9999, 1e6)
+            converged = np.isfinite(new_rate) & (np.abs(new_rate - rate) < tol)
+            rate = np.where(np.isfinite(new_rate), new_rate, rate)
+            if converged.all():
+                break
+
+        # WHAT: Bisection fallback for rows Newton failed on (oscillation / overflow)
+        pending = ~converged
+        if pending.any():
+            sub = rows[pending]
+            lo = np.full(sub.shape[0], -0.9999)
+            hi = np.full(sub.shape[0], 10.0)
+            npv_lo = (sub * (1.0 + lo)[:, None] ** -t).sum(axis=1)
+            npv_hi = (sub * (1.0 + hi)[:, None] ** -t).sum(axis=1)
+            bracketed = np.sign(npv_lo) != np.sign(npv_hi)
+            for _ in range(200):
+                mid = (lo + hi) / 2.0
+                npv_mid = (sub * (1.0 + mid)[:, None] ** -t).sum(axis=1)
+                same_side = np.sign(npv_mid) == np.sign(npv_lo)
+                lo = np.where(same_side, mid, lo)
+                npv_lo = np.where(same_side, npv_mid, npv_lo)
+                hi = np.where(same_side, hi, mid)
+            rate[pending] = np.where(bracketed, (lo + hi) / 2.0, np.nan)
+
+    result[solvable] = rate
+    return result
+
+
+def batch_npv(cash_flow_matrix, dates, discount_rate):
+    """
+    **WHAT**: Net present value for many cash flow series at once (XNPV convention)
+    **HOW**: Discount each column by (1 + rate) ** year_fraction from the first date
+
+    **RETURNS**: 1-D float array of NPVs in dollars
+    """
+    cf = np.atleast_2d(np.asarray(cash_flow_matrix, dtype='float64'))
+    if cf.shape[1] == 0:
+        return np.zeros(cf.shape[0])
+    t = _year_fractions(dates)
+    return (cf * (1.0 + float(discount_rate)) ** -t).sum(axis=1)
+
+
+def batch_moic(cash_flow_matrix):
+    """
+    **WHAT**: Multiple on invested capital per series (inflows / |outflows|)
+
+    **RETURNS**: 1-D float array; NaN where a series has no outflows
+    """
+    cf = np.atleast_2d(np.asarray(cash_flow_matrix, dtype='float64'))
+    inflows = np.where(cf > 0, cf, 0.0).sum(axis=1)
+    outflows = -np.where(cf < 0, cf, 0.0).sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(outflows > 0, inflows / outflows, np.nan)
+
+
 def calculate_irr(cash_flows, dates):
     """
-    **WHAT**: Calculate Internal Rate of Return
+    **WHAT**: Calculate Internal Rate of Return (XIRR)
     **WHY**: Time-weighted return metric
-    **HOW**: Solve for rate where NPV = 0 (requires numpy.irr or scipy.optimize)
+    **HOW**: Solve for the annual rate where the date-discounted NPV = 0 (see batch_xirr)
     
-    **NOTE**: Placeholder - implement with numpy_financial.irr() when needed
+    **PARAMETERS**:
+    - cash_flows: Sequence of cash flows (negative = investment, positive = return)
+    - dates: Sequence of dates aligned with cash_flows
     
-    **RETURNS**: Float IRR percentage
+    **RETURNS**: Float annualized IRR as decimal (0.15 = 15%); 0.0 when undefined
     """
-    # TODO: Implement with numpy_financial.irr(cash_flows)
-    return 0.0
+    if not cash_flows or len(cash_flows) < 2:
+        return 0.0
+    rate = batch_xirr([cash_flows], dates)[0]
+    return float(rate) if np.isfinite(rate) else 0.0
 
 
-# Placeholder for NPV calculation
-def calculate_npv(cash_flows, discount_rate):
+def calculate_npv(cash_flows, discount_rate, dates=None):
     """
     **WHAT**: Calculate Net Present Value
     **WHY**: Present value of future cash flows
-    **HOW**: Sum of discounted cash flows
+    **HOW**: Sum of discounted cash flows; by actual dates (XNPV) when dates are given,
+    otherwise by period index with numpy_financial.npv
     
-    **NOTE**: Placeholder - implement with numpy_financial.npv() when needed
+    **PARAMETERS**:
+    - cash_flows: Sequence of cash flows
+    - discount_rate: Annual rate as decimal when dates are given, per-period rate otherwise
+    - dates: Optional sequence of dates aligned with cash_flows
     
     **RETURNS**: Float NPV value
     """
-    # TODO: Implement with numpy_financial.npv(discount_rate, cash_flows)
-    return 0.0
+    if not cash_flows:
+        return 0.0
+    if dates is not None:
+        value = batch_npv([cash_flows], dates, discount_rate)[0]
+    else:
+        value = npf.npv(float(discount_rate), [float(cf) for cf in cash_flows])
+    return float(value) if np.isfinite(value) else 0.0
@@ -12,6 +12,8 @@ SERVICE FILES:
 - serv_rep_byStatus.py - By Status report specific logic
 - serv_rep_byFund.py - By Fund report specific logic
 - serv_rep_byEntity.py - By Entity report specific logic
+- serv_rep_cache.py - Response cache (filter-keyed, stale-while-revalidate, tag invalidation)
+- serv_rep_realizedPerformance.py - Realized IRR/NPV/MOIC from LLCashFlowSeries (batched NumPy)
 
 ARCHITECTURE:
 View → Service → QuerySet → Model
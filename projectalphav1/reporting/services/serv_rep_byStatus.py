@@ -16,18 +16,18 @@ View → This Service → queryBuilder + aggregations → Model
 """
 
 from typing import List, Dict, Any
-from .serv_rep_queryBuilder import build_reporting_queryset, parse_filter_params
+from .serv_rep_queryBuilder import build_reporting_queryset
 from .serv_rep_aggregations import group_by_status
 
 
-def get_by_status_chart_data(request) -> List[Dict[str, Any]]:
+def get_by_status_chart_data(filters: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     WHAT: Get chart data for By Status visualization
     WHY: Display doughnut/pie chart showing portfolio by status
-    HOW: Parse filters, build queryset, group by status, format for Chart.js
+    HOW: Build queryset from parsed filters, group by status, format for Chart.js
     
     ARGS:
-        request: Django request with query params
+        filters: Output of parse_filter_params
     
     RETURNS: List of chart data points
         [
@@ -43,8 +43,7 @@ def get_by_status_chart_data(request) -> List[Dict[str, Any]]:
             ...
         ]
     """
-    # WHAT: Parse filters and build queryset
-    filters = parse_filter_params(request)
+    # WHAT: Build queryset from the parsed filters
     queryset = build_reporting_queryset(**filters)
     
     # WHAT: Group by status
@@ -84,19 +83,18 @@ def get_by_status_chart_data(request) -> List[Dict[str, Any]]:
     return chart_data
 
 
-def get_by_status_grid_data(request) -> List[Dict[str, Any]]:
+def get_by_status_grid_data(filters: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     WHAT: Get detailed grid data for By Status table
     WHY: Display status metrics in AG Grid
     HOW: Same as chart but return full status_metrics directly
     
     ARGS:
-        request: Django request with query params
+        filters: Output of parse_filter_params
     
     RETURNS: List of row objects for AG Grid
     """
-    # WHAT: Parse filters and build queryset
-    filters = parse_filter_params(request)
+    # WHAT: Build queryset from the parsed filters
     queryset = build_reporting_queryset(**filters)
     
     # WHAT: Group by status
@@ -24,18 +24,19 @@ from django.db.models import QuerySet
 from django.utils import timezone
 from acq_module.models.model_acq_seller import AcqAsset
 from am_module.services.serv_am_assetInventory import AssetInventoryEnricher
-from .serv_rep_queryBuilder import build_reporting_queryset, parse_filter_params
+from .serv_rep_queryBuilder import build_reporting_queryset
 from .serv_rep_aggregations import group_by_trade
+from .serv_rep_realizedPerformance import compute_realized_performance, realized_lookup
 
 
-def get_by_trade_chart_data(request) -> List[Dict[str, Any]]:
+def get_by_trade_chart_data(filters: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     WHAT: Get chart data for By Trade visualization
     WHY: Display bar/line/pie chart showing UPB by trade
-    HOW: Parse filters, build queryset, group by trade, format for Chart.js
+    HOW: Build queryset from parsed filters, group by trade, format for Chart.js
     
     ARGS:
-        request: Django request with query params (trade_ids, statuses, dates)
+        filters: Output of parse_filter_params (trade_ids, statuses, dates)
     
     RETURNS: List of chart data points
         [
@@ -53,13 +54,9 @@ def get_by_trade_chart_data(request) -> List[Dict[str, Any]]:
         ]
     
     EXAMPLE USAGE in view:
-        chart_data = get_by_trade_chart_data(request)
+        chart_data = get_by_trade_chart_data(parse_filter_params(request))
         return Response(chart_data)
     """
-    # WHAT: Parse filter parameters from query string
-    # WHY: Extract trade_ids, statuses, dates, etc.
-    filters = parse_filter_params(request)
-    
     # WHAT: Build filtered queryset
     # WHY: Apply all user-selected filters
     queryset = build_reporting_queryset(**filters)
@@ -67,6 +64,12 @@ def get_by_trade_chart_data(request) -> List[Dict[str, Any]]:
     # WHAT: Group by trade and calculate metrics
     # WHY: Get per-trade summary stats
     trade_metrics = group_by_trade(queryset)
+
+    # WHAT: Realized IRR/MOIC per trade from LLCashFlowSeries (one batch, not per trade)
+    realized = realized_lookup(
+        compute_realized_performance(queryset.values_list('asset_hub_id', flat=True), levels=('trade',)),
+        'trade',
+    )
     
     # WHAT: Format for Chart.js
     # WHY: Frontend expects {x, y, meta} format
@@ -79,6 +82,8 @@ def get_by_trade_chart_data(request) -> List[Dict[str, Any]]:
                 'count': trade['asset_count'],
                 'ltv': trade['avg_ltv'],
                 'status': trade['status'],
+                'realized_irr': realized.get(trade['trade_id'], {}).get('realized_irr'),
+                'realized_moic': realized.get(trade['trade_id'], {}).get('realized_moic'),
             }
         }
         for trade in trade_metrics
@@ -87,14 +92,14 @@ def get_by_trade_chart_data(request) -> List[Dict[str, Any]]:
     return chart_data
 
 
-def get_by_trade_grid_data(request) -> List[Dict[str, Any]]:
+def get_by_trade_grid_data(filters: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
     WHAT: Get asset-level grid data for By Trade table (AG Grid)
     WHY: Each row represents a single asset, filtered by trade and other sidebar filters
-    HOW: Parse filters, build asset-level queryset, project required fields into dicts
+    HOW: Build asset-level queryset from parsed filters, project required fields into dicts
 
     ARGS:
-        request: Django request with query params
+        filters: Output of parse_filter_params
 
     RETURNS: List of row objects for AG Grid
         [
@@ -114,20 +119,25 @@ def get_by_trade_grid_data(request) -> List[Dict[str, Any]]:
         ]
 
     EXAMPLE USAGE in view:
-        grid_data = get_by_trade_grid_data(request)
+        grid_data = get_by_trade_grid_data(parse_filter_params(request))
         return Response(grid_data)
     """
-    # WHAT: Parse filter parameters
-    filters = parse_filter_params(request)
-
     # WHAT: Build filtered queryset (asset-level SellerRawData rows)
     queryset = build_reporting_queryset(**filters)
 
+    # WHAT: Realized IRR/NPV/MOIC for every asset in scope, solved in one batch
+    realized = realized_lookup(
+        compute_realized_performance(queryset.values_list('asset_hub_id', flat=True), levels=('asset',)),
+        'asset',
+    )
+
+    assets = list(queryset)
     enricher = AssetInventoryEnricher()
+    enricher.prime_workflow_states(assets)  # WHAT: Track/task state for all rows in one bulk load
     grid_rows: List[Dict[str, Any]] = []
     today = timezone.now().date()
 
-    for asset in queryset:
+    for asset in assets:
         trade = asset.trade
         purchase_date = getattr(asset, 'purchase_date', None)
         purchase_price = getattr(asset, 'purchase_price', None)
@@ -238,6 +248,11 @@ def get_by_trade_grid_data(request) -> List[Dict[str, Any]]:
             'expected_irr': float(expected_irr or 0) if expected_irr is not None else None,
             'expected_moic': float(expected_moic or 0) if expected_moic is not None else None,
 
+            # realized returns from LLCashFlowSeries (None when no cash flows / undefined)
+            'realized_irr': realized.get(asset.pk, {}).get('realized_irr'),
+            'realized_npv': realized.get(asset.pk, {}).get('realized_npv'),
+            'realized_moic': realized.get(asset.pk, {}).get('realized_moic'),
+
             # monthly servicing cost (matches calculate_monthly_servicing_cost helper)
             'legal_expenses': float(getattr(asset, 'legal_expenses', 0) or 0),
             'servicing_expenses': float(getattr(asset, 'servicing_expenses', 0) or 0),
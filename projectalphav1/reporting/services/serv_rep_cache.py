@@ -0,0 +1,248 @@
+"""
+Service: Reporting Response Cache
+
+WHAT: Shared cache layer for reporting dashboard and filter-option endpoints
+WHY: Summary, By Trade, By Status and sidebar option endpoints recompute identical
+     results for every user and every page load
+WHERE: Imported by reporting views (view_rep_filters, view_rep_summary, view_rep_trade, view_rep_status)
+HOW: Key results on the normalized output of parse_filter_params, serve stale results
+     while revalidating in the background, and invalidate through dependency tags
+     bumped by model save/delete signals (see reporting/signals.py)
+
+FILE NAMING: serv_rep_cache.py
+- serv_ = Services folder
+- _rep_ = Reporting module
+- cache = Descriptive name
+
+ARCHITECTURE:
+View → cached_report(namespace, filters, compute, tags) → shared Django cache tier (settings.CACHES)
+                                   ↓ (miss or stale)
+                               compute() → Service Layer → Model
+
+CACHE ENTRY (envelope stored under the result key):
+    {
+        'value': <endpoint payload>,
+        'fresh_until': <epoch seconds>,   # serve directly until this time
+        'tags': {'trades': 17, ...},      # tag versions the value was computed against
+    }
+
+Entries are kept for ttl + stale_ttl seconds. Between fresh_until and expiry the stale
+value is returned immediately and a single background refresh recomputes it
+(stale-while-revalidate). A tag version mismatch is a hard miss: invalidated data is
+never served.
+
+Docs reviewed:
+- Django cache framework: https://docs.djangoproject.com/en/5.2/topics/cache/
+- Django low-level cache API: https://docs.djangoproject.com/en/5.2/topics/cache/#the-low-level-cache-api
+- RFC 5861 (stale-while-revalidate): https://datatracker.ietf.org/doc/html/rfc5861
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from django.core.cache import cache
+from django.db import close_old_connections
+
+from core.services.serv_co_cache import record_cache_event
+
+logger = logging.getLogger(__name__)
+
+# WHAT: Freshness window and stale-serving window (seconds)
+# WHY: Reporting data changes on boarding/servicer loads, not per request
+REPORTING_CACHE_TTL = int(os.getenv('REPORTING_CACHE_TTL', '300'))
+REPORTING_CACHE_STALE_TTL = int(os.getenv('REPORTING_CACHE_STALE_TTL', '1800'))
+
+CACHE_KEY_PREFIX = 'reporting'
+
+# WHAT: Dependency tags for invalidation
+# WHY: Each reporting payload declares which source tables it was computed from
+TAG_TRADES = 'trades'              # Trade + AcqAsset (trade options, boarded asset set)
+TAG_TRACKS = 'tracks'              # AM outcome tracks (REOData, FCSale, DIL, ...)
+TAG_TASKS = 'tasks'                # AM outcome tasks (REOtask, FCTask, ...)
+TAG_SERVICER = 'servicer_data'     # ServicerLoanData (UPB, delinquency, balances)
+TAG_PARTNERSHIPS = 'partnerships'  # FundLegalEntity + AssetDetails fund linkage
+TAG_CASH_FLOWS = 'cash_flows'      # LLCashFlowSeries (realized IRR/NPV/MOIC)
+
+ALL_REPORT_TAGS = (TAG_TRADES, TAG_TRACKS, TAG_TASKS, TAG_SERVICER, TAG_PARTNERSHIPS, TAG_CASH_FLOWS)
+
+
+def normalize_filters(filters: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    WHAT: Normalize parse_filter_params output into a canonical form
+    WHY: ?trade_ids=2,1 and ?trade_ids=1,2,1 must hit the same cache entry
+    HOW: Drop None / blank values, de-duplicate and sort list filters (except ordering,
+         where column order is meaningful). An empty list is kept: parse_filter_params
+         returns trade_ids=[] for an explicit filter that matched nothing, which is not
+         the same request as no filter
+
+    ARGS:
+        filters: Dict returned by parse_filter_params (or any simple kwargs dict)
+
+    RETURNS: Normalized dict safe for JSON serialization
+    """
+    normalized: Dict[str, Any] = {}
+    for key, value in (filters or {}).items():
+        if value is None or value == '':
+            continue
+        if isinstance(value, (list, tuple, set)):
+            if key == 'ordering':
+                normalized[key] = [str(v) for v in value]
+            else:
+                normalized[key] = sorted({str(v) for v in value})
+        else:
+            normalized[key] = str(value)
+    return normalized
+
+
+def build_cache_key(namespace: str, filters: Optional[Dict[str, Any]] = None) -> str:
+    """
+    WHAT: Build the cache key for one endpoint + filter set
+    HOW: SHA-1 of the normalized filters (keeps keys short for memcached/Redis)
+
+    EXAMPLE:
+        build_cache_key('summary', {'trade_ids': [3, 1]})
+        # 'reporting:summary:5f0c...'
+    """
+    payload = json.dumps(normalize_filters(filters), sort_keys=True, separators=(',', ':'))
+    digest = hashlib.sha1(payload.encode('utf-8')).hexdigest()
+    return f'{CACHE_KEY_PREFIX}:{namespace}:{digest}'
+
+
+def _tag_key(tag: str) -> str:
+    return f'{CACHE_KEY_PREFIX}:tag:{tag}'
+
+
+def get_tag_versions(tags: Iterable[str]) -> Dict[str, int]:
+    """
+    WHAT: Read the current version of each dependency tag
+    WHY: Results are only valid for the tag versions they were computed against
+    HOW: One get_many round trip; missing tags are seeded with a time-based version
+         so an evicted tag key can never resurrect an older version number
+    """
+    tags = sorted(set(tags))
+    if not tags:
+        return {}
+    keys = {_tag_key(tag): tag for tag in tags}
+    found = cache.get_many(list(keys))
+    versions: Dict[str, int] = {}
+    for key, tag in keys.items():
+        version = found.get(key)
+        if version is None:
+            cache.add(key, time.time_ns(), timeout=None)
+            version = cache.get(key)
+        versions[tag] = version
+    return versions
+
+
+def invalidate_tags(*tags: str) -> None:
+    """
+    WHAT: Invalidate every cached reporting result that depends on the given tags
+    WHY: Called from model signals when trades, tracks, tasks or servicer data change
+    HOW: Bump the tag version; entries carrying the old version become misses
+    """
+    for tag in set(tags):
+        key = _tag_key(tag)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # WHAT: Tag never read (or evicted) - seed with a fresh version
+            cache.set(key, time.time_ns(), timeout=None)
+
+
+def _store(key: str, value: Any, versions: Dict[str, int], ttl: int, stale_ttl: int) -> None:
+    envelope = {
+        'value': value,
+        'fresh_until': time.time() + ttl,
+        'tags': versions,
+    }
+    cache.set(key, envelope, timeout=ttl + stale_ttl)
+
+
+def _run_in_background(target: Callable[[], None]) -> None:
+    """Start a daemon thread for revalidation (patched to run inline in tests)."""
+    threading.Thread(target=target, daemon=True).start()
+
+
+def _schedule_revalidation(
+    key: str,
+    compute: Callable[[], Any],
+    tags: Iterable[str],
+    ttl: int,
+    stale_ttl: int,
+) -> None:
+    """
+    WHAT: Recompute a stale entry once, off the request path
+    HOW: cache.add() acts as a cross-worker lock so only one refresh runs per key
+    """
+    lock_key = f'{key}:refresh'
+    if not cache.add(lock_key, 1, timeout=max(ttl, 30)):
+        return
+
+    def _refresh() -> None:
+        try:
+            # WHAT: Read versions before computing so an invalidation that lands
+            # mid-refresh still marks this result as outdated
+            versions = get_tag_versions(tags)
+            _store(key, compute(), versions, ttl, stale_ttl)
+        except Exception as e:
+            logger.warning(f'[ReportingCache] Background refresh failed for {key}: {e}', exc_info=True)
+        finally:
+            cache.delete(lock_key)
+            close_old_connections()
+
+    _run_in_background(_refresh)
+
+
+def cached_report(
+    namespace: str,
+    filters: Optional[Dict[str, Any]],
+    compute: Callable[[], Any],
+    tags: Iterable[str] = ALL_REPORT_TAGS,
+    ttl: Optional[int] = None,
+    stale_ttl: Optional[int] = None,
+) -> Any:
+    """
+    WHAT: Return a cached reporting payload, computing it on miss
+    WHY: Single entry point used by all reporting views
+    HOW: Fresh hit → return; stale hit → return and refresh in background;
+         miss or tag mismatch → compute synchronously and store
+
+    ARGS:
+        namespace: Endpoint name (e.g. 'summary', 'by_trade_grid')
+        filters: Output of parse_filter_params (or other endpoint kwargs)
+        compute: Zero-arg callable producing the JSON-serializable payload
+        tags: Dependency tags the payload is computed from
+        ttl: Fresh window in seconds (default REPORTING_CACHE_TTL)
+        stale_ttl: Extra seconds a stale value may be served (default REPORTING_CACHE_STALE_TTL)
+
+    USAGE in view:
+        filters = parse_filter_params(request)
+        metrics = cached_report(
+            'summary', filters,
+            lambda: calculate_summary_metrics(build_reporting_queryset(**filters)),
+        )
+    """
+    ttl = REPORTING_CACHE_TTL if ttl is None else ttl
+    stale_ttl = REPORTING_CACHE_STALE_TTL if stale_ttl is None else stale_ttl
+    tags = tuple(tags)
+
+    key = build_cache_key(namespace, filters)
+    versions = get_tag_versions(tags)
+    envelope = cache.get(key)
+
+    if envelope is not None and envelope.get('tags') == versions:
+        record_cache_event(CACHE_KEY_PREFIX, 'hits')
+        if time.time() < envelope['fresh_until']:
+            return envelope['value']
+        _schedule_revalidation(key, compute, tags, ttl, stale_ttl)
+        return envelope['value']
+
+    record_cache_event(CACHE_KEY_PREFIX, 'misses')
+    value = compute()
+    _store(key, value, versions, ttl, stale_ttl)
+    return value
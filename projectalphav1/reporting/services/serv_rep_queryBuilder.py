@@ -59,25 +59,10 @@ def build_base_queryset() -> QuerySet[AcqAsset]:
             'seller',                   # WHAT: Direct seller FK if exists
             'loan',
             'property',
-            'asset_hub__dil',
-            'asset_hub__modification',
-            'asset_hub__reo_data',
-            'asset_hub__fc_sale',
-            'asset_hub__short_sale',
-            'asset_hub__note_sale',
-            'asset_hub__performing_track',
-            'asset_hub__delinquent_track',
+            # NOTE: Outcome tracks/tasks come from serv_am_workflowState (bulk-loaded per grid)
         )
         .prefetch_related(
             'asset_hub__valuations',    # WHAT: Valuations for AIV/ARV calculations
-            'asset_hub__dil_tasks',
-            'asset_hub__modification_tasks',
-            'asset_hub__reo_tasks',
-            'asset_hub__fc_tasks',
-            'asset_hub__short_sale_tasks',
-            'asset_hub__note_sale_tasks',
-            'asset_hub__performing_tasks',
-            'asset_hub__delinquent_tasks',
             'asset_hub__ammetrics',
         )
         # WHAT: Filter to only BOARDED trades by default
@@ -0,0 +1,204 @@
+"""
+Service: Realized Performance Analytics
+
+WHAT: Realized IRR / NPV / MOIC for assets, trades, funds and the whole portfolio
+WHY: Realized per-period cash flows already live in LLCashFlowSeries; the By Trade
+     and By Fund grids need realized returns without per-asset loops
+WHERE: Imported by view_rep_performance.py and serv_rep_byTrade.py
+HOW: One query pulls (asset_hub_id, period_date, net_cash_flow) for the filtered
+     asset set, NumPy pivots it into an asset x period matrix, group matrices are
+     summed from it, and XIRR/NPV/MOIC are solved for every row in a batch
+
+FILE NAMING: serv_rep_realizedPerformance.py
+- serv_ = Services folder
+- _rep_ = Reporting module
+- realizedPerformance = Descriptive name
+
+ARCHITECTURE:
+View → This Service → LLCashFlowSeries (1 query) + AcqAsset group keys (1 query)
+                  ↓
+   logic_rep_metrics.batch_xirr / batch_npv / batch_moic (NumPy)
+
+Results are cached per filter set through serv_rep_cache and dropped whenever
+LLCashFlowSeries rows are rebuilt (TAG_CASH_FLOWS).
+
+Docs reviewed:
+- Django values_list(): https://docs.djangoproject.com/en/5.2/ref/models/querysets/#values-list
+- numpy.unique / numpy.add.at: https://numpy.org/doc/stable/reference/generated/numpy.ufunc.at.html
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from acq_module.models.model_acq_seller import AcqAsset
+from core.models.model_co_realizedTransactions import LLCashFlowSeries
+from reporting.logic.logic_rep_metrics import batch_moic, batch_npv, batch_xirr
+from .serv_rep_cache import (
+    cached_report,
+    TAG_CASH_FLOWS,
+    TAG_PARTNERSHIPS,
+    TAG_TRADES,
+)
+from .serv_rep_queryBuilder import build_reporting_queryset
+
+# WHAT: Default annual discount rate for realized NPV (matches acquisition modeling default)
+DEFAULT_DISCOUNT_RATE = 0.10
+
+LEVELS = ('asset', 'trade', 'fund', 'portfolio')
+
+
+def _to_float(value: Any) -> Optional[float]:
+    if value is None or not np.isfinite(value):
+        return None
+    return round(float(value), 6)
+
+
+def build_cash_flow_matrix(rows: Iterable[tuple]) -> Dict[str, Any]:
+    """
+    WHAT: Pivot (asset_hub_id, period_date, net_cash_flow) rows into a dense matrix
+    WHY: Batch XIRR needs every series on one shared date axis
+    HOW: np.unique maps hubs and dates to indices; np.add.at sums duplicates
+
+    RETURNS: {'hub_ids': ndarray, 'dates': ndarray[datetime64[D]], 'matrix': ndarray}
+    """
+    rows = list(rows)
+    if not rows:
+        return {
+            'hub_ids': np.array([], dtype='int64'),
+            'dates': np.array([], dtype='datetime64[D]'),
+            'matrix': np.zeros((0, 0)),
+        }
+    hubs = np.fromiter((r[0] for r in rows), dtype='int64', count=len(rows))
+    dates = np.array([r[1] for r in rows], dtype='datetime64[D]')
+    values = np.fromiter((float(r[2] or 0) for r in rows), dtype='float64', count=len(rows))
+
+    hub_ids, hub_idx = np.unique(hubs, return_inverse=True)
+    period_dates, date_idx = np.unique(dates, return_inverse=True)
+    matrix = np.zeros((hub_ids.size, period_dates.size))
+    np.add.at(matrix, (hub_idx, date_idx), values)
+    return {'hub_ids': hub_ids, 'dates': period_dates, 'matrix': matrix}
+
+
+def _group_matrix(matrix: np.ndarray, group_keys: List[Any]):
+    """Sum asset rows into one row per distinct group key (None keys are skipped)."""
+    keys = sorted({k for k in group_keys if k is not None}, key=str)
+    if not keys:
+        return keys, np.zeros((0, matrix.shape[1]))
+    position = {k: i for i, k in enumerate(keys)}
+    rows = np.array([position.get(k, -1) for k in group_keys], dtype='int64')
+    mask = rows >= 0
+    grouped = np.zeros((len(keys), matrix.shape[1]))
+    np.add.at(grouped, rows[mask], matrix[mask])
+    return keys, grouped
+
+
+def _metrics_rows(keys: List[Any], matrix: np.ndarray, dates: np.ndarray, discount_rate: float) -> List[Dict[str, Any]]:
+    irr = batch_xirr(matrix, dates)
+    npv = batch_npv(matrix, dates, discount_rate)
+    moic = batch_moic(matrix)
+    invested = -np.where(matrix < 0, matrix, 0.0).sum(axis=1)
+    returned = np.where(matrix > 0, matrix, 0.0).sum(axis=1)
+    active_periods = (matrix != 0).sum(axis=1)
+    return [
+        {
+            'id': key,
+            'realized_irr': _to_float(irr[i]),
+            'realized_npv': _to_float(npv[i]),
+            'realized_moic': _to_float(moic[i]),
+            'total_invested': _to_float(invested[i]),
+            'total_returned': _to_float(returned[i]),
+            'net_cash_flow': _to_float(returned[i] - invested[i]),
+            'period_count': int(active_periods[i]),
+        }
+        for i, key in enumerate(keys)
+    ]
+
+
+def compute_realized_performance(
+    asset_hub_ids: Iterable[int],
+    discount_rate: float = DEFAULT_DISCOUNT_RATE,
+    levels: Iterable[str] = LEVELS,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    WHAT: Realized XIRR/NPV/MOIC at asset, trade, fund and portfolio level
+    WHY: Single batch computation shared by By Trade / By Fund grids and the API
+    HOW: 2 queries total (cash flows + group keys), everything else is NumPy
+
+    ARGS:
+        asset_hub_ids: AssetIdHub ids in scope (e.g. from the filtered reporting queryset)
+        discount_rate: Annual discount rate for NPV (decimal)
+        levels: Subset of ('asset', 'trade', 'fund', 'portfolio') to compute
+
+    RETURNS:
+        {
+            'asset': [{'id': hub_id, 'realized_irr': 0.142, 'realized_npv': ..., 'realized_moic': 1.21, ...}],
+            'trade': [{'id': trade_id, ...}],
+            'fund': [{'id': fund_legal_entity_id, ...}],
+            'portfolio': [{'id': 'portfolio', ...}],
+        }
+    """
+    levels = set(levels)
+    hub_ids = list(asset_hub_ids)
+    flows = build_cash_flow_matrix(
+        LLCashFlowSeries.objects
+        .filter(asset_hub_id__in=hub_ids)
+        .values_list('asset_hub_id', 'period_date', 'net_cash_flow')
+    )
+    matrix, dates, flow_hubs = flows['matrix'], flows['dates'], flows['hub_ids'].tolist()
+    results: Dict[str, List[Dict[str, Any]]] = {level: [] for level in LEVELS if level in levels}
+    if not flow_hubs:
+        return results
+
+    if 'asset' in levels:
+        results['asset'] = _metrics_rows(flow_hubs, matrix, dates, discount_rate)
+
+    if 'trade' in levels or 'fund' in levels:
+        # WHAT: Group keys for every hub that has cash flows (one query)
+        group_keys = {
+            hub_id: (trade_id, fund_id)
+            for hub_id, trade_id, fund_id in (
+                AcqAsset.objects
+                .filter(asset_hub_id__in=flow_hubs)
+                .values_list('asset_hub_id', 'trade_id', 'asset_hub__details__fund_legal_entity_id')
+            )
+        }
+        if 'trade' in levels:
+            keys, grouped = _group_matrix(matrix, [group_keys.get(h, (None, None))[0] for h in flow_hubs])
+            results['trade'] = _metrics_rows(keys, grouped, dates, discount_rate)
+        if 'fund' in levels:
+            keys, grouped = _group_matrix(matrix, [group_keys.get(h, (None, None))[1] for h in flow_hubs])
+            results['fund'] = _metrics_rows(keys, grouped, dates, discount_rate)
+
+    if 'portfolio' in levels:
+        results['portfolio'] = _metrics_rows(['portfolio'], matrix.sum(axis=0, keepdims=True), dates, discount_rate)
+
+    return results
+
+
+def get_realized_performance(filters: Dict[str, Any], discount_rate: float = DEFAULT_DISCOUNT_RATE) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    WHAT: Cached realized performance for a reporting filter set
+    WHY: Recomputed only when the filter set changes or cash flow series are rebuilt
+
+    ARGS:
+        filters: Output of parse_filter_params
+        discount_rate: Annual discount rate for NPV
+
+    RETURNS: Same structure as compute_realized_performance
+    """
+    def _compute():
+        hub_ids = build_reporting_queryset(**filters).values_list('asset_hub_id', flat=True)
+        return compute_realized_performance(hub_ids, discount_rate=discount_rate)
+
+    return cached_report(
+        'realized_performance',
+        {**filters, 'discount_rate': discount_rate},
+        _compute,
+        tags=(TAG_CASH_FLOWS, TAG_TRADES, TAG_PARTNERSHIPS),
+    )
+
+
+def realized_lookup(performance: Dict[str, List[Dict[str, Any]]], level: str) -> Dict[Any, Dict[str, Any]]:
+    """Index one level of get_realized_performance output by id."""
+    return {row['id']: row for row in performance.get(level, [])}
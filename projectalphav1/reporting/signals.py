@@ -0,0 +1,83 @@
+"""Reporting cache invalidation signals.
+
+This module is imported by reporting.apps.ReportingConfig.ready() and bumps the
+dependency tags used by reporting/services/serv_rep_cache.py whenever a source
+table behind the reporting endpoints is saved or deleted.
+
+Docs reviewed:
+- Django signals: https://docs.djangoproject.com/en/5.2/topics/signals/
+- transaction.on_commit: https://docs.djangoproject.com/en/5.2/topics/db/transactions/#performing-actions-after-commit
+"""
+
+import logging
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from reporting.services.serv_rep_cache import (
+    invalidate_tags,
+    TAG_TRADES,
+    TAG_TRACKS,
+    TAG_TASKS,
+    TAG_SERVICER,
+    TAG_PARTNERSHIPS,
+    TAG_CASH_FLOWS,
+)
+
+logger = logging.getLogger(__name__)
+
+# WHAT: Model label → dependency tags invalidated when that model changes
+# WHY: One table drives which reporting payloads must be recomputed
+INVALIDATION_MAP = {
+    'acq_module.Trade': (TAG_TRADES,),
+    'acq_module.AcqAsset': (TAG_TRADES,),
+    'core.FundLegalEntity': (TAG_PARTNERSHIPS,),
+    'core.AssetDetails': (TAG_PARTNERSHIPS,),
+    'am_module.ServicerLoanData': (TAG_SERVICER,),
+    'core.LLCashFlowSeries': (TAG_CASH_FLOWS,),
+    # Outcome tracks (one-to-one with AssetIdHub)
+    'am_module.REOData': (TAG_TRACKS,),
+    'am_module.FCSale': (TAG_TRACKS,),
+    'am_module.DIL': (TAG_TRACKS,),
+    'am_module.ShortSale': (TAG_TRACKS,),
+    'am_module.Modification': (TAG_TRACKS,),
+    'am_module.NoteSale': (TAG_TRACKS,),
+    'am_module.PerformingTrack': (TAG_TRACKS,),
+    'am_module.DelinquentTrack': (TAG_TRACKS,),
+    # Outcome tasks
+    'am_module.REOtask': (TAG_TASKS,),
+    'am_module.FCTask': (TAG_TASKS,),
+    'am_module.DILTask': (TAG_TASKS,),
+    'am_module.ShortSaleTask': (TAG_TASKS,),
+    'am_module.ModificationTask': (TAG_TASKS,),
+    'am_module.NoteSaleTask': (TAG_TASKS,),
+    'am_module.PerformingTask': (TAG_TASKS,),
+    'am_module.DelinquentTask': (TAG_TASKS,),
+}
+
+
+def _invalidate_after_commit(tags) -> None:
+    def _bump():
+        try:
+            invalidate_tags(*tags)
+        except Exception as e:
+            # WHAT: Cache outages must never break a model save
+            logger.warning(f'[ReportingCache] Tag invalidation failed for {tags}: {e}')
+
+    transaction.on_commit(_bump)
+
+
+def _make_handler(tags):
+    def _handler(sender, instance, **kwargs):
+        _invalidate_after_commit(tags)
+    return _handler
+
+
+# WHAT: Keep strong references to the generated handlers
+# WHY: Signals hold weak references by default
+_HANDLERS = {}
+
+for _label, _tags in INVALIDATION_MAP.items():
+    _HANDLERS[_label] = _make_handler(_tags)
+    post_save.connect(_HANDLERS[_label], sender=_label, dispatch_uid=f'reporting_cache_save_{_label}')
+    post_delete.connect(_HANDLERS[_label], sender=_label, dispatch_uid=f'reporting_cache_delete_{_label}')
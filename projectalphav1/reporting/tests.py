@@ -1,3 +1,114 @@
-from django.test import TestCase
+"""Tests for the reporting response cache (serv_rep_cache) and realized metrics."""
 
-# Create your tests here.
+from datetime import date
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from reporting.logic.logic_rep_metrics import batch_moic, batch_xirr, calculate_irr, calculate_npv
+from reporting.services import serv_rep_cache
+from reporting.services.serv_rep_cache import (
+    build_cache_key,
+    cached_report,
+    invalidate_tags,
+    normalize_filters,
+    TAG_TRADES,
+    TAG_TASKS,
+)
+from reporting.services.serv_rep_realizedPerformance import build_cash_flow_matrix
+
+LOCMEM_CACHE = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'reporting-tests',
+    }
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class ReportingCacheTestCase(SimpleTestCase):
+    """Test case for cached_report key normalization, SWR and tag invalidation."""
+
+    def setUp(self):
+        cache.clear()
+        self.calls = 0
+
+    def _compute(self):
+        self.calls += 1
+        return {'value': self.calls}
+
+    def test_filter_normalization(self):
+        """Equivalent filter sets share one cache key."""
+        self.assertEqual(
+            build_cache_key('summary', {'trade_ids': [2, 1, 2], 'q': None}),
+            build_cache_key('summary', {'trade_ids': [1, 2]}),
+        )
+        self.assertNotEqual(
+            build_cache_key('summary', {'trade_ids': [1]}),
+            build_cache_key('by_trade_grid', {'trade_ids': [1]}),
+        )
+        self.assertEqual(normalize_filters({'ordering': ['b', 'a']}), {'ordering': ['b', 'a']})
+        self.assertNotEqual(
+            build_cache_key('summary', {'trade_ids': []}),
+            build_cache_key('summary', None),
+        )
+
+    def test_fresh_hit_skips_compute(self):
+        """A fresh entry is returned without recomputing."""
+        first = cached_report('summary', {'trade_ids': [1]}, self._compute, tags=(TAG_TRADES,))
+        second = cached_report('summary', {'trade_ids': [1]}, self._compute, tags=(TAG_TRADES,))
+        self.assertEqual(first, second)
+        self.assertEqual(self.calls, 1)
+
+    def test_tag_invalidation_forces_recompute(self):
+        """Bumping a dependency tag is a hard miss; unrelated tags are unaffected."""
+        cached_report('summary', None, self._compute, tags=(TAG_TRADES,))
+        invalidate_tags(TAG_TASKS)
+        cached_report('summary', None, self._compute, tags=(TAG_TRADES,))
+        self.assertEqual(self.calls, 1)
+
+        invalidate_tags(TAG_TRADES)
+        result = cached_report('summary', None, self._compute, tags=(TAG_TRADES,))
+        self.assertEqual(result, {'value': 2})
+
+    def test_stale_entry_served_then_revalidated(self):
+        """A stale entry is returned immediately and refreshed in the background."""
+        cached_report('summary', None, self._compute, tags=(TAG_TRADES,), ttl=0, stale_ttl=60)
+        with patch.object(serv_rep_cache, '_run_in_background', side_effect=lambda fn: fn()):
+            stale = cached_report('summary', None, self._compute, tags=(TAG_TRADES,), ttl=0, stale_ttl=60)
+        self.assertEqual(stale, {'value': 1})
+        self.assertEqual(self.calls, 2)
+
+        refreshed = cache.get(build_cache_key('summary', None))
+        self.assertEqual(refreshed['value'], {'value': 2})
+
+
+class RealizedMetricsTestCase(SimpleTestCase):
+    """Test case for batched XIRR/NPV/MOIC (logic_rep_metrics + cash flow pivot)."""
+
+    def test_batch_xirr_matches_single_series(self):
+        """Each row of the matrix solves to its own annual IRR."""
+        dates = [date(2023, 1, 1), date(2024, 1, 1)]
+        irr = batch_xirr([[-100.0, 110.0], [-100.0, 150.0], [0.0, 50.0]], dates)
+        self.assertAlmostEqual(irr[0], 0.10, places=4)
+        self.assertAlmostEqual(irr[1], 0.50, places=4)
+        self.assertTrue(irr[2] != irr[2])  # NaN: no sign change
+        self.assertAlmostEqual(calculate_irr([-100, 110], dates), 0.10, places=4)
+
+    def test_npv_and_moic(self):
+        """XNPV discounts by year fraction; MOIC is inflows over outflows."""
+        dates = [date(2023, 1, 1), date(2024, 1, 1)]
+        self.assertAlmostEqual(calculate_npv([-100, 110], 0.10, dates), 0.0, places=1)
+        self.assertAlmostEqual(batch_moic([[-100.0, 50.0, 80.0]])[0], 1.3)
+
+    def test_cash_flow_matrix_pivot(self):
+        """Rows are pivoted to an asset x date matrix and duplicates are summed."""
+        result = build_cash_flow_matrix([
+            (2, date(2024, 2, 1), 5),
+            (1, date(2024, 1, 1), -100),
+            (1, date(2024, 2, 1), 10),
+            (1, date(2024, 2, 1), 15),
+        ])
+        self.assertEqual(result['hub_ids'].tolist(), [1, 2])
+        self.assertEqual(result['matrix'].tolist(), [[-100.0, 25.0], [0.0, 5.0]])
@@ -10,6 +10,7 @@ ENDPOINTS:
 - /api/reporting/summary/ - Top bar KPIs
 - /api/reporting/by-trade/ - By Trade chart data
 - /api/reporting/by-trade/grid/ - By Trade grid data
+- /api/reporting/realized-performance/ - Realized IRR/NPV/MOIC (asset/trade/fund/portfolio)
 - /api/reporting/trades/ - Trade filter options
 - etc.
 
@@ -22,7 +23,8 @@ from reporting.views import (
     view_rep_filters,
     view_rep_summary,
     view_rep_trade,
-    view_rep_status
+    view_rep_status,
+    view_rep_performance,
 )
 
 urlpatterns = [
@@ -65,6 +67,13 @@ urlpatterns = [
     path('by-status/', view_rep_status.get_by_status_chart, name='reporting-by-status-chart'),
     path('by-status/grid/', view_rep_status.get_by_status_grid, name='reporting-by-status-grid'),
     
+    # ========================================================================
+    # REALIZED PERFORMANCE - IRR/NPV/MOIC from LLCashFlowSeries
+    # ========================================================================
+    # WHAT: Realized returns at asset, trade, fund and portfolio level
+    # ENDPOINT: GET /api/reporting/realized-performance/?discount_rate=0.10
+    path('realized-performance/', view_rep_performance.realized_performance, name='reporting-realized-performance'),
+    
     # TODO: Add remaining report endpoints:
     # - by-fund/
     # - by-entity/
@@ -35,6 +35,13 @@ from reporting.serializers.serial_rep_filterOptions import (
     TaskStatusOptionSerializer,
     FundLegalEntityOptionSerializer,
 )
+from reporting.services.serv_rep_cache import (
+    cached_report,
+    TAG_TRADES,
+    TAG_TRACKS,
+    TAG_TASKS,
+    TAG_PARTNERSHIPS,
+)
 
 
 @api_view(['GET'])
@@ -76,15 +83,18 @@ def trade_options(request):
             except ValueError:
                 partnership_ids = None
         
-        # WHAT: Delegate to service layer
-        # WHY: Keep view thin, business logic in service
-        trades = get_trade_options_data(partnership_ids=partnership_ids)
-        
-        # WHAT: Serialize data using field definitions
-        # WHY: Validate and format response
-        serializer = TradeOptionSerializer(trades, many=True)
+        # WHAT: Delegate to service layer, serialize, and cache per partnership set
+        # WHY: Keep view thin; options are identical for every user
+        data = cached_report(
+            'trade_options',
+            {'partnership_ids': partnership_ids},
+            lambda: list(TradeOptionSerializer(
+                get_trade_options_data(partnership_ids=partnership_ids), many=True
+            ).data),
+            tags=(TAG_TRADES, TAG_PARTNERSHIPS),
+        )
         
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(data, status=status.HTTP_200_OK)
     
     except Exception as e:
         # WHAT: Log error and return 500
@@ -117,13 +127,15 @@ def status_options(request):
         ]
     """
     try:
-        # WHAT: Delegate to service layer
-        tracks = get_status_options_data()
-        
-        # WHAT: Serialize data
-        serializer = StatusOptionSerializer(tracks, many=True)
+        # WHAT: Delegate to service layer, serialize, and cache
+        data = cached_report(
+            'status_options',
+            None,
+            lambda: list(StatusOptionSerializer(get_status_options_data(), many=True).data),
+            tags=(TAG_TRADES, TAG_TRACKS),
+        )
         
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(data, status=status.HTTP_200_OK)
     
     except Exception as e:
         import logging
@@ -161,15 +173,18 @@ def task_status_options(request):
         # WHY: Allow filtering tasks by specific outcome track
         track = request.GET.get('track', None)
         
-        # WHAT: Delegate to service layer
+        # WHAT: Delegate to service layer, serialize, and cache per track
         # WHY: Keep view thin, business logic in service
-        task_statuses = get_task_status_options_data(track=track)
-        
-        # WHAT: Serialize data using field definitions
-        # WHY: Validate and format response
-        serializer = TaskStatusOptionSerializer(task_statuses, many=True)
+        data = cached_report(
+            'task_status_options',
+            {'track': track},
+            lambda: list(TaskStatusOptionSerializer(
+                get_task_status_options_data(track=track), many=True
+            ).data),
+            tags=(TAG_TRADES, TAG_TASKS),
+        )
         
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(data, status=status.HTTP_200_OK)
     
     except Exception as e:
         import logging
@@ -193,9 +208,13 @@ def partnership_options(request):
     RETURNS: 200 OK with list of partnership options
     """
     try:
-        partnerships = get_partnership_options_data()
-        serializer = FundLegalEntityOptionSerializer(partnerships, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        data = cached_report(
+            'partnership_options',
+            None,
+            lambda: list(FundLegalEntityOptionSerializer(get_partnership_options_data(), many=True).data),
+            tags=(TAG_PARTNERSHIPS,),
+        )
+        return Response(data, status=status.HTTP_200_OK)
     except Exception as e:
         import logging
         logger = logging.getLogger(__name__)
@@ -0,0 +1,67 @@
+"""
+View: Realized Performance Endpoint
+
+WHAT: API endpoint for realized IRR / NPV / MOIC at asset, trade, fund and portfolio level
+WHY: Power realized-return columns in By Trade / By Fund reports and portfolio KPIs
+WHERE: Mounted at /api/reporting/realized-performance/
+HOW: Delegate to serv_rep_realizedPerformance (thin view principle)
+
+FILE NAMING: view_rep_performance.py
+- view_ = Views folder
+- _rep_ = Reporting module
+- performance = Specific report type
+
+ARCHITECTURE:
+Frontend → This View → serv_rep_realizedPerformance → LLCashFlowSeries
+
+Docs reviewed:
+- DRF API Views: https://www.django-rest-framework.org/api-guide/views/
+- DRF Response: https://www.django-rest-framework.org/api-guide/responses/
+"""
+
+import logging
+
+from rest_framework.decorators import api_view
+from rest_framework.response import Response
+from rest_framework import status
+from reporting.services.serv_rep_queryBuilder import parse_filter_params
+from reporting.services.serv_rep_realizedPerformance import (
+    DEFAULT_DISCOUNT_RATE,
+    get_realized_performance,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@api_view(['GET'])
+def realized_performance(request):
+    """
+    WHAT: Return realized performance at every aggregation level
+    WHY: Single call for asset, trade, fund and portfolio realized returns
+
+    ENDPOINT: GET /api/reporting/realized-performance/
+
+    QUERY PARAMS:
+        - Same sidebar filters as /by-trade/ (trade_ids, statuses, fund_id, ...)
+        - discount_rate: Annual NPV discount rate as a decimal (default 0.10)
+
+    RETURNS: 200 OK with {'asset': [...], 'trade': [...], 'fund': [...], 'portfolio': [...]}
+    """
+    try:
+        discount_rate = float(request.GET.get('discount_rate', DEFAULT_DISCOUNT_RATE))
+    except (TypeError, ValueError):
+        return Response(
+            {'error': 'discount_rate must be a decimal number (e.g. 0.10)'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    try:
+        data = get_realized_performance(parse_filter_params(request), discount_rate=discount_rate)
+        return Response(data, status=status.HTTP_200_OK)
+
+    except Exception as e:
+        logger.error(f'[RealizedPerformance] Error: {str(e)}', exc_info=True)
+        return Response(
+            {'error': 'Failed to load realized performance', 'detail': str(e)},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
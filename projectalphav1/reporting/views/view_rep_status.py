@@ -10,6 +10,8 @@ from reporting.services.serv_rep_byStatus import (
     get_by_status_chart_data,
     get_by_status_grid_data,
 )
+from reporting.services.serv_rep_cache import cached_report
+from reporting.services.serv_rep_queryBuilder import parse_filter_params
 
 
 @api_view(['GET'])
@@ -23,7 +25,13 @@ def get_by_status_chart(request):
     
     **RETURNS**: List of {x: status, y: total_upb, meta: {count, percentage}}
     """
-    chart_data = get_by_status_chart_data(request)
+    # WHAT: Close over the parsed filters, not the request (revalidation runs after it ends)
+    filters = parse_filter_params(request)
+    chart_data = cached_report(
+        'by_status_chart',
+        filters,
+        lambda: get_by_status_chart_data(filters),
+    )
     return Response(chart_data)
 
 
@@ -38,5 +46,10 @@ def get_by_status_grid(request):
     
     **RETURNS**: List of {status, count, total_upb, avg_upb, percentage, ...}
     """
-    grid_data = get_by_status_grid_data(request)
+    filters = parse_filter_params(request)
+    grid_data = cached_report(
+        'by_status_grid',
+        filters,
+        lambda: get_by_status_grid_data(filters),
+    )
     return Response(grid_data)
@@ -23,6 +23,7 @@ from rest_framework.response import Response
 from rest_framework import status
 from reporting.services.serv_rep_queryBuilder import build_reporting_queryset, parse_filter_params
 from reporting.services.serv_rep_aggregations import calculate_summary_metrics
+from reporting.services.serv_rep_cache import cached_report
 
 
 @api_view(['GET'])
@@ -55,13 +56,13 @@ def report_summary(request):
         # WHY: Extract user-selected filters
         filters = parse_filter_params(request)
         
-        # WHAT: Build filtered queryset using service layer
-        # WHY: Centralized query building logic
-        queryset = build_reporting_queryset(**filters)
-        
-        # WHAT: Calculate summary metrics using service layer
-        # WHY: Business logic stays in service, not view
-        metrics = calculate_summary_metrics(queryset)
+        # WHAT: Build filtered queryset and calculate metrics (cached per filter set)
+        # WHY: Business logic stays in service, not view; identical filters share one result
+        metrics = cached_report(
+            'summary',
+            filters,
+            lambda: calculate_summary_metrics(build_reporting_queryset(**filters)),
+        )
         
         return Response(metrics, status=status.HTTP_200_OK)
     
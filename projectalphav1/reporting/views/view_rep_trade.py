@@ -28,6 +28,8 @@ from reporting.services.serv_rep_byTrade import (
     get_by_trade_chart_data,
     get_by_trade_grid_data,
 )
+from reporting.services.serv_rep_cache import cached_report
+from reporting.services.serv_rep_queryBuilder import parse_filter_params
 
 
 @api_view(['GET'])
@@ -52,7 +54,13 @@ def by_trade_chart(request):
     try:
         # WHAT: Delegate to service layer
         # WHY: Keep view thin, business logic in service
-        chart_data = get_by_trade_chart_data(request)
+        # WHAT: Close over the parsed filters, not the request (revalidation runs after it ends)
+        filters = parse_filter_params(request)
+        chart_data = cached_report(
+            'by_trade_chart',
+            filters,
+            lambda: get_by_trade_chart_data(filters),
+        )
         return Response(chart_data, status=status.HTTP_200_OK)
     
     except Exception as e:
@@ -83,7 +91,12 @@ def by_trade_grid(request):
     try:
         # WHAT: Delegate to service layer
         # WHY: Keep view thin, business logic in service
-        grid_data = get_by_trade_grid_data(request)
+        filters = parse_filter_params(request)
+        grid_data = cached_report(
+            'by_trade_grid',
+            filters,
+            lambda: get_by_trade_grid_data(filters),
+        )
         return Response(grid_data, status=status.HTTP_200_OK)
     
     except Exception as e:
@@ -5,132 +5,171 @@ Auto-create SharePoint folders when Django entities are created.
 Maintains sync between platform and SharePoint structure.
 
 Implementation: Option 1 (Eager Creation)
-- Folders created immediately when trade/asset created
+- Folders created shortly after the trade/asset is created
 - SharePoint mirrors full database structure
 - Users see organized structure before uploading files
+
+post_save only appends TRADE_FOLDERS / ASSET_FOLDERS events to the side-effect
+outbox (core/services/serv_co_outbox.py); the dispatcher creates the folders for
+every trade/asset queued in the debounce window with one Graph batch run, so
+trade/asset saves never wait on SharePoint.
 """
 
 from django.db.models.signals import post_save
 from django.dispatch import receiver
-from sharepoint.services.serv_sp_client import SharePointClient
+from core.models import SideEffectEvent
+from core.services.serv_co_outbox import emit_side_effect, register_side_effect_handler
 from sharepoint.services.serv_sp_folder_structure import FolderStructure
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+_INVALID_FOLDER_CHARS = ['~', '#', '%', '&', '*', '{', '}', '\\', ':', '<', '>', '?', '/', '|', '"']
+
+
+def _sanitize_folder_name(name: str) -> str:
+    """Replace characters SharePoint rejects and clamp to 100 characters."""
+    for char in _INVALID_FOLDER_CHARS:
+        name = name.replace(char, '_')
+    return name.strip(' .')[:100]
+
+
+def trade_folder_name(trade) -> str:
+    """Folder name for a trade: "{trade_name} - {seller_name}" (sanitized)."""
+    seller_name = trade.seller.name if trade.seller else None
+    combined_name = f"{trade.trade_name} - {seller_name}" if seller_name else trade.trade_name
+    return _sanitize_folder_name(combined_name)
+
+
+def asset_folder_name(asset) -> str:
+    """Folder name for an AcqAsset.
+
+    Naming convention: "{primary_id} - {address}" where primary_id is
+    servicer_id, else sellertape_id, else asset_hub_id.
+    """
+    asset_hub_id = asset.asset_hub.id if asset.asset_hub else asset.pk
+
+    servicer_id = None
+    sellertape_id = None
+    if asset.asset_hub:
+        servicer_id = getattr(asset.asset_hub, 'servicer_id', None)
+        sellertape_id = getattr(asset.asset_hub, 'sellertape_id', None)
+
+    # Build address (optional) for human-friendly folder naming
+    street = getattr(asset, 'street_address', None) or ''
+    city = getattr(asset, 'city', None) or ''
+    state = getattr(asset, 'state', None) or ''
+    zip_code = getattr(asset, 'zip', None) or ''
+    full_address = f"{street}, {city}, {state} {zip_code}".strip(', ').strip()
+
+    primary_id = servicer_id or sellertape_id or asset_hub_id
+    asset_folder_raw = f"{primary_id} - {full_address}" if full_address else str(primary_id)
+    return _sanitize_folder_name(asset_folder_raw)
+
+
+def _create_folder_paths(folder_paths, label: str) -> dict:
+    """Create folder paths with one SharePointBatchService run (errors are reported, not raised)."""
+    from sharepoint.services.serv_sp_batch import SharePointBatchService
+
+    if not folder_paths:
+        return {'created': 0, 'existed': 0, 'failed': 0, 'errors': []}
+    try:
+        results = SharePointBatchService().create_folders_batch(folder_paths)
+        logger.info(f"Created SharePoint folders for {len(folder_paths)} {label} paths in batch")
+        return results
+    except Exception as e:
+        logger.error(f"Failed to batch-create SharePoint {label} folders: {str(e)}")
+        return {'created': 0, 'existed': 0, 'failed': len(folder_paths), 'errors': [str(e)]}
+
+
+def create_trade_folders_bulk(trade_ids) -> dict:
+    """
+    Create trade-level SharePoint folders (Bid, Legal, Post Close, Asset Level)
+    for many trades in one batched pass.
+    """
+    from acq_module.models.model_acq_seller import Trade
+
+    folder_paths = []
+    for trade in Trade.objects.filter(pk__in=list(trade_ids)).select_related('seller'):
+        if not trade.trade_name:
+            logger.warning(f"Trade {trade.pk} has no trade_name - skipping folder creation")
+            continue
+        folder_paths.extend(FolderStructure.get_trade_folders(trade_folder_name(trade)))
+    return _create_folder_paths(folder_paths, 'trade')
+
+
+def create_asset_folders_bulk(asset_hub_ids) -> dict:
+    """
+    Create SharePoint folders for many assets in one batched pass.
+
+    Used by the outbox dispatcher for both post_save events and seller tape
+    imports (bulk_create does not send post_save; the importer queues events).
+    """
+    from acq_module.models.model_acq_seller import AcqAsset
+
+    assets = (
+        AcqAsset.objects
+        .filter(asset_hub_id__in=list(asset_hub_ids))
+        # WHAT: street_address/city/state/zip are aliases over the reverse `property` row
+        .select_related('asset_hub', 'trade__seller', 'property')
+    )
+    folder_paths = []
+    for asset in assets:
+        if not asset.trade or not asset.trade.trade_name:
+            logger.warning(f"Asset {asset.pk} has no trade - skipping folder creation")
+            continue
+        folder_paths.extend(FolderStructure.get_asset_folders(trade_folder_name(asset.trade), asset_folder_name(asset)))
+    return _create_folder_paths(folder_paths, 'asset')
+
+
+def _raise_on_total_failure(results: dict) -> None:
+    """Outbox handlers raise (-> retry with backoff) when nothing could be created."""
+    if results.get('failed') and not (results.get('created') or results.get('existed')):
+        raise RuntimeError(f"SharePoint folder creation failed: {(results.get('errors') or ['unknown error'])[0]}")
+
+
+def _dispatch_trade_folders(trade_ids) -> None:
+    _raise_on_total_failure(create_trade_folders_bulk(trade_ids))
+
+
+def _dispatch_asset_folders(asset_hub_ids) -> None:
+    _raise_on_total_failure(create_asset_folders_bulk(asset_hub_ids))
+
+
+register_side_effect_handler(SideEffectEvent.Kind.TRADE_FOLDERS, _dispatch_trade_folders)
+register_side_effect_handler(SideEffectEvent.Kind.ASSET_FOLDERS, _dispatch_asset_folders)
+
+
 @receiver(post_save, sender='acq_module.Trade')
 def create_trade_folders(sender, instance, created, **kwargs):
     """
-    Create SharePoint folders when a trade is created.
-    Creates trade-level folders (Bid, Legal, Post Close, Asset Level).
+    Queue SharePoint trade-level folder creation when a trade is created.
     """
     if not created:
         return  # Only for new trades
-    
+
     try:
-        # Build folder name from trade_name and seller
-        trade_name = instance.trade_name
-        seller_name = instance.seller.name if instance.seller else None
-        
-        if not trade_name:
-            logger.warning(f"Trade {instance.pk} has no trade_name - skipping folder creation")
-            return
-        
-        # Sanitize folder name
-        if seller_name:
-            combined_name = f"{trade_name} - {seller_name}"
-        else:
-            combined_name = trade_name
-        
-        # Simple sanitization
-        folder_name = combined_name
-        for char in ['~', '#', '%', '&', '*', '{', '}', '\\', ':', '<', '>', '?', '/', '|', '"']:
-            folder_name = folder_name.replace(char, '_')
-        folder_name = folder_name.strip(' .')[:100]
-        
-        # Create folders
-        client = SharePointClient()
-        folders = FolderStructure.get_trade_folders(folder_name)
-        for folder_path in folders:
-            client.create_folder(folder_path)
-        
-        logger.info(f"Created SharePoint folders for trade: {combined_name}")
-    
+        emit_side_effect(SideEffectEvent.Kind.TRADE_FOLDERS, instance.pk)
     except Exception as e:
-        logger.error(f"Failed to create SharePoint folders for trade {instance.pk}: {str(e)}")
+        logger.error(f"Failed to queue SharePoint folders for trade {instance.pk}: {str(e)}")
         # Don't raise - folder creation failure shouldn't block trade creation
 
 
 @receiver(post_save, sender='acq_module.AcqAsset')
 def create_asset_folders(sender, instance, created, **kwargs):
     """
-    Create SharePoint folders when an asset is created.
-    Creates all asset-level category folders with subfolders.
+    Queue SharePoint asset folder creation (all category folders with subfolders)
+    when an asset is created.
     """
     if not created:
         return  # Only for new assets
-    
+
     try:
-        # Get trade info
-        if not instance.trade or not instance.trade.trade_name:
-            logger.warning(f"Asset {instance.pk} has no trade - skipping folder creation")
-            return
-        
-        trade = instance.trade
-        trade_name = trade.trade_name
-        seller_name = trade.seller.name if trade.seller else None
-        
-        # Build trade folder name
-        if seller_name:
-            combined_trade_name = f"{trade_name} - {seller_name}"
-        else:
-            combined_trade_name = trade_name
-        
-        # Sanitize
-        trade_folder = combined_trade_name
-        for char in ['~', '#', '%', '&', '*', '{', '}', '\\', ':', '<', '>', '?', '/', '|', '"']:
-            trade_folder = trade_folder.replace(char, '_')
-        trade_folder = trade_folder.strip(' .')[:100]
-        
-        # Get asset info
-        asset_hub_id = instance.asset_hub.id if instance.asset_hub else instance.pk
-
-        servicer_id = None
-        sellertape_id = None
-        if instance.asset_hub:
-            servicer_id = getattr(instance.asset_hub, 'servicer_id', None)
-            sellertape_id = getattr(instance.asset_hub, 'sellertape_id', None)
-
-        # Build address (optional) for human-friendly folder naming
-        street = getattr(instance, 'street_address', None) or ''
-        city = getattr(instance, 'city', None) or ''
-        state = getattr(instance, 'state', None) or ''
-        zip_code = getattr(instance, 'zip', None) or ''
-        full_address = f"{street}, {city}, {state} {zip_code}".strip(', ').strip()
-
-        # Asset folder naming convention:
-        #   "{primary_id} - {address}"
-        # where primary_id is servicer_id, else sellertape_id, else asset_hub_id
-        primary_id = servicer_id or sellertape_id or asset_hub_id
-        asset_folder_raw = f"{primary_id} - {full_address}" if full_address else str(primary_id)
-        asset_folder = asset_folder_raw
-        for char in ['~', '#', '%', '&', '*', '{', '}', '\\', ':', '<', '>', '?', '/', '|', '"']:
-            asset_folder = asset_folder.replace(char, '_')
-        asset_folder = asset_folder.strip(' .')[:100]
-        
-        # Create folders
-        client = SharePointClient()
-        folders = FolderStructure.get_asset_folders(trade_folder, asset_folder)
-        for folder_path in folders:
-            client.create_folder(folder_path)
-        
-        logger.info(f"Created SharePoint folders for asset: {trade_name}/{asset_hub_id}")
-    
+        emit_side_effect(SideEffectEvent.Kind.ASSET_FOLDERS, instance.asset_hub_id)
     except Exception as e:
-        logger.error(f"Failed to create SharePoint folders for asset {instance.pk}: {str(e)}")
+        logger.error(f"Failed to queue SharePoint folders for asset {instance.pk}: {str(e)}")
         # Don't raise - folder creation failure shouldn't block asset creation
 
 
-logger.info("SharePoint signals active - auto-creating folders for new trades/assets")
-
+logger.info("SharePoint signals active - queueing folder creation for new trades/assets")